@@ -0,0 +1,6 @@
+HAVE_READLINE=1
+READLINE_DIR=
+HAVE_SYSTEMTAP_SDT=
+PREFIX=/usr/local
+DATAROOTDIR=/usr/local/share
+STRIP_FLAGS=--gc-sections
@@ -0,0 +1,277 @@
+from asdl import pybase
+from mycpp import mops
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf, TraversalState
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
+
+class value_e(object):
+  Str = 1
+  Array = 2
+
+_value_str = {
+  1: 'Str',
+  2: 'Array',
+}
+
+def value_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _value_str[tag]
+  if dot:
+    return "value.%s" % v
+  else:
+    return v
+
+class value_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class value__Str(value_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('value__Str')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('value__Str')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class value(object):
+  Str = value__Str()
+  
+  class Array(value_t):
+    _type_tag = 2
+    __slots__ = ('a',)
+  
+    def __init__(self, a):
+      # type: (int) -> None
+      self.a = a
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> value.Array
+      return value.Array(-1)
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('value.Array')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+      L.append(Field('a', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('value.Array')
+      L = out_node.fields
+      x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+      L.append(Field('a', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class t2(pybase.CompoundObj):
+  _type_tag = 64
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a, b):
+    # type: (int, int) -> None
+    self.a = a
+    self.b = b
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> t2
+    return t2(-1, -1)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('t2')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(Field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(Field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('t2')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(Field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(Field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class t3(pybase.CompoundObj):
+  _type_tag = 65
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a, b):
+    # type: (int, int) -> None
+    self.a = a
+    self.b = b
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> t3
+    return t3(-1, -1)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('t3')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(Field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(Field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('t3')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(Field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(Field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class t4(pybase.CompoundObj):
+  _type_tag = 66
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a, b):
+    # type: (int, int) -> None
+    self.a = a
+    self.b = b
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> t4
+    return t4(-1, -1)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('t4')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(Field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(Field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('t4')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(Field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(Field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
@@ -0,0 +1,74 @@
+# This code is generated by pgen2/grammar.py
+
+augassign = 256
+and_expr = 257
+and_test = 258
+arg_group = 259
+arglist = 260
+arglist3 = 261
+argument = 262
+arith_expr = 263
+array_item = 264
+atom = 265
+braced_var_sub = 266
+char_literal = 267
+class_literal = 268
+class_literal_term = 269
+comma_newline = 270
+command_expr = 271
+comp_for = 272
+comp_op = 273
+comparison = 274
+dict = 275
+dict_pair = 276
+dq_string = 277
+eggex = 278
+end_stmt = 279
+expr = 280
+factor = 281
+lambdef = 282
+lhs_list = 283
+literal_expr = 284
+name_type = 285
+name_type_list = 286
+not_test = 287
+old_sh_array_literal = 288
+or_test = 289
+param = 290
+param_group = 291
+pat_else = 292
+pat_exprs = 293
+place_trailer = 294
+power = 295
+range_char = 296
+range_expr = 297
+re_alt = 298
+re_atom = 299
+re_flag = 300
+regex = 301
+repeat_op = 302
+repeat_range = 303
+sh_array_literal = 304
+sh_command_sub = 305
+shift_expr = 306
+simple_var_sub = 307
+splat_expr = 308
+sq_string = 309
+subscript = 310
+subscriptlist = 311
+term = 312
+test = 313
+testlist = 314
+testlist_comp = 315
+trailer = 316
+type_expr = 317
+xor_expr = 318
+ysh_case_pat = 319
+ysh_eager_arglist = 320
+ysh_expr = 321
+ysh_expr_sub = 322
+ysh_func = 323
+ysh_lazy_arglist = 324
+ysh_mutation = 325
+ysh_proc = 326
+ysh_var_decl = 327
@@ -0,0 +1,906 @@
+from asdl import pybase
+
+Id_t = int  # type alias for integer
+
+class Id(object):
+  Word_Compound = 1
+  Arith_Semi = 2
+  Arith_Comma = 3
+  Arith_Plus = 4
+  Arith_Minus = 5
+  Arith_Star = 6
+  Arith_Slash = 7
+  Arith_Percent = 8
+  Arith_DPlus = 9
+  Arith_DMinus = 10
+  Arith_DStar = 11
+  Arith_LParen = 12
+  Arith_RParen = 13
+  Arith_LBracket = 14
+  Arith_RBracket = 15
+  Arith_RBrace = 16
+  Arith_QMark = 17
+  Arith_Colon = 18
+  Arith_LessEqual = 19
+  Arith_Less = 20
+  Arith_GreatEqual = 21
+  Arith_Great = 22
+  Arith_DEqual = 23
+  Arith_NEqual = 24
+  Arith_DAmp = 25
+  Arith_DPipe = 26
+  Arith_Bang = 27
+  Arith_DGreat = 28
+  Arith_DLess = 29
+  Arith_Amp = 30
+  Arith_Pipe = 31
+  Arith_Caret = 32
+  Arith_Tilde = 33
+  Arith_Equal = 34
+  Arith_PlusEqual = 35
+  Arith_MinusEqual = 36
+  Arith_StarEqual = 37
+  Arith_SlashEqual = 38
+  Arith_PercentEqual = 39
+  Arith_DGreatEqual = 40
+  Arith_DLessEqual = 41
+  Arith_AmpEqual = 42
+  Arith_CaretEqual = 43
+  Arith_PipeEqual = 44
+  Eof_Real = 45
+  Eof_RParen = 46
+  Eof_Backtick = 47
+  Undefined_Tok = 48
+  Unknown_Tok = 49
+  Unknown_Backslash = 50
+  Unknown_DEqual = 51
+  Eol_Tok = 52
+  Ignored_LineCont = 53
+  Ignored_Space = 54
+  Ignored_Comment = 55
+  Ignored_Newline = 56
+  WS_Space = 57
+  Lit_Chars = 58
+  Lit_CharsWithoutPrefix = 59
+  Lit_VarLike = 60
+  Lit_ArrayLhsOpen = 61
+  Lit_ArrayLhsClose = 62
+  Lit_Splice = 63
+  Lit_AtLBracket = 64
+  Lit_AtLBraceDot = 65
+  Lit_Other = 66
+  Lit_EscapedChar = 67
+  Lit_LBracket = 68
+  Lit_RBracket = 69
+  Lit_Star = 70
+  Lit_QMark = 71
+  Lit_LBrace = 72
+  Lit_RBrace = 73
+  Lit_Comma = 74
+  Lit_Equals = 75
+  Lit_Dollar = 76
+  Lit_DRightBracket = 77
+  Lit_Tilde = 78
+  Lit_Pound = 79
+  Lit_TPound = 80
+  Lit_TDot = 81
+  Lit_Slash = 82
+  Lit_Percent = 83
+  Lit_Colon = 84
+  Lit_Digits = 85
+  Lit_At = 86
+  Lit_ArithVarLike = 87
+  Lit_BadBackslash = 88
+  Lit_CompDummy = 89
+  Backtick_Right = 90
+  Backtick_Quoted = 91
+  Backtick_DoubleQuote = 92
+  Backtick_Other = 93
+  History_Op = 94
+  History_Num = 95
+  History_Search = 96
+  History_Other = 97
+  Op_Newline = 98
+  Op_Amp = 99
+  Op_Pipe = 100
+  Op_PipeAmp = 101
+  Op_DAmp = 102
+  Op_DPipe = 103
+  Op_Semi = 104
+  Op_DSemi = 105
+  Op_SemiAmp = 106
+  Op_DSemiAmp = 107
+  Op_LParen = 108
+  Op_RParen = 109
+  Op_DLeftParen = 110
+  Op_DRightParen = 111
+  Op_Less = 112
+  Op_Great = 113
+  Op_Bang = 114
+  Op_LBracket = 115
+  Op_RBracket = 116
+  Op_LBrace = 117
+  Op_RBrace = 118
+  Expr_Reserved = 119
+  Expr_Symbol = 120
+  Expr_Name = 121
+  Expr_DecInt = 122
+  Expr_BinInt = 123
+  Expr_OctInt = 124
+  Expr_HexInt = 125
+  Expr_Float = 126
+  Expr_Bang = 127
+  Expr_Dot = 128
+  Expr_DDot = 129
+  Expr_Colon = 130
+  Expr_RArrow = 131
+  Expr_RDArrow = 132
+  Expr_DSlash = 133
+  Expr_TEqual = 134
+  Expr_NotDEqual = 135
+  Expr_TildeDEqual = 136
+  Expr_At = 137
+  Expr_DoubleAt = 138
+  Expr_Ellipsis = 139
+  Expr_Dollar = 140
+  Expr_NotTilde = 141
+  Expr_DTilde = 142
+  Expr_NotDTilde = 143
+  Expr_DStarEqual = 144
+  Expr_DSlashEqual = 145
+  Expr_CastedDummy = 146
+  Expr_Null = 147
+  Expr_True = 148
+  Expr_False = 149
+  Expr_And = 150
+  Expr_Or = 151
+  Expr_Not = 152
+  Expr_For = 153
+  Expr_Is = 154
+  Expr_In = 155
+  Expr_If = 156
+  Expr_Else = 157
+  Expr_Func = 158
+  Expr_Capture = 159
+  Expr_As = 160
+  Char_OneChar = 161
+  Char_Stop = 162
+  Char_Hex = 163
+  Char_YHex = 164
+  Char_Octal3 = 165
+  Char_Octal4 = 166
+  Char_Unicode4 = 167
+  Char_SurrogatePair = 168
+  Char_Unicode8 = 169
+  Char_UBraced = 170
+  Char_Pound = 171
+  Char_AsciiControl = 172
+  BashRegex_LParen = 173
+  BashRegex_AllowedInParens = 174
+  Eggex_Start = 175
+  Eggex_End = 176
+  Eggex_Dot = 177
+  Redir_Less = 178
+  Redir_Great = 179
+  Redir_DLess = 180
+  Redir_TLess = 181
+  Redir_DGreat = 182
+  Redir_GreatAnd = 183
+  Redir_LessAnd = 184
+  Redir_DLessDash = 185
+  Redir_LessGreat = 186
+  Redir_Clobber = 187
+  Redir_AndGreat = 188
+  Redir_AndDGreat = 189
+  Left_DoubleQuote = 190
+  Left_JDoubleQuote = 191
+  Left_SingleQuote = 192
+  Left_DollarSingleQuote = 193
+  Left_RSingleQuote = 194
+  Left_USingleQuote = 195
+  Left_BSingleQuote = 196
+  Left_TDoubleQuote = 197
+  Left_DollarTDoubleQuote = 198
+  Left_TSingleQuote = 199
+  Left_RTSingleQuote = 200
+  Left_UTSingleQuote = 201
+  Left_BTSingleQuote = 202
+  Left_Backtick = 203
+  Left_DollarParen = 204
+  Left_DollarBrace = 205
+  Left_DollarBraceZsh = 206
+  Left_DollarDParen = 207
+  Left_DollarBracket = 208
+  Left_DollarDoubleQuote = 209
+  Left_ProcSubIn = 210
+  Left_ProcSubOut = 211
+  Left_AtParen = 212
+  Left_CaretParen = 213
+  Left_CaretBracket = 214
+  Left_CaretBrace = 215
+  Left_CaretDoubleQuote = 216
+  Left_ColonPipe = 217
+  Left_PercentParen = 218
+  Right_DoubleQuote = 219
+  Right_SingleQuote = 220
+  Right_Backtick = 221
+  Right_DollarBrace = 222
+  Right_DollarDParen = 223
+  Right_DollarDoubleQuote = 224
+  Right_DollarSingleQuote = 225
+  Right_Subshell = 226
+  Right_ShFunction = 227
+  Right_CasePat = 228
+  Right_ShArrayLiteral = 229
+  Right_ExtGlob = 230
+  Right_BashRegexGroup = 231
+  Right_BlockLiteral = 232
+  ExtGlob_Comma = 233
+  ExtGlob_At = 234
+  ExtGlob_Star = 235
+  ExtGlob_Plus = 236
+  ExtGlob_QMark = 237
+  ExtGlob_Bang = 238
+  VSub_DollarName = 239
+  VSub_Name = 240
+  VSub_Number = 241
+  VSub_Bang = 242
+  VSub_At = 243
+  VSub_Pound = 244
+  VSub_Dollar = 245
+  VSub_Star = 246
+  VSub_Hyphen = 247
+  VSub_QMark = 248
+  VSub_Dot = 249
+  VTest_ColonHyphen = 250
+  VTest_Hyphen = 251
+  VTest_ColonEquals = 252
+  VTest_Equals = 253
+  VTest_ColonQMark = 254
+  VTest_QMark = 255
+  VTest_ColonPlus = 256
+  VTest_Plus = 257
+  VOp0_Q = 258
+  VOp0_E = 259
+  VOp0_P = 260
+  VOp0_A = 261
+  VOp0_a = 262
+  VOp1_Percent = 263
+  VOp1_DPercent = 264
+  VOp1_Pound = 265
+  VOp1_DPound = 266
+  VOp1_Caret = 267
+  VOp1_DCaret = 268
+  VOp1_Comma = 269
+  VOp1_DComma = 270
+  VOpYsh_Pipe = 271
+  VOpYsh_Space = 272
+  VOp2_Slash = 273
+  VOp2_Colon = 274
+  VOp2_LBracket = 275
+  VOp2_RBracket = 276
+  VOp3_At = 277
+  VOp3_Star = 278
+  Node_PostDPlus = 279
+  Node_PostDMinus = 280
+  Node_UnaryPlus = 281
+  Node_UnaryMinus = 282
+  Node_NotIn = 283
+  Node_IsNot = 284
+  KW_DLeftBracket = 285
+  KW_Bang = 286
+  KW_For = 287
+  KW_While = 288
+  KW_Until = 289
+  KW_Do = 290
+  KW_Done = 291
+  KW_In = 292
+  KW_Case = 293
+  KW_Esac = 294
+  KW_If = 295
+  KW_Fi = 296
+  KW_Then = 297
+  KW_Else = 298
+  KW_Elif = 299
+  KW_Function = 300
+  KW_Time = 301
+  KW_Const = 302
+  KW_Var = 303
+  KW_SetVar = 304
+  KW_SetGlobal = 305
+  KW_Call = 306
+  KW_Proc = 307
+  KW_Typed = 308
+  KW_Func = 309
+  ControlFlow_Break = 310
+  ControlFlow_Continue = 311
+  ControlFlow_Return = 312
+  ControlFlow_Exit = 313
+  LookAhead_FuncParens = 314
+  Glob_LBracket = 315
+  Glob_RBracket = 316
+  Glob_Star = 317
+  Glob_QMark = 318
+  Glob_Bang = 319
+  Glob_Caret = 320
+  Glob_EscapedChar = 321
+  Glob_BadBackslash = 322
+  Glob_CleanLiterals = 323
+  Glob_OtherLiteral = 324
+  Format_EscapedPercent = 325
+  Format_Percent = 326
+  Format_Flag = 327
+  Format_Num = 328
+  Format_Dot = 329
+  Format_Type = 330
+  Format_Star = 331
+  Format_Time = 332
+  Format_Zero = 333
+  PS_Subst = 334
+  PS_Octal3 = 335
+  PS_LBrace = 336
+  PS_RBrace = 337
+  PS_Literals = 338
+  PS_BadBackslash = 339
+  Range_Int = 340
+  Range_Char = 341
+  Range_Dots = 342
+  Range_Other = 343
+  J8_LBracket = 344
+  J8_RBracket = 345
+  J8_LBrace = 346
+  J8_RBrace = 347
+  J8_Comma = 348
+  J8_Colon = 349
+  J8_Null = 350
+  J8_Bool = 351
+  J8_Int = 352
+  J8_Float = 353
+  J8_String = 354
+  J8_Identifier = 355
+  J8_Newline = 356
+  J8_Tab = 357
+  J8_LParen = 358
+  J8_RParen = 359
+  J8_Operator = 360
+  BoolUnary_z = 361
+  BoolUnary_n = 362
+  BoolUnary_o = 363
+  BoolUnary_t = 364
+  BoolUnary_v = 365
+  BoolUnary_R = 366
+  BoolUnary_a = 367
+  BoolUnary_b = 368
+  BoolUnary_c = 369
+  BoolUnary_d = 370
+  BoolUnary_e = 371
+  BoolUnary_f = 372
+  BoolUnary_g = 373
+  BoolUnary_h = 374
+  BoolUnary_k = 375
+  BoolUnary_L = 376
+  BoolUnary_p = 377
+  BoolUnary_r = 378
+  BoolUnary_s = 379
+  BoolUnary_S = 380
+  BoolUnary_u = 381
+  BoolUnary_w = 382
+  BoolUnary_x = 383
+  BoolUnary_O = 384
+  BoolUnary_G = 385
+  BoolUnary_N = 386
+  BoolBinary_GlobEqual = 387
+  BoolBinary_GlobDEqual = 388
+  BoolBinary_GlobNEqual = 389
+  BoolBinary_EqualTilde = 390
+  BoolBinary_ef = 391
+  BoolBinary_nt = 392
+  BoolBinary_ot = 393
+  BoolBinary_eq = 394
+  BoolBinary_ne = 395
+  BoolBinary_gt = 396
+  BoolBinary_ge = 397
+  BoolBinary_lt = 398
+  BoolBinary_le = 399
+  BoolBinary_Equal = 400
+  BoolBinary_DEqual = 401
+  BoolBinary_NEqual = 402
+  ARRAY_SIZE = 403
+
+_Id_str = {
+  1: 'Id.Word_Compound',
+  2: 'Id.Arith_Semi',
+  3: 'Id.Arith_Comma',
+  4: 'Id.Arith_Plus',
+  5: 'Id.Arith_Minus',
+  6: 'Id.Arith_Star',
+  7: 'Id.Arith_Slash',
+  8: 'Id.Arith_Percent',
+  9: 'Id.Arith_DPlus',
+  10: 'Id.Arith_DMinus',
+  11: 'Id.Arith_DStar',
+  12: 'Id.Arith_LParen',
+  13: 'Id.Arith_RParen',
+  14: 'Id.Arith_LBracket',
+  15: 'Id.Arith_RBracket',
+  16: 'Id.Arith_RBrace',
+  17: 'Id.Arith_QMark',
+  18: 'Id.Arith_Colon',
+  19: 'Id.Arith_LessEqual',
+  20: 'Id.Arith_Less',
+  21: 'Id.Arith_GreatEqual',
+  22: 'Id.Arith_Great',
+  23: 'Id.Arith_DEqual',
+  24: 'Id.Arith_NEqual',
+  25: 'Id.Arith_DAmp',
+  26: 'Id.Arith_DPipe',
+  27: 'Id.Arith_Bang',
+  28: 'Id.Arith_DGreat',
+  29: 'Id.Arith_DLess',
+  30: 'Id.Arith_Amp',
+  31: 'Id.Arith_Pipe',
+  32: 'Id.Arith_Caret',
+  33: 'Id.Arith_Tilde',
+  34: 'Id.Arith_Equal',
+  35: 'Id.Arith_PlusEqual',
+  36: 'Id.Arith_MinusEqual',
+  37: 'Id.Arith_StarEqual',
+  38: 'Id.Arith_SlashEqual',
+  39: 'Id.Arith_PercentEqual',
+  40: 'Id.Arith_DGreatEqual',
+  41: 'Id.Arith_DLessEqual',
+  42: 'Id.Arith_AmpEqual',
+  43: 'Id.Arith_CaretEqual',
+  44: 'Id.Arith_PipeEqual',
+  45: 'Id.Eof_Real',
+  46: 'Id.Eof_RParen',
+  47: 'Id.Eof_Backtick',
+  48: 'Id.Undefined_Tok',
+  49: 'Id.Unknown_Tok',
+  50: 'Id.Unknown_Backslash',
+  51: 'Id.Unknown_DEqual',
+  52: 'Id.Eol_Tok',
+  53: 'Id.Ignored_LineCont',
+  54: 'Id.Ignored_Space',
+  55: 'Id.Ignored_Comment',
+  56: 'Id.Ignored_Newline',
+  57: 'Id.WS_Space',
+  58: 'Id.Lit_Chars',
+  59: 'Id.Lit_CharsWithoutPrefix',
+  60: 'Id.Lit_VarLike',
+  61: 'Id.Lit_ArrayLhsOpen',
+  62: 'Id.Lit_ArrayLhsClose',
+  63: 'Id.Lit_Splice',
+  64: 'Id.Lit_AtLBracket',
+  65: 'Id.Lit_AtLBraceDot',
+  66: 'Id.Lit_Other',
+  67: 'Id.Lit_EscapedChar',
+  68: 'Id.Lit_LBracket',
+  69: 'Id.Lit_RBracket',
+  70: 'Id.Lit_Star',
+  71: 'Id.Lit_QMark',
+  72: 'Id.Lit_LBrace',
+  73: 'Id.Lit_RBrace',
+  74: 'Id.Lit_Comma',
+  75: 'Id.Lit_Equals',
+  76: 'Id.Lit_Dollar',
+  77: 'Id.Lit_DRightBracket',
+  78: 'Id.Lit_Tilde',
+  79: 'Id.Lit_Pound',
+  80: 'Id.Lit_TPound',
+  81: 'Id.Lit_TDot',
+  82: 'Id.Lit_Slash',
+  83: 'Id.Lit_Percent',
+  84: 'Id.Lit_Colon',
+  85: 'Id.Lit_Digits',
+  86: 'Id.Lit_At',
+  87: 'Id.Lit_ArithVarLike',
+  88: 'Id.Lit_BadBackslash',
+  89: 'Id.Lit_CompDummy',
+  90: 'Id.Backtick_Right',
+  91: 'Id.Backtick_Quoted',
+  92: 'Id.Backtick_DoubleQuote',
+  93: 'Id.Backtick_Other',
+  94: 'Id.History_Op',
+  95: 'Id.History_Num',
+  96: 'Id.History_Search',
+  97: 'Id.History_Other',
+  98: 'Id.Op_Newline',
+  99: 'Id.Op_Amp',
+  100: 'Id.Op_Pipe',
+  101: 'Id.Op_PipeAmp',
+  102: 'Id.Op_DAmp',
+  103: 'Id.Op_DPipe',
+  104: 'Id.Op_Semi',
+  105: 'Id.Op_DSemi',
+  106: 'Id.Op_SemiAmp',
+  107: 'Id.Op_DSemiAmp',
+  108: 'Id.Op_LParen',
+  109: 'Id.Op_RParen',
+  110: 'Id.Op_DLeftParen',
+  111: 'Id.Op_DRightParen',
+  112: 'Id.Op_Less',
+  113: 'Id.Op_Great',
+  114: 'Id.Op_Bang',
+  115: 'Id.Op_LBracket',
+  116: 'Id.Op_RBracket',
+  117: 'Id.Op_LBrace',
+  118: 'Id.Op_RBrace',
+  119: 'Id.Expr_Reserved',
+  120: 'Id.Expr_Symbol',
+  121: 'Id.Expr_Name',
+  122: 'Id.Expr_DecInt',
+  123: 'Id.Expr_BinInt',
+  124: 'Id.Expr_OctInt',
+  125: 'Id.Expr_HexInt',
+  126: 'Id.Expr_Float',
+  127: 'Id.Expr_Bang',
+  128: 'Id.Expr_Dot',
+  129: 'Id.Expr_DDot',
+  130: 'Id.Expr_Colon',
+  131: 'Id.Expr_RArrow',
+  132: 'Id.Expr_RDArrow',
+  133: 'Id.Expr_DSlash',
+  134: 'Id.Expr_TEqual',
+  135: 'Id.Expr_NotDEqual',
+  136: 'Id.Expr_TildeDEqual',
+  137: 'Id.Expr_At',
+  138: 'Id.Expr_DoubleAt',
+  139: 'Id.Expr_Ellipsis',
+  140: 'Id.Expr_Dollar',
+  141: 'Id.Expr_NotTilde',
+  142: 'Id.Expr_DTilde',
+  143: 'Id.Expr_NotDTilde',
+  144: 'Id.Expr_DStarEqual',
+  145: 'Id.Expr_DSlashEqual',
+  146: 'Id.Expr_CastedDummy',
+  147: 'Id.Expr_Null',
+  148: 'Id.Expr_True',
+  149: 'Id.Expr_False',
+  150: 'Id.Expr_And',
+  151: 'Id.Expr_Or',
+  152: 'Id.Expr_Not',
+  153: 'Id.Expr_For',
+  154: 'Id.Expr_Is',
+  155: 'Id.Expr_In',
+  156: 'Id.Expr_If',
+  157: 'Id.Expr_Else',
+  158: 'Id.Expr_Func',
+  159: 'Id.Expr_Capture',
+  160: 'Id.Expr_As',
+  161: 'Id.Char_OneChar',
+  162: 'Id.Char_Stop',
+  163: 'Id.Char_Hex',
+  164: 'Id.Char_YHex',
+  165: 'Id.Char_Octal3',
+  166: 'Id.Char_Octal4',
+  167: 'Id.Char_Unicode4',
+  168: 'Id.Char_SurrogatePair',
+  169: 'Id.Char_Unicode8',
+  170: 'Id.Char_UBraced',
+  171: 'Id.Char_Pound',
+  172: 'Id.Char_AsciiControl',
+  173: 'Id.BashRegex_LParen',
+  174: 'Id.BashRegex_AllowedInParens',
+  175: 'Id.Eggex_Start',
+  176: 'Id.Eggex_End',
+  177: 'Id.Eggex_Dot',
+  178: 'Id.Redir_Less',
+  179: 'Id.Redir_Great',
+  180: 'Id.Redir_DLess',
+  181: 'Id.Redir_TLess',
+  182: 'Id.Redir_DGreat',
+  183: 'Id.Redir_GreatAnd',
+  184: 'Id.Redir_LessAnd',
+  185: 'Id.Redir_DLessDash',
+  186: 'Id.Redir_LessGreat',
+  187: 'Id.Redir_Clobber',
+  188: 'Id.Redir_AndGreat',
+  189: 'Id.Redir_AndDGreat',
+  190: 'Id.Left_DoubleQuote',
+  191: 'Id.Left_JDoubleQuote',
+  192: 'Id.Left_SingleQuote',
+  193: 'Id.Left_DollarSingleQuote',
+  194: 'Id.Left_RSingleQuote',
+  195: 'Id.Left_USingleQuote',
+  196: 'Id.Left_BSingleQuote',
+  197: 'Id.Left_TDoubleQuote',
+  198: 'Id.Left_DollarTDoubleQuote',
+  199: 'Id.Left_TSingleQuote',
+  200: 'Id.Left_RTSingleQuote',
+  201: 'Id.Left_UTSingleQuote',
+  202: 'Id.Left_BTSingleQuote',
+  203: 'Id.Left_Backtick',
+  204: 'Id.Left_DollarParen',
+  205: 'Id.Left_DollarBrace',
+  206: 'Id.Left_DollarBraceZsh',
+  207: 'Id.Left_DollarDParen',
+  208: 'Id.Left_DollarBracket',
+  209: 'Id.Left_DollarDoubleQuote',
+  210: 'Id.Left_ProcSubIn',
+  211: 'Id.Left_ProcSubOut',
+  212: 'Id.Left_AtParen',
+  213: 'Id.Left_CaretParen',
+  214: 'Id.Left_CaretBracket',
+  215: 'Id.Left_CaretBrace',
+  216: 'Id.Left_CaretDoubleQuote',
+  217: 'Id.Left_ColonPipe',
+  218: 'Id.Left_PercentParen',
+  219: 'Id.Right_DoubleQuote',
+  220: 'Id.Right_SingleQuote',
+  221: 'Id.Right_Backtick',
+  222: 'Id.Right_DollarBrace',
+  223: 'Id.Right_DollarDParen',
+  224: 'Id.Right_DollarDoubleQuote',
+  225: 'Id.Right_DollarSingleQuote',
+  226: 'Id.Right_Subshell',
+  227: 'Id.Right_ShFunction',
+  228: 'Id.Right_CasePat',
+  229: 'Id.Right_ShArrayLiteral',
+  230: 'Id.Right_ExtGlob',
+  231: 'Id.Right_BashRegexGroup',
+  232: 'Id.Right_BlockLiteral',
+  233: 'Id.ExtGlob_Comma',
+  234: 'Id.ExtGlob_At',
+  235: 'Id.ExtGlob_Star',
+  236: 'Id.ExtGlob_Plus',
+  237: 'Id.ExtGlob_QMark',
+  238: 'Id.ExtGlob_Bang',
+  239: 'Id.VSub_DollarName',
+  240: 'Id.VSub_Name',
+  241: 'Id.VSub_Number',
+  242: 'Id.VSub_Bang',
+  243: 'Id.VSub_At',
+  244: 'Id.VSub_Pound',
+  245: 'Id.VSub_Dollar',
+  246: 'Id.VSub_Star',
+  247: 'Id.VSub_Hyphen',
+  248: 'Id.VSub_QMark',
+  249: 'Id.VSub_Dot',
+  250: 'Id.VTest_ColonHyphen',
+  251: 'Id.VTest_Hyphen',
+  252: 'Id.VTest_ColonEquals',
+  253: 'Id.VTest_Equals',
+  254: 'Id.VTest_ColonQMark',
+  255: 'Id.VTest_QMark',
+  256: 'Id.VTest_ColonPlus',
+  257: 'Id.VTest_Plus',
+  258: 'Id.VOp0_Q',
+  259: 'Id.VOp0_E',
+  260: 'Id.VOp0_P',
+  261: 'Id.VOp0_A',
+  262: 'Id.VOp0_a',
+  263: 'Id.VOp1_Percent',
+  264: 'Id.VOp1_DPercent',
+  265: 'Id.VOp1_Pound',
+  266: 'Id.VOp1_DPound',
+  267: 'Id.VOp1_Caret',
+  268: 'Id.VOp1_DCaret',
+  269: 'Id.VOp1_Comma',
+  270: 'Id.VOp1_DComma',
+  271: 'Id.VOpYsh_Pipe',
+  272: 'Id.VOpYsh_Space',
+  273: 'Id.VOp2_Slash',
+  274: 'Id.VOp2_Colon',
+  275: 'Id.VOp2_LBracket',
+  276: 'Id.VOp2_RBracket',
+  277: 'Id.VOp3_At',
+  278: 'Id.VOp3_Star',
+  279: 'Id.Node_PostDPlus',
+  280: 'Id.Node_PostDMinus',
+  281: 'Id.Node_UnaryPlus',
+  282: 'Id.Node_UnaryMinus',
+  283: 'Id.Node_NotIn',
+  284: 'Id.Node_IsNot',
+  285: 'Id.KW_DLeftBracket',
+  286: 'Id.KW_Bang',
+  287: 'Id.KW_For',
+  288: 'Id.KW_While',
+  289: 'Id.KW_Until',
+  290: 'Id.KW_Do',
+  291: 'Id.KW_Done',
+  292: 'Id.KW_In',
+  293: 'Id.KW_Case',
+  294: 'Id.KW_Esac',
+  295: 'Id.KW_If',
+  296: 'Id.KW_Fi',
+  297: 'Id.KW_Then',
+  298: 'Id.KW_Else',
+  299: 'Id.KW_Elif',
+  300: 'Id.KW_Function',
+  301: 'Id.KW_Time',
+  302: 'Id.KW_Const',
+  303: 'Id.KW_Var',
+  304: 'Id.KW_SetVar',
+  305: 'Id.KW_SetGlobal',
+  306: 'Id.KW_Call',
+  307: 'Id.KW_Proc',
+  308: 'Id.KW_Typed',
+  309: 'Id.KW_Func',
+  310: 'Id.ControlFlow_Break',
+  311: 'Id.ControlFlow_Continue',
+  312: 'Id.ControlFlow_Return',
+  313: 'Id.ControlFlow_Exit',
+  314: 'Id.LookAhead_FuncParens',
+  315: 'Id.Glob_LBracket',
+  316: 'Id.Glob_RBracket',
+  317: 'Id.Glob_Star',
+  318: 'Id.Glob_QMark',
+  319: 'Id.Glob_Bang',
+  320: 'Id.Glob_Caret',
+  321: 'Id.Glob_EscapedChar',
+  322: 'Id.Glob_BadBackslash',
+  323: 'Id.Glob_CleanLiterals',
+  324: 'Id.Glob_OtherLiteral',
+  325: 'Id.Format_EscapedPercent',
+  326: 'Id.Format_Percent',
+  327: 'Id.Format_Flag',
+  328: 'Id.Format_Num',
+  329: 'Id.Format_Dot',
+  330: 'Id.Format_Type',
+  331: 'Id.Format_Star',
+  332: 'Id.Format_Time',
+  333: 'Id.Format_Zero',
+  334: 'Id.PS_Subst',
+  335: 'Id.PS_Octal3',
+  336: 'Id.PS_LBrace',
+  337: 'Id.PS_RBrace',
+  338: 'Id.PS_Literals',
+  339: 'Id.PS_BadBackslash',
+  340: 'Id.Range_Int',
+  341: 'Id.Range_Char',
+  342: 'Id.Range_Dots',
+  343: 'Id.Range_Other',
+  344: 'Id.J8_LBracket',
+  345: 'Id.J8_RBracket',
+  346: 'Id.J8_LBrace',
+  347: 'Id.J8_RBrace',
+  348: 'Id.J8_Comma',
+  349: 'Id.J8_Colon',
+  350: 'Id.J8_Null',
+  351: 'Id.J8_Bool',
+  352: 'Id.J8_Int',
+  353: 'Id.J8_Float',
+  354: 'Id.J8_String',
+  355: 'Id.J8_Identifier',
+  356: 'Id.J8_Newline',
+  357: 'Id.J8_Tab',
+  358: 'Id.J8_LParen',
+  359: 'Id.J8_RParen',
+  360: 'Id.J8_Operator',
+  361: 'Id.BoolUnary_z',
+  362: 'Id.BoolUnary_n',
+  363: 'Id.BoolUnary_o',
+  364: 'Id.BoolUnary_t',
+  365: 'Id.BoolUnary_v',
+  366: 'Id.BoolUnary_R',
+  367: 'Id.BoolUnary_a',
+  368: 'Id.BoolUnary_b',
+  369: 'Id.BoolUnary_c',
+  370: 'Id.BoolUnary_d',
+  371: 'Id.BoolUnary_e',
+  372: 'Id.BoolUnary_f',
+  373: 'Id.BoolUnary_g',
+  374: 'Id.BoolUnary_h',
+  375: 'Id.BoolUnary_k',
+  376: 'Id.BoolUnary_L',
+  377: 'Id.BoolUnary_p',
+  378: 'Id.BoolUnary_r',
+  379: 'Id.BoolUnary_s',
+  380: 'Id.BoolUnary_S',
+  381: 'Id.BoolUnary_u',
+  382: 'Id.BoolUnary_w',
+  383: 'Id.BoolUnary_x',
+  384: 'Id.BoolUnary_O',
+  385: 'Id.BoolUnary_G',
+  386: 'Id.BoolUnary_N',
+  387: 'Id.BoolBinary_GlobEqual',
+  388: 'Id.BoolBinary_GlobDEqual',
+  389: 'Id.BoolBinary_GlobNEqual',
+  390: 'Id.BoolBinary_EqualTilde',
+  391: 'Id.BoolBinary_ef',
+  392: 'Id.BoolBinary_nt',
+  393: 'Id.BoolBinary_ot',
+  394: 'Id.BoolBinary_eq',
+  395: 'Id.BoolBinary_ne',
+  396: 'Id.BoolBinary_gt',
+  397: 'Id.BoolBinary_ge',
+  398: 'Id.BoolBinary_lt',
+  399: 'Id.BoolBinary_le',
+  400: 'Id.BoolBinary_Equal',
+  401: 'Id.BoolBinary_DEqual',
+  402: 'Id.BoolBinary_NEqual',
+}
+
+def Id_str(val):
+  # type: (Id_t) -> str
+  return _Id_str[val]
+
+class Kind_t(pybase.SimpleObj):
+  pass
+
+class Kind(object):
+  Word = Kind_t(1)
+  Arith = Kind_t(2)
+  Eof = Kind_t(3)
+  Undefined = Kind_t(4)
+  Unknown = Kind_t(5)
+  Eol = Kind_t(6)
+  Ignored = Kind_t(7)
+  WS = Kind_t(8)
+  Lit = Kind_t(9)
+  Backtick = Kind_t(10)
+  History = Kind_t(11)
+  Op = Kind_t(12)
+  Expr = Kind_t(13)
+  Char = Kind_t(14)
+  BashRegex = Kind_t(15)
+  Eggex = Kind_t(16)
+  Redir = Kind_t(17)
+  Left = Kind_t(18)
+  Right = Kind_t(19)
+  ExtGlob = Kind_t(20)
+  VSub = Kind_t(21)
+  VTest = Kind_t(22)
+  VOp0 = Kind_t(23)
+  VOp1 = Kind_t(24)
+  VOpYsh = Kind_t(25)
+  VOp2 = Kind_t(26)
+  VOp3 = Kind_t(27)
+  Node = Kind_t(28)
+  KW = Kind_t(29)
+  ControlFlow = Kind_t(30)
+  LookAhead = Kind_t(31)
+  Glob = Kind_t(32)
+  Format = Kind_t(33)
+  PS = Kind_t(34)
+  Range = Kind_t(35)
+  J8 = Kind_t(36)
+  BoolUnary = Kind_t(37)
+  BoolBinary = Kind_t(38)
+
+_Kind_str = {
+  1: 'Kind.Word',
+  2: 'Kind.Arith',
+  3: 'Kind.Eof',
+  4: 'Kind.Undefined',
+  5: 'Kind.Unknown',
+  6: 'Kind.Eol',
+  7: 'Kind.Ignored',
+  8: 'Kind.WS',
+  9: 'Kind.Lit',
+  10: 'Kind.Backtick',
+  11: 'Kind.History',
+  12: 'Kind.Op',
+  13: 'Kind.Expr',
+  14: 'Kind.Char',
+  15: 'Kind.BashRegex',
+  16: 'Kind.Eggex',
+  17: 'Kind.Redir',
+  18: 'Kind.Left',
+  19: 'Kind.Right',
+  20: 'Kind.ExtGlob',
+  21: 'Kind.VSub',
+  22: 'Kind.VTest',
+  23: 'Kind.VOp0',
+  24: 'Kind.VOp1',
+  25: 'Kind.VOpYsh',
+  26: 'Kind.VOp2',
+  27: 'Kind.VOp3',
+  28: 'Kind.Node',
+  29: 'Kind.KW',
+  30: 'Kind.ControlFlow',
+  31: 'Kind.LookAhead',
+  32: 'Kind.Glob',
+  33: 'Kind.Format',
+  34: 'Kind.PS',
+  35: 'Kind.Range',
+  36: 'Kind.J8',
+  37: 'Kind.BoolUnary',
+  38: 'Kind.BoolBinary',
+}
+
+def Kind_str(val):
+  # type: (Kind_t) -> str
+  return _Kind_str[val]
+
@@ -0,0 +1,384 @@
+from asdl import pybase
+
+option_t = int  # type alias for integer
+
+class option_i(object):
+  errexit = 1
+  nounset = 2
+  pipefail = 3
+  inherit_errexit = 4
+  nullglob = 5
+  verbose_errexit = 6
+  noexec = 7
+  xtrace = 8
+  verbose = 9
+  noglob = 10
+  noclobber = 11
+  posix = 12
+  vi = 13
+  emacs = 14
+  interactive = 15
+  hashall = 16
+  failglob = 17
+  extglob = 18
+  dotglob = 19
+  globstar = 20
+  nocaseglob = 21
+  nocasematch = 22
+  eval_unsafe_arith = 23
+  buffered_stdin = 24
+  _allow_command_sub = 25
+  _allow_process_sub = 26
+  dynamic_scope = 27
+  redefine_module = 28
+  _running_trap = 29
+  _running_hay = 30
+  _no_debug_trap = 31
+  strict_argv = 32
+  strict_arith = 33
+  strict_array = 34
+  strict_control_flow = 35
+  strict_errexit = 36
+  strict_nameref = 37
+  strict_word_eval = 38
+  strict_tilde = 39
+  strict_glob = 40
+  parse_at = 41
+  parse_proc = 42
+  parse_func = 43
+  parse_brace = 44
+  parse_bracket = 45
+  parse_equals = 46
+  parse_paren = 47
+  parse_ysh_string = 48
+  parse_triple_quote = 49
+  simple_word_eval = 50
+  dashglob = 51
+  command_sub_errexit = 52
+  process_sub_fail = 53
+  xtrace_rich = 54
+  xtrace_details = 55
+  sigpipe_status_ok = 56
+  redefine_proc_func = 57
+  parse_at_all = 58
+  parse_backslash = 59
+  parse_backticks = 60
+  parse_dollar = 61
+  parse_ignored = 62
+  parse_sh_arith = 63
+  parse_dparen = 64
+  parse_dbracket = 65
+  parse_bare_word = 66
+  simple_echo = 67
+  simple_eval_builtin = 68
+  simple_test_builtin = 69
+  expand_aliases = 70
+  lastpipe = 71
+  progcomp = 72
+  histappend = 73
+  hostcomplete = 74
+  cmdhist = 75
+  assoc_expand_once = 76
+  autocd = 77
+  cdable_vars = 78
+  cdspell = 79
+  checkhash = 80
+  checkjobs = 81
+  checkwinsize = 82
+  complete_fullquote = 83
+  direxpand = 84
+  dirspell = 85
+  execfail = 86
+  extdebug = 87
+  extquote = 88
+  force_fignore = 89
+  globasciiranges = 90
+  gnu_errfmt = 91
+  histreedit = 92
+  histverify = 93
+  huponexit = 94
+  interactive_comments = 95
+  lithist = 96
+  localvar_inherit = 97
+  localvar_unset = 98
+  login_shell = 99
+  mailwarn = 100
+  no_empty_cmd_completion = 101
+  progcomp_alias = 102
+  promptvars = 103
+  restricted_shell = 104
+  shift_verbose = 105
+  sourcepath = 106
+  xpg_echo = 107
+  ARRAY_SIZE = 108
+
+_option_str = {
+  1: 'option.errexit',
+  2: 'option.nounset',
+  3: 'option.pipefail',
+  4: 'option.inherit_errexit',
+  5: 'option.nullglob',
+  6: 'option.verbose_errexit',
+  7: 'option.noexec',
+  8: 'option.xtrace',
+  9: 'option.verbose',
+  10: 'option.noglob',
+  11: 'option.noclobber',
+  12: 'option.posix',
+  13: 'option.vi',
+  14: 'option.emacs',
+  15: 'option.interactive',
+  16: 'option.hashall',
+  17: 'option.failglob',
+  18: 'option.extglob',
+  19: 'option.dotglob',
+  20: 'option.globstar',
+  21: 'option.nocaseglob',
+  22: 'option.nocasematch',
+  23: 'option.eval_unsafe_arith',
+  24: 'option.buffered_stdin',
+  25: 'option._allow_command_sub',
+  26: 'option._allow_process_sub',
+  27: 'option.dynamic_scope',
+  28: 'option.redefine_module',
+  29: 'option._running_trap',
+  30: 'option._running_hay',
+  31: 'option._no_debug_trap',
+  32: 'option.strict_argv',
+  33: 'option.strict_arith',
+  34: 'option.strict_array',
+  35: 'option.strict_control_flow',
+  36: 'option.strict_errexit',
+  37: 'option.strict_nameref',
+  38: 'option.strict_word_eval',
+  39: 'option.strict_tilde',
+  40: 'option.strict_glob',
+  41: 'option.parse_at',
+  42: 'option.parse_proc',
+  43: 'option.parse_func',
+  44: 'option.parse_brace',
+  45: 'option.parse_bracket',
+  46: 'option.parse_equals',
+  47: 'option.parse_paren',
+  48: 'option.parse_ysh_string',
+  49: 'option.parse_triple_quote',
+  50: 'option.simple_word_eval',
+  51: 'option.dashglob',
+  52: 'option.command_sub_errexit',
+  53: 'option.process_sub_fail',
+  54: 'option.xtrace_rich',
+  55: 'option.xtrace_details',
+  56: 'option.sigpipe_status_ok',
+  57: 'option.redefine_proc_func',
+  58: 'option.parse_at_all',
+  59: 'option.parse_backslash',
+  60: 'option.parse_backticks',
+  61: 'option.parse_dollar',
+  62: 'option.parse_ignored',
+  63: 'option.parse_sh_arith',
+  64: 'option.parse_dparen',
+  65: 'option.parse_dbracket',
+  66: 'option.parse_bare_word',
+  67: 'option.simple_echo',
+  68: 'option.simple_eval_builtin',
+  69: 'option.simple_test_builtin',
+  70: 'option.expand_aliases',
+  71: 'option.lastpipe',
+  72: 'option.progcomp',
+  73: 'option.histappend',
+  74: 'option.hostcomplete',
+  75: 'option.cmdhist',
+  76: 'option.assoc_expand_once',
+  77: 'option.autocd',
+  78: 'option.cdable_vars',
+  79: 'option.cdspell',
+  80: 'option.checkhash',
+  81: 'option.checkjobs',
+  82: 'option.checkwinsize',
+  83: 'option.complete_fullquote',
+  84: 'option.direxpand',
+  85: 'option.dirspell',
+  86: 'option.execfail',
+  87: 'option.extdebug',
+  88: 'option.extquote',
+  89: 'option.force_fignore',
+  90: 'option.globasciiranges',
+  91: 'option.gnu_errfmt',
+  92: 'option.histreedit',
+  93: 'option.histverify',
+  94: 'option.huponexit',
+  95: 'option.interactive_comments',
+  96: 'option.lithist',
+  97: 'option.localvar_inherit',
+  98: 'option.localvar_unset',
+  99: 'option.login_shell',
+  100: 'option.mailwarn',
+  101: 'option.no_empty_cmd_completion',
+  102: 'option.progcomp_alias',
+  103: 'option.promptvars',
+  104: 'option.restricted_shell',
+  105: 'option.shift_verbose',
+  106: 'option.sourcepath',
+  107: 'option.xpg_echo',
+}
+
+def option_str(val):
+  # type: (option_t) -> str
+  return _option_str[val]
+
+builtin_t = int  # type alias for integer
+
+class builtin_i(object):
+  colon = 1
+  dot = 2
+  exec_ = 3
+  eval = 4
+  set = 5
+  shift = 6
+  times = 7
+  trap = 8
+  unset = 9
+  builtin = 10
+  readonly = 11
+  local = 12
+  declare = 13
+  typeset = 14
+  export_ = 15
+  true_ = 16
+  false_ = 17
+  try_ = 18
+  read = 19
+  echo = 20
+  printf = 21
+  mapfile = 22
+  readarray = 23
+  cd = 24
+  pushd = 25
+  popd = 26
+  dirs = 27
+  pwd = 28
+  source = 29
+  umask = 30
+  ulimit = 31
+  wait = 32
+  jobs = 33
+  fg = 34
+  bg = 35
+  shopt = 36
+  complete = 37
+  compgen = 38
+  compopt = 39
+  compadjust = 40
+  compexport = 41
+  getopts = 42
+  command = 43
+  type = 44
+  hash = 45
+  help = 46
+  history = 47
+  alias = 48
+  unalias = 49
+  bind = 50
+  append = 51
+  write = 52
+  json = 53
+  json8 = 54
+  pp = 55
+  hay = 56
+  haynode = 57
+  module = 58
+  use = 59
+  error = 60
+  fork = 61
+  forkwait = 62
+  fopen = 63
+  shvar = 64
+  ctx = 65
+  runproc = 66
+  boolstatus = 67
+  test = 68
+  bracket = 69
+  push_registers = 70
+  is_main = 71
+  cat = 72
+  ARRAY_SIZE = 73
+
+_builtin_str = {
+  1: 'builtin.colon',
+  2: 'builtin.dot',
+  3: 'builtin.exec_',
+  4: 'builtin.eval',
+  5: 'builtin.set',
+  6: 'builtin.shift',
+  7: 'builtin.times',
+  8: 'builtin.trap',
+  9: 'builtin.unset',
+  10: 'builtin.builtin',
+  11: 'builtin.readonly',
+  12: 'builtin.local',
+  13: 'builtin.declare',
+  14: 'builtin.typeset',
+  15: 'builtin.export_',
+  16: 'builtin.true_',
+  17: 'builtin.false_',
+  18: 'builtin.try_',
+  19: 'builtin.read',
+  20: 'builtin.echo',
+  21: 'builtin.printf',
+  22: 'builtin.mapfile',
+  23: 'builtin.readarray',
+  24: 'builtin.cd',
+  25: 'builtin.pushd',
+  26: 'builtin.popd',
+  27: 'builtin.dirs',
+  28: 'builtin.pwd',
+  29: 'builtin.source',
+  30: 'builtin.umask',
+  31: 'builtin.ulimit',
+  32: 'builtin.wait',
+  33: 'builtin.jobs',
+  34: 'builtin.fg',
+  35: 'builtin.bg',
+  36: 'builtin.shopt',
+  37: 'builtin.complete',
+  38: 'builtin.compgen',
+  39: 'builtin.compopt',
+  40: 'builtin.compadjust',
+  41: 'builtin.compexport',
+  42: 'builtin.getopts',
+  43: 'builtin.command',
+  44: 'builtin.type',
+  45: 'builtin.hash',
+  46: 'builtin.help',
+  47: 'builtin.history',
+  48: 'builtin.alias',
+  49: 'builtin.unalias',
+  50: 'builtin.bind',
+  51: 'builtin.append',
+  52: 'builtin.write',
+  53: 'builtin.json',
+  54: 'builtin.json8',
+  55: 'builtin.pp',
+  56: 'builtin.hay',
+  57: 'builtin.haynode',
+  58: 'builtin.module',
+  59: 'builtin.use',
+  60: 'builtin.error',
+  61: 'builtin.fork',
+  62: 'builtin.forkwait',
+  63: 'builtin.fopen',
+  64: 'builtin.shvar',
+  65: 'builtin.ctx',
+  66: 'builtin.runproc',
+  67: 'builtin.boolstatus',
+  68: 'builtin.test',
+  69: 'builtin.bracket',
+  70: 'builtin.push_registers',
+  71: 'builtin.is_main',
+  72: 'builtin.cat',
+}
+
+def builtin_str(val):
+  # type: (builtin_t) -> str
+  return _builtin_str[val]
+
@@ -0,0 +1,18698 @@
+from asdl import pybase
+from mycpp import mops
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from _devbuild.gen.value_asdl import value_t
+
+from _devbuild.gen.id_kind_asdl import Id_t
+from _devbuild.gen.id_kind_asdl import Id_str
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf, TraversalState
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
+
+class parse_result_e(object):
+  EmptyLine = 1
+  Eof = 2
+  Node = 3
+
+_parse_result_str = {
+  1: 'EmptyLine',
+  2: 'Eof',
+  3: 'Node',
+}
+
+def parse_result_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _parse_result_str[tag]
+  if dot:
+    return "parse_result.%s" % v
+  else:
+    return v
+
+class parse_result_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> parse_result_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('parse_result_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('parse_result_t', dec.Ref())
+    if tag == parse_result_e.EmptyLine:
+      return parse_result__EmptyLine.UnmarshalNew(dec)
+    if tag == parse_result_e.Eof:
+      return parse_result__Eof.UnmarshalNew(dec)
+    if tag == parse_result_e.Node:
+      return parse_result.Node.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('parse_result_t', None)
+  pass
+
+class parse_result__EmptyLine(parse_result_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> parse_result__EmptyLine
+    dec.Register(parse_result.EmptyLine)
+    return parse_result.EmptyLine
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('parse_result__EmptyLine')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('parse_result__EmptyLine')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class parse_result__Eof(parse_result_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> parse_result__Eof
+    dec.Register(parse_result.Eof)
+    return parse_result.Eof
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('parse_result__Eof')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('parse_result__Eof')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class parse_result(object):
+  EmptyLine = parse_result__EmptyLine()
+  
+  Eof = parse_result__Eof()
+  
+  class Node(parse_result_t):
+    _type_tag = 3
+    __slots__ = ('cmd',)
+  
+    def __init__(self, cmd):
+      # type: (command_t) -> None
+      self.cmd = cmd
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> parse_result.Node
+      return parse_result.Node(cast(command_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.cmd is None:
+        enc.Null()
+      else:
+        self.cmd.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> parse_result.Node
+      x0 = command_t.Unmarshal(dec)
+      obj = parse_result.Node(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('parse_result.Node')
+      L = out_node.fields
+  
+      assert self.cmd is not None
+      x0 = self.cmd.PrettyTree(trav=trav)
+      L.append(Field('cmd', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('parse_result.Node')
+      L = out_node.fields
+      assert self.cmd is not None
+      x0 = self.cmd.AbbreviatedTree(trav=trav)
+      L.append(Field('cmd', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class source_e(object):
+  Interactive = 1
+  Headless = 2
+  Unused = 3
+  CFlag = 4
+  Stdin = 5
+  MainFile = 6
+  SourcedFile = 7
+  ArgvWord = 8
+  Variable = 9
+  VarRef = 10
+  Alias = 11
+  Reparsed = 12
+  Synthetic = 13
+
+_source_str = {
+  1: 'Interactive',
+  2: 'Headless',
+  3: 'Unused',
+  4: 'CFlag',
+  5: 'Stdin',
+  6: 'MainFile',
+  7: 'SourcedFile',
+  8: 'ArgvWord',
+  9: 'Variable',
+  10: 'VarRef',
+  11: 'Alias',
+  12: 'Reparsed',
+  13: 'Synthetic',
+}
+
+def source_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _source_str[tag]
+  if dot:
+    return "source.%s" % v
+  else:
+    return v
+
+class source_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> source_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('source_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('source_t', dec.Ref())
+    if tag == source_e.Interactive:
+      return source__Interactive.UnmarshalNew(dec)
+    if tag == source_e.Headless:
+      return source__Headless.UnmarshalNew(dec)
+    if tag == source_e.Unused:
+      return source.Unused.UnmarshalNew(dec)
+    if tag == source_e.CFlag:
+      return source__CFlag.UnmarshalNew(dec)
+    if tag == source_e.Stdin:
+      return source.Stdin.UnmarshalNew(dec)
+    if tag == source_e.MainFile:
+      return source.MainFile.UnmarshalNew(dec)
+    if tag == source_e.SourcedFile:
+      return source.SourcedFile.UnmarshalNew(dec)
+    if tag == source_e.ArgvWord:
+      return source.ArgvWord.UnmarshalNew(dec)
+    if tag == source_e.Variable:
+      return source.Variable.UnmarshalNew(dec)
+    if tag == source_e.VarRef:
+      return source.VarRef.UnmarshalNew(dec)
+    if tag == source_e.Alias:
+      return source.Alias.UnmarshalNew(dec)
+    if tag == source_e.Reparsed:
+      return source.Reparsed.UnmarshalNew(dec)
+    if tag == source_e.Synthetic:
+      return source.Synthetic.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('source_t', None)
+  pass
+
+class source__Interactive(source_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> source__Interactive
+    dec.Register(source.Interactive)
+    return source.Interactive
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('source__Interactive')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('source__Interactive')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class source__Headless(source_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> source__Headless
+    dec.Register(source.Headless)
+    return source.Headless
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('source__Headless')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('source__Headless')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class source__CFlag(source_t):
+  _type_tag = 4
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> source__CFlag
+    dec.Register(source.CFlag)
+    return source.CFlag
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('source__CFlag')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('source__CFlag')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class source(object):
+  Interactive = source__Interactive()
+  
+  Headless = source__Headless()
+  
+  class Unused(source_t):
+    _type_tag = 3
+    __slots__ = ('comment',)
+  
+    def __init__(self, comment):
+      # type: (str) -> None
+      self.comment = comment
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.Unused
+      return source.Unused('')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.comment)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.Unused
+      x0 = dec.Str()
+      obj = source.Unused(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Unused')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.comment, color_e.StringConst)
+      L.append(Field('comment', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Unused')
+      L = out_node.fields
+      x0 = NewLeaf(self.comment, color_e.StringConst)
+      L.append(Field('comment', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  CFlag = source__CFlag()
+  
+  class Stdin(source_t):
+    _type_tag = 5
+    __slots__ = ('comment',)
+  
+    def __init__(self, comment):
+      # type: (str) -> None
+      self.comment = comment
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.Stdin
+      return source.Stdin('')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.comment)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.Stdin
+      x0 = dec.Str()
+      obj = source.Stdin(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Stdin')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.comment, color_e.StringConst)
+      L.append(Field('comment', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Stdin')
+      L = out_node.fields
+      x0 = NewLeaf(self.comment, color_e.StringConst)
+      L.append(Field('comment', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class MainFile(source_t):
+    _type_tag = 6
+    __slots__ = ('path',)
+  
+    def __init__(self, path):
+      # type: (str) -> None
+      self.path = path
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.MainFile
+      return source.MainFile('')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.path)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.MainFile
+      x0 = dec.Str()
+      obj = source.MainFile(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.MainFile')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.path, color_e.StringConst)
+      L.append(Field('path', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.MainFile')
+      L = out_node.fields
+      x0 = NewLeaf(self.path, color_e.StringConst)
+      L.append(Field('path', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class SourcedFile(source_t):
+    _type_tag = 7
+    __slots__ = ('path', 'location')
+  
+    def __init__(self, path, location):
+      # type: (str, loc_t) -> None
+      self.path = path
+      self.location = location
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.SourcedFile
+      return source.SourcedFile('', cast(loc_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.path)
+      if self.location is None:
+        enc.Null()
+      else:
+        self.location.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.SourcedFile
+      x0 = dec.Str()
+      x1 = loc_t.Unmarshal(dec)
+      obj = source.SourcedFile(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.SourcedFile')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.path, color_e.StringConst)
+      L.append(Field('path', x0))
+  
+      assert self.location is not None
+      x1 = self.location.PrettyTree(trav=trav)
+      L.append(Field('location', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.SourcedFile')
+      L = out_node.fields
+      x0 = NewLeaf(self.path, color_e.StringConst)
+      L.append(Field('path', x0))
+  
+      assert self.location is not None
+      x1 = self.location.AbbreviatedTree(trav=trav)
+      L.append(Field('location', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ArgvWord(source_t):
+    _type_tag = 8
+    __slots__ = ('what', 'location')
+  
+    def __init__(self, what, location):
+      # type: (str, loc_t) -> None
+      self.what = what
+      self.location = location
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.ArgvWord
+      return source.ArgvWord('', cast(loc_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.what)
+      if self.location is None:
+        enc.Null()
+      else:
+        self.location.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.ArgvWord
+      x0 = dec.Str()
+      x1 = loc_t.Unmarshal(dec)
+      obj = source.ArgvWord(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.ArgvWord')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.what, color_e.StringConst)
+      L.append(Field('what', x0))
+  
+      assert self.location is not None
+      x1 = self.location.PrettyTree(trav=trav)
+      L.append(Field('location', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.ArgvWord')
+      L = out_node.fields
+      x0 = NewLeaf(self.what, color_e.StringConst)
+      L.append(Field('what', x0))
+  
+      assert self.location is not None
+      x1 = self.location.AbbreviatedTree(trav=trav)
+      L.append(Field('location', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Variable(source_t):
+    _type_tag = 9
+    __slots__ = ('var_name', 'location')
+  
+    def __init__(self, var_name, location):
+      # type: (str, loc_t) -> None
+      self.var_name = var_name
+      self.location = location
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.Variable
+      return source.Variable('', cast(loc_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.var_name)
+      if self.location is None:
+        enc.Null()
+      else:
+        self.location.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.Variable
+      x0 = dec.Str()
+      x1 = loc_t.Unmarshal(dec)
+      obj = source.Variable(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Variable')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x0))
+  
+      assert self.location is not None
+      x1 = self.location.PrettyTree(trav=trav)
+      L.append(Field('location', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Variable')
+      L = out_node.fields
+      x0 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x0))
+  
+      assert self.location is not None
+      x1 = self.location.AbbreviatedTree(trav=trav)
+      L.append(Field('location', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class VarRef(source_t):
+    _type_tag = 10
+    __slots__ = ('orig_tok',)
+  
+    def __init__(self, orig_tok):
+      # type: (Token) -> None
+      self.orig_tok = orig_tok
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.VarRef
+      return source.VarRef(cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.orig_tok is None:
+        enc.Null()
+      else:
+        self.orig_tok.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.VarRef
+      x0 = Token.Unmarshal(dec)
+      obj = source.VarRef(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.VarRef')
+      L = out_node.fields
+  
+      assert self.orig_tok is not None
+      x0 = self.orig_tok.PrettyTree(trav=trav)
+      L.append(Field('orig_tok', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.VarRef')
+      L = out_node.fields
+      assert self.orig_tok is not None
+      x0 = self.orig_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('orig_tok', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Alias(source_t):
+    _type_tag = 11
+    __slots__ = ('argv0', 'argv0_loc')
+  
+    def __init__(self, argv0, argv0_loc):
+      # type: (str, loc_t) -> None
+      self.argv0 = argv0
+      self.argv0_loc = argv0_loc
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.Alias
+      return source.Alias('', cast(loc_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.argv0)
+      if self.argv0_loc is None:
+        enc.Null()
+      else:
+        self.argv0_loc.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.Alias
+      x0 = dec.Str()
+      x1 = loc_t.Unmarshal(dec)
+      obj = source.Alias(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Alias')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.argv0, color_e.StringConst)
+      L.append(Field('argv0', x0))
+  
+      assert self.argv0_loc is not None
+      x1 = self.argv0_loc.PrettyTree(trav=trav)
+      L.append(Field('argv0_loc', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Alias')
+      L = out_node.fields
+      x0 = NewLeaf(self.argv0, color_e.StringConst)
+      L.append(Field('argv0', x0))
+  
+      assert self.argv0_loc is not None
+      x1 = self.argv0_loc.AbbreviatedTree(trav=trav)
+      L.append(Field('argv0_loc', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Reparsed(source_t):
+    _type_tag = 12
+    __slots__ = ('what', 'left_token', 'right_token')
+  
+    def __init__(self, what, left_token, right_token):
+      # type: (str, Token, Token) -> None
+      self.what = what
+      self.left_token = left_token
+      self.right_token = right_token
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.Reparsed
+      return source.Reparsed('', cast(Token, None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.what)
+      if self.left_token is None:
+        enc.Null()
+      else:
+        self.left_token.Marshal(enc)
+      if self.right_token is None:
+        enc.Null()
+      else:
+        self.right_token.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.Reparsed
+      x0 = dec.Str()
+      x1 = Token.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      obj = source.Reparsed(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Reparsed')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.what, color_e.StringConst)
+      L.append(Field('what', x0))
+  
+      assert self.left_token is not None
+      x1 = self.left_token.PrettyTree(trav=trav)
+      L.append(Field('left_token', x1))
+  
+      assert self.right_token is not None
+      x2 = self.right_token.PrettyTree(trav=trav)
+      L.append(Field('right_token', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Reparsed')
+      L = out_node.fields
+      x0 = NewLeaf(self.what, color_e.StringConst)
+      L.append(Field('what', x0))
+  
+      assert self.left_token is not None
+      x1 = self.left_token.AbbreviatedTree(trav=trav)
+      L.append(Field('left_token', x1))
+  
+      assert self.right_token is not None
+      x2 = self.right_token.AbbreviatedTree(trav=trav)
+      L.append(Field('right_token', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Synthetic(source_t):
+    _type_tag = 13
+    __slots__ = ('s',)
+  
+    def __init__(self, s):
+      # type: (str) -> None
+      self.s = s
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> source.Synthetic
+      return source.Synthetic('')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.s)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> source.Synthetic
+      x0 = dec.Str()
+      obj = source.Synthetic(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Synthetic')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('source.Synthetic')
+      L = out_node.fields
+      x0 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class word_shape_t(pybase.SimpleObj):
+  pass
+
+class word_shape_e(object):
+  Unknown = word_shape_t(1)
+  Other = word_shape_t(2)
+  Literal = word_shape_t(3)
+  SingleQuoted = word_shape_t(4)
+  QuotedVar = word_shape_t(5)
+
+_word_shape_str = {
+  1: 'word_shape.Unknown',
+  2: 'word_shape.Other',
+  3: 'word_shape.Literal',
+  4: 'word_shape.SingleQuoted',
+  5: 'word_shape.QuotedVar',
+}
+
+def word_shape_str(val):
+  # type: (word_shape_t) -> str
+  return _word_shape_str[val]
+
+class loc_e(object):
+  Missing = 1
+  Token = 67
+  ArgWord = 69
+  WordPart = 4
+  Word = 5
+  Arith = 6
+  Command = 7
+  TokenTooLong = 8
+
+_loc_str = {
+  1: 'Missing',
+  4: 'WordPart',
+  5: 'Word',
+  6: 'Arith',
+  7: 'Command',
+  8: 'TokenTooLong',
+  67: 'Token',
+  69: 'ArgWord',
+}
+
+def loc_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _loc_str[tag]
+  if dot:
+    return "loc.%s" % v
+  else:
+    return v
+
+class loc_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> loc_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('loc_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('loc_t', dec.Ref())
+    if tag == loc_e.Missing:
+      return loc__Missing.UnmarshalNew(dec)
+    if tag == loc_e.Token:
+      return Token.UnmarshalNew(dec)
+    if tag == loc_e.ArgWord:
+      return CompoundWord.UnmarshalNew(dec)
+    if tag == loc_e.WordPart:
+      return loc.WordPart.UnmarshalNew(dec)
+    if tag == loc_e.Word:
+      return loc.Word.UnmarshalNew(dec)
+    if tag == loc_e.Arith:
+      return loc.Arith.UnmarshalNew(dec)
+    if tag == loc_e.Command:
+      return loc.Command.UnmarshalNew(dec)
+    if tag == loc_e.TokenTooLong:
+      return loc.TokenTooLong.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('loc_t', None)
+  pass
+
+class loc__Missing(loc_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> loc__Missing
+    dec.Register(loc.Missing)
+    return loc.Missing
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('loc__Missing')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('loc__Missing')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class loc(object):
+  Missing = loc__Missing()
+  
+  class WordPart(loc_t):
+    _type_tag = 4
+    __slots__ = ('p',)
+  
+    def __init__(self, p):
+      # type: (word_part_t) -> None
+      self.p = p
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> loc.WordPart
+      return loc.WordPart(cast(word_part_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.p is None:
+        enc.Null()
+      else:
+        self.p.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> loc.WordPart
+      x0 = word_part_t.Unmarshal(dec)
+      obj = loc.WordPart(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.WordPart')
+      L = out_node.fields
+  
+      assert self.p is not None
+      x0 = self.p.PrettyTree(trav=trav)
+      L.append(Field('p', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.WordPart')
+      L = out_node.fields
+      assert self.p is not None
+      x0 = self.p.AbbreviatedTree(trav=trav)
+      L.append(Field('p', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Word(loc_t):
+    _type_tag = 5
+    __slots__ = ('w',)
+  
+    def __init__(self, w):
+      # type: (word_t) -> None
+      self.w = w
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> loc.Word
+      return loc.Word(cast(word_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.w is None:
+        enc.Null()
+      else:
+        self.w.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> loc.Word
+      x0 = word_t.Unmarshal(dec)
+      obj = loc.Word(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.Word')
+      L = out_node.fields
+  
+      assert self.w is not None
+      x0 = self.w.PrettyTree(trav=trav)
+      L.append(Field('w', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.Word')
+      L = out_node.fields
+      assert self.w is not None
+      x0 = self.w.AbbreviatedTree(trav=trav)
+      L.append(Field('w', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Arith(loc_t):
+    _type_tag = 6
+    __slots__ = ('a',)
+  
+    def __init__(self, a):
+      # type: (arith_expr_t) -> None
+      self.a = a
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> loc.Arith
+      return loc.Arith(cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.a is None:
+        enc.Null()
+      else:
+        self.a.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> loc.Arith
+      x0 = arith_expr_t.Unmarshal(dec)
+      obj = loc.Arith(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.Arith')
+      L = out_node.fields
+  
+      assert self.a is not None
+      x0 = self.a.PrettyTree(trav=trav)
+      L.append(Field('a', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.Arith')
+      L = out_node.fields
+      assert self.a is not None
+      x0 = self.a.AbbreviatedTree(trav=trav)
+      L.append(Field('a', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Command(loc_t):
+    _type_tag = 7
+    __slots__ = ('c',)
+  
+    def __init__(self, c):
+      # type: (command_t) -> None
+      self.c = c
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> loc.Command
+      return loc.Command(cast(command_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.c is None:
+        enc.Null()
+      else:
+        self.c.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> loc.Command
+      x0 = command_t.Unmarshal(dec)
+      obj = loc.Command(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.Command')
+      L = out_node.fields
+  
+      assert self.c is not None
+      x0 = self.c.PrettyTree(trav=trav)
+      L.append(Field('c', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.Command')
+      L = out_node.fields
+      assert self.c is not None
+      x0 = self.c.AbbreviatedTree(trav=trav)
+      L.append(Field('c', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class TokenTooLong(loc_t):
+    _type_tag = 8
+    __slots__ = ('line', 'id', 'length', 'col')
+  
+    def __init__(self, line, id, length, col):
+      # type: (SourceLine, Id_t, int, int) -> None
+      self.line = line
+      self.id = id
+      self.length = length
+      self.col = col
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> loc.TokenTooLong
+      return loc.TokenTooLong(cast(SourceLine, None), -1, -1, -1)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.line is None:
+        enc.Null()
+      else:
+        self.line.Marshal(enc)
+      enc.Int(self.id)
+      enc.Int(self.length)
+      enc.Int(self.col)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> loc.TokenTooLong
+      x0 = SourceLine.Unmarshal(dec)
+      x1 = dec.Int()
+      x2 = dec.Int()
+      x3 = dec.Int()
+      obj = loc.TokenTooLong(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.TokenTooLong')
+      L = out_node.fields
+  
+      assert self.line is not None
+      x0 = self.line.PrettyTree(trav=trav)
+      L.append(Field('line', x0))
+  
+      x1 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x1))
+  
+      x2 = hnode.Leaf(str(self.length), color_e.OtherConst)
+      L.append(Field('length', x2))
+  
+      x3 = hnode.Leaf(str(self.col), color_e.OtherConst)
+      L.append(Field('col', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('loc.TokenTooLong')
+      L = out_node.fields
+      assert self.line is not None
+      x0 = self.line.AbbreviatedTree(trav=trav)
+      L.append(Field('line', x0))
+  
+      x1 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x1))
+  
+      x2 = hnode.Leaf(str(self.length), color_e.OtherConst)
+      L.append(Field('length', x2))
+  
+      x3 = hnode.Leaf(str(self.col), color_e.OtherConst)
+      L.append(Field('col', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class debug_frame_e(object):
+  Main = 1
+  Source = 2
+  Call = 3
+
+_debug_frame_str = {
+  1: 'Main',
+  2: 'Source',
+  3: 'Call',
+}
+
+def debug_frame_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _debug_frame_str[tag]
+  if dot:
+    return "debug_frame.%s" % v
+  else:
+    return v
+
+class debug_frame_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> debug_frame_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('debug_frame_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('debug_frame_t', dec.Ref())
+    if tag == debug_frame_e.Main:
+      return debug_frame.Main.UnmarshalNew(dec)
+    if tag == debug_frame_e.Source:
+      return debug_frame.Source.UnmarshalNew(dec)
+    if tag == debug_frame_e.Call:
+      return debug_frame.Call.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('debug_frame_t', None)
+  pass
+
+class debug_frame(object):
+  class Main(debug_frame_t):
+    _type_tag = 1
+    __slots__ = ('dollar0',)
+  
+    def __init__(self, dollar0):
+      # type: (str) -> None
+      self.dollar0 = dollar0
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> debug_frame.Main
+      return debug_frame.Main('')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.dollar0)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> debug_frame.Main
+      x0 = dec.Str()
+      obj = debug_frame.Main(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('debug_frame.Main')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.dollar0, color_e.StringConst)
+      L.append(Field('dollar0', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('debug_frame.Main')
+      L = out_node.fields
+      x0 = NewLeaf(self.dollar0, color_e.StringConst)
+      L.append(Field('dollar0', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Source(debug_frame_t):
+    _type_tag = 2
+    __slots__ = ('call_tok', 'source_name')
+  
+    def __init__(self, call_tok, source_name):
+      # type: (Optional[Token], str) -> None
+      self.call_tok = call_tok
+      self.source_name = source_name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> debug_frame.Source
+      return debug_frame.Source(cast('Optional[Token]', None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.call_tok is None:
+        enc.Null()
+      else:
+        self.call_tok.Marshal(enc)
+      enc.Str(self.source_name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> debug_frame.Source
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = debug_frame.Source(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('debug_frame.Source')
+      L = out_node.fields
+  
+      if self.call_tok is not None:  # Optional
+        x0 = self.call_tok.PrettyTree(trav=trav)
+        L.append(Field('call_tok', x0))
+  
+      x1 = NewLeaf(self.source_name, color_e.StringConst)
+      L.append(Field('source_name', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('debug_frame.Source')
+      L = out_node.fields
+      if self.call_tok is not None:  # Optional
+        x0 = self.call_tok.AbbreviatedTree(trav=trav)
+        L.append(Field('call_tok', x0))
+  
+      x1 = NewLeaf(self.source_name, color_e.StringConst)
+      L.append(Field('source_name', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Call(debug_frame_t):
+    _type_tag = 3
+    __slots__ = ('call_tok', 'def_tok', 'func_name')
+  
+    def __init__(self, call_tok, def_tok, func_name):
+      # type: (Optional[Token], Token, str) -> None
+      self.call_tok = call_tok
+      self.def_tok = def_tok
+      self.func_name = func_name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> debug_frame.Call
+      return debug_frame.Call(cast('Optional[Token]', None), cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.call_tok is None:
+        enc.Null()
+      else:
+        self.call_tok.Marshal(enc)
+      if self.def_tok is None:
+        enc.Null()
+      else:
+        self.def_tok.Marshal(enc)
+      enc.Str(self.func_name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> debug_frame.Call
+      x0 = Token.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      x2 = dec.Str()
+      obj = debug_frame.Call(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('debug_frame.Call')
+      L = out_node.fields
+  
+      if self.call_tok is not None:  # Optional
+        x0 = self.call_tok.PrettyTree(trav=trav)
+        L.append(Field('call_tok', x0))
+  
+      assert self.def_tok is not None
+      x1 = self.def_tok.PrettyTree(trav=trav)
+      L.append(Field('def_tok', x1))
+  
+      x2 = NewLeaf(self.func_name, color_e.StringConst)
+      L.append(Field('func_name', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('debug_frame.Call')
+      L = out_node.fields
+      if self.call_tok is not None:  # Optional
+        x0 = self.call_tok.AbbreviatedTree(trav=trav)
+        L.append(Field('call_tok', x0))
+  
+      assert self.def_tok is not None
+      x1 = self.def_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('def_tok', x1))
+  
+      x2 = NewLeaf(self.func_name, color_e.StringConst)
+      L.append(Field('func_name', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class bracket_op_e(object):
+  WholeArray = 1
+  ArrayIndex = 2
+
+_bracket_op_str = {
+  1: 'WholeArray',
+  2: 'ArrayIndex',
+}
+
+def bracket_op_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _bracket_op_str[tag]
+  if dot:
+    return "bracket_op.%s" % v
+  else:
+    return v
+
+class bracket_op_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> bracket_op_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('bracket_op_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('bracket_op_t', dec.Ref())
+    if tag == bracket_op_e.WholeArray:
+      return bracket_op.WholeArray.UnmarshalNew(dec)
+    if tag == bracket_op_e.ArrayIndex:
+      return bracket_op.ArrayIndex.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('bracket_op_t', None)
+  pass
+
+class bracket_op(object):
+  class WholeArray(bracket_op_t):
+    _type_tag = 1
+    __slots__ = ('op_id',)
+  
+    def __init__(self, op_id):
+      # type: (Id_t) -> None
+      self.op_id = op_id
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bracket_op.WholeArray
+      return bracket_op.WholeArray(-1)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.op_id)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bracket_op.WholeArray
+      x0 = dec.Int()
+      obj = bracket_op.WholeArray(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bracket_op.WholeArray')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bracket_op.WholeArray')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ArrayIndex(bracket_op_t):
+    _type_tag = 2
+    __slots__ = ('expr',)
+  
+    def __init__(self, expr):
+      # type: (arith_expr_t) -> None
+      self.expr = expr
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bracket_op.ArrayIndex
+      return bracket_op.ArrayIndex(cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.expr is None:
+        enc.Null()
+      else:
+        self.expr.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bracket_op.ArrayIndex
+      x0 = arith_expr_t.Unmarshal(dec)
+      obj = bracket_op.ArrayIndex(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bracket_op.ArrayIndex')
+      L = out_node.fields
+  
+      assert self.expr is not None
+      x0 = self.expr.PrettyTree(trav=trav)
+      L.append(Field('expr', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bracket_op.ArrayIndex')
+      L = out_node.fields
+      assert self.expr is not None
+      x0 = self.expr.AbbreviatedTree(trav=trav)
+      L.append(Field('expr', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class suffix_op_e(object):
+  Nullary = 67
+  Unary = 2
+  Static = 3
+  PatSub = 4
+  Slice = 5
+
+_suffix_op_str = {
+  2: 'Unary',
+  3: 'Static',
+  4: 'PatSub',
+  5: 'Slice',
+  67: 'Nullary',
+}
+
+def suffix_op_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _suffix_op_str[tag]
+  if dot:
+    return "suffix_op.%s" % v
+  else:
+    return v
+
+class suffix_op_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> suffix_op_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('suffix_op_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('suffix_op_t', dec.Ref())
+    if tag == suffix_op_e.Nullary:
+      return Token.UnmarshalNew(dec)
+    if tag == suffix_op_e.Unary:
+      return suffix_op.Unary.UnmarshalNew(dec)
+    if tag == suffix_op_e.Static:
+      return suffix_op.Static.UnmarshalNew(dec)
+    if tag == suffix_op_e.PatSub:
+      return suffix_op.PatSub.UnmarshalNew(dec)
+    if tag == suffix_op_e.Slice:
+      return suffix_op.Slice.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('suffix_op_t', None)
+  pass
+
+class suffix_op(object):
+  class Unary(suffix_op_t):
+    _type_tag = 2
+    __slots__ = ('op', 'arg_word')
+  
+    def __init__(self, op, arg_word):
+      # type: (Token, rhs_word_t) -> None
+      self.op = op
+      self.arg_word = arg_word
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> suffix_op.Unary
+      return suffix_op.Unary(cast(Token, None), cast(rhs_word_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.arg_word is None:
+        enc.Null()
+      else:
+        self.arg_word.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> suffix_op.Unary
+      x0 = Token.Unmarshal(dec)
+      x1 = rhs_word_t.Unmarshal(dec)
+      obj = suffix_op.Unary(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.Unary')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.arg_word is not None
+      x1 = self.arg_word.PrettyTree(trav=trav)
+      L.append(Field('arg_word', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.Unary')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.arg_word is not None
+      x1 = self.arg_word.AbbreviatedTree(trav=trav)
+      L.append(Field('arg_word', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Static(suffix_op_t):
+    _type_tag = 3
+    __slots__ = ('tok', 'arg')
+  
+    def __init__(self, tok, arg):
+      # type: (Token, str) -> None
+      self.tok = tok
+      self.arg = arg
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> suffix_op.Static
+      return suffix_op.Static(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.tok is None:
+        enc.Null()
+      else:
+        self.tok.Marshal(enc)
+      enc.Str(self.arg)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> suffix_op.Static
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = suffix_op.Static(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.Static')
+      L = out_node.fields
+  
+      assert self.tok is not None
+      x0 = self.tok.PrettyTree(trav=trav)
+      L.append(Field('tok', x0))
+  
+      x1 = NewLeaf(self.arg, color_e.StringConst)
+      L.append(Field('arg', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.Static')
+      L = out_node.fields
+      assert self.tok is not None
+      x0 = self.tok.AbbreviatedTree(trav=trav)
+      L.append(Field('tok', x0))
+  
+      x1 = NewLeaf(self.arg, color_e.StringConst)
+      L.append(Field('arg', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class PatSub(suffix_op_t):
+    _type_tag = 4
+    __slots__ = ('pat', 'replace', 'replace_mode', 'slash_tok')
+  
+    def __init__(self, pat, replace, replace_mode, slash_tok):
+      # type: (CompoundWord, rhs_word_t, Id_t, Token) -> None
+      self.pat = pat
+      self.replace = replace
+      self.replace_mode = replace_mode
+      self.slash_tok = slash_tok
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> suffix_op.PatSub
+      return suffix_op.PatSub(cast(CompoundWord, None), cast(rhs_word_t, None), -1, cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.pat is None:
+        enc.Null()
+      else:
+        self.pat.Marshal(enc)
+      if self.replace is None:
+        enc.Null()
+      else:
+        self.replace.Marshal(enc)
+      enc.Int(self.replace_mode)
+      if self.slash_tok is None:
+        enc.Null()
+      else:
+        self.slash_tok.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> suffix_op.PatSub
+      x0 = CompoundWord.Unmarshal(dec)
+      x1 = rhs_word_t.Unmarshal(dec)
+      x2 = dec.Int()
+      x3 = Token.Unmarshal(dec)
+      obj = suffix_op.PatSub(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.PatSub')
+      L = out_node.fields
+  
+      assert self.pat is not None
+      x0 = self.pat.PrettyTree(trav=trav)
+      L.append(Field('pat', x0))
+  
+      assert self.replace is not None
+      x1 = self.replace.PrettyTree(trav=trav)
+      L.append(Field('replace', x1))
+  
+      x2 = hnode.Leaf(Id_str(self.replace_mode), color_e.UserType)
+      L.append(Field('replace_mode', x2))
+  
+      assert self.slash_tok is not None
+      x3 = self.slash_tok.PrettyTree(trav=trav)
+      L.append(Field('slash_tok', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.PatSub')
+      L = out_node.fields
+      assert self.pat is not None
+      x0 = self.pat.AbbreviatedTree(trav=trav)
+      L.append(Field('pat', x0))
+  
+      assert self.replace is not None
+      x1 = self.replace.AbbreviatedTree(trav=trav)
+      L.append(Field('replace', x1))
+  
+      x2 = hnode.Leaf(Id_str(self.replace_mode), color_e.UserType)
+      L.append(Field('replace_mode', x2))
+  
+      assert self.slash_tok is not None
+      x3 = self.slash_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('slash_tok', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Slice(suffix_op_t):
+    _type_tag = 5
+    __slots__ = ('begin', 'length')
+  
+    def __init__(self, begin, length):
+      # type: (Optional[arith_expr_t], Optional[arith_expr_t]) -> None
+      self.begin = begin
+      self.length = length
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> suffix_op.Slice
+      return suffix_op.Slice(cast('Optional[arith_expr_t]', None), cast('Optional[arith_expr_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.begin is None:
+        enc.Null()
+      else:
+        self.begin.Marshal(enc)
+      if self.length is None:
+        enc.Null()
+      else:
+        self.length.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> suffix_op.Slice
+      x0 = arith_expr_t.Unmarshal(dec)
+      x1 = arith_expr_t.Unmarshal(dec)
+      obj = suffix_op.Slice(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.Slice')
+      L = out_node.fields
+  
+      if self.begin is not None:  # Optional
+        x0 = self.begin.PrettyTree(trav=trav)
+        L.append(Field('begin', x0))
+  
+      if self.length is not None:  # Optional
+        x1 = self.length.PrettyTree(trav=trav)
+        L.append(Field('length', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('suffix_op.Slice')
+      L = out_node.fields
+      if self.begin is not None:  # Optional
+        x0 = self.begin.AbbreviatedTree(trav=trav)
+        L.append(Field('begin', x0))
+  
+      if self.length is not None:  # Optional
+        x1 = self.length.AbbreviatedTree(trav=trav)
+        L.append(Field('length', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class word_part_e(object):
+  ShArrayLiteral = 75
+  BashAssocLiteral = 2
+  Literal = 67
+  EscapedLiteral = 4
+  SingleQuoted = 72
+  DoubleQuoted = 71
+  SimpleVarSub = 73
+  BracedVarSub = 70
+  ZshVarSub = 9
+  CommandSub = 74
+  TildeSub = 11
+  ArithSub = 12
+  BracedTuple = 13
+  BracedRange = 14
+  ExtGlob = 15
+  BashRegexGroup = 16
+  Splice = 17
+  ExprSub = 18
+
+_word_part_str = {
+  2: 'BashAssocLiteral',
+  4: 'EscapedLiteral',
+  9: 'ZshVarSub',
+  11: 'TildeSub',
+  12: 'ArithSub',
+  13: 'BracedTuple',
+  14: 'BracedRange',
+  15: 'ExtGlob',
+  16: 'BashRegexGroup',
+  17: 'Splice',
+  18: 'ExprSub',
+  67: 'Literal',
+  70: 'BracedVarSub',
+  71: 'DoubleQuoted',
+  72: 'SingleQuoted',
+  73: 'SimpleVarSub',
+  74: 'CommandSub',
+  75: 'ShArrayLiteral',
+}
+
+def word_part_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _word_part_str[tag]
+  if dot:
+    return "word_part.%s" % v
+  else:
+    return v
+
+class word_part_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> word_part_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('word_part_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('word_part_t', dec.Ref())
+    if tag == word_part_e.ShArrayLiteral:
+      return ShArrayLiteral.UnmarshalNew(dec)
+    if tag == word_part_e.BashAssocLiteral:
+      return word_part.BashAssocLiteral.UnmarshalNew(dec)
+    if tag == word_part_e.Literal:
+      return Token.UnmarshalNew(dec)
+    if tag == word_part_e.EscapedLiteral:
+      return word_part.EscapedLiteral.UnmarshalNew(dec)
+    if tag == word_part_e.SingleQuoted:
+      return SingleQuoted.UnmarshalNew(dec)
+    if tag == word_part_e.DoubleQuoted:
+      return DoubleQuoted.UnmarshalNew(dec)
+    if tag == word_part_e.SimpleVarSub:
+      return SimpleVarSub.UnmarshalNew(dec)
+    if tag == word_part_e.BracedVarSub:
+      return BracedVarSub.UnmarshalNew(dec)
+    if tag == word_part_e.ZshVarSub:
+      return word_part.ZshVarSub.UnmarshalNew(dec)
+    if tag == word_part_e.CommandSub:
+      return CommandSub.UnmarshalNew(dec)
+    if tag == word_part_e.TildeSub:
+      return word_part.TildeSub.UnmarshalNew(dec)
+    if tag == word_part_e.ArithSub:
+      return word_part.ArithSub.UnmarshalNew(dec)
+    if tag == word_part_e.BracedTuple:
+      return word_part.BracedTuple.UnmarshalNew(dec)
+    if tag == word_part_e.BracedRange:
+      return word_part.BracedRange.UnmarshalNew(dec)
+    if tag == word_part_e.ExtGlob:
+      return word_part.ExtGlob.UnmarshalNew(dec)
+    if tag == word_part_e.BashRegexGroup:
+      return word_part.BashRegexGroup.UnmarshalNew(dec)
+    if tag == word_part_e.Splice:
+      return word_part.Splice.UnmarshalNew(dec)
+    if tag == word_part_e.ExprSub:
+      return word_part.ExprSub.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('word_part_t', None)
+  pass
+
+class word_part(object):
+  class BashAssocLiteral(word_part_t):
+    _type_tag = 2
+    __slots__ = ('left', 'pairs', 'right')
+  
+    def __init__(self, left, pairs, right):
+      # type: (Token, List[AssocPair], Token) -> None
+      self.left = left
+      self.pairs = pairs
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.BashAssocLiteral
+      return word_part.BashAssocLiteral(cast(Token, None), [] if alloc_lists else cast('List[AssocPair]', None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.pairs is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.pairs))
+        for x1 in self.pairs:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.BashAssocLiteral
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[AssocPair]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(AssocPair.Unmarshal(dec))
+      x2 = Token.Unmarshal(dec)
+      obj = word_part.BashAssocLiteral(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BashAssocLiteral')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.pairs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.pairs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('pairs', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BashAssocLiteral')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.pairs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.pairs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('pairs', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class EscapedLiteral(word_part_t):
+    _type_tag = 4
+    __slots__ = ('token', 'ch')
+  
+    def __init__(self, token, ch):
+      # type: (Token, str) -> None
+      self.token = token
+      self.ch = ch
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.EscapedLiteral
+      return word_part.EscapedLiteral(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.token is None:
+        enc.Null()
+      else:
+        self.token.Marshal(enc)
+      enc.Str(self.ch)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.EscapedLiteral
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = word_part.EscapedLiteral(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.EscapedLiteral')
+      L = out_node.fields
+  
+      assert self.token is not None
+      x0 = self.token.PrettyTree(trav=trav)
+      L.append(Field('token', x0))
+  
+      x1 = NewLeaf(self.ch, color_e.StringConst)
+      L.append(Field('ch', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.EscapedLiteral')
+      L = out_node.fields
+      assert self.token is not None
+      x0 = self.token.AbbreviatedTree(trav=trav)
+      L.append(Field('token', x0))
+  
+      x1 = NewLeaf(self.ch, color_e.StringConst)
+      L.append(Field('ch', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ZshVarSub(word_part_t):
+    _type_tag = 9
+    __slots__ = ('left', 'ignored', 'right')
+  
+    def __init__(self, left, ignored, right):
+      # type: (Token, CompoundWord, Token) -> None
+      self.left = left
+      self.ignored = ignored
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.ZshVarSub
+      return word_part.ZshVarSub(cast(Token, None), cast(CompoundWord, None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.ignored is None:
+        enc.Null()
+      else:
+        self.ignored.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.ZshVarSub
+      x0 = Token.Unmarshal(dec)
+      x1 = CompoundWord.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      obj = word_part.ZshVarSub(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ZshVarSub')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.ignored is not None
+      x1 = self.ignored.PrettyTree(trav=trav)
+      L.append(Field('ignored', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ZshVarSub')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.ignored is not None
+      x1 = self.ignored.AbbreviatedTree(trav=trav)
+      L.append(Field('ignored', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class TildeSub(word_part_t):
+    _type_tag = 11
+    __slots__ = ('left', 'name', 'user_name')
+  
+    def __init__(self, left, name, user_name):
+      # type: (Token, Optional[Token], Optional[str]) -> None
+      self.left = left
+      self.name = name
+      self.user_name = user_name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.TildeSub
+      return word_part.TildeSub(cast(Token, None), cast('Optional[Token]', None), cast('Optional[str]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.name is None:
+        enc.Null()
+      else:
+        self.name.Marshal(enc)
+      enc.Str(self.user_name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.TildeSub
+      x0 = Token.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      x2 = dec.Str()
+      obj = word_part.TildeSub(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.TildeSub')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.name is not None:  # Optional
+        x1 = self.name.PrettyTree(trav=trav)
+        L.append(Field('name', x1))
+  
+      if self.user_name is not None:  # Optional
+        x2 = NewLeaf(self.user_name, color_e.StringConst)
+        L.append(Field('user_name', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.TildeSub')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.name is not None:  # Optional
+        x1 = self.name.AbbreviatedTree(trav=trav)
+        L.append(Field('name', x1))
+  
+      if self.user_name is not None:  # Optional
+        x2 = NewLeaf(self.user_name, color_e.StringConst)
+        L.append(Field('user_name', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ArithSub(word_part_t):
+    _type_tag = 12
+    __slots__ = ('left', 'anode', 'right')
+  
+    def __init__(self, left, anode, right):
+      # type: (Token, arith_expr_t, Token) -> None
+      self.left = left
+      self.anode = anode
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.ArithSub
+      return word_part.ArithSub(cast(Token, None), cast(arith_expr_t, None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.anode is None:
+        enc.Null()
+      else:
+        self.anode.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.ArithSub
+      x0 = Token.Unmarshal(dec)
+      x1 = arith_expr_t.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      obj = word_part.ArithSub(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ArithSub')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.anode is not None
+      x1 = self.anode.PrettyTree(trav=trav)
+      L.append(Field('anode', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ArithSub')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.anode is not None
+      x1 = self.anode.AbbreviatedTree(trav=trav)
+      L.append(Field('anode', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class BracedTuple(word_part_t):
+    _type_tag = 13
+    __slots__ = ('words',)
+  
+    def __init__(self, words):
+      # type: (List[CompoundWord]) -> None
+      self.words = words
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.BracedTuple
+      return word_part.BracedTuple([] if alloc_lists else cast('List[CompoundWord]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.words is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.words))
+        for x0 in self.words:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.BracedTuple
+      x0 = None  # type: List[CompoundWord]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(CompoundWord.Unmarshal(dec))
+      obj = word_part.BracedTuple(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BracedTuple')
+      L = out_node.fields
+  
+      if self.words is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('words', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BracedTuple')
+      L = out_node.fields
+      if self.words is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('words', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class BracedRange(word_part_t):
+    _type_tag = 14
+    __slots__ = ('blame_tok', 'kind', 'start', 'end', 'step')
+  
+    def __init__(self, blame_tok, kind, start, end, step):
+      # type: (Token, Id_t, str, str, int) -> None
+      self.blame_tok = blame_tok
+      self.kind = kind
+      self.start = start
+      self.end = end
+      self.step = step
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.BracedRange
+      return word_part.BracedRange(cast(Token, None), -1, '', '', -1)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.blame_tok is None:
+        enc.Null()
+      else:
+        self.blame_tok.Marshal(enc)
+      enc.Int(self.kind)
+      enc.Str(self.start)
+      enc.Str(self.end)
+      enc.Int(self.step)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.BracedRange
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Int()
+      x2 = dec.Str()
+      x3 = dec.Str()
+      x4 = dec.Int()
+      obj = word_part.BracedRange(x0, x1, x2, x3, x4)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BracedRange')
+      L = out_node.fields
+  
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.PrettyTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = hnode.Leaf(Id_str(self.kind), color_e.UserType)
+      L.append(Field('kind', x1))
+  
+      x2 = NewLeaf(self.start, color_e.StringConst)
+      L.append(Field('start', x2))
+  
+      x3 = NewLeaf(self.end, color_e.StringConst)
+      L.append(Field('end', x3))
+  
+      x4 = hnode.Leaf(str(self.step), color_e.OtherConst)
+      L.append(Field('step', x4))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BracedRange')
+      L = out_node.fields
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = hnode.Leaf(Id_str(self.kind), color_e.UserType)
+      L.append(Field('kind', x1))
+  
+      x2 = NewLeaf(self.start, color_e.StringConst)
+      L.append(Field('start', x2))
+  
+      x3 = NewLeaf(self.end, color_e.StringConst)
+      L.append(Field('end', x3))
+  
+      x4 = hnode.Leaf(str(self.step), color_e.OtherConst)
+      L.append(Field('step', x4))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ExtGlob(word_part_t):
+    _type_tag = 15
+    __slots__ = ('op', 'arms', 'right')
+  
+    def __init__(self, op, arms, right):
+      # type: (Token, List[CompoundWord], Token) -> None
+      self.op = op
+      self.arms = arms
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.ExtGlob
+      return word_part.ExtGlob(cast(Token, None), [] if alloc_lists else cast('List[CompoundWord]', None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.arms is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.arms))
+        for x1 in self.arms:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.ExtGlob
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[CompoundWord]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(CompoundWord.Unmarshal(dec))
+      x2 = Token.Unmarshal(dec)
+      obj = word_part.ExtGlob(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ExtGlob')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      if self.arms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.arms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('arms', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ExtGlob')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      if self.arms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.arms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('arms', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class BashRegexGroup(word_part_t):
+    _type_tag = 16
+    __slots__ = ('left', 'child', 'right')
+  
+    def __init__(self, left, child, right):
+      # type: (Token, Optional[CompoundWord], Token) -> None
+      self.left = left
+      self.child = child
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.BashRegexGroup
+      return word_part.BashRegexGroup(cast(Token, None), cast('Optional[CompoundWord]', None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.BashRegexGroup
+      x0 = Token.Unmarshal(dec)
+      x1 = CompoundWord.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      obj = word_part.BashRegexGroup(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BashRegexGroup')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.child is not None:  # Optional
+        x1 = self.child.PrettyTree(trav=trav)
+        L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.BashRegexGroup')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.child is not None:  # Optional
+        x1 = self.child.AbbreviatedTree(trav=trav)
+        L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Splice(word_part_t):
+    _type_tag = 17
+    __slots__ = ('blame_tok', 'var_name')
+  
+    def __init__(self, blame_tok, var_name):
+      # type: (Token, str) -> None
+      self.blame_tok = blame_tok
+      self.var_name = var_name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.Splice
+      return word_part.Splice(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.blame_tok is None:
+        enc.Null()
+      else:
+        self.blame_tok.Marshal(enc)
+      enc.Str(self.var_name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.Splice
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = word_part.Splice(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.Splice')
+      L = out_node.fields
+  
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.PrettyTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.Splice')
+      L = out_node.fields
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ExprSub(word_part_t):
+    _type_tag = 18
+    __slots__ = ('left', 'child', 'right')
+  
+    def __init__(self, left, child, right):
+      # type: (Token, expr_t, Token) -> None
+      self.left = left
+      self.child = child
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word_part.ExprSub
+      return word_part.ExprSub(cast(Token, None), cast(expr_t, None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word_part.ExprSub
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      obj = word_part.ExprSub(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ExprSub')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word_part.ExprSub')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class rhs_word_e(object):
+  Empty = 1
+  Compound = 69
+
+_rhs_word_str = {
+  1: 'Empty',
+  69: 'Compound',
+}
+
+def rhs_word_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _rhs_word_str[tag]
+  if dot:
+    return "rhs_word.%s" % v
+  else:
+    return v
+
+class rhs_word_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> rhs_word_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('rhs_word_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('rhs_word_t', dec.Ref())
+    if tag == rhs_word_e.Empty:
+      return rhs_word__Empty.UnmarshalNew(dec)
+    if tag == rhs_word_e.Compound:
+      return CompoundWord.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('rhs_word_t', None)
+  pass
+
+class rhs_word__Empty(rhs_word_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> rhs_word__Empty
+    dec.Register(rhs_word.Empty)
+    return rhs_word.Empty
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('rhs_word__Empty')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('rhs_word__Empty')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class rhs_word(object):
+  Empty = rhs_word__Empty()
+  
+  pass
+
+class word_e(object):
+  Operator = 67
+  Compound = 69
+  BracedTree = 3
+  String = 4
+
+_word_str = {
+  3: 'BracedTree',
+  4: 'String',
+  67: 'Operator',
+  69: 'Compound',
+}
+
+def word_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _word_str[tag]
+  if dot:
+    return "word.%s" % v
+  else:
+    return v
+
+class word_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> word_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('word_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('word_t', dec.Ref())
+    if tag == word_e.Operator:
+      return Token.UnmarshalNew(dec)
+    if tag == word_e.Compound:
+      return CompoundWord.UnmarshalNew(dec)
+    if tag == word_e.BracedTree:
+      return word.BracedTree.UnmarshalNew(dec)
+    if tag == word_e.String:
+      return word.String.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('word_t', None)
+  pass
+
+class word(object):
+  class BracedTree(word_t):
+    _type_tag = 3
+    __slots__ = ('parts',)
+  
+    def __init__(self, parts):
+      # type: (List[word_part_t]) -> None
+      self.parts = parts
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word.BracedTree
+      return word.BracedTree([] if alloc_lists else cast('List[word_part_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.parts is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.parts))
+        for x0 in self.parts:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word.BracedTree
+      x0 = None  # type: List[word_part_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(word_part_t.Unmarshal(dec))
+      obj = word.BracedTree(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word.BracedTree')
+      L = out_node.fields
+  
+      if self.parts is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.parts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('parts', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word.BracedTree')
+      L = out_node.fields
+      if self.parts is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.parts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('parts', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class String(word_t):
+    _type_tag = 4
+    __slots__ = ('id', 's', 'blame_loc')
+  
+    def __init__(self, id, s, blame_loc):
+      # type: (Id_t, str, Optional[CompoundWord]) -> None
+      self.id = id
+      self.s = s
+      self.blame_loc = blame_loc
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> word.String
+      return word.String(-1, '', cast('Optional[CompoundWord]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.id)
+      enc.Str(self.s)
+      if self.blame_loc is None:
+        enc.Null()
+      else:
+        self.blame_loc.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> word.String
+      x0 = dec.Int()
+      x1 = dec.Str()
+      x2 = CompoundWord.Unmarshal(dec)
+      obj = word.String(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word.String')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x0))
+  
+      x1 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x1))
+  
+      if self.blame_loc is not None:  # Optional
+        x2 = self.blame_loc.PrettyTree(trav=trav)
+        L.append(Field('blame_loc', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('word.String')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x0))
+  
+      x1 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x1))
+  
+      if self.blame_loc is not None:  # Optional
+        x2 = self.blame_loc.AbbreviatedTree(trav=trav)
+        L.append(Field('blame_loc', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class sh_lhs_e(object):
+  Name = 1
+  IndexedName = 2
+  UnparsedIndex = 3
+
+_sh_lhs_str = {
+  1: 'Name',
+  2: 'IndexedName',
+  3: 'UnparsedIndex',
+}
+
+def sh_lhs_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _sh_lhs_str[tag]
+  if dot:
+    return "sh_lhs.%s" % v
+  else:
+    return v
+
+class sh_lhs_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> sh_lhs_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('sh_lhs_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('sh_lhs_t', dec.Ref())
+    if tag == sh_lhs_e.Name:
+      return sh_lhs.Name.UnmarshalNew(dec)
+    if tag == sh_lhs_e.IndexedName:
+      return sh_lhs.IndexedName.UnmarshalNew(dec)
+    if tag == sh_lhs_e.UnparsedIndex:
+      return sh_lhs.UnparsedIndex.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('sh_lhs_t', None)
+  pass
+
+class sh_lhs(object):
+  class Name(sh_lhs_t):
+    _type_tag = 1
+    __slots__ = ('left', 'name')
+  
+    def __init__(self, left, name):
+      # type: (Token, str) -> None
+      self.left = left
+      self.name = name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> sh_lhs.Name
+      return sh_lhs.Name(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      enc.Str(self.name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> sh_lhs.Name
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = sh_lhs.Name(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('sh_lhs.Name')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('sh_lhs.Name')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class IndexedName(sh_lhs_t):
+    _type_tag = 2
+    __slots__ = ('left', 'name', 'index')
+  
+    def __init__(self, left, name, index):
+      # type: (Token, str, arith_expr_t) -> None
+      self.left = left
+      self.name = name
+      self.index = index
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> sh_lhs.IndexedName
+      return sh_lhs.IndexedName(cast(Token, None), '', cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      enc.Str(self.name)
+      if self.index is None:
+        enc.Null()
+      else:
+        self.index.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> sh_lhs.IndexedName
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      x2 = arith_expr_t.Unmarshal(dec)
+      obj = sh_lhs.IndexedName(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('sh_lhs.IndexedName')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      assert self.index is not None
+      x2 = self.index.PrettyTree(trav=trav)
+      L.append(Field('index', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('sh_lhs.IndexedName')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      assert self.index is not None
+      x2 = self.index.AbbreviatedTree(trav=trav)
+      L.append(Field('index', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class UnparsedIndex(sh_lhs_t):
+    _type_tag = 3
+    __slots__ = ('left', 'name', 'index')
+  
+    def __init__(self, left, name, index):
+      # type: (Token, str, str) -> None
+      self.left = left
+      self.name = name
+      self.index = index
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> sh_lhs.UnparsedIndex
+      return sh_lhs.UnparsedIndex(cast(Token, None), '', '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      enc.Str(self.name)
+      enc.Str(self.index)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> sh_lhs.UnparsedIndex
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      x2 = dec.Str()
+      obj = sh_lhs.UnparsedIndex(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('sh_lhs.UnparsedIndex')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      x2 = NewLeaf(self.index, color_e.StringConst)
+      L.append(Field('index', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('sh_lhs.UnparsedIndex')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      x2 = NewLeaf(self.index, color_e.StringConst)
+      L.append(Field('index', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class arith_expr_e(object):
+  VarSub = 67
+  Word = 69
+  UnaryAssign = 3
+  BinaryAssign = 4
+  Unary = 5
+  Binary = 6
+  TernaryOp = 7
+
+_arith_expr_str = {
+  3: 'UnaryAssign',
+  4: 'BinaryAssign',
+  5: 'Unary',
+  6: 'Binary',
+  7: 'TernaryOp',
+  67: 'VarSub',
+  69: 'Word',
+}
+
+def arith_expr_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _arith_expr_str[tag]
+  if dot:
+    return "arith_expr.%s" % v
+  else:
+    return v
+
+class arith_expr_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> arith_expr_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('arith_expr_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('arith_expr_t', dec.Ref())
+    if tag == arith_expr_e.VarSub:
+      return Token.UnmarshalNew(dec)
+    if tag == arith_expr_e.Word:
+      return CompoundWord.UnmarshalNew(dec)
+    if tag == arith_expr_e.UnaryAssign:
+      return arith_expr.UnaryAssign.UnmarshalNew(dec)
+    if tag == arith_expr_e.BinaryAssign:
+      return arith_expr.BinaryAssign.UnmarshalNew(dec)
+    if tag == arith_expr_e.Unary:
+      return arith_expr.Unary.UnmarshalNew(dec)
+    if tag == arith_expr_e.Binary:
+      return arith_expr.Binary.UnmarshalNew(dec)
+    if tag == arith_expr_e.TernaryOp:
+      return arith_expr.TernaryOp.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('arith_expr_t', None)
+  pass
+
+class arith_expr(object):
+  class UnaryAssign(arith_expr_t):
+    _type_tag = 3
+    __slots__ = ('op_id', 'child')
+  
+    def __init__(self, op_id, child):
+      # type: (Id_t, arith_expr_t) -> None
+      self.op_id = op_id
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.UnaryAssign
+      return arith_expr.UnaryAssign(-1, cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.op_id)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> arith_expr.UnaryAssign
+      x0 = dec.Int()
+      x1 = arith_expr_t.Unmarshal(dec)
+      obj = arith_expr.UnaryAssign(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.UnaryAssign')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.UnaryAssign')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class BinaryAssign(arith_expr_t):
+    _type_tag = 4
+    __slots__ = ('op_id', 'left', 'right')
+  
+    def __init__(self, op_id, left, right):
+      # type: (Id_t, arith_expr_t, arith_expr_t) -> None
+      self.op_id = op_id
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.BinaryAssign
+      return arith_expr.BinaryAssign(-1, cast(arith_expr_t, None), cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.op_id)
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> arith_expr.BinaryAssign
+      x0 = dec.Int()
+      x1 = arith_expr_t.Unmarshal(dec)
+      x2 = arith_expr_t.Unmarshal(dec)
+      obj = arith_expr.BinaryAssign(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.BinaryAssign')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.left is not None
+      x1 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.BinaryAssign')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.left is not None
+      x1 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Unary(arith_expr_t):
+    _type_tag = 5
+    __slots__ = ('op_id', 'child')
+  
+    def __init__(self, op_id, child):
+      # type: (Id_t, arith_expr_t) -> None
+      self.op_id = op_id
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Unary
+      return arith_expr.Unary(-1, cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.op_id)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> arith_expr.Unary
+      x0 = dec.Int()
+      x1 = arith_expr_t.Unmarshal(dec)
+      obj = arith_expr.Unary(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.Unary')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.Unary')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Binary(arith_expr_t):
+    _type_tag = 6
+    __slots__ = ('op', 'left', 'right')
+  
+    def __init__(self, op, left, right):
+      # type: (Token, arith_expr_t, arith_expr_t) -> None
+      self.op = op
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Binary
+      return arith_expr.Binary(cast(Token, None), cast(arith_expr_t, None), cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> arith_expr.Binary
+      x0 = Token.Unmarshal(dec)
+      x1 = arith_expr_t.Unmarshal(dec)
+      x2 = arith_expr_t.Unmarshal(dec)
+      obj = arith_expr.Binary(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.Binary')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.Binary')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class TernaryOp(arith_expr_t):
+    _type_tag = 7
+    __slots__ = ('cond', 'true_expr', 'false_expr')
+  
+    def __init__(self, cond, true_expr, false_expr):
+      # type: (arith_expr_t, arith_expr_t, arith_expr_t) -> None
+      self.cond = cond
+      self.true_expr = true_expr
+      self.false_expr = false_expr
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.TernaryOp
+      return arith_expr.TernaryOp(cast(arith_expr_t, None), cast(arith_expr_t, None), cast(arith_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.cond is None:
+        enc.Null()
+      else:
+        self.cond.Marshal(enc)
+      if self.true_expr is None:
+        enc.Null()
+      else:
+        self.true_expr.Marshal(enc)
+      if self.false_expr is None:
+        enc.Null()
+      else:
+        self.false_expr.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> arith_expr.TernaryOp
+      x0 = arith_expr_t.Unmarshal(dec)
+      x1 = arith_expr_t.Unmarshal(dec)
+      x2 = arith_expr_t.Unmarshal(dec)
+      obj = arith_expr.TernaryOp(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.TernaryOp')
+      L = out_node.fields
+  
+      assert self.cond is not None
+      x0 = self.cond.PrettyTree(trav=trav)
+      L.append(Field('cond', x0))
+  
+      assert self.true_expr is not None
+      x1 = self.true_expr.PrettyTree(trav=trav)
+      L.append(Field('true_expr', x1))
+  
+      assert self.false_expr is not None
+      x2 = self.false_expr.PrettyTree(trav=trav)
+      L.append(Field('false_expr', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('arith_expr.TernaryOp')
+      L = out_node.fields
+      assert self.cond is not None
+      x0 = self.cond.AbbreviatedTree(trav=trav)
+      L.append(Field('cond', x0))
+  
+      assert self.true_expr is not None
+      x1 = self.true_expr.AbbreviatedTree(trav=trav)
+      L.append(Field('true_expr', x1))
+  
+      assert self.false_expr is not None
+      x2 = self.false_expr.AbbreviatedTree(trav=trav)
+      L.append(Field('false_expr', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class bool_expr_e(object):
+  WordTest = 1
+  Binary = 2
+  Unary = 3
+  LogicalNot = 4
+  LogicalAnd = 5
+  LogicalOr = 6
+
+_bool_expr_str = {
+  1: 'WordTest',
+  2: 'Binary',
+  3: 'Unary',
+  4: 'LogicalNot',
+  5: 'LogicalAnd',
+  6: 'LogicalOr',
+}
+
+def bool_expr_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _bool_expr_str[tag]
+  if dot:
+    return "bool_expr.%s" % v
+  else:
+    return v
+
+class bool_expr_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> bool_expr_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('bool_expr_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('bool_expr_t', dec.Ref())
+    if tag == bool_expr_e.WordTest:
+      return bool_expr.WordTest.UnmarshalNew(dec)
+    if tag == bool_expr_e.Binary:
+      return bool_expr.Binary.UnmarshalNew(dec)
+    if tag == bool_expr_e.Unary:
+      return bool_expr.Unary.UnmarshalNew(dec)
+    if tag == bool_expr_e.LogicalNot:
+      return bool_expr.LogicalNot.UnmarshalNew(dec)
+    if tag == bool_expr_e.LogicalAnd:
+      return bool_expr.LogicalAnd.UnmarshalNew(dec)
+    if tag == bool_expr_e.LogicalOr:
+      return bool_expr.LogicalOr.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('bool_expr_t', None)
+  pass
+
+class bool_expr(object):
+  class WordTest(bool_expr_t):
+    _type_tag = 1
+    __slots__ = ('w',)
+  
+    def __init__(self, w):
+      # type: (word_t) -> None
+      self.w = w
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bool_expr.WordTest
+      return bool_expr.WordTest(cast(word_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.w is None:
+        enc.Null()
+      else:
+        self.w.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bool_expr.WordTest
+      x0 = word_t.Unmarshal(dec)
+      obj = bool_expr.WordTest(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.WordTest')
+      L = out_node.fields
+  
+      assert self.w is not None
+      x0 = self.w.PrettyTree(trav=trav)
+      L.append(Field('w', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.WordTest')
+      L = out_node.fields
+      assert self.w is not None
+      x0 = self.w.AbbreviatedTree(trav=trav)
+      L.append(Field('w', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Binary(bool_expr_t):
+    _type_tag = 2
+    __slots__ = ('op_id', 'left', 'right')
+  
+    def __init__(self, op_id, left, right):
+      # type: (Id_t, word_t, word_t) -> None
+      self.op_id = op_id
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bool_expr.Binary
+      return bool_expr.Binary(-1, cast(word_t, None), cast(word_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.op_id)
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bool_expr.Binary
+      x0 = dec.Int()
+      x1 = word_t.Unmarshal(dec)
+      x2 = word_t.Unmarshal(dec)
+      obj = bool_expr.Binary(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.Binary')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.left is not None
+      x1 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.Binary')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.left is not None
+      x1 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Unary(bool_expr_t):
+    _type_tag = 3
+    __slots__ = ('op_id', 'child')
+  
+    def __init__(self, op_id, child):
+      # type: (Id_t, word_t) -> None
+      self.op_id = op_id
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bool_expr.Unary
+      return bool_expr.Unary(-1, cast(word_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.op_id)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bool_expr.Unary
+      x0 = dec.Int()
+      x1 = word_t.Unmarshal(dec)
+      obj = bool_expr.Unary(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.Unary')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.Unary')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class LogicalNot(bool_expr_t):
+    _type_tag = 4
+    __slots__ = ('child',)
+  
+    def __init__(self, child):
+      # type: (bool_expr_t) -> None
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bool_expr.LogicalNot
+      return bool_expr.LogicalNot(cast(bool_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bool_expr.LogicalNot
+      x0 = bool_expr_t.Unmarshal(dec)
+      obj = bool_expr.LogicalNot(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.LogicalNot')
+      L = out_node.fields
+  
+      assert self.child is not None
+      x0 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.LogicalNot')
+      L = out_node.fields
+      assert self.child is not None
+      x0 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class LogicalAnd(bool_expr_t):
+    _type_tag = 5
+    __slots__ = ('left', 'right')
+  
+    def __init__(self, left, right):
+      # type: (bool_expr_t, bool_expr_t) -> None
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bool_expr.LogicalAnd
+      return bool_expr.LogicalAnd(cast(bool_expr_t, None), cast(bool_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bool_expr.LogicalAnd
+      x0 = bool_expr_t.Unmarshal(dec)
+      x1 = bool_expr_t.Unmarshal(dec)
+      obj = bool_expr.LogicalAnd(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.LogicalAnd')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.right is not None
+      x1 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.LogicalAnd')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.right is not None
+      x1 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class LogicalOr(bool_expr_t):
+    _type_tag = 6
+    __slots__ = ('left', 'right')
+  
+    def __init__(self, left, right):
+      # type: (bool_expr_t, bool_expr_t) -> None
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> bool_expr.LogicalOr
+      return bool_expr.LogicalOr(cast(bool_expr_t, None), cast(bool_expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> bool_expr.LogicalOr
+      x0 = bool_expr_t.Unmarshal(dec)
+      x1 = bool_expr_t.Unmarshal(dec)
+      obj = bool_expr.LogicalOr(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.LogicalOr')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.right is not None
+      x1 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('bool_expr.LogicalOr')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.right is not None
+      x1 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class redir_loc_e(object):
+  Fd = 1
+  VarName = 2
+
+_redir_loc_str = {
+  1: 'Fd',
+  2: 'VarName',
+}
+
+def redir_loc_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _redir_loc_str[tag]
+  if dot:
+    return "redir_loc.%s" % v
+  else:
+    return v
+
+class redir_loc_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> redir_loc_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('redir_loc_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('redir_loc_t', dec.Ref())
+    if tag == redir_loc_e.Fd:
+      return redir_loc.Fd.UnmarshalNew(dec)
+    if tag == redir_loc_e.VarName:
+      return redir_loc.VarName.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('redir_loc_t', None)
+  pass
+
+class redir_loc(object):
+  class Fd(redir_loc_t):
+    _type_tag = 1
+    __slots__ = ('fd',)
+  
+    def __init__(self, fd):
+      # type: (int) -> None
+      self.fd = fd
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> redir_loc.Fd
+      return redir_loc.Fd(-1)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.fd)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> redir_loc.Fd
+      x0 = dec.Int()
+      obj = redir_loc.Fd(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('redir_loc.Fd')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(str(self.fd), color_e.OtherConst)
+      L.append(Field('fd', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('redir_loc.Fd')
+      L = out_node.fields
+      x0 = hnode.Leaf(str(self.fd), color_e.OtherConst)
+      L.append(Field('fd', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class VarName(redir_loc_t):
+    _type_tag = 2
+    __slots__ = ('name',)
+  
+    def __init__(self, name):
+      # type: (str) -> None
+      self.name = name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> redir_loc.VarName
+      return redir_loc.VarName('')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Str(self.name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> redir_loc.VarName
+      x0 = dec.Str()
+      obj = redir_loc.VarName(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('redir_loc.VarName')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('redir_loc.VarName')
+      L = out_node.fields
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class redir_param_e(object):
+  Word = 69
+  HereDoc = 2
+
+_redir_param_str = {
+  2: 'HereDoc',
+  69: 'Word',
+}
+
+def redir_param_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _redir_param_str[tag]
+  if dot:
+    return "redir_param.%s" % v
+  else:
+    return v
+
+class redir_param_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> redir_param_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('redir_param_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('redir_param_t', dec.Ref())
+    if tag == redir_param_e.Word:
+      return CompoundWord.UnmarshalNew(dec)
+    if tag == redir_param_e.HereDoc:
+      return redir_param.HereDoc.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('redir_param_t', None)
+  pass
+
+class redir_param(object):
+  class HereDoc(redir_param_t):
+    _type_tag = 2
+    __slots__ = ('here_begin', 'here_end_tok', 'stdin_parts')
+  
+    def __init__(self, here_begin, here_end_tok, stdin_parts):
+      # type: (word_t, Optional[Token], List[word_part_t]) -> None
+      self.here_begin = here_begin
+      self.here_end_tok = here_end_tok
+      self.stdin_parts = stdin_parts
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> redir_param.HereDoc
+      return redir_param.HereDoc(cast(word_t, None), cast('Optional[Token]', None), [] if alloc_lists else cast('List[word_part_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.here_begin is None:
+        enc.Null()
+      else:
+        self.here_begin.Marshal(enc)
+      if self.here_end_tok is None:
+        enc.Null()
+      else:
+        self.here_end_tok.Marshal(enc)
+      if self.stdin_parts is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.stdin_parts))
+        for x2 in self.stdin_parts:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> redir_param.HereDoc
+      x0 = word_t.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      x2 = None  # type: List[word_part_t]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(word_part_t.Unmarshal(dec))
+      obj = redir_param.HereDoc(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('redir_param.HereDoc')
+      L = out_node.fields
+  
+      assert self.here_begin is not None
+      x0 = self.here_begin.PrettyTree(trav=trav)
+      L.append(Field('here_begin', x0))
+  
+      if self.here_end_tok is not None:  # Optional
+        x1 = self.here_end_tok.PrettyTree(trav=trav)
+        L.append(Field('here_end_tok', x1))
+  
+      if self.stdin_parts is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.stdin_parts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('stdin_parts', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('redir_param.HereDoc')
+      L = out_node.fields
+      assert self.here_begin is not None
+      x0 = self.here_begin.AbbreviatedTree(trav=trav)
+      L.append(Field('here_begin', x0))
+  
+      if self.here_end_tok is not None:  # Optional
+        x1 = self.here_end_tok.AbbreviatedTree(trav=trav)
+        L.append(Field('here_end_tok', x1))
+  
+      if self.stdin_parts is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.stdin_parts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('stdin_parts', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class assign_op_t(pybase.SimpleObj):
+  pass
+
+class assign_op_e(object):
+  Equal = assign_op_t(1)
+  PlusEqual = assign_op_t(2)
+
+_assign_op_str = {
+  1: 'assign_op.Equal',
+  2: 'assign_op.PlusEqual',
+}
+
+def assign_op_str(val):
+  # type: (assign_op_t) -> str
+  return _assign_op_str[val]
+
+class condition_e(object):
+  Shell = 1
+  YshExpr = 2
+
+_condition_str = {
+  1: 'Shell',
+  2: 'YshExpr',
+}
+
+def condition_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _condition_str[tag]
+  if dot:
+    return "condition.%s" % v
+  else:
+    return v
+
+class condition_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> condition_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('condition_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('condition_t', dec.Ref())
+    if tag == condition_e.Shell:
+      return condition.Shell.UnmarshalNew(dec)
+    if tag == condition_e.YshExpr:
+      return condition.YshExpr.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('condition_t', None)
+  pass
+
+class condition(object):
+  class Shell(condition_t):
+    _type_tag = 1
+    __slots__ = ('commands',)
+  
+    def __init__(self, commands):
+      # type: (List[command_t]) -> None
+      self.commands = commands
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> condition.Shell
+      return condition.Shell([] if alloc_lists else cast('List[command_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.commands is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.commands))
+        for x0 in self.commands:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> condition.Shell
+      x0 = None  # type: List[command_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(command_t.Unmarshal(dec))
+      obj = condition.Shell(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('condition.Shell')
+      L = out_node.fields
+  
+      if self.commands is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.commands:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('commands', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('condition.Shell')
+      L = out_node.fields
+      if self.commands is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.commands:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('commands', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class YshExpr(condition_t):
+    _type_tag = 2
+    __slots__ = ('e',)
+  
+    def __init__(self, e):
+      # type: (expr_t) -> None
+      self.e = e
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> condition.YshExpr
+      return condition.YshExpr(cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.e is None:
+        enc.Null()
+      else:
+        self.e.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> condition.YshExpr
+      x0 = expr_t.Unmarshal(dec)
+      obj = condition.YshExpr(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('condition.YshExpr')
+      L = out_node.fields
+  
+      assert self.e is not None
+      x0 = self.e.PrettyTree(trav=trav)
+      L.append(Field('e', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('condition.YshExpr')
+      L = out_node.fields
+      assert self.e is not None
+      x0 = self.e.AbbreviatedTree(trav=trav)
+      L.append(Field('e', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class case_arg_e(object):
+  Word = 1
+  YshExpr = 2
+
+_case_arg_str = {
+  1: 'Word',
+  2: 'YshExpr',
+}
+
+def case_arg_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _case_arg_str[tag]
+  if dot:
+    return "case_arg.%s" % v
+  else:
+    return v
+
+class case_arg_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> case_arg_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('case_arg_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('case_arg_t', dec.Ref())
+    if tag == case_arg_e.Word:
+      return case_arg.Word.UnmarshalNew(dec)
+    if tag == case_arg_e.YshExpr:
+      return case_arg.YshExpr.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('case_arg_t', None)
+  pass
+
+class case_arg(object):
+  class Word(case_arg_t):
+    _type_tag = 1
+    __slots__ = ('w',)
+  
+    def __init__(self, w):
+      # type: (word_t) -> None
+      self.w = w
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> case_arg.Word
+      return case_arg.Word(cast(word_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.w is None:
+        enc.Null()
+      else:
+        self.w.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> case_arg.Word
+      x0 = word_t.Unmarshal(dec)
+      obj = case_arg.Word(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('case_arg.Word')
+      L = out_node.fields
+  
+      assert self.w is not None
+      x0 = self.w.PrettyTree(trav=trav)
+      L.append(Field('w', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('case_arg.Word')
+      L = out_node.fields
+      assert self.w is not None
+      x0 = self.w.AbbreviatedTree(trav=trav)
+      L.append(Field('w', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class YshExpr(case_arg_t):
+    _type_tag = 2
+    __slots__ = ('e',)
+  
+    def __init__(self, e):
+      # type: (expr_t) -> None
+      self.e = e
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> case_arg.YshExpr
+      return case_arg.YshExpr(cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.e is None:
+        enc.Null()
+      else:
+        self.e.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> case_arg.YshExpr
+      x0 = expr_t.Unmarshal(dec)
+      obj = case_arg.YshExpr(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('case_arg.YshExpr')
+      L = out_node.fields
+  
+      assert self.e is not None
+      x0 = self.e.PrettyTree(trav=trav)
+      L.append(Field('e', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('case_arg.YshExpr')
+      L = out_node.fields
+      assert self.e is not None
+      x0 = self.e.AbbreviatedTree(trav=trav)
+      L.append(Field('e', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class pat_e(object):
+  Else = 1
+  Words = 2
+  YshExprs = 3
+  Eggex = 83
+
+_pat_str = {
+  1: 'Else',
+  2: 'Words',
+  3: 'YshExprs',
+  83: 'Eggex',
+}
+
+def pat_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _pat_str[tag]
+  if dot:
+    return "pat.%s" % v
+  else:
+    return v
+
+class pat_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> pat_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('pat_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('pat_t', dec.Ref())
+    if tag == pat_e.Else:
+      return pat__Else.UnmarshalNew(dec)
+    if tag == pat_e.Words:
+      return pat.Words.UnmarshalNew(dec)
+    if tag == pat_e.YshExprs:
+      return pat.YshExprs.UnmarshalNew(dec)
+    if tag == pat_e.Eggex:
+      return Eggex.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('pat_t', None)
+  pass
+
+class pat__Else(pat_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> pat__Else
+    dec.Register(pat.Else)
+    return pat.Else
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('pat__Else')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('pat__Else')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class pat(object):
+  Else = pat__Else()
+  
+  class Words(pat_t):
+    _type_tag = 2
+    __slots__ = ('words',)
+  
+    def __init__(self, words):
+      # type: (List[word_t]) -> None
+      self.words = words
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> pat.Words
+      return pat.Words([] if alloc_lists else cast('List[word_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.words is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.words))
+        for x0 in self.words:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> pat.Words
+      x0 = None  # type: List[word_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(word_t.Unmarshal(dec))
+      obj = pat.Words(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('pat.Words')
+      L = out_node.fields
+  
+      if self.words is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('words', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('pat.Words')
+      L = out_node.fields
+      if self.words is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('words', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class YshExprs(pat_t):
+    _type_tag = 3
+    __slots__ = ('exprs',)
+  
+    def __init__(self, exprs):
+      # type: (List[expr_t]) -> None
+      self.exprs = exprs
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> pat.YshExprs
+      return pat.YshExprs([] if alloc_lists else cast('List[expr_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.exprs is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.exprs))
+        for x0 in self.exprs:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> pat.YshExprs
+      x0 = None  # type: List[expr_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(expr_t.Unmarshal(dec))
+      obj = pat.YshExprs(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('pat.YshExprs')
+      L = out_node.fields
+  
+      if self.exprs is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.exprs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('exprs', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('pat.YshExprs')
+      L = out_node.fields
+      if self.exprs is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.exprs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('exprs', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class for_iter_e(object):
+  Args = 1
+  Words = 2
+  YshExpr = 3
+
+_for_iter_str = {
+  1: 'Args',
+  2: 'Words',
+  3: 'YshExpr',
+}
+
+def for_iter_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _for_iter_str[tag]
+  if dot:
+    return "for_iter.%s" % v
+  else:
+    return v
+
+class for_iter_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> for_iter_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('for_iter_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('for_iter_t', dec.Ref())
+    if tag == for_iter_e.Args:
+      return for_iter__Args.UnmarshalNew(dec)
+    if tag == for_iter_e.Words:
+      return for_iter.Words.UnmarshalNew(dec)
+    if tag == for_iter_e.YshExpr:
+      return for_iter.YshExpr.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('for_iter_t', None)
+  pass
+
+class for_iter__Args(for_iter_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> for_iter__Args
+    dec.Register(for_iter.Args)
+    return for_iter.Args
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('for_iter__Args')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('for_iter__Args')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class for_iter(object):
+  Args = for_iter__Args()
+  
+  class Words(for_iter_t):
+    _type_tag = 2
+    __slots__ = ('words',)
+  
+    def __init__(self, words):
+      # type: (List[word_t]) -> None
+      self.words = words
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> for_iter.Words
+      return for_iter.Words([] if alloc_lists else cast('List[word_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.words is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.words))
+        for x0 in self.words:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> for_iter.Words
+      x0 = None  # type: List[word_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(word_t.Unmarshal(dec))
+      obj = for_iter.Words(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('for_iter.Words')
+      L = out_node.fields
+  
+      if self.words is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('words', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('for_iter.Words')
+      L = out_node.fields
+      if self.words is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('words', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class YshExpr(for_iter_t):
+    _type_tag = 3
+    __slots__ = ('e', 'blame')
+  
+    def __init__(self, e, blame):
+      # type: (expr_t, Token) -> None
+      self.e = e
+      self.blame = blame
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> for_iter.YshExpr
+      return for_iter.YshExpr(cast(expr_t, None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.e is None:
+        enc.Null()
+      else:
+        self.e.Marshal(enc)
+      if self.blame is None:
+        enc.Null()
+      else:
+        self.blame.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> for_iter.YshExpr
+      x0 = expr_t.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      obj = for_iter.YshExpr(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('for_iter.YshExpr')
+      L = out_node.fields
+  
+      assert self.e is not None
+      x0 = self.e.PrettyTree(trav=trav)
+      L.append(Field('e', x0))
+  
+      assert self.blame is not None
+      x1 = self.blame.PrettyTree(trav=trav)
+      L.append(Field('blame', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('for_iter.YshExpr')
+      L = out_node.fields
+      assert self.e is not None
+      x0 = self.e.AbbreviatedTree(trav=trav)
+      L.append(Field('e', x0))
+  
+      assert self.blame is not None
+      x1 = self.blame.AbbreviatedTree(trav=trav)
+      L.append(Field('blame', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class proc_sig_e(object):
+  Open = 1
+  Closed = 2
+
+_proc_sig_str = {
+  1: 'Open',
+  2: 'Closed',
+}
+
+def proc_sig_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _proc_sig_str[tag]
+  if dot:
+    return "proc_sig.%s" % v
+  else:
+    return v
+
+class proc_sig_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> proc_sig_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('proc_sig_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('proc_sig_t', dec.Ref())
+    if tag == proc_sig_e.Open:
+      return proc_sig__Open.UnmarshalNew(dec)
+    if tag == proc_sig_e.Closed:
+      return proc_sig.Closed.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('proc_sig_t', None)
+  pass
+
+class proc_sig__Open(proc_sig_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> proc_sig__Open
+    dec.Register(proc_sig.Open)
+    return proc_sig.Open
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('proc_sig__Open')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('proc_sig__Open')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class proc_sig(object):
+  Open = proc_sig__Open()
+  
+  class Closed(proc_sig_t):
+    _type_tag = 2
+    __slots__ = ('word', 'positional', 'named', 'block_param')
+  
+    def __init__(self, word, positional, named, block_param):
+      # type: (Optional[ParamGroup], Optional[ParamGroup], Optional[ParamGroup], Optional[Param]) -> None
+      self.word = word
+      self.positional = positional
+      self.named = named
+      self.block_param = block_param
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> proc_sig.Closed
+      return proc_sig.Closed(cast('Optional[ParamGroup]', None), cast('Optional[ParamGroup]', None), cast('Optional[ParamGroup]', None), cast('Optional[Param]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.word is None:
+        enc.Null()
+      else:
+        self.word.Marshal(enc)
+      if self.positional is None:
+        enc.Null()
+      else:
+        self.positional.Marshal(enc)
+      if self.named is None:
+        enc.Null()
+      else:
+        self.named.Marshal(enc)
+      if self.block_param is None:
+        enc.Null()
+      else:
+        self.block_param.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> proc_sig.Closed
+      x0 = ParamGroup.Unmarshal(dec)
+      x1 = ParamGroup.Unmarshal(dec)
+      x2 = ParamGroup.Unmarshal(dec)
+      x3 = Param.Unmarshal(dec)
+      obj = proc_sig.Closed(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('proc_sig.Closed')
+      L = out_node.fields
+  
+      if self.word is not None:  # Optional
+        x0 = self.word.PrettyTree(trav=trav)
+        L.append(Field('word', x0))
+  
+      if self.positional is not None:  # Optional
+        x1 = self.positional.PrettyTree(trav=trav)
+        L.append(Field('positional', x1))
+  
+      if self.named is not None:  # Optional
+        x2 = self.named.PrettyTree(trav=trav)
+        L.append(Field('named', x2))
+  
+      if self.block_param is not None:  # Optional
+        x3 = self.block_param.PrettyTree(trav=trav)
+        L.append(Field('block_param', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('proc_sig.Closed')
+      L = out_node.fields
+      if self.word is not None:  # Optional
+        x0 = self.word.AbbreviatedTree(trav=trav)
+        L.append(Field('word', x0))
+  
+      if self.positional is not None:  # Optional
+        x1 = self.positional.AbbreviatedTree(trav=trav)
+        L.append(Field('positional', x1))
+  
+      if self.named is not None:  # Optional
+        x2 = self.named.AbbreviatedTree(trav=trav)
+        L.append(Field('named', x2))
+  
+      if self.block_param is not None:  # Optional
+        x3 = self.block_param.AbbreviatedTree(trav=trav)
+        L.append(Field('block_param', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class command_e(object):
+  NoOp = 1
+  Simple = 2
+  ExpandedAlias = 3
+  Sentence = 4
+  ShAssignment = 5
+  Retval = 6
+  ControlFlow = 7
+  Pipeline = 8
+  AndOr = 9
+  DoGroup = 10
+  BraceGroup = 85
+  Subshell = 12
+  DParen = 13
+  DBracket = 14
+  ForEach = 15
+  ForExpr = 16
+  WhileUntil = 17
+  If = 18
+  Case = 19
+  ShFunction = 20
+  TimeBlock = 21
+  CommandList = 22
+  VarDecl = 23
+  BareDecl = 24
+  Mutation = 25
+  Expr = 26
+  Proc = 89
+  Func = 90
+
+_command_str = {
+  1: 'NoOp',
+  2: 'Simple',
+  3: 'ExpandedAlias',
+  4: 'Sentence',
+  5: 'ShAssignment',
+  6: 'Retval',
+  7: 'ControlFlow',
+  8: 'Pipeline',
+  9: 'AndOr',
+  10: 'DoGroup',
+  12: 'Subshell',
+  13: 'DParen',
+  14: 'DBracket',
+  15: 'ForEach',
+  16: 'ForExpr',
+  17: 'WhileUntil',
+  18: 'If',
+  19: 'Case',
+  20: 'ShFunction',
+  21: 'TimeBlock',
+  22: 'CommandList',
+  23: 'VarDecl',
+  24: 'BareDecl',
+  25: 'Mutation',
+  26: 'Expr',
+  85: 'BraceGroup',
+  89: 'Proc',
+  90: 'Func',
+}
+
+def command_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _command_str[tag]
+  if dot:
+    return "command.%s" % v
+  else:
+    return v
+
+class command_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> command_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('command_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('command_t', dec.Ref())
+    if tag == command_e.NoOp:
+      return command__NoOp.UnmarshalNew(dec)
+    if tag == command_e.Simple:
+      return command.Simple.UnmarshalNew(dec)
+    if tag == command_e.ExpandedAlias:
+      return command.ExpandedAlias.UnmarshalNew(dec)
+    if tag == command_e.Sentence:
+      return command.Sentence.UnmarshalNew(dec)
+    if tag == command_e.ShAssignment:
+      return command.ShAssignment.UnmarshalNew(dec)
+    if tag == command_e.Retval:
+      return command.Retval.UnmarshalNew(dec)
+    if tag == command_e.ControlFlow:
+      return command.ControlFlow.UnmarshalNew(dec)
+    if tag == command_e.Pipeline:
+      return command.Pipeline.UnmarshalNew(dec)
+    if tag == command_e.AndOr:
+      return command.AndOr.UnmarshalNew(dec)
+    if tag == command_e.DoGroup:
+      return command.DoGroup.UnmarshalNew(dec)
+    if tag == command_e.BraceGroup:
+      return BraceGroup.UnmarshalNew(dec)
+    if tag == command_e.Subshell:
+      return command.Subshell.UnmarshalNew(dec)
+    if tag == command_e.DParen:
+      return command.DParen.UnmarshalNew(dec)
+    if tag == command_e.DBracket:
+      return command.DBracket.UnmarshalNew(dec)
+    if tag == command_e.ForEach:
+      return command.ForEach.UnmarshalNew(dec)
+    if tag == command_e.ForExpr:
+      return command.ForExpr.UnmarshalNew(dec)
+    if tag == command_e.WhileUntil:
+      return command.WhileUntil.UnmarshalNew(dec)
+    if tag == command_e.If:
+      return command.If.UnmarshalNew(dec)
+    if tag == command_e.Case:
+      return command.Case.UnmarshalNew(dec)
+    if tag == command_e.ShFunction:
+      return command.ShFunction.UnmarshalNew(dec)
+    if tag == command_e.TimeBlock:
+      return command.TimeBlock.UnmarshalNew(dec)
+    if tag == command_e.CommandList:
+      return command.CommandList.UnmarshalNew(dec)
+    if tag == command_e.VarDecl:
+      return command.VarDecl.UnmarshalNew(dec)
+    if tag == command_e.BareDecl:
+      return command.BareDecl.UnmarshalNew(dec)
+    if tag == command_e.Mutation:
+      return command.Mutation.UnmarshalNew(dec)
+    if tag == command_e.Expr:
+      return command.Expr.UnmarshalNew(dec)
+    if tag == command_e.Proc:
+      return Proc.UnmarshalNew(dec)
+    if tag == command_e.Func:
+      return Func.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('command_t', None)
+  pass
+
+class command__NoOp(command_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> command__NoOp
+    dec.Register(command.NoOp)
+    return command.NoOp
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('command__NoOp')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('command__NoOp')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class command(object):
+  NoOp = command__NoOp()
+  
+  class Simple(command_t):
+    _type_tag = 2
+    __slots__ = ('blame_tok', 'more_env', 'words', 'redirects', 'typed_args',
+                 'block', 'do_fork')
+  
+    def __init__(self, blame_tok, more_env, words, redirects, typed_args,
+                 block, do_fork):
+      # type: (Optional[Token], List[EnvPair], List[word_t], List[Redir], Optional[ArgList], Optional[LiteralBlock], bool) -> None
+      self.blame_tok = blame_tok
+      self.more_env = more_env
+      self.words = words
+      self.redirects = redirects
+      self.typed_args = typed_args
+      self.block = block
+      self.do_fork = do_fork
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Simple
+      return command.Simple(cast('Optional[Token]', None), [] if alloc_lists else cast('List[EnvPair]', None), [] if alloc_lists else cast('List[word_t]', None), [] if alloc_lists else cast('List[Redir]', None), cast('Optional[ArgList]', None), cast('Optional[LiteralBlock]', None), False)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.blame_tok is None:
+        enc.Null()
+      else:
+        self.blame_tok.Marshal(enc)
+      if self.more_env is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.more_env))
+        for x1 in self.more_env:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.words is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.words))
+        for x2 in self.words:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x3 in self.redirects:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      if self.typed_args is None:
+        enc.Null()
+      else:
+        self.typed_args.Marshal(enc)
+      if self.block is None:
+        enc.Null()
+      else:
+        self.block.Marshal(enc)
+      enc.Bool(self.do_fork)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Simple
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[EnvPair]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(EnvPair.Unmarshal(dec))
+      x2 = None  # type: List[word_t]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(word_t.Unmarshal(dec))
+      x3 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(Redir.Unmarshal(dec))
+      x4 = ArgList.Unmarshal(dec)
+      x5 = LiteralBlock.Unmarshal(dec)
+      x6 = dec.Bool()
+      obj = command.Simple(x0, x1, x2, x3, x4, x5, x6)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Simple')
+      L = out_node.fields
+  
+      if self.blame_tok is not None:  # Optional
+        x0 = self.blame_tok.PrettyTree(trav=trav)
+        L.append(Field('blame_tok', x0))
+  
+      if self.more_env is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.more_env:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('more_env', x1))
+  
+      if self.words is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('words', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      if self.typed_args is not None:  # Optional
+        x4 = self.typed_args.PrettyTree(trav=trav)
+        L.append(Field('typed_args', x4))
+  
+      if self.block is not None:  # Optional
+        x5 = self.block.PrettyTree(trav=trav)
+        L.append(Field('block', x5))
+  
+      x6 = hnode.Leaf('T' if self.do_fork else 'F', color_e.OtherConst)
+      L.append(Field('do_fork', x6))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Simple')
+      L = out_node.fields
+      if self.blame_tok is not None:  # Optional
+        x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+        L.append(Field('blame_tok', x0))
+  
+      if self.more_env is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.more_env:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('more_env', x1))
+  
+      if self.words is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.words:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('words', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      if self.typed_args is not None:  # Optional
+        x4 = self.typed_args.AbbreviatedTree(trav=trav)
+        L.append(Field('typed_args', x4))
+  
+      if self.block is not None:  # Optional
+        x5 = self.block.AbbreviatedTree(trav=trav)
+        L.append(Field('block', x5))
+  
+      x6 = hnode.Leaf('T' if self.do_fork else 'F', color_e.OtherConst)
+      L.append(Field('do_fork', x6))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ExpandedAlias(command_t):
+    _type_tag = 3
+    __slots__ = ('child', 'redirects', 'more_env')
+  
+    def __init__(self, child, redirects, more_env):
+      # type: (command_t, List[Redir], List[EnvPair]) -> None
+      self.child = child
+      self.redirects = redirects
+      self.more_env = more_env
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.ExpandedAlias
+      return command.ExpandedAlias(cast(command_t, None), [] if alloc_lists else cast('List[Redir]', None), [] if alloc_lists else cast('List[EnvPair]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x1 in self.redirects:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.more_env is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.more_env))
+        for x2 in self.more_env:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.ExpandedAlias
+      x0 = command_t.Unmarshal(dec)
+      x1 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(Redir.Unmarshal(dec))
+      x2 = None  # type: List[EnvPair]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(EnvPair.Unmarshal(dec))
+      obj = command.ExpandedAlias(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ExpandedAlias')
+      L = out_node.fields
+  
+      assert self.child is not None
+      x0 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      if self.redirects is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('redirects', x1))
+  
+      if self.more_env is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.more_env:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('more_env', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ExpandedAlias')
+      L = out_node.fields
+      assert self.child is not None
+      x0 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      if self.redirects is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('redirects', x1))
+  
+      if self.more_env is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.more_env:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('more_env', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Sentence(command_t):
+    _type_tag = 4
+    __slots__ = ('child', 'terminator')
+  
+    def __init__(self, child, terminator):
+      # type: (command_t, Token) -> None
+      self.child = child
+      self.terminator = terminator
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Sentence
+      return command.Sentence(cast(command_t, None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.terminator is None:
+        enc.Null()
+      else:
+        self.terminator.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Sentence
+      x0 = command_t.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      obj = command.Sentence(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Sentence')
+      L = out_node.fields
+  
+      assert self.child is not None
+      x0 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      assert self.terminator is not None
+      x1 = self.terminator.PrettyTree(trav=trav)
+      L.append(Field('terminator', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Sentence')
+      L = out_node.fields
+      assert self.child is not None
+      x0 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      assert self.terminator is not None
+      x1 = self.terminator.AbbreviatedTree(trav=trav)
+      L.append(Field('terminator', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ShAssignment(command_t):
+    _type_tag = 5
+    __slots__ = ('left', 'pairs', 'redirects')
+  
+    def __init__(self, left, pairs, redirects):
+      # type: (Token, List[AssignPair], List[Redir]) -> None
+      self.left = left
+      self.pairs = pairs
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.ShAssignment
+      return command.ShAssignment(cast(Token, None), [] if alloc_lists else cast('List[AssignPair]', None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.pairs is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.pairs))
+        for x1 in self.pairs:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x2 in self.redirects:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.ShAssignment
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[AssignPair]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(AssignPair.Unmarshal(dec))
+      x2 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(Redir.Unmarshal(dec))
+      obj = command.ShAssignment(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ShAssignment')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.pairs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.pairs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('pairs', x1))
+  
+      if self.redirects is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('redirects', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ShAssignment')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.pairs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.pairs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('pairs', x1))
+  
+      if self.redirects is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('redirects', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Retval(command_t):
+    _type_tag = 6
+    __slots__ = ('keyword', 'val')
+  
+    def __init__(self, keyword, val):
+      # type: (Token, expr_t) -> None
+      self.keyword = keyword
+      self.val = val
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Retval
+      return command.Retval(cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.val is None:
+        enc.Null()
+      else:
+        self.val.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Retval
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      obj = command.Retval(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Retval')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.val is not None
+      x1 = self.val.PrettyTree(trav=trav)
+      L.append(Field('val', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Retval')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.val is not None
+      x1 = self.val.AbbreviatedTree(trav=trav)
+      L.append(Field('val', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ControlFlow(command_t):
+    _type_tag = 7
+    __slots__ = ('keyword', 'arg_word')
+  
+    def __init__(self, keyword, arg_word):
+      # type: (Token, Optional[word_t]) -> None
+      self.keyword = keyword
+      self.arg_word = arg_word
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.ControlFlow
+      return command.ControlFlow(cast(Token, None), cast('Optional[word_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.arg_word is None:
+        enc.Null()
+      else:
+        self.arg_word.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.ControlFlow
+      x0 = Token.Unmarshal(dec)
+      x1 = word_t.Unmarshal(dec)
+      obj = command.ControlFlow(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ControlFlow')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.arg_word is not None:  # Optional
+        x1 = self.arg_word.PrettyTree(trav=trav)
+        L.append(Field('arg_word', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ControlFlow')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.arg_word is not None:  # Optional
+        x1 = self.arg_word.AbbreviatedTree(trav=trav)
+        L.append(Field('arg_word', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Pipeline(command_t):
+    _type_tag = 8
+    __slots__ = ('negated', 'children', 'ops')
+  
+    def __init__(self, negated, children, ops):
+      # type: (Optional[Token], List[command_t], List[Token]) -> None
+      self.negated = negated
+      self.children = children
+      self.ops = ops
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Pipeline
+      return command.Pipeline(cast('Optional[Token]', None), [] if alloc_lists else cast('List[command_t]', None), [] if alloc_lists else cast('List[Token]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.negated is None:
+        enc.Null()
+      else:
+        self.negated.Marshal(enc)
+      if self.children is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.children))
+        for x1 in self.children:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.ops is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.ops))
+        for x2 in self.ops:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Pipeline
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[command_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(command_t.Unmarshal(dec))
+      x2 = None  # type: List[Token]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(Token.Unmarshal(dec))
+      obj = command.Pipeline(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Pipeline')
+      L = out_node.fields
+  
+      if self.negated is not None:  # Optional
+        x0 = self.negated.PrettyTree(trav=trav)
+        L.append(Field('negated', x0))
+  
+      if self.children is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('children', x1))
+  
+      if self.ops is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('ops', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Pipeline')
+      L = out_node.fields
+      if self.negated is not None:  # Optional
+        x0 = self.negated.AbbreviatedTree(trav=trav)
+        L.append(Field('negated', x0))
+  
+      if self.children is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('children', x1))
+  
+      if self.ops is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('ops', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class AndOr(command_t):
+    _type_tag = 9
+    __slots__ = ('children', 'ops')
+  
+    def __init__(self, children, ops):
+      # type: (List[command_t], List[Token]) -> None
+      self.children = children
+      self.ops = ops
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.AndOr
+      return command.AndOr([] if alloc_lists else cast('List[command_t]', None), [] if alloc_lists else cast('List[Token]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.children is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.children))
+        for x0 in self.children:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      if self.ops is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.ops))
+        for x1 in self.ops:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.AndOr
+      x0 = None  # type: List[command_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(command_t.Unmarshal(dec))
+      x1 = None  # type: List[Token]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(Token.Unmarshal(dec))
+      obj = command.AndOr(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.AndOr')
+      L = out_node.fields
+  
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      if self.ops is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('ops', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.AndOr')
+      L = out_node.fields
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      if self.ops is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('ops', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class DoGroup(command_t):
+    _type_tag = 10
+    __slots__ = ('left', 'children', 'right')
+  
+    def __init__(self, left, children, right):
+      # type: (Token, List[command_t], Token) -> None
+      self.left = left
+      self.children = children
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.DoGroup
+      return command.DoGroup(cast(Token, None), [] if alloc_lists else cast('List[command_t]', None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.children is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.children))
+        for x1 in self.children:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.DoGroup
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[command_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(command_t.Unmarshal(dec))
+      x2 = Token.Unmarshal(dec)
+      obj = command.DoGroup(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.DoGroup')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.children is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('children', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.DoGroup')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.children is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('children', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Subshell(command_t):
+    _type_tag = 12
+    __slots__ = ('left', 'child', 'right', 'redirects')
+  
+    def __init__(self, left, child, right, redirects):
+      # type: (Token, command_t, Token, List[Redir]) -> None
+      self.left = left
+      self.child = child
+      self.right = right
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Subshell
+      return command.Subshell(cast(Token, None), cast(command_t, None), cast(Token, None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x3 in self.redirects:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Subshell
+      x0 = Token.Unmarshal(dec)
+      x1 = command_t.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      x3 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(Redir.Unmarshal(dec))
+      obj = command.Subshell(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Subshell')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Subshell')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class DParen(command_t):
+    _type_tag = 13
+    __slots__ = ('left', 'child', 'right', 'redirects')
+  
+    def __init__(self, left, child, right, redirects):
+      # type: (Token, arith_expr_t, Token, List[Redir]) -> None
+      self.left = left
+      self.child = child
+      self.right = right
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.DParen
+      return command.DParen(cast(Token, None), cast(arith_expr_t, None), cast(Token, None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x3 in self.redirects:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.DParen
+      x0 = Token.Unmarshal(dec)
+      x1 = arith_expr_t.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      x3 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(Redir.Unmarshal(dec))
+      obj = command.DParen(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.DParen')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.DParen')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class DBracket(command_t):
+    _type_tag = 14
+    __slots__ = ('left', 'expr', 'right', 'redirects')
+  
+    def __init__(self, left, expr, right, redirects):
+      # type: (Token, bool_expr_t, Token, List[Redir]) -> None
+      self.left = left
+      self.expr = expr
+      self.right = right
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.DBracket
+      return command.DBracket(cast(Token, None), cast(bool_expr_t, None), cast(Token, None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.expr is None:
+        enc.Null()
+      else:
+        self.expr.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x3 in self.redirects:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.DBracket
+      x0 = Token.Unmarshal(dec)
+      x1 = bool_expr_t.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      x3 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(Redir.Unmarshal(dec))
+      obj = command.DBracket(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.DBracket')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.expr is not None
+      x1 = self.expr.PrettyTree(trav=trav)
+      L.append(Field('expr', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.DBracket')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.expr is not None
+      x1 = self.expr.AbbreviatedTree(trav=trav)
+      L.append(Field('expr', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ForEach(command_t):
+    _type_tag = 15
+    __slots__ = ('keyword', 'iter_names', 'iterable', 'semi_tok', 'body',
+                 'redirects')
+  
+    def __init__(self, keyword, iter_names, iterable, semi_tok, body,
+                 redirects):
+      # type: (Token, List[str], for_iter_t, Optional[Token], command_t, List[Redir]) -> None
+      self.keyword = keyword
+      self.iter_names = iter_names
+      self.iterable = iterable
+      self.semi_tok = semi_tok
+      self.body = body
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.ForEach
+      return command.ForEach(cast(Token, None), [] if alloc_lists else cast('List[str]', None), cast(for_iter_t, None), cast('Optional[Token]', None), cast(command_t, None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.iter_names is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.iter_names))
+        for x1 in self.iter_names:
+          enc.Str(x1)
+      if self.iterable is None:
+        enc.Null()
+      else:
+        self.iterable.Marshal(enc)
+      if self.semi_tok is None:
+        enc.Null()
+      else:
+        self.semi_tok.Marshal(enc)
+      if self.body is None:
+        enc.Null()
+      else:
+        self.body.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x5 in self.redirects:
+          if x5 is None:
+            enc.Null()
+          else:
+            x5.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.ForEach
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[str]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(dec.Str())
+      x2 = for_iter_t.Unmarshal(dec)
+      x3 = Token.Unmarshal(dec)
+      x4 = command_t.Unmarshal(dec)
+      x5 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x5 = []
+        for _ in xrange(n):
+          x5.append(Redir.Unmarshal(dec))
+      obj = command.ForEach(x0, x1, x2, x3, x4, x5)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ForEach')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.iter_names is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.iter_names:
+          x1.children.append(NewLeaf(i1, color_e.StringConst))
+        L.append(Field('iter_names', x1))
+  
+      assert self.iterable is not None
+      x2 = self.iterable.PrettyTree(trav=trav)
+      L.append(Field('iterable', x2))
+  
+      if self.semi_tok is not None:  # Optional
+        x3 = self.semi_tok.PrettyTree(trav=trav)
+        L.append(Field('semi_tok', x3))
+  
+      assert self.body is not None
+      x4 = self.body.PrettyTree(trav=trav)
+      L.append(Field('body', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.PrettyTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ForEach')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.iter_names is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.iter_names:
+          x1.children.append(NewLeaf(i1, color_e.StringConst))
+        L.append(Field('iter_names', x1))
+  
+      assert self.iterable is not None
+      x2 = self.iterable.AbbreviatedTree(trav=trav)
+      L.append(Field('iterable', x2))
+  
+      if self.semi_tok is not None:  # Optional
+        x3 = self.semi_tok.AbbreviatedTree(trav=trav)
+        L.append(Field('semi_tok', x3))
+  
+      assert self.body is not None
+      x4 = self.body.AbbreviatedTree(trav=trav)
+      L.append(Field('body', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.AbbreviatedTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ForExpr(command_t):
+    _type_tag = 16
+    __slots__ = ('keyword', 'init', 'cond', 'update', 'body', 'redirects')
+  
+    def __init__(self, keyword, init, cond, update, body, redirects):
+      # type: (Token, Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[command_t], List[Redir]) -> None
+      self.keyword = keyword
+      self.init = init
+      self.cond = cond
+      self.update = update
+      self.body = body
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.ForExpr
+      return command.ForExpr(cast(Token, None), cast('Optional[arith_expr_t]', None), cast('Optional[arith_expr_t]', None), cast('Optional[arith_expr_t]', None), cast('Optional[command_t]', None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.init is None:
+        enc.Null()
+      else:
+        self.init.Marshal(enc)
+      if self.cond is None:
+        enc.Null()
+      else:
+        self.cond.Marshal(enc)
+      if self.update is None:
+        enc.Null()
+      else:
+        self.update.Marshal(enc)
+      if self.body is None:
+        enc.Null()
+      else:
+        self.body.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x5 in self.redirects:
+          if x5 is None:
+            enc.Null()
+          else:
+            x5.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.ForExpr
+      x0 = Token.Unmarshal(dec)
+      x1 = arith_expr_t.Unmarshal(dec)
+      x2 = arith_expr_t.Unmarshal(dec)
+      x3 = arith_expr_t.Unmarshal(dec)
+      x4 = command_t.Unmarshal(dec)
+      x5 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x5 = []
+        for _ in xrange(n):
+          x5.append(Redir.Unmarshal(dec))
+      obj = command.ForExpr(x0, x1, x2, x3, x4, x5)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ForExpr')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.init is not None:  # Optional
+        x1 = self.init.PrettyTree(trav=trav)
+        L.append(Field('init', x1))
+  
+      if self.cond is not None:  # Optional
+        x2 = self.cond.PrettyTree(trav=trav)
+        L.append(Field('cond', x2))
+  
+      if self.update is not None:  # Optional
+        x3 = self.update.PrettyTree(trav=trav)
+        L.append(Field('update', x3))
+  
+      if self.body is not None:  # Optional
+        x4 = self.body.PrettyTree(trav=trav)
+        L.append(Field('body', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.PrettyTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ForExpr')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.init is not None:  # Optional
+        x1 = self.init.AbbreviatedTree(trav=trav)
+        L.append(Field('init', x1))
+  
+      if self.cond is not None:  # Optional
+        x2 = self.cond.AbbreviatedTree(trav=trav)
+        L.append(Field('cond', x2))
+  
+      if self.update is not None:  # Optional
+        x3 = self.update.AbbreviatedTree(trav=trav)
+        L.append(Field('update', x3))
+  
+      if self.body is not None:  # Optional
+        x4 = self.body.AbbreviatedTree(trav=trav)
+        L.append(Field('body', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.AbbreviatedTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class WhileUntil(command_t):
+    _type_tag = 17
+    __slots__ = ('keyword', 'cond', 'body', 'redirects')
+  
+    def __init__(self, keyword, cond, body, redirects):
+      # type: (Token, condition_t, command_t, List[Redir]) -> None
+      self.keyword = keyword
+      self.cond = cond
+      self.body = body
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.WhileUntil
+      return command.WhileUntil(cast(Token, None), cast(condition_t, None), cast(command_t, None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.cond is None:
+        enc.Null()
+      else:
+        self.cond.Marshal(enc)
+      if self.body is None:
+        enc.Null()
+      else:
+        self.body.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x3 in self.redirects:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.WhileUntil
+      x0 = Token.Unmarshal(dec)
+      x1 = condition_t.Unmarshal(dec)
+      x2 = command_t.Unmarshal(dec)
+      x3 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(Redir.Unmarshal(dec))
+      obj = command.WhileUntil(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.WhileUntil')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.cond is not None
+      x1 = self.cond.PrettyTree(trav=trav)
+      L.append(Field('cond', x1))
+  
+      assert self.body is not None
+      x2 = self.body.PrettyTree(trav=trav)
+      L.append(Field('body', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.WhileUntil')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.cond is not None
+      x1 = self.cond.AbbreviatedTree(trav=trav)
+      L.append(Field('cond', x1))
+  
+      assert self.body is not None
+      x2 = self.body.AbbreviatedTree(trav=trav)
+      L.append(Field('body', x2))
+  
+      if self.redirects is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('redirects', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class If(command_t):
+    _type_tag = 18
+    __slots__ = ('if_kw', 'arms', 'else_kw', 'else_action', 'fi_kw',
+                 'redirects')
+  
+    def __init__(self, if_kw, arms, else_kw, else_action, fi_kw, redirects):
+      # type: (Token, List[IfArm], Optional[Token], List[command_t], Optional[Token], List[Redir]) -> None
+      self.if_kw = if_kw
+      self.arms = arms
+      self.else_kw = else_kw
+      self.else_action = else_action
+      self.fi_kw = fi_kw
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.If
+      return command.If(cast(Token, None), [] if alloc_lists else cast('List[IfArm]', None), cast('Optional[Token]', None), [] if alloc_lists else cast('List[command_t]', None), cast('Optional[Token]', None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.if_kw is None:
+        enc.Null()
+      else:
+        self.if_kw.Marshal(enc)
+      if self.arms is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.arms))
+        for x1 in self.arms:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.else_kw is None:
+        enc.Null()
+      else:
+        self.else_kw.Marshal(enc)
+      if self.else_action is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.else_action))
+        for x3 in self.else_action:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      if self.fi_kw is None:
+        enc.Null()
+      else:
+        self.fi_kw.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x5 in self.redirects:
+          if x5 is None:
+            enc.Null()
+          else:
+            x5.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.If
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[IfArm]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(IfArm.Unmarshal(dec))
+      x2 = Token.Unmarshal(dec)
+      x3 = None  # type: List[command_t]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(command_t.Unmarshal(dec))
+      x4 = Token.Unmarshal(dec)
+      x5 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x5 = []
+        for _ in xrange(n):
+          x5.append(Redir.Unmarshal(dec))
+      obj = command.If(x0, x1, x2, x3, x4, x5)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.If')
+      L = out_node.fields
+  
+      assert self.if_kw is not None
+      x0 = self.if_kw.PrettyTree(trav=trav)
+      L.append(Field('if_kw', x0))
+  
+      if self.arms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.arms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('arms', x1))
+  
+      if self.else_kw is not None:  # Optional
+        x2 = self.else_kw.PrettyTree(trav=trav)
+        L.append(Field('else_kw', x2))
+  
+      if self.else_action is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.else_action:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('else_action', x3))
+  
+      if self.fi_kw is not None:  # Optional
+        x4 = self.fi_kw.PrettyTree(trav=trav)
+        L.append(Field('fi_kw', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.PrettyTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.If')
+      L = out_node.fields
+      assert self.if_kw is not None
+      x0 = self.if_kw.AbbreviatedTree(trav=trav)
+      L.append(Field('if_kw', x0))
+  
+      if self.arms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.arms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('arms', x1))
+  
+      if self.else_kw is not None:  # Optional
+        x2 = self.else_kw.AbbreviatedTree(trav=trav)
+        L.append(Field('else_kw', x2))
+  
+      if self.else_action is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.else_action:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('else_action', x3))
+  
+      if self.fi_kw is not None:  # Optional
+        x4 = self.fi_kw.AbbreviatedTree(trav=trav)
+        L.append(Field('fi_kw', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.AbbreviatedTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Case(command_t):
+    _type_tag = 19
+    __slots__ = ('case_kw', 'to_match', 'arms_start', 'arms', 'arms_end',
+                 'redirects')
+  
+    def __init__(self, case_kw, to_match, arms_start, arms, arms_end,
+                 redirects):
+      # type: (Token, case_arg_t, Token, List[CaseArm], Token, List[Redir]) -> None
+      self.case_kw = case_kw
+      self.to_match = to_match
+      self.arms_start = arms_start
+      self.arms = arms
+      self.arms_end = arms_end
+      self.redirects = redirects
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Case
+      return command.Case(cast(Token, None), cast(case_arg_t, None), cast(Token, None), [] if alloc_lists else cast('List[CaseArm]', None), cast(Token, None), [] if alloc_lists else cast('List[Redir]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.case_kw is None:
+        enc.Null()
+      else:
+        self.case_kw.Marshal(enc)
+      if self.to_match is None:
+        enc.Null()
+      else:
+        self.to_match.Marshal(enc)
+      if self.arms_start is None:
+        enc.Null()
+      else:
+        self.arms_start.Marshal(enc)
+      if self.arms is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.arms))
+        for x3 in self.arms:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      if self.arms_end is None:
+        enc.Null()
+      else:
+        self.arms_end.Marshal(enc)
+      if self.redirects is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.redirects))
+        for x5 in self.redirects:
+          if x5 is None:
+            enc.Null()
+          else:
+            x5.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Case
+      x0 = Token.Unmarshal(dec)
+      x1 = case_arg_t.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      x3 = None  # type: List[CaseArm]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(CaseArm.Unmarshal(dec))
+      x4 = Token.Unmarshal(dec)
+      x5 = None  # type: List[Redir]
+      n = dec.Len()
+      if n != -1:
+        x5 = []
+        for _ in xrange(n):
+          x5.append(Redir.Unmarshal(dec))
+      obj = command.Case(x0, x1, x2, x3, x4, x5)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Case')
+      L = out_node.fields
+  
+      assert self.case_kw is not None
+      x0 = self.case_kw.PrettyTree(trav=trav)
+      L.append(Field('case_kw', x0))
+  
+      assert self.to_match is not None
+      x1 = self.to_match.PrettyTree(trav=trav)
+      L.append(Field('to_match', x1))
+  
+      assert self.arms_start is not None
+      x2 = self.arms_start.PrettyTree(trav=trav)
+      L.append(Field('arms_start', x2))
+  
+      if self.arms is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.arms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('arms', x3))
+  
+      assert self.arms_end is not None
+      x4 = self.arms_end.PrettyTree(trav=trav)
+      L.append(Field('arms_end', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.PrettyTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Case')
+      L = out_node.fields
+      assert self.case_kw is not None
+      x0 = self.case_kw.AbbreviatedTree(trav=trav)
+      L.append(Field('case_kw', x0))
+  
+      assert self.to_match is not None
+      x1 = self.to_match.AbbreviatedTree(trav=trav)
+      L.append(Field('to_match', x1))
+  
+      assert self.arms_start is not None
+      x2 = self.arms_start.AbbreviatedTree(trav=trav)
+      L.append(Field('arms_start', x2))
+  
+      if self.arms is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.arms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('arms', x3))
+  
+      assert self.arms_end is not None
+      x4 = self.arms_end.AbbreviatedTree(trav=trav)
+      L.append(Field('arms_end', x4))
+  
+      if self.redirects is not None:  # List
+        x5 = hnode.Array([])
+        for i5 in self.redirects:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i5 is None else
+               i5.AbbreviatedTree(trav=trav))
+          x5.children.append(h)
+        L.append(Field('redirects', x5))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class ShFunction(command_t):
+    _type_tag = 20
+    __slots__ = ('keyword', 'name_tok', 'name', 'body')
+  
+    def __init__(self, keyword, name_tok, name, body):
+      # type: (Optional[Token], Token, str, command_t) -> None
+      self.keyword = keyword
+      self.name_tok = name_tok
+      self.name = name
+      self.body = body
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.ShFunction
+      return command.ShFunction(cast('Optional[Token]', None), cast(Token, None), '', cast(command_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.name_tok is None:
+        enc.Null()
+      else:
+        self.name_tok.Marshal(enc)
+      enc.Str(self.name)
+      if self.body is None:
+        enc.Null()
+      else:
+        self.body.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.ShFunction
+      x0 = Token.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      x2 = dec.Str()
+      x3 = command_t.Unmarshal(dec)
+      obj = command.ShFunction(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ShFunction')
+      L = out_node.fields
+  
+      if self.keyword is not None:  # Optional
+        x0 = self.keyword.PrettyTree(trav=trav)
+        L.append(Field('keyword', x0))
+  
+      assert self.name_tok is not None
+      x1 = self.name_tok.PrettyTree(trav=trav)
+      L.append(Field('name_tok', x1))
+  
+      x2 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x2))
+  
+      assert self.body is not None
+      x3 = self.body.PrettyTree(trav=trav)
+      L.append(Field('body', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.ShFunction')
+      L = out_node.fields
+      if self.keyword is not None:  # Optional
+        x0 = self.keyword.AbbreviatedTree(trav=trav)
+        L.append(Field('keyword', x0))
+  
+      assert self.name_tok is not None
+      x1 = self.name_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('name_tok', x1))
+  
+      x2 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x2))
+  
+      assert self.body is not None
+      x3 = self.body.AbbreviatedTree(trav=trav)
+      L.append(Field('body', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class TimeBlock(command_t):
+    _type_tag = 21
+    __slots__ = ('keyword', 'pipeline')
+  
+    def __init__(self, keyword, pipeline):
+      # type: (Token, command_t) -> None
+      self.keyword = keyword
+      self.pipeline = pipeline
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.TimeBlock
+      return command.TimeBlock(cast(Token, None), cast(command_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.pipeline is None:
+        enc.Null()
+      else:
+        self.pipeline.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.TimeBlock
+      x0 = Token.Unmarshal(dec)
+      x1 = command_t.Unmarshal(dec)
+      obj = command.TimeBlock(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.TimeBlock')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.pipeline is not None
+      x1 = self.pipeline.PrettyTree(trav=trav)
+      L.append(Field('pipeline', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.TimeBlock')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.pipeline is not None
+      x1 = self.pipeline.AbbreviatedTree(trav=trav)
+      L.append(Field('pipeline', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class CommandList(command_t):
+    _type_tag = 22
+    __slots__ = ('children',)
+  
+    def __init__(self, children):
+      # type: (List[command_t]) -> None
+      self.children = children
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.CommandList
+      return command.CommandList([] if alloc_lists else cast('List[command_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.children is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.children))
+        for x0 in self.children:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.CommandList
+      x0 = None  # type: List[command_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(command_t.Unmarshal(dec))
+      obj = command.CommandList(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.CommandList')
+      L = out_node.fields
+  
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.CommandList')
+      L = out_node.fields
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class VarDecl(command_t):
+    _type_tag = 23
+    __slots__ = ('keyword', 'lhs', 'rhs')
+  
+    def __init__(self, keyword, lhs, rhs):
+      # type: (Optional[Token], List[NameType], Optional[expr_t]) -> None
+      self.keyword = keyword
+      self.lhs = lhs
+      self.rhs = rhs
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.VarDecl
+      return command.VarDecl(cast('Optional[Token]', None), [] if alloc_lists else cast('List[NameType]', None), cast('Optional[expr_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.lhs is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.lhs))
+        for x1 in self.lhs:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.rhs is None:
+        enc.Null()
+      else:
+        self.rhs.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.VarDecl
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[NameType]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(NameType.Unmarshal(dec))
+      x2 = expr_t.Unmarshal(dec)
+      obj = command.VarDecl(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.VarDecl')
+      L = out_node.fields
+  
+      if self.keyword is not None:  # Optional
+        x0 = self.keyword.PrettyTree(trav=trav)
+        L.append(Field('keyword', x0))
+  
+      if self.lhs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.lhs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('lhs', x1))
+  
+      if self.rhs is not None:  # Optional
+        x2 = self.rhs.PrettyTree(trav=trav)
+        L.append(Field('rhs', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.VarDecl')
+      L = out_node.fields
+      if self.keyword is not None:  # Optional
+        x0 = self.keyword.AbbreviatedTree(trav=trav)
+        L.append(Field('keyword', x0))
+  
+      if self.lhs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.lhs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('lhs', x1))
+  
+      if self.rhs is not None:  # Optional
+        x2 = self.rhs.AbbreviatedTree(trav=trav)
+        L.append(Field('rhs', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class BareDecl(command_t):
+    _type_tag = 24
+    __slots__ = ('lhs', 'rhs')
+  
+    def __init__(self, lhs, rhs):
+      # type: (Token, expr_t) -> None
+      self.lhs = lhs
+      self.rhs = rhs
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.BareDecl
+      return command.BareDecl(cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.lhs is None:
+        enc.Null()
+      else:
+        self.lhs.Marshal(enc)
+      if self.rhs is None:
+        enc.Null()
+      else:
+        self.rhs.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.BareDecl
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      obj = command.BareDecl(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.BareDecl')
+      L = out_node.fields
+  
+      assert self.lhs is not None
+      x0 = self.lhs.PrettyTree(trav=trav)
+      L.append(Field('lhs', x0))
+  
+      assert self.rhs is not None
+      x1 = self.rhs.PrettyTree(trav=trav)
+      L.append(Field('rhs', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.BareDecl')
+      L = out_node.fields
+      assert self.lhs is not None
+      x0 = self.lhs.AbbreviatedTree(trav=trav)
+      L.append(Field('lhs', x0))
+  
+      assert self.rhs is not None
+      x1 = self.rhs.AbbreviatedTree(trav=trav)
+      L.append(Field('rhs', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Mutation(command_t):
+    _type_tag = 25
+    __slots__ = ('keyword', 'lhs', 'op', 'rhs')
+  
+    def __init__(self, keyword, lhs, op, rhs):
+      # type: (Token, List[y_lhs_t], Token, expr_t) -> None
+      self.keyword = keyword
+      self.lhs = lhs
+      self.op = op
+      self.rhs = rhs
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Mutation
+      return command.Mutation(cast(Token, None), [] if alloc_lists else cast('List[y_lhs_t]', None), cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.lhs is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.lhs))
+        for x1 in self.lhs:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.rhs is None:
+        enc.Null()
+      else:
+        self.rhs.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Mutation
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[y_lhs_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(y_lhs_t.Unmarshal(dec))
+      x2 = Token.Unmarshal(dec)
+      x3 = expr_t.Unmarshal(dec)
+      obj = command.Mutation(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Mutation')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.lhs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.lhs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('lhs', x1))
+  
+      assert self.op is not None
+      x2 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x2))
+  
+      assert self.rhs is not None
+      x3 = self.rhs.PrettyTree(trav=trav)
+      L.append(Field('rhs', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Mutation')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      if self.lhs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.lhs:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('lhs', x1))
+  
+      assert self.op is not None
+      x2 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x2))
+  
+      assert self.rhs is not None
+      x3 = self.rhs.AbbreviatedTree(trav=trav)
+      L.append(Field('rhs', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Expr(command_t):
+    _type_tag = 26
+    __slots__ = ('keyword', 'e')
+  
+    def __init__(self, keyword, e):
+      # type: (Token, expr_t) -> None
+      self.keyword = keyword
+      self.e = e
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> command.Expr
+      return command.Expr(cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.keyword is None:
+        enc.Null()
+      else:
+        self.keyword.Marshal(enc)
+      if self.e is None:
+        enc.Null()
+      else:
+        self.e.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> command.Expr
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      obj = command.Expr(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Expr')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.e is not None
+      x1 = self.e.PrettyTree(trav=trav)
+      L.append(Field('e', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('command.Expr')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree(trav=trav)
+      L.append(Field('keyword', x0))
+  
+      assert self.e is not None
+      x1 = self.e.AbbreviatedTree(trav=trav)
+      L.append(Field('e', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class glob_part_e(object):
+  Literal = 1
+  Operator = 2
+  CharClass = 3
+
+_glob_part_str = {
+  1: 'Literal',
+  2: 'Operator',
+  3: 'CharClass',
+}
+
+def glob_part_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _glob_part_str[tag]
+  if dot:
+    return "glob_part.%s" % v
+  else:
+    return v
+
+class glob_part_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> glob_part_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('glob_part_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('glob_part_t', dec.Ref())
+    if tag == glob_part_e.Literal:
+      return glob_part.Literal.UnmarshalNew(dec)
+    if tag == glob_part_e.Operator:
+      return glob_part.Operator.UnmarshalNew(dec)
+    if tag == glob_part_e.CharClass:
+      return glob_part.CharClass.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('glob_part_t', None)
+  pass
+
+class glob_part(object):
+  class Literal(glob_part_t):
+    _type_tag = 1
+    __slots__ = ('id', 's')
+  
+    def __init__(self, id, s):
+      # type: (Id_t, str) -> None
+      self.id = id
+      self.s = s
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> glob_part.Literal
+      return glob_part.Literal(-1, '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.id)
+      enc.Str(self.s)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> glob_part.Literal
+      x0 = dec.Int()
+      x1 = dec.Str()
+      obj = glob_part.Literal(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('glob_part.Literal')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x0))
+  
+      x1 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('glob_part.Literal')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x0))
+  
+      x1 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Operator(glob_part_t):
+    _type_tag = 2
+    __slots__ = ('op_id',)
+  
+    def __init__(self, op_id):
+      # type: (Id_t) -> None
+      self.op_id = op_id
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> glob_part.Operator
+      return glob_part.Operator(-1)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Int(self.op_id)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> glob_part.Operator
+      x0 = dec.Int()
+      obj = glob_part.Operator(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('glob_part.Operator')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('glob_part.Operator')
+      L = out_node.fields
+      x0 = hnode.Leaf(Id_str(self.op_id), color_e.UserType)
+      L.append(Field('op_id', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class CharClass(glob_part_t):
+    _type_tag = 3
+    __slots__ = ('negated', 'strs')
+  
+    def __init__(self, negated, strs):
+      # type: (bool, List[str]) -> None
+      self.negated = negated
+      self.strs = strs
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> glob_part.CharClass
+      return glob_part.CharClass(False, [] if alloc_lists else cast('List[str]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Bool(self.negated)
+      if self.strs is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.strs))
+        for x1 in self.strs:
+          enc.Str(x1)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> glob_part.CharClass
+      x0 = dec.Bool()
+      x1 = None  # type: List[str]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(dec.Str())
+      obj = glob_part.CharClass(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('glob_part.CharClass')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      if self.strs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.strs:
+          x1.children.append(NewLeaf(i1, color_e.StringConst))
+        L.append(Field('strs', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('glob_part.CharClass')
+      L = out_node.fields
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      if self.strs is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.strs:
+          x1.children.append(NewLeaf(i1, color_e.StringConst))
+        L.append(Field('strs', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class printf_part_e(object):
+  Literal = 67
+  Percent = 2
+
+_printf_part_str = {
+  2: 'Percent',
+  67: 'Literal',
+}
+
+def printf_part_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _printf_part_str[tag]
+  if dot:
+    return "printf_part.%s" % v
+  else:
+    return v
+
+class printf_part_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> printf_part_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('printf_part_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('printf_part_t', dec.Ref())
+    if tag == printf_part_e.Literal:
+      return Token.UnmarshalNew(dec)
+    if tag == printf_part_e.Percent:
+      return printf_part.Percent.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('printf_part_t', None)
+  pass
+
+class printf_part(object):
+  class Percent(printf_part_t):
+    _type_tag = 2
+    __slots__ = ('flags', 'width', 'precision', 'type')
+  
+    def __init__(self, flags, width, precision, type):
+      # type: (List[Token], Optional[Token], Optional[Token], Token) -> None
+      self.flags = flags
+      self.width = width
+      self.precision = precision
+      self.type = type
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> printf_part.Percent
+      return printf_part.Percent([] if alloc_lists else cast('List[Token]', None), cast('Optional[Token]', None), cast('Optional[Token]', None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.flags is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.flags))
+        for x0 in self.flags:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      if self.width is None:
+        enc.Null()
+      else:
+        self.width.Marshal(enc)
+      if self.precision is None:
+        enc.Null()
+      else:
+        self.precision.Marshal(enc)
+      if self.type is None:
+        enc.Null()
+      else:
+        self.type.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> printf_part.Percent
+      x0 = None  # type: List[Token]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(Token.Unmarshal(dec))
+      x1 = Token.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      x3 = Token.Unmarshal(dec)
+      obj = printf_part.Percent(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('printf_part.Percent')
+      L = out_node.fields
+  
+      if self.flags is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.flags:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('flags', x0))
+  
+      if self.width is not None:  # Optional
+        x1 = self.width.PrettyTree(trav=trav)
+        L.append(Field('width', x1))
+  
+      if self.precision is not None:  # Optional
+        x2 = self.precision.PrettyTree(trav=trav)
+        L.append(Field('precision', x2))
+  
+      assert self.type is not None
+      x3 = self.type.PrettyTree(trav=trav)
+      L.append(Field('type', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('printf_part.Percent')
+      L = out_node.fields
+      if self.flags is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.flags:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('flags', x0))
+  
+      if self.width is not None:  # Optional
+        x1 = self.width.AbbreviatedTree(trav=trav)
+        L.append(Field('width', x1))
+  
+      if self.precision is not None:  # Optional
+        x2 = self.precision.AbbreviatedTree(trav=trav)
+        L.append(Field('precision', x2))
+  
+      assert self.type is not None
+      x3 = self.type.AbbreviatedTree(trav=trav)
+      L.append(Field('type', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class expr_context_t(pybase.SimpleObj):
+  pass
+
+class expr_context_e(object):
+  Load = expr_context_t(1)
+  Store = expr_context_t(2)
+  Del = expr_context_t(3)
+  AugLoad = expr_context_t(4)
+  AugStore = expr_context_t(5)
+  Param = expr_context_t(6)
+
+_expr_context_str = {
+  1: 'expr_context.Load',
+  2: 'expr_context.Store',
+  3: 'expr_context.Del',
+  4: 'expr_context.AugLoad',
+  5: 'expr_context.AugStore',
+  6: 'expr_context.Param',
+}
+
+def expr_context_str(val):
+  # type: (expr_context_t) -> str
+  return _expr_context_str[val]
+
+class y_lhs_e(object):
+  Var = 67
+  Subscript = 97
+  Attribute = 98
+
+_y_lhs_str = {
+  67: 'Var',
+  97: 'Subscript',
+  98: 'Attribute',
+}
+
+def y_lhs_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _y_lhs_str[tag]
+  if dot:
+    return "y_lhs.%s" % v
+  else:
+    return v
+
+class y_lhs_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> y_lhs_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('y_lhs_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('y_lhs_t', dec.Ref())
+    if tag == y_lhs_e.Var:
+      return Token.UnmarshalNew(dec)
+    if tag == y_lhs_e.Subscript:
+      return Subscript.UnmarshalNew(dec)
+    if tag == y_lhs_e.Attribute:
+      return Attribute.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('y_lhs_t', None)
+  pass
+
+class y_lhs(object):
+  pass
+
+class place_op_e(object):
+  Subscript = 1
+  Attribute = 2
+
+_place_op_str = {
+  1: 'Subscript',
+  2: 'Attribute',
+}
+
+def place_op_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _place_op_str[tag]
+  if dot:
+    return "place_op.%s" % v
+  else:
+    return v
+
+class place_op_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> place_op_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('place_op_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('place_op_t', dec.Ref())
+    if tag == place_op_e.Subscript:
+      return place_op.Subscript.UnmarshalNew(dec)
+    if tag == place_op_e.Attribute:
+      return place_op.Attribute.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('place_op_t', None)
+  pass
+
+class place_op(object):
+  class Subscript(place_op_t):
+    _type_tag = 1
+    __slots__ = ('op', 'index')
+  
+    def __init__(self, op, index):
+      # type: (Token, expr_t) -> None
+      self.op = op
+      self.index = index
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> place_op.Subscript
+      return place_op.Subscript(cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.index is None:
+        enc.Null()
+      else:
+        self.index.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> place_op.Subscript
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      obj = place_op.Subscript(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('place_op.Subscript')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.index is not None
+      x1 = self.index.PrettyTree(trav=trav)
+      L.append(Field('index', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('place_op.Subscript')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.index is not None
+      x1 = self.index.AbbreviatedTree(trav=trav)
+      L.append(Field('index', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Attribute(place_op_t):
+    _type_tag = 2
+    __slots__ = ('op', 'attr')
+  
+    def __init__(self, op, attr):
+      # type: (Token, Token) -> None
+      self.op = op
+      self.attr = attr
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> place_op.Attribute
+      return place_op.Attribute(cast(Token, None), cast(Token, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.attr is None:
+        enc.Null()
+      else:
+        self.attr.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> place_op.Attribute
+      x0 = Token.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      obj = place_op.Attribute(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('place_op.Attribute')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.attr is not None
+      x1 = self.attr.PrettyTree(trav=trav)
+      L.append(Field('attr', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('place_op.Attribute')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.attr is not None
+      x1 = self.attr.AbbreviatedTree(trav=trav)
+      L.append(Field('attr', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class expr_e(object):
+  Var = 1
+  Const = 2
+  Place = 3
+  ShArrayLiteral = 75
+  Eggex = 83
+  SimpleVarSub = 73
+  BracedVarSub = 70
+  CommandSub = 74
+  SingleQuoted = 72
+  DoubleQuoted = 71
+  Literal = 11
+  Lambda = 12
+  Unary = 13
+  Binary = 14
+  Compare = 15
+  FuncCall = 16
+  IfExp = 17
+  Tuple = 18
+  List = 19
+  Dict = 20
+  Implicit = 21
+  ListComp = 22
+  DictComp = 23
+  GeneratorExp = 24
+  Range = 25
+  Slice = 26
+  Subscript = 97
+  Attribute = 98
+  Spread = 29
+
+_expr_str = {
+  1: 'Var',
+  2: 'Const',
+  3: 'Place',
+  11: 'Literal',
+  12: 'Lambda',
+  13: 'Unary',
+  14: 'Binary',
+  15: 'Compare',
+  16: 'FuncCall',
+  17: 'IfExp',
+  18: 'Tuple',
+  19: 'List',
+  20: 'Dict',
+  21: 'Implicit',
+  22: 'ListComp',
+  23: 'DictComp',
+  24: 'GeneratorExp',
+  25: 'Range',
+  26: 'Slice',
+  29: 'Spread',
+  70: 'BracedVarSub',
+  71: 'DoubleQuoted',
+  72: 'SingleQuoted',
+  73: 'SimpleVarSub',
+  74: 'CommandSub',
+  75: 'ShArrayLiteral',
+  83: 'Eggex',
+  97: 'Subscript',
+  98: 'Attribute',
+}
+
+def expr_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _expr_str[tag]
+  if dot:
+    return "expr.%s" % v
+  else:
+    return v
+
+class expr_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> expr_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('expr_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('expr_t', dec.Ref())
+    if tag == expr_e.Var:
+      return expr.Var.UnmarshalNew(dec)
+    if tag == expr_e.Const:
+      return expr.Const.UnmarshalNew(dec)
+    if tag == expr_e.Place:
+      return expr.Place.UnmarshalNew(dec)
+    if tag == expr_e.ShArrayLiteral:
+      return ShArrayLiteral.UnmarshalNew(dec)
+    if tag == expr_e.Eggex:
+      return Eggex.UnmarshalNew(dec)
+    if tag == expr_e.SimpleVarSub:
+      return SimpleVarSub.UnmarshalNew(dec)
+    if tag == expr_e.BracedVarSub:
+      return BracedVarSub.UnmarshalNew(dec)
+    if tag == expr_e.CommandSub:
+      return CommandSub.UnmarshalNew(dec)
+    if tag == expr_e.SingleQuoted:
+      return SingleQuoted.UnmarshalNew(dec)
+    if tag == expr_e.DoubleQuoted:
+      return DoubleQuoted.UnmarshalNew(dec)
+    if tag == expr_e.Literal:
+      return expr.Literal.UnmarshalNew(dec)
+    if tag == expr_e.Lambda:
+      return expr.Lambda.UnmarshalNew(dec)
+    if tag == expr_e.Unary:
+      return expr.Unary.UnmarshalNew(dec)
+    if tag == expr_e.Binary:
+      return expr.Binary.UnmarshalNew(dec)
+    if tag == expr_e.Compare:
+      return expr.Compare.UnmarshalNew(dec)
+    if tag == expr_e.FuncCall:
+      return expr.FuncCall.UnmarshalNew(dec)
+    if tag == expr_e.IfExp:
+      return expr.IfExp.UnmarshalNew(dec)
+    if tag == expr_e.Tuple:
+      return expr.Tuple.UnmarshalNew(dec)
+    if tag == expr_e.List:
+      return expr.List.UnmarshalNew(dec)
+    if tag == expr_e.Dict:
+      return expr.Dict.UnmarshalNew(dec)
+    if tag == expr_e.Implicit:
+      return expr__Implicit.UnmarshalNew(dec)
+    if tag == expr_e.ListComp:
+      return expr.ListComp.UnmarshalNew(dec)
+    if tag == expr_e.DictComp:
+      return expr.DictComp.UnmarshalNew(dec)
+    if tag == expr_e.GeneratorExp:
+      return expr.GeneratorExp.UnmarshalNew(dec)
+    if tag == expr_e.Range:
+      return expr.Range.UnmarshalNew(dec)
+    if tag == expr_e.Slice:
+      return expr.Slice.UnmarshalNew(dec)
+    if tag == expr_e.Subscript:
+      return Subscript.UnmarshalNew(dec)
+    if tag == expr_e.Attribute:
+      return Attribute.UnmarshalNew(dec)
+    if tag == expr_e.Spread:
+      return expr.Spread.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('expr_t', None)
+  pass
+
+class expr__Implicit(expr_t):
+  _type_tag = 21
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> expr__Implicit
+    dec.Register(expr.Implicit)
+    return expr.Implicit
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('expr__Implicit')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('expr__Implicit')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class expr(object):
+  class Var(expr_t):
+    _type_tag = 1
+    __slots__ = ('left', 'name')
+  
+    def __init__(self, left, name):
+      # type: (Token, str) -> None
+      self.left = left
+      self.name = name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Var
+      return expr.Var(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      enc.Str(self.name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Var
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = expr.Var(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Var')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Var')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Const(expr_t):
+    _type_tag = 2
+    __slots__ = ('c', 'val')
+  
+    def __init__(self, c, val):
+      # type: (Token, value_t) -> None
+      self.c = c
+      self.val = val
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Const
+      return expr.Const(cast(Token, None), cast(value_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.c is None:
+        enc.Null()
+      else:
+        self.c.Marshal(enc)
+      enc.Unsupported()
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Const
+      x0 = Token.Unmarshal(dec)
+      dec.Unsupported()
+      x1 = cast(value_t, None)
+      obj = expr.Const(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Const')
+      L = out_node.fields
+  
+      assert self.c is not None
+      x0 = self.c.PrettyTree(trav=trav)
+      L.append(Field('c', x0))
+  
+      assert self.val is not None
+      x1 = self.val.PrettyTree(trav=trav)
+      L.append(Field('val', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Const')
+      L = out_node.fields
+      assert self.c is not None
+      x0 = self.c.AbbreviatedTree(trav=trav)
+      L.append(Field('c', x0))
+  
+      assert self.val is not None
+      x1 = self.val.AbbreviatedTree(trav=trav)
+      L.append(Field('val', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Place(expr_t):
+    _type_tag = 3
+    __slots__ = ('blame_tok', 'var_name', 'ops')
+  
+    def __init__(self, blame_tok, var_name, ops):
+      # type: (Token, str, List[place_op_t]) -> None
+      self.blame_tok = blame_tok
+      self.var_name = var_name
+      self.ops = ops
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Place
+      return expr.Place(cast(Token, None), '', [] if alloc_lists else cast('List[place_op_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.blame_tok is None:
+        enc.Null()
+      else:
+        self.blame_tok.Marshal(enc)
+      enc.Str(self.var_name)
+      if self.ops is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.ops))
+        for x2 in self.ops:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Place
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      x2 = None  # type: List[place_op_t]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(place_op_t.Unmarshal(dec))
+      obj = expr.Place(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Place')
+      L = out_node.fields
+  
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.PrettyTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      if self.ops is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('ops', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Place')
+      L = out_node.fields
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      if self.ops is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('ops', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Literal(expr_t):
+    _type_tag = 11
+    __slots__ = ('inner',)
+  
+    def __init__(self, inner):
+      # type: (expr_t) -> None
+      self.inner = inner
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Literal
+      return expr.Literal(cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.inner is None:
+        enc.Null()
+      else:
+        self.inner.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Literal
+      x0 = expr_t.Unmarshal(dec)
+      obj = expr.Literal(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Literal')
+      L = out_node.fields
+  
+      assert self.inner is not None
+      x0 = self.inner.PrettyTree(trav=trav)
+      L.append(Field('inner', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Literal')
+      L = out_node.fields
+      assert self.inner is not None
+      x0 = self.inner.AbbreviatedTree(trav=trav)
+      L.append(Field('inner', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Lambda(expr_t):
+    _type_tag = 12
+    __slots__ = ('params', 'body')
+  
+    def __init__(self, params, body):
+      # type: (List[NameType], expr_t) -> None
+      self.params = params
+      self.body = body
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Lambda
+      return expr.Lambda([] if alloc_lists else cast('List[NameType]', None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.params is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.params))
+        for x0 in self.params:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      if self.body is None:
+        enc.Null()
+      else:
+        self.body.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Lambda
+      x0 = None  # type: List[NameType]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(NameType.Unmarshal(dec))
+      x1 = expr_t.Unmarshal(dec)
+      obj = expr.Lambda(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Lambda')
+      L = out_node.fields
+  
+      if self.params is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.params:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('params', x0))
+  
+      assert self.body is not None
+      x1 = self.body.PrettyTree(trav=trav)
+      L.append(Field('body', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Lambda')
+      L = out_node.fields
+      if self.params is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.params:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('params', x0))
+  
+      assert self.body is not None
+      x1 = self.body.AbbreviatedTree(trav=trav)
+      L.append(Field('body', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Unary(expr_t):
+    _type_tag = 13
+    __slots__ = ('op', 'child')
+  
+    def __init__(self, op, child):
+      # type: (Token, expr_t) -> None
+      self.op = op
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Unary
+      return expr.Unary(cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Unary
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      obj = expr.Unary(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Unary')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Unary')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Binary(expr_t):
+    _type_tag = 14
+    __slots__ = ('op', 'left', 'right')
+  
+    def __init__(self, op, left, right):
+      # type: (Token, expr_t, expr_t) -> None
+      self.op = op
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Binary
+      return expr.Binary(cast(Token, None), cast(expr_t, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Binary
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      x2 = expr_t.Unmarshal(dec)
+      obj = expr.Binary(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Binary')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Binary')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Compare(expr_t):
+    _type_tag = 15
+    __slots__ = ('left', 'ops', 'comparators')
+  
+    def __init__(self, left, ops, comparators):
+      # type: (expr_t, List[Token], List[expr_t]) -> None
+      self.left = left
+      self.ops = ops
+      self.comparators = comparators
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Compare
+      return expr.Compare(cast(expr_t, None), [] if alloc_lists else cast('List[Token]', None), [] if alloc_lists else cast('List[expr_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.ops is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.ops))
+        for x1 in self.ops:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.comparators is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.comparators))
+        for x2 in self.comparators:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Compare
+      x0 = expr_t.Unmarshal(dec)
+      x1 = None  # type: List[Token]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(Token.Unmarshal(dec))
+      x2 = None  # type: List[expr_t]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(expr_t.Unmarshal(dec))
+      obj = expr.Compare(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Compare')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.ops is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('ops', x1))
+  
+      if self.comparators is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.comparators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('comparators', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Compare')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.ops is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.ops:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('ops', x1))
+  
+      if self.comparators is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.comparators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('comparators', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class FuncCall(expr_t):
+    _type_tag = 16
+    __slots__ = ('func', 'args')
+  
+    def __init__(self, func, args):
+      # type: (expr_t, ArgList) -> None
+      self.func = func
+      self.args = args
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.FuncCall
+      return expr.FuncCall(cast(expr_t, None), cast(ArgList, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.func is None:
+        enc.Null()
+      else:
+        self.func.Marshal(enc)
+      if self.args is None:
+        enc.Null()
+      else:
+        self.args.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.FuncCall
+      x0 = expr_t.Unmarshal(dec)
+      x1 = ArgList.Unmarshal(dec)
+      obj = expr.FuncCall(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.FuncCall')
+      L = out_node.fields
+  
+      assert self.func is not None
+      x0 = self.func.PrettyTree(trav=trav)
+      L.append(Field('func', x0))
+  
+      assert self.args is not None
+      x1 = self.args.PrettyTree(trav=trav)
+      L.append(Field('args', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.FuncCall')
+      L = out_node.fields
+      assert self.func is not None
+      x0 = self.func.AbbreviatedTree(trav=trav)
+      L.append(Field('func', x0))
+  
+      assert self.args is not None
+      x1 = self.args.AbbreviatedTree(trav=trav)
+      L.append(Field('args', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class IfExp(expr_t):
+    _type_tag = 17
+    __slots__ = ('test', 'body', 'orelse')
+  
+    def __init__(self, test, body, orelse):
+      # type: (expr_t, expr_t, expr_t) -> None
+      self.test = test
+      self.body = body
+      self.orelse = orelse
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.IfExp
+      return expr.IfExp(cast(expr_t, None), cast(expr_t, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.test is None:
+        enc.Null()
+      else:
+        self.test.Marshal(enc)
+      if self.body is None:
+        enc.Null()
+      else:
+        self.body.Marshal(enc)
+      if self.orelse is None:
+        enc.Null()
+      else:
+        self.orelse.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.IfExp
+      x0 = expr_t.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      x2 = expr_t.Unmarshal(dec)
+      obj = expr.IfExp(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.IfExp')
+      L = out_node.fields
+  
+      assert self.test is not None
+      x0 = self.test.PrettyTree(trav=trav)
+      L.append(Field('test', x0))
+  
+      assert self.body is not None
+      x1 = self.body.PrettyTree(trav=trav)
+      L.append(Field('body', x1))
+  
+      assert self.orelse is not None
+      x2 = self.orelse.PrettyTree(trav=trav)
+      L.append(Field('orelse', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.IfExp')
+      L = out_node.fields
+      assert self.test is not None
+      x0 = self.test.AbbreviatedTree(trav=trav)
+      L.append(Field('test', x0))
+  
+      assert self.body is not None
+      x1 = self.body.AbbreviatedTree(trav=trav)
+      L.append(Field('body', x1))
+  
+      assert self.orelse is not None
+      x2 = self.orelse.AbbreviatedTree(trav=trav)
+      L.append(Field('orelse', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Tuple(expr_t):
+    _type_tag = 18
+    __slots__ = ('left', 'elts', 'ctx')
+  
+    def __init__(self, left, elts, ctx):
+      # type: (Token, List[expr_t], expr_context_t) -> None
+      self.left = left
+      self.elts = elts
+      self.ctx = ctx
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Tuple
+      return expr.Tuple(cast(Token, None), [] if alloc_lists else cast('List[expr_t]', None), expr_context_e.Load)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.elts is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.elts))
+        for x1 in self.elts:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      enc.Int(self.ctx)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Tuple
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[expr_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(expr_t.Unmarshal(dec))
+      x2 = expr_context_t(dec.Int())
+      obj = expr.Tuple(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Tuple')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.elts is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.elts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('elts', x1))
+  
+      x2 = hnode.Leaf(expr_context_str(self.ctx), color_e.TypeName)
+      L.append(Field('ctx', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Tuple')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.elts is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.elts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('elts', x1))
+  
+      x2 = hnode.Leaf(expr_context_str(self.ctx), color_e.TypeName)
+      L.append(Field('ctx', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class List(expr_t):
+    _type_tag = 19
+    __slots__ = ('left', 'elts', 'ctx')
+  
+    def __init__(self, left, elts, ctx):
+      # type: (Token, List[expr_t], expr_context_t) -> None
+      self.left = left
+      self.elts = elts
+      self.ctx = ctx
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.List
+      return expr.List(cast(Token, None), [] if alloc_lists else cast('List[expr_t]', None), expr_context_e.Load)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.elts is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.elts))
+        for x1 in self.elts:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      enc.Int(self.ctx)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.List
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[expr_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(expr_t.Unmarshal(dec))
+      x2 = expr_context_t(dec.Int())
+      obj = expr.List(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.List')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.elts is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.elts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('elts', x1))
+  
+      x2 = hnode.Leaf(expr_context_str(self.ctx), color_e.TypeName)
+      L.append(Field('ctx', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.List')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.elts is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.elts:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('elts', x1))
+  
+      x2 = hnode.Leaf(expr_context_str(self.ctx), color_e.TypeName)
+      L.append(Field('ctx', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Dict(expr_t):
+    _type_tag = 20
+    __slots__ = ('left', 'keys', 'values')
+  
+    def __init__(self, left, keys, values):
+      # type: (Token, List[expr_t], List[expr_t]) -> None
+      self.left = left
+      self.keys = keys
+      self.values = values
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Dict
+      return expr.Dict(cast(Token, None), [] if alloc_lists else cast('List[expr_t]', None), [] if alloc_lists else cast('List[expr_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.keys is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.keys))
+        for x1 in self.keys:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      if self.values is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.values))
+        for x2 in self.values:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Dict
+      x0 = Token.Unmarshal(dec)
+      x1 = None  # type: List[expr_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(expr_t.Unmarshal(dec))
+      x2 = None  # type: List[expr_t]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(expr_t.Unmarshal(dec))
+      obj = expr.Dict(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Dict')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.keys is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.keys:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('keys', x1))
+  
+      if self.values is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.values:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('values', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Dict')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      if self.keys is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.keys:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('keys', x1))
+  
+      if self.values is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.values:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('values', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  Implicit = expr__Implicit()
+  
+  class ListComp(expr_t):
+    _type_tag = 22
+    __slots__ = ('left', 'elt', 'generators')
+  
+    def __init__(self, left, elt, generators):
+      # type: (Token, expr_t, List[Comprehension]) -> None
+      self.left = left
+      self.elt = elt
+      self.generators = generators
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.ListComp
+      return expr.ListComp(cast(Token, None), cast(expr_t, None), [] if alloc_lists else cast('List[Comprehension]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.elt is None:
+        enc.Null()
+      else:
+        self.elt.Marshal(enc)
+      if self.generators is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.generators))
+        for x2 in self.generators:
+          if x2 is None:
+            enc.Null()
+          else:
+            x2.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.ListComp
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      x2 = None  # type: List[Comprehension]
+      n = dec.Len()
+      if n != -1:
+        x2 = []
+        for _ in xrange(n):
+          x2.append(Comprehension.Unmarshal(dec))
+      obj = expr.ListComp(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.ListComp')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.elt is not None
+      x1 = self.elt.PrettyTree(trav=trav)
+      L.append(Field('elt', x1))
+  
+      if self.generators is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.generators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.PrettyTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('generators', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.ListComp')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.elt is not None
+      x1 = self.elt.AbbreviatedTree(trav=trav)
+      L.append(Field('elt', x1))
+  
+      if self.generators is not None:  # List
+        x2 = hnode.Array([])
+        for i2 in self.generators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+               i2.AbbreviatedTree(trav=trav))
+          x2.children.append(h)
+        L.append(Field('generators', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class DictComp(expr_t):
+    _type_tag = 23
+    __slots__ = ('left', 'key', 'value', 'generators')
+  
+    def __init__(self, left, key, value, generators):
+      # type: (Token, expr_t, expr_t, List[Comprehension]) -> None
+      self.left = left
+      self.key = key
+      self.value = value
+      self.generators = generators
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.DictComp
+      return expr.DictComp(cast(Token, None), cast(expr_t, None), cast(expr_t, None), [] if alloc_lists else cast('List[Comprehension]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.key is None:
+        enc.Null()
+      else:
+        self.key.Marshal(enc)
+      if self.value is None:
+        enc.Null()
+      else:
+        self.value.Marshal(enc)
+      if self.generators is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.generators))
+        for x3 in self.generators:
+          if x3 is None:
+            enc.Null()
+          else:
+            x3.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.DictComp
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      x2 = expr_t.Unmarshal(dec)
+      x3 = None  # type: List[Comprehension]
+      n = dec.Len()
+      if n != -1:
+        x3 = []
+        for _ in xrange(n):
+          x3.append(Comprehension.Unmarshal(dec))
+      obj = expr.DictComp(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.DictComp')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.key is not None
+      x1 = self.key.PrettyTree(trav=trav)
+      L.append(Field('key', x1))
+  
+      assert self.value is not None
+      x2 = self.value.PrettyTree(trav=trav)
+      L.append(Field('value', x2))
+  
+      if self.generators is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.generators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.PrettyTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('generators', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.DictComp')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.key is not None
+      x1 = self.key.AbbreviatedTree(trav=trav)
+      L.append(Field('key', x1))
+  
+      assert self.value is not None
+      x2 = self.value.AbbreviatedTree(trav=trav)
+      L.append(Field('value', x2))
+  
+      if self.generators is not None:  # List
+        x3 = hnode.Array([])
+        for i3 in self.generators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+               i3.AbbreviatedTree(trav=trav))
+          x3.children.append(h)
+        L.append(Field('generators', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class GeneratorExp(expr_t):
+    _type_tag = 24
+    __slots__ = ('elt', 'generators')
+  
+    def __init__(self, elt, generators):
+      # type: (expr_t, List[Comprehension]) -> None
+      self.elt = elt
+      self.generators = generators
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.GeneratorExp
+      return expr.GeneratorExp(cast(expr_t, None), [] if alloc_lists else cast('List[Comprehension]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.elt is None:
+        enc.Null()
+      else:
+        self.elt.Marshal(enc)
+      if self.generators is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.generators))
+        for x1 in self.generators:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.GeneratorExp
+      x0 = expr_t.Unmarshal(dec)
+      x1 = None  # type: List[Comprehension]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(Comprehension.Unmarshal(dec))
+      obj = expr.GeneratorExp(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.GeneratorExp')
+      L = out_node.fields
+  
+      assert self.elt is not None
+      x0 = self.elt.PrettyTree(trav=trav)
+      L.append(Field('elt', x0))
+  
+      if self.generators is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.generators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('generators', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.GeneratorExp')
+      L = out_node.fields
+      assert self.elt is not None
+      x0 = self.elt.AbbreviatedTree(trav=trav)
+      L.append(Field('elt', x0))
+  
+      if self.generators is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.generators:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('generators', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Range(expr_t):
+    _type_tag = 25
+    __slots__ = ('lower', 'op', 'upper')
+  
+    def __init__(self, lower, op, upper):
+      # type: (expr_t, Token, expr_t) -> None
+      self.lower = lower
+      self.op = op
+      self.upper = upper
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Range
+      return expr.Range(cast(expr_t, None), cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.lower is None:
+        enc.Null()
+      else:
+        self.lower.Marshal(enc)
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.upper is None:
+        enc.Null()
+      else:
+        self.upper.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Range
+      x0 = expr_t.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      x2 = expr_t.Unmarshal(dec)
+      obj = expr.Range(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Range')
+      L = out_node.fields
+  
+      assert self.lower is not None
+      x0 = self.lower.PrettyTree(trav=trav)
+      L.append(Field('lower', x0))
+  
+      assert self.op is not None
+      x1 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x1))
+  
+      assert self.upper is not None
+      x2 = self.upper.PrettyTree(trav=trav)
+      L.append(Field('upper', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Range')
+      L = out_node.fields
+      assert self.lower is not None
+      x0 = self.lower.AbbreviatedTree(trav=trav)
+      L.append(Field('lower', x0))
+  
+      assert self.op is not None
+      x1 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x1))
+  
+      assert self.upper is not None
+      x2 = self.upper.AbbreviatedTree(trav=trav)
+      L.append(Field('upper', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Slice(expr_t):
+    _type_tag = 26
+    __slots__ = ('lower', 'op', 'upper')
+  
+    def __init__(self, lower, op, upper):
+      # type: (Optional[expr_t], Token, Optional[expr_t]) -> None
+      self.lower = lower
+      self.op = op
+      self.upper = upper
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Slice
+      return expr.Slice(cast('Optional[expr_t]', None), cast(Token, None), cast('Optional[expr_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.lower is None:
+        enc.Null()
+      else:
+        self.lower.Marshal(enc)
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      if self.upper is None:
+        enc.Null()
+      else:
+        self.upper.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Slice
+      x0 = expr_t.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      x2 = expr_t.Unmarshal(dec)
+      obj = expr.Slice(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Slice')
+      L = out_node.fields
+  
+      if self.lower is not None:  # Optional
+        x0 = self.lower.PrettyTree(trav=trav)
+        L.append(Field('lower', x0))
+  
+      assert self.op is not None
+      x1 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x1))
+  
+      if self.upper is not None:  # Optional
+        x2 = self.upper.PrettyTree(trav=trav)
+        L.append(Field('upper', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Slice')
+      L = out_node.fields
+      if self.lower is not None:  # Optional
+        x0 = self.lower.AbbreviatedTree(trav=trav)
+        L.append(Field('lower', x0))
+  
+      assert self.op is not None
+      x1 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x1))
+  
+      if self.upper is not None:  # Optional
+        x2 = self.upper.AbbreviatedTree(trav=trav)
+        L.append(Field('upper', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Spread(expr_t):
+    _type_tag = 29
+    __slots__ = ('left', 'child')
+  
+    def __init__(self, left, child):
+      # type: (Token, expr_t) -> None
+      self.left = left
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Spread
+      return expr.Spread(cast(Token, None), cast(expr_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> expr.Spread
+      x0 = Token.Unmarshal(dec)
+      x1 = expr_t.Unmarshal(dec)
+      obj = expr.Spread(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Spread')
+      L = out_node.fields
+  
+      assert self.left is not None
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('expr.Spread')
+      L = out_node.fields
+      assert self.left is not None
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class class_literal_term_e(object):
+  PosixClass = 99
+  PerlClass = 100
+  CharRange = 102
+  CharCode = 101
+  SingleQuoted = 72
+  Splice = 6
+
+_class_literal_term_str = {
+  6: 'Splice',
+  72: 'SingleQuoted',
+  99: 'PosixClass',
+  100: 'PerlClass',
+  101: 'CharCode',
+  102: 'CharRange',
+}
+
+def class_literal_term_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _class_literal_term_str[tag]
+  if dot:
+    return "class_literal_term.%s" % v
+  else:
+    return v
+
+class class_literal_term_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> class_literal_term_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('class_literal_term_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('class_literal_term_t', dec.Ref())
+    if tag == class_literal_term_e.PosixClass:
+      return PosixClass.UnmarshalNew(dec)
+    if tag == class_literal_term_e.PerlClass:
+      return PerlClass.UnmarshalNew(dec)
+    if tag == class_literal_term_e.CharRange:
+      return CharRange.UnmarshalNew(dec)
+    if tag == class_literal_term_e.CharCode:
+      return CharCode.UnmarshalNew(dec)
+    if tag == class_literal_term_e.SingleQuoted:
+      return SingleQuoted.UnmarshalNew(dec)
+    if tag == class_literal_term_e.Splice:
+      return class_literal_term.Splice.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('class_literal_term_t', None)
+  pass
+
+class class_literal_term(object):
+  class Splice(class_literal_term_t):
+    _type_tag = 6
+    __slots__ = ('name', 'var_name')
+  
+    def __init__(self, name, var_name):
+      # type: (Token, str) -> None
+      self.name = name
+      self.var_name = var_name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> class_literal_term.Splice
+      return class_literal_term.Splice(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.name is None:
+        enc.Null()
+      else:
+        self.name.Marshal(enc)
+      enc.Str(self.var_name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> class_literal_term.Splice
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = class_literal_term.Splice(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('class_literal_term.Splice')
+      L = out_node.fields
+  
+      assert self.name is not None
+      x0 = self.name.PrettyTree(trav=trav)
+      L.append(Field('name', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('class_literal_term.Splice')
+      L = out_node.fields
+      assert self.name is not None
+      x0 = self.name.AbbreviatedTree(trav=trav)
+      L.append(Field('name', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class char_class_term_e(object):
+  PosixClass = 99
+  PerlClass = 100
+  CharRange = 102
+  CharCode = 101
+
+_char_class_term_str = {
+  99: 'PosixClass',
+  100: 'PerlClass',
+  101: 'CharCode',
+  102: 'CharRange',
+}
+
+def char_class_term_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _char_class_term_str[tag]
+  if dot:
+    return "char_class_term.%s" % v
+  else:
+    return v
+
+class char_class_term_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> char_class_term_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('char_class_term_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('char_class_term_t', dec.Ref())
+    if tag == char_class_term_e.PosixClass:
+      return PosixClass.UnmarshalNew(dec)
+    if tag == char_class_term_e.PerlClass:
+      return PerlClass.UnmarshalNew(dec)
+    if tag == char_class_term_e.CharRange:
+      return CharRange.UnmarshalNew(dec)
+    if tag == char_class_term_e.CharCode:
+      return CharCode.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('char_class_term_t', None)
+  pass
+
+class char_class_term(object):
+  pass
+
+class re_repeat_e(object):
+  Op = 67
+  Range = 2
+
+_re_repeat_str = {
+  2: 'Range',
+  67: 'Op',
+}
+
+def re_repeat_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _re_repeat_str[tag]
+  if dot:
+    return "re_repeat.%s" % v
+  else:
+    return v
+
+class re_repeat_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> re_repeat_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('re_repeat_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('re_repeat_t', dec.Ref())
+    if tag == re_repeat_e.Op:
+      return Token.UnmarshalNew(dec)
+    if tag == re_repeat_e.Range:
+      return re_repeat.Range.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('re_repeat_t', None)
+  pass
+
+class re_repeat(object):
+  class Range(re_repeat_t):
+    _type_tag = 2
+    __slots__ = ('left', 'lower', 'upper', 'right')
+  
+    def __init__(self, left, lower, upper, right):
+      # type: (Optional[Token], str, str, Optional[Token]) -> None
+      self.left = left
+      self.lower = lower
+      self.upper = upper
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re_repeat.Range
+      return re_repeat.Range(cast('Optional[Token]', None), '', '', cast('Optional[Token]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.left is None:
+        enc.Null()
+      else:
+        self.left.Marshal(enc)
+      enc.Str(self.lower)
+      enc.Str(self.upper)
+      if self.right is None:
+        enc.Null()
+      else:
+        self.right.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re_repeat.Range
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      x2 = dec.Str()
+      x3 = Token.Unmarshal(dec)
+      obj = re_repeat.Range(x0, x1, x2, x3)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re_repeat.Range')
+      L = out_node.fields
+  
+      if self.left is not None:  # Optional
+        x0 = self.left.PrettyTree(trav=trav)
+        L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.lower, color_e.StringConst)
+      L.append(Field('lower', x1))
+  
+      x2 = NewLeaf(self.upper, color_e.StringConst)
+      L.append(Field('upper', x2))
+  
+      if self.right is not None:  # Optional
+        x3 = self.right.PrettyTree(trav=trav)
+        L.append(Field('right', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re_repeat.Range')
+      L = out_node.fields
+      if self.left is not None:  # Optional
+        x0 = self.left.AbbreviatedTree(trav=trav)
+        L.append(Field('left', x0))
+  
+      x1 = NewLeaf(self.lower, color_e.StringConst)
+      L.append(Field('lower', x1))
+  
+      x2 = NewLeaf(self.upper, color_e.StringConst)
+      L.append(Field('upper', x2))
+  
+      if self.right is not None:  # Optional
+        x3 = self.right.AbbreviatedTree(trav=trav)
+        L.append(Field('right', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class re_e(object):
+  Primitive = 1
+  PosixClass = 99
+  PerlClass = 100
+  CharClassLiteral = 4
+  CharClass = 5
+  Splice = 6
+  SingleQuoted = 72
+  Repeat = 8
+  Seq = 9
+  Alt = 10
+  Group = 11
+  Capture = 12
+  Backtracking = 13
+  LiteralChars = 14
+
+_re_str = {
+  1: 'Primitive',
+  4: 'CharClassLiteral',
+  5: 'CharClass',
+  6: 'Splice',
+  8: 'Repeat',
+  9: 'Seq',
+  10: 'Alt',
+  11: 'Group',
+  12: 'Capture',
+  13: 'Backtracking',
+  14: 'LiteralChars',
+  72: 'SingleQuoted',
+  99: 'PosixClass',
+  100: 'PerlClass',
+}
+
+def re_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _re_str[tag]
+  if dot:
+    return "re.%s" % v
+  else:
+    return v
+
+class re_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    raise NotImplementedError()
+  
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> re_t
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('re_t', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('re_t', dec.Ref())
+    if tag == re_e.Primitive:
+      return re.Primitive.UnmarshalNew(dec)
+    if tag == re_e.PosixClass:
+      return PosixClass.UnmarshalNew(dec)
+    if tag == re_e.PerlClass:
+      return PerlClass.UnmarshalNew(dec)
+    if tag == re_e.CharClassLiteral:
+      return re.CharClassLiteral.UnmarshalNew(dec)
+    if tag == re_e.CharClass:
+      return re.CharClass.UnmarshalNew(dec)
+    if tag == re_e.Splice:
+      return re.Splice.UnmarshalNew(dec)
+    if tag == re_e.SingleQuoted:
+      return SingleQuoted.UnmarshalNew(dec)
+    if tag == re_e.Repeat:
+      return re.Repeat.UnmarshalNew(dec)
+    if tag == re_e.Seq:
+      return re.Seq.UnmarshalNew(dec)
+    if tag == re_e.Alt:
+      return re.Alt.UnmarshalNew(dec)
+    if tag == re_e.Group:
+      return re.Group.UnmarshalNew(dec)
+    if tag == re_e.Capture:
+      return re.Capture.UnmarshalNew(dec)
+    if tag == re_e.Backtracking:
+      return re.Backtracking.UnmarshalNew(dec)
+    if tag == re_e.LiteralChars:
+      return re.LiteralChars.UnmarshalNew(dec)
+    dec.BadTag(tag)
+    return cast('re_t', None)
+  pass
+
+class re(object):
+  class Primitive(re_t):
+    _type_tag = 1
+    __slots__ = ('blame_tok', 'id')
+  
+    def __init__(self, blame_tok, id):
+      # type: (Token, Id_t) -> None
+      self.blame_tok = blame_tok
+      self.id = id
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Primitive
+      return re.Primitive(cast(Token, None), -1)
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.blame_tok is None:
+        enc.Null()
+      else:
+        self.blame_tok.Marshal(enc)
+      enc.Int(self.id)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Primitive
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Int()
+      obj = re.Primitive(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Primitive')
+      L = out_node.fields
+  
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.PrettyTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Primitive')
+      L = out_node.fields
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+      L.append(Field('id', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class CharClassLiteral(re_t):
+    _type_tag = 4
+    __slots__ = ('negated', 'terms')
+  
+    def __init__(self, negated, terms):
+      # type: (bool, List[class_literal_term_t]) -> None
+      self.negated = negated
+      self.terms = terms
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.CharClassLiteral
+      return re.CharClassLiteral(False, [] if alloc_lists else cast('List[class_literal_term_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Bool(self.negated)
+      if self.terms is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.terms))
+        for x1 in self.terms:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.CharClassLiteral
+      x0 = dec.Bool()
+      x1 = None  # type: List[class_literal_term_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(class_literal_term_t.Unmarshal(dec))
+      obj = re.CharClassLiteral(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.CharClassLiteral')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      if self.terms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.terms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('terms', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.CharClassLiteral')
+      L = out_node.fields
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      if self.terms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.terms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('terms', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class CharClass(re_t):
+    _type_tag = 5
+    __slots__ = ('negated', 'terms')
+  
+    def __init__(self, negated, terms):
+      # type: (bool, List[char_class_term_t]) -> None
+      self.negated = negated
+      self.terms = terms
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.CharClass
+      return re.CharClass(False, [] if alloc_lists else cast('List[char_class_term_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Bool(self.negated)
+      if self.terms is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.terms))
+        for x1 in self.terms:
+          if x1 is None:
+            enc.Null()
+          else:
+            x1.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.CharClass
+      x0 = dec.Bool()
+      x1 = None  # type: List[char_class_term_t]
+      n = dec.Len()
+      if n != -1:
+        x1 = []
+        for _ in xrange(n):
+          x1.append(char_class_term_t.Unmarshal(dec))
+      obj = re.CharClass(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.CharClass')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      if self.terms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.terms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.PrettyTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('terms', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.CharClass')
+      L = out_node.fields
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      if self.terms is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.terms:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+               i1.AbbreviatedTree(trav=trav))
+          x1.children.append(h)
+        L.append(Field('terms', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Splice(re_t):
+    _type_tag = 6
+    __slots__ = ('name', 'var_name')
+  
+    def __init__(self, name, var_name):
+      # type: (Token, str) -> None
+      self.name = name
+      self.var_name = var_name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Splice
+      return re.Splice(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.name is None:
+        enc.Null()
+      else:
+        self.name.Marshal(enc)
+      enc.Str(self.var_name)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Splice
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = re.Splice(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Splice')
+      L = out_node.fields
+  
+      assert self.name is not None
+      x0 = self.name.PrettyTree(trav=trav)
+      L.append(Field('name', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Splice')
+      L = out_node.fields
+      assert self.name is not None
+      x0 = self.name.AbbreviatedTree(trav=trav)
+      L.append(Field('name', x0))
+  
+      x1 = NewLeaf(self.var_name, color_e.StringConst)
+      L.append(Field('var_name', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Repeat(re_t):
+    _type_tag = 8
+    __slots__ = ('child', 'op')
+  
+    def __init__(self, child, op):
+      # type: (re_t, re_repeat_t) -> None
+      self.child = child
+      self.op = op
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Repeat
+      return re.Repeat(cast(re_t, None), cast(re_repeat_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.op is None:
+        enc.Null()
+      else:
+        self.op.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Repeat
+      x0 = re_t.Unmarshal(dec)
+      x1 = re_repeat_t.Unmarshal(dec)
+      obj = re.Repeat(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Repeat')
+      L = out_node.fields
+  
+      assert self.child is not None
+      x0 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      assert self.op is not None
+      x1 = self.op.PrettyTree(trav=trav)
+      L.append(Field('op', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Repeat')
+      L = out_node.fields
+      assert self.child is not None
+      x0 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      assert self.op is not None
+      x1 = self.op.AbbreviatedTree(trav=trav)
+      L.append(Field('op', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Seq(re_t):
+    _type_tag = 9
+    __slots__ = ('children',)
+  
+    def __init__(self, children):
+      # type: (List[re_t]) -> None
+      self.children = children
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Seq
+      return re.Seq([] if alloc_lists else cast('List[re_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.children is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.children))
+        for x0 in self.children:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Seq
+      x0 = None  # type: List[re_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(re_t.Unmarshal(dec))
+      obj = re.Seq(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Seq')
+      L = out_node.fields
+  
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Seq')
+      L = out_node.fields
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Alt(re_t):
+    _type_tag = 10
+    __slots__ = ('children',)
+  
+    def __init__(self, children):
+      # type: (List[re_t]) -> None
+      self.children = children
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Alt
+      return re.Alt([] if alloc_lists else cast('List[re_t]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.children is None:
+        enc.Len(-1)
+      else:
+        enc.Len(len(self.children))
+        for x0 in self.children:
+          if x0 is None:
+            enc.Null()
+          else:
+            x0.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Alt
+      x0 = None  # type: List[re_t]
+      n = dec.Len()
+      if n != -1:
+        x0 = []
+        for _ in xrange(n):
+          x0.append(re_t.Unmarshal(dec))
+      obj = re.Alt(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Alt')
+      L = out_node.fields
+  
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.PrettyTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Alt')
+      L = out_node.fields
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+               i0.AbbreviatedTree(trav=trav))
+          x0.children.append(h)
+        L.append(Field('children', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Group(re_t):
+    _type_tag = 11
+    __slots__ = ('child',)
+  
+    def __init__(self, child):
+      # type: (re_t) -> None
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Group
+      return re.Group(cast(re_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Group
+      x0 = re_t.Unmarshal(dec)
+      obj = re.Group(x0)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Group')
+      L = out_node.fields
+  
+      assert self.child is not None
+      x0 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Group')
+      L = out_node.fields
+      assert self.child is not None
+      x0 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Capture(re_t):
+    _type_tag = 12
+    __slots__ = ('child', 'name', 'func_name')
+  
+    def __init__(self, child, name, func_name):
+      # type: (re_t, Optional[Token], Optional[Token]) -> None
+      self.child = child
+      self.name = name
+      self.func_name = func_name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Capture
+      return re.Capture(cast(re_t, None), cast('Optional[Token]', None), cast('Optional[Token]', None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      if self.name is None:
+        enc.Null()
+      else:
+        self.name.Marshal(enc)
+      if self.func_name is None:
+        enc.Null()
+      else:
+        self.func_name.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Capture
+      x0 = re_t.Unmarshal(dec)
+      x1 = Token.Unmarshal(dec)
+      x2 = Token.Unmarshal(dec)
+      obj = re.Capture(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Capture')
+      L = out_node.fields
+  
+      assert self.child is not None
+      x0 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      if self.name is not None:  # Optional
+        x1 = self.name.PrettyTree(trav=trav)
+        L.append(Field('name', x1))
+  
+      if self.func_name is not None:  # Optional
+        x2 = self.func_name.PrettyTree(trav=trav)
+        L.append(Field('func_name', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Capture')
+      L = out_node.fields
+      assert self.child is not None
+      x0 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x0))
+  
+      if self.name is not None:  # Optional
+        x1 = self.name.AbbreviatedTree(trav=trav)
+        L.append(Field('name', x1))
+  
+      if self.func_name is not None:  # Optional
+        x2 = self.func_name.AbbreviatedTree(trav=trav)
+        L.append(Field('func_name', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class Backtracking(re_t):
+    _type_tag = 13
+    __slots__ = ('negated', 'name', 'child')
+  
+    def __init__(self, negated, name, child):
+      # type: (bool, Token, re_t) -> None
+      self.negated = negated
+      self.name = name
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.Backtracking
+      return re.Backtracking(False, cast(Token, None), cast(re_t, None))
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      enc.Bool(self.negated)
+      if self.name is None:
+        enc.Null()
+      else:
+        self.name.Marshal(enc)
+      if self.child is None:
+        enc.Null()
+      else:
+        self.child.Marshal(enc)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.Backtracking
+      x0 = dec.Bool()
+      x1 = Token.Unmarshal(dec)
+      x2 = re_t.Unmarshal(dec)
+      obj = re.Backtracking(x0, x1, x2)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Backtracking')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      assert self.name is not None
+      x1 = self.name.PrettyTree(trav=trav)
+      L.append(Field('name', x1))
+  
+      assert self.child is not None
+      x2 = self.child.PrettyTree(trav=trav)
+      L.append(Field('child', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.Backtracking')
+      L = out_node.fields
+      x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+      L.append(Field('negated', x0))
+  
+      assert self.name is not None
+      x1 = self.name.AbbreviatedTree(trav=trav)
+      L.append(Field('name', x1))
+  
+      assert self.child is not None
+      x2 = self.child.AbbreviatedTree(trav=trav)
+      L.append(Field('child', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  class LiteralChars(re_t):
+    _type_tag = 14
+    __slots__ = ('blame_tok', 's')
+  
+    def __init__(self, blame_tok, s):
+      # type: (Token, str) -> None
+      self.blame_tok = blame_tok
+      self.s = s
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> re.LiteralChars
+      return re.LiteralChars(cast(Token, None), '')
+  
+    def Marshal(self, enc):
+      # type: (runtime.Encoder) -> None
+      heap_id = id(self)
+      if not enc.Begin(heap_id, self._type_tag):
+        return
+      if self.blame_tok is None:
+        enc.Null()
+      else:
+        self.blame_tok.Marshal(enc)
+      enc.Str(self.s)
+      enc.End(heap_id)
+  
+    @staticmethod
+    def UnmarshalNew(dec):
+      # type: (runtime.Decoder) -> re.LiteralChars
+      x0 = Token.Unmarshal(dec)
+      x1 = dec.Str()
+      obj = re.LiteralChars(x0, x1)
+      dec.Register(obj)
+      return obj
+  
+    def PrettyTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.LiteralChars')
+      L = out_node.fields
+  
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.PrettyTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      trav = trav or TraversalState()
+      heap_id = id(self)
+      if heap_id in trav.seen:
+        return hnode.AlreadySeen(heap_id)
+      trav.seen[heap_id] = True
+      out_node = NewRecord('re.LiteralChars')
+      L = out_node.fields
+      assert self.blame_tok is not None
+      x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('blame_tok', x0))
+  
+      x1 = NewLeaf(self.s, color_e.StringConst)
+      L.append(Field('s', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self, trav=None):
+      # type: (Optional[TraversalState]) -> hnode_t
+      return self._AbbreviatedTree(trav=trav)
+  
+  pass
+
+class BoolParamBox(pybase.CompoundObj):
+  _type_tag = 64
+  __slots__ = ('b',)
+
+  def __init__(self, b):
+    # type: (bool) -> None
+    self.b = b
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> BoolParamBox
+    return BoolParamBox(False)
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.Bool(self.b)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> BoolParamBox
+    x0 = dec.Bool()
+    obj = BoolParamBox(x0)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> BoolParamBox
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('BoolParamBox', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('BoolParamBox', dec.Ref())
+    if tag != BoolParamBox._type_tag:
+      dec.BadTag(tag)
+      return cast('BoolParamBox', None)
+    return BoolParamBox.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('BoolParamBox')
+    L = out_node.fields
+
+    x0 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(Field('b', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('BoolParamBox')
+    L = out_node.fields
+    x0 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(Field('b', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class IntParamBox(pybase.CompoundObj):
+  _type_tag = 65
+  __slots__ = ('i',)
+
+  def __init__(self, i):
+    # type: (int) -> None
+    self.i = i
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> IntParamBox
+    return IntParamBox(-1)
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.Int(self.i)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> IntParamBox
+    x0 = dec.Int()
+    obj = IntParamBox(x0)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> IntParamBox
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('IntParamBox', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('IntParamBox', dec.Ref())
+    if tag != IntParamBox._type_tag:
+      dec.BadTag(tag)
+      return cast('IntParamBox', None)
+    return IntParamBox.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('IntParamBox')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(Field('i', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('IntParamBox')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(Field('i', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class SourceLine(pybase.CompoundObj):
+  _type_tag = 66
+  __slots__ = ('line_num', 'content', 'src')
+
+  def __init__(self, line_num, content, src):
+    # type: (int, str, source_t) -> None
+    self.line_num = line_num
+    self.content = content
+    self.src = src
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> SourceLine
+    return SourceLine(-1, '', cast(source_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.Int(self.line_num)
+    enc.Str(self.content)
+    if self.src is None:
+      enc.Null()
+    else:
+      self.src.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> SourceLine
+    x0 = dec.Int()
+    x1 = dec.Str()
+    x2 = source_t.Unmarshal(dec)
+    obj = SourceLine(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> SourceLine
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('SourceLine', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('SourceLine', dec.Ref())
+    if tag != SourceLine._type_tag:
+      dec.BadTag(tag)
+      return cast('SourceLine', None)
+    return SourceLine.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('SourceLine')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.line_num), color_e.OtherConst)
+    L.append(Field('line_num', x0))
+
+    x1 = NewLeaf(self.content, color_e.StringConst)
+    L.append(Field('content', x1))
+
+    assert self.src is not None
+    x2 = self.src.PrettyTree(trav=trav)
+    L.append(Field('src', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('SourceLine')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.line_num), color_e.OtherConst)
+    L.append(Field('line_num', x0))
+
+    x1 = NewLeaf(self.content, color_e.StringConst)
+    L.append(Field('content', x1))
+
+    assert self.src is not None
+    x2 = self.src.AbbreviatedTree(trav=trav)
+    L.append(Field('src', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Token(loc_t, suffix_op_t, word_part_t, word_t, arith_expr_t,
+            printf_part_t, y_lhs_t, re_repeat_t):
+  _type_tag = 67
+  __slots__ = ('id', 'length', 'col', 'line', 'tval')
+
+  def __init__(self, id, length, col, line, tval):
+    # type: (Id_t, int, int, Optional[SourceLine], Optional[str]) -> None
+    self.id = id
+    self.length = length
+    self.col = col
+    self.line = line
+    self.tval = tval
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Token
+    return Token(-1, cast(int, None), -1, cast('Optional[SourceLine]', None), cast('Optional[str]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.Int(self.id)
+    enc.Int(self.length)
+    enc.Int(self.col)
+    if self.line is None:
+      enc.Null()
+    else:
+      self.line.Marshal(enc)
+    enc.Str(self.tval)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Token
+    x0 = dec.Int()
+    x1 = dec.Int()
+    x2 = dec.Int()
+    x3 = SourceLine.Unmarshal(dec)
+    x4 = dec.Str()
+    obj = Token(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Token
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Token', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Token', dec.Ref())
+    if tag != Token._type_tag:
+      dec.BadTag(tag)
+      return cast('Token', None)
+    return Token.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Token')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+    L.append(Field('id', x0))
+
+    x1 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(Field('length', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(Field('col', x2))
+
+    if self.line is not None:  # Optional
+      x3 = self.line.PrettyTree(trav=trav)
+      L.append(Field('line', x3))
+
+    if self.tval is not None:  # Optional
+      x4 = NewLeaf(self.tval, color_e.StringConst)
+      L.append(Field('tval', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Token')
+    L = out_node.fields
+    x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+    L.append(Field('id', x0))
+
+    x1 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(Field('length', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(Field('col', x2))
+
+    if self.line is not None:  # Optional
+      x3 = self.line.AbbreviatedTree(trav=trav)
+      L.append(Field('line', x3))
+
+    if self.tval is not None:  # Optional
+      x4 = NewLeaf(self.tval, color_e.StringConst)
+      L.append(Field('tval', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    p = _Token(self)
+    return p if p else self._AbbreviatedTree(trav=trav)
+
+class WideToken(pybase.CompoundObj):
+  _type_tag = 68
+  __slots__ = ('id', 'length', 'col', 'line', 'tval')
+
+  def __init__(self, id, length, col, line, tval):
+    # type: (Id_t, int, int, Optional[SourceLine], Optional[str]) -> None
+    self.id = id
+    self.length = length
+    self.col = col
+    self.line = line
+    self.tval = tval
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> WideToken
+    return WideToken(-1, -1, -1, cast('Optional[SourceLine]', None), cast('Optional[str]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.Int(self.id)
+    enc.Int(self.length)
+    enc.Int(self.col)
+    if self.line is None:
+      enc.Null()
+    else:
+      self.line.Marshal(enc)
+    enc.Str(self.tval)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> WideToken
+    x0 = dec.Int()
+    x1 = dec.Int()
+    x2 = dec.Int()
+    x3 = SourceLine.Unmarshal(dec)
+    x4 = dec.Str()
+    obj = WideToken(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> WideToken
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('WideToken', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('WideToken', dec.Ref())
+    if tag != WideToken._type_tag:
+      dec.BadTag(tag)
+      return cast('WideToken', None)
+    return WideToken.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('WideToken')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+    L.append(Field('id', x0))
+
+    x1 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(Field('length', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(Field('col', x2))
+
+    if self.line is not None:  # Optional
+      x3 = self.line.PrettyTree(trav=trav)
+      L.append(Field('line', x3))
+
+    if self.tval is not None:  # Optional
+      x4 = NewLeaf(self.tval, color_e.StringConst)
+      L.append(Field('tval', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('WideToken')
+    L = out_node.fields
+    x0 = hnode.Leaf(Id_str(self.id), color_e.UserType)
+    L.append(Field('id', x0))
+
+    x1 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(Field('length', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(Field('col', x2))
+
+    if self.line is not None:  # Optional
+      x3 = self.line.AbbreviatedTree(trav=trav)
+      L.append(Field('line', x3))
+
+    if self.tval is not None:  # Optional
+      x4 = NewLeaf(self.tval, color_e.StringConst)
+      L.append(Field('tval', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class CompoundWord(loc_t, rhs_word_t, word_t, arith_expr_t, redir_param_t):
+  _type_tag = 69
+  __slots__ = ('parts', 'shape')
+
+  def __init__(self, parts, shape):
+    # type: (List[word_part_t], word_shape_t) -> None
+    self.parts = parts
+    self.shape = shape
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> CompoundWord
+    return CompoundWord([] if alloc_lists else cast('List[word_part_t]', None), word_shape_e.Unknown)
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.parts is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.parts))
+      for x0 in self.parts:
+        if x0 is None:
+          enc.Null()
+        else:
+          x0.Marshal(enc)
+    enc.Int(self.shape)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> CompoundWord
+    x0 = None  # type: List[word_part_t]
+    n = dec.Len()
+    if n != -1:
+      x0 = []
+      for _ in xrange(n):
+        x0.append(word_part_t.Unmarshal(dec))
+    x1 = word_shape_t(dec.Int())
+    obj = CompoundWord(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> CompoundWord
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('CompoundWord', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('CompoundWord', dec.Ref())
+    if tag != CompoundWord._type_tag:
+      dec.BadTag(tag)
+      return cast('CompoundWord', None)
+    return CompoundWord.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CompoundWord')
+    L = out_node.fields
+
+    if self.parts is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.parts:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+             i0.PrettyTree(trav=trav))
+        x0.children.append(h)
+      L.append(Field('parts', x0))
+
+    x1 = hnode.Leaf(word_shape_str(self.shape), color_e.TypeName)
+    L.append(Field('shape', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CompoundWord')
+    L = out_node.fields
+    if self.parts is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.parts:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+             i0.AbbreviatedTree(trav=trav))
+        x0.children.append(h)
+      L.append(Field('parts', x0))
+
+    x1 = hnode.Leaf(word_shape_str(self.shape), color_e.TypeName)
+    L.append(Field('shape', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    p = _CompoundWord(self)
+    return p if p else self._AbbreviatedTree(trav=trav)
+
+class BracedVarSub(word_part_t, expr_t):
+  _type_tag = 70
+  __slots__ = ('left', 'token', 'var_name', 'prefix_op', 'bracket_op',
+               'suffix_op', 'right')
+
+  def __init__(self, left, token, var_name, prefix_op, bracket_op, suffix_op,
+               right):
+    # type: (Token, Token, str, Optional[Token], Optional[bracket_op_t], Optional[suffix_op_t], Token) -> None
+    self.left = left
+    self.token = token
+    self.var_name = var_name
+    self.prefix_op = prefix_op
+    self.bracket_op = bracket_op
+    self.suffix_op = suffix_op
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> BracedVarSub
+    return BracedVarSub(cast(Token, None), cast(Token, None), '', cast('Optional[Token]', None), cast('Optional[bracket_op_t]', None), cast('Optional[suffix_op_t]', None), cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.token is None:
+      enc.Null()
+    else:
+      self.token.Marshal(enc)
+    enc.Str(self.var_name)
+    if self.prefix_op is None:
+      enc.Null()
+    else:
+      self.prefix_op.Marshal(enc)
+    if self.bracket_op is None:
+      enc.Null()
+    else:
+      self.bracket_op.Marshal(enc)
+    if self.suffix_op is None:
+      enc.Null()
+    else:
+      self.suffix_op.Marshal(enc)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> BracedVarSub
+    x0 = Token.Unmarshal(dec)
+    x1 = Token.Unmarshal(dec)
+    x2 = dec.Str()
+    x3 = Token.Unmarshal(dec)
+    x4 = bracket_op_t.Unmarshal(dec)
+    x5 = suffix_op_t.Unmarshal(dec)
+    x6 = Token.Unmarshal(dec)
+    obj = BracedVarSub(x0, x1, x2, x3, x4, x5, x6)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> BracedVarSub
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('BracedVarSub', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('BracedVarSub', dec.Ref())
+    if tag != BracedVarSub._type_tag:
+      dec.BadTag(tag)
+      return cast('BracedVarSub', None)
+    return BracedVarSub.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('BracedVarSub')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.token is not None
+    x1 = self.token.PrettyTree(trav=trav)
+    L.append(Field('token', x1))
+
+    x2 = NewLeaf(self.var_name, color_e.StringConst)
+    L.append(Field('var_name', x2))
+
+    if self.prefix_op is not None:  # Optional
+      x3 = self.prefix_op.PrettyTree(trav=trav)
+      L.append(Field('prefix_op', x3))
+
+    if self.bracket_op is not None:  # Optional
+      x4 = self.bracket_op.PrettyTree(trav=trav)
+      L.append(Field('bracket_op', x4))
+
+    if self.suffix_op is not None:  # Optional
+      x5 = self.suffix_op.PrettyTree(trav=trav)
+      L.append(Field('suffix_op', x5))
+
+    assert self.right is not None
+    x6 = self.right.PrettyTree(trav=trav)
+    L.append(Field('right', x6))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('BracedVarSub')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.token is not None
+    x1 = self.token.AbbreviatedTree(trav=trav)
+    L.append(Field('token', x1))
+
+    x2 = NewLeaf(self.var_name, color_e.StringConst)
+    L.append(Field('var_name', x2))
+
+    if self.prefix_op is not None:  # Optional
+      x3 = self.prefix_op.AbbreviatedTree(trav=trav)
+      L.append(Field('prefix_op', x3))
+
+    if self.bracket_op is not None:  # Optional
+      x4 = self.bracket_op.AbbreviatedTree(trav=trav)
+      L.append(Field('bracket_op', x4))
+
+    if self.suffix_op is not None:  # Optional
+      x5 = self.suffix_op.AbbreviatedTree(trav=trav)
+      L.append(Field('suffix_op', x5))
+
+    assert self.right is not None
+    x6 = self.right.AbbreviatedTree(trav=trav)
+    L.append(Field('right', x6))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    p = _BracedVarSub(self)
+    return p if p else self._AbbreviatedTree(trav=trav)
+
+class DoubleQuoted(word_part_t, expr_t):
+  _type_tag = 71
+  __slots__ = ('left', 'parts', 'right')
+
+  def __init__(self, left, parts, right):
+    # type: (Token, List[word_part_t], Token) -> None
+    self.left = left
+    self.parts = parts
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> DoubleQuoted
+    return DoubleQuoted(cast(Token, None), [] if alloc_lists else cast('List[word_part_t]', None), cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.parts is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.parts))
+      for x1 in self.parts:
+        if x1 is None:
+          enc.Null()
+        else:
+          x1.Marshal(enc)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> DoubleQuoted
+    x0 = Token.Unmarshal(dec)
+    x1 = None  # type: List[word_part_t]
+    n = dec.Len()
+    if n != -1:
+      x1 = []
+      for _ in xrange(n):
+        x1.append(word_part_t.Unmarshal(dec))
+    x2 = Token.Unmarshal(dec)
+    obj = DoubleQuoted(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> DoubleQuoted
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('DoubleQuoted', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('DoubleQuoted', dec.Ref())
+    if tag != DoubleQuoted._type_tag:
+      dec.BadTag(tag)
+      return cast('DoubleQuoted', None)
+    return DoubleQuoted.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('DoubleQuoted')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.parts is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.parts:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.PrettyTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('parts', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('DoubleQuoted')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.parts is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.parts:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.AbbreviatedTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('parts', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    p = _DoubleQuoted(self)
+    return p if p else self._AbbreviatedTree(trav=trav)
+
+class SingleQuoted(word_part_t, expr_t, class_literal_term_t, re_t):
+  _type_tag = 72
+  __slots__ = ('left', 'sval', 'right')
+
+  def __init__(self, left, sval, right):
+    # type: (Token, str, Token) -> None
+    self.left = left
+    self.sval = sval
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> SingleQuoted
+    return SingleQuoted(cast(Token, None), '', cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    enc.Str(self.sval)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> SingleQuoted
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    x2 = Token.Unmarshal(dec)
+    obj = SingleQuoted(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> SingleQuoted
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('SingleQuoted', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('SingleQuoted', dec.Ref())
+    if tag != SingleQuoted._type_tag:
+      dec.BadTag(tag)
+      return cast('SingleQuoted', None)
+    return SingleQuoted.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('SingleQuoted')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    x1 = NewLeaf(self.sval, color_e.StringConst)
+    L.append(Field('sval', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('SingleQuoted')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    x1 = NewLeaf(self.sval, color_e.StringConst)
+    L.append(Field('sval', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    p = _SingleQuoted(self)
+    return p if p else self._AbbreviatedTree(trav=trav)
+
+class SimpleVarSub(word_part_t, expr_t):
+  _type_tag = 73
+  __slots__ = ('tok',)
+
+  def __init__(self, tok):
+    # type: (Token) -> None
+    self.tok = tok
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> SimpleVarSub
+    return SimpleVarSub(cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.tok is None:
+      enc.Null()
+    else:
+      self.tok.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> SimpleVarSub
+    x0 = Token.Unmarshal(dec)
+    obj = SimpleVarSub(x0)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> SimpleVarSub
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('SimpleVarSub', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('SimpleVarSub', dec.Ref())
+    if tag != SimpleVarSub._type_tag:
+      dec.BadTag(tag)
+      return cast('SimpleVarSub', None)
+    return SimpleVarSub.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('SimpleVarSub')
+    L = out_node.fields
+
+    assert self.tok is not None
+    x0 = self.tok.PrettyTree(trav=trav)
+    L.append(Field('tok', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('SimpleVarSub')
+    L = out_node.fields
+    assert self.tok is not None
+    x0 = self.tok.AbbreviatedTree(trav=trav)
+    L.append(Field('tok', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    p = _SimpleVarSub(self)
+    return p if p else self._AbbreviatedTree(trav=trav)
+
+class CommandSub(word_part_t, expr_t):
+  _type_tag = 74
+  __slots__ = ('left_token', 'child', 'right')
+
+  def __init__(self, left_token, child, right):
+    # type: (Token, command_t, Token) -> None
+    self.left_token = left_token
+    self.child = child
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> CommandSub
+    return CommandSub(cast(Token, None), cast(command_t, None), cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left_token is None:
+      enc.Null()
+    else:
+      self.left_token.Marshal(enc)
+    if self.child is None:
+      enc.Null()
+    else:
+      self.child.Marshal(enc)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> CommandSub
+    x0 = Token.Unmarshal(dec)
+    x1 = command_t.Unmarshal(dec)
+    x2 = Token.Unmarshal(dec)
+    obj = CommandSub(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> CommandSub
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('CommandSub', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('CommandSub', dec.Ref())
+    if tag != CommandSub._type_tag:
+      dec.BadTag(tag)
+      return cast('CommandSub', None)
+    return CommandSub.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CommandSub')
+    L = out_node.fields
+
+    assert self.left_token is not None
+    x0 = self.left_token.PrettyTree(trav=trav)
+    L.append(Field('left_token', x0))
+
+    assert self.child is not None
+    x1 = self.child.PrettyTree(trav=trav)
+    L.append(Field('child', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CommandSub')
+    L = out_node.fields
+    assert self.left_token is not None
+    x0 = self.left_token.AbbreviatedTree(trav=trav)
+    L.append(Field('left_token', x0))
+
+    assert self.child is not None
+    x1 = self.child.AbbreviatedTree(trav=trav)
+    L.append(Field('child', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class ShArrayLiteral(word_part_t, expr_t):
+  _type_tag = 75
+  __slots__ = ('left', 'words', 'right')
+
+  def __init__(self, left, words, right):
+    # type: (Token, List[word_t], Token) -> None
+    self.left = left
+    self.words = words
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> ShArrayLiteral
+    return ShArrayLiteral(cast(Token, None), [] if alloc_lists else cast('List[word_t]', None), cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.words is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.words))
+      for x1 in self.words:
+        if x1 is None:
+          enc.Null()
+        else:
+          x1.Marshal(enc)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> ShArrayLiteral
+    x0 = Token.Unmarshal(dec)
+    x1 = None  # type: List[word_t]
+    n = dec.Len()
+    if n != -1:
+      x1 = []
+      for _ in xrange(n):
+        x1.append(word_t.Unmarshal(dec))
+    x2 = Token.Unmarshal(dec)
+    obj = ShArrayLiteral(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> ShArrayLiteral
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('ShArrayLiteral', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('ShArrayLiteral', dec.Ref())
+    if tag != ShArrayLiteral._type_tag:
+      dec.BadTag(tag)
+      return cast('ShArrayLiteral', None)
+    return ShArrayLiteral.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ShArrayLiteral')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.words is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.words:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.PrettyTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('words', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ShArrayLiteral')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.words is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.words:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.AbbreviatedTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('words', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree(trav=trav)
+    L.append(Field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class ArgList(pybase.CompoundObj):
+  _type_tag = 76
+  __slots__ = ('left', 'pos_args', 'semi_tok', 'named_args', 'semi_tok2',
+               'block_expr', 'right')
+
+  def __init__(self, left, pos_args, semi_tok, named_args, semi_tok2,
+               block_expr, right):
+    # type: (Token, List[expr_t], Optional[Token], List[NamedArg], Optional[Token], Optional[expr_t], Token) -> None
+    self.left = left
+    self.pos_args = pos_args
+    self.semi_tok = semi_tok
+    self.named_args = named_args
+    self.semi_tok2 = semi_tok2
+    self.block_expr = block_expr
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> ArgList
+    return ArgList(cast(Token, None), [] if alloc_lists else cast('List[expr_t]', None), cast('Optional[Token]', None), [] if alloc_lists else cast('List[NamedArg]', None), cast('Optional[Token]', None), cast('Optional[expr_t]', None), cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.pos_args is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.pos_args))
+      for x1 in self.pos_args:
+        if x1 is None:
+          enc.Null()
+        else:
+          x1.Marshal(enc)
+    if self.semi_tok is None:
+      enc.Null()
+    else:
+      self.semi_tok.Marshal(enc)
+    if self.named_args is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.named_args))
+      for x3 in self.named_args:
+        if x3 is None:
+          enc.Null()
+        else:
+          x3.Marshal(enc)
+    if self.semi_tok2 is None:
+      enc.Null()
+    else:
+      self.semi_tok2.Marshal(enc)
+    if self.block_expr is None:
+      enc.Null()
+    else:
+      self.block_expr.Marshal(enc)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> ArgList
+    x0 = Token.Unmarshal(dec)
+    x1 = None  # type: List[expr_t]
+    n = dec.Len()
+    if n != -1:
+      x1 = []
+      for _ in xrange(n):
+        x1.append(expr_t.Unmarshal(dec))
+    x2 = Token.Unmarshal(dec)
+    x3 = None  # type: List[NamedArg]
+    n = dec.Len()
+    if n != -1:
+      x3 = []
+      for _ in xrange(n):
+        x3.append(NamedArg.Unmarshal(dec))
+    x4 = Token.Unmarshal(dec)
+    x5 = expr_t.Unmarshal(dec)
+    x6 = Token.Unmarshal(dec)
+    obj = ArgList(x0, x1, x2, x3, x4, x5, x6)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> ArgList
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('ArgList', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('ArgList', dec.Ref())
+    if tag != ArgList._type_tag:
+      dec.BadTag(tag)
+      return cast('ArgList', None)
+    return ArgList.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ArgList')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.pos_args is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.pos_args:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.PrettyTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('pos_args', x1))
+
+    if self.semi_tok is not None:  # Optional
+      x2 = self.semi_tok.PrettyTree(trav=trav)
+      L.append(Field('semi_tok', x2))
+
+    if self.named_args is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.named_args:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.PrettyTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('named_args', x3))
+
+    if self.semi_tok2 is not None:  # Optional
+      x4 = self.semi_tok2.PrettyTree(trav=trav)
+      L.append(Field('semi_tok2', x4))
+
+    if self.block_expr is not None:  # Optional
+      x5 = self.block_expr.PrettyTree(trav=trav)
+      L.append(Field('block_expr', x5))
+
+    assert self.right is not None
+    x6 = self.right.PrettyTree(trav=trav)
+    L.append(Field('right', x6))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ArgList')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.pos_args is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.pos_args:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.AbbreviatedTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('pos_args', x1))
+
+    if self.semi_tok is not None:  # Optional
+      x2 = self.semi_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('semi_tok', x2))
+
+    if self.named_args is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.named_args:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.AbbreviatedTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('named_args', x3))
+
+    if self.semi_tok2 is not None:  # Optional
+      x4 = self.semi_tok2.AbbreviatedTree(trav=trav)
+      L.append(Field('semi_tok2', x4))
+
+    if self.block_expr is not None:  # Optional
+      x5 = self.block_expr.AbbreviatedTree(trav=trav)
+      L.append(Field('block_expr', x5))
+
+    assert self.right is not None
+    x6 = self.right.AbbreviatedTree(trav=trav)
+    L.append(Field('right', x6))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class AssocPair(pybase.CompoundObj):
+  _type_tag = 77
+  __slots__ = ('key', 'value')
+
+  def __init__(self, key, value):
+    # type: (CompoundWord, CompoundWord) -> None
+    self.key = key
+    self.value = value
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> AssocPair
+    return AssocPair(cast(CompoundWord, None), cast(CompoundWord, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.key is None:
+      enc.Null()
+    else:
+      self.key.Marshal(enc)
+    if self.value is None:
+      enc.Null()
+    else:
+      self.value.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> AssocPair
+    x0 = CompoundWord.Unmarshal(dec)
+    x1 = CompoundWord.Unmarshal(dec)
+    obj = AssocPair(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> AssocPair
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('AssocPair', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('AssocPair', dec.Ref())
+    if tag != AssocPair._type_tag:
+      dec.BadTag(tag)
+      return cast('AssocPair', None)
+    return AssocPair.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('AssocPair')
+    L = out_node.fields
+
+    assert self.key is not None
+    x0 = self.key.PrettyTree(trav=trav)
+    L.append(Field('key', x0))
+
+    assert self.value is not None
+    x1 = self.value.PrettyTree(trav=trav)
+    L.append(Field('value', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('AssocPair')
+    L = out_node.fields
+    assert self.key is not None
+    x0 = self.key.AbbreviatedTree(trav=trav)
+    L.append(Field('key', x0))
+
+    assert self.value is not None
+    x1 = self.value.AbbreviatedTree(trav=trav)
+    L.append(Field('value', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Redir(pybase.CompoundObj):
+  _type_tag = 78
+  __slots__ = ('op', 'loc', 'arg')
+
+  def __init__(self, op, loc, arg):
+    # type: (Token, redir_loc_t, redir_param_t) -> None
+    self.op = op
+    self.loc = loc
+    self.arg = arg
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Redir
+    return Redir(cast(Token, None), cast(redir_loc_t, None), cast(redir_param_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.op is None:
+      enc.Null()
+    else:
+      self.op.Marshal(enc)
+    if self.loc is None:
+      enc.Null()
+    else:
+      self.loc.Marshal(enc)
+    if self.arg is None:
+      enc.Null()
+    else:
+      self.arg.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Redir
+    x0 = Token.Unmarshal(dec)
+    x1 = redir_loc_t.Unmarshal(dec)
+    x2 = redir_param_t.Unmarshal(dec)
+    obj = Redir(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Redir
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Redir', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Redir', dec.Ref())
+    if tag != Redir._type_tag:
+      dec.BadTag(tag)
+      return cast('Redir', None)
+    return Redir.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Redir')
+    L = out_node.fields
+
+    assert self.op is not None
+    x0 = self.op.PrettyTree(trav=trav)
+    L.append(Field('op', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.PrettyTree(trav=trav)
+    L.append(Field('loc', x1))
+
+    assert self.arg is not None
+    x2 = self.arg.PrettyTree(trav=trav)
+    L.append(Field('arg', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Redir')
+    L = out_node.fields
+    assert self.op is not None
+    x0 = self.op.AbbreviatedTree(trav=trav)
+    L.append(Field('op', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.AbbreviatedTree(trav=trav)
+    L.append(Field('loc', x1))
+
+    assert self.arg is not None
+    x2 = self.arg.AbbreviatedTree(trav=trav)
+    L.append(Field('arg', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class AssignPair(pybase.CompoundObj):
+  _type_tag = 79
+  __slots__ = ('left', 'lhs', 'op', 'rhs')
+
+  def __init__(self, left, lhs, op, rhs):
+    # type: (Token, sh_lhs_t, assign_op_t, rhs_word_t) -> None
+    self.left = left
+    self.lhs = lhs
+    self.op = op
+    self.rhs = rhs
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> AssignPair
+    return AssignPair(cast(Token, None), cast(sh_lhs_t, None), assign_op_e.Equal, cast(rhs_word_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.lhs is None:
+      enc.Null()
+    else:
+      self.lhs.Marshal(enc)
+    enc.Int(self.op)
+    if self.rhs is None:
+      enc.Null()
+    else:
+      self.rhs.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> AssignPair
+    x0 = Token.Unmarshal(dec)
+    x1 = sh_lhs_t.Unmarshal(dec)
+    x2 = assign_op_t(dec.Int())
+    x3 = rhs_word_t.Unmarshal(dec)
+    obj = AssignPair(x0, x1, x2, x3)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> AssignPair
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('AssignPair', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('AssignPair', dec.Ref())
+    if tag != AssignPair._type_tag:
+      dec.BadTag(tag)
+      return cast('AssignPair', None)
+    return AssignPair.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('AssignPair')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.lhs is not None
+    x1 = self.lhs.PrettyTree(trav=trav)
+    L.append(Field('lhs', x1))
+
+    x2 = hnode.Leaf(assign_op_str(self.op), color_e.TypeName)
+    L.append(Field('op', x2))
+
+    assert self.rhs is not None
+    x3 = self.rhs.PrettyTree(trav=trav)
+    L.append(Field('rhs', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('AssignPair')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.lhs is not None
+    x1 = self.lhs.AbbreviatedTree(trav=trav)
+    L.append(Field('lhs', x1))
+
+    x2 = hnode.Leaf(assign_op_str(self.op), color_e.TypeName)
+    L.append(Field('op', x2))
+
+    assert self.rhs is not None
+    x3 = self.rhs.AbbreviatedTree(trav=trav)
+    L.append(Field('rhs', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class EnvPair(pybase.CompoundObj):
+  _type_tag = 80
+  __slots__ = ('left', 'name', 'val')
+
+  def __init__(self, left, name, val):
+    # type: (Token, str, rhs_word_t) -> None
+    self.left = left
+    self.name = name
+    self.val = val
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> EnvPair
+    return EnvPair(cast(Token, None), '', cast(rhs_word_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    enc.Str(self.name)
+    if self.val is None:
+      enc.Null()
+    else:
+      self.val.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> EnvPair
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    x2 = rhs_word_t.Unmarshal(dec)
+    obj = EnvPair(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> EnvPair
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('EnvPair', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('EnvPair', dec.Ref())
+    if tag != EnvPair._type_tag:
+      dec.BadTag(tag)
+      return cast('EnvPair', None)
+    return EnvPair.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('EnvPair')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    assert self.val is not None
+    x2 = self.val.PrettyTree(trav=trav)
+    L.append(Field('val', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('EnvPair')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    assert self.val is not None
+    x2 = self.val.AbbreviatedTree(trav=trav)
+    L.append(Field('val', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class CaseArm(pybase.CompoundObj):
+  _type_tag = 81
+  __slots__ = ('left', 'pattern', 'middle', 'action', 'right')
+
+  def __init__(self, left, pattern, middle, action, right):
+    # type: (Token, pat_t, Token, List[command_t], Optional[Token]) -> None
+    self.left = left
+    self.pattern = pattern
+    self.middle = middle
+    self.action = action
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> CaseArm
+    return CaseArm(cast(Token, None), cast(pat_t, None), cast(Token, None), [] if alloc_lists else cast('List[command_t]', None), cast('Optional[Token]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.pattern is None:
+      enc.Null()
+    else:
+      self.pattern.Marshal(enc)
+    if self.middle is None:
+      enc.Null()
+    else:
+      self.middle.Marshal(enc)
+    if self.action is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.action))
+      for x3 in self.action:
+        if x3 is None:
+          enc.Null()
+        else:
+          x3.Marshal(enc)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> CaseArm
+    x0 = Token.Unmarshal(dec)
+    x1 = pat_t.Unmarshal(dec)
+    x2 = Token.Unmarshal(dec)
+    x3 = None  # type: List[command_t]
+    n = dec.Len()
+    if n != -1:
+      x3 = []
+      for _ in xrange(n):
+        x3.append(command_t.Unmarshal(dec))
+    x4 = Token.Unmarshal(dec)
+    obj = CaseArm(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> CaseArm
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('CaseArm', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('CaseArm', dec.Ref())
+    if tag != CaseArm._type_tag:
+      dec.BadTag(tag)
+      return cast('CaseArm', None)
+    return CaseArm.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CaseArm')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.pattern is not None
+    x1 = self.pattern.PrettyTree(trav=trav)
+    L.append(Field('pattern', x1))
+
+    assert self.middle is not None
+    x2 = self.middle.PrettyTree(trav=trav)
+    L.append(Field('middle', x2))
+
+    if self.action is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.action:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.PrettyTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('action', x3))
+
+    if self.right is not None:  # Optional
+      x4 = self.right.PrettyTree(trav=trav)
+      L.append(Field('right', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CaseArm')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.pattern is not None
+    x1 = self.pattern.AbbreviatedTree(trav=trav)
+    L.append(Field('pattern', x1))
+
+    assert self.middle is not None
+    x2 = self.middle.AbbreviatedTree(trav=trav)
+    L.append(Field('middle', x2))
+
+    if self.action is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.action:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.AbbreviatedTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('action', x3))
+
+    if self.right is not None:  # Optional
+      x4 = self.right.AbbreviatedTree(trav=trav)
+      L.append(Field('right', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class EggexFlag(pybase.CompoundObj):
+  _type_tag = 82
+  __slots__ = ('negated', 'flag')
+
+  def __init__(self, negated, flag):
+    # type: (bool, Token) -> None
+    self.negated = negated
+    self.flag = flag
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> EggexFlag
+    return EggexFlag(False, cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    enc.Bool(self.negated)
+    if self.flag is None:
+      enc.Null()
+    else:
+      self.flag.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> EggexFlag
+    x0 = dec.Bool()
+    x1 = Token.Unmarshal(dec)
+    obj = EggexFlag(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> EggexFlag
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('EggexFlag', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('EggexFlag', dec.Ref())
+    if tag != EggexFlag._type_tag:
+      dec.BadTag(tag)
+      return cast('EggexFlag', None)
+    return EggexFlag.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('EggexFlag')
+    L = out_node.fields
+
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(Field('negated', x0))
+
+    assert self.flag is not None
+    x1 = self.flag.PrettyTree(trav=trav)
+    L.append(Field('flag', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('EggexFlag')
+    L = out_node.fields
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(Field('negated', x0))
+
+    assert self.flag is not None
+    x1 = self.flag.AbbreviatedTree(trav=trav)
+    L.append(Field('flag', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Eggex(pat_t, expr_t):
+  _type_tag = 83
+  __slots__ = ('left', 'regex', 'flags', 'trans_pref', 'canonical_flags')
+
+  def __init__(self, left, regex, flags, trans_pref, canonical_flags):
+    # type: (Token, re_t, List[EggexFlag], Optional[Token], Optional[str]) -> None
+    self.left = left
+    self.regex = regex
+    self.flags = flags
+    self.trans_pref = trans_pref
+    self.canonical_flags = canonical_flags
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Eggex
+    return Eggex(cast(Token, None), cast(re_t, None), [] if alloc_lists else cast('List[EggexFlag]', None), cast('Optional[Token]', None), cast('Optional[str]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.regex is None:
+      enc.Null()
+    else:
+      self.regex.Marshal(enc)
+    if self.flags is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.flags))
+      for x2 in self.flags:
+        if x2 is None:
+          enc.Null()
+        else:
+          x2.Marshal(enc)
+    if self.trans_pref is None:
+      enc.Null()
+    else:
+      self.trans_pref.Marshal(enc)
+    enc.Str(self.canonical_flags)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Eggex
+    x0 = Token.Unmarshal(dec)
+    x1 = re_t.Unmarshal(dec)
+    x2 = None  # type: List[EggexFlag]
+    n = dec.Len()
+    if n != -1:
+      x2 = []
+      for _ in xrange(n):
+        x2.append(EggexFlag.Unmarshal(dec))
+    x3 = Token.Unmarshal(dec)
+    x4 = dec.Str()
+    obj = Eggex(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Eggex
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Eggex', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Eggex', dec.Ref())
+    if tag != Eggex._type_tag:
+      dec.BadTag(tag)
+      return cast('Eggex', None)
+    return Eggex.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Eggex')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.regex is not None
+    x1 = self.regex.PrettyTree(trav=trav)
+    L.append(Field('regex', x1))
+
+    if self.flags is not None:  # List
+      x2 = hnode.Array([])
+      for i2 in self.flags:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+             i2.PrettyTree(trav=trav))
+        x2.children.append(h)
+      L.append(Field('flags', x2))
+
+    if self.trans_pref is not None:  # Optional
+      x3 = self.trans_pref.PrettyTree(trav=trav)
+      L.append(Field('trans_pref', x3))
+
+    if self.canonical_flags is not None:  # Optional
+      x4 = NewLeaf(self.canonical_flags, color_e.StringConst)
+      L.append(Field('canonical_flags', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Eggex')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.regex is not None
+    x1 = self.regex.AbbreviatedTree(trav=trav)
+    L.append(Field('regex', x1))
+
+    if self.flags is not None:  # List
+      x2 = hnode.Array([])
+      for i2 in self.flags:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+             i2.AbbreviatedTree(trav=trav))
+        x2.children.append(h)
+      L.append(Field('flags', x2))
+
+    if self.trans_pref is not None:  # Optional
+      x3 = self.trans_pref.AbbreviatedTree(trav=trav)
+      L.append(Field('trans_pref', x3))
+
+    if self.canonical_flags is not None:  # Optional
+      x4 = NewLeaf(self.canonical_flags, color_e.StringConst)
+      L.append(Field('canonical_flags', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class IfArm(pybase.CompoundObj):
+  _type_tag = 84
+  __slots__ = ('keyword', 'cond', 'then_kw', 'action', 'then_tok')
+
+  def __init__(self, keyword, cond, then_kw, action, then_tok):
+    # type: (Token, condition_t, Optional[Token], List[command_t], Optional[Token]) -> None
+    self.keyword = keyword
+    self.cond = cond
+    self.then_kw = then_kw
+    self.action = action
+    self.then_tok = then_tok
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> IfArm
+    return IfArm(cast(Token, None), cast(condition_t, None), cast('Optional[Token]', None), [] if alloc_lists else cast('List[command_t]', None), cast('Optional[Token]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.keyword is None:
+      enc.Null()
+    else:
+      self.keyword.Marshal(enc)
+    if self.cond is None:
+      enc.Null()
+    else:
+      self.cond.Marshal(enc)
+    if self.then_kw is None:
+      enc.Null()
+    else:
+      self.then_kw.Marshal(enc)
+    if self.action is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.action))
+      for x3 in self.action:
+        if x3 is None:
+          enc.Null()
+        else:
+          x3.Marshal(enc)
+    if self.then_tok is None:
+      enc.Null()
+    else:
+      self.then_tok.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> IfArm
+    x0 = Token.Unmarshal(dec)
+    x1 = condition_t.Unmarshal(dec)
+    x2 = Token.Unmarshal(dec)
+    x3 = None  # type: List[command_t]
+    n = dec.Len()
+    if n != -1:
+      x3 = []
+      for _ in xrange(n):
+        x3.append(command_t.Unmarshal(dec))
+    x4 = Token.Unmarshal(dec)
+    obj = IfArm(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> IfArm
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('IfArm', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('IfArm', dec.Ref())
+    if tag != IfArm._type_tag:
+      dec.BadTag(tag)
+      return cast('IfArm', None)
+    return IfArm.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('IfArm')
+    L = out_node.fields
+
+    assert self.keyword is not None
+    x0 = self.keyword.PrettyTree(trav=trav)
+    L.append(Field('keyword', x0))
+
+    assert self.cond is not None
+    x1 = self.cond.PrettyTree(trav=trav)
+    L.append(Field('cond', x1))
+
+    if self.then_kw is not None:  # Optional
+      x2 = self.then_kw.PrettyTree(trav=trav)
+      L.append(Field('then_kw', x2))
+
+    if self.action is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.action:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.PrettyTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('action', x3))
+
+    if self.then_tok is not None:  # Optional
+      x4 = self.then_tok.PrettyTree(trav=trav)
+      L.append(Field('then_tok', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('IfArm')
+    L = out_node.fields
+    assert self.keyword is not None
+    x0 = self.keyword.AbbreviatedTree(trav=trav)
+    L.append(Field('keyword', x0))
+
+    assert self.cond is not None
+    x1 = self.cond.AbbreviatedTree(trav=trav)
+    L.append(Field('cond', x1))
+
+    if self.then_kw is not None:  # Optional
+      x2 = self.then_kw.AbbreviatedTree(trav=trav)
+      L.append(Field('then_kw', x2))
+
+    if self.action is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.action:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.AbbreviatedTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('action', x3))
+
+    if self.then_tok is not None:  # Optional
+      x4 = self.then_tok.AbbreviatedTree(trav=trav)
+      L.append(Field('then_tok', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class BraceGroup(command_t):
+  _type_tag = 85
+  __slots__ = ('left', 'doc_token', 'children', 'redirects', 'right')
+
+  def __init__(self, left, doc_token, children, redirects, right):
+    # type: (Token, Optional[Token], List[command_t], List[Redir], Token) -> None
+    self.left = left
+    self.doc_token = doc_token
+    self.children = children
+    self.redirects = redirects
+    self.right = right
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> BraceGroup
+    return BraceGroup(cast(Token, None), cast('Optional[Token]', None), [] if alloc_lists else cast('List[command_t]', None), [] if alloc_lists else cast('List[Redir]', None), cast(Token, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.doc_token is None:
+      enc.Null()
+    else:
+      self.doc_token.Marshal(enc)
+    if self.children is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.children))
+      for x2 in self.children:
+        if x2 is None:
+          enc.Null()
+        else:
+          x2.Marshal(enc)
+    if self.redirects is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.redirects))
+      for x3 in self.redirects:
+        if x3 is None:
+          enc.Null()
+        else:
+          x3.Marshal(enc)
+    if self.right is None:
+      enc.Null()
+    else:
+      self.right.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> BraceGroup
+    x0 = Token.Unmarshal(dec)
+    x1 = Token.Unmarshal(dec)
+    x2 = None  # type: List[command_t]
+    n = dec.Len()
+    if n != -1:
+      x2 = []
+      for _ in xrange(n):
+        x2.append(command_t.Unmarshal(dec))
+    x3 = None  # type: List[Redir]
+    n = dec.Len()
+    if n != -1:
+      x3 = []
+      for _ in xrange(n):
+        x3.append(Redir.Unmarshal(dec))
+    x4 = Token.Unmarshal(dec)
+    obj = BraceGroup(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> BraceGroup
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('BraceGroup', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('BraceGroup', dec.Ref())
+    if tag != BraceGroup._type_tag:
+      dec.BadTag(tag)
+      return cast('BraceGroup', None)
+    return BraceGroup.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('BraceGroup')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.doc_token is not None:  # Optional
+      x1 = self.doc_token.PrettyTree(trav=trav)
+      L.append(Field('doc_token', x1))
+
+    if self.children is not None:  # List
+      x2 = hnode.Array([])
+      for i2 in self.children:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+             i2.PrettyTree(trav=trav))
+        x2.children.append(h)
+      L.append(Field('children', x2))
+
+    if self.redirects is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.redirects:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.PrettyTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('redirects', x3))
+
+    assert self.right is not None
+    x4 = self.right.PrettyTree(trav=trav)
+    L.append(Field('right', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('BraceGroup')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    if self.doc_token is not None:  # Optional
+      x1 = self.doc_token.AbbreviatedTree(trav=trav)
+      L.append(Field('doc_token', x1))
+
+    if self.children is not None:  # List
+      x2 = hnode.Array([])
+      for i2 in self.children:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+             i2.AbbreviatedTree(trav=trav))
+        x2.children.append(h)
+      L.append(Field('children', x2))
+
+    if self.redirects is not None:  # List
+      x3 = hnode.Array([])
+      for i3 in self.redirects:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i3 is None else
+             i3.AbbreviatedTree(trav=trav))
+        x3.children.append(h)
+      L.append(Field('redirects', x3))
+
+    assert self.right is not None
+    x4 = self.right.AbbreviatedTree(trav=trav)
+    L.append(Field('right', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Param(pybase.CompoundObj):
+  _type_tag = 86
+  __slots__ = ('blame_tok', 'name', 'type', 'default_val')
+
+  def __init__(self, blame_tok, name, type, default_val):
+    # type: (Token, str, Optional[TypeExpr], Optional[expr_t]) -> None
+    self.blame_tok = blame_tok
+    self.name = name
+    self.type = type
+    self.default_val = default_val
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Param
+    return Param(cast(Token, None), '', cast('Optional[TypeExpr]', None), cast('Optional[expr_t]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.blame_tok is None:
+      enc.Null()
+    else:
+      self.blame_tok.Marshal(enc)
+    enc.Str(self.name)
+    if self.type is None:
+      enc.Null()
+    else:
+      self.type.Marshal(enc)
+    if self.default_val is None:
+      enc.Null()
+    else:
+      self.default_val.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Param
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    x2 = TypeExpr.Unmarshal(dec)
+    x3 = expr_t.Unmarshal(dec)
+    obj = Param(x0, x1, x2, x3)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Param
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Param', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Param', dec.Ref())
+    if tag != Param._type_tag:
+      dec.BadTag(tag)
+      return cast('Param', None)
+    return Param.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Param')
+    L = out_node.fields
+
+    assert self.blame_tok is not None
+    x0 = self.blame_tok.PrettyTree(trav=trav)
+    L.append(Field('blame_tok', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    if self.type is not None:  # Optional
+      x2 = self.type.PrettyTree(trav=trav)
+      L.append(Field('type', x2))
+
+    if self.default_val is not None:  # Optional
+      x3 = self.default_val.PrettyTree(trav=trav)
+      L.append(Field('default_val', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Param')
+    L = out_node.fields
+    assert self.blame_tok is not None
+    x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+    L.append(Field('blame_tok', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    if self.type is not None:  # Optional
+      x2 = self.type.AbbreviatedTree(trav=trav)
+      L.append(Field('type', x2))
+
+    if self.default_val is not None:  # Optional
+      x3 = self.default_val.AbbreviatedTree(trav=trav)
+      L.append(Field('default_val', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class RestParam(pybase.CompoundObj):
+  _type_tag = 87
+  __slots__ = ('blame_tok', 'name')
+
+  def __init__(self, blame_tok, name):
+    # type: (Token, str) -> None
+    self.blame_tok = blame_tok
+    self.name = name
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> RestParam
+    return RestParam(cast(Token, None), '')
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.blame_tok is None:
+      enc.Null()
+    else:
+      self.blame_tok.Marshal(enc)
+    enc.Str(self.name)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> RestParam
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    obj = RestParam(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> RestParam
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('RestParam', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('RestParam', dec.Ref())
+    if tag != RestParam._type_tag:
+      dec.BadTag(tag)
+      return cast('RestParam', None)
+    return RestParam.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('RestParam')
+    L = out_node.fields
+
+    assert self.blame_tok is not None
+    x0 = self.blame_tok.PrettyTree(trav=trav)
+    L.append(Field('blame_tok', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('RestParam')
+    L = out_node.fields
+    assert self.blame_tok is not None
+    x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+    L.append(Field('blame_tok', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class ParamGroup(pybase.CompoundObj):
+  _type_tag = 88
+  __slots__ = ('params', 'rest_of')
+
+  def __init__(self, params, rest_of):
+    # type: (List[Param], Optional[RestParam]) -> None
+    self.params = params
+    self.rest_of = rest_of
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> ParamGroup
+    return ParamGroup([] if alloc_lists else cast('List[Param]', None), cast('Optional[RestParam]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.params is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.params))
+      for x0 in self.params:
+        if x0 is None:
+          enc.Null()
+        else:
+          x0.Marshal(enc)
+    if self.rest_of is None:
+      enc.Null()
+    else:
+      self.rest_of.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> ParamGroup
+    x0 = None  # type: List[Param]
+    n = dec.Len()
+    if n != -1:
+      x0 = []
+      for _ in xrange(n):
+        x0.append(Param.Unmarshal(dec))
+    x1 = RestParam.Unmarshal(dec)
+    obj = ParamGroup(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> ParamGroup
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('ParamGroup', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('ParamGroup', dec.Ref())
+    if tag != ParamGroup._type_tag:
+      dec.BadTag(tag)
+      return cast('ParamGroup', None)
+    return ParamGroup.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ParamGroup')
+    L = out_node.fields
+
+    if self.params is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.params:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+             i0.PrettyTree(trav=trav))
+        x0.children.append(h)
+      L.append(Field('params', x0))
+
+    if self.rest_of is not None:  # Optional
+      x1 = self.rest_of.PrettyTree(trav=trav)
+      L.append(Field('rest_of', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ParamGroup')
+    L = out_node.fields
+    if self.params is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.params:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+             i0.AbbreviatedTree(trav=trav))
+        x0.children.append(h)
+      L.append(Field('params', x0))
+
+    if self.rest_of is not None:  # Optional
+      x1 = self.rest_of.AbbreviatedTree(trav=trav)
+      L.append(Field('rest_of', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Proc(command_t):
+  _type_tag = 89
+  __slots__ = ('keyword', 'name', 'sig', 'body')
+
+  def __init__(self, keyword, name, sig, body):
+    # type: (Token, Token, proc_sig_t, command_t) -> None
+    self.keyword = keyword
+    self.name = name
+    self.sig = sig
+    self.body = body
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Proc
+    return Proc(cast(Token, None), cast(Token, None), cast(proc_sig_t, None), cast(command_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.keyword is None:
+      enc.Null()
+    else:
+      self.keyword.Marshal(enc)
+    if self.name is None:
+      enc.Null()
+    else:
+      self.name.Marshal(enc)
+    if self.sig is None:
+      enc.Null()
+    else:
+      self.sig.Marshal(enc)
+    if self.body is None:
+      enc.Null()
+    else:
+      self.body.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Proc
+    x0 = Token.Unmarshal(dec)
+    x1 = Token.Unmarshal(dec)
+    x2 = proc_sig_t.Unmarshal(dec)
+    x3 = command_t.Unmarshal(dec)
+    obj = Proc(x0, x1, x2, x3)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Proc
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Proc', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Proc', dec.Ref())
+    if tag != Proc._type_tag:
+      dec.BadTag(tag)
+      return cast('Proc', None)
+    return Proc.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Proc')
+    L = out_node.fields
+
+    assert self.keyword is not None
+    x0 = self.keyword.PrettyTree(trav=trav)
+    L.append(Field('keyword', x0))
+
+    assert self.name is not None
+    x1 = self.name.PrettyTree(trav=trav)
+    L.append(Field('name', x1))
+
+    assert self.sig is not None
+    x2 = self.sig.PrettyTree(trav=trav)
+    L.append(Field('sig', x2))
+
+    assert self.body is not None
+    x3 = self.body.PrettyTree(trav=trav)
+    L.append(Field('body', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Proc')
+    L = out_node.fields
+    assert self.keyword is not None
+    x0 = self.keyword.AbbreviatedTree(trav=trav)
+    L.append(Field('keyword', x0))
+
+    assert self.name is not None
+    x1 = self.name.AbbreviatedTree(trav=trav)
+    L.append(Field('name', x1))
+
+    assert self.sig is not None
+    x2 = self.sig.AbbreviatedTree(trav=trav)
+    L.append(Field('sig', x2))
+
+    assert self.body is not None
+    x3 = self.body.AbbreviatedTree(trav=trav)
+    L.append(Field('body', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Func(command_t):
+  _type_tag = 90
+  __slots__ = ('keyword', 'name', 'positional', 'named', 'body')
+
+  def __init__(self, keyword, name, positional, named, body):
+    # type: (Token, Token, Optional[ParamGroup], Optional[ParamGroup], command_t) -> None
+    self.keyword = keyword
+    self.name = name
+    self.positional = positional
+    self.named = named
+    self.body = body
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Func
+    return Func(cast(Token, None), cast(Token, None), cast('Optional[ParamGroup]', None), cast('Optional[ParamGroup]', None), cast(command_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.keyword is None:
+      enc.Null()
+    else:
+      self.keyword.Marshal(enc)
+    if self.name is None:
+      enc.Null()
+    else:
+      self.name.Marshal(enc)
+    if self.positional is None:
+      enc.Null()
+    else:
+      self.positional.Marshal(enc)
+    if self.named is None:
+      enc.Null()
+    else:
+      self.named.Marshal(enc)
+    if self.body is None:
+      enc.Null()
+    else:
+      self.body.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Func
+    x0 = Token.Unmarshal(dec)
+    x1 = Token.Unmarshal(dec)
+    x2 = ParamGroup.Unmarshal(dec)
+    x3 = ParamGroup.Unmarshal(dec)
+    x4 = command_t.Unmarshal(dec)
+    obj = Func(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Func
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Func', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Func', dec.Ref())
+    if tag != Func._type_tag:
+      dec.BadTag(tag)
+      return cast('Func', None)
+    return Func.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Func')
+    L = out_node.fields
+
+    assert self.keyword is not None
+    x0 = self.keyword.PrettyTree(trav=trav)
+    L.append(Field('keyword', x0))
+
+    assert self.name is not None
+    x1 = self.name.PrettyTree(trav=trav)
+    L.append(Field('name', x1))
+
+    if self.positional is not None:  # Optional
+      x2 = self.positional.PrettyTree(trav=trav)
+      L.append(Field('positional', x2))
+
+    if self.named is not None:  # Optional
+      x3 = self.named.PrettyTree(trav=trav)
+      L.append(Field('named', x3))
+
+    assert self.body is not None
+    x4 = self.body.PrettyTree(trav=trav)
+    L.append(Field('body', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Func')
+    L = out_node.fields
+    assert self.keyword is not None
+    x0 = self.keyword.AbbreviatedTree(trav=trav)
+    L.append(Field('keyword', x0))
+
+    assert self.name is not None
+    x1 = self.name.AbbreviatedTree(trav=trav)
+    L.append(Field('name', x1))
+
+    if self.positional is not None:  # Optional
+      x2 = self.positional.AbbreviatedTree(trav=trav)
+      L.append(Field('positional', x2))
+
+    if self.named is not None:  # Optional
+      x3 = self.named.AbbreviatedTree(trav=trav)
+      L.append(Field('named', x3))
+
+    assert self.body is not None
+    x4 = self.body.AbbreviatedTree(trav=trav)
+    L.append(Field('body', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class LiteralBlock(pybase.CompoundObj):
+  _type_tag = 91
+  __slots__ = ('brace_group', 'lines')
+
+  def __init__(self, brace_group, lines):
+    # type: (BraceGroup, List[SourceLine]) -> None
+    self.brace_group = brace_group
+    self.lines = lines
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> LiteralBlock
+    return LiteralBlock(cast(BraceGroup, None), [] if alloc_lists else cast('List[SourceLine]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.brace_group is None:
+      enc.Null()
+    else:
+      self.brace_group.Marshal(enc)
+    if self.lines is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.lines))
+      for x1 in self.lines:
+        if x1 is None:
+          enc.Null()
+        else:
+          x1.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> LiteralBlock
+    x0 = BraceGroup.Unmarshal(dec)
+    x1 = None  # type: List[SourceLine]
+    n = dec.Len()
+    if n != -1:
+      x1 = []
+      for _ in xrange(n):
+        x1.append(SourceLine.Unmarshal(dec))
+    obj = LiteralBlock(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> LiteralBlock
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('LiteralBlock', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('LiteralBlock', dec.Ref())
+    if tag != LiteralBlock._type_tag:
+      dec.BadTag(tag)
+      return cast('LiteralBlock', None)
+    return LiteralBlock.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('LiteralBlock')
+    L = out_node.fields
+
+    assert self.brace_group is not None
+    x0 = self.brace_group.PrettyTree(trav=trav)
+    L.append(Field('brace_group', x0))
+
+    if self.lines is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.lines:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.PrettyTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('lines', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('LiteralBlock')
+    L = out_node.fields
+    assert self.brace_group is not None
+    x0 = self.brace_group.AbbreviatedTree(trav=trav)
+    L.append(Field('brace_group', x0))
+
+    if self.lines is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.lines:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i1 is None else
+             i1.AbbreviatedTree(trav=trav))
+        x1.children.append(h)
+      L.append(Field('lines', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class ParsedAssignment(pybase.CompoundObj):
+  _type_tag = 92
+  __slots__ = ('left', 'close', 'part_offset', 'w')
+
+  def __init__(self, left, close, part_offset, w):
+    # type: (Optional[Token], Optional[Token], int, CompoundWord) -> None
+    self.left = left
+    self.close = close
+    self.part_offset = part_offset
+    self.w = w
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> ParsedAssignment
+    return ParsedAssignment(cast('Optional[Token]', None), cast('Optional[Token]', None), -1, cast(CompoundWord, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.close is None:
+      enc.Null()
+    else:
+      self.close.Marshal(enc)
+    enc.Int(self.part_offset)
+    if self.w is None:
+      enc.Null()
+    else:
+      self.w.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> ParsedAssignment
+    x0 = Token.Unmarshal(dec)
+    x1 = Token.Unmarshal(dec)
+    x2 = dec.Int()
+    x3 = CompoundWord.Unmarshal(dec)
+    obj = ParsedAssignment(x0, x1, x2, x3)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> ParsedAssignment
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('ParsedAssignment', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('ParsedAssignment', dec.Ref())
+    if tag != ParsedAssignment._type_tag:
+      dec.BadTag(tag)
+      return cast('ParsedAssignment', None)
+    return ParsedAssignment.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ParsedAssignment')
+    L = out_node.fields
+
+    if self.left is not None:  # Optional
+      x0 = self.left.PrettyTree(trav=trav)
+      L.append(Field('left', x0))
+
+    if self.close is not None:  # Optional
+      x1 = self.close.PrettyTree(trav=trav)
+      L.append(Field('close', x1))
+
+    x2 = hnode.Leaf(str(self.part_offset), color_e.OtherConst)
+    L.append(Field('part_offset', x2))
+
+    assert self.w is not None
+    x3 = self.w.PrettyTree(trav=trav)
+    L.append(Field('w', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('ParsedAssignment')
+    L = out_node.fields
+    if self.left is not None:  # Optional
+      x0 = self.left.AbbreviatedTree(trav=trav)
+      L.append(Field('left', x0))
+
+    if self.close is not None:  # Optional
+      x1 = self.close.AbbreviatedTree(trav=trav)
+      L.append(Field('close', x1))
+
+    x2 = hnode.Leaf(str(self.part_offset), color_e.OtherConst)
+    L.append(Field('part_offset', x2))
+
+    assert self.w is not None
+    x3 = self.w.AbbreviatedTree(trav=trav)
+    L.append(Field('w', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class TypeExpr(pybase.CompoundObj):
+  _type_tag = 93
+  __slots__ = ('tok', 'name', 'params')
+
+  def __init__(self, tok, name, params):
+    # type: (Token, str, List[TypeExpr]) -> None
+    self.tok = tok
+    self.name = name
+    self.params = params
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> TypeExpr
+    return TypeExpr(cast(Token, None), '', [] if alloc_lists else cast('List[TypeExpr]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.tok is None:
+      enc.Null()
+    else:
+      self.tok.Marshal(enc)
+    enc.Str(self.name)
+    if self.params is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.params))
+      for x2 in self.params:
+        if x2 is None:
+          enc.Null()
+        else:
+          x2.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> TypeExpr
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    x2 = None  # type: List[TypeExpr]
+    n = dec.Len()
+    if n != -1:
+      x2 = []
+      for _ in xrange(n):
+        x2.append(TypeExpr.Unmarshal(dec))
+    obj = TypeExpr(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> TypeExpr
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('TypeExpr', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('TypeExpr', dec.Ref())
+    if tag != TypeExpr._type_tag:
+      dec.BadTag(tag)
+      return cast('TypeExpr', None)
+    return TypeExpr.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('TypeExpr')
+    L = out_node.fields
+
+    assert self.tok is not None
+    x0 = self.tok.PrettyTree(trav=trav)
+    L.append(Field('tok', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    if self.params is not None:  # List
+      x2 = hnode.Array([])
+      for i2 in self.params:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+             i2.PrettyTree(trav=trav))
+        x2.children.append(h)
+      L.append(Field('params', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('TypeExpr')
+    L = out_node.fields
+    assert self.tok is not None
+    x0 = self.tok.AbbreviatedTree(trav=trav)
+    L.append(Field('tok', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    if self.params is not None:  # List
+      x2 = hnode.Array([])
+      for i2 in self.params:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i2 is None else
+             i2.AbbreviatedTree(trav=trav))
+        x2.children.append(h)
+      L.append(Field('params', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class NameType(pybase.CompoundObj):
+  _type_tag = 94
+  __slots__ = ('left', 'name', 'typ')
+
+  def __init__(self, left, name, typ):
+    # type: (Token, str, Optional[TypeExpr]) -> None
+    self.left = left
+    self.name = name
+    self.typ = typ
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> NameType
+    return NameType(cast(Token, None), '', cast('Optional[TypeExpr]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    enc.Str(self.name)
+    if self.typ is None:
+      enc.Null()
+    else:
+      self.typ.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> NameType
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    x2 = TypeExpr.Unmarshal(dec)
+    obj = NameType(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> NameType
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('NameType', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('NameType', dec.Ref())
+    if tag != NameType._type_tag:
+      dec.BadTag(tag)
+      return cast('NameType', None)
+    return NameType.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('NameType')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    if self.typ is not None:  # Optional
+      x2 = self.typ.PrettyTree(trav=trav)
+      L.append(Field('typ', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('NameType')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    if self.typ is not None:  # Optional
+      x2 = self.typ.AbbreviatedTree(trav=trav)
+      L.append(Field('typ', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Comprehension(pybase.CompoundObj):
+  _type_tag = 95
+  __slots__ = ('lhs', 'iter', 'cond')
+
+  def __init__(self, lhs, iter, cond):
+    # type: (List[NameType], expr_t, Optional[expr_t]) -> None
+    self.lhs = lhs
+    self.iter = iter
+    self.cond = cond
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Comprehension
+    return Comprehension([] if alloc_lists else cast('List[NameType]', None), cast(expr_t, None), cast('Optional[expr_t]', None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.lhs is None:
+      enc.Len(-1)
+    else:
+      enc.Len(len(self.lhs))
+      for x0 in self.lhs:
+        if x0 is None:
+          enc.Null()
+        else:
+          x0.Marshal(enc)
+    if self.iter is None:
+      enc.Null()
+    else:
+      self.iter.Marshal(enc)
+    if self.cond is None:
+      enc.Null()
+    else:
+      self.cond.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Comprehension
+    x0 = None  # type: List[NameType]
+    n = dec.Len()
+    if n != -1:
+      x0 = []
+      for _ in xrange(n):
+        x0.append(NameType.Unmarshal(dec))
+    x1 = expr_t.Unmarshal(dec)
+    x2 = expr_t.Unmarshal(dec)
+    obj = Comprehension(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Comprehension
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Comprehension', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Comprehension', dec.Ref())
+    if tag != Comprehension._type_tag:
+      dec.BadTag(tag)
+      return cast('Comprehension', None)
+    return Comprehension.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Comprehension')
+    L = out_node.fields
+
+    if self.lhs is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.lhs:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+             i0.PrettyTree(trav=trav))
+        x0.children.append(h)
+      L.append(Field('lhs', x0))
+
+    assert self.iter is not None
+    x1 = self.iter.PrettyTree(trav=trav)
+    L.append(Field('iter', x1))
+
+    if self.cond is not None:  # Optional
+      x2 = self.cond.PrettyTree(trav=trav)
+      L.append(Field('cond', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Comprehension')
+    L = out_node.fields
+    if self.lhs is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.lhs:
+        h = (hnode.Leaf("_", color_e.OtherConst) if i0 is None else
+             i0.AbbreviatedTree(trav=trav))
+        x0.children.append(h)
+      L.append(Field('lhs', x0))
+
+    assert self.iter is not None
+    x1 = self.iter.AbbreviatedTree(trav=trav)
+    L.append(Field('iter', x1))
+
+    if self.cond is not None:  # Optional
+      x2 = self.cond.AbbreviatedTree(trav=trav)
+      L.append(Field('cond', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class NamedArg(pybase.CompoundObj):
+  _type_tag = 96
+  __slots__ = ('name', 'value')
+
+  def __init__(self, name, value):
+    # type: (Optional[Token], expr_t) -> None
+    self.name = name
+    self.value = value
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> NamedArg
+    return NamedArg(cast('Optional[Token]', None), cast(expr_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.name is None:
+      enc.Null()
+    else:
+      self.name.Marshal(enc)
+    if self.value is None:
+      enc.Null()
+    else:
+      self.value.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> NamedArg
+    x0 = Token.Unmarshal(dec)
+    x1 = expr_t.Unmarshal(dec)
+    obj = NamedArg(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> NamedArg
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('NamedArg', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('NamedArg', dec.Ref())
+    if tag != NamedArg._type_tag:
+      dec.BadTag(tag)
+      return cast('NamedArg', None)
+    return NamedArg.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('NamedArg')
+    L = out_node.fields
+
+    if self.name is not None:  # Optional
+      x0 = self.name.PrettyTree(trav=trav)
+      L.append(Field('name', x0))
+
+    assert self.value is not None
+    x1 = self.value.PrettyTree(trav=trav)
+    L.append(Field('value', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('NamedArg')
+    L = out_node.fields
+    if self.name is not None:  # Optional
+      x0 = self.name.AbbreviatedTree(trav=trav)
+      L.append(Field('name', x0))
+
+    assert self.value is not None
+    x1 = self.value.AbbreviatedTree(trav=trav)
+    L.append(Field('value', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Subscript(y_lhs_t, expr_t):
+  _type_tag = 97
+  __slots__ = ('left', 'obj', 'index')
+
+  def __init__(self, left, obj, index):
+    # type: (Token, expr_t, expr_t) -> None
+    self.left = left
+    self.obj = obj
+    self.index = index
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Subscript
+    return Subscript(cast(Token, None), cast(expr_t, None), cast(expr_t, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.left is None:
+      enc.Null()
+    else:
+      self.left.Marshal(enc)
+    if self.obj is None:
+      enc.Null()
+    else:
+      self.obj.Marshal(enc)
+    if self.index is None:
+      enc.Null()
+    else:
+      self.index.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Subscript
+    x0 = Token.Unmarshal(dec)
+    x1 = expr_t.Unmarshal(dec)
+    x2 = expr_t.Unmarshal(dec)
+    obj = Subscript(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Subscript
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Subscript', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Subscript', dec.Ref())
+    if tag != Subscript._type_tag:
+      dec.BadTag(tag)
+      return cast('Subscript', None)
+    return Subscript.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Subscript')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.obj is not None
+    x1 = self.obj.PrettyTree(trav=trav)
+    L.append(Field('obj', x1))
+
+    assert self.index is not None
+    x2 = self.index.PrettyTree(trav=trav)
+    L.append(Field('index', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Subscript')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree(trav=trav)
+    L.append(Field('left', x0))
+
+    assert self.obj is not None
+    x1 = self.obj.AbbreviatedTree(trav=trav)
+    L.append(Field('obj', x1))
+
+    assert self.index is not None
+    x2 = self.index.AbbreviatedTree(trav=trav)
+    L.append(Field('index', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class Attribute(y_lhs_t, expr_t):
+  _type_tag = 98
+  __slots__ = ('obj', 'op', 'attr', 'attr_name', 'ctx')
+
+  def __init__(self, obj, op, attr, attr_name, ctx):
+    # type: (expr_t, Token, Token, str, expr_context_t) -> None
+    self.obj = obj
+    self.op = op
+    self.attr = attr
+    self.attr_name = attr_name
+    self.ctx = ctx
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Attribute
+    return Attribute(cast(expr_t, None), cast(Token, None), cast(Token, None), '', expr_context_e.Load)
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.obj is None:
+      enc.Null()
+    else:
+      self.obj.Marshal(enc)
+    if self.op is None:
+      enc.Null()
+    else:
+      self.op.Marshal(enc)
+    if self.attr is None:
+      enc.Null()
+    else:
+      self.attr.Marshal(enc)
+    enc.Str(self.attr_name)
+    enc.Int(self.ctx)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> Attribute
+    x0 = expr_t.Unmarshal(dec)
+    x1 = Token.Unmarshal(dec)
+    x2 = Token.Unmarshal(dec)
+    x3 = dec.Str()
+    x4 = expr_context_t(dec.Int())
+    obj = Attribute(x0, x1, x2, x3, x4)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> Attribute
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('Attribute', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('Attribute', dec.Ref())
+    if tag != Attribute._type_tag:
+      dec.BadTag(tag)
+      return cast('Attribute', None)
+    return Attribute.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Attribute')
+    L = out_node.fields
+
+    assert self.obj is not None
+    x0 = self.obj.PrettyTree(trav=trav)
+    L.append(Field('obj', x0))
+
+    assert self.op is not None
+    x1 = self.op.PrettyTree(trav=trav)
+    L.append(Field('op', x1))
+
+    assert self.attr is not None
+    x2 = self.attr.PrettyTree(trav=trav)
+    L.append(Field('attr', x2))
+
+    x3 = NewLeaf(self.attr_name, color_e.StringConst)
+    L.append(Field('attr_name', x3))
+
+    x4 = hnode.Leaf(expr_context_str(self.ctx), color_e.TypeName)
+    L.append(Field('ctx', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('Attribute')
+    L = out_node.fields
+    assert self.obj is not None
+    x0 = self.obj.AbbreviatedTree(trav=trav)
+    L.append(Field('obj', x0))
+
+    assert self.op is not None
+    x1 = self.op.AbbreviatedTree(trav=trav)
+    L.append(Field('op', x1))
+
+    assert self.attr is not None
+    x2 = self.attr.AbbreviatedTree(trav=trav)
+    L.append(Field('attr', x2))
+
+    x3 = NewLeaf(self.attr_name, color_e.StringConst)
+    L.append(Field('attr_name', x3))
+
+    x4 = hnode.Leaf(expr_context_str(self.ctx), color_e.TypeName)
+    L.append(Field('ctx', x4))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class PosixClass(class_literal_term_t, char_class_term_t, re_t):
+  _type_tag = 99
+  __slots__ = ('negated', 'name')
+
+  def __init__(self, negated, name):
+    # type: (Optional[Token], str) -> None
+    self.negated = negated
+    self.name = name
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> PosixClass
+    return PosixClass(cast('Optional[Token]', None), '')
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.negated is None:
+      enc.Null()
+    else:
+      self.negated.Marshal(enc)
+    enc.Str(self.name)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> PosixClass
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    obj = PosixClass(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> PosixClass
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('PosixClass', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('PosixClass', dec.Ref())
+    if tag != PosixClass._type_tag:
+      dec.BadTag(tag)
+      return cast('PosixClass', None)
+    return PosixClass.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('PosixClass')
+    L = out_node.fields
+
+    if self.negated is not None:  # Optional
+      x0 = self.negated.PrettyTree(trav=trav)
+      L.append(Field('negated', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('PosixClass')
+    L = out_node.fields
+    if self.negated is not None:  # Optional
+      x0 = self.negated.AbbreviatedTree(trav=trav)
+      L.append(Field('negated', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class PerlClass(class_literal_term_t, char_class_term_t, re_t):
+  _type_tag = 100
+  __slots__ = ('negated', 'name')
+
+  def __init__(self, negated, name):
+    # type: (Optional[Token], str) -> None
+    self.negated = negated
+    self.name = name
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> PerlClass
+    return PerlClass(cast('Optional[Token]', None), '')
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.negated is None:
+      enc.Null()
+    else:
+      self.negated.Marshal(enc)
+    enc.Str(self.name)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> PerlClass
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Str()
+    obj = PerlClass(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> PerlClass
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('PerlClass', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('PerlClass', dec.Ref())
+    if tag != PerlClass._type_tag:
+      dec.BadTag(tag)
+      return cast('PerlClass', None)
+    return PerlClass.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('PerlClass')
+    L = out_node.fields
+
+    if self.negated is not None:  # Optional
+      x0 = self.negated.PrettyTree(trav=trav)
+      L.append(Field('negated', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('PerlClass')
+    L = out_node.fields
+    if self.negated is not None:  # Optional
+      x0 = self.negated.AbbreviatedTree(trav=trav)
+      L.append(Field('negated', x0))
+
+    x1 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class CharCode(class_literal_term_t, char_class_term_t):
+  _type_tag = 101
+  __slots__ = ('blame_tok', 'i', 'u_braced')
+
+  def __init__(self, blame_tok, i, u_braced):
+    # type: (Token, int, bool) -> None
+    self.blame_tok = blame_tok
+    self.i = i
+    self.u_braced = u_braced
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> CharCode
+    return CharCode(cast(Token, None), -1, False)
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.blame_tok is None:
+      enc.Null()
+    else:
+      self.blame_tok.Marshal(enc)
+    enc.Int(self.i)
+    enc.Bool(self.u_braced)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> CharCode
+    x0 = Token.Unmarshal(dec)
+    x1 = dec.Int()
+    x2 = dec.Bool()
+    obj = CharCode(x0, x1, x2)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> CharCode
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('CharCode', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('CharCode', dec.Ref())
+    if tag != CharCode._type_tag:
+      dec.BadTag(tag)
+      return cast('CharCode', None)
+    return CharCode.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CharCode')
+    L = out_node.fields
+
+    assert self.blame_tok is not None
+    x0 = self.blame_tok.PrettyTree(trav=trav)
+    L.append(Field('blame_tok', x0))
+
+    x1 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(Field('i', x1))
+
+    x2 = hnode.Leaf('T' if self.u_braced else 'F', color_e.OtherConst)
+    L.append(Field('u_braced', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CharCode')
+    L = out_node.fields
+    assert self.blame_tok is not None
+    x0 = self.blame_tok.AbbreviatedTree(trav=trav)
+    L.append(Field('blame_tok', x0))
+
+    x1 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(Field('i', x1))
+
+    x2 = hnode.Leaf('T' if self.u_braced else 'F', color_e.OtherConst)
+    L.append(Field('u_braced', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+class CharRange(class_literal_term_t, char_class_term_t):
+  _type_tag = 102
+  __slots__ = ('start', 'end')
+
+  def __init__(self, start, end):
+    # type: (CharCode, CharCode) -> None
+    self.start = start
+    self.end = end
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> CharRange
+    return CharRange(cast(CharCode, None), cast(CharCode, None))
+
+  def Marshal(self, enc):
+    # type: (runtime.Encoder) -> None
+    heap_id = id(self)
+    if not enc.Begin(heap_id, self._type_tag):
+      return
+    if self.start is None:
+      enc.Null()
+    else:
+      self.start.Marshal(enc)
+    if self.end is None:
+      enc.Null()
+    else:
+      self.end.Marshal(enc)
+    enc.End(heap_id)
+
+  @staticmethod
+  def UnmarshalNew(dec):
+    # type: (runtime.Decoder) -> CharRange
+    x0 = CharCode.Unmarshal(dec)
+    x1 = CharCode.Unmarshal(dec)
+    obj = CharRange(x0, x1)
+    dec.Register(obj)
+    return obj
+
+  @staticmethod
+  def Unmarshal(dec):
+    # type: (runtime.Decoder) -> CharRange
+    tag = dec.Int()
+    if tag == runtime.MARSHAL_NULL:
+      return cast('CharRange', None)
+    if tag == runtime.MARSHAL_REF:
+      return cast('CharRange', dec.Ref())
+    if tag != CharRange._type_tag:
+      dec.BadTag(tag)
+      return cast('CharRange', None)
+    return CharRange.UnmarshalNew(dec)
+
+  def PrettyTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CharRange')
+    L = out_node.fields
+
+    assert self.start is not None
+    x0 = self.start.PrettyTree(trav=trav)
+    L.append(Field('start', x0))
+
+    assert self.end is not None
+    x1 = self.end.PrettyTree(trav=trav)
+    L.append(Field('end', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    trav = trav or TraversalState()
+    heap_id = id(self)
+    if heap_id in trav.seen:
+      return hnode.AlreadySeen(heap_id)
+    trav.seen[heap_id] = True
+    out_node = NewRecord('CharRange')
+    L = out_node.fields
+    assert self.start is not None
+    x0 = self.start.AbbreviatedTree(trav=trav)
+    L.append(Field('start', x0))
+
+    assert self.end is not None
+    x1 = self.end.AbbreviatedTree(trav=trav)
+    L.append(Field('end', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self, trav=None):
+    # type: (Optional[TraversalState]) -> hnode_t
+    return self._AbbreviatedTree(trav=trav)
+
+#
+# CONCATENATED FILE
+#
+
+"""
+syntax_abbrev.py - Abbreviations for pretty-printing syntax.asdl.
+
+This module is not used directly, but is combined with generated code.
+"""
+
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.hnode_asdl import hnode_t
+from asdl import runtime
+
+
+def _AbbreviateToken(tok, out):
+    # type: (Token, List[hnode_t]) -> None
+    tok_str = tok.line.content[tok.col:tok.col + tok.length]
+    n1 = runtime.NewLeaf(Id_str(tok.id), color_e.OtherConst)
+    out.append(n1)
+    n2 = runtime.NewLeaf(tok_str, color_e.StringConst)
+    out.append(n2)
+
+
+def _Token(obj):
+    # type: (Token) -> hnode_t
+    p_node = runtime.NewRecord('')  # don't show node type
+    p_node.abbrev = True
+
+    p_node.left = '<'
+    p_node.right = '>'
+    _AbbreviateToken(obj, p_node.unnamed_fields)
+    return p_node
+
+
+def _CompoundWord(obj):
+    # type: (CompoundWord) -> hnode_t
+    p_node = runtime.NewRecord('')  # don't show node type
+    p_node.abbrev = True
+    p_node.left = '{'
+    p_node.right = '}'
+
+    for part in obj.parts:
+        p_node.unnamed_fields.append(part.AbbreviatedTree())
+    return p_node
+
+
+def _DoubleQuoted(obj):
+    # type: (DoubleQuoted) -> hnode_t
+    if obj.left.id != Id.Left_DoubleQuote:
+        return None  # Fall back on obj._AbbreviatedTree()
+
+    p_node = runtime.NewRecord('DQ')
+    p_node.abbrev = True
+
+    for part in obj.parts:
+        p_node.unnamed_fields.append(part.AbbreviatedTree())
+    return p_node
+
+
+def _SingleQuoted(obj):
+    # type: (SingleQuoted) -> hnode_t
+
+    # Only abbreviate 'foo', not $'foo\n' or r'foo'
+    if obj.left.id != Id.Left_SingleQuote:
+        return None  # Fall back on obj._AbbreviatedTree()
+
+    p_node = runtime.NewRecord('SQ')
+    p_node.abbrev = True
+
+    n2 = runtime.NewLeaf(obj.sval, color_e.StringConst)
+    p_node.unnamed_fields.append(n2)
+    return p_node
+
+
+def _SimpleVarSub(obj):
+    # type: (SimpleVarSub) -> hnode_t
+    p_node = runtime.NewRecord('$')
+    p_node.abbrev = True
+
+    if obj.tok.id in (Id.VSub_DollarName, Id.VSub_Number):  # $myvar or $1
+        # We want to show the variable name
+        # _AbbreviateToken(obj.tok, p_node.unnamed_fields)
+        tok = obj.tok
+        # Omit $
+        var_name = tok.line.content[tok.col + 1:tok.col + tok.length]
+        n1 = runtime.NewLeaf(var_name, color_e.StringConst)
+        p_node.unnamed_fields.append(n1)
+    else:  # $?
+        n1 = runtime.NewLeaf(Id_str(obj.tok.id), color_e.OtherConst)
+        p_node.unnamed_fields.append(n1)
+
+    return p_node
+
+
+def _BracedVarSub(obj):
+    # type: (BracedVarSub) -> hnode_t
+    p_node = runtime.NewRecord('${')
+    if obj.prefix_op or obj.bracket_op or obj.suffix_op:
+        return None  # we have other fields to display; don't abbreviate
+
+    p_node.abbrev = True
+    _AbbreviateToken(obj.token, p_node.unnamed_fields)
+    return p_node
+
+
+def _command__Simple(obj):
+    # type: (command.Simple) -> hnode_t
+    p_node = runtime.NewRecord('C')
+    if (obj.redirects or obj.more_env or obj.typed_args or obj.block or
+            obj.do_fork == False):
+        return None  # we have other fields to display; don't abbreviate
+
+    p_node.abbrev = True
+
+    for w in obj.words:
+        p_node.unnamed_fields.append(w.AbbreviatedTree())
+    return p_node
+
+
+def _expr__Var(obj):
+    # type: (expr.Var) -> hnode_t
+    p_node = runtime.NewRecord('Var')
+    p_node.abbrev = True
+
+    assert obj.left.id == Id.Expr_Name, obj.name
+    n1 = runtime.NewLeaf(obj.name, color_e.StringConst)
+    p_node.unnamed_fields.append(n1)
+    return p_node
+
+
+def _expr__Const(obj):
+    # type: (expr.Const) -> hnode_t
+    p_node = runtime.NewRecord('Const')
+    p_node.abbrev = True
+
+    tok = obj.c
+    out = p_node.unnamed_fields
+
+    n1 = runtime.NewLeaf(Id_str(tok.id), color_e.OtherConst)
+    out.append(n1)
+
+    n2 = runtime.NewLeaf(tok.tval, color_e.StringConst)
+    out.append(n2)
+    return p_node
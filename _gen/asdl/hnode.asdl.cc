@@ -0,0 +1,259 @@
+// _gen/asdl/hnode.asdl.cc is generated by asdl_main.py
+
+#include "_gen/asdl/hnode.asdl.h"
+#include <assert.h>
+#include "prebuilt/asdl/runtime.mycpp.h"  // generated code uses wrappers here
+
+// Generated code uses these types
+using hnode_asdl::hnode;
+using hnode_asdl::Field;
+using hnode_asdl::color_e;
+
+
+namespace hnode_asdl {
+
+BigStr* color_str(color_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case color_e::TypeName:
+    v = "TypeName"; break;
+  case color_e::StringConst:
+    v = "StringConst"; break;
+  case color_e::OtherConst:
+    v = "OtherConst"; break;
+  case color_e::UserType:
+    v = "UserType"; break;
+  case color_e::External:
+    v = "External"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "color.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* Field::PrettyTree(Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Field"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = runtime::NewLeaf(this->name, color_e::StringConst);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = this->val->PrettyTree(seen);
+  L->append(Alloc<Field>(StrFromC("val"), x1));
+
+  return out_node;
+}
+
+BigStr* hnode_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case hnode_e::AlreadySeen:
+    v = "AlreadySeen"; break;
+  case hnode_e::Record:
+    v = "Record"; break;
+  case hnode_e::Array:
+    v = "Array"; break;
+  case hnode_e::Leaf:
+    v = "Leaf"; break;
+  case hnode_e::External:
+    v = "External"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "hnode.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* hnode__AlreadySeen::PrettyTree(Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(str(this->heap_id), color_e::OtherConst);
+  L->append(Alloc<Field>(StrFromC("heap_id"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* hnode__Record::PrettyTree(Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = runtime::NewLeaf(this->node_type, color_e::StringConst);
+  L->append(Alloc<Field>(StrFromC("node_type"), x0));
+
+  if (this->fields != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Field*> it(this->fields); !it.Done(); it.Next()) {
+      Field* i1 = it.Value();
+      hnode_t* h = (i1 == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : i1->PrettyTree(seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("fields"), x1));
+  }
+
+  hnode_t* x2 = Alloc<hnode::Leaf>(this->abbrev ? runtime::TRUE_STR :
+                                   runtime::FALSE_STR, color_e::OtherConst);
+  L->append(Alloc<Field>(StrFromC("abbrev"), x2));
+
+  hnode_t* x3 = runtime::NewLeaf(this->left, color_e::StringConst);
+  L->append(Alloc<Field>(StrFromC("left"), x3));
+
+  hnode_t* x4 = runtime::NewLeaf(this->right, color_e::StringConst);
+  L->append(Alloc<Field>(StrFromC("right"), x4));
+
+  if (this->unnamed_fields != nullptr) {  // List
+    hnode::Array* x5 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<hnode_t*> it(this->unnamed_fields); !it.Done(); it.Next()) {
+      hnode_t* i5 = it.Value();
+      hnode_t* h = (i5 == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : i5->PrettyTree(seen);
+      x5->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("unnamed_fields"), x5));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* hnode__Array::PrettyTree(Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<hnode_t*> it(this->children); !it.Done(); it.Next()) {
+      hnode_t* i0 = it.Value();
+      hnode_t* h = (i0 == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : i0->PrettyTree(seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* hnode__Leaf::PrettyTree(Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = runtime::NewLeaf(this->s, color_e::StringConst);
+  L->append(Alloc<Field>(StrFromC("s"), x0));
+
+  hnode_t* x1 = Alloc<hnode::Leaf>(color_str(this->color), color_e::TypeName);
+  L->append(Alloc<Field>(StrFromC("color"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* hnode__External::PrettyTree(Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::External>(this->obj);
+  L->append(Alloc<Field>(StrFromC("obj"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* hnode_t::PrettyTree(Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case hnode_e::AlreadySeen: {
+    hnode__AlreadySeen* obj = static_cast<hnode__AlreadySeen*>(this);
+    return obj->PrettyTree(seen);
+  }
+  case hnode_e::Record: {
+    hnode__Record* obj = static_cast<hnode__Record*>(this);
+    return obj->PrettyTree(seen);
+  }
+  case hnode_e::Array: {
+    hnode__Array* obj = static_cast<hnode__Array*>(this);
+    return obj->PrettyTree(seen);
+  }
+  case hnode_e::Leaf: {
+    hnode__Leaf* obj = static_cast<hnode__Leaf*>(this);
+    return obj->PrettyTree(seen);
+  }
+  case hnode_e::External: {
+    hnode__External* obj = static_cast<hnode__External*>(this);
+    return obj->PrettyTree(seen);
+  }
+  default:
+    assert(0);
+  }
+}
+BigStr* alloc_members_str(alloc_members_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case alloc_members_e::List:
+    v = "List"; break;
+  case alloc_members_e::Dict:
+    v = "Dict"; break;
+  case alloc_members_e::Struct:
+    v = "Struct"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "alloc_members.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+}  // namespace hnode_asdl
@@ -0,0 +1 @@
+const char* gCommitHash = "ref: refs/heads/master";
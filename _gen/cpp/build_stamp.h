@@ -0,0 +1 @@
+extern const char* gCommitHash;
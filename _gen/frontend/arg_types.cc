@@ -0,0 +1,916 @@
+// arg_types.cc is generated by frontend/flag_gen.py
+
+#include "arg_types.h"
+using runtime_asdl::flag_type_e;
+
+namespace arg_types {
+
+GLOBAL_STR(kFlag_A, "A");
+GLOBAL_STR(kFlag_C, "C");
+GLOBAL_STR(kFlag_D, "D");
+GLOBAL_STR(kFlag_E, "E");
+GLOBAL_STR(kFlag_F, "F");
+GLOBAL_STR(kFlag_H, "H");
+GLOBAL_STR(kFlag_L, "L");
+GLOBAL_STR(kFlag_N, "N");
+GLOBAL_STR(kFlag_P, "P");
+GLOBAL_STR(kFlag_S, "S");
+GLOBAL_STR(kFlag_V, "V");
+GLOBAL_STR(kFlag_W, "W");
+GLOBAL_STR(kFlag_X, "X");
+GLOBAL_STR(kFlag_Z, "Z");
+GLOBAL_STR(kFlag_a, "a");
+GLOBAL_STR(kFlag_all, "all");
+GLOBAL_STR(kFlag_assign, "assign");
+GLOBAL_STR(kFlag_ast_format, "ast_format");
+GLOBAL_STR(kFlag_begin, "begin");
+GLOBAL_STR(kFlag_builtin, "builtin");
+GLOBAL_STR(kFlag_c, "c");
+GLOBAL_STR(kFlag_completion_demo, "completion_demo");
+GLOBAL_STR(kFlag_completion_display, "completion_display");
+GLOBAL_STR(kFlag_d, "d");
+GLOBAL_STR(kFlag_debug, "debug");
+GLOBAL_STR(kFlag_debug_file, "debug_file");
+GLOBAL_STR(kFlag_do_lossless, "do_lossless");
+GLOBAL_STR(kFlag_e, "e");
+GLOBAL_STR(kFlag_end, "end");
+GLOBAL_STR(kFlag_f, "f");
+GLOBAL_STR(kFlag_format, "format");
+GLOBAL_STR(kFlag_g, "g");
+GLOBAL_STR(kFlag_h, "h");
+GLOBAL_STR(kFlag_headless, "headless");
+GLOBAL_STR(kFlag_help, "help");
+GLOBAL_STR(kFlag_i, "i");
+GLOBAL_STR(kFlag_indent, "indent");
+GLOBAL_STR(kFlag_j8, "j8");
+GLOBAL_STR(kFlag_json, "json");
+GLOBAL_STR(kFlag_l, "l");
+GLOBAL_STR(kFlag_line, "line");
+GLOBAL_STR(kFlag_lines, "lines");
+GLOBAL_STR(kFlag_location_start_line, "location_start_line");
+GLOBAL_STR(kFlag_location_str, "location_str");
+GLOBAL_STR(kFlag_login, "login");
+GLOBAL_STR(kFlag_n, "n");
+GLOBAL_STR(kFlag_norc, "norc");
+GLOBAL_STR(kFlag_num_bytes, "num_bytes");
+GLOBAL_STR(kFlag_o, "o");
+GLOBAL_STR(kFlag_p, "p");
+GLOBAL_STR(kFlag_pretty, "pretty");
+GLOBAL_STR(kFlag_print_status, "print_status");
+GLOBAL_STR(kFlag_q, "q");
+GLOBAL_STR(kFlag_r, "r");
+GLOBAL_STR(kFlag_rcdir, "rcdir");
+GLOBAL_STR(kFlag_rcfile, "rcfile");
+GLOBAL_STR(kFlag_s, "s");
+GLOBAL_STR(kFlag_sep, "sep");
+GLOBAL_STR(kFlag_surrogate_ok, "surrogate_ok");
+GLOBAL_STR(kFlag_t, "t");
+GLOBAL_STR(kFlag_tool, "tool");
+GLOBAL_STR(kFlag_u, "u");
+GLOBAL_STR(kFlag_v, "v");
+GLOBAL_STR(kFlag_version, "version");
+GLOBAL_STR(kFlag_with_eol, "with_eol");
+GLOBAL_STR(kFlag_x, "x");
+GLOBAL_STR(kFlag_xtrace_to_debug_file, "xtrace_to_debug_file");
+
+static inline bool _Bool(value_asdl::value_t* val) {
+  return static_cast<value::Bool*>(val)->b;
+}
+
+static inline BigStr* _Str(value_asdl::value_t* val) {
+  return val->tag() == value_e::Undef ? nullptr
+                                      : static_cast<value::Str*>(val)->s;
+}
+
+static inline int _Int(value_asdl::value_t* val) {
+  return val->tag() == value_e::Undef ? -1
+                                      : static_cast<value::Int*>(val)->i;
+}
+
+static inline float _Float(value_asdl::value_t* val) {
+  return val->tag() == value_e::Undef ? -1
+                                      : static_cast<value::Float*>(val)->f;
+}
+
+cd::cd(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : L(_Bool(attrs->at(kFlag_L))),
+      P(_Bool(attrs->at(kFlag_P))) {
+}
+
+command::command(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : V(_Bool(attrs->at(kFlag_V))),
+      p(_Bool(attrs->at(kFlag_p))),
+      v(_Bool(attrs->at(kFlag_v))) {
+}
+
+compadjust::compadjust(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : n(_Str(attrs->at(kFlag_n))),
+      s(_Bool(attrs->at(kFlag_s))) {
+}
+
+compexport::compexport(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : begin(_Int(attrs->at(kFlag_begin))),
+      c(_Str(attrs->at(kFlag_c))),
+      end(_Int(attrs->at(kFlag_end))),
+      format(_Str(attrs->at(kFlag_format))) {
+}
+
+compgen::compgen(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : C(_Str(attrs->at(kFlag_C))),
+      F(_Str(attrs->at(kFlag_F))),
+      P(_Str(attrs->at(kFlag_P))),
+      S(_Str(attrs->at(kFlag_S))),
+      W(_Str(attrs->at(kFlag_W))),
+      X(_Str(attrs->at(kFlag_X))) {
+}
+
+complete::complete(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : C(_Str(attrs->at(kFlag_C))),
+      D(_Bool(attrs->at(kFlag_D))),
+      E(_Bool(attrs->at(kFlag_E))),
+      F(_Str(attrs->at(kFlag_F))),
+      P(_Str(attrs->at(kFlag_P))),
+      S(_Str(attrs->at(kFlag_S))),
+      W(_Str(attrs->at(kFlag_W))),
+      X(_Str(attrs->at(kFlag_X))) {
+}
+
+dirs::dirs(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : c(_Bool(attrs->at(kFlag_c))),
+      l(_Bool(attrs->at(kFlag_l))),
+      p(_Bool(attrs->at(kFlag_p))),
+      v(_Bool(attrs->at(kFlag_v))) {
+}
+
+echo::echo(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : e(_Bool(attrs->at(kFlag_e))),
+      n(_Bool(attrs->at(kFlag_n))) {
+}
+
+export_::export_(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : f(_Bool(attrs->at(kFlag_f))),
+      n(_Bool(attrs->at(kFlag_n))),
+      p(_Bool(attrs->at(kFlag_p))) {
+}
+
+hash::hash(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : r(_Bool(attrs->at(kFlag_r))) {
+}
+
+history::history(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : a(_Bool(attrs->at(kFlag_a))),
+      c(_Bool(attrs->at(kFlag_c))),
+      d(_Int(attrs->at(kFlag_d))),
+      r(_Bool(attrs->at(kFlag_r))) {
+}
+
+jobs::jobs(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : debug(_Bool(attrs->at(kFlag_debug))),
+      l(_Bool(attrs->at(kFlag_l))),
+      p(_Bool(attrs->at(kFlag_p))) {
+}
+
+json_read::json_read(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : lines(_Bool(attrs->at(kFlag_lines))) {
+}
+
+json_write::json_write(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : indent(_Int(attrs->at(kFlag_indent))),
+      lines(_Bool(attrs->at(kFlag_lines))),
+      pretty(_Bool(attrs->at(kFlag_pretty))),
+      surrogate_ok(_Bool(attrs->at(kFlag_surrogate_ok))) {
+}
+
+main::main(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : ast_format(_Str(attrs->at(kFlag_ast_format))),
+      c(_Str(attrs->at(kFlag_c))),
+      completion_demo(_Bool(attrs->at(kFlag_completion_demo))),
+      completion_display(_Str(attrs->at(kFlag_completion_display))),
+      debug_file(_Str(attrs->at(kFlag_debug_file))),
+      do_lossless(_Bool(attrs->at(kFlag_do_lossless))),
+      headless(_Bool(attrs->at(kFlag_headless))),
+      help(_Bool(attrs->at(kFlag_help))),
+      i(_Bool(attrs->at(kFlag_i))),
+      l(_Bool(attrs->at(kFlag_l))),
+      location_start_line(_Int(attrs->at(kFlag_location_start_line))),
+      location_str(_Str(attrs->at(kFlag_location_str))),
+      login(_Bool(attrs->at(kFlag_login))),
+      norc(_Bool(attrs->at(kFlag_norc))),
+      print_status(_Bool(attrs->at(kFlag_print_status))),
+      rcdir(_Str(attrs->at(kFlag_rcdir))),
+      rcfile(_Str(attrs->at(kFlag_rcfile))),
+      tool(_Str(attrs->at(kFlag_tool))),
+      version(_Bool(attrs->at(kFlag_version))),
+      xtrace_to_debug_file(_Bool(attrs->at(kFlag_xtrace_to_debug_file))) {
+}
+
+mapfile::mapfile(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : t(_Bool(attrs->at(kFlag_t))) {
+}
+
+new_var::new_var(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : A(_Bool(attrs->at(kFlag_A))),
+      F(_Bool(attrs->at(kFlag_F))),
+      a(_Bool(attrs->at(kFlag_a))),
+      f(_Bool(attrs->at(kFlag_f))),
+      g(_Bool(attrs->at(kFlag_g))),
+      i(_Bool(attrs->at(kFlag_i))),
+      n(_Str(attrs->at(kFlag_n))),
+      p(_Bool(attrs->at(kFlag_p))),
+      r(_Str(attrs->at(kFlag_r))),
+      x(_Str(attrs->at(kFlag_x))) {
+}
+
+printf::printf(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : v(_Str(attrs->at(kFlag_v))) {
+}
+
+pwd::pwd(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : L(_Bool(attrs->at(kFlag_L))),
+      P(_Bool(attrs->at(kFlag_P))) {
+}
+
+read::read(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : N(_Int(attrs->at(kFlag_N))),
+      Z(_Bool(attrs->at(kFlag_Z))),
+      a(_Str(attrs->at(kFlag_a))),
+      all(_Bool(attrs->at(kFlag_all))),
+      d(_Str(attrs->at(kFlag_d))),
+      j8(_Bool(attrs->at(kFlag_j8))),
+      json(_Bool(attrs->at(kFlag_json))),
+      line(_Bool(attrs->at(kFlag_line))),
+      n(_Int(attrs->at(kFlag_n))),
+      num_bytes(_Int(attrs->at(kFlag_num_bytes))),
+      p(_Str(attrs->at(kFlag_p))),
+      r(_Bool(attrs->at(kFlag_r))),
+      s(_Bool(attrs->at(kFlag_s))),
+      t(_Float(attrs->at(kFlag_t))),
+      u(_Int(attrs->at(kFlag_u))),
+      with_eol(_Bool(attrs->at(kFlag_with_eol))) {
+}
+
+readonly::readonly(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : A(_Bool(attrs->at(kFlag_A))),
+      a(_Bool(attrs->at(kFlag_a))),
+      p(_Bool(attrs->at(kFlag_p))) {
+}
+
+runproc::runproc(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : h(_Bool(attrs->at(kFlag_h))) {
+}
+
+shopt::shopt(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : o(_Bool(attrs->at(kFlag_o))),
+      p(_Bool(attrs->at(kFlag_p))),
+      q(_Bool(attrs->at(kFlag_q))),
+      s(_Bool(attrs->at(kFlag_s))),
+      u(_Bool(attrs->at(kFlag_u))) {
+}
+
+source::source(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : builtin(_Bool(attrs->at(kFlag_builtin))) {
+}
+
+trap::trap(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : l(_Bool(attrs->at(kFlag_l))),
+      p(_Bool(attrs->at(kFlag_p))) {
+}
+
+try_::try_(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : assign(_Str(attrs->at(kFlag_assign))) {
+}
+
+type::type(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : P(_Bool(attrs->at(kFlag_P))),
+      a(_Bool(attrs->at(kFlag_a))),
+      f(_Bool(attrs->at(kFlag_f))),
+      p(_Bool(attrs->at(kFlag_p))),
+      t(_Bool(attrs->at(kFlag_t))) {
+}
+
+ulimit::ulimit(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : H(_Bool(attrs->at(kFlag_H))),
+      S(_Bool(attrs->at(kFlag_S))),
+      a(_Bool(attrs->at(kFlag_a))),
+      all(_Bool(attrs->at(kFlag_all))),
+      c(_Bool(attrs->at(kFlag_c))),
+      d(_Bool(attrs->at(kFlag_d))),
+      f(_Bool(attrs->at(kFlag_f))),
+      n(_Bool(attrs->at(kFlag_n))),
+      s(_Bool(attrs->at(kFlag_s))),
+      t(_Bool(attrs->at(kFlag_t))),
+      v(_Bool(attrs->at(kFlag_v))) {
+}
+
+unset::unset(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : f(_Bool(attrs->at(kFlag_f))),
+      v(_Bool(attrs->at(kFlag_v))) {
+}
+
+wait::wait(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : n(_Bool(attrs->at(kFlag_n))) {
+}
+
+write::write(Dict<BigStr*, value_asdl::value_t*>* attrs)
+    : end(_Str(attrs->at(kFlag_end))),
+      j8(_Bool(attrs->at(kFlag_j8))),
+      json(_Bool(attrs->at(kFlag_json))),
+      n(_Bool(attrs->at(kFlag_n))),
+      sep(_Str(attrs->at(kFlag_sep))) {
+}
+
+const char* arity0_3[] = {"L", "P", nullptr};
+
+DefaultPair_c defaults_3[] = {
+    {"L", flag_type_e::Bool, {.b = false}},
+    {"P", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_4[] = {"V", "p", "v", nullptr};
+
+DefaultPair_c defaults_4[] = {
+    {"V", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {"v", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_6[] = {"c", "l", "p", "v", nullptr};
+
+DefaultPair_c defaults_6[] = {
+    {"c", flag_type_e::Bool, {.b = false}},
+    {"l", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {"v", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_7[] = {"e", "n", nullptr};
+
+DefaultPair_c defaults_7[] = {
+    {"e", flag_type_e::Bool, {.b = false}},
+    {"n", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_11[] = {"f", "n", "p", nullptr};
+
+DefaultPair_c defaults_11[] = {
+    {"f", flag_type_e::Bool, {.b = false}},
+    {"n", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_15[] = {"r", nullptr};
+
+DefaultPair_c defaults_15[] = {
+    {"r", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_17[] = {"a", "c", "r", nullptr};
+
+Action_c arity1_17[] = {
+    {"d", ActionType_c::SetToInt, "d", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_17[] = {
+    {"a", flag_type_e::Bool, {.b = false}},
+    {"c", flag_type_e::Bool, {.b = false}},
+    {"d", flag_type_e::Int, {.i = -1}},
+    {"r", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_18[] = {"l", "p", nullptr};
+
+Action_c actions_long_18[] = {
+    {"debug", ActionType_c::SetToTrue, "debug", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_18[] = {
+    {"debug", flag_type_e::Bool, {.b = false}},
+    {"l", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c actions_long_19[] = {
+    {"lines", ActionType_c::SetAttachedBool, "lines", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_19[] = {
+    {"lines", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c actions_long_20[] = {
+    {"indent", ActionType_c::SetToInt, "indent", nullptr},
+    {"lines", ActionType_c::SetAttachedBool, "lines", nullptr},
+    {"pretty", ActionType_c::SetAttachedBool, "pretty", nullptr},
+    {"surrogate-ok", ActionType_c::SetAttachedBool, "surrogate-ok", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_20[] = {
+    {"indent", flag_type_e::Int, {.i = 2}},
+    {"lines", flag_type_e::Bool, {.b = false}},
+    {"pretty", flag_type_e::Bool, {.b = true}},
+    {"surrogate_ok", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_21[] = {"t", nullptr};
+
+DefaultPair_c defaults_21[] = {
+    {"t", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_23[] = {"A", "F", "a", "f", "g", "i", "p", nullptr};
+
+const char* plus_23[] = {"n", "r", "x", nullptr};
+
+DefaultPair_c defaults_23[] = {
+    {"A", flag_type_e::Bool, {.b = false}},
+    {"F", flag_type_e::Bool, {.b = false}},
+    {"a", flag_type_e::Bool, {.b = false}},
+    {"f", flag_type_e::Bool, {.b = false}},
+    {"g", flag_type_e::Bool, {.b = false}},
+    {"i", flag_type_e::Bool, {.b = false}},
+    {"n", flag_type_e::Str, {}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {"r", flag_type_e::Str, {}},
+    {"x", flag_type_e::Str, {}},
+    {},
+};
+
+Action_c arity1_26[] = {
+    {"v", ActionType_c::SetToString, "v", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_26[] = {
+    {"v", flag_type_e::Str, {}},
+    {},
+};
+
+const char* arity0_29[] = {"L", "P", nullptr};
+
+DefaultPair_c defaults_29[] = {
+    {"L", flag_type_e::Bool, {.b = false}},
+    {"P", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_30[] = {"Z", "r", "s", nullptr};
+
+Action_c arity1_30[] = {
+    {"N", ActionType_c::SetToInt, "N", nullptr},
+    {"a", ActionType_c::SetToString, "a", nullptr},
+    {"d", ActionType_c::SetToString, "d", nullptr},
+    {"n", ActionType_c::SetToInt, "n", nullptr},
+    {"p", ActionType_c::SetToString, "p", nullptr},
+    {"t", ActionType_c::SetToFloat, "t", nullptr},
+    {"u", ActionType_c::SetToInt, "u", nullptr},
+    {},
+};
+
+Action_c actions_long_30[] = {
+    {"all", ActionType_c::SetToTrue, "all", nullptr},
+    {"j8", ActionType_c::SetAttachedBool, "j8", nullptr},
+    {"json", ActionType_c::SetAttachedBool, "json", nullptr},
+    {"line", ActionType_c::SetToTrue, "line", nullptr},
+    {"num-bytes", ActionType_c::SetToInt, "num-bytes", nullptr},
+    {"with-eol", ActionType_c::SetToTrue, "with-eol", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_30[] = {
+    {"N", flag_type_e::Int, {.i = -1}},
+    {"Z", flag_type_e::Bool, {.b = false}},
+    {"a", flag_type_e::Str, {}},
+    {"all", flag_type_e::Bool, {.b = false}},
+    {"d", flag_type_e::Str, {}},
+    {"j8", flag_type_e::Bool, {.b = false}},
+    {"json", flag_type_e::Bool, {.b = false}},
+    {"line", flag_type_e::Bool, {.b = false}},
+    {"n", flag_type_e::Int, {.i = -1}},
+    {"num_bytes", flag_type_e::Int, {.i = -1}},
+    {"p", flag_type_e::Str, {}},
+    {"r", flag_type_e::Bool, {.b = false}},
+    {"s", flag_type_e::Bool, {.b = false}},
+    {"t", flag_type_e::Float, {.f = -1.0}},
+    {"u", flag_type_e::Int, {.i = -1}},
+    {"with_eol", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_31[] = {"A", "a", "p", nullptr};
+
+DefaultPair_c defaults_31[] = {
+    {"A", flag_type_e::Bool, {.b = false}},
+    {"a", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c arity1_32[] = {
+    {"h", ActionType_c::SetAttachedBool, "h", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_32[] = {
+    {"h", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_33[] = {"o", "p", "q", "s", "u", nullptr};
+
+Action_c actions_long_33[] = {
+    {"set", ActionType_c::SetToTrue, "s", nullptr},
+    {"unset", ActionType_c::SetToTrue, "u", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_33[] = {
+    {"o", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {"q", flag_type_e::Bool, {.b = false}},
+    {"s", flag_type_e::Bool, {.b = false}},
+    {"u", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c actions_long_36[] = {
+    {"builtin", ActionType_c::SetToTrue, "builtin", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_36[] = {
+    {"builtin", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_37[] = {"l", "p", nullptr};
+
+DefaultPair_c defaults_37[] = {
+    {"l", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c actions_long_38[] = {
+    {"assign", ActionType_c::SetToString, "assign", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_38[] = {
+    {"assign", flag_type_e::Str, {}},
+    {},
+};
+
+const char* arity0_39[] = {"P", "a", "f", "p", "t", nullptr};
+
+DefaultPair_c defaults_39[] = {
+    {"P", flag_type_e::Bool, {.b = false}},
+    {"a", flag_type_e::Bool, {.b = false}},
+    {"f", flag_type_e::Bool, {.b = false}},
+    {"p", flag_type_e::Bool, {.b = false}},
+    {"t", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_40[] = {"H", "S", "a", "c", "d", "f", "n", "s", "t", "v", nullptr};
+
+Action_c actions_long_40[] = {
+    {"all", ActionType_c::SetToTrue, "all", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_40[] = {
+    {"H", flag_type_e::Bool, {.b = false}},
+    {"S", flag_type_e::Bool, {.b = false}},
+    {"a", flag_type_e::Bool, {.b = false}},
+    {"all", flag_type_e::Bool, {.b = false}},
+    {"c", flag_type_e::Bool, {.b = false}},
+    {"d", flag_type_e::Bool, {.b = false}},
+    {"f", flag_type_e::Bool, {.b = false}},
+    {"n", flag_type_e::Bool, {.b = false}},
+    {"s", flag_type_e::Bool, {.b = false}},
+    {"t", flag_type_e::Bool, {.b = false}},
+    {"v", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_42[] = {"f", "v", nullptr};
+
+DefaultPair_c defaults_42[] = {
+    {"f", flag_type_e::Bool, {.b = false}},
+    {"v", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+const char* arity0_43[] = {"n", nullptr};
+
+DefaultPair_c defaults_43[] = {
+    {"n", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c arity1_44[] = {
+    {"n", ActionType_c::SetAttachedBool, "n", nullptr},
+    {},
+};
+
+Action_c actions_long_44[] = {
+    {"end", ActionType_c::SetToString, "end", nullptr},
+    {"j8", ActionType_c::SetAttachedBool, "j8", nullptr},
+    {"json", ActionType_c::SetAttachedBool, "json", nullptr},
+    {"sep", ActionType_c::SetToString, "sep", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_44[] = {
+    {"end", flag_type_e::Str, {.s = "\n"}},
+    {"j8", flag_type_e::Bool, {.b = false}},
+    {"json", flag_type_e::Bool, {.b = false}},
+    {"n", flag_type_e::Bool, {.b = false}},
+    {"sep", flag_type_e::Str, {.s = "\n"}},
+    {},
+};
+
+FlagSpec_c kFlagSpecs[] = {
+    { "alias", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "append", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "boolstatus", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "cd", arity0_3, nullptr, nullptr, nullptr, defaults_3 },
+    { "command", arity0_4, nullptr, nullptr, nullptr, defaults_4 },
+    { "ctx", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "dirs", arity0_6, nullptr, nullptr, nullptr, defaults_6 },
+    { "echo", arity0_7, nullptr, nullptr, nullptr, defaults_7 },
+    { "error", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "eval", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "exec", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "export_", arity0_11, nullptr, nullptr, nullptr, defaults_11 },
+    { "fopen", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "fork", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "forkwait", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "hash", arity0_15, nullptr, nullptr, nullptr, defaults_15 },
+    { "help", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "history", arity0_17, arity1_17, nullptr, nullptr, defaults_17 },
+    { "jobs", arity0_18, nullptr, actions_long_18, nullptr, defaults_18 },
+    { "json_read", nullptr, nullptr, actions_long_19, nullptr, defaults_19 },
+    { "json_write", nullptr, nullptr, actions_long_20, nullptr, defaults_20 },
+    { "mapfile", arity0_21, nullptr, nullptr, nullptr, defaults_21 },
+    { "module", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "new_var", arity0_23, nullptr, nullptr, plus_23, defaults_23 },
+    { "popd", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "pp", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "printf", nullptr, arity1_26, nullptr, nullptr, defaults_26 },
+    { "push-registers", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "pushd", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "pwd", arity0_29, nullptr, nullptr, nullptr, defaults_29 },
+    { "read", arity0_30, arity1_30, actions_long_30, nullptr, defaults_30 },
+    { "readonly", arity0_31, nullptr, nullptr, nullptr, defaults_31 },
+    { "runproc", nullptr, arity1_32, nullptr, nullptr, defaults_32 },
+    { "shopt", arity0_33, nullptr, actions_long_33, nullptr, defaults_33 },
+    { "shvar", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "shvm", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "source", nullptr, nullptr, actions_long_36, nullptr, defaults_36 },
+    { "trap", arity0_37, nullptr, nullptr, nullptr, defaults_37 },
+    { "try_", nullptr, nullptr, actions_long_38, nullptr, defaults_38 },
+    { "type", arity0_39, nullptr, nullptr, nullptr, defaults_39 },
+    { "ulimit", arity0_40, nullptr, actions_long_40, nullptr, defaults_40 },
+    { "unalias", nullptr, nullptr, nullptr, nullptr, nullptr },
+    { "unset", arity0_42, nullptr, nullptr, nullptr, defaults_42 },
+    { "wait", arity0_43, nullptr, nullptr, nullptr, defaults_43 },
+    { "write", nullptr, arity1_44, actions_long_44, nullptr, defaults_44 },
+    {},
+};
+
+Action_c short_45[] = {
+    {"n", ActionType_c::SetToString, "n", nullptr},
+    {"s", ActionType_c::SetToTrue, "s", nullptr},
+    {},
+};
+
+DefaultPair_c defaults_45[] = {
+    {"n", flag_type_e::Str, {}},
+    {"s", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c short_46[] = {
+    {"c", ActionType_c::SetToString, "c", nullptr},
+    {},
+};
+
+const char* params_0[] = {"jlines", "tsv8", nullptr};
+
+Action_c long_46[] = {
+    {"begin", ActionType_c::SetToInt, "begin", nullptr},
+    {"end", ActionType_c::SetToInt, "end", nullptr},
+    {"format", ActionType_c::SetToString, "format", params_0},
+    {},
+};
+
+DefaultPair_c defaults_46[] = {
+    {"begin", flag_type_e::Int, {.i = -1}},
+    {"c", flag_type_e::Str, {}},
+    {"end", flag_type_e::Int, {.i = -1}},
+    {"format", flag_type_e::Str, {.s = "jlines"}},
+    {},
+};
+
+const char* params_1[] = {"alias", "binding", "builtin", "command", "directory", "export", "file", "function", "helptopic", "job", "keyword", "setopt", "shopt", "signal", "stopped", "user", "variable", nullptr};
+
+const char* params_2[] = {"bashdefault", "default", "dirnames", "filenames", "nospace", "plusdirs", nullptr};
+
+Action_c short_47[] = {
+    {"A", ActionType_c::SetNamedAction, nullptr, params_1},
+    {"C", ActionType_c::SetToString, "C", nullptr},
+    {"F", ActionType_c::SetToString, "F", nullptr},
+    {"P", ActionType_c::SetToString, "P", nullptr},
+    {"S", ActionType_c::SetToString, "S", nullptr},
+    {"W", ActionType_c::SetToString, "W", nullptr},
+    {"X", ActionType_c::SetToString, "X", nullptr},
+    {"a", ActionType_c::SetAction, "alias", nullptr},
+    {"b", ActionType_c::SetAction, "binding", nullptr},
+    {"c", ActionType_c::SetAction, "command", nullptr},
+    {"d", ActionType_c::SetAction, "directory", nullptr},
+    {"e", ActionType_c::SetAction, "export", nullptr},
+    {"f", ActionType_c::SetAction, "file", nullptr},
+    {"j", ActionType_c::SetAction, "job", nullptr},
+    {"k", ActionType_c::SetAction, "keyword", nullptr},
+    {"o", ActionType_c::SetNamedOption, nullptr, params_2},
+    {"u", ActionType_c::SetAction, "user", nullptr},
+    {"v", ActionType_c::SetAction, "variable", nullptr},
+    {},
+};
+
+const char* plus_2[] = {"o", nullptr};
+
+DefaultPair_c defaults_47[] = {
+    {"C", flag_type_e::Str, {}},
+    {"F", flag_type_e::Str, {}},
+    {"P", flag_type_e::Str, {}},
+    {"S", flag_type_e::Str, {}},
+    {"W", flag_type_e::Str, {}},
+    {"X", flag_type_e::Str, {}},
+    {},
+};
+
+const char* params_3[] = {"alias", "binding", "builtin", "command", "directory", "export", "file", "function", "helptopic", "job", "keyword", "setopt", "shopt", "signal", "stopped", "user", "variable", nullptr};
+
+const char* params_4[] = {"bashdefault", "default", "dirnames", "filenames", "nospace", "plusdirs", nullptr};
+
+Action_c short_48[] = {
+    {"A", ActionType_c::SetNamedAction, nullptr, params_3},
+    {"C", ActionType_c::SetToString, "C", nullptr},
+    {"D", ActionType_c::SetToTrue, "D", nullptr},
+    {"E", ActionType_c::SetToTrue, "E", nullptr},
+    {"F", ActionType_c::SetToString, "F", nullptr},
+    {"P", ActionType_c::SetToString, "P", nullptr},
+    {"S", ActionType_c::SetToString, "S", nullptr},
+    {"W", ActionType_c::SetToString, "W", nullptr},
+    {"X", ActionType_c::SetToString, "X", nullptr},
+    {"a", ActionType_c::SetAction, "alias", nullptr},
+    {"b", ActionType_c::SetAction, "binding", nullptr},
+    {"c", ActionType_c::SetAction, "command", nullptr},
+    {"d", ActionType_c::SetAction, "directory", nullptr},
+    {"e", ActionType_c::SetAction, "export", nullptr},
+    {"f", ActionType_c::SetAction, "file", nullptr},
+    {"j", ActionType_c::SetAction, "job", nullptr},
+    {"k", ActionType_c::SetAction, "keyword", nullptr},
+    {"o", ActionType_c::SetNamedOption, nullptr, params_4},
+    {"u", ActionType_c::SetAction, "user", nullptr},
+    {"v", ActionType_c::SetAction, "variable", nullptr},
+    {},
+};
+
+const char* plus_3[] = {"o", nullptr};
+
+DefaultPair_c defaults_48[] = {
+    {"C", flag_type_e::Str, {}},
+    {"D", flag_type_e::Bool, {.b = false}},
+    {"E", flag_type_e::Bool, {.b = false}},
+    {"F", flag_type_e::Str, {}},
+    {"P", flag_type_e::Str, {}},
+    {"S", flag_type_e::Str, {}},
+    {"W", flag_type_e::Str, {}},
+    {"X", flag_type_e::Str, {}},
+    {},
+};
+
+const char* params_5[] = {"bashdefault", "default", "dirnames", "filenames", "nospace", "plusdirs", nullptr};
+
+Action_c short_49[] = {
+    {"o", ActionType_c::SetNamedOption, nullptr, params_5},
+    {},
+};
+
+const char* plus_4[] = {"o", nullptr};
+
+Action_c short_50[] = {
+    {"C", ActionType_c::SetOption, "noclobber", nullptr},
+    {"O", ActionType_c::SetNamedOption_shopt, nullptr, nullptr},
+    {"c", ActionType_c::SetToString_q, "c", nullptr},
+    {"e", ActionType_c::SetOption, "errexit", nullptr},
+    {"f", ActionType_c::SetOption, "noglob", nullptr},
+    {"h", ActionType_c::SetOption, "hashall", nullptr},
+    {"i", ActionType_c::SetToTrue, "i", nullptr},
+    {"l", ActionType_c::SetToTrue, "l", nullptr},
+    {"n", ActionType_c::SetOption, "noexec", nullptr},
+    {"o", ActionType_c::SetNamedOption, nullptr, nullptr},
+    {"u", ActionType_c::SetOption, "nounset", nullptr},
+    {"v", ActionType_c::SetOption, "verbose", nullptr},
+    {"x", ActionType_c::SetOption, "xtrace", nullptr},
+    {},
+};
+
+const char* params_6[] = {"abbrev-html", "abbrev-text", "html", "none", "oheap", "text", nullptr};
+
+const char* params_7[] = {"minimal", "nice", nullptr};
+
+const char* params_8[] = {"cat-em", "deps", "fmt", "lossless-cat", "syntax-tree", "tokens", "ysh-ify", nullptr};
+
+Action_c long_50[] = {
+    {"ast-format", ActionType_c::SetToString, "ast-format", params_6},
+    {"completion-demo", ActionType_c::SetToTrue, "completion-demo", nullptr},
+    {"completion-display", ActionType_c::SetToString, "completion-display", params_7},
+    {"debug-file", ActionType_c::SetToString, "debug-file", nullptr},
+    {"do-lossless", ActionType_c::SetToTrue, "do-lossless", nullptr},
+    {"headless", ActionType_c::SetToTrue, "headless", nullptr},
+    {"help", ActionType_c::SetToTrue, "help", nullptr},
+    {"location-start-line", ActionType_c::SetToInt, "location-start-line", nullptr},
+    {"location-str", ActionType_c::SetToString, "location-str", nullptr},
+    {"login", ActionType_c::SetToTrue, "login", nullptr},
+    {"norc", ActionType_c::SetToTrue, "norc", nullptr},
+    {"print-status", ActionType_c::SetToTrue, "print-status", nullptr},
+    {"rcdir", ActionType_c::SetToString, "rcdir", nullptr},
+    {"rcfile", ActionType_c::SetToString, "rcfile", nullptr},
+    {"tool", ActionType_c::SetToString, "tool", params_8},
+    {"version", ActionType_c::SetToTrue, "version", nullptr},
+    {"xtrace-to-debug-file", ActionType_c::SetToTrue, "xtrace-to-debug-file", nullptr},
+    {},
+};
+
+const char* plus_5[] = {"C", "O", "e", "f", "h", "n", "o", "u", "v", "x", nullptr};
+
+DefaultPair_c defaults_50[] = {
+    {"ast_format", flag_type_e::Str, {.s = "abbrev-text"}},
+    {"c", flag_type_e::Str, {}},
+    {"completion_demo", flag_type_e::Bool, {.b = false}},
+    {"completion_display", flag_type_e::Str, {.s = "nice"}},
+    {"debug_file", flag_type_e::Str, {}},
+    {"do_lossless", flag_type_e::Bool, {.b = false}},
+    {"headless", flag_type_e::Bool, {.b = false}},
+    {"help", flag_type_e::Bool, {.b = false}},
+    {"i", flag_type_e::Bool, {.b = false}},
+    {"l", flag_type_e::Bool, {.b = false}},
+    {"location_start_line", flag_type_e::Int, {.i = -1}},
+    {"location_str", flag_type_e::Str, {}},
+    {"login", flag_type_e::Bool, {.b = false}},
+    {"norc", flag_type_e::Bool, {.b = false}},
+    {"print_status", flag_type_e::Bool, {.b = false}},
+    {"rcdir", flag_type_e::Str, {}},
+    {"rcfile", flag_type_e::Str, {}},
+    {"tool", flag_type_e::Str, {.s = ""}},
+    {"version", flag_type_e::Bool, {.b = false}},
+    {"xtrace_to_debug_file", flag_type_e::Bool, {.b = false}},
+    {},
+};
+
+Action_c short_51[] = {
+    {"C", ActionType_c::SetOption, "noclobber", nullptr},
+    {"O", ActionType_c::SetNamedOption_shopt, nullptr, nullptr},
+    {"e", ActionType_c::SetOption, "errexit", nullptr},
+    {"f", ActionType_c::SetOption, "noglob", nullptr},
+    {"h", ActionType_c::SetOption, "hashall", nullptr},
+    {"n", ActionType_c::SetOption, "noexec", nullptr},
+    {"o", ActionType_c::SetNamedOption, nullptr, nullptr},
+    {"u", ActionType_c::SetOption, "nounset", nullptr},
+    {"v", ActionType_c::SetOption, "verbose", nullptr},
+    {"x", ActionType_c::SetOption, "xtrace", nullptr},
+    {},
+};
+
+const char* plus_6[] = {"C", "O", "e", "f", "h", "n", "o", "u", "v", "x", nullptr};
+
+FlagSpecAndMore_c kFlagSpecsAndMore[] = {
+    { "compadjust", short_45, nullptr, nullptr, defaults_45 },
+    { "compexport", short_46, long_46, nullptr, defaults_46 },
+    { "compgen", short_47, nullptr, plus_2, defaults_47 },
+    { "complete", short_48, nullptr, plus_3, defaults_48 },
+    { "compopt", short_49, nullptr, plus_4, nullptr },
+    { "main", short_50, long_50, plus_5, defaults_50 },
+    { "set", short_51, nullptr, plus_6, nullptr },
+    {},
+};
+}  // namespace arg_types
@@ -0,0 +1,547 @@
+// arg_types.h is generated by frontend/flag_gen.py
+
+#ifndef ARG_TYPES_H
+#define ARG_TYPES_H
+
+#include "cpp/frontend_flag_spec.h"  // for FlagSpec_c
+#include "mycpp/gc_mylib.h"
+
+using value_asdl::value;
+using value_asdl::value_e;
+
+namespace arg_types {
+
+class cd {
+ public:
+  explicit cd(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool L;
+  bool P;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(cd));
+  }
+};
+
+class command {
+ public:
+  explicit command(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool V;
+  bool p;
+  bool v;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(command));
+  }
+};
+
+class compadjust {
+ public:
+  explicit compadjust(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  BigStr* n;
+  bool s;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(compadjust));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(compadjust, n));
+  }
+
+};
+
+class compexport {
+ public:
+  explicit compexport(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  int begin;
+  BigStr* c;
+  int end;
+  BigStr* format;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(compexport));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(compexport, c))
+    | maskbit(offsetof(compexport, format));
+  }
+
+};
+
+class compgen {
+ public:
+  explicit compgen(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  BigStr* C;
+  BigStr* F;
+  BigStr* P;
+  BigStr* S;
+  BigStr* W;
+  BigStr* X;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(compgen));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(compgen, C))
+    | maskbit(offsetof(compgen, F))
+    | maskbit(offsetof(compgen, P))
+    | maskbit(offsetof(compgen, S))
+    | maskbit(offsetof(compgen, W))
+    | maskbit(offsetof(compgen, X));
+  }
+
+};
+
+class complete {
+ public:
+  explicit complete(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  BigStr* C;
+  bool D;
+  bool E;
+  BigStr* F;
+  BigStr* P;
+  BigStr* S;
+  BigStr* W;
+  BigStr* X;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(complete));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(complete, C))
+    | maskbit(offsetof(complete, F))
+    | maskbit(offsetof(complete, P))
+    | maskbit(offsetof(complete, S))
+    | maskbit(offsetof(complete, W))
+    | maskbit(offsetof(complete, X));
+  }
+
+};
+
+class dirs {
+ public:
+  explicit dirs(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool c;
+  bool l;
+  bool p;
+  bool v;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(dirs));
+  }
+};
+
+class echo {
+ public:
+  explicit echo(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool e;
+  bool n;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(echo));
+  }
+};
+
+class export_ {
+ public:
+  explicit export_(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool f;
+  bool n;
+  bool p;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(export_));
+  }
+};
+
+class hash {
+ public:
+  explicit hash(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool r;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(hash));
+  }
+};
+
+class history {
+ public:
+  explicit history(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool a;
+  bool c;
+  int d;
+  bool r;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(history));
+  }
+};
+
+class jobs {
+ public:
+  explicit jobs(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool debug;
+  bool l;
+  bool p;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(jobs));
+  }
+};
+
+class json_read {
+ public:
+  explicit json_read(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool lines;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(json_read));
+  }
+};
+
+class json_write {
+ public:
+  explicit json_write(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  int indent;
+  bool lines;
+  bool pretty;
+  bool surrogate_ok;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(json_write));
+  }
+};
+
+class main {
+ public:
+  explicit main(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  BigStr* ast_format;
+  BigStr* c;
+  bool completion_demo;
+  BigStr* completion_display;
+  BigStr* debug_file;
+  bool do_lossless;
+  bool headless;
+  bool help;
+  bool i;
+  bool l;
+  int location_start_line;
+  BigStr* location_str;
+  bool login;
+  bool norc;
+  bool print_status;
+  BigStr* rcdir;
+  BigStr* rcfile;
+  BigStr* tool;
+  bool version;
+  bool xtrace_to_debug_file;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(main));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(main, ast_format))
+    | maskbit(offsetof(main, c))
+    | maskbit(offsetof(main, completion_display))
+    | maskbit(offsetof(main, debug_file))
+    | maskbit(offsetof(main, location_str))
+    | maskbit(offsetof(main, rcdir))
+    | maskbit(offsetof(main, rcfile))
+    | maskbit(offsetof(main, tool));
+  }
+
+};
+
+class mapfile {
+ public:
+  explicit mapfile(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool t;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(mapfile));
+  }
+};
+
+class new_var {
+ public:
+  explicit new_var(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool A;
+  bool F;
+  bool a;
+  bool f;
+  bool g;
+  bool i;
+  BigStr* n;
+  bool p;
+  BigStr* r;
+  BigStr* x;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(new_var));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(new_var, n))
+    | maskbit(offsetof(new_var, r))
+    | maskbit(offsetof(new_var, x));
+  }
+
+};
+
+class printf {
+ public:
+  explicit printf(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  BigStr* v;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(printf));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(printf, v));
+  }
+
+};
+
+class pwd {
+ public:
+  explicit pwd(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool L;
+  bool P;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(pwd));
+  }
+};
+
+class read {
+ public:
+  explicit read(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  int N;
+  bool Z;
+  BigStr* a;
+  bool all;
+  BigStr* d;
+  bool j8;
+  bool json;
+  bool line;
+  int n;
+  int num_bytes;
+  BigStr* p;
+  bool r;
+  bool s;
+  float t;
+  int u;
+  bool with_eol;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(read));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(read, a))
+    | maskbit(offsetof(read, d))
+    | maskbit(offsetof(read, p));
+  }
+
+};
+
+class readonly {
+ public:
+  explicit readonly(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool A;
+  bool a;
+  bool p;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(readonly));
+  }
+};
+
+class runproc {
+ public:
+  explicit runproc(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool h;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(runproc));
+  }
+};
+
+class shopt {
+ public:
+  explicit shopt(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool o;
+  bool p;
+  bool q;
+  bool s;
+  bool u;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(shopt));
+  }
+};
+
+class source {
+ public:
+  explicit source(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool builtin;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(source));
+  }
+};
+
+class trap {
+ public:
+  explicit trap(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool l;
+  bool p;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(trap));
+  }
+};
+
+class try_ {
+ public:
+  explicit try_(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  BigStr* assign;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(try_));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(try_, assign));
+  }
+
+};
+
+class type {
+ public:
+  explicit type(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool P;
+  bool a;
+  bool f;
+  bool p;
+  bool t;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(type));
+  }
+};
+
+class ulimit {
+ public:
+  explicit ulimit(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool H;
+  bool S;
+  bool a;
+  bool all;
+  bool c;
+  bool d;
+  bool f;
+  bool n;
+  bool s;
+  bool t;
+  bool v;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(ulimit));
+  }
+};
+
+class unset {
+ public:
+  explicit unset(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool f;
+  bool v;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(unset));
+  }
+};
+
+class wait {
+ public:
+  explicit wait(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  bool n;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::Opaque, kZeroMask, sizeof(wait));
+  }
+};
+
+class write {
+ public:
+  explicit write(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+  BigStr* end;
+  bool j8;
+  bool json;
+  bool n;
+  BigStr* sep;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::Class(HeapTag::FixedSize, field_mask(), sizeof(write));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return
+      maskbit(offsetof(write, end))
+    | maskbit(offsetof(write, sep));
+  }
+
+};
+
+extern FlagSpec_c kFlagSpecs[];
+extern FlagSpecAndMore_c kFlagSpecsAndMore[];
+
+}  // namespace arg_types
+
+#endif  // ARG_TYPES_H
+
@@ -0,0 +1,14 @@
+import sys, time, imp
+sys.path[:0] = ['.', 'vendor']
+from core import test_lib
+from osh import braces
+mod = braces
+if len(sys.argv) > 1:
+    mod = imp.load_source('braces_base', sys.argv[1])
+code = sys.argv[2] if len(sys.argv) > 2 else 'echo {1..300}{a..z}{1..40}'
+c_parser = test_lib.InitCommandParser(code)
+node = c_parser.ParseLogicalLine()
+words = mod.BraceDetectAll(node.words)
+t = time.time()
+out = mod.BraceExpandWords(words)
+print('%d words %.2fs' % (len(out), time.time() - t))
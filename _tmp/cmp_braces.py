@@ -0,0 +1,35 @@
+import sys, imp
+sys.path[:0] = ['.', 'vendor']
+from core import test_lib
+from osh import braces
+from frontend import location
+base = imp.load_source('braces_base', '_tmp/braces_base.py')
+from asdl import format as fmt
+
+def Show(words):
+    from frontend import lexer
+    from _devbuild.gen.syntax_asdl import word_part_str, Token
+    out = []
+    for w in words:
+        desc = []
+        for p in w.parts:
+            if isinstance(p, Token):
+                desc.append('%d:%s' % (p.id, lexer.LazyStr(p)))
+            else:
+                desc.append(word_part_str(p.tag()))
+        out.append(' '.join(desc))
+    return out
+
+cases = ['echo {1..300}{a..z}{1..4}', 'echo -{a,b}-{c,d}-E x y{1..3}', 'echo {a,{b,c}d}e{,}',
+         'echo ~{a,b} {~,x}/y {z..a}{01..3}', 'echo a{b,c{1..2}}d', 'echo {a,b}$x{c,d}*',
+         'echo {,}{,} {a,} {,b}c', 'echo {a,b}{}', 'echo pre{x,y}', 'echo {1..3}post{a,b}post2']
+bad = 0
+for code in cases:
+    node = test_lib.InitCommandParser(code).ParseLogicalLine()
+    a = Show(braces.BraceExpandWords(braces.BraceDetectAll(node.words)))
+    node = test_lib.InitCommandParser(code).ParseLogicalLine()
+    b = Show(base.BraceExpandWords(base.BraceDetectAll(node.words)))
+    if a != b:
+        bad += 1
+        print('DIFF %s\n  %s\n  %s' % (code, a[:6], b[:6]))
+print('%d cases differ' % bad)
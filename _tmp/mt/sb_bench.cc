@@ -0,0 +1,24 @@
+#include <time.h>
+#include "mycpp/runtime.h"
+static double Now() { struct timespec t; clock_gettime(CLOCK_MONOTONIC, &t); return t.tv_sec + t.tv_nsec / 1e9; }
+int main() {
+  gHeap.Init(50000);
+  BigStr* s = OverAllocatedStr(10000000);
+  for (int i = 0; i < 10000000; ++i) s->data_[i] = 'a' + i % 26;
+  s->MaybeShrink(10000000);
+  StackRoots _r({&s});
+  int n = 0;
+  double t0 = Now();
+  for (int i = 0; i < len(s); ++i) {
+    BigStr* c = NewStr(1); c->data_[0] = s->data_[i];  // old at()
+    if (str_equals(c, StrFromC("q"))) n++;
+    gHeap.MaybeCollect();
+  }
+  double t1 = Now();
+  for (int i = 0; i < len(s); ++i) {
+    if (str_equals(s->at(i), StrFromC("q"))) n++;
+    gHeap.MaybeCollect();
+  }
+  double t2 = Now();
+  printf("n=%d old %.3f s, new %.3f s, collections %d\n", n, t1 - t0, t2 - t1, gHeap.num_collections_);
+}
@@ -0,0 +1,36 @@
+#include "_gen/frontend/syntax.asdl.h"
+#include "prebuilt/asdl/runtime.mycpp.h"
+using namespace syntax_asdl;
+int main() {
+  gHeap.Init();
+  auto src = Alloc<source::MainFile>(StrFromC("foo.sh"));
+  auto line = Alloc<SourceLine>(3, StrFromC("echo hi\n"), src);
+  auto t1 = Alloc<Token>(id_kind_asdl::Id::Lit_Chars, 4, 0, line, StrFromC("echo"));
+  auto t2 = Alloc<Token>(id_kind_asdl::Id::Lit_Chars, 2, 5, line, nullptr);
+  auto parts = Alloc<List<word_part_t*>>();
+  parts->append(t1);
+  auto w = Alloc<CompoundWord>(parts);
+  auto parts2 = Alloc<List<word_part_t*>>();
+  parts2->append(t2);
+  auto words = NewList<word_t*>({w, Alloc<CompoundWord>(parts2)});
+  auto enc = Alloc<runtime::Encoder>();
+  auto node = Alloc<command::Simple>(t1, Alloc<List<EnvPair*>>(), words, nullptr, nullptr, nullptr, true);
+  node->Marshal(enc);
+  BigStr* blob = enc->Serialize();
+  printf("ok=%d len=%d\n", enc->ok, len(blob));
+  auto dec = Alloc<runtime::Decoder>(blob);
+  command_t* out = command_t::Unmarshal(dec);
+  printf("dec ok=%d atend=%d\n", dec->ok, dec->AtEnd());
+  auto s = static_cast<command::Simple*>(out);
+  auto w0 = static_cast<CompoundWord*>(s->words->at(0));
+  auto tok = static_cast<Token*>(w0->parts->at(0));
+  auto w1 = static_cast<CompoundWord*>(s->words->at(1));
+  auto tok2 = static_cast<Token*>(w1->parts->at(0));
+  printf("%s %d %d shared_line=%d shared_tok=%d %s src=%s\n", tok->tval->data_, tok->line->line_num, tok2->col,
+    tok->line == tok2->line, s->blame_tok == tok, tok->line->content->data_,
+    static_cast<source::MainFile*>(tok->line->src)->path->data_);
+  // corrupt
+  auto dec2 = Alloc<runtime::Decoder>(blob->slice(0, len(blob)-1));
+  printf("corrupt ok=%d\n", dec2->ok);
+  return 0;
+}
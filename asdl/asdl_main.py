@@ -27,6 +27,13 @@ def Options():
                  default=True,
                  help='Whether to generate pretty printing methods')
 
+    # For frontend/syntax.asdl, which is saved by the 'source' parse cache
+    p.add_option('--marshal-methods',
+                 dest='marshal_methods',
+                 action='store_true',
+                 default=False,
+                 help='Generate Marshal() and Unmarshal() methods')
+
     # Control Python constructors
 
     # for hnode.asdl
@@ -122,6 +129,13 @@ using hnode_asdl::hnode_t;
 #include "_gen/frontend/id_kind.asdl.h"
 using id_kind_asdl::Id_t;
 
+""")
+
+            if opts.marshal_methods:
+                # Defined in asdl/runtime.py
+                f.write("""\
+namespace runtime { class Encoder; class Decoder; }
+
 """)
 
             for use in schema_ast.uses:
@@ -153,7 +167,8 @@ namespace %s {
             v2 = gen_cpp.ClassDefVisitor(
                 f,
                 pretty_print_methods=opts.pretty_print_methods,
-                debug_info=debug_info)
+                debug_info=debug_info,
+                marshal_methods=opts.marshal_methods)
             v2.VisitModule(schema_ast)
 
             f.write("""
@@ -212,7 +227,8 @@ namespace %s {
 
 """ % ns)
 
-                v3 = gen_cpp.MethodDefVisitor(f)
+                v3 = gen_cpp.MethodDefVisitor(
+                    f, marshal_methods=opts.marshal_methods)
                 v3.VisitModule(schema_ast)
 
                 f.write("""
@@ -271,7 +287,8 @@ from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
             f,
             abbrev_mod_entries,
             pretty_print_methods=opts.pretty_print_methods,
-            py_init_n=opts.py_init_n)
+            py_init_n=opts.py_init_n,
+            marshal_methods=opts.marshal_methods)
         v.VisitModule(schema_ast)
 
         if abbrev_mod:
@@ -236,3 +236,36 @@ def TypeNameHeuristic(t):
     the name!  e.g. re_t or BraceGroup
     """
     return '%s_t' % t if t[0].islower() else t
+
+
+def MarshalKind(typ):
+    """How generated Marshal() and Unmarshal() methods handle a field type.
+
+    Returns 'str', 'int', 'bool', 'enum', 'obj', 'list', or None if the type
+    isn't supported, e.g. float, Dict, or a type from another schema.
+    """
+    if typ.IsOptional():
+        typ = typ.children[0]
+
+    if isinstance(typ, ParameterizedType):
+        if typ.type_name == 'List':
+            if MarshalKind(typ.children[0]) in (None, 'list'):
+                return None
+            return 'list'
+        return None  # Dict
+
+    if typ.name == 'string':
+        return 'str'
+    if typ.name in ('int', 'uint16', 'id'):
+        return 'int'
+    if typ.name == 'bool':
+        return 'bool'
+
+    if isinstance(typ.resolved, SimpleSum):
+        if 'integers' in typ.resolved.generate or 'uint16' in typ.resolved.generate:
+            return 'int'
+        return 'enum'
+    if isinstance(typ.resolved, (Sum, Product)):
+        return 'obj'
+
+    return None  # BigInt, float, any, or Use
@@ -227,7 +227,11 @@ def _HNodeExpr(abbrev, typ, var_name):
 class ClassDefVisitor(visitor.AsdlVisitor):
     """Generate C++ declarations and type-safe enums."""
 
-    def __init__(self, f, pretty_print_methods=True, debug_info=None):
+    def __init__(self,
+                 f,
+                 pretty_print_methods=True,
+                 debug_info=None,
+                 marshal_methods=False):
         """
     Args:
       f: file to write to
@@ -236,6 +240,7 @@ class ClassDefVisitor(visitor.AsdlVisitor):
         visitor.AsdlVisitor.__init__(self, f)
         self.pretty_print_methods = pretty_print_methods
         self.debug_info = debug_info if debug_info is not None else {}
+        self.marshal_methods = marshal_methods
 
         self._shared_type_tags = {}
         self._product_counter = 64  # start halfway through the range 0-127
@@ -373,6 +378,11 @@ class ClassDefVisitor(visitor.AsdlVisitor):
                 self.Emit('  hnode_t* %s(Dict<int, bool>* seen = nullptr);' %
                           abbrev)
 
+        if self.marshal_methods:
+            self.Emit('  void Marshal(runtime::Encoder* enc);')
+            self.Emit('  static %s_t* Unmarshal(runtime::Decoder* dec);' %
+                      sum_name)
+
         Emit('  DISALLOW_COPY_AND_ASSIGN(%(sum_name)s_t)')
         Emit('};')
         Emit('')
@@ -416,7 +426,13 @@ class ClassDefVisitor(visitor.AsdlVisitor):
         Emit('};')
         Emit('')
 
-    def _GenClass(self, ast_node, class_name, base_classes, depth, tag):
+    def _GenClass(self,
+                  ast_node,
+                  class_name,
+                  base_classes,
+                  depth,
+                  tag,
+                  is_product=False):
         """For Product and Constructor."""
         if base_classes:
             bases = ', '.join('public %s' % b for b in base_classes)
@@ -485,6 +501,17 @@ class ClassDefVisitor(visitor.AsdlVisitor):
                     depth)
             self.Emit('')
 
+        if self.marshal_methods:
+            self.Emit('  void Marshal(runtime::Encoder* enc);', depth)
+            self.Emit(
+                '  static %s* UnmarshalNew(runtime::Decoder* dec);' %
+                class_name, depth)
+            if is_product:
+                self.Emit(
+                    '  static %s* Unmarshal(runtime::Decoder* dec);' %
+                    class_name, depth)
+            self.Emit('')
+
         self.Emit('  static constexpr ObjHeader obj_header() {')
         self.Emit('    return ObjHeader::AsdlClass(%s, %d);' %
                   (tag, len(managed_fields)))
@@ -515,7 +542,12 @@ class ClassDefVisitor(visitor.AsdlVisitor):
             ast_node, name, depth, tag_num = args
             # Figure out base classes AFTERWARD.
             bases = self._product_bases[name]
-            self._GenClass(ast_node, name, bases, depth, tag_num)
+            self._GenClass(ast_node,
+                           name,
+                           bases,
+                           depth,
+                           tag_num,
+                           is_product=True)
 
 
 class MethodDefVisitor(visitor.AsdlVisitor):
@@ -525,8 +557,157 @@ class MethodDefVisitor(visitor.AsdlVisitor):
     circular dependencies.
     """
 
-    def __init__(self, f, pretty_print_methods=True):
+    def __init__(self, f, pretty_print_methods=True, marshal_methods=False):
         visitor.AsdlVisitor.__init__(self, f)
+        self.marshal_methods = marshal_methods
+
+    def _EmitMarshalField(self, typ, var_name, depth):
+        """Write one field to 'enc'."""
+        kind = ast.MarshalKind(typ)
+
+        if kind == 'str':
+            self.Emit('enc->Str(%s);' % var_name, depth)
+        elif kind == 'int':
+            self.Emit('enc->Int(%s);' % var_name, depth)
+        elif kind == 'enum':
+            self.Emit('enc->Int(static_cast<int>(%s));' % var_name, depth)
+        elif kind == 'bool':
+            self.Emit('enc->Bool(%s);' % var_name, depth)
+        elif kind == 'obj':
+            self.Emit('if (%s == nullptr) {' % var_name, depth)
+            self.Emit('  enc->Null();', depth)
+            self.Emit('} else {', depth)
+            self.Emit('  %s->Marshal(enc);' % var_name, depth)
+            self.Emit('}', depth)
+        elif kind == 'list':
+            if typ.IsOptional():
+                typ = typ.children[0]
+            item_type = typ.children[0]
+            c_item_type = _GetCppType(item_type)
+            item_name = 'i%d' % depth
+            self.Emit('if (%s == nullptr) {' % var_name, depth)
+            self.Emit('  enc->Len(-1);', depth)
+            self.Emit('} else {', depth)
+            self.Emit('  enc->Len(len(%s));' % var_name, depth)
+            self.Emit(
+                '  for (ListIter<%s> it(%s); !it.Done(); it.Next()) {' %
+                (c_item_type, var_name), depth)
+            self.Emit('    %s %s = it.Value();' % (c_item_type, item_name),
+                      depth)
+            self._EmitMarshalField(item_type, item_name, depth + 2)
+            self.Emit('  }', depth)
+            self.Emit('}', depth)
+        else:
+            self.Emit('enc->Unsupported();', depth)
+
+    def _UnmarshalExpr(self, typ):
+        """Return an expression that reads a field from 'dec'."""
+        kind = ast.MarshalKind(typ)
+        if typ.IsOptional():
+            typ = typ.children[0]
+
+        if kind == 'str':
+            return 'dec->Str()'
+        if kind == 'int':
+            return 'dec->Int()'
+        if kind == 'enum':
+            return 'static_cast<%s>(dec->Int())' % _GetCppType(typ)
+        if kind == 'bool':
+            return 'dec->Bool()'
+        if kind == 'obj':
+            # e.g. command_t* -> command_t::Unmarshal()
+            return '%s::Unmarshal(dec)' % _GetCppType(typ)[:-1]
+        raise AssertionError(kind)
+
+    def _EmitUnmarshalField(self, typ, var_name, depth):
+        """Declare var_name, and read one field from 'dec' into it."""
+        kind = ast.MarshalKind(typ)
+        c_type = _GetCppType(typ)
+
+        if kind == 'list':
+            if typ.IsOptional():
+                typ = typ.children[0]
+            len_name = 'n_%s' % var_name
+            self.Emit('%s %s = nullptr;' % (c_type, var_name), depth)
+            self.Emit('int %s = dec->Len();' % len_name, depth)
+            self.Emit('if (%s != -1) {' % len_name, depth)
+            self.Emit('  %s = Alloc<%s>();' % (var_name, c_type[:-1]), depth)
+            self.Emit('  for (int i = 0; i < %s; ++i) {' % len_name, depth)
+            self.Emit(
+                '    %s->append(%s);' %
+                (var_name, self._UnmarshalExpr(typ.children[0])), depth)
+            self.Emit('  }', depth)
+            self.Emit('}', depth)
+
+        elif kind is None:
+            self.Emit('dec->Unsupported();', depth)
+            self.Emit(
+                '%s %s = %s;' %
+                (c_type, var_name, _DefaultValue(typ, conditional=False)),
+                depth)
+
+        else:
+            self.Emit(
+                '%s %s = %s;' % (c_type, var_name, self._UnmarshalExpr(typ)),
+                depth)
+
+    def _EmitMarshalMethods(self,
+                            class_name,
+                            ast_node,
+                            singleton=None,
+                            is_product=False):
+        self.Emit('')
+        self.Emit('void %s::Marshal(runtime::Encoder* enc) {' % class_name)
+        self.Emit('  int heap_id = ObjectId(this);')
+        self.Emit(
+            '  if (!enc->Begin(heap_id, ObjHeader::FromObject(this)->type_tag)) {'
+        )
+        self.Emit('    return;')
+        self.Emit('  }')
+        for field in ast_node.fields:
+            self._EmitMarshalField(field.typ, 'this->%s' % field.name, 1)
+        self.Emit('  enc->End(heap_id);')
+        self.Emit('}')
+
+        self.Emit('')
+        self.Emit('%s* %s::UnmarshalNew(runtime::Decoder* dec) {' %
+                  (class_name, class_name))
+        if singleton:
+            self.Emit('  dec->Register(%s);' % singleton)
+            self.Emit('  return %s;' % singleton)
+            self.Emit('}')
+            return
+
+        args = []
+        for i, field in enumerate(ast_node.fields):
+            var_name = 'x%d' % i
+            self._EmitUnmarshalField(field.typ, var_name, 1)
+            args.append(var_name)
+        self.Emit('  %s* obj = Alloc<%s>(%s);' %
+                  (class_name, class_name, ', '.join(args)))
+        self.Emit('  dec->Register(obj);')
+        self.Emit('  return obj;')
+        self.Emit('}')
+
+        if not is_product:
+            return
+
+        self.Emit('')
+        self.Emit('%s* %s::Unmarshal(runtime::Decoder* dec) {' %
+                  (class_name, class_name))
+        self.Emit('  int tag = dec->Int();')
+        self.Emit('  if (tag == runtime::MARSHAL_NULL) {')
+        self.Emit('    return nullptr;')
+        self.Emit('  }')
+        self.Emit('  if (tag == runtime::MARSHAL_REF) {')
+        self.Emit('    return static_cast<%s*>(dec->Ref());' % class_name)
+        self.Emit('  }')
+        self.Emit('  if (tag != %s::obj_header().type_tag) {' % class_name)
+        self.Emit('    dec->BadTag(tag);')
+        self.Emit('    return nullptr;')
+        self.Emit('  }')
+        self.Emit('  return %s::UnmarshalNew(dec);' % class_name)
+        self.Emit('}')
 
     def _EmitCodeForField(self, abbrev, field, counter):
         """Generate code that returns an hnode for a field."""
@@ -820,7 +1001,67 @@ class MethodDefVisitor(visitor.AsdlVisitor):
             self.Emit('  }')
             self.Emit('}')
 
+        if self.marshal_methods:
+            self._EmitSumMarshalMethods(sum, sum_name, depth)
+
+    def _EmitSumMarshalMethods(self, sum, sum_name, depth):
+        for variant in sum.types:
+            if variant.shared_type:
+                continue
+            class_name = '%s__%s' % (sum_name, variant.name)
+            if len(variant.fields) == 0:
+                singleton = '%s::%s' % (sum_name, variant.name)
+            else:
+                singleton = None
+            self._EmitMarshalMethods(class_name, variant, singleton=singleton)
+
+        # Dispatch WITHOUT using 'virtual', like PrettyTree()
+        self.Emit('')
+        self.Emit('void %s_t::Marshal(runtime::Encoder* enc) {' % sum_name)
+        self.Emit('  switch (this->tag()) {', depth)
+        for variant in sum.types:
+            if variant.shared_type:
+                subtype_name = variant.shared_type
+            else:
+                subtype_name = '%s__%s' % (sum_name, variant.name)
+            self.Emit('  case %s_e::%s: {' % (sum_name, variant.name), depth)
+            self.Emit('    static_cast<%s*>(this)->Marshal(enc);' % subtype_name,
+                      depth)
+            self.Emit('    return;', depth)
+            self.Emit('  }', depth)
+        self.Emit('  default:', depth)
+        self.Emit('    assert(0);', depth)
+        self.Emit('  }')
+        self.Emit('}')
+
+        self.Emit('')
+        self.Emit('%s_t* %s_t::Unmarshal(runtime::Decoder* dec) {' %
+                  (sum_name, sum_name))
+        self.Emit('  int tag = dec->Int();')
+        self.Emit('  if (tag == runtime::MARSHAL_NULL) {')
+        self.Emit('    return nullptr;')
+        self.Emit('  }')
+        self.Emit('  if (tag == runtime::MARSHAL_REF) {')
+        self.Emit('    return static_cast<%s_t*>(dec->Ref());' % sum_name)
+        self.Emit('  }')
+        self.Emit('  switch (tag) {', depth)
+        for variant in sum.types:
+            if variant.shared_type:
+                subtype_name = variant.shared_type
+            else:
+                subtype_name = '%s__%s' % (sum_name, variant.name)
+            self.Emit('  case %s_e::%s:' % (sum_name, variant.name), depth)
+            self.Emit('    return %s::UnmarshalNew(dec);' % subtype_name,
+                      depth)
+        self.Emit('  default:', depth)
+        self.Emit('    dec->BadTag(tag);', depth)
+        self.Emit('    return nullptr;', depth)
+        self.Emit('  }')
+        self.Emit('}')
+
     def VisitProduct(self, product, name, depth):
         #self._GenClass(product, product.attributes, name, None, depth)
         all_fields = product.fields
         self._EmitPrettyPrintMethods(name, all_fields, product)
+        if self.marshal_methods:
+            self._EmitMarshalMethods(name, product, is_product=True)
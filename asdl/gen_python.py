@@ -170,12 +170,14 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
                  abbrev_mod_entries=None,
                  pretty_print_methods=True,
                  py_init_n=False,
-                 simple_int_sums=None):
+                 simple_int_sums=None,
+                 marshal_methods=False):
 
         visitor.AsdlVisitor.__init__(self, f)
         self.abbrev_mod_entries = abbrev_mod_entries or []
         self.pretty_print_methods = pretty_print_methods
         self.py_init_n = py_init_n
+        self.marshal_methods = marshal_methods
 
         # For Id to use different code gen.  It's used like an integer, not just
         # like an enum.
@@ -323,16 +325,149 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
             self.Emit('  L.append(Field(%r, %s))' % (field.name, out_val_name),
                       depth)
 
+    def _EmitMarshalField(self, typ, var_name, item_name, depth):
+        """Write one field to 'enc'.  A List field loops over item_name."""
+        kind = ast.MarshalKind(typ)
+
+        if kind == 'str':
+            self.Emit('enc.Str(%s)' % var_name, depth)
+        elif kind in ('int', 'enum'):
+            self.Emit('enc.Int(%s)' % var_name, depth)
+        elif kind == 'bool':
+            self.Emit('enc.Bool(%s)' % var_name, depth)
+        elif kind == 'obj':
+            self.Emit('if %s is None:' % var_name, depth)
+            self.Emit('  enc.Null()', depth)
+            self.Emit('else:', depth)
+            self.Emit('  %s.Marshal(enc)' % var_name, depth)
+        elif kind == 'list':
+            if typ.IsOptional():
+                typ = typ.children[0]
+            self.Emit('if %s is None:' % var_name, depth)
+            self.Emit('  enc.Len(-1)', depth)
+            self.Emit('else:', depth)
+            self.Emit('  enc.Len(len(%s))' % var_name, depth)
+            self.Emit('  for %s in %s:' % (item_name, var_name), depth)
+            # Lists of lists aren't supported, so item_name isn't reused
+            self._EmitMarshalField(typ.children[0], item_name, None,
+                                   depth + 2)
+        else:
+            self.Emit('enc.Unsupported()', depth)
+
+    def _UnmarshalExpr(self, typ):
+        """Return an expression that reads a field from 'dec'."""
+        kind = ast.MarshalKind(typ)
+
+        if typ.IsOptional():
+            typ = typ.children[0]
+
+        if kind == 'str':
+            return 'dec.Str()'
+        if kind == 'int':
+            return 'dec.Int()'
+        if kind == 'enum':
+            return '%s_t(dec.Int())' % typ.name
+        if kind == 'bool':
+            return 'dec.Bool()'
+        if kind == 'obj':
+            return '%s.Unmarshal(dec)' % _MyPyType(typ)
+        raise AssertionError(kind)
+
+    def _EmitUnmarshalField(self, typ, var_name, depth):
+        """Read one field from 'dec' into var_name."""
+        kind = ast.MarshalKind(typ)
+        mypy_type = _MyPyType(typ)
+
+        if kind == 'list':
+            if typ.IsOptional():
+                typ = typ.children[0]
+            self.Emit('%s = None  # type: %s' % (var_name, mypy_type), depth)
+            self.Emit('n = dec.Len()', depth)
+            self.Emit('if n != -1:', depth)
+            self.Emit('  %s = []' % var_name, depth)
+            self.Emit('  for _ in xrange(n):', depth)
+            self.Emit(
+                '    %s.append(%s)' %
+                (var_name, self._UnmarshalExpr(typ.children[0])), depth)
+
+        elif kind is None:
+            self.Emit('dec.Unsupported()', depth)
+            if isinstance(typ, ast.ParameterizedType):
+                default = "cast('%s', None)" % mypy_type
+            else:
+                default = _DefaultValue(typ, mypy_type)
+            self.Emit('%s = %s' % (var_name, default), depth)
+
+        else:
+            self.Emit('%s = %s' % (var_name, self._UnmarshalExpr(typ)), depth)
+
+    def _EmitMarshalMethods(self, ast_node, class_name, singleton, is_product):
+        """Marshal() writes an object to an Encoder, and UnmarshalNew() reads
+        it back, after its tag."""
+
+        self.Emit('  def Marshal(self, enc):')
+        self.Emit('    # type: (runtime.Encoder) -> None')
+        self.Emit('    heap_id = id(self)')
+        self.Emit('    if not enc.Begin(heap_id, self._type_tag):')
+        self.Emit('      return')
+        for i, field in enumerate(ast_node.fields):
+            # Each field has its own loop variable, so its type doesn't change
+            self._EmitMarshalField(field.typ, 'self.%s' % field.name,
+                                   'x%d' % i, self.current_depth + 2)
+        self.Emit('    enc.End(heap_id)')
+        self.Emit('')
+
+        self.Emit('  @staticmethod')
+        self.Emit('  def UnmarshalNew(dec):')
+        self.Emit('    # type: (runtime.Decoder) -> %s' % class_name)
+        if singleton:
+            self.Emit('    dec.Register(%s)' % singleton)
+            self.Emit('    return %s' % singleton)
+            self.Emit('')
+            return
+
+        args = []
+        for i, field in enumerate(ast_node.fields):
+            var_name = 'x%d' % i
+            self._EmitUnmarshalField(field.typ, var_name,
+                                     self.current_depth + 2)
+            args.append(var_name)
+        self.Emit('    obj = %s(%s)' % (class_name, ', '.join(args)))
+        self.Emit('    dec.Register(obj)')
+        self.Emit('    return obj')
+        self.Emit('')
+
+        if not is_product:
+            return
+
+        # Products are referred to directly, not through a sum type
+        self.Emit('  @staticmethod')
+        self.Emit('  def Unmarshal(dec):')
+        self.Emit('    # type: (runtime.Decoder) -> %s' % class_name)
+        self.Emit('    tag = dec.Int()')
+        self.Emit('    if tag == runtime.MARSHAL_NULL:')
+        self.Emit("      return cast('%s', None)" % class_name)
+        self.Emit('    if tag == runtime.MARSHAL_REF:')
+        self.Emit("      return cast('%s', dec.Ref())" % class_name)
+        self.Emit('    if tag != %s._type_tag:' % class_name)
+        self.Emit('      dec.BadTag(tag)')
+        self.Emit("      return cast('%s', None)" % class_name)
+        self.Emit('    return %s.UnmarshalNew(dec)' % class_name)
+        self.Emit('')
+
     def _GenClass(self,
                   ast_node,
                   class_name,
                   base_classes,
                   tag_num,
-                  class_ns=''):
+                  class_ns='',
+                  singleton=None,
+                  is_product=False):
         """Used for both Sum variants ("constructors") and Product types.
 
         Args:
           class_ns: for variants like value.Str
+          singleton: for zero arg variants like command.NoOp
         """
         self.Emit('class %s(%s):' % (class_name, ', '.join(base_classes)))
         self.Emit('  _type_tag = %d' % tag_num)
@@ -385,6 +520,10 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
                       reflow=False)
             self.Emit('')
 
+        if self.marshal_methods:
+            self._EmitMarshalMethods(ast_node, class_ns + class_name,
+                                     singleton, is_product)
+
         if not self.pretty_print_methods:
             return
 
@@ -518,6 +657,34 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
         self.Emit('  # type: () -> int')
         self.Emit('  return self._type_tag')
 
+        if self.marshal_methods:
+            # Every variant overrides this
+            self.Emit('')
+            self.Emit('def Marshal(self, enc):')
+            self.Emit('  # type: (runtime.Encoder) -> None')
+            self.Emit('  raise NotImplementedError()')
+
+            self.Emit('')
+            self.Emit('@staticmethod')
+            self.Emit('def Unmarshal(dec):')
+            self.Emit('  # type: (runtime.Decoder) -> %s_t' % sum_name)
+            self.Emit('  tag = dec.Int()')
+            self.Emit('  if tag == runtime.MARSHAL_NULL:')
+            self.Emit("    return cast('%s_t', None)" % sum_name)
+            self.Emit('  if tag == runtime.MARSHAL_REF:')
+            self.Emit("    return cast('%s_t', dec.Ref())" % sum_name)
+            for variant in sum.types:
+                if variant.shared_type:
+                    subtype_name = variant.shared_type
+                elif len(variant.fields) == 0:
+                    subtype_name = '%s__%s' % (sum_name, variant.name)
+                else:
+                    subtype_name = '%s.%s' % (sum_name, variant.name)
+                self.Emit('  if tag == %s_e.%s:' % (sum_name, variant.name))
+                self.Emit('    return %s.UnmarshalNew(dec)' % subtype_name)
+            self.Emit('  dec.BadTag(tag)')
+            self.Emit("  return cast('%s_t', None)" % sum_name)
+
         # This is what we would do in C++, but we don't need it in Python because
         # every function is virtual.
         if 0:
@@ -565,7 +732,11 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
                 # We must use the old-style naming here, ie. command__NoOp, in order
                 # to support zero field variants as constants.
                 class_name = '%s__%s' % (sum_name, variant.name)
-                self._GenClass(variant, class_name, (sum_name + '_t', ), i + 1)
+                singleton = '%s.%s' % (sum_name, variant.name)
+                self._GenClass(variant,
+                               class_name, (sum_name + '_t', ),
+                               i + 1,
+                               singleton=singleton)
 
         # Class that's just a NAMESPACE, e.g. for value.Str
         self.Emit('class %s(object):' % sum_name, depth)
@@ -608,4 +779,4 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
             bases = self._product_bases[name]
             if not bases:
                 bases = ('pybase.CompoundObj', )
-            self._GenClass(ast_node, name, bases, tag_num)
+            self._GenClass(ast_node, name, bases, tag_num, is_product=True)
@@ -6,8 +6,10 @@
 from __future__ import print_function
 
 from _devbuild.gen.hnode_asdl import hnode, color_t, color_e
+from mycpp import mops
+from mycpp import mylib
 
-from typing import Optional, Dict
+from typing import Optional, List, Dict, Any
 
 # Used throughout the "LST" to indicate we don't have location info.
 NO_SPID = -1
@@ -65,3 +67,284 @@ class TraversalState:
 # Constants to avoid 'StrFromC("T")' in ASDL-generated code
 TRUE_STR = 'T'
 FALSE_STR = 'F'
+
+
+#
+# Marshaling, for the generated Marshal() and Unmarshal() methods
+#
+
+# Markers in the integer stream, where an object is expected.  Type tags are
+# always positive.
+MARSHAL_NULL = 0
+MARSHAL_REF = -1
+
+
+def _ZigZag(i):
+    # type: (int) -> mops.BigInt
+    """Map 0, -1, 1, -2, ... to 0, 1, 2, 3, ..., so small negative numbers are
+    short too.
+
+    In 64 bits, because i * 2 can overflow an int in C++.
+    """
+    b = mops.IntWiden(i)
+    twice = mops.Add(b, b)
+    if i >= 0:
+        return twice
+    return mops.Sub(mops.Negate(twice), mops.ONE)
+
+
+def _UnZigZag(u):
+    # type: (mops.BigInt) -> int
+    """The inverse of _ZigZag(), for u < 2 ** 32."""
+    half = mops.RShift(u, mops.ONE)
+    if mops.Equal(mops.BitAnd(u, mops.ONE), mops.ZERO):
+        return mops.BigTruncate(half)
+    return mops.BigTruncate(mops.Sub(mops.Negate(half), mops.ONE))
+
+
+def _WriteVarint(out, n):
+    # type: (List[str], mops.BigInt) -> None
+    """Write a non-negative integer, 7 bits per byte, low bits first."""
+    while mops.Greater(n, mops.IntWiden(0x7f)):
+        low = mops.BigTruncate(mops.BitAnd(n, mops.IntWiden(0x7f)))
+        out.append(chr(low | 0x80))
+        n = mops.RShift(n, mops.IntWiden(7))
+    out.append(chr(mops.BigTruncate(n)))
+
+
+class Encoder(object):
+    """Flattens a graph of ASDL objects into integers and strings.
+
+    An object that's reachable more than once, like a SourceLine, is written
+    once.  Later references are MARSHAL_REF followed by its number, which
+    Decoder assigns in the same order.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.ints = []  # type: List[int]
+        self.strs = []  # type: List[Optional[str]]
+        self.obj_nums = {}  # type: Dict[int, int]
+
+        # Set to False when a field can't be marshaled, e.g. a 'value' in
+        # expr.Const.  The caller shouldn't save the output.
+        self.ok = True
+
+    def External(self, heap_id):
+        # type: (int) -> None
+        """Register an object that the reader supplies, rather than decodes.
+
+        Must be called in the same order as Decoder.External().
+        """
+        self.obj_nums[heap_id] = len(self.obj_nums)
+
+    def Begin(self, heap_id, tag):
+        # type: (int, int) -> bool
+        """Start an object.  Returns False if it was already written."""
+        num = self.obj_nums.get(heap_id, -1)
+        if num != -1:
+            self.ints.append(MARSHAL_REF)
+            self.ints.append(num)
+            return False
+
+        self.ints.append(tag)
+        return True
+
+    def End(self, heap_id):
+        # type: (int) -> None
+        """Number the object after its fields, like Decoder.Register()."""
+        self.obj_nums[heap_id] = len(self.obj_nums)
+
+    def Null(self):
+        # type: () -> None
+        self.ints.append(MARSHAL_NULL)
+
+    def Int(self, i):
+        # type: (int) -> None
+        self.ints.append(i)
+
+    def Bool(self, b):
+        # type: (bool) -> None
+        self.ints.append(1 if b else 0)
+
+    def Str(self, s):
+        # type: (Optional[str]) -> None
+        self.strs.append(s)
+
+    def Len(self, n):
+        # type: (int) -> None
+        """Length of a List, or -1 for None."""
+        self.ints.append(n)
+
+    def Unsupported(self):
+        # type: () -> None
+        self.ok = False
+        self.ints.append(MARSHAL_NULL)
+
+    def Serialize(self):
+        # type: () -> str
+        """Return the ints and strings as one byte string."""
+        out = []  # type: List[str]
+
+        _WriteVarint(out, mops.IntWiden(len(self.ints)))
+        for i in self.ints:
+            _WriteVarint(out, _ZigZag(i))
+
+        _WriteVarint(out, mops.IntWiden(len(self.strs)))
+        for j in xrange(len(self.strs)):
+            s = self.strs[j]
+            if s is None:
+                _WriteVarint(out, mops.ZERO)
+            else:
+                _WriteVarint(out, mops.IntWiden(len(s) + 1))
+                out.append(s)
+
+        return ''.join(out)
+
+
+class Decoder(object):
+    """Reads the output of Encoder.Serialize().
+
+    Malformed input doesn't raise an exception.  It sets self.ok to False,
+    and the decoded tree must be thrown away.
+    """
+
+    def __init__(self, blob):
+        # type: (str) -> None
+        self.blob = blob
+        self.pos = 0  # in blob
+
+        self.ints = []  # type: List[int]
+        self.strs = []  # type: List[Optional[str]]
+        self.int_pos = 0
+        self.str_pos = 0
+
+        self.objs = []  # type: List[Any]
+        self.ok = True
+
+        self._Parse()
+
+    def _ReadVarint(self, num_bits):
+        # type: (int) -> mops.BigInt
+        """Read a number less than 2 ** num_bits, where num_bits <= 32.
+
+        Sets self.ok to False if the input ends, or the number is too big.
+        """
+        n = mops.ZERO
+        shift = 0
+        while True:
+            # 32 bits take at most 5 bytes, so the last shift is 28
+            if self.pos >= len(self.blob) or shift >= 32:
+                self.ok = False
+                return mops.ZERO
+            b = mylib.ByteAt(self.blob, self.pos)
+            self.pos += 1
+            n = mops.BitOr(
+                n, mops.LShift(mops.IntWiden(b & 0x7f),
+                               mops.IntWiden(shift)))
+            if b < 0x80:
+                break
+            shift += 7
+
+        if not mops.Equal(mops.RShift(n, mops.IntWiden(num_bits)), mops.ZERO):
+            self.ok = False
+            return mops.ZERO
+        return n
+
+    def _ReadLen(self):
+        # type: () -> int
+        """A non-negative int."""
+        return mops.BigTruncate(self._ReadVarint(31))
+
+    def _Parse(self):
+        # type: () -> None
+        num_ints = self._ReadLen()
+        for _ in xrange(num_ints):
+            u = self._ReadVarint(32)
+            if not self.ok:
+                return
+            self.ints.append(_UnZigZag(u))
+
+        num_strs = self._ReadLen()
+        for _ in xrange(num_strs):
+            n = self._ReadLen()
+            if not self.ok:
+                return
+            if n == 0:
+                self.strs.append(None)
+                continue
+            end = self.pos + n - 1
+            if end > len(self.blob):
+                self.ok = False
+                return
+            self.strs.append(self.blob[self.pos:end])
+            self.pos = end
+
+        if self.pos != len(self.blob):
+            self.ok = False
+
+    def External(self, obj):
+        # type: (Any) -> None
+        """See Encoder.External()."""
+        self.objs.append(obj)
+
+    def Register(self, obj):
+        # type: (Any) -> None
+        self.objs.append(obj)
+
+    def Int(self):
+        # type: () -> int
+        if self.int_pos >= len(self.ints):
+            self.ok = False
+            return MARSHAL_NULL
+        i = self.ints[self.int_pos]
+        self.int_pos += 1
+        return i
+
+    def Bool(self):
+        # type: () -> bool
+        return self.Int() != 0
+
+    def Str(self):
+        # type: () -> Optional[str]
+        if self.str_pos >= len(self.strs):
+            self.ok = False
+            return None
+        s = self.strs[self.str_pos]
+        self.str_pos += 1
+        return s
+
+    def Len(self):
+        # type: () -> int
+        """Length of a List, or -1 for None."""
+        n = self.Int()
+        # Every item takes at least one int or string, so don't loop forever
+        # on a corrupt length.
+        remaining = len(self.ints) - self.int_pos + len(self.strs) - self.str_pos
+        if n < -1 or n > remaining:
+            self.ok = False
+            return 0
+        return n
+
+    def Ref(self):
+        # type: () -> Any
+        """Return an object that was already decoded, after MARSHAL_REF."""
+        num = self.Int()
+        if num < 0 or num >= len(self.objs):
+            self.ok = False
+            return None
+        return self.objs[num]
+
+    def BadTag(self, tag):
+        # type: (int) -> None
+        self.ok = False
+
+    def Unsupported(self):
+        # type: () -> None
+        """The Encoder never writes output for these fields."""
+        self.Int()
+        self.ok = False
+
+    def AtEnd(self):
+        # type: () -> bool
+        return self.int_pos == len(self.ints) and self.str_pos == len(self.strs)
@@ -0,0 +1,76 @@
+#!/usr/bin/env bash
+#
+# Compare the glob engine in osh/glob_.py with libc glob() and bash.
+#
+# Usage:
+#   benchmarks/glob.sh <function name>
+#
+# Example:
+#   benchmarks/glob.sh setup
+#   benchmarks/glob.sh compare
+
+set -o nounset
+set -o pipefail
+set -o errexit
+
+REPO_ROOT=$(cd "$(dirname $0)/.."; pwd)
+
+readonly TREE=_tmp/glob-bench
+
+# 100 dirs with 1000 files each
+setup() {
+  rm -r -f $TREE
+  mkdir -p $TREE
+
+  local i
+  for i in $(seq 100); do
+    mkdir -p $TREE/d$i/sub
+    (cd $TREE/d$i && touch $(seq -f 'f%g.txt' 990) $(seq -f 'g%g.py' 9))
+    touch $TREE/d$i/sub/deep.py
+  done
+  find $TREE -type f | wc -l
+}
+
+# The same patterns through libc glob(), which osh used before
+libc-glob() {
+  local pat=$1
+  PYTHONPATH=$REPO_ROOT python2 -S -c '
+import sys
+import libc
+print(len(libc.glob(sys.argv[1])))
+' "$pat"
+}
+
+osh-glob() {
+  local pat=$1
+  $REPO_ROOT/bin/osh -c 'shopt -s globstar; a=( '"$pat"' ); echo ${#a[@]}'
+}
+
+bash-glob() {
+  local pat=$1
+  bash -c 'shopt -s globstar; a=( '"$pat"' ); echo ${#a[@]}'
+}
+
+compare-one() {
+  local pat=$1
+
+  echo "=== $pat"
+  local impl
+  for impl in libc-glob osh-glob bash-glob; do
+    echo "--- $impl"
+    time $impl "$pat"
+  done
+}
+
+compare() {
+  # Every file
+  compare-one "$TREE/*/*.txt"
+
+  # A literal directory is looked up without reading its parent
+  compare-one "$TREE/d42/*.py"
+
+  # libc glob() can't do this one; it treats ** like *
+  compare-one "$TREE/**/*.py"
+}
+
+"$@"
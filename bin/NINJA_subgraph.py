@@ -75,6 +75,7 @@ def NinjaGraph(ru):
                          '//bin/text_files',
                          '//cpp/core',
                          '//cpp/data_lang',
+                         '//cpp/data_lang_read',
                          '//cpp/fanos',
                          '//cpp/libc',
                          '//cpp/osh',
@@ -430,7 +430,7 @@ class Rules(object):
     return headers
 
   def asdl_library(self, asdl_path, deps = None,
-      pretty_print_methods=True):
+      pretty_print_methods=True, marshal_methods=False):
 
     deps = deps or []
 
@@ -451,6 +451,10 @@ class Rules(object):
       outputs = [out_header]
       asdl_flags += '--no-pretty-print-methods'
 
+    if marshal_methods:
+      # Marshal() and Unmarshal(), for the parse cache
+      asdl_flags += ' --marshal-methods'
+
     debug_mod = prefix + '_debug.py'
     outputs.append(debug_mod)
 
@@ -154,7 +154,7 @@ py-codegen() {
   # does __import__ of syntax_abbrev.py, which depends on Id.  We could use the
   # AST module later?
   # depends on syntax_asdl
-  gen-asdl-py 'frontend/syntax.asdl' 'frontend.syntax_abbrev'
+  gen-asdl-py 'frontend/syntax.asdl' 'frontend.syntax_abbrev' --marshal-methods
 
   option-mypy-gen
   flag-gen-mypy
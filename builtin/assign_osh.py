@@ -11,6 +11,7 @@ from _devbuild.gen.runtime_asdl import (
 from _devbuild.gen.value_asdl import (value, value_e, value_t, LeftName)
 from _devbuild.gen.syntax_asdl import loc, loc_t, word_t
 
+from core import bash_array
 from core import error
 from core.error import e_usage
 from core import state
@@ -164,31 +165,27 @@ def _PrintVariables(mem, cmd_val, attrs, print_flags, builtin=_OTHER):
         elif val.tag() == value_e.BashArray:
             array_val = cast(value.BashArray, val)
 
-            # mycpp rewrite: None in array_val.strs
-            has_holes = False
-            for s in array_val.strs:
-                if s is None:
-                    has_holes = True
-                    break
+            keys = bash_array.GetKeys(array_val)
+            values = bash_array.GetValues(array_val)
+            has_holes = len(keys) != bash_array.Length(array_val)
 
             if has_holes:
                 # Note: Arrays with unset elements are printed in the form:
                 #   declare -p arr=(); arr[3]='' arr[4]='foo' ...
                 decl.append("=()")
                 first = True
-                for i, element in enumerate(array_val.strs):
-                    if element is not None:
-                        if first:
-                            decl.append(";")
-                            first = False
-                        decl.extend([
-                            " ", name, "[",
-                            str(i), "]=",
-                            j8_lite.MaybeShellEncode(element)
-                        ])
+                for k in xrange(len(keys)):
+                    if first:
+                        decl.append(";")
+                        first = False
+                    decl.extend([
+                        " ", name, "[",
+                        str(keys[k]), "]=",
+                        j8_lite.MaybeShellEncode(values[k])
+                    ])
             else:
                 body = []  # type: List[str]
-                for element in array_val.strs:
+                for element in values:
                     if len(body) > 0:
                         body.append(" ")
                     body.append(j8_lite.MaybeShellEncode(element))
@@ -305,7 +302,7 @@ def _ReconcileTypes(rval, flag_a, flag_A, blame_word):
         # associative array.
         if rval.tag() == value_e.BashArray:
             array_val = cast(value.BashArray, rval)
-            if len(array_val.strs) == 0:
+            if bash_array.IsEmpty(array_val):
                 return value.BashAssoc({})
                 #return value.BashArray([])
 
@@ -340,7 +337,7 @@ class Readonly(vm._AssignBuiltin):
         for pair in cmd_val.pairs:
             if pair.rval is None:
                 if arg.a:
-                    rval = value.BashArray([])  # type: value_t
+                    rval = value.BashArray([], None)  # type: value_t
                 elif arg.A:
                     rval = value.BashAssoc({})
                 else:
@@ -449,7 +446,7 @@ class NewVar(vm._AssignBuiltin):
                 old_val = self.mem.GetValue(pair.var_name)
                 if arg.a:
                     if old_val.tag() != value_e.BashArray:
-                        rval = value.BashArray([])
+                        rval = value.BashArray([], None)
                 elif arg.A:
                     if old_val.tag() != value_e.BashAssoc:
                         rval = value.BashAssoc({})
@@ -2,7 +2,7 @@
 from __future__ import print_function
 
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.syntax_asdl import loc, word, word_e, word_t, bool_expr
+from _devbuild.gen.syntax_asdl import loc, word, word_e, word_t
 from _devbuild.gen.types_asdl import lex_mode_e
 from _devbuild.gen.value_asdl import value
 
@@ -18,16 +18,35 @@ from osh import word_eval
 
 _ = log
 
-from typing import cast, TYPE_CHECKING
+from typing import cast, Dict, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from _devbuild.gen.id_kind_asdl import Id_t
     from _devbuild.gen.runtime_asdl import cmd_value
-    from _devbuild.gen.syntax_asdl import bool_expr_t
+    from _devbuild.gen.syntax_asdl import bool_expr_t, CompoundWord
     from _devbuild.gen.types_asdl import lex_mode_t
     from core.ui import ErrorFormatter
     from core import optview
     from core import state
 
+# Don't let a script with many distinct long expressions grow the cache
+# without bound
+_SHAPE_CACHE_SIZE = 64
+
+
+def _ArgId(s):
+    # type: (str) -> Id_t
+    """Classify an arg of test/[ like a token."""
+    # chained lookup; default is an operand word
+    id_ = match.BracketUnary(s)
+    if id_ == Id.Undefined_Tok:
+        id_ = match.BracketBinary(s)
+    if id_ == Id.Undefined_Tok:
+        id_ = match.BracketOther(s)
+    if id_ == Id.Undefined_Tok:
+        id_ = Id.Word_Compound
+    return id_
+
 
 class _StringWordEmitter(word_parse.WordEmitter):
     """For test/[, we need a word parser that returns String.
@@ -42,6 +61,7 @@ class _StringWordEmitter(word_parse.WordEmitter):
         self.cmd_val = cmd_val
         self.i = 0
         self.n = len(cmd_val.argv)
+        self.words = []  # type: List[word.String]  # every word returned
 
     def ReadWord(self, unused_lex_mode):
         # type: (lex_mode_t) -> word.String
@@ -61,16 +81,9 @@ class _StringWordEmitter(word_parse.WordEmitter):
 
         self.i += 1
 
-        # chained lookup; default is an operand word
-        id_ = match.BracketUnary(s)
-        if id_ == Id.Undefined_Tok:
-            id_ = match.BracketBinary(s)
-        if id_ == Id.Undefined_Tok:
-            id_ = match.BracketOther(s)
-        if id_ == Id.Undefined_Tok:
-            id_ = Id.Word_Compound
-
-        return word.String(id_, s, arg_loc)
+        w = word.String(_ArgId(s), s, arg_loc)
+        self.words.append(w)
+        return w
 
     def Read(self):
         # type: () -> word.String
@@ -105,68 +118,38 @@ class _WordEvaluator(word_eval.StringWordEvaluator):
         return value.Str(string_word.s)
 
 
-def _TwoArgs(w_parser):
-    # type: (_StringWordEmitter) -> bool_expr_t
-    """Returns an expression tree to be evaluated."""
-    w0 = w_parser.Read()
-    w1 = w_parser.Read()
-
-    s0 = w0.s
-    if s0 == '!':
-        return bool_expr.LogicalNot(bool_expr.WordTest(w1))
-
-    unary_id = Id.Undefined_Tok
-
-    # YSH prefers long flags
-    if w0.s.startswith('--'):
-        if s0 == '--dir':
-            unary_id = Id.BoolUnary_d
-        elif s0 == '--exists':
-            unary_id = Id.BoolUnary_e
-        elif s0 == '--file':
-            unary_id = Id.BoolUnary_f
-        elif s0 == '--symlink':
-            unary_id = Id.BoolUnary_L
-
-    if unary_id == Id.Undefined_Tok:
-        unary_id = match.BracketUnary(w0.s)
-
-    if unary_id == Id.Undefined_Tok:
-        p_die('Expected unary operator, got %r (2 args)' % w0.s, loc.Word(w0))
+class _Shape(object):
+    """A parsed expression with more than 4 args, for reuse.
 
-    return bool_expr.Unary(unary_id, w1)
-
-
-def _ThreeArgs(w_parser):
-    # type: (_StringWordEmitter) -> bool_expr_t
-    """Returns an expression tree to be evaluated."""
-    w0 = w_parser.Read()
-    w1 = w_parser.Read()
-    w2 = w_parser.Read()
-
-    # NOTE: Order is important here.
-
-    binary_id = match.BracketBinary(w1.s)
-    if binary_id != Id.Undefined_Tok:
-        return bool_expr.Binary(binary_id, w0, w2)
+    The parse only depends on the classification of each arg, not its
+    value.  So we can swap the values and locations of the args into the
+    leaves of the tree.
+    """
 
-    if w1.s == '-a':
-        return bool_expr.LogicalAnd(bool_expr.WordTest(w0),
-                                    bool_expr.WordTest(w2))
+    def __init__(self, node, words):
+        # type: (bool_expr_t, List[word.String]) -> None
+        self.node = node
+        self.words = words  # one per arg, in order
 
-    if w1.s == '-o':
-        return bool_expr.LogicalOr(bool_expr.WordTest(w0),
-                                   bool_expr.WordTest(w2))
 
-    if w0.s == '!':
-        w_parser.Rewind(2)
-        child = _TwoArgs(w_parser)
-        return bool_expr.LogicalNot(child)
+def _ArgWord(argv, arg_locs, i):
+    # type: (List[str], List[CompoundWord], int) -> word.String
+    """A word for error locations.  The ID doesn't matter."""
+    return word.String(Id.Word_Compound, argv[i], arg_locs[i])
 
-    if w0.s == '(' and w2.s == ')':
-        return bool_expr.WordTest(w1)
 
-    p_die('Expected binary operator, got %r (3 args)' % w1.s, loc.Word(w1))
+def _LongFlagId(s):
+    # type: (str) -> Id_t
+    """YSH prefers long flags."""
+    if s == '--dir':
+        return Id.BoolUnary_d
+    if s == '--exists':
+        return Id.BoolUnary_e
+    if s == '--file':
+        return Id.BoolUnary_f
+    if s == '--symlink':
+        return Id.BoolUnary_L
+    return Id.Undefined_Tok
 
 
 class Test(vm._Builtin):
@@ -178,6 +161,104 @@ class Test(vm._Builtin):
         self.mem = mem
         self.errfmt = errfmt
 
+        # We technically don't need mem because we don't support BASH_REMATCH here.
+        # We want [ a -eq a ] to always be an error, unlike [[ a -eq a ]].  This is
+        # a weird case of [[ being less strict.
+        self.bool_ev = sh_expr_eval.BoolEvaluator(mem,
+                                                  exec_opts,
+                                                  None,
+                                                  None,
+                                                  errfmt,
+                                                  always_strict=True)
+        self.bool_ev.word_ev = _WordEvaluator()
+        self.bool_ev.CheckCircularDeps()
+
+        # Operator pattern -> parsed tree, for expressions with more than 4
+        # args
+        self.shapes = {}  # type: Dict[str, _Shape]
+
+    def _TwoArgs(self, argv, arg_locs, i):
+        # type: (List[str], List[CompoundWord], int) -> bool
+        s0 = argv[i]
+        s1 = argv[i + 1]
+        if s0 == '!':
+            return not bool(s1)
+
+        unary_id = Id.Undefined_Tok
+        if s0.startswith('--'):
+            unary_id = _LongFlagId(s0)
+
+        if unary_id == Id.Undefined_Tok:
+            unary_id = match.BracketUnary(s0)
+
+        if unary_id == Id.Undefined_Tok:
+            p_die('Expected unary operator, got %r (2 args)' % s0,
+                  loc.Word(_ArgWord(argv, arg_locs, i)))
+
+        return self.bool_ev.EvalUnary(unary_id, s1,
+                                      _ArgWord(argv, arg_locs, i + 1))
+
+    def _ThreeArgs(self, argv, arg_locs, i):
+        # type: (List[str], List[CompoundWord], int) -> bool
+        s0 = argv[i]
+        s1 = argv[i + 1]
+        s2 = argv[i + 2]
+
+        # NOTE: Order is important here.
+
+        binary_id = match.BracketBinary(s1)
+        if binary_id != Id.Undefined_Tok:
+            return self.bool_ev.EvalBinary(binary_id, s0, s2,
+                                           _ArgWord(argv, arg_locs, i),
+                                           _ArgWord(argv, arg_locs, i + 2))
+
+        if s1 == '-a':
+            return bool(s0) and bool(s2)
+
+        if s1 == '-o':
+            return bool(s0) or bool(s2)
+
+        if s0 == '!':
+            return not self._TwoArgs(argv, arg_locs, i + 1)
+
+        if s0 == '(' and s2 == ')':
+            return bool(s1)
+
+        p_die('Expected binary operator, got %r (3 args)' % s1,
+              loc.Word(_ArgWord(argv, arg_locs, i + 1)))
+
+    def _ParseShape(self, cmd_val):
+        # type: (cmd_value.Argv) -> bool_expr_t
+        """Parse an expression with the BoolParser, reusing earlier parses.
+
+        Raises error.Parse.
+        """
+        argv = cmd_val.argv
+        n = len(argv)
+
+        parts = []  # type: List[str]
+        for i in xrange(1, n):
+            parts.append(str(_ArgId(argv[i])))
+        key = ' '.join(parts)
+
+        shape = self.shapes.get(key)
+        if shape is not None:
+            # Same operators in the same places, so the tree is the same
+            for i, w in enumerate(shape.words):
+                w.s = argv[i + 1]
+                w.blame_loc = cmd_val.arg_locs[i + 1]
+            return shape.node
+
+        w_parser = _StringWordEmitter(cmd_val)
+        w_parser.Read()  # dummy: advance past argv[0]
+        b_parser = bool_parse.BoolParser(w_parser)
+        node = b_parser.ParseForBuiltin()
+
+        if len(self.shapes) < _SHAPE_CACHE_SIZE:
+            # Skip argv[0] and the Eof_Real words at the end
+            self.shapes[key] = _Shape(node, w_parser.words[1:n])
+        return node
+
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
         """The test/[ builtin.
@@ -199,10 +280,6 @@ class Test(vm._Builtin):
             cmd_val.argv.pop()
             cmd_val.arg_locs.pop()
 
-        w_parser = _StringWordEmitter(cmd_val)
-        w_parser.Read()  # dummy: advance past argv[0]
-        b_parser = bool_parse.BoolParser(w_parser)
-
         # There is a fundamental ambiguity due to poor language design, in cases like:
         # [ -z ]
         # [ -z -a ]
@@ -216,62 +293,42 @@ class Test(vm._Builtin):
         # Another ambiguity:
         # -a is both a unary prefix operator and an infix operator.  How to fix this
         # ambiguity?
+        #
+        # The forms with 4 args or fewer are evaluated directly, without
+        # building a bool_expr tree.  Parse errors in them are raised before
+        # anything is evaluated, as if we had parsed first.
 
-        bool_node = None  # type: bool_expr_t
-        n = len(cmd_val.argv) - 1
+        argv = cmd_val.argv
+        arg_locs = cmd_val.arg_locs
+        n = len(argv) - 1
 
         if self.exec_opts.simple_test_builtin() and n > 3:
             e_usage(
                 "should only have 3 arguments or fewer (simple_test_builtin)",
                 loc.Missing)
 
+        if n == 0:
+            return 1  # [ ] is False
+
         try:
-            if n == 0:
-                return 1  # [ ] is False
-            elif n == 1:
-                w = w_parser.Read()
-                bool_node = bool_expr.WordTest(w)
+            if n == 1:
+                b = bool(argv[1])
             elif n == 2:
-                bool_node = _TwoArgs(w_parser)
+                b = self._TwoArgs(argv, arg_locs, 1)
             elif n == 3:
-                bool_node = _ThreeArgs(w_parser)
-            if n == 4:
-                a0 = w_parser.Peek(0)
-                if a0 == '!':
-                    w_parser.Read()  # skip !
-                    child = _ThreeArgs(w_parser)
-                    bool_node = bool_expr.LogicalNot(child)
-                elif a0 == '(' and w_parser.Peek(3) == ')':
-                    w_parser.Read()  # skip ')'
-                    bool_node = _TwoArgs(w_parser)
-                else:
-                    pass  # fallthrough
-
-            if bool_node is None:
-                bool_node = b_parser.ParseForBuiltin()
-
-        except error.Parse as e:
-            self.errfmt.PrettyPrintError(e, prefix='(test) ')
-            return 2
-
-        word_ev = _WordEvaluator()
+                b = self._ThreeArgs(argv, arg_locs, 1)
+            elif n == 4 and argv[1] == '!':
+                b = not self._ThreeArgs(argv, arg_locs, 2)
+            elif n == 4 and argv[1] == '(' and argv[4] == ')':
+                b = self._TwoArgs(argv, arg_locs, 2)
+            else:
+                bool_node = self._ParseShape(cmd_val)
+                b = self.bool_ev.EvalB(bool_node)
 
-        # We technically don't need mem because we don't support BASH_REMATCH here.
-        # We want [ a -eq a ] to always be an error, unlike [[ a -eq a ]].  This is
-        # a weird case of [[ being less strict.
-        bool_ev = sh_expr_eval.BoolEvaluator(self.mem,
-                                             self.exec_opts,
-                                             None,
-                                             None,
-                                             self.errfmt,
-                                             always_strict=True)
-        bool_ev.word_ev = word_ev
-        bool_ev.CheckCircularDeps()
-        try:
-            b = bool_ev.EvalB(bool_node)
         except error._ErrorWithLocation as e:
-            # We want to catch e_die() and e_strict().  Those are both FatalRuntime
-            # errors now, but it might not make sense later.
+            # We want to catch p_die(), e_die(), and e_strict().  The latter
+            # two are FatalRuntime errors now, but it might not make sense
+            # later.
 
             # NOTE: This doesn't seem to happen.  We have location info for all
             # errors that arise out of [.
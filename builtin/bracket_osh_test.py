@@ -4,7 +4,11 @@ from __future__ import print_function
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.runtime_asdl import cmd_value
+from _devbuild.gen.syntax_asdl import CompoundWord, word_shape_e
+from core import state
 from core import test_lib
+from core import ui
 from builtin import bracket_osh  # module under test
 
 
@@ -22,5 +26,85 @@ class BracketTest(unittest.TestCase):
                 break
 
 
+def _MakeTest():
+    arena = test_lib.MakeArena('<bracket_osh_test>')
+    mem = state.Mem('', [], arena, [])
+    _, exec_opts, mutable_opts = state.MakeOpts(mem, None)
+    mem.exec_opts = exec_opts
+    state.InitMem(mem, {}, '0.1')
+    mutable_opts.Init()
+    return bracket_osh.Test(False, exec_opts, mem, ui.ErrorFormatter())
+
+
+class TestBuiltinTest(unittest.TestCase):
+
+    def _Run(self, b, argv_str):
+        argv = ['test'] + argv_str.split(' ') if argv_str else ['test']
+        # Error messages need real locations
+        arg_locs = [
+            CompoundWord([test_lib.FakeTok(Id.Lit_Chars, s)],
+                         word_shape_e.Unknown) for s in argv
+        ]
+        return b.Run(cmd_value.Argv(argv, arg_locs, None, None, None, None))
+
+    def testShortForms(self):
+        b = _MakeTest()
+        CASES = [
+            ('', 1),
+            ('x', 0),
+            ('-z', 0),  # one arg is a word test
+            ('! x', 1),
+            ('-z x', 1),
+            ('--dir /', 0),
+            ('--file /', 1),
+            ('-f', 0),
+            ('x -a y', 0),
+            ('x -o y', 0),
+            ('x = x', 0),
+            ('x != x', 1),
+            ('3 -lt 10', 0),
+            ('b < a', 1),
+            ('! -z x', 0),
+            ('( x )', 0),
+            ('! x = y', 0),
+            ('( -n x )', 0),
+            ('( -z x )', 1),
+            # Errors are status 2
+            ('x y', 2),
+            ('x y z', 2),
+            ('a -eq 1', 2),
+            ('! x y z', 2),
+        ]
+        for argv_str, status in CASES:
+            self.assertEqual(status, self._Run(b, argv_str), argv_str)
+
+        # Short forms don't need the parser
+        self.assertEqual(0, len(b.shapes))
+
+    def testShapeCache(self):
+        b = _MakeTest()
+        self.assertEqual(0, self._Run(b, '-n a -a -z  -o x = y'))
+        self.assertEqual(1, len(b.shapes))
+
+        # Same operators, different operands
+        self.assertEqual(1, self._Run(b, '-n  -a -z b -o x = y'))
+        self.assertEqual(0, self._Run(b, '-n  -a -z b -o y = y'))
+        self.assertEqual(1, len(b.shapes))
+
+        # Errors use the new operands
+        self.assertEqual(2, self._Run(b, 'x -eq 1 -a 1 -eq 1'))
+        self.assertEqual(0, self._Run(b, '1 -eq 1 -a 1 -eq 1'))
+        self.assertEqual(2, self._Run(b, '1 -eq 1 -a 1 -eq z'))
+        self.assertEqual(2, len(b.shapes))
+
+        # Parse errors aren't cached
+        self.assertEqual(2, self._Run(b, 'a b c d e'))
+        self.assertEqual(2, len(b.shapes))
+
+        for i in xrange(bracket_osh._SHAPE_CACHE_SIZE + 10):
+            self._Run(b, ' '.join(['x'] + ['-a x'] * (i + 3)))
+        self.assertEqual(bracket_osh._SHAPE_CACHE_SIZE, len(b.shapes))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,7 @@ from _devbuild.gen import arg_types
 from _devbuild.gen.syntax_asdl import loc
 from _devbuild.gen.value_asdl import (value, value_e)
 
+from core import bash_array
 from core import completion
 from core import error
 from core import state
@@ -101,6 +102,7 @@ class SpecBuilder(object):
             splitter,  # type: SplitContext
             comp_lookup,  # type: Lookup
             help_data,  # type: Dict[str, str]
+            search_path,  # type: state.SearchPath
             errfmt  # type: ui.ErrorFormatter
     ):
         # type: (...) -> None
@@ -108,12 +110,14 @@ class SpecBuilder(object):
         Args:
           cmd_ev: CommandEvaluator for compgen -F
           parse_ctx, word_ev, splitter: for compgen -W
+          search_path: for compgen -A command
         """
         self.cmd_ev = cmd_ev
         self.parse_ctx = parse_ctx
         self.word_ev = word_ev
         self.splitter = splitter
         self.comp_lookup = comp_lookup
+        self.search_path = search_path
 
         self.help_data = help_data
         # lazily initialized
@@ -179,7 +183,7 @@ class SpecBuilder(object):
                 actions.append(completion.FileSystemAction(False, True, False))
 
                 # Look on the file system.
-                a = completion.ExternalCommandAction(cmd_ev.mem)
+                a = completion.ExternalCommandAction(self.search_path)
 
             elif name == 'directory':
                 a = completion.FileSystemAction(True, False, False)
@@ -463,7 +467,7 @@ class CompAdjust(vm._Builtin):
         val = self.mem.GetValue('COMP_ARGV')
         if val.tag() != value_e.BashArray:
             raise error.Usage("COMP_ARGV should be an array", loc.Missing)
-        comp_argv = cast(value.BashArray, val).strs
+        comp_argv = bash_array.GetValues(cast(value.BashArray, val))
 
         # These are the ones from COMP_WORDBREAKS that we care about.  The rest occur
         # "outside" of words.
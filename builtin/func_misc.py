@@ -55,7 +55,11 @@ class Len(vm._Callable):
                 x = cast(value.Str, UP_x)
                 return num.ToBig(len(x.s))
 
-        raise error.TypeErr(x, 'len() expected Str, List, or Dict',
+            elif case(value_e.Range):  # O(1), without a List
+                x = cast(value.Range, UP_x)
+                return value.Int(val_ops.RangeLen(x))
+
+        raise error.TypeErr(x, 'len() expected Str, List, Range, or Dict',
                             rd.BlamePos())
 
 
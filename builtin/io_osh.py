@@ -23,6 +23,7 @@ import posix_ as posix
 from typing import List, Dict, TYPE_CHECKING
 if TYPE_CHECKING:
     from _devbuild.gen.runtime_asdl import cmd_value
+    from core import process
     from core import ui
     from osh import cmd_eval
 
@@ -112,11 +113,20 @@ class Echo(vm._Builtin):
 class MapFile(vm._Builtin):
     """Mapfile / readarray."""
 
-    def __init__(self, mem, errfmt, cmd_ev):
-        # type: (state.Mem, ui.ErrorFormatter, cmd_eval.CommandEvaluator) -> None
+    def __init__(
+            self,
+            mem,  # type: state.Mem
+            errfmt,  # type: ui.ErrorFormatter
+            cmd_ev,  # type: cmd_eval.CommandEvaluator
+            exec_opts,  # type: optview.Exec
+            stdin_buf,  # type: process.StdinBuffer
+    ):
+        # type: (...) -> None
         self.mem = mem
         self.errfmt = errfmt
         self.cmd_ev = cmd_ev
+        self.exec_opts = exec_opts
+        self.stdin_buf = stdin_buf
 
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
@@ -127,11 +137,16 @@ class MapFile(vm._Builtin):
         if var_name is None:
             var_name = 'MAPFILE'
 
+        buffered = self.stdin_buf.ShouldRead(self.exec_opts.buffered_stdin())
+
         lines = []  # type: List[str]
         while True:
             # bash uses this slow algorithm; YSH could provide read --all-lines
             try:
-                line = read_osh.ReadLineSlowly(self.cmd_ev)
+                if buffered:
+                    line = read_osh.ReadLine(self.stdin_buf, self.cmd_ev)
+                else:
+                    line = read_osh.ReadLineSlowly(self.cmd_ev)
             except pyos.ReadError as e:
                 self.errfmt.PrintMessage("mapfile: read() error: %s" %
                                          posix.strerror(e.err_num))
@@ -147,6 +162,11 @@ class MapFile(vm._Builtin):
         return 0
 
 
+# $(< file) streams the file to the command sub pipe.  Larger chunks mean
+# fewer read() and write() calls for big files.
+_CAT_CHUNK_SIZE = 65536
+
+
 class Cat(vm._Builtin):
     """Internal implementation detail for $(< file).
 
@@ -162,7 +182,7 @@ class Cat(vm._Builtin):
         # type: (cmd_value.Argv) -> int
         chunks = []  # type: List[str]
         while True:
-            n, err_num = pyos.Read(0, 4096, chunks)
+            n, err_num = pyos.Read(0, _CAT_CHUNK_SIZE, chunks)
 
             if n < 0:
                 if err_num == EINTR:
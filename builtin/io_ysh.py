@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from core.alloc import Arena
     from core.ui import ErrorFormatter
     from osh import cmd_eval
+    from osh.sh_expr_eval import ArithParseCache
 
 _ = log
 
@@ -44,11 +45,12 @@ class Pp(_Builtin):
     'pp cell a' is a lot easier to type than 'argv.py "${a[@]}"'.
     """
 
-    def __init__(self, mem, errfmt, procs, arena):
-        # type: (state.Mem, ErrorFormatter, Dict[str, value.Proc], Arena) -> None
+    def __init__(self, mem, errfmt, procs, arena, arith_cache):
+        # type: (state.Mem, ErrorFormatter, Dict[str, value.Proc], Arena, ArithParseCache) -> None
         _Builtin.__init__(self, mem, errfmt)
         self.procs = procs
         self.arena = arena
+        self.arith_cache = arith_cache
         self.stdout_ = mylib.Stdout()
 
     def Run(self, cmd_val):
@@ -126,6 +128,11 @@ class Pp(_Builtin):
             print('TODO')
             status = 0
 
+        elif action == '.arith-cache':
+            # Strings like x='i+1' that are parsed at runtime
+            print(self.arith_cache.Stats())
+            status = 0
+
         elif action == 'proc':
             names, locs = arg_r.Rest2()
             if len(names):
@@ -1,9 +1,9 @@
 from __future__ import print_function
 
 from _devbuild.gen import arg_types
-from _devbuild.gen.runtime_asdl import cmd_value
-from _devbuild.gen.syntax_asdl import loc, loc_t
-from _devbuild.gen.value_asdl import value, LeftName
+from _devbuild.gen.runtime_asdl import cmd_value, flow_e
+from _devbuild.gen.syntax_asdl import loc, loc_t, command_t
+from _devbuild.gen.value_asdl import value, value_e, value_t, LeftName
 from builtin import read_osh
 from core import error
 from core.error import e_usage
@@ -11,17 +11,20 @@ from core import pyos
 from core import state
 from core import vm
 from data_lang import j8
+from data_lang import pyj8_read
 from frontend import flag_util
 from frontend import args
 from frontend import typed_args
 from mycpp import mops
 from mycpp import mylib
 from mycpp.mylib import log
+from osh import cmd_eval
 
 import posix_ as posix
 
-from typing import TYPE_CHECKING
+from typing import cast, List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
+    from core.process import StdinBuffer
     from core.ui import ErrorFormatter
 
 _ = log
@@ -36,16 +39,103 @@ class Json(vm._Builtin):
     --indent=2 controls multiline indentation
     """
 
-    def __init__(self, mem, errfmt, is_j8):
-        # type: (state.Mem, ErrorFormatter, bool) -> None
+    def __init__(self, mem, errfmt, cmd_ev, is_j8, stdin_buf):
+        # type: (state.Mem, ErrorFormatter, cmd_eval.CommandEvaluator, bool, StdinBuffer) -> None
         self.mem = mem
         self.errfmt = errfmt
+        self.cmd_ev = cmd_ev  # to run blocks, and traps on EINTR
+        self.stdin_buf = stdin_buf
 
         self.is_j8 = is_j8
         self.name = 'json8' if is_j8 else 'json'  # for error messages
 
         self.stdout_ = mylib.Stdout()
 
+    def _Print(self, val, buf, indent):
+        # type: (value_t, mylib.BufWriter, int) -> None
+        if self.is_j8:
+            j8.PrintMessage(val, buf, indent)
+        else:
+            j8.PrintJsonMessage(val, buf, indent)
+
+    def _WriteLines(self, val, action_loc):
+        # type: (value_t, loc_t) -> int
+        """json write --lines: each item of a List on its own line."""
+        UP_val = val
+        if val.tag() != value_e.List:
+            raise error.TypeErr(val, 'json write --lines expected a List',
+                                action_loc)
+        val = cast(value.List, UP_val)
+
+        for item in val.items:
+            buf = mylib.BufWriter()
+            try:
+                self._Print(item, buf, -1)
+            except error.Encode as e:
+                self.errfmt.PrintMessage(
+                    '%s write: %s' % (self.name, e.Message()), action_loc)
+                return 1
+            buf.write('\n')
+            self.stdout_.write(buf.getvalue())
+
+        return 0
+
+    def _ReadLines(self, place, block, blame_loc, action_loc):
+        # type: (value.Place, Optional[command_t], loc_t, loc_t) -> int
+        """json read --lines: decode one record per line, until EOF.
+
+        With a block, set the place to each record and run the block, like a
+        loop body.  Otherwise, append the records to a List in the place.
+
+        Only one line is held in memory at a time.
+        """
+        records = None  # type: List[value_t]
+        if block is None:
+            records = []
+            self.mem.SetPlace(place, value.List(records), blame_loc)
+
+        line_num = 0
+        with cmd_eval.ctx_LoopLevel(self.cmd_ev):
+            while True:
+                try:
+                    line = read_osh.ReadLine(self.stdin_buf, self.cmd_ev)
+                except pyos.ReadError as e:
+                    self.errfmt.PrintMessage("read error: %s" %
+                                             posix.strerror(e.err_num))
+                    return 1
+                if len(line) == 0:  # EOF
+                    break
+
+                line_num += 1
+                if len(line.strip()) == 0:  # blank lines are allowed
+                    continue
+
+                p = j8.Parser(line, self.is_j8)
+                try:
+                    val = p.ParseValue()
+                except error.Decode as err:
+                    err.line_num = line_num  # not the line within the record
+                    self.errfmt.Print_('%s read: %s' %
+                                       (self.name, err.Message()),
+                                       blame_loc=action_loc)
+                    return 1
+
+                if block is None:
+                    records.append(val)
+                    continue
+
+                self.mem.SetPlace(place, val, blame_loc)
+                try:
+                    unused = self.cmd_ev.EvalLoopBody(block)
+                except vm.IntControlFlow as e:
+                    action = e.HandleLoop()
+                    if action == flow_e.Break:
+                        break
+                    elif action == flow_e.Raise:
+                        raise
+
+        return 0
+
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
         arg_r = args.Reader(cmd_val.argv, locs=cmd_val.arg_locs)
@@ -72,6 +162,9 @@ class Json(vm._Builtin):
             space = mops.BigTruncate(rd.NamedInt('space', 2))
             rd.Done()
 
+            if arg_jw.lines:  # json write --lines (mylist)
+                return self._WriteLines(val, action_loc)
+
             # Convert from external JS-like API to internal API.
             if space <= 0:
                 indent = -1
@@ -80,10 +173,7 @@ class Json(vm._Builtin):
 
             buf = mylib.BufWriter()
             try:
-                if self.is_j8:
-                    j8.PrintMessage(val, buf, indent)
-                else:
-                    j8.PrintJsonMessage(val, buf, indent)
+                self._Print(val, buf, indent)
             except error.Encode as e:
                 self.errfmt.PrintMessage(
                     '%s write: %s' % (self.name, e.Message()), action_loc)
@@ -94,37 +184,51 @@ class Json(vm._Builtin):
 
         elif action == 'read':
             attrs = flag_util.Parse('json_read', arg_r)
-            #arg_jr = arg_types.json_read(attrs.attrs)
+            arg_jr = arg_types.json_read(attrs.attrs)
+
+            place = None  # type: Optional[value.Place]
+            block = None  # type: Optional[command_t]
+            blame_loc = cmd_val.arg_locs[0]  # type: loc_t
 
             if cmd_val.typed_args:  # json read (&x)
                 rd = typed_args.ReaderForProc(cmd_val)
-                place = rd.PosPlace()
+                if arg_jr.lines:  # json read --lines (&x) { echo $x }
+                    place = rd.OptionalPlace()
+                    block = rd.OptionalBlock()
+                else:
+                    place = rd.PosPlace()
                 rd.Done()
 
-                blame_loc = cmd_val.typed_args.left  # type: loc_t
+                if place is not None:
+                    blame_loc = cmd_val.typed_args.left
 
-            else:  # json read
+            if place is None:  # json read
                 var_name = '_reply'
 
                 #log('VAR %s', var_name)
-                blame_loc = cmd_val.arg_locs[0]
                 place = value.Place(LeftName(var_name, blame_loc),
                                     self.mem.TopNamespace())
 
             if not arg_r.AtEnd():
                 e_usage('read got too many args', arg_r.Location())
 
+            if arg_jr.lines:
+                return self._ReadLines(place, block, blame_loc, action_loc)
+
+            # Like read_osh.ReadAll(), start with what's buffered
+            if self.stdin_buf.HasData():
+                prefix = self.stdin_buf.TakeAll()
+            else:
+                prefix = ''
+
+            # Decode while reading, instead of reading everything first
             try:
-                contents = read_osh.ReadAll()
+                val = pyj8_read.ReadValue(0, prefix, self.is_j8)
             except pyos.ReadError as e:  # different paths for read -d, etc.
                 # don't quote code since YSH errexit will likely quote
                 self.errfmt.PrintMessage("read error: %s" %
                                          posix.strerror(e.err_num))
                 return 1
-
-            p = j8.Parser(contents, self.is_j8)
-            try:
-                val = p.ParseValue()
             except error.Decode as err:
                 # TODO: Need to show position info
                 self.errfmt.Print_('%s read: %s' % (self.name, err.Message()),
@@ -6,7 +6,7 @@ from __future__ import print_function
 
 from _devbuild.gen import arg_types
 from _devbuild.gen.runtime_asdl import cmd_value, CommandStatus
-from _devbuild.gen.syntax_asdl import source, loc
+from _devbuild.gen.syntax_asdl import source, source_t, loc
 from _devbuild.gen.value_asdl import value
 from core import alloc
 from core import dev
@@ -14,6 +14,7 @@ from core import error
 from core import executor
 from core import main_loop
 from core import process
+from core import pyos
 from core.error import e_usage
 from core import pyutil  # strerror
 from core import state
@@ -23,6 +24,7 @@ from frontend import flag_util
 from frontend import consts
 from frontend import reader
 from frontend import typed_args
+from mycpp import mylib
 from mycpp.mylib import log, print_stderr
 from pylib import os_path
 from osh import cmd_eval
@@ -35,6 +37,7 @@ _ = log
 from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from frontend import args
+    from frontend.parse_cache import ParseCache
     from frontend.parse_lib import ParseContext
     from core import optview
     from core import ui
@@ -104,6 +107,7 @@ class Source(vm._Builtin):
             tracer,  # type: dev.Tracer
             errfmt,  # type: ui.ErrorFormatter
             loader,  # type: pyutil._ResourceLoader
+            parse_cache=None,  # type: Optional[ParseCache]
     ):
         # type: (...) -> None
         self.parse_ctx = parse_ctx
@@ -114,6 +118,7 @@ class Source(vm._Builtin):
         self.tracer = tracer
         self.errfmt = errfmt
         self.loader = loader
+        self.parse_cache = parse_cache
 
         self.mem = cmd_ev.mem
 
@@ -160,10 +165,71 @@ class Source(vm._Builtin):
             c_parser = self.parse_ctx.MakeOshParser(line_reader)
 
             with process.ctx_FileCloser(f):
-                return self._Exec(cmd_val, arg_r, path, c_parser)
+                return self._Exec(cmd_val, arg_r, path, c_parser,
+                                  resolved=resolved,
+                                  f=f,
+                                  line_reader=line_reader)
+
+    def _RunCached(self, resolved, src, c_parser, f, line_reader):
+        # type: (str, source_t, CommandParser, mylib.LineReader, reader.FileLineReader) -> int
+        """Like main_loop.Batch(), but use the parse cache if it's valid."""
+        try:
+            mtime, size = pyos.MakeFileCacheKey(resolved)
+        except (IOError, OSError) as e:
+            return main_loop.Batch(self.cmd_ev,
+                                   c_parser,
+                                   self.errfmt,
+                                   cmd_flags=cmd_eval.RaiseControlFlow)
+
+        abs_path = os_path.abspath(resolved)
+        lines = self.parse_cache.Load(abs_path, mtime, size, src)
+
+        if lines is None:  # miss
+            recorder = self.parse_cache.MakeRecorder(abs_path, mtime, size,
+                                                     src)
+            status = main_loop.Batch(self.cmd_ev,
+                                     c_parser,
+                                     self.errfmt,
+                                     cmd_flags=cmd_eval.RaiseControlFlow,
+                                     recorder=recorder)
+            if recorder:
+                self.parse_cache.Store(recorder)
+            return status
+
+        status = 0
+        for line in lines:
+            if not self.parse_cache.CanReuse(line):
+                # e.g. the file changed parse options with shopt.  Parse the
+                # rest of it, starting at this line.
+                for _ in xrange(line.start_line - 1):
+                    f.readline()
+                line_reader.SetLineOffset(line.start_line)
+                return main_loop.Batch(self.cmd_ev,
+                                       c_parser,
+                                       self.errfmt,
+                                       cmd_flags=cmd_eval.RaiseControlFlow)
 
-    def _Exec(self, cmd_val, arg_r, path, c_parser):
-        # type: (cmd_value.Argv, args.Reader, str, CommandParser) -> int
+            is_return, is_fatal = self.cmd_ev.ExecuteAndCatch(
+                line.node, cmd_flags=cmd_eval.RaiseControlFlow)
+            status = self.cmd_ev.LastStatus()
+            if is_return or is_fatal:
+                break
+
+            mylib.MaybeCollect()  # manual GC point
+
+        return status
+
+    def _Exec(
+            self,
+            cmd_val,  # type: cmd_value.Argv
+            arg_r,  # type: args.Reader
+            path,  # type: str
+            c_parser,  # type: CommandParser
+            resolved=None,  # type: Optional[str]
+            f=None,  # type: Optional[mylib.LineReader]
+            line_reader=None,  # type: Optional[reader.FileLineReader]
+    ):
+        # type: (...) -> int
         call_loc = cmd_val.arg_locs[0]
 
         # A sourced module CAN have a new arguments array, but it always shares
@@ -179,11 +245,15 @@ class Source(vm._Builtin):
                     src = source.SourcedFile(path, call_loc)
                     with alloc.ctx_SourceCode(self.arena, src):
                         try:
-                            status = main_loop.Batch(
-                                self.cmd_ev,
-                                c_parser,
-                                self.errfmt,
-                                cmd_flags=cmd_eval.RaiseControlFlow)
+                            if self.parse_cache and resolved is not None:
+                                status = self._RunCached(
+                                    resolved, src, c_parser, f, line_reader)
+                            else:
+                                status = main_loop.Batch(
+                                    self.cmd_ev,
+                                    c_parser,
+                                    self.errfmt,
+                                    cmd_flags=cmd_eval.RaiseControlFlow)
                         except vm.IntControlFlow as e:
                             if e.IsReturn():
                                 status = e.StatusCode()
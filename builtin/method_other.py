@@ -4,10 +4,15 @@ from __future__ import print_function
 
 from _devbuild.gen.value_asdl import (value, value_t)
 
+from core import error
 from core import state
 from core import vm
 from frontend import typed_args
+from mycpp import mops
 from mycpp.mylib import log
+from ysh import val_ops
+
+from typing import cast
 
 _ = log
 
@@ -30,3 +35,42 @@ class SetValue(vm._Callable):
         self.mem.SetPlace(place, val, rd.LeftParenToken())
 
         return value.Null
+
+
+class RangeStep(vm._Callable):
+    """(0 .. 10) => step(3) is 0, 3, 6, 9"""
+
+    def __init__(self):
+        # type: () -> None
+        pass
+
+    def Call(self, rd):
+        # type: (typed_args.Reader) -> value_t
+
+        # This is guaranteed
+        r = cast(value.Range, rd.PosValue())
+
+        step = rd.PosInt()
+        rd.Done()
+
+        if mops.Equal(step, mops.ZERO):
+            raise error.Expr("Range step can't be 0", rd.BlamePos())
+
+        return value.Range(r.lower, r.upper, step)
+
+
+class RangeReversed(vm._Callable):
+    """(0 .. 3) => reversed() is 2, 1, 0"""
+
+    def __init__(self):
+        # type: () -> None
+        pass
+
+    def Call(self, rd):
+        # type: (typed_args.Reader) -> value_t
+
+        # This is guaranteed
+        r = cast(value.Range, rd.PosValue())
+        rd.Done()
+
+        return val_ops.RangeReversed(r)
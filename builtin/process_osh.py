@@ -215,6 +215,7 @@ class Exec(vm._Builtin):
         c2 = cmd_value.Argv(cmd_val.argv[i:], cmd_val.arg_locs[i:], None, None,
                             None, None)
 
+        self.fd_state.stdin_buf.Sync()
         self.ext_prog.Exec(argv0_path, c2, environ)  # NEVER RETURNS
         # makes mypy and C++ compiler happy
         raise AssertionError('unreachable')
@@ -28,6 +28,8 @@ if TYPE_CHECKING:
     from _devbuild.gen.runtime_asdl import span_t
     from frontend.parse_lib import ParseContext
     from frontend import args
+    from core.optview import Exec
+    from core.process import StdinBuffer
     from osh.cmd_eval import CommandEvaluator
     from osh.split import SplitContext
 
@@ -185,6 +187,79 @@ def _ReadPortion(delim_byte, max_chars, cmd_ev):
     return pyutil.ChArrayToString(ch_array), eof
 
 
+#
+# Buffered variants for shopt -s buffered_stdin.  They also run traps on EINTR.
+#
+
+
+def _FillBuffer(stdin_buf, cmd_ev):
+    # type: (StdinBuffer, CommandEvaluator) -> bool
+    """Make sure stdin_buf has data.  Returns False on EOF."""
+    while not stdin_buf.HasData():
+        n, err_num = stdin_buf.Fill()
+        if n < 0:
+            if err_num == EINTR:
+                cmd_ev.RunPendingTraps()
+                # retry after running traps
+            else:
+                raise pyos.ReadError(err_num)
+
+        elif n == 0:  # EOF
+            return False
+
+    return True
+
+
+def _ReadNBuffered(stdin_buf, num_bytes, cmd_ev):
+    # type: (StdinBuffer, int, CommandEvaluator) -> str
+    """Like _ReadN()"""
+    chunks = []  # type: List[str]
+    bytes_left = num_bytes
+    while bytes_left > 0:
+        if not _FillBuffer(stdin_buf, cmd_ev):
+            break
+        s = stdin_buf.TakeN(bytes_left)
+        chunks.append(s)
+        bytes_left -= len(s)
+
+    return ''.join(chunks)
+
+
+def _ReadPortionBuffered(stdin_buf, delim_byte, max_chars, cmd_ev):
+    # type: (StdinBuffer, int, int, CommandEvaluator) -> Tuple[str, bool]
+    """Like _ReadPortion(), but scans blocks for the delimiter."""
+    delim = chr(delim_byte)
+    chunks = []  # type: List[str]
+    eof = False
+    bytes_left = max_chars
+    while bytes_left != 0:  # -1 means no limit
+        if not _FillBuffer(stdin_buf, cmd_ev):
+            eof = True
+            break
+
+        s, found = stdin_buf.Take(delim, bytes_left)
+        chunks.append(s)
+        if found:
+            break
+
+        if bytes_left > 0:
+            bytes_left -= len(s)
+
+    return ''.join(chunks), eof
+
+
+def ReadLine(stdin_buf, cmd_ev):
+    # type: (StdinBuffer, CommandEvaluator) -> str
+    """Read a line from the buffer, including the newline.
+
+    Like ReadLineSlowly(), returns the empty string on EOF.
+    """
+    line, eof = _ReadPortionBuffered(stdin_buf, pyos.NEWLINE_CH, -1, cmd_ev)
+    if eof:
+        return line
+    return line + '\n'
+
+
 # sys.stdin.readline() in Python has its own buffering which is incompatible
 # with shell semantics.  dash, mksh, and zsh all read a single byte at a
 # time with read(0, 1).
@@ -221,28 +296,20 @@ def ReadLineSlowly(cmd_ev):
     return pyutil.ChArrayToString(ch_array)
 
 
-def ReadAll():
-    # type: () -> str
-    """Read all of stdin.
+def ReadAll(stdin_buf):
+    # type: (StdinBuffer) -> str
+    """Read all of stdin, starting with what's buffered.
 
     Similar to command sub in core/executor.py.
     """
-    chunks = []  # type: List[str]
-    while True:
-        n, err_num = pyos.Read(0, 4096, chunks)
-
-        if n < 0:
-            if err_num == EINTR:
-                # Retry only.  Like read --line (and command sub), read --all doesn't
-                # run traps.  It would be a bit weird to run every 4096 bytes.
-                pass
-            else:
-                raise pyos.ReadError(err_num)
+    prefix = stdin_buf.TakeAll() if stdin_buf.HasData() else ''
 
-        elif n == 0:  # EOF
-            break
-
-    return ''.join(chunks)
+    # EINTR is retried only.  Like read --line (and command sub), read --all
+    # doesn't run traps.
+    s, err_num = pyos.ReadAll(0, prefix, False)
+    if err_num != 0:
+        raise pyos.ReadError(err_num)
+    return s
 
 
 class ctx_TermAttrs(object):
@@ -276,6 +343,8 @@ class Read(vm._Builtin):
             parse_ctx,  # type: ParseContext
             cmd_ev,  # type: CommandEvaluator
             errfmt,  # type: ui.ErrorFormatter
+            exec_opts,  # type: Exec
+            stdin_buf,  # type: StdinBuffer
     ):
         # type: (...) -> None
         self.splitter = splitter
@@ -283,6 +352,8 @@ class Read(vm._Builtin):
         self.parse_ctx = parse_ctx
         self.cmd_ev = cmd_ev
         self.errfmt = errfmt
+        self.exec_opts = exec_opts
+        self.stdin_buf = stdin_buf
         self.stdin_ = mylib.Stdin()
 
     # Was --qsn, might be restored as --j8-word or --j8-line
@@ -375,12 +446,16 @@ class Read(vm._Builtin):
 
         num_bytes = mops.BigTruncate(arg.num_bytes)
         if num_bytes != -1:  # read --num-bytes
-            contents = _ReadN(num_bytes, self.cmd_ev)
+            if self.stdin_buf.ShouldRead(self.exec_opts.buffered_stdin()):
+                contents = _ReadNBuffered(self.stdin_buf, num_bytes,
+                                          self.cmd_ev)
+            else:
+                contents = _ReadN(num_bytes, self.cmd_ev)
             self.mem.SetPlace(place, value.Str(contents), blame_loc)
             return 0
 
         if arg.all:  # read --all
-            contents = ReadAll()
+            contents = ReadAll(self.stdin_buf)
             self.mem.SetPlace(place, value.Str(contents), blame_loc)
             return 0
 
@@ -435,9 +510,14 @@ class Read(vm._Builtin):
 
         # read a certain number of bytes, NOT respecting delimiter (-1 means
         # unset)
+        buffered = self.stdin_buf.ShouldRead(self.exec_opts.buffered_stdin())
+
         arg_N = mops.BigTruncate(arg.N)
         if arg_N >= 0:
-            s = _ReadN(arg_N, self.cmd_ev)
+            if buffered:
+                s = _ReadNBuffered(self.stdin_buf, arg_N, self.cmd_ev)
+            else:
+                s = _ReadN(arg_N, self.cmd_ev)
 
             if len(names):
                 name = names[0]  # ignore other names
@@ -487,8 +567,13 @@ class Read(vm._Builtin):
         join_next = False
         status = 0
         while True:
-            chunk, eof = _ReadPortion(delim_byte, mops.BigTruncate(arg.n),
-                                      self.cmd_ev)
+            if buffered:
+                chunk, eof = _ReadPortionBuffered(self.stdin_buf, delim_byte,
+                                                  mops.BigTruncate(arg.n),
+                                                  self.cmd_ev)
+            else:
+                chunk, eof = _ReadPortion(delim_byte, mops.BigTruncate(arg.n),
+                                          self.cmd_ev)
 
             if eof:
                 # status 1 to terminate loop.  (This is true even though we set
@@ -0,0 +1,306 @@
+"""
+bash_array.py - Operations on value.BashArray
+
+A BashArray has two layouts:
+
+- Dense: the items are in 'strs', and unset items ("holes") are None.
+- Sparse: the items are in 'sparse.d', keyed by index.  This is used after
+  a[1000000]=x, or when most items of a big array have been unset.
+
+We switch between them automatically, based on how many slots are used.  The
+layout isn't visible to shell code, so callers should use these functions
+instead of accessing 'strs' directly.
+"""
+from __future__ import print_function
+
+from _devbuild.gen.value_asdl import value, SparseStrs
+from mycpp import mylib
+from mycpp.mylib import log, iteritems
+
+from typing import Dict, List, Optional
+
+_ = log
+
+# Arrays with fewer slots than this always use the dense layout
+_MIN_SPARSE_LEN = 64
+
+# A dense array becomes sparse when fewer than 1 in _SPARSE_RATIO slots would
+# be used.  A sparse array becomes dense again when half of its slots are
+# used.  The gap between the two avoids switching back and forth.
+_SPARSE_RATIO = 4
+
+
+def _ToSparse(array_val):
+    # type: (value.BashArray) -> None
+    d = {}  # type: Dict[int, str]
+    max_index = -1
+    for i, s in enumerate(array_val.strs):
+        if s is not None:
+            d[i] = s
+            max_index = i
+    array_val.sparse = SparseStrs(d, max_index)
+    array_val.strs = []
+
+
+def _ToDense(array_val):
+    # type: (value.BashArray) -> None
+    sparse = array_val.sparse
+    no_str = None  # type: Optional[str]
+    strs = [no_str] * (sparse.max_index + 1)
+    for i, s in iteritems(sparse.d):
+        strs[i] = s
+    array_val.strs = strs
+    array_val.sparse = None
+
+
+def _MaybeSparse(array_val, num_items):
+    # type: (value.BashArray, int) -> None
+    """Called when we've counted the items of a dense array anyway."""
+    n = len(array_val.strs)
+    if n >= _MIN_SPARSE_LEN and num_items * _SPARSE_RATIO < n:
+        _ToSparse(array_val)
+
+
+def IsSparse(array_val):
+    # type: (value.BashArray) -> bool
+    """Whether the array uses the sparse layout.  Only for printing."""
+    return array_val.sparse is not None
+
+
+def Length(array_val):
+    # type: (value.BashArray) -> int
+    """The last index plus one.  Negative indices are relative to it."""
+    if array_val.sparse:
+        return array_val.sparse.max_index + 1
+    return len(array_val.strs)
+
+
+def IsEmpty(array_val):
+    # type: (value.BashArray) -> bool
+    return Length(array_val) == 0
+
+
+def Count(array_val):
+    # type: (value.BashArray) -> int
+    """The number of items that are set, for ${#a[@]}."""
+    if array_val.sparse:
+        return len(array_val.sparse.d)
+
+    num_items = 0
+    for s in array_val.strs:
+        if s is not None:
+            num_items += 1
+    _MaybeSparse(array_val, num_items)
+    return num_items
+
+
+def _SortedKeys(sparse):
+    # type: (SparseStrs) -> List[int]
+    keys = sparse.d.keys()
+    keys.sort()
+    return keys
+
+
+def GetKeys(array_val):
+    # type: (value.BashArray) -> List[int]
+    """The indices of the items that are set, in order."""
+    if array_val.sparse:
+        return _SortedKeys(array_val.sparse)
+
+    keys = []  # type: List[int]
+    for i, s in enumerate(array_val.strs):
+        if s is not None:
+            keys.append(i)
+    _MaybeSparse(array_val, len(keys))
+    return keys
+
+
+def GetValues(array_val):
+    # type: (value.BashArray) -> List[str]
+    """The items that are set, in order.  The result has no None.
+
+    Don't mutate the result, since it may be the array's own list.
+    """
+    if array_val.sparse:
+        d = array_val.sparse.d
+        return [d[i] for i in _SortedKeys(array_val.sparse)]
+
+    strs = array_val.strs
+    num_items = 0
+    for s in strs:
+        if s is not None:
+            num_items += 1
+    if num_items == len(strs):
+        return strs  # no holes, so don't copy
+
+    values = []  # type: List[str]
+    for s in strs:
+        if s is not None:
+            values.append(s)
+    _MaybeSparse(array_val, num_items)
+    return values
+
+
+def GetItem(array_val, index):
+    # type: (value.BashArray, int) -> Optional[str]
+    """Return the item at index, or None if it's not set.
+
+    A negative index counts back from the end.
+    """
+    if index < 0:
+        index += Length(array_val)
+        if index < 0:
+            return None
+
+    if array_val.sparse:
+        return array_val.sparse.d.get(index)
+
+    strs = array_val.strs
+    if index < len(strs):
+        return strs[index]
+    return None
+
+
+def SetItem(array_val, index, s):
+    # type: (value.BashArray, int, str) -> bool
+    """Set the item at index.
+
+    Returns False if a negative index is before the start of the array.
+    """
+    if index < 0:
+        index += Length(array_val)
+        if index < 0:
+            return False
+
+    if not array_val.sparse:
+        strs = array_val.strs
+        n = len(strs)
+        if index < n:
+            strs[index] = s
+            return True
+
+        if index < _MIN_SPARSE_LEN or (n + 1) * _SPARSE_RATIO > index + 1:
+            # Fill it in with None.  It could look like this:
+            # ['1', 2, 3, None, None, '4', None]
+            # Then ${#a[@]} counts the entries that are not None.
+            for i in xrange(index - n):
+                strs.append(None)
+            strs.append(s)
+            return True
+
+        # e.g. a[1000000]=x
+        _ToSparse(array_val)
+
+    sparse = array_val.sparse
+    sparse.d[index] = s
+    if index > sparse.max_index:
+        sparse.max_index = index
+
+    if len(sparse.d) * 2 >= sparse.max_index + 1:
+        _ToDense(array_val)
+    return True
+
+
+def UnsetItem(array_val, index):
+    # type: (value.BashArray, int) -> None
+    """Unset the item at index.  It's not an error if it isn't set.
+
+    A negative index counts back from the end.
+    """
+    if index < 0:
+        index += Length(array_val)
+        if index < 0:
+            return
+
+    if array_val.sparse:
+        sparse = array_val.sparse
+        if index not in sparse.d:
+            return
+        mylib.dict_erase(sparse.d, index)
+
+        if index == sparse.max_index:
+            # The array SHORTENS if you unset from the end
+            max_index = -1
+            for i in sparse.d.keys():
+                if i > max_index:
+                    max_index = i
+            sparse.max_index = max_index
+
+        if sparse.max_index < _MIN_SPARSE_LEN:
+            _ToDense(array_val)
+        return
+
+    strs = array_val.strs
+    n = len(strs)
+    if index == n - 1:
+        # Special case: The array SHORTENS if you unset from the end.  You can
+        # tell with a+=(3 4)
+        strs.pop()
+        while len(strs) and strs[-1] is None:
+            strs.pop()
+    elif index < n - 1:
+        strs[index] = None
+
+
+def AppendValues(array_val, strs):
+    # type: (value.BashArray, List[str]) -> None
+    """Append items after the last index, like a+=(x y)."""
+    if array_val.sparse:
+        sparse = array_val.sparse
+        for s in strs:
+            sparse.max_index += 1
+            sparse.d[sparse.max_index] = s
+        if len(sparse.d) * 2 >= sparse.max_index + 1:
+            _ToDense(array_val)
+    else:
+        array_val.strs.extend(strs)
+
+
+def Copy(array_val):
+    # type: (value.BashArray) -> value.BashArray
+    if array_val.sparse:
+        d = {}  # type: Dict[int, str]
+        for i, s in iteritems(array_val.sparse.d):
+            d[i] = s
+        return value.BashArray([],
+                               SparseStrs(d, array_val.sparse.max_index))
+
+    strs = []  # type: List[str]
+    strs.extend(array_val.strs)
+    return value.BashArray(strs, None)
+
+
+def GetDenseStrs(array_val):
+    # type: (value.BashArray) -> List[str]
+    """All slots up to the last index, with None for holes.
+
+    For printers that show holes as null.
+    """
+    if array_val.sparse:
+        sparse = array_val.sparse
+        no_str = None  # type: Optional[str]
+        strs = [no_str] * (sparse.max_index + 1)
+        for i, s in iteritems(sparse.d):
+            strs[i] = s
+        return strs
+    return array_val.strs
+
+
+def Equals(left, right):
+    # type: (value.BashArray, value.BashArray) -> bool
+    """Whether two arrays have the same items, regardless of layout."""
+    if Length(left) != Length(right):
+        return False
+
+    left_keys = GetKeys(left)
+    right_keys = GetKeys(right)
+    if len(left_keys) != len(right_keys):
+        return False
+
+    for k in xrange(len(left_keys)):
+        i = left_keys[k]
+        if i != right_keys[k]:
+            return False
+        if GetItem(left, i) != GetItem(right, i):
+            return False
+    return True
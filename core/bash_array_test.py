@@ -0,0 +1,121 @@
+#!/usr/bin/env python2
+"""
+bash_array_test.py: Tests for bash_array.py
+"""
+from __future__ import print_function
+
+import unittest
+
+from _devbuild.gen.value_asdl import value
+from core import bash_array  # module under test
+
+
+def _Array(strs):
+    return value.BashArray(strs, None)
+
+
+class BashArrayTest(unittest.TestCase):
+
+    def assertItems(self, keys, values, array_val):
+        self.assertEqual(keys, bash_array.GetKeys(array_val))
+        self.assertEqual(values, bash_array.GetValues(array_val))
+        self.assertEqual(len(keys), bash_array.Count(array_val))
+
+    def testDense(self):
+        a = _Array(['a', 'b', 'c'])
+        self.assertEqual(3, bash_array.Length(a))
+        self.assertEqual('c', bash_array.GetItem(a, -1))
+        self.assertEqual(None, bash_array.GetItem(a, -4))
+        self.assertEqual(None, bash_array.GetItem(a, 3))
+
+        bash_array.UnsetItem(a, 1)
+        self.assertItems([0, 2], ['a', 'c'], a)
+        self.assertEqual(3, bash_array.Length(a))
+
+        # Unsetting the last item shortens the array, past any holes
+        bash_array.UnsetItem(a, -1)
+        self.assertEqual(1, bash_array.Length(a))
+        bash_array.AppendValues(a, ['x'])
+        self.assertItems([0, 1], ['a', 'x'], a)
+
+        self.assertEqual(False, bash_array.SetItem(a, -3, 'z'))
+        self.assertEqual(True, bash_array.SetItem(a, -2, 'z'))
+        self.assertItems([0, 1], ['z', 'x'], a)
+
+        # Small gaps are filled in
+        bash_array.SetItem(a, 5, 'y')
+        self.assertEqual(False, bash_array.IsSparse(a))
+        self.assertEqual([None, None, None], a.strs[2:5])
+
+    def testSparse(self):
+        a = _Array([])
+        self.assertEqual(True, bash_array.IsEmpty(a))
+
+        # a[1000000]=x doesn't allocate a million slots
+        bash_array.SetItem(a, 1000000, 'x')
+        self.assertEqual(True, bash_array.IsSparse(a))
+        self.assertEqual(1000001, bash_array.Length(a))
+        self.assertEqual('x', bash_array.GetItem(a, -1))
+        self.assertEqual(None, bash_array.GetItem(a, 5))
+
+        bash_array.SetItem(a, 3, 'b')
+        bash_array.AppendValues(a, ['y', 'z'])
+        self.assertItems([3, 1000000, 1000001, 1000002], ['b', 'x', 'y', 'z'],
+                         a)
+
+        bash_array.UnsetItem(a, -1)
+        bash_array.UnsetItem(a, 1000001)
+        self.assertEqual(1000001, bash_array.Length(a))
+        bash_array.UnsetItem(a, 12345)  # not an error
+
+        # Back to dense when the array gets small
+        bash_array.UnsetItem(a, 1000000)
+        self.assertEqual(False, bash_array.IsSparse(a))
+        self.assertItems([3], ['b'], a)
+        self.assertEqual(4, bash_array.Length(a))
+
+    def testSwitchLayout(self):
+        a = _Array([str(i) for i in xrange(200)])
+        for i in xrange(190):
+            bash_array.UnsetItem(a, i)
+        self.assertEqual(False, bash_array.IsSparse(a))
+
+        # Counting the items notices that most slots are empty
+        self.assertEqual(10, bash_array.Count(a))
+        self.assertEqual(True, bash_array.IsSparse(a))
+        self.assertEqual(200, bash_array.Length(a))
+
+        # Back to dense when half of the slots are used
+        for i in xrange(89):
+            bash_array.SetItem(a, i, 'x')
+            self.assertEqual(True, bash_array.IsSparse(a))
+        bash_array.SetItem(a, 89, 'x')
+        self.assertEqual(False, bash_array.IsSparse(a))
+        self.assertEqual(100, bash_array.Count(a))
+        self.assertEqual('199', bash_array.GetItem(a, -1))
+
+    def testCopyAndEquals(self):
+        a = _Array([])
+        bash_array.SetItem(a, 1000, 'x')
+        b = bash_array.Copy(a)
+        self.assertEqual(True, bash_array.Equals(a, b))
+
+        bash_array.SetItem(b, 1000, 'y')
+        self.assertEqual('x', bash_array.GetItem(a, 1000))
+        self.assertEqual(False, bash_array.Equals(a, b))
+
+        # Equal regardless of layout
+        c = _Array(['p', 'q'])
+        d = _Array([])
+        bash_array.SetItem(d, 1000, 'q')
+        bash_array.UnsetItem(d, 1000)
+        bash_array.SetItem(d, 0, 'p')
+        bash_array.SetItem(d, 1, 'q')
+        self.assertEqual(True, bash_array.Equals(c, d))
+
+        self.assertEqual([None, 'q'],
+                         bash_array.GetDenseStrs(_Array([None, 'q'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
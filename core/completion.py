@@ -41,6 +41,7 @@ from _devbuild.gen.syntax_asdl import (CompoundWord, word_part_e, word_t,
 from _devbuild.gen.runtime_asdl import (scope_e, comp_action_e, comp_action_t)
 from _devbuild.gen.types_asdl import redir_arg_type_e
 from _devbuild.gen.value_asdl import (value, value_e)
+from core import bash_array
 from core import error
 from core import pyos
 from core import state
@@ -65,7 +66,7 @@ from typing import (Dict, Tuple, List, Iterator, Optional, Any, cast,
                     TYPE_CHECKING)
 if TYPE_CHECKING:
     from core.comp_ui import State
-    from core.state import Mem
+    from core.state import Mem, SearchPath
     from frontend.py_readline import Readline
     from core.util import _DebugFile
     from frontend.parse_lib import ParseContext
@@ -637,7 +638,7 @@ class ShellFuncAction(CompletionAction):
             self.debug('> %r' % val)  # CRASHES in C++
 
         array_val = cast(value.BashArray, val)
-        for s in array_val.strs:
+        for s in bash_array.GetValues(array_val):
             #self.debug('> %r' % s)
             yield s
 
@@ -679,30 +680,14 @@ class ExternalCommandAction(CompletionAction):
     This is PART of compgen -A command.
     """
 
-    def __init__(self, mem):
-        # type: (Mem) -> None
+    def __init__(self, search_path):
+        # type: (SearchPath) -> None
         """
         Args:
-          mem: for looking up Path
+          search_path: its index of $PATH directories is shared with command
+                       lookup, and invalidated by directory mtime
         """
-        self.mem = mem
-        # Should we list everything executable in $PATH here?  And then whenever
-        # $PATH is changed, regenerated it?
-        # Or we can cache directory listings?  What if the contents of the dir
-        # changed?
-        # Can we look at the dir timestamp?
-        #
-        # (dir, timestamp) -> list of entries perhaps?  And then every time you hit
-        # tab, do you have to check the timestamp?  It should be cached by the
-        # kernel, so yes.
-        # XXX(unused?) self.ext = []
-
-        # (dir, timestamp) -> list
-        # NOTE: This cache assumes that listing a directory is slower than statting
-        # it to get the mtime.  That may not be true on all systems?  Either way
-        # you are reading blocks of metadata.  But I guess /bin on many systems is
-        # huge, and will require lots of sys calls.
-        self.cache = {}  # type: Dict[Tuple[str, int], List[str]]
+        self.search_path = search_path
 
     def Print(self, f):
         # type: (mylib.BufWriter) -> None
@@ -711,43 +696,7 @@ class ExternalCommandAction(CompletionAction):
 
     def Matches(self, comp):
         # type: (Api) -> Iterator[str]
-        """TODO: Cache is never cleared.
-
-        - When we get a newer timestamp, we should clear the old one.
-        - When PATH is changed, we can remove old entries.
-        """
-        val = self.mem.GetValue('PATH')
-        if val.tag() != value_e.Str:
-            # No matches if not a string
-            return
-
-        val_s = cast(value.Str, val)
-        path_dirs = val_s.s.split(':')
-        #log('path: %s', path_dirs)
-
-        executables = []  # type: List[str]
-        for d in path_dirs:
-            try:
-                key = pyos.MakeDirCacheKey(d)
-            except (IOError, OSError) as e:
-                # There could be a directory that doesn't exist in the $PATH.
-                continue
-
-            dir_exes = self.cache.get(key)
-            if dir_exes is None:
-                entries = posix.listdir(d)
-                dir_exes = []
-                for name in entries:
-                    path = os_path.join(d, name)
-                    # TODO: Handle exception if file gets deleted in between listing and
-                    # check?
-                    if not posix.access(path, X_OK):
-                        continue
-                    dir_exes.append(name)  # append the name, not the path
-
-                self.cache[key] = dir_exes
-
-            executables.extend(dir_exes)
+        executables = self.search_path.Executables()
 
         # TODO: Shouldn't do the prefix / space thing ourselves.  readline does
         # that at the END of the line.
@@ -128,7 +128,7 @@ class CompletionTest(unittest.TestCase):
         parse_opts, exec_opts, mutable_opts = state.MakeOpts(mem, None)
         mem.exec_opts = exec_opts
 
-        a = completion.ExternalCommandAction(mem)
+        a = completion.ExternalCommandAction(state.SearchPath(mem))
         comp = self._CompApi([], 0, 'f')
         print(list(a.Matches(comp)))
 
@@ -10,6 +10,7 @@ from _devbuild.gen.syntax_asdl import assign_op_e, Token
 from _devbuild.gen.value_asdl import (value, value_e, value_t, sh_lvalue,
                                       sh_lvalue_e, LeftName)
 
+from core import bash_array
 from core import error
 from core import optview
 from core import num
@@ -213,7 +214,7 @@ def _PrintShValue(val, buf):
         elif case(value_e.BashArray):
             val = cast(value.BashArray, UP_val)
             parts = ['(']
-            for s in val.strs:
+            for s in bash_array.GetValues(val):
                 parts.append(j8_lite.MaybeShellEncode(s))
             parts.append(')')
             result = ' '.join(parts)
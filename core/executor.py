@@ -1,8 +1,6 @@
 """executor.py."""
 from __future__ import print_function
 
-from errno import EINTR
-
 from _devbuild.gen.id_kind_asdl import Id
 from _devbuild.gen.option_asdl import builtin_i
 from _devbuild.gen.runtime_asdl import RedirValue, trace
@@ -11,6 +9,7 @@ from _devbuild.gen.syntax_asdl import (
     command_e,
     CommandSub,
     CompoundWord,
+    word_shape_e,
     loc,
     loc_t,
 )
@@ -185,13 +184,18 @@ class ShellExecutor(vm._Executor):
         #   interleaved.
         # - We could turn the `exit` builtin into a error.FatalRuntime exception
         #   and get this check for "free".
+        # The child may read stdin, so give back what 'read' buffered
+        self.fd_state.stdin_buf.Sync()
+
         thunk = process.SubProgramThunk(self.cmd_ev,
                                         node,
                                         self.trap_state,
                                         self.multi_trace,
+                                        self.fd_state.stdin_buf,
                                         inherit_errexit=inherit_errexit)
         p = process.Process(thunk, self.job_control, self.job_list,
                             self.tracer)
+        p.AddStateChange(process.ClearStdinBuffers(self.fd_state))
         return p
 
     def RunBuiltin(self, builtin_id, cmd_val):
@@ -343,6 +347,9 @@ class ShellExecutor(vm._Executor):
             self.errfmt.Print_('%r not found (OILS-ERR-100)' % arg0, arg0_loc)
             return 127
 
+        # The external process may read stdin
+        self.fd_state.stdin_buf.Sync()
+
         # Normal case: ls /
         if run_flags & DO_FORK:
             thunk = process.ExternalThunk(self.ext_prog, argv0_path, cmd_val,
@@ -489,7 +496,7 @@ class ShellExecutor(vm._Executor):
                 # change it to __cat < file
                 # TODO: change to 'internal cat' (issue 1013)
                 tok = lexer.DummyToken(Id.Lit_Chars, '__cat')
-                cat_word = CompoundWord([tok])
+                cat_word = CompoundWord([tok], word_shape_e.Unknown)
                 # MUTATE the command.Simple node.  This will only be done the first
                 # time in the parent process.
                 simple.words.append(cat_word)
@@ -505,22 +512,12 @@ class ShellExecutor(vm._Executor):
         p.StartProcess(trace.CommandSub)
         #log('Command sub started %d', pid)
 
-        chunks = []  # type: List[str]
         posix.close(w)  # not going to write
-        while True:
-            n, err_num = pyos.Read(r, 4096, chunks)
-
-            if n < 0:
-                if err_num == EINTR:
-                    pass  # retry
-                else:
-                    # Like the top level IOError handler
-                    e_die_status(
-                        2,
-                        'osh I/O error (read): %s' % posix.strerror(err_num))
-
-            elif n == 0:  # EOF
-                break
+        stdout_str, err_num = pyos.ReadAll(r, '', True)
+        if err_num != 0:
+            # Like the top level IOError handler
+            e_die_status(2,
+                         'osh I/O error (read): %s' % posix.strerror(err_num))
         posix.close(r)
 
         status = p.Wait(self.waiter)
@@ -545,9 +542,9 @@ class ShellExecutor(vm._Executor):
             self.mem.SetLastStatus(status)
 
         # Runtime errors test case: # $("echo foo > $@")
-        # Why rstrip()?
+        # Why strip trailing newlines?
         # https://unix.stackexchange.com/questions/17747/why-does-shell-command-substitution-gobble-up-a-trailing-newline-char
-        return ''.join(chunks).rstrip('\n')
+        return stdout_str
 
     def RunProcessSub(self, cs_part):
         # type: (CommandSub) -> str
@@ -25,10 +25,11 @@ from mycpp.mylib import log, print_stderr, probe, tagswitch
 import fanos
 import posix_ as posix
 
-from typing import cast, Any, List, TYPE_CHECKING
+from typing import cast, Any, List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from core.comp_ui import _IDisplay
     from core.ui import ErrorFormatter
+    from frontend import parse_cache
     from frontend import parse_lib
     from osh.cmd_parse import CommandParser
     from osh.cmd_eval import CommandEvaluator
@@ -311,10 +312,13 @@ def Interactive(
     return status
 
 
-def Batch(cmd_ev, c_parser, errfmt, cmd_flags=0):
-    # type: (CommandEvaluator, CommandParser, ui.ErrorFormatter, int) -> int
+def Batch(cmd_ev, c_parser, errfmt, cmd_flags=0, recorder=None):
+    # type: (CommandEvaluator, CommandParser, ui.ErrorFormatter, int, Optional[parse_cache.Recorder]) -> int
     """Loop for batch execution.
 
+    Args:
+      recorder: if set, logical lines are saved to the parse cache
+
     Returns:
       int status, e.g. 2 on parse error
 
@@ -337,16 +341,22 @@ def Batch(cmd_ev, c_parser, errfmt, cmd_flags=0):
     status = 0
     while True:
         probe('main_loop', 'Batch_parse_enter')
+        start_line = c_parser.line_reader.line_num
         try:
             node = c_parser.ParseLogicalLine()  # can raise ParseError
             if node is None:  # EOF
                 c_parser.CheckForPendingHereDocs()  # can raise ParseError
+                if recorder:
+                    recorder.eof = True
                 break
         except error.Parse as e:
             errfmt.PrettyPrintError(e)
             status = 2
             break
 
+        if recorder:
+            recorder.AddLine(start_line, node)
+
         # After every "logical line", no lines will be referenced by the Arena.
         # Tokens in the LST still point to many lines, but lines with only comment
         # or whitespace won't be reachable, so the GC will free them.
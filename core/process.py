@@ -137,6 +137,193 @@ def SaveFd(fd):
     return saved
 
 
+# For shopt -s buffered_stdin
+_STDIN_BLOCK_SIZE = 64 * 1024
+
+
+class StdinBuffer(object):
+    """Read-ahead buffer for descriptor 0, used by 'read' and 'mapfile'.
+
+    Shells normally read stdin one byte at a time, so that a builtin never
+    consumes input that belongs to the next command, e.g. in
+
+        { read x; cat; } < file.txt
+
+    With shopt -s buffered_stdin, we read large blocks instead, and keep the
+    unconsumed tail here.  Before another process can read descriptor 0, or a
+    redirect replaces it, Sync() gives the tail back with lseek().
+
+    That only works for regular files.  Pipes can't be rewound, so turning on
+    the option asserts that the shell is the only reader of a piped stdin.
+    Forked children start with an empty buffer, and Sync() before they exit.
+
+    When a redirect like <&8 is undone, FdState keeps the tail of the pipe in
+    the frame where descriptor 8 is still valid, and restores it for the next
+    <&8, as in
+
+        read line1 <&8
+        read line2 <&8
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.buf = ''
+        self.pos = 0  # bytes before this have been consumed
+
+        # Kind of descriptor 0, or -1 if unknown.  Reset when it's redirected.
+        self.kind = -1
+
+        # The descriptor copied to 0, like 8 in <&8, or -1
+        self.src_fd = -1
+
+        # Unconsumed bytes and src_fd, saved when descriptor 0 is redirected
+        self.saved = []  # type: List[str]
+        self.saved_src = []  # type: List[int]
+
+    def Kind(self):
+        # type: () -> int
+        """Returns pyos.FD_REGULAR, FD_PIPE, or FD_OTHER (e.g. a terminal).
+
+        Terminals are never buffered, because of read -n and read -s.
+        """
+        if self.kind == -1:
+            self.kind = pyos.FdKind(mylib.STDIN_FILENO)
+        return self.kind
+
+    def HasData(self):
+        # type: () -> bool
+        return self.pos < len(self.buf)
+
+    def ShouldRead(self, buffered_stdin):
+        # type: (bool) -> bool
+        """Should builtins read stdin through this buffer?"""
+        if self.HasData():
+            return True  # drain it, even if the option was turned off
+        return buffered_stdin and self.Kind() != pyos.FD_OTHER
+
+    def Fill(self):
+        # type: () -> Tuple[int, int]
+        """Read another block, when the buffer is empty.
+
+        Like pyos.Read(), returns (num_bytes, errno), with 0 bytes for EOF.
+        """
+        assert not self.HasData()
+
+        chunks = []  # type: List[str]
+        n, err_num = pyos.Read(mylib.STDIN_FILENO, _STDIN_BLOCK_SIZE, chunks)
+        if n > 0:
+            self.buf = chunks[0]
+            self.pos = 0
+        return n, err_num
+
+    def Take(self, delim, max_bytes):
+        # type: (str, int) -> Tuple[str, bool]
+        """Take buffered bytes up to the 1-byte delimiter, or max_bytes.
+
+        Use max_bytes -1 for no limit.  Returns (bytes, found_delim).  The
+        delimiter is consumed, but not included in the result.
+        """
+        end = len(self.buf)
+        if max_bytes >= 0 and self.pos + max_bytes < end:
+            end = self.pos + max_bytes
+
+        i = self.buf.find(delim, self.pos, end)
+        if i == -1:
+            s = self.buf[self.pos:end]
+            self.pos = end
+            return s, False
+
+        s = self.buf[self.pos:i]
+        self.pos = i + 1
+        return s, True
+
+    def TakeN(self, max_bytes):
+        # type: (int) -> str
+        end = len(self.buf)
+        if self.pos + max_bytes < end:
+            end = self.pos + max_bytes
+        s = self.buf[self.pos:end]
+        self.pos = end
+        return s
+
+    def TakeAll(self):
+        # type: () -> str
+        s = self.buf[self.pos:]
+        self.buf = ''
+        self.pos = 0
+        return s
+
+    def Sync(self):
+        # type: () -> None
+        """Give unconsumed bytes back to descriptor 0, if it's a file."""
+        if not self.HasData():
+            return
+        if self.Kind() != pyos.FD_REGULAR:
+            return  # leave it buffered; we can't rewind a pipe
+        num_bytes = len(self.buf) - self.pos
+        unused_err_num = pyos.SeekBack(mylib.STDIN_FILENO, num_bytes)
+        self.buf = ''
+        self.pos = 0
+
+    def Push(self):
+        # type: () -> None
+        """Called before descriptor 0 is redirected."""
+        self.Sync()
+        self.saved.append(self.TakeAll())
+        self.saved_src.append(self.src_fd)
+        self.src_fd = -1
+        self.kind = -1
+
+    def SetSource(self, src_fd, leftover):
+        # type: (int, Optional[str]) -> None
+        """Called after src_fd is copied to descriptor 0, as in <&8.
+
+        leftover is what was buffered from src_fd by an earlier <&8.
+        """
+        self.src_fd = src_fd
+        if leftover is not None:
+            self.buf = leftover
+            self.pos = 0
+
+    def Pop(self):
+        # type: () -> Tuple[int, str]
+        """Called when a redirect of descriptor 0 is undone.
+
+        The caller should Sync() first, while the redirect is still in effect.
+        Returns the source descriptor and the bytes that couldn't be given
+        back to it, which are only left for a pipe.
+        """
+        src_fd = self.src_fd
+        tail = self.TakeAll()
+
+        self.buf = self.saved.pop()
+        self.pos = 0
+        self.src_fd = self.saved_src.pop()
+        self.kind = -1
+        return src_fd, tail
+
+    def Forget(self, n):
+        # type: (int) -> None
+        """For exec 0< file, which makes n redirects permanent."""
+        for _ in xrange(n):
+            self.saved.pop()
+            self.saved_src.pop()
+
+    def ClearInChild(self):
+        # type: () -> None
+        """Called in a forked child.
+
+        The parent owns the buffered bytes, and the child's descriptor 0 may be
+        a different file, e.g. in 'echo hi | { read x; }'.
+        """
+        self.buf = ''
+        self.pos = 0
+        self.src_fd = -1
+        self.kind = -1
+        for i in xrange(len(self.saved)):
+            self.saved[i] = ''
+
+
 class _RedirFrame(object):
 
     def __init__(self, saved_fd, orig_fd, forget):
@@ -152,6 +339,12 @@ class _FdFrame(object):
         # type: () -> None
         self.saved = []  # type: List[_RedirFrame]
         self.need_wait = []  # type: List[Process]
+        self.num_stdin_saved = 0  # how many StdinBuffer.Push() calls
+
+        # For shopt -s buffered_stdin: bytes buffered from a pipe by <&8, after
+        # the redirect was undone.  They belong to this frame, where descriptor
+        # 8 is the same pipe.
+        self.stdin_leftovers = {}  # type: Dict[int, str]
 
     def Forget(self):
         # type: () -> None
@@ -168,6 +361,15 @@ class _FdFrame(object):
         return '<_FdFrame %s>' % self.saved
 
 
+def _FrameSaves(frame, fd):
+    # type: (_FdFrame, int) -> bool
+    """Does the frame redirect fd, and restore it when it's popped?"""
+    for rf in frame.saved:
+        if rf.orig_fd == fd:
+            return True
+    return False
+
+
 class FdState(object):
     """File descriptor state for the current process.
 
@@ -198,6 +400,7 @@ class FdState(object):
         self.mem = mem
         self.tracer = tracer
         self.waiter = waiter
+        self.stdin_buf = StdinBuffer()
 
     def Open(self, path):
         # type: (str) -> mylib.LineReader
@@ -258,6 +461,10 @@ class FdState(object):
         # type: (int) -> bool
         """Save fd to a new location and remember to restore it later."""
         #log('---- _PushSave %s', fd)
+        if fd == mylib.STDIN_FILENO:
+            self.stdin_buf.Push()
+            self.cur_frame.num_stdin_saved += 1
+
         ok = True
         try:
             new_fd = SaveFd(fd)
@@ -425,16 +632,20 @@ class FdState(object):
                 arg = cast(redirect_arg.CopyFd, UP_arg)
 
                 if r.op_id == Id.Redir_GreatAnd:  # 1>&2
-                    self._PushDup(arg.target_fd, r.loc)
+                    new_fd = self._PushDup(arg.target_fd, r.loc)
 
                 elif r.op_id == Id.Redir_LessAnd:  # 0<&5
                     # The only difference between >& and <& is the default file
                     # descriptor argument.
-                    self._PushDup(arg.target_fd, r.loc)
+                    new_fd = self._PushDup(arg.target_fd, r.loc)
 
                 else:
                     raise NotImplementedError()
 
+                if new_fd == mylib.STDIN_FILENO:
+                    self.stdin_buf.SetSource(
+                        arg.target_fd, self._TakeLeftovers(arg.target_fd))
+
             elif case(redirect_arg_e.MoveFd):  # e.g. echo hi 5>&6-
                 arg = cast(redirect_arg.MoveFd, UP_arg)
                 new_fd = self._PushDup(arg.target_fd, r.loc)
@@ -491,6 +702,18 @@ class FdState(object):
                     posix.write(write_fd, arg.body)
                     posix.close(write_fd)
 
+    def _TakeLeftovers(self, fd):
+        # type: (int) -> Optional[str]
+        """Remove and return what <&fd buffered before, if fd is the same."""
+        for frame in reversed(self.stack):
+            s = frame.stdin_leftovers.get(fd)
+            if s is not None:
+                mylib.dict_erase(frame.stdin_leftovers, fd)
+                return s
+            if _FrameSaves(frame, fd):
+                return None  # fd was redirected after any leftovers
+        return None
+
     def Push(self, redirects, err_out):
         # type: (List[RedirValue], List[error.IOError_OSError]) -> None
         """Apply a group of redirects and remember to undo them."""
@@ -531,6 +754,16 @@ class FdState(object):
         # type: (List[error.IOError_OSError]) -> None
         frame = self.stack.pop()
         #log('< Pop %s', frame)
+        if frame.num_stdin_saved:
+            self.stdin_buf.Sync()
+            for _ in xrange(frame.num_stdin_saved):
+                src_fd, tail = self.stdin_buf.Pop()
+                # Keep the tail in the enclosing frame, unless this frame
+                # redirected src_fd too, as in 8< pipe <&8
+                if (len(tail) and src_fd != NO_FD and
+                        not _FrameSaves(frame, src_fd)):
+                    self.stack[-1].stdin_leftovers[src_fd] = tail
+
         for rf in reversed(frame.saved):
             if rf.saved_fd == NO_FD:
                 #log('Close %d', orig)
@@ -558,8 +791,23 @@ class FdState(object):
         for proc in frame.need_wait:
             unused_status = proc.Wait(self.waiter)
 
+    def ClearStdinBuffers(self):
+        # type: () -> None
+        """Called in a forked child.  See StdinBuffer.ClearInChild()."""
+        self.stdin_buf.ClearInChild()
+        for frame in self.stack:
+            frame.stdin_leftovers.clear()
+
     def MakePermanent(self):
         # type: () -> None
+
+        # The leftovers of descriptors that are now permanently different
+        for rf in self.cur_frame.saved:
+            for frame in self.stack:
+                mylib.dict_erase(frame.stdin_leftovers, rf.orig_fd)
+
+        self.stdin_buf.Forget(self.cur_frame.num_stdin_saved)
+        self.cur_frame.num_stdin_saved = 0
         self.cur_frame.Forget()
 
 
@@ -620,6 +868,18 @@ class StdoutToPipe(ChildStateChange):
         #log('child CLOSE r %d pid=%d', self.r, posix.getpid())
 
 
+class ClearStdinBuffers(ChildStateChange):
+    """For shopt -s buffered_stdin: the child doesn't inherit buffered input."""
+
+    def __init__(self, fd_state):
+        # type: (FdState) -> None
+        self.fd_state = fd_state
+
+    def Apply(self):
+        # type: () -> None
+        self.fd_state.ClearStdinBuffers()
+
+
 INVALID_PGID = -1
 # argument to setpgid() that means the process is its own leader
 OWN_LEADER = 0
@@ -804,12 +1064,14 @@ class SubProgramThunk(Thunk):
                  node,
                  trap_state,
                  multi_trace,
+                 stdin_buf,
                  inherit_errexit=True):
-        # type: (CommandEvaluator, command_t, trap_osh.TrapState, dev.MultiTracer, bool) -> None
+        # type: (CommandEvaluator, command_t, trap_osh.TrapState, dev.MultiTracer, StdinBuffer, bool) -> None
         self.cmd_ev = cmd_ev
         self.node = node
         self.trap_state = trap_state
         self.multi_trace = multi_trace
+        self.stdin_buf = stdin_buf
         self.inherit_errexit = inherit_errexit  # for bash errexit compatibility
 
     def UserString(self):
@@ -855,6 +1117,10 @@ class SubProgramThunk(Thunk):
                          pyutil.strerror(e))
             status = 2
 
+        # The file offset of descriptor 0 is shared with the parent, so give
+        # back what 'read' buffered, as in { read x; ( read y ); read z; } < f
+        self.stdin_buf.Sync()
+
         # If ProcessInit() doesn't turn off buffering, this is needed before
         # _exit()
         pyos.FlushStdout()
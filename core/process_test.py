@@ -120,6 +120,133 @@ class ProcessTest(unittest.TestCase):
         self.assertEqual('one', line1)
         self.assertEqual('one', line2)
 
+    def testStdinBuffer(self):
+        PATH = '_tmp/one-two-three.txt'
+        with open(PATH, 'w') as f:
+            f.write('one\ntwo\nthree\n')
+
+        r = RedirValue(Id.Redir_Less, runtime.NO_SPID, redir_loc.Fd(0),
+                       redirect_arg.Path(PATH))
+
+        class CommandEvaluator(object):
+
+            def RunPendingTraps(self):
+                pass
+
+        cmd_ev = CommandEvaluator()
+        stdin_buf = self.fd_state.stdin_buf
+
+        err_out = []
+        self.fd_state.Push([r], err_out)
+        self.assertEqual(pyos.FD_REGULAR, stdin_buf.Kind())
+        self.assertEqual(True, stdin_buf.ShouldRead(True))
+        self.assertEqual(False, stdin_buf.ShouldRead(False))
+
+        line1, eof = read_osh._ReadPortionBuffered(stdin_buf, pyos.NEWLINE_CH,
+                                                   -1, cmd_ev)
+        self.assertEqual('one', line1)
+        self.assertEqual(False, eof)
+
+        # The whole file was read, so the rest is buffered
+        self.assertEqual(True, stdin_buf.HasData())
+        self.assertEqual(True, stdin_buf.ShouldRead(False))
+
+        # Nested redirect of the same file, which must not see the buffer
+        self.fd_state.Push([r], err_out)
+        self.assertEqual(False, stdin_buf.HasData())
+        line, _ = read_osh._ReadPortion(pyos.NEWLINE_CH, -1, cmd_ev)
+        self.assertEqual('one', line)
+        self.fd_state.Pop(err_out)
+
+        # The buffer of the outer redirect was restored
+        s = read_osh._ReadNBuffered(stdin_buf, 2, cmd_ev)
+        self.assertEqual('tw', s)
+
+        # Give the rest back to the file, so unbuffered reads see it, like an
+        # external process would
+        stdin_buf.Sync()
+        self.assertEqual(False, stdin_buf.HasData())
+        line2, _ = read_osh._ReadPortion(pyos.NEWLINE_CH, -1, cmd_ev)
+        self.assertEqual('o', line2)
+
+        line3 = read_osh.ReadLine(stdin_buf, cmd_ev)
+        self.assertEqual('three\n', line3)
+        line4 = read_osh.ReadLine(stdin_buf, cmd_ev)
+        self.assertEqual('', line4)
+
+        self.fd_state.Pop(err_out)
+        self.assertEqual([], err_out)
+
+    def testStdinBufferPipe(self):
+        r, w = posix.pipe()
+        posix.write(w, 'one\ntwo\n')
+        posix.close(w)
+
+        # read <&r
+        redir = RedirValue(Id.Redir_LessAnd, runtime.NO_SPID, redir_loc.Fd(0),
+                           redirect_arg.CopyFd(r))
+
+        class CommandEvaluator(object):
+
+            def RunPendingTraps(self):
+                pass
+
+        cmd_ev = CommandEvaluator()
+        stdin_buf = self.fd_state.stdin_buf
+
+        err_out = []
+        self.fd_state.Push([redir], err_out)
+        self.assertEqual(True, stdin_buf.ShouldRead(True))
+        line1 = read_osh.ReadLine(stdin_buf, cmd_ev)
+        self.fd_state.Pop(err_out)
+
+        # Another pipe doesn't get them
+        r2, w2 = posix.pipe()
+        posix.write(w2, 'other\n')
+        posix.close(w2)
+        redir2 = RedirValue(Id.Redir_LessAnd, runtime.NO_SPID,
+                            redir_loc.Fd(0), redirect_arg.CopyFd(r2))
+        self.fd_state.Push([redir2], err_out)
+        self.assertEqual('other\n', read_osh.ReadLine(stdin_buf, cmd_ev))
+        self.fd_state.Pop(err_out)
+
+        # Nor does r, while it's redirected to another pipe
+        r3, w3 = posix.pipe()
+        posix.write(w3, 'third\n')
+        posix.close(w3)
+        redir3 = RedirValue(Id.Redir_LessAnd, runtime.NO_SPID,
+                            redir_loc.Fd(r), redirect_arg.CopyFd(r3))
+        self.fd_state.Push([redir3, redir], err_out)
+        self.assertEqual('third\n', read_osh.ReadLine(stdin_buf, cmd_ev))
+        self.fd_state.Pop(err_out)
+
+        # The rest of the pipe is restored when it's stdin again
+        self.fd_state.Push([redir], err_out)
+        self.assertEqual(True, stdin_buf.ShouldRead(True))
+        line2 = read_osh.ReadLine(stdin_buf, cmd_ev)
+        self.fd_state.Pop(err_out)
+
+        r4, w4 = posix.pipe()
+        redir4 = RedirValue(Id.Redir_LessAnd, runtime.NO_SPID,
+                            redir_loc.Fd(0), redirect_arg.CopyFd(r4))
+
+        # A forked child doesn't inherit them
+        posix.write(w4, 'four\nfive\n')
+        posix.close(w4)
+        self.fd_state.Push([redir4], err_out)
+        self.assertEqual('four\n', read_osh.ReadLine(stdin_buf, cmd_ev))
+        self.fd_state.Pop(err_out)
+        self.fd_state.ClearStdinBuffers()
+        self.fd_state.Push([redir4], err_out)
+        self.assertEqual(False, stdin_buf.HasData())
+        self.fd_state.Pop(err_out)
+
+        for fd in (r, r2, r3, r4):
+            posix.close(fd)
+        self.assertEqual('one\n', line1)
+        self.assertEqual('two\n', line2)
+        self.assertEqual([], err_out)
+
     def testProcess(self):
         # 3 fds.  Does Python open it?  Shell seems to have it too.  Maybe it
         # inherits from the shell.
@@ -181,9 +308,12 @@ class ProcessTest(unittest.TestCase):
         node2 = _CommandNode('head', self.arena)
         node3 = _CommandNode('sort --reverse', self.arena)
 
-        thunk1 = process.SubProgramThunk(cmd_ev, node1, self.trap_state, None)
-        thunk2 = process.SubProgramThunk(cmd_ev, node2, self.trap_state, None)
-        thunk3 = process.SubProgramThunk(cmd_ev, node3, self.trap_state, None)
+        thunk1 = process.SubProgramThunk(cmd_ev, node1, self.trap_state, None,
+                                         self.fd_state.stdin_buf)
+        thunk2 = process.SubProgramThunk(cmd_ev, node2, self.trap_state, None,
+                                         self.fd_state.stdin_buf)
+        thunk3 = process.SubProgramThunk(cmd_ev, node3, self.trap_state, None,
+                                         self.fd_state.stdin_buf)
 
         p = process.Pipeline(False, self.job_control, self.job_list,
                              self.tracer)
@@ -221,8 +351,10 @@ class ProcessTest(unittest.TestCase):
         node1 = _CommandNode('/bin/echo testpipeline', self.arena)
         node2 = _CommandNode('cat', self.arena)
 
-        thunk1 = process.SubProgramThunk(cmd_ev, node1, self.trap_state, None)
-        thunk2 = process.SubProgramThunk(cmd_ev, node2, self.trap_state, None)
+        thunk1 = process.SubProgramThunk(cmd_ev, node1, self.trap_state, None,
+                                         self.fd_state.stdin_buf)
+        thunk2 = process.SubProgramThunk(cmd_ev, node2, self.trap_state, None,
+                                         self.fd_state.stdin_buf)
 
         pi.Add(Process(thunk1, jc, self.job_list, self.tracer))
         pi.Add(Process(thunk2, jc, self.job_list, self.tracer))
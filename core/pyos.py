@@ -10,6 +10,7 @@ import pwd
 import resource
 import signal
 import select
+import stat
 import sys
 import termios  # for read -n
 import time
@@ -101,6 +102,86 @@ def Read(fd, n, chunks):
         return length, 0
 
 
+# ReadAll() starts with this buffer size when it can't fstat() the size, e.g.
+# for pipes
+_MIN_READ_SIZE = 4096
+
+# The Python version reads at most this much at once.  The C++ version
+# doubles its buffer without a limit.
+_MAX_READ_SIZE = 1 << 20
+
+
+def _ReadSizeHint(fd):
+    # type: (int) -> int
+    """The number of bytes left in a regular file, plus 1 to see EOF.
+
+    Files in /proc have a size of 0, so it's never less than _MIN_READ_SIZE.
+    """
+    try:
+        st = posix.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return _MIN_READ_SIZE
+        pos = posix.lseek(fd, 0, 1)  # SEEK_CUR
+    except OSError as e:
+        return _MIN_READ_SIZE
+    return max(st.st_size - pos + 1, _MIN_READ_SIZE)
+
+
+def ReadAll(fd, prefix, strip_newlines):
+    # type: (int, str, bool) -> Tuple[str, int]
+    """Read from fd until EOF, for command subs and read --all.
+
+    Returns:
+      ('', errno) on failure
+      (prefix + contents, 0) on success.
+
+    EINTR is retried, without running traps.  The C++ version reads into a
+    single buffer, which is sized with fstat() for regular files, and grows
+    geometrically for pipes.  It strips trailing newlines in place.
+    """
+    chunks = []  # type: List[str]
+    if len(prefix):
+        chunks.append(prefix)
+
+    n = _ReadSizeHint(fd)
+    while True:
+        try:
+            chunk = posix.read(fd, n)
+        except OSError as e:
+            if e.errno == EINTR:
+                continue  # retry
+            return '', e.errno
+
+        if len(chunk) == 0:  # EOF
+            break
+        chunks.append(chunk)
+        n = min(n * 2, _MAX_READ_SIZE)
+
+    s = ''.join(chunks)
+    if strip_newlines:
+        s = s.rstrip('\n')
+    return s, 0
+
+
+def WriteAll(fd, s):
+    # type: (int, str) -> int
+    """Write all of s to fd, continuing after partial writes.
+
+    Returns 0 on success, or errno on failure.  EINTR is retried, like
+    ReadAll().
+    """
+    pos = 0
+    n = len(s)
+    while pos < n:
+        try:
+            pos += posix.write(fd, s[pos:])
+        except OSError as e:
+            if e.errno == EINTR:
+                continue  # retry
+            return e.errno
+    return 0
+
+
 def ReadByte(fd):
     # type: (int) -> Tuple[int, int]
     """Another low level interface with a return value interface.  Used by
@@ -121,6 +202,40 @@ def ReadByte(fd):
             return EOF_SENTINEL, 0
 
 
+# Kinds of file descriptor, for process.StdinBuffer
+FD_OTHER = 0  # terminal, socket, etc.
+FD_REGULAR = 1  # can lseek()
+FD_PIPE = 2
+
+
+def FdKind(fd):
+    # type: (int) -> int
+    """Returns FD_REGULAR, FD_PIPE, or FD_OTHER."""
+    try:
+        st = posix.fstat(fd)
+    except OSError as e:
+        return FD_OTHER
+
+    if stat.S_ISREG(st.st_mode):
+        return FD_REGULAR
+    if stat.S_ISFIFO(st.st_mode):
+        return FD_PIPE
+    return FD_OTHER
+
+
+def SeekBack(fd, num_bytes):
+    # type: (int, int) -> int
+    """Move the file offset back by num_bytes, to "unread" them.
+
+    Returns 0 for success and nonzero errno for error.
+    """
+    try:
+        posix.lseek(fd, -num_bytes, 1)  # SEEK_CUR
+    except OSError as e:
+        return e.errno
+    return 0
+
+
 if 0:
 
     def ReadLineBuffered():
@@ -429,3 +544,11 @@ def MakeDirCacheKey(path):
     directory accesses."""
     st = posix.stat(path)
     return (path, int(st.st_mtime))
+
+
+def MakeFileCacheKey(path):
+    # type: (str) -> Tuple[int, int]
+    """Returns (last modified time, size) of a file, to validate a cache of
+    its contents."""
+    st = posix.stat(path)
+    return (int(st.st_mtime), st.st_size)
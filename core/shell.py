@@ -34,6 +34,7 @@ unused1 = flag_def
 from frontend import flag_util
 from frontend import location
 from frontend import reader
+from frontend import parse_cache
 from frontend import parse_lib
 
 from builtin import assign_osh
@@ -528,10 +529,20 @@ def Main(
                                       ext_prog, waiter, tracer, job_control,
                                       job_list, fd_state, trap_state, errfmt)
 
-    arith_ev = sh_expr_eval.ArithEvaluator(mem, exec_opts, mutable_opts,
-                                           parse_ctx, errfmt)
-    bool_ev = sh_expr_eval.BoolEvaluator(mem, exec_opts, mutable_opts,
-                                         parse_ctx, errfmt)
+    # Shared by (( x )), [[ x -eq y ]], and unset 'a[i]', where x='i+1'
+    arith_cache = sh_expr_eval.ArithParseCache(mutable_opts)
+    arith_ev = sh_expr_eval.ArithEvaluator(mem,
+                                           exec_opts,
+                                           mutable_opts,
+                                           parse_ctx,
+                                           errfmt,
+                                           parse_cache=arith_cache)
+    bool_ev = sh_expr_eval.BoolEvaluator(mem,
+                                         exec_opts,
+                                         mutable_opts,
+                                         parse_ctx,
+                                         errfmt,
+                                         parse_cache=arith_cache)
     expr_ev = expr_eval.ExprEvaluator(mem, mutable_opts, methods, splitter,
                                       errfmt)
     word_ev = word_eval.NormalWordEvaluator(mem, exec_opts, mutable_opts,
@@ -594,8 +605,16 @@ def Main(
     b[builtin_i.runproc] = meta_osh.RunProc(shell_ex, procs, errfmt)
 
     # Meta builtins
+    # Opt-in.  Cache files are trusted like the scripts they came from.
+    parse_cache_dir = environ.get('OILS_PARSE_CACHE_DIR', '')
+    if len(parse_cache_dir):
+        source_cache = parse_cache.ParseCache(
+            parse_cache_dir, version_str, mutable_opts,
+            aliases)  # type: Optional[parse_cache.ParseCache]
+    else:
+        source_cache = None
     source_builtin = meta_osh.Source(parse_ctx, search_path, cmd_ev, fd_state,
-                                     tracer, errfmt, loader)
+                                     tracer, errfmt, loader, source_cache)
     b[builtin_i.source] = source_builtin
     b[builtin_i.dot] = source_builtin
     b[builtin_i.eval] = meta_osh.Eval(parse_ctx, exec_opts, cmd_ev, tracer,
@@ -641,13 +660,15 @@ def Main(
     b[builtin_i.fopen] = io_ysh.Fopen(mem, cmd_ev)
 
     # (pp output format isn't stable)
-    b[builtin_i.pp] = io_ysh.Pp(mem, errfmt, procs, arena)
+    b[builtin_i.pp] = io_ysh.Pp(mem, errfmt, procs, arena, arith_cache)
 
     # Input
     b[builtin_i.cat] = io_osh.Cat()  # for $(<file)
-    b[builtin_i.read] = read_osh.Read(splitter, mem, parse_ctx, cmd_ev, errfmt)
+    b[builtin_i.read] = read_osh.Read(splitter, mem, parse_ctx, cmd_ev, errfmt,
+                                       exec_opts, fd_state.stdin_buf)
 
-    mapfile = io_osh.MapFile(mem, errfmt, cmd_ev)
+    mapfile = io_osh.MapFile(mem, errfmt, cmd_ev, exec_opts,
+                             fd_state.stdin_buf)
     b[builtin_i.mapfile] = mapfile
     b[builtin_i.readarray] = mapfile
 
@@ -661,8 +682,10 @@ def Main(
 
     b[builtin_i.times] = misc_osh.Times()
 
-    b[builtin_i.json] = json_ysh.Json(mem, errfmt, False)
-    b[builtin_i.json8] = json_ysh.Json(mem, errfmt, True)
+    b[builtin_i.json] = json_ysh.Json(mem, errfmt, cmd_ev, False,
+                                       fd_state.stdin_buf)
+    b[builtin_i.json8] = json_ysh.Json(mem, errfmt, cmd_ev, True,
+                                        fd_state.stdin_buf)
 
     ### Process builtins
     b[builtin_i.exec_] = process_osh.Exec(mem, ext_prog, fd_state, search_path,
@@ -687,7 +710,7 @@ def Main(
     # Completion
     spec_builder = completion_osh.SpecBuilder(cmd_ev, parse_ctx, word_ev,
                                               splitter, comp_lookup, help_data,
-                                              errfmt)
+                                              search_path, errfmt)
     complete_builtin = completion_osh.Complete(spec_builder, comp_lookup)
     b[builtin_i.complete] = complete_builtin
     b[builtin_i.compgen] = completion_osh.CompGen(spec_builder)
@@ -772,6 +795,11 @@ def Main(
         'join': func_misc.Join(),  # both a method and a func
     }
 
+    methods[value_e.Range] = {
+        'step': method_other.RangeStep(),
+        'reversed': method_other.RangeReversed(),
+    }
+
     methods[value_e.Match] = {
         'group': func_eggex.MatchMethod(func_eggex.G, expr_ev),
         'start': func_eggex.MatchMethod(func_eggex.S, None),
@@ -20,6 +20,7 @@ from _devbuild.gen.value_asdl import (value, value_e, value_t, sh_lvalue,
                                       sh_lvalue_e, sh_lvalue_t, LeftName,
                                       y_lvalue_e, regex_match, regex_match_e,
                                       regex_match_t, RegexMatch)
+from core import bash_array
 from core import error
 from core.error import e_usage, e_die
 from core import num
@@ -94,59 +95,155 @@ def LookupExecutable(name, path_dirs, exec_required=True):
     return None
 
 
+class _PathDir(object):
+    """The names in a directory on $PATH, for SearchPath."""
+
+    def __init__(self, mtime, names, racy):
+        # type: (int, Optional[Dict[str, bool]], bool) -> None
+        self.mtime = mtime
+        # None if the directory can be searched but not listed, like one with
+        # mode 111
+        self.names = names
+
+        # mtime has a granularity of 1 second.  If the directory was listed in
+        # the same second it was modified, it could change again without
+        # changing mtime, so we list it again next time.
+        self.racy = racy
+
+        # Names of executable files, computed lazily for completion
+        self.executables = None  # type: Optional[List[str]]
+
+
 class SearchPath(object):
-    """For looking up files in $PATH."""
+    """For looking up files in $PATH.
+
+    Keeps an index of the names in each directory on $PATH, which is
+    invalidated when the directory's mtime changes.  So a lookup is a stat()
+    and a dict lookup per directory.
+
+    Like bash, a command that's already hashed isn't looked up again, until
+    'hash -r'.
+    """
 
     def __init__(self, mem):
         # type: (Mem) -> None
         self.mem = mem
-        self.cache = {}  # type: Dict[str, str]
+        self.cache = {}  # type: Dict[str, str]  # for the 'hash' builtin
+
+        # $PATH, and its parsed form.  ''.split(':') == ['']
+        self.path_str = ''
+        self.path_dirs = ['']  # type: List[str]
+
+        self.dirs = {}  # type: Dict[str, _PathDir]
+        self.num_dir_reads = 0
+
+        # Lookups where no directory had to be read (hit), or some did (miss)
+        self.num_hits = 0
+        self.num_misses = 0
 
     def _GetPath(self):
         # type: () -> List[str]
 
-        # TODO: Could cache this to avoid split() allocating all the time.
         val = self.mem.GetValue('PATH')
         UP_val = val
         if val.tag() == value_e.Str:
             val = cast(value.Str, UP_val)
-            return val.s.split(':')
+            if val.s != self.path_str:  # only split when $PATH changes
+                self.path_str = val.s
+                self.path_dirs = val.s.split(':')
+            return self.path_dirs
         else:
             return []  # treat as empty path
 
-    def LookupOne(self, name, exec_required=True):
-        # type: (str, bool) -> Optional[str]
-        """
-        Returns the path itself (if relative path), the resolved path, or None.
-        """
-        return LookupExecutable(name,
-                                self._GetPath(),
-                                exec_required=exec_required)
-
-    def LookupReflect(self, name, do_all):
-        # type: (str, bool) -> List[str]
-        """
-        Like LookupOne(), with an option for 'type -a' to return all paths.
+    def _GetDir(self, path_dir):
+        # type: (str) -> Optional[_PathDir]
+        """Returns the index of a directory, or None if it doesn't exist."""
+        try:
+            _, mtime = pyos.MakeDirCacheKey(path_dir)
+        except (IOError, OSError) as e:
+            return None  # There could be a directory that doesn't exist
+
+        d = self.dirs.get(path_dir)
+        if d is not None and d.mtime == mtime and not d.racy:
+            return d
+
+        try:
+            entries = posix.listdir(path_dir)
+        except (IOError, OSError) as e:
+            # Not cached, because chmod doesn't change the mtime
+            return _PathDir(mtime, None, True)
+        self.num_dir_reads += 1
+
+        names = {}  # type: Dict[str, bool]
+        for name in entries:
+            names[name] = True
+
+        racy = mtime >= int(time_.time())
+        d = _PathDir(mtime, names, racy)
+        self.dirs[path_dir] = d
+        return d
+
+    def _Search(self, name, exec_required, do_all):
+        # type: (str, bool, bool) -> List[str]
+        """Search $PATH for name.
+
+        A name with a slash isn't searched for.  It's returned if it exists.
         """
+        results = []  # type: List[str]
         if len(name) == 0:  # special case for "$(true)"
-            return []
+            return results
 
         if '/' in name:
             if path_stat.exists(name):
-                return [name]
-            else:
-                return []
+                results.append(name)
+            return results
+
+        num_dir_reads = self.num_dir_reads
 
-        results = []  # type: List[str]
         for path_dir in self._GetPath():
+            if path_dir.startswith('/'):
+                d = self._GetDir(path_dir)
+                if d is None:
+                    continue
+                if d.names is not None and name not in d.names:
+                    continue
+            # else: relative entries like '' and '.' depend on the current
+            # directory, so they aren't indexed
+
             full_path = os_path.join(path_dir, name)
-            if path_stat.exists(full_path):
+            if exec_required:
+                found = posix.access(full_path, X_OK)
+            else:
+                found = path_stat.exists(full_path)
+
+            if found:
                 results.append(full_path)
                 if not do_all:
-                    return results
+                    break
 
+        if self.num_dir_reads == num_dir_reads:
+            self.num_hits += 1
+        else:
+            self.num_misses += 1
         return results
 
+    def LookupOne(self, name, exec_required=True):
+        # type: (str, bool) -> Optional[str]
+        """
+        Returns the path itself (if relative path), the resolved path, or None.
+        """
+        results = self._Search(name, exec_required, False)
+        if len(results):
+            return results[0]
+        return None
+
+    def LookupReflect(self, name, do_all):
+        # type: (str, bool) -> List[str]
+        """
+        Like LookupOne(), with an option for 'type -a' to return all paths.
+        """
+        return self._Search(name, False, do_all)
+
     def CachedLookup(self, name):
         # type: (str) -> Optional[str]
         #log('name %r', name)
@@ -167,11 +264,33 @@ class SearchPath(object):
         # type: () -> None
         """For hash -r."""
         self.cache.clear()
+        self.dirs.clear()
 
     def CachedCommands(self):
         # type: () -> List[str]
         return self.cache.values()
 
+    def Executables(self):
+        # type: () -> List[str]
+        """Names of all executables in $PATH, for completion."""
+        executables = []  # type: List[str]
+        for path_dir in self._GetPath():
+            d = self._GetDir(path_dir)
+            if d is None or d.names is None:
+                continue
+
+            if d.executables is None:
+                d.executables = []
+                for name in d.names:
+                    path = os_path.join(path_dir, name)
+                    # TODO: Handle exception if file gets deleted in between
+                    # listing and check?
+                    if posix.access(path, X_OK):
+                        d.executables.append(name)
+
+            executables.extend(d.executables)
+        return executables
+
 
 class ctx_Source(object):
     """For source builtin."""
@@ -706,7 +825,7 @@ class _ArgFrame(object):
         # type: () -> Dict[str, value_t]
         return {
             # Easier to serialize value.BashArray than value.List
-            'argv': value.BashArray(self.argv),
+            'argv': value.BashArray(self.argv, None),
             'num_shifted': num.ToBig(self.num_shifted),
         }
 
@@ -940,7 +1059,7 @@ class ctx_FuncCall(object):
     def __exit__(self, type, value, traceback):
         # type: (Any, Any, Any) -> None
         self.mem.PopCall()
-        self.mem.var_stack.pop()
+        self.mem.PopVarFrame()
 
 
 class ctx_ProcCall(object):
@@ -991,7 +1110,7 @@ class ctx_ProcCall(object):
         # type: (Any, Any, Any) -> None
         self.mutable_opts.PopDynamicScope()
         self.mem.PopCall()
-        self.mem.var_stack.pop()
+        self.mem.PopVarFrame()
 
         if self.sh_compat:
             self.mem.argv_stack.pop()
@@ -1155,6 +1274,12 @@ class Mem(object):
         # For the ctx builtin
         self.ctx_stack = []  # type: List[Dict[str, value_t]]
 
+        # GetExported() is called for every external command, so we cache it.
+        # Anything that changes an exported cell, or the set of exported
+        # cells, sets the dirty bit.
+        self.exported = {}  # type: Dict[str, str]
+        self.exported_dirty = True
+
     def __repr__(self):
         # type: () -> str
         parts = []  # type: List[str]
@@ -1398,7 +1523,16 @@ class Mem(object):
 
     def PopTemp(self):
         # type: () -> None
-        self.var_stack.pop()
+        self.PopVarFrame()
+
+    def PopVarFrame(self):
+        # type: () -> None
+        """Pop the frame of a func, proc, or temp binding."""
+        frame = self.var_stack.pop()
+        for _, cell in iteritems(frame):
+            if cell.exported:  # e.g. FOO=bar myfunc, or local -x
+                self.exported_dirty = True
+                break
 
     def TopNamespace(self):
         # type: () -> Dict[str, Cell]
@@ -1615,9 +1749,11 @@ class Mem(object):
                 cell = frame.get(yval.name)
                 if cell is None:
                     cell = Cell(False, False, False, val)
-                    frame[yval.name] = cell
+                    frame[intern(yval.name)] = cell
                 else:
                     cell.val = val
+                    if cell.exported:
+                        self.exported_dirty = True
 
             elif case(y_lvalue_e.Container):
                 e_die('Container place not implemented', blame_loc)
@@ -1638,9 +1774,11 @@ class Mem(object):
                 e_die("Can't assign to readonly value %r" % lval.name,
                       lval.blame_loc)
             cell.val = val  # Mutate value_t
+            if cell.exported:
+                self.exported_dirty = True
         else:
             cell = Cell(False, False, False, val)
-            name_map[lval.name] = cell
+            name_map[intern(lval.name)] = cell
 
     def SetNamed(self, lval, val, which_scopes, flags=0):
         # type: (LeftName, value_t, scope_t, int) -> None
@@ -1688,6 +1826,9 @@ class Mem(object):
             if flags & SetNameref:
                 cell.nameref = True
 
+            if cell.exported or flags & ClearExport:
+                self.exported_dirty = True
+
         else:
             if val is None:  # declare -rx nonexistent
                 # set -o nounset; local foo; echo $foo  # It's still undefined!
@@ -1695,7 +1836,10 @@ class Mem(object):
 
             cell = Cell(bool(flags & SetExport), bool(flags & SetReadOnly),
                         bool(flags & SetNameref), val)
-            name_map[cell_name] = cell
+            name_map[intern(cell_name)] = cell
+
+            if cell.exported:
+                self.exported_dirty = True
 
         # Maintain invariant that only strings and undefined cells can be
         # exported.
@@ -1785,25 +1929,14 @@ class Mem(object):
 
                     elif case2(value_e.BashArray):
                         cell_val = cast(value.BashArray, UP_cell_val)
-                        strs = cell_val.strs
-
-                        n = len(strs)
-                        index = lval.index
-                        if index < 0:  # a[-1]++ computes this twice; could we avoid it?
-                            index += n
-
-                        if 0 <= index and index < n:
-                            strs[index] = rval.s
-                        else:
-                            # Fill it in with None.  It could look like this:
-                            # ['1', 2, 3, None, None, '4', None]
-                            # Then ${#a[@]} counts the entries that are not None.
-                            #
-                            # TODO: strict_array for Oil arrays won't auto-fill.
-                            n = index - len(strs) + 1
-                            for i in xrange(n):
-                                strs.append(None)
-                            strs[lval.index] = rval.s
+                        # a[-1]++ computes the index twice; could we avoid it?
+                        # TODO: strict_array for Oil arrays won't auto-fill.
+                        if not bash_array.SetItem(cell_val, lval.index,
+                                                  rval.s):
+                            e_die(
+                                "Index %d is out of bounds for array of length %d"
+                                % (lval.index, bash_array.Length(cell_val)),
+                                left_loc)
                         return
 
                 # This could be an object, eggex object, etc.  It won't be
@@ -1841,14 +1974,15 @@ class Mem(object):
     def _BindNewArrayWithEntry(self, name_map, lval, val, flags):
         # type: (Dict[str, Cell], sh_lvalue.Indexed, value.Str, int) -> None
         """Fill 'name_map' with a new indexed array entry."""
-        no_str = None  # type: Optional[str]
-        items = [no_str] * lval.index
-        items.append(val.s)
-        new_value = value.BashArray(items)
+        new_value = value.BashArray([], None)
+        if not bash_array.SetItem(new_value, lval.index, val.s):
+            e_die(
+                "Index %d is out of bounds for array of length 0" % lval.index,
+                lval.blame_loc)
 
         # arrays can't be exported; can't have BashAssoc flag
         readonly = bool(flags & SetReadOnly)
-        name_map[lval.name] = Cell(False, readonly, False, new_value)
+        name_map[intern(lval.name)] = Cell(False, readonly, False, new_value)
 
     def InternalSetGlobal(self, name, new_val):
         # type: (str, value_t) -> None
@@ -1864,6 +1998,8 @@ class Mem(object):
         """
         cell = self.var_stack[0][name]
         cell.val = new_val
+        if cell.exported:
+            self.exported_dirty = True
 
     def GetValue(self, name, which_scopes=scope_e.Shopt):
         # type: (str, scope_t) -> value_t
@@ -1899,7 +2035,7 @@ class Mem(object):
             elif case('PIPESTATUS'):
                 strs2 = [str(i)
                          for i in self.pipe_status[-1]]  # type: List[str]
-                return value.BashArray(strs2)
+                return value.BashArray(strs2, None)
 
             elif case('_pipeline_status'):
                 items = [num.ToBig(i)
@@ -1918,7 +2054,7 @@ class Mem(object):
                     elif case2(regex_match_e.Yes):
                         m = cast(RegexMatch, top_match)
                         groups = util.RegexGroupStrings(m.s, m.indices)
-                return value.BashArray(groups)
+                return value.BashArray(groups, None)
 
             # Do lookup of system globals before looking at user variables.  Note: we
             # could optimize this at compile-time like $?.  That would break
@@ -1942,7 +2078,7 @@ class Mem(object):
                         elif case2(debug_frame_e.Main):
                             strs.append('main')  # also bash behavior
 
-                return value.BashArray(strs)  # TODO: Reuse this object too?
+                return value.BashArray(strs, None)  # TODO: Reuse this object too?
 
             # $BASH_SOURCE and $BASH_LINENO have OFF BY ONE design bugs:
             #
@@ -1975,7 +2111,7 @@ class Mem(object):
                             frame = cast(debug_frame.Main, UP_frame)
                             strs.append(frame.dollar0)
 
-                return value.BashArray(strs)  # TODO: Reuse this object too?
+                return value.BashArray(strs, None)  # TODO: Reuse this object too?
 
             elif case('BASH_LINENO'):
                 strs = []
@@ -1994,7 +2130,7 @@ class Mem(object):
                             # Bash does this to line up with 'main'
                             strs.append('0')
 
-                return value.BashArray(strs)  # TODO: Reuse this object too?
+                return value.BashArray(strs, None)  # TODO: Reuse this object too?
 
             elif case('LINENO'):
                 assert self.token_for_line is not None
@@ -2078,6 +2214,8 @@ class Mem(object):
                 # Make variables in higher scopes visible.
                 # example: test/spec.sh builtin-vars -r 24 (ble.sh)
                 mylib.dict_erase(name_map, cell_name)
+                if cell.exported:
+                    self.exported_dirty = True
 
                 # alternative that some shells use:
                 #   name_map[cell_name].val = value.Undef
@@ -2097,27 +2235,12 @@ class Mem(object):
                     raise error.Runtime("%r isn't an array" % var_name)
 
                 val = cast(value.BashArray, UP_val)
-                strs = val.strs
-
-                n = len(strs)
-                last_index = n - 1
-                index = lval.index
-                if index < 0:
-                    index += n
-
-                if index == last_index:
-                    # Special case: The array SHORTENS if you unset from the end.  You
-                    # can tell with a+=(3 4)
-                    strs.pop()
-                elif 0 <= index and index < last_index:
-                    strs[index] = None
-                else:
-                    # If it's not found, it's not an error.  In other words, 'unset'
-                    # ensures that a value doesn't exist, regardless of whether it
-                    # existed.  It's idempotent.
-                    # (Ousterhout specifically argues that the strict behavior was a
-                    # mistake for Tcl!)
-                    pass
+                # If it's not found, it's not an error.  In other words, 'unset'
+                # ensures that a value doesn't exist, regardless of whether it
+                # existed.  It's idempotent.
+                # (Ousterhout specifically argues that the strict behavior was a
+                # mistake for Tcl!)
+                bash_array.UnsetItem(val, lval.index)
 
             elif case(sh_lvalue_e.Keyed):  # unset 'A["K"]'
                 lval = cast(sh_lvalue.Keyed, UP_lval)
@@ -2159,6 +2282,8 @@ class Mem(object):
         cell, name_map = self._ResolveNameOnly(name, self.ScopesForReading())
         if cell:
             if flag & ClearExport:
+                if cell.exported:
+                    self.exported_dirty = True
                 cell.exported = False
             if flag & ClearNameref:
                 cell.nameref = False
@@ -2168,11 +2293,14 @@ class Mem(object):
 
     def GetExported(self):
         # type: () -> Dict[str, str]
-        """Get all the variables that are marked exported."""
-        # TODO: This is run on every SimpleCommand.  Should we have a dirty flag?
-        # We have to notice these things:
-        # - If an exported variable is changed.
-        # - If the set of exported variables changes.
+        """Get all the variables that are marked exported.
+
+        This is run on every external command, so the result is cached until
+        an exported variable changes, or the set of exported variables
+        changes.  Callers must not mutate it.
+        """
+        if not self.exported_dirty:
+            return self.exported
 
         exported = {}  # type: Dict[str, str]
         # Search from globals up.  Names higher on the stack will overwrite names
@@ -2184,6 +2312,9 @@ class Mem(object):
                 if cell.exported and cell.val.tag() == value_e.Str:
                     val = cast(value.Str, cell.val)
                     exported[name] = val.s
+
+        self.exported = exported
+        self.exported_dirty = False
         return exported
 
     def VarNames(self):
@@ -2318,7 +2449,7 @@ def BuiltinSetArray(mem, name, a):
     Used by compadjust, read -a, etc.
     """
     assert isinstance(a, list)
-    BuiltinSetValue(mem, location.LName(name), value.BashArray(a))
+    BuiltinSetValue(mem, location.LName(name), value.BashArray(a, None))
 
 
 def SetGlobalString(mem, name, s):
@@ -2333,7 +2464,8 @@ def SetGlobalArray(mem, name, a):
     # type: (Mem, str, List[str]) -> None
     """Used by completion, shell initialization, etc."""
     assert isinstance(a, list)
-    mem.SetNamed(location.LName(name), value.BashArray(a), scope_e.GlobalOnly)
+    mem.SetNamed(location.LName(name), value.BashArray(a, None),
+                 scope_e.GlobalOnly)
 
 
 def ExportGlobalString(mem, name, s):
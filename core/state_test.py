@@ -44,7 +44,7 @@ class MemTest(unittest.TestCase):
     def _PopShellCall(self, mem):
         """ simulate shell function """
         mem.PopCall()
-        mem.var_stack.pop()
+        mem.PopVarFrame()
         mem.argv_stack.pop()
 
     def testGet(self):
@@ -83,6 +83,66 @@ class MemTest(unittest.TestCase):
         else:
             self.assertEqual(search_path.LookupOne('env'), '/usr/bin/env')
 
+    def testSearchPathIndex(self):
+        mem = _InitMem()
+        search_path = state.SearchPath(mem)
+
+        d1 = os.path.abspath('_tmp/search-path-1')
+        d2 = os.path.abspath('_tmp/search-path-2')
+        for d in [d1, d2]:
+            if not os.path.exists(d):
+                os.makedirs(d)
+            for name in os.listdir(d):
+                os.remove(os.path.join(d, name))
+
+        def MakeExe(path):
+            with open(path, 'w') as f:
+                f.write('#!/bin/sh\n')
+            os.chmod(path, 0o755)
+
+        MakeExe(os.path.join(d2, 'tool'))
+        with open(os.path.join(d2, 'data'), 'w') as f:
+            f.write('not executable')
+
+        mem.SetValue(location.LName('PATH'), value.Str('%s:%s' % (d1, d2)),
+                     scope_e.GlobalOnly)
+
+        self.assertEqual(d2 + '/tool', search_path.CachedLookup('tool'))
+        self.assertEqual(None, search_path.CachedLookup('data'))
+        self.assertEqual(d2 + '/data',
+                         search_path.LookupOne('data', exec_required=False))
+        self.assertEqual([d2 + '/tool'], search_path.CachedCommands())
+        self.assertEqual(['tool'], search_path.Executables())
+
+        # A new executable in an earlier directory shadows the old one, but
+        # not for a command that's already hashed
+        MakeExe(os.path.join(d1, 'tool'))
+        self.assertEqual(d1 + '/tool', search_path.LookupOne('tool'))
+        self.assertEqual(d2 + '/tool', search_path.CachedLookup('tool'))
+        self.assertEqual([d1 + '/tool', d2 + '/tool'],
+                         search_path.LookupReflect('tool', True))
+
+        # Force the directories to look old, so their listings are reused
+        for d in [d1, d2]:
+            os.utime(d, (1, 1))
+        search_path.ClearCache()
+
+        search_path.LookupOne('nonexistent')  # lists both directories
+        num_hits = search_path.num_hits
+        num_misses = search_path.num_misses
+        search_path.LookupOne('tool')
+        search_path.LookupOne('nonexistent')
+        self.assertEqual(num_hits + 2, search_path.num_hits)
+        self.assertEqual(num_misses, search_path.num_misses)
+
+        # A directory that can be searched but not listed
+        os.chmod(d1, 0o111)
+        try:
+            search_path.ClearCache()
+            self.assertEqual(d1 + '/tool', search_path.LookupOne('tool'))
+        finally:
+            os.chmod(d1, 0o755)
+
     def testPushTemp(self):
         mem = _InitMem()
 
@@ -188,7 +248,8 @@ class MemTest(unittest.TestCase):
         # COMPREPLY=(1 2 3)
         # invariant to enforce: arrays can't be exported
         mem.SetValue(location.LName('COMPREPLY'),
-                     value.BashArray(['1', '2', '3']), scope_e.GlobalOnly)
+                     value.BashArray(['1', '2', '3'], None),
+                     scope_e.GlobalOnly)
         self.assertEqual(['1', '2', '3'],
                          mem.var_stack[0]['COMPREPLY'].val.strs)
 
@@ -243,7 +304,7 @@ class MemTest(unittest.TestCase):
         # a[1]=(x y z)  # illegal but doesn't parse anyway
         if 0:
             try:
-                mem.SetValue(lhs, value.BashArray(['x', 'y', 'z']),
+                mem.SetValue(lhs, value.BashArray(['x', 'y', 'z'], None),
                              scope_e.Dynamic)
             except error.FatalRuntime as e:
                 pass
@@ -297,6 +358,50 @@ class MemTest(unittest.TestCase):
         e = mem.GetExported()
         self.assertEqual('u', e['U'])
 
+    def testGetExportedCache(self):
+        mem = _InitMem()
+
+        # export U=u
+        mem.SetValue(location.LName('U'),
+                     value.Str('u'),
+                     scope_e.Dynamic,
+                     flags=state.SetExport)
+        e1 = mem.GetExported()
+        self.assertEqual('u', e1['U'])
+
+        # Unexported variables don't invalidate the cache
+        mem.SetValue(location.LName('x'), value.Str('1'), scope_e.Dynamic)
+        self.assertIs(e1, mem.GetExported())
+
+        # U=v
+        mem.SetValue(location.LName('U'), value.Str('v'), scope_e.Dynamic)
+        e2 = mem.GetExported()
+        self.assertIsNot(e1, e2)
+        self.assertEqual('v', e2['U'])
+
+        # FOO=bar myfunc
+        mem.PushTemp()
+        mem.SetValue(location.LName('FOO'),
+                     value.Str('bar'),
+                     scope_e.LocalOnly,
+                     flags=state.SetExport)
+        self.assertEqual('bar', mem.GetExported()['FOO'])
+        mem.PopTemp()
+        self.assertEqual(None, mem.GetExported().get('FOO'))
+
+        # export -n U
+        mem.ClearFlag('U', state.ClearExport)
+        self.assertEqual(None, mem.GetExported().get('U'))
+
+        # export U; unset U
+        mem.SetValue(location.LName('U'),
+                     None,
+                     scope_e.Dynamic,
+                     flags=state.SetExport)
+        self.assertEqual('v', mem.GetExported()['U'])
+        mem.Unset(location.LName('U'), scope_e.Dynamic)
+        self.assertEqual(None, mem.GetExported().get('U'))
+
     def testUnset(self):
         mem = _InitMem()
         # unset a
@@ -302,7 +302,7 @@ def InitCommandEvaluator(parse_ctx=None,
         TOPICS = None  # minimal dev build
     spec_builder = completion_osh.SpecBuilder(cmd_ev, parse_ctx, word_ev,
                                               splitter, comp_lookup, TOPICS,
-                                              errfmt)
+                                              search_path, errfmt)
 
     # Add some builtins that depend on the executor!
     complete_builtin = completion_osh.Complete(spec_builder, comp_lookup)
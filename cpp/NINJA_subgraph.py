@@ -104,6 +104,29 @@ def NinjaGraph(ru):
                  ],
                  matrix=ninja_lib.COMPILERS_VARIANTS)
 
+    # Separate from //cpp/data_lang, which the prebuilt error.mycpp code
+    # depends on
+    ru.cc_library(
+        '//cpp/data_lang_read',
+        srcs=[
+            'cpp/data_lang_read.cc',
+        ],
+        deps=[
+            '//core/value.asdl',
+            '//cpp/core',
+            '//data_lang/utf8',
+            '//mycpp/runtime',
+        ],
+    )
+
+    ru.cc_binary(
+        'cpp/data_lang_read_test.cc',
+        deps=[
+            '//cpp/data_lang_read',
+            '//prebuilt/core/error.mycpp',  # error::Decode
+        ],
+        matrix=ninja_lib.COMPILERS_VARIANTS)
+
     # Note: depends on code generated by re2c
     ru.cc_library(
         '//cpp/frontend_match',
@@ -163,7 +186,11 @@ def NinjaGraph(ru):
                   srcs=['cpp/fanos.cc'],
                   deps=['//cpp/fanos_shared', '//mycpp/runtime'])
 
-    ru.cc_library('//cpp/libc', srcs=['cpp/libc.cc'], deps=['//mycpp/runtime'])
+    ru.cc_library('//cpp/regex_cache', srcs=['cpp/regex_cache.c'])
+
+    ru.cc_library('//cpp/libc',
+                  srcs=['cpp/libc.cc'],
+                  deps=['//cpp/regex_cache', '//mycpp/runtime'])
 
     ru.cc_binary('cpp/libc_test.cc',
                  deps=['//cpp/libc'],
@@ -4,6 +4,7 @@
 
 #include <ctype.h>  // ispunct()
 #include <errno.h>
+#include <limits.h>  // INT_MAX
 #include <math.h>  // fmod()
 #include <pwd.h>   // passwd
 #include <signal.h>
@@ -62,6 +63,89 @@ Tuple2<int, int> Read(int fd, int n, List<BigStr*>* chunks) {
   return Tuple2<int, int>(length, 0);
 }
 
+// Like the Python version
+const int kMinReadSize = 4096;
+
+static int ReadSizeHint(int fd) {
+  struct stat st;
+  if (::fstat(fd, &st) != 0 || !S_ISREG(st.st_mode)) {
+    return kMinReadSize;
+  }
+  off_t pos = ::lseek(fd, 0, SEEK_CUR);
+  if (pos < 0) {
+    return kMinReadSize;
+  }
+  // Plus 1 so we see EOF without growing the buffer
+  off_t n = st.st_size - pos + 1;
+  if (n < kMinReadSize) {
+    return kMinReadSize;  // e.g. files in /proc have a size of 0
+  }
+  if (n > INT_MAX / 2) {
+    return INT_MAX / 2;
+  }
+  return static_cast<int>(n);
+}
+
+Tuple2<BigStr*, int> ReadAll(int fd, BigStr* prefix, bool strip_newlines) {
+  int prefix_len = len(prefix);
+  int cap = prefix_len + ReadSizeHint(fd);
+  BigStr* buf = OverAllocatedStr(cap);
+  memcpy(buf->data(), prefix->data(), prefix_len);
+  int length = prefix_len;
+
+  while (true) {
+    if (length == cap) {
+      // Grow geometrically.  No GC can happen here, so we don't need to
+      // root the old buffer.
+      if (cap > INT_MAX / 2) {
+        return Tuple2<BigStr*, int>(kEmptyString, ENOMEM);
+      }
+      cap *= 2;
+      BigStr* bigger = OverAllocatedStr(cap);
+      memcpy(bigger->data(), buf->data(), length);
+      buf = bigger;
+    }
+
+    int n = ::read(fd, buf->data() + length, cap - length);
+    if (n < 0) {
+      if (errno == EINTR) {
+        continue;  // retry, like the Python version
+      }
+      return Tuple2<BigStr*, int>(kEmptyString, errno);
+    }
+    if (n == 0) {  // EOF
+      break;
+    }
+    length += n;
+  }
+
+  // For command subs.  Trimming in place means we don't copy the result.
+  if (strip_newlines) {
+    while (length > 0 && buf->data()[length - 1] == '\n') {
+      length--;
+    }
+  }
+  buf->MaybeShrink(length);
+  return Tuple2<BigStr*, int>(buf, 0);
+}
+
+int WriteAll(int fd, BigStr* s) {
+  const char* p = s->data();
+  int n = len(s);
+  while (n > 0) {
+    ssize_t w = ::write(fd, p, n);
+    if (w < 0) {
+      if (errno == EINTR) {
+        continue;  // retry, like the Python version
+      }
+      return errno;
+    }
+    p += w;
+    n -= w;
+  }
+  return 0;
+}
+
 Tuple2<int, int> ReadByte(int fd) {
   unsigned char buf[1];
   ssize_t n = read(fd, &buf, 1);
@@ -77,6 +161,27 @@ Tuple2<int, int> ReadByte(int fd) {
   }
 }
 
+int FdKind(int fd) {
+  struct stat st;
+  if (::fstat(fd, &st) != 0) {
+    return FD_OTHER;
+  }
+  if (S_ISREG(st.st_mode)) {
+    return FD_REGULAR;
+  }
+  if (S_ISFIFO(st.st_mode)) {
+    return FD_PIPE;
+  }
+  return FD_OTHER;
+}
+
+int SeekBack(int fd, int num_bytes) {
+  if (::lseek(fd, -num_bytes, SEEK_CUR) < 0) {
+    return errno;
+  }
+  return 0;
+}
+
 Dict<BigStr*, BigStr*>* Environ() {
   auto d = Alloc<Dict<BigStr*, BigStr*>>();
 
@@ -299,6 +404,15 @@ Tuple2<BigStr*, int>* MakeDirCacheKey(BigStr* path) {
   return Alloc<Tuple2<BigStr*, int>>(path, st.st_mtime);
 }
 
+Tuple2<int, int> MakeFileCacheKey(BigStr* path) {
+  struct stat st;
+  if (::stat(path->data(), &st) == -1) {
+    throw Alloc<OSError>(errno);
+  }
+
+  return Tuple2<int, int>(st.st_mtime, st.st_size);
+}
+
 Tuple2<int, void*> PushTermAttrs(int fd, int mask) {
   struct termios* term_attrs =
       static_cast<struct termios*>(malloc(sizeof(struct termios)));
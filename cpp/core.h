@@ -38,6 +38,16 @@ const int UNTRAPPED_SIGWINCH = -1;
 Tuple2<int, int> WaitPid(int waitpid_options);
 Tuple2<int, int> Read(int fd, int n, List<BigStr*>* chunks);
 Tuple2<int, int> ReadByte(int fd);
+Tuple2<BigStr*, int> ReadAll(int fd, BigStr* prefix, bool strip_newlines);
+int WriteAll(int fd, BigStr* s);
+
+const int FD_OTHER = 0;
+const int FD_REGULAR = 1;
+const int FD_PIPE = 2;
+
+int FdKind(int fd);
+int SeekBack(int fd, int num_bytes);
+
 BigStr* ReadLineBuffered();
 Dict<BigStr*, BigStr*>* Environ();
 int Chdir(BigStr* dest_dir);
@@ -238,6 +248,8 @@ void RegisterSignalInterest(int sig_num);
 
 Tuple2<BigStr*, int>* MakeDirCacheKey(BigStr* path);
 
+Tuple2<int, int> MakeFileCacheKey(BigStr* path);
+
 }  // namespace pyos
 
 namespace pyutil {
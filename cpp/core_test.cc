@@ -166,6 +166,89 @@ TEST pyos_read_test() {
   PASS();
 }
 
+TEST pyos_read_all_test() {
+  const char* tmp_name = "pyos_ReadAll";
+  int fd = ::open(tmp_name, O_CREAT | O_RDWR | O_TRUNC, 0644);
+  ASSERT(fd > 0);
+  write(fd, "skip\nhi\n\n\n", 10);
+
+  // Reads from the current offset of a regular file
+  ASSERT_EQ(5, lseek(fd, 5, SEEK_SET));
+  Tuple2<BigStr*, int> tup = pyos::ReadAll(fd, StrFromC("> "), true);
+  ASSERT_EQ_FMT(0, tup.at1(), "%d");
+  ASSERT(str_equals(StrFromC("> hi"), tup.at0()));
+
+  ASSERT_EQ(0, lseek(fd, 0, SEEK_SET));
+  tup = pyos::ReadAll(fd, kEmptyString, false);
+  ASSERT(str_equals(StrFromC("skip\nhi\n\n\n"), tup.at0()));
+  close(fd);
+
+  // A pipe with more than the initial buffer size, so it has to grow
+  int fds[2];
+  ASSERT_EQ(0, pipe(fds));
+  int n = 10000;
+  for (int i = 0; i < n; ++i) {
+    write(fds[1], i % 2 ? "a" : "b", 1);
+  }
+  write(fds[1], "\n", 1);
+  close(fds[1]);
+
+  tup = pyos::ReadAll(fds[0], kEmptyString, true);
+  ASSERT_EQ_FMT(0, tup.at1(), "%d");
+  ASSERT_EQ_FMT(n, len(tup.at0()), "%d");
+  ASSERT_EQ('b', tup.at0()->data()[0]);
+  ASSERT_EQ('a', tup.at0()->data()[n - 1]);
+  close(fds[0]);
+
+  // Error
+  tup = pyos::ReadAll(-1, kEmptyString, true);
+  ASSERT_EQ_FMT(EBADF, tup.at1(), "%d");
+  ASSERT_EQ_FMT(0, len(tup.at0()), "%d");
+
+  PASS();
+}
+
+TEST pyos_write_all_test() {
+  int fds[2];
+  ASSERT_EQ(0, pipe(fds));
+  ASSERT_EQ_FMT(0, pyos::WriteAll(fds[1], StrFromC("hi\n")), "%d");
+  close(fds[1]);
+
+  Tuple2<BigStr*, int> tup = pyos::ReadAll(fds[0], kEmptyString, false);
+  ASSERT(str_equals(StrFromC("hi\n"), tup.at0()));
+  close(fds[0]);
+
+  ASSERT_EQ_FMT(EBADF, pyos::WriteAll(-1, StrFromC("hi")), "%d");
+
+  PASS();
+}
+
+TEST pyos_seek_back_test() {
+  const char* tmp_name = "pyos_SeekBack";
+  int fd = ::open(tmp_name, O_CREAT | O_RDWR | O_TRUNC, 0644);
+  ASSERT(fd > 0);
+  write(fd, "SH", 2);
+  ASSERT_EQ_FMT(pyos::FD_REGULAR, pyos::FdKind(fd), "%d");
+
+  // Unread one byte
+  ASSERT_EQ_FMT(0, pyos::SeekBack(fd, 1), "%d");
+  Tuple2<int, int> tup = pyos::ReadByte(fd);
+  ASSERT_EQ_FMT('H', tup.at0(), "%d");
+  close(fd);
+
+  int fds[2];
+  ASSERT_EQ(0, pipe(fds));
+  ASSERT_EQ_FMT(pyos::FD_PIPE, pyos::FdKind(fds[0]), "%d");
+  // Pipes can't be rewound
+  ASSERT_EQ_FMT(ESPIPE, pyos::SeekBack(fds[0], 1), "%d");
+  close(fds[0]);
+  close(fds[1]);
+
+  ASSERT_EQ_FMT(pyos::FD_OTHER, pyos::FdKind(-1), "%d");
+
+  PASS();
+}
+
 TEST pyos_test() {
   Tuple3<double, double, double> t = pyos::Time();
   ASSERT(t.at0() > 0.0);
@@ -365,6 +448,25 @@ TEST dir_cache_key_test() {
   PASS();
 }
 
+TEST file_cache_key_test() {
+  struct stat st;
+  ASSERT(::stat("cpp/core_test.cc", &st) == 0);
+
+  Tuple2<int, int> key = pyos::MakeFileCacheKey(StrFromC("cpp/core_test.cc"));
+  ASSERT_EQ(st.st_mtime, key.at0());
+  ASSERT_EQ(st.st_size, key.at1());
+
+  int ec = -1;
+  try {
+    pyos::MakeFileCacheKey(StrFromC("nonexistent_ZZ"));
+  } catch (IOError_OSError* e) {
+    ec = e->errno_;
+  }
+  ASSERT(ec == ENOENT);
+
+  PASS();
+}
+
 // Test the theory that LeakSanitizer tests for reachability from global
 // variables.
 struct Node {
@@ -399,6 +501,9 @@ int main(int argc, char** argv) {
   RUN_TEST(uname_test);
   RUN_TEST(pyos_readbyte_test);
   RUN_TEST(pyos_read_test);
+  RUN_TEST(pyos_read_all_test);
+  RUN_TEST(pyos_write_all_test);
+  RUN_TEST(pyos_seek_back_test);
   RUN_TEST(pyos_test);  // non-hermetic
   RUN_TEST(pyutil_test);
   RUN_TEST(strerror_test);
@@ -408,6 +513,7 @@ int main(int argc, char** argv) {
 
   RUN_TEST(passwd_test);
   RUN_TEST(dir_cache_key_test);
+  RUN_TEST(file_cache_key_test);
   RUN_TEST(asan_global_leak_test);
 
   gHeap.CleanProcessExit();
@@ -0,0 +1,771 @@
+// data_lang_read.cc: a streaming J8 / JSON decoder
+//
+// This is the same language as data_lang/j8.py Parser and LexerDecoder, with
+// the same error messages.  The differences:
+//
+// - We read a file descriptor in chunks.  Bytes are discarded once they've
+//   been decoded, so a big document isn't held in memory as a string.
+// - We build value_t directly.  There are no intermediate token strings or
+//   Tuple2, and a string literal is copied once, into its value.Str.
+// - The plain bytes of string literals are found 8 at a time (SWAR).
+//
+// Offsets in error messages are relative to the start of the buffer, which is
+// the start of the document unless we've discarded some of it.
+
+#include "cpp/data_lang_read.h"
+
+#include <errno.h>
+#include <stdint.h>  // uint64_t
+#include <stdlib.h>  // malloc(), realloc()
+#include <string.h>  // memcpy(), memmove()
+#include <unistd.h>  // read()
+
+#include <string>
+
+#include "_gen/frontend/id_kind.asdl.h"
+#include "cpp/core.h"  // pyos::ReadError
+#include "data_lang/utf8.h"
+// To avoid circular dependency with //cpp/data_lang
+#include "prebuilt/core/error.mycpp.h"
+
+using id_kind_asdl::Id;
+using id_kind_asdl::Id_str;
+using value_asdl::value;
+using value_asdl::value_t;
+
+namespace pyj8_read {
+
+namespace {
+
+const int kChunkSize = 64 * 1024;
+
+const uint64_t kOnes = 0x0101010101010101ULL;
+const uint64_t kHighBits = 0x8080808080808080ULL;
+
+// Returns the number of bytes at the start of [p, p+n) that can be copied to
+// the decoded string as is: not the closing quote, a backslash, an ASCII
+// control char, or part of a UTF-8 sequence that must be validated.
+inline int PlainPrefix(const char* p, int n, char quote) {
+  const uint64_t quotes = kOnes * static_cast<unsigned char>(quote);
+  const uint64_t backslashes = kOnes * '\\';
+
+  int i = 0;
+  for (; i + 8 <= n; i += 8) {
+    uint64_t w;
+    memcpy(&w, p + i, 8);
+    // The high bit of a byte is set if it's < 0x20, equal to the quote or
+    // backslash, or >= 0x80.  A borrow only happens after such a byte.
+    uint64_t special = ((w - kOnes * 0x20) | ((w ^ quotes) - kOnes) |
+                        ((w ^ backslashes) - kOnes) | w) &
+                       kHighBits;
+    if (special) {
+      break;
+    }
+  }
+  for (; i < n; ++i) {
+    unsigned char c = p[i];
+    if (c < 0x20 || c >= 0x80 || c == quote || c == '\\') {
+      break;
+    }
+  }
+  return i;
+}
+
+inline bool IsDigit(int c) {
+  return '0' <= c && c <= '9';
+}
+
+inline int HexValue(int c) {
+  if ('0' <= c && c <= '9') {
+    return c - '0';
+  }
+  if ('a' <= c && c <= 'f') {
+    return c - 'a' + 10;
+  }
+  if ('A' <= c && c <= 'F') {
+    return c - 'A' + 10;
+  }
+  return -1;
+}
+
+inline bool IsNameStart(int c) {
+  return ('a' <= c && c <= 'z') || ('A' <= c && c <= 'Z') || c == '_';
+}
+
+inline bool IsNameChar(int c) {
+  return IsNameStart(c) || IsDigit(c);
+}
+
+// Id.J8_Operator in frontend/lexer_def.py
+inline bool IsOperatorChar(int c) {
+  return c > 0 && strchr("~!@$%^&*+=|;./<>?-", c) != nullptr;
+}
+
+// Same as j8.Utf8Encode()
+void AppendUtf8(std::string* out, uint32_t code) {
+  if (code <= 0x7F) {
+    out->push_back(code);
+  } else if (code <= 0x7FF) {
+    out->push_back(0xC0 | (code >> 6));
+    out->push_back(0x80 | (code & 0x3F));
+  } else if (code <= 0xFFFF) {
+    out->push_back(0xE0 | (code >> 12));
+    out->push_back(0x80 | ((code >> 6) & 0x3F));
+    out->push_back(0x80 | (code & 0x3F));
+  } else {
+    out->push_back(0xF0 | (code >> 18));
+    out->push_back(0x80 | ((code >> 12) & 0x3F));
+    out->push_back(0x80 | ((code >> 6) & 0x3F));
+    out->push_back(0x80 | (code & 0x3F));
+  }
+}
+
+class Decoder {
+ public:
+  Decoder(int fd, BigStr* prefix, bool is_j8);
+  ~Decoder();
+
+  // Like j8.Parser.ParseValue()
+  value_t* ParseDocument();
+
+ private:
+  // The byte at pos_ + k, or -1 at EOF.  Reads more if necessary.
+  int Peek(int k) {
+    while (pos_ + k >= len_) {
+      if (!Fill()) {
+        return -1;
+      }
+    }
+    return static_cast<unsigned char>(buf_[pos_ + k]);
+  }
+  bool Fill();
+  int Offset(int pos) {
+    return offset_ + pos;
+  }
+
+  void Next();
+  void LexToken();
+  void LexNumber();
+  void LexString(int left_id, int left_len);
+  void LexEscape(int left_id, bool json_style);
+  void LexBracedEscape();
+
+  value_t* ParseValue();
+  value_t* ParseDict();
+  value_t* ParseList();
+  void Eat(int tok_id);
+
+  // Like LexerDecoder._Error() and _Parser._ParseError()
+  error::Decode* Error(BigStr* msg, int end_pos);
+  error::Decode* LexError(const char* fmt, int end);
+
+  int fd_;
+  bool is_j8_;
+  BigStr* lang_str_;
+
+  // buf_[0, len_) is input, followed by a NUL terminator for utf8_decode()
+  char* buf_;
+  int capacity_;
+  int len_;
+  int pos_;     // the next byte to lex
+  int keep_;    // Fill() may discard bytes before this
+  int offset_;  // of buf_[0] in the document
+  bool eof_;
+
+  // The current token
+  int tok_id_;
+  int tok_start_;  // offset in the document
+  int tok_end_;
+  BigStr* tok_str_;  // decoded string, or the text of a number
+  int line_num_;
+
+  std::string decoded_;  // reused for each string
+
+  DISALLOW_COPY_AND_ASSIGN(Decoder);
+};
+
+Decoder::Decoder(int fd, BigStr* prefix, bool is_j8)
+    : fd_(fd),
+      is_j8_(is_j8),
+      lang_str_(StrFromC(is_j8 ? "J8" : "JSON")),
+      capacity_(kChunkSize),
+      len_(0),
+      pos_(0),
+      keep_(0),
+      offset_(0),
+      eof_(false),
+      tok_id_(Id::Undefined_Tok),
+      tok_start_(0),
+      tok_end_(0),
+      tok_str_(nullptr),
+      line_num_(1) {
+  int n = len(prefix);
+  while (capacity_ < n + 1) {
+    capacity_ *= 2;
+  }
+  buf_ = static_cast<char*>(malloc(capacity_));
+  memcpy(buf_, prefix->data_, n);
+  len_ = n;
+  buf_[len_] = '\0';
+}
+
+Decoder::~Decoder() {
+  free(buf_);
+}
+
+// Read another chunk, after discarding bytes before keep_.  Returns false at
+// EOF.
+bool Decoder::Fill() {
+  if (eof_) {
+    return false;
+  }
+
+  // Discard what we've parsed only when we need room, so that documents
+  // smaller than a chunk get the same error offsets as j8.Parser
+  if (keep_ > 0 && capacity_ - len_ - 1 < kChunkSize / 2) {
+    memmove(buf_, buf_ + keep_, len_ - keep_);
+    len_ -= keep_;
+    pos_ -= keep_;
+    offset_ += keep_;
+    keep_ = 0;
+  }
+  if (capacity_ - len_ - 1 < kChunkSize / 2) {  // a long token
+    capacity_ *= 2;
+    buf_ = static_cast<char*>(realloc(buf_, capacity_));
+  }
+
+  while (true) {
+    int n = read(fd_, buf_ + len_, capacity_ - len_ - 1);
+    if (n < 0) {
+      if (errno == EINTR) {
+        continue;  // Like pyos::ReadAll(), retry and don't run traps
+      }
+      throw Alloc<pyos::ReadError>(errno);
+    }
+    if (n == 0) {
+      eof_ = true;
+      return false;
+    }
+    len_ += n;
+    buf_[len_] = '\0';
+    return true;
+  }
+}
+
+error::Decode* Decoder::Error(BigStr* msg, int end_pos) {
+  // Show what's left in the buffer, with offsets relative to it
+  int start = std::max(tok_start_ - offset_, 0);
+  int end = std::max(end_pos - offset_, start);
+  BigStr* s = StrFromC(buf_, len_);
+  return Alloc<error::Decode>(msg, s, start, end, line_num_);
+}
+
+error::Decode* Decoder::LexError(const char* fmt, int end) {
+  return Error(StrFormat(fmt, lang_str_), Offset(end));
+}
+
+// Skip whitespace and comments, and lex one token
+void Decoder::Next() {
+  while (true) {
+    keep_ = pos_;
+    tok_start_ = Offset(pos_);
+
+    int c = Peek(0);
+    if (c == ' ' || c == '\t' || c == '\r') {
+      pos_++;
+    } else if (c == '\n') {
+      line_num_++;
+      pos_++;
+    } else if (c == '#') {
+      while ((c = Peek(0)) > 0 && c != '\n') {
+        pos_++;
+      }
+      if (!is_j8_) {
+        throw Error(
+            StrFromC("Comments aren't part of JSON; you may want 'json8 read'"),
+            Offset(pos_));
+      }
+    } else {
+      break;
+    }
+  }
+  LexToken();
+}
+
+void Decoder::LexToken() {
+  int c = Peek(0);
+  int id = Id::Unknown_Tok;
+
+  switch (c) {
+  case -1:
+  case '\0':  // like the NUL sentinel of the re2c lexer
+    tok_id_ = Id::Eol_Tok;
+    tok_end_ = Offset(pos_);
+    return;
+
+  case '[':
+    id = Id::J8_LBracket;
+    break;
+  case ']':
+    id = Id::J8_RBracket;
+    break;
+  case '{':
+    id = Id::J8_LBrace;
+    break;
+  case '}':
+    id = Id::J8_RBrace;
+    break;
+  case '(':
+    id = Id::J8_LParen;
+    break;
+  case ')':
+    id = Id::J8_RParen;
+    break;
+  case ',':
+    id = Id::J8_Comma;
+    break;
+  case ':':
+    id = Id::J8_Colon;
+    break;
+
+  case '"':
+    LexString(Id::Left_DoubleQuote, 1);
+    return;
+  case '\'':
+    LexString(Id::Left_USingleQuote, 1);
+    return;
+
+  default:
+    if (c == '-' || IsDigit(c)) {
+      if (c != '-' || IsDigit(Peek(1))) {
+        LexNumber();
+        return;
+      }
+    }
+    if (c == 'j' && Peek(1) == '"') {
+      LexString(Id::Left_JDoubleQuote, 2);
+      return;
+    }
+    if ((c == 'u' || c == 'b') && Peek(1) == '\'') {
+      LexString(c == 'u' ? Id::Left_USingleQuote : Id::Left_BSingleQuote, 2);
+      return;
+    }
+
+    if (IsNameStart(c)) {
+      int n = 1;
+      while (IsNameChar(Peek(n))) {
+        n++;
+      }
+      const char* p = buf_ + pos_;
+      if (n == 4 && memcmp(p, "null", 4) == 0) {
+        id = Id::J8_Null;
+      } else if ((n == 4 && memcmp(p, "true", 4) == 0) ||
+                 (n == 5 && memcmp(p, "false", 5) == 0)) {
+        id = Id::J8_Bool;
+      } else {
+        id = Id::J8_Identifier;
+      }
+      pos_ += n;
+      tok_id_ = id;
+      tok_end_ = Offset(pos_);
+      return;
+    }
+
+    if (IsOperatorChar(c)) {  // NIL8 only
+      int n = 1;
+      while (IsOperatorChar(Peek(n))) {
+        n++;
+      }
+      pos_ += n;
+      tok_id_ = Id::J8_Operator;
+      tok_end_ = Offset(pos_);
+      return;
+    }
+    break;  // Id::Unknown_Tok, including ASCII control chars
+  }
+
+  pos_++;
+  tok_id_ = id;
+  tok_end_ = Offset(pos_);
+}
+
+// -?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?
+void Decoder::LexNumber() {
+  int id = Id::J8_Int;
+  int n = 0;
+  if (Peek(n) == '-') {
+    n++;
+  }
+  if (Peek(n) == '0') {
+    n++;
+  } else {
+    while (IsDigit(Peek(n))) {
+      n++;
+    }
+  }
+
+  if (Peek(n) == '.' && IsDigit(Peek(n + 1))) {
+    n += 2;
+    while (IsDigit(Peek(n))) {
+      n++;
+    }
+    id = Id::J8_Float;
+  }
+
+  int c = Peek(n);
+  if (c == 'e' || c == 'E') {
+    int m = n + 1;
+    c = Peek(m);
+    if (c == '+' || c == '-') {
+      m++;
+    }
+    if (IsDigit(Peek(m))) {
+      while (IsDigit(Peek(m))) {
+        m++;
+      }
+      n = m;
+      id = Id::J8_Float;
+    }
+  }
+
+  tok_str_ = StrFromC(buf_ + pos_, n);
+  pos_ += n;
+  tok_id_ = id;
+  tok_end_ = Offset(pos_);
+}
+
+// Like LexerDecoder.Next() and _DecodeString()
+void Decoder::LexString(int left_id, int left_len) {
+  bool json_style =
+      left_id == Id::Left_DoubleQuote || left_id == Id::Left_JDoubleQuote;
+
+  if (!is_j8_) {
+    if (!json_style) {
+      throw Error(StrFromC("Single quotes aren't part of JSON; you may want "
+                           "'json8 read'"),
+                  Offset(pos_ + left_len));
+    }
+    if (left_id == Id::Left_JDoubleQuote) {
+      throw Error(StrFromC("Pure JSON does not accept j\"\" prefix"),
+                  Offset(pos_ + left_len));
+    }
+  }
+
+  pos_ += left_len;
+  char quote = json_style ? '"' : '\'';
+  decoded_.clear();
+
+  while (true) {
+    keep_ = pos_;  // bytes before this have been decoded
+
+    int n = PlainPrefix(buf_ + pos_, len_ - pos_, quote);
+    if (n) {
+      decoded_.append(buf_ + pos_, n);
+      pos_ += n;
+      continue;
+    }
+
+    int c = Peek(0);
+    if (c <= 0) {
+      throw LexError("Unexpected EOF while lexing %s string", pos_);
+    }
+    if (c == quote) {
+      pos_++;
+      break;
+    }
+    if (c == '\\') {
+      LexEscape(left_id, json_style);
+      continue;
+    }
+    if (c < 0x20) {
+      throw LexError("%s strings can't have unescaped ASCII control chars",
+                     pos_ + 1);
+    }
+
+    // Validate one UTF-8 sequence.  Make sure it's in the buffer, which is
+    // NUL-terminated.
+    Peek(3);
+    Utf8Result result;
+    utf8_decode(reinterpret_cast<unsigned char*>(buf_ + pos_), &result);
+    if (result.error) {
+      // Like j8.py, the error ends where the Lit_Chars token would: at the
+      // next quote, backslash, control char, or EOF.  Don't start at
+      // bytes_read, which may include the quote after a truncated sequence.
+      int n = 1;
+      while (true) {
+        c = Peek(n);
+        if (c < 0x20 || c == quote || c == '\\') {
+          break;
+        }
+        n++;
+      }
+      throw LexError("Invalid UTF-8 in %s string literal", pos_ + n);
+    }
+    decoded_.append(buf_ + pos_, result.bytes_read);
+    pos_ += result.bytes_read;
+  }
+
+  tok_str_ = StrFromC(decoded_.data(), decoded_.size());
+  tok_id_ = Id::J8_String;
+  tok_end_ = Offset(pos_);
+}
+
+// Decode one escape at pos_, which is a backslash
+void Decoder::LexEscape(int left_id, bool json_style) {
+  int c = Peek(1);
+  switch (c) {
+  case '\\':
+  case '"':
+  case '/':
+    decoded_.push_back(c);
+    pos_ += 2;
+    return;
+  case 'b':
+    decoded_.push_back('\b');
+    pos_ += 2;
+    return;
+  case 'f':
+    decoded_.push_back('\f');
+    pos_ += 2;
+    return;
+  case 'n':
+    decoded_.push_back('\n');
+    pos_ += 2;
+    return;
+  case 'r':
+    decoded_.push_back('\r');
+    pos_ += 2;
+    return;
+  case 't':
+    decoded_.push_back('\t');
+    pos_ += 2;
+    return;
+
+  case '\'':
+    if (!json_style) {
+      decoded_.push_back('\'');
+      pos_ += 2;
+      return;
+    }
+    break;
+
+  case 'u':
+  case 'U':
+    if (json_style) {
+      if (c == 'U') {
+        break;
+      }
+      // \u03bc, or a surrogate pair like \ud83d\ude00
+      int code = 0;
+      int i = 2;
+      for (; i < 6; ++i) {
+        int h = HexValue(Peek(i));
+        if (h < 0) {
+          break;
+        }
+        code = code * 16 + h;
+      }
+      if (i < 6) {
+        break;
+      }
+      if (0xD800 <= code && code < 0xDC00 && Peek(6) == '\\' &&
+          Peek(7) == 'u') {
+        int low = 0;
+        int j = 8;
+        for (; j < 12; ++j) {
+          int h = HexValue(Peek(j));
+          if (h < 0) {
+            break;
+          }
+          low = low * 16 + h;
+        }
+        if (j == 12 && 0xDC00 <= low && low < 0xE000) {
+          // https://www.oilshell.org/blog/2023/06/surrogate-pair.html
+          AppendUtf8(&decoded_,
+                     0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00));
+          pos_ += 12;
+          return;
+        }
+      }
+      AppendUtf8(&decoded_, code);  // may be an unpaired surrogate
+      pos_ += 6;
+      return;
+    }
+    if (Peek(2) == '{') {
+      LexBracedEscape();
+      return;
+    }
+    break;
+
+  case 'y':
+    if (!json_style) {
+      int h1 = HexValue(Peek(2));
+      int h2 = HexValue(Peek(3));
+      if (h1 < 0 || h2 < 0) {
+        break;
+      }
+      // Same check in osh/word_parse.py
+      if (left_id != Id::Left_BSingleQuote) {
+        throw Error(StrFormat("\\y%s escapes not allowed in u'' strings",
+                              StrFromC(buf_ + pos_ + 2, 2)),
+                    Offset(pos_ + 4));
+      }
+      decoded_.push_back(h1 * 16 + h2);
+      pos_ += 4;
+      return;
+    }
+    break;
+  }
+
+  throw LexError("Bad backslash escape in %s string", pos_ + 1);
+}
+
+// \u{123456} in J8 strings, at pos_
+void Decoder::LexBracedEscape() {
+  int code = 0;
+  int n = 3;
+  for (; n < 9; ++n) {
+    int h = HexValue(Peek(n));
+    if (h < 0) {
+      break;
+    }
+    code = code * 16 + h;
+  }
+  if (n == 3 || Peek(n) != '}') {
+    throw LexError("Bad backslash escape in %s string", pos_ + 1);
+  }
+
+  // Same checks in osh/word_compile.py
+  int end = pos_ + n + 1;
+  if (code > 0x10ffff) {
+    throw Error(StrFromC("Code point can't be greater than U+10ffff"),
+                Offset(end));
+  }
+  if (0xD800 <= code && code < 0xE000) {
+    throw Error(StrFormat("\\u{%s} escape is illegal because it's in the "
+                          "surrogate range",
+                          StrFromC(buf_ + pos_ + 3, n - 3)),
+                Offset(end));
+  }
+  AppendUtf8(&decoded_, code);
+  pos_ = end;
+}
+
+void Decoder::Eat(int tok_id) {
+  if (tok_id_ != tok_id) {
+    throw Error(StrFormat("Expected %s, got %s", Id_str(tok_id),
+                          Id_str(tok_id_)),
+                tok_end_);
+  }
+  Next();
+}
+
+value_t* Decoder::ParseDict() {
+  auto d = Alloc<Dict<BigStr*, value_t*>>();
+
+  Next();
+  if (tok_id_ == Id::J8_RBrace) {
+    Next();
+    return Alloc<value::Dict>(d);
+  }
+
+  while (true) {
+    BigStr* k = tok_str_;
+    Eat(Id::J8_String);
+    Eat(Id::J8_Colon);
+    d->set(k, ParseValue());
+
+    if (tok_id_ != Id::J8_Comma) {
+      break;
+    }
+    Next();
+  }
+  Eat(Id::J8_RBrace);
+
+  return Alloc<value::Dict>(d);
+}
+
+value_t* Decoder::ParseList() {
+  auto items = Alloc<List<value_t*>>();
+
+  Next();
+  if (tok_id_ == Id::J8_RBracket) {
+    Next();
+    return Alloc<value::List>(items);
+  }
+
+  while (true) {
+    items->append(ParseValue());
+
+    if (tok_id_ != Id::J8_Comma) {
+      break;
+    }
+    Next();
+  }
+  Eat(Id::J8_RBracket);
+
+  return Alloc<value::List>(items);
+}
+
+value_t* Decoder::ParseValue() {
+  value_t* result = nullptr;
+
+  switch (tok_id_) {
+  case Id::J8_LBrace:
+    return ParseDict();
+
+  case Id::J8_LBracket:
+    return ParseList();
+
+  case Id::J8_Null:
+    result = value::Null;
+    break;
+
+  case Id::J8_Bool:
+    result = Alloc<value::Bool>(tok_end_ - tok_start_ == 4);  // true
+    break;
+
+  case Id::J8_Int:
+    result = Alloc<value::Int>(mops::FromStr(tok_str_));
+    break;
+
+  case Id::J8_Float:
+    result = Alloc<value::Float>(to_float(tok_str_));
+    break;
+
+  // UString, BString too
+  case Id::J8_String:
+    result = Alloc<value::Str>(tok_str_);
+    break;
+
+  case Id::Eol_Tok:
+    throw Error(StrFormat("Unexpected EOF while parsing %s", lang_str_),
+                tok_end_);
+
+  default:  // Id.Unknown_Tok, Id.J8_{LParen,RParen}
+    throw Error(StrFormat("Invalid token while parsing %s: %s", lang_str_,
+                          Id_str(tok_id_)),
+                tok_end_);
+  }
+
+  Next();
+  return result;
+}
+
+value_t* Decoder::ParseDocument() {
+  Next();
+  value_t* obj = ParseValue();
+  if (tok_id_ != Id::Eol_Tok) {
+    throw Error(StrFromC("Unexpected trailing input"), tok_end_);
+  }
+  return obj;
+}
+
+}  // namespace
+
+value_t* ReadValue(int fd, BigStr* prefix, bool is_j8) {
+  Decoder decoder(fd, prefix, is_j8);
+  return decoder.ParseDocument();
+}
+
+}  // namespace pyj8_read
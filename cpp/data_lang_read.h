@@ -0,0 +1,17 @@
+// cpp/data_lang_read.h: decode J8 and JSON from a file descriptor
+
+#ifndef DATA_LANG_READ_H
+#define DATA_LANG_READ_H
+
+#include "_gen/core/value.asdl.h"
+#include "mycpp/runtime.h"
+
+namespace pyj8_read {
+
+// Like j8.Parser(s, is_j8).ParseValue(), but reads fd in chunks instead of
+// taking a string.  Raises error::Decode or pyos::ReadError.
+value_asdl::value_t* ReadValue(int fd, BigStr* prefix, bool is_j8);
+
+}  // namespace pyj8_read
+
+#endif  // DATA_LANG_READ_H
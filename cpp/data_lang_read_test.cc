@@ -0,0 +1,241 @@
+#include "cpp/data_lang_read.h"
+
+#include <unistd.h>  // pipe(), write()
+
+#include <string>
+
+#include "_gen/frontend/id_kind.asdl.h"
+#include "cpp/core.h"
+#include "prebuilt/core/error.mycpp.h"
+#include "vendor/greatest.h"
+
+using value_asdl::value;
+using value_asdl::value_e;
+using value_asdl::value_t;
+
+// Decode s, read through a pipe after the prefix
+value_t* ReadFromPipe(const char* prefix, const char* s, bool is_j8) {
+  int fds[2];
+  if (pipe(fds) < 0) {
+    return nullptr;
+  }
+  int n = strlen(s);
+  if (write(fds[1], s, n) != n) {
+    return nullptr;
+  }
+  close(fds[1]);
+
+  value_t* result = nullptr;
+  try {
+    result = pyj8_read::ReadValue(fds[0], StrFromC(prefix), is_j8);
+  } catch (error::Decode* e) {
+    log("error: %s", e->Message()->data_);
+  }
+  close(fds[0]);
+  return result;
+}
+
+value_t* Read(const char* s, bool is_j8 = true) {
+  return ReadFromPipe("", s, is_j8);
+}
+
+TEST scalar_test() {
+  ASSERT_EQ(value::Null, Read("null"));
+  ASSERT_EQ(true, static_cast<value::Bool*>(Read(" true "))->b);
+  ASSERT_EQ(false, static_cast<value::Bool*>(Read("false\n"))->b);
+  ASSERT_EQ(-42, static_cast<value::Int*>(Read("-42"))->i);
+  ASSERT_EQ(1.5e3, static_cast<value::Float*>(Read("1.5e3"))->f);
+  ASSERT_EQ(100.0, static_cast<value::Float*>(Read("1E2"))->f);
+
+  ASSERT(str_equals(StrFromC("hi"),
+                    static_cast<value::Str*>(Read("\"hi\""))->s));
+
+  // Trailing input, bad tokens
+  ASSERT_EQ(nullptr, Read("1 2"));
+  ASSERT_EQ(nullptr, Read("01"));
+  ASSERT_EQ(nullptr, Read("-"));
+  ASSERT_EQ(nullptr, Read(""));
+  ASSERT_EQ(nullptr, Read("nullx"));
+
+  PASS();
+}
+
+BigStr* ReadStr(const char* s, bool is_j8 = true) {
+  value_t* val = Read(s, is_j8);
+  if (val == nullptr || val->tag() != value_e::Str) {
+    return nullptr;
+  }
+  return static_cast<value::Str*>(val)->s;
+}
+
+TEST string_test() {
+  ASSERT(str_equals(StrFromC("a\"\\/\b\f\n\r\t"),
+                    ReadStr("\"a\\\"\\\\\\/\\b\\f\\n\\r\\t\"")));
+  ASSERT(str_equals(StrFromC("\xce\xbc \xf0\x9f\x98\x80"),
+                    ReadStr("\"\\u03bc \\ud83d\\ude00\"", false)));
+  // Unpaired surrogate
+  ASSERT(str_equals(StrFromC("\xed\xa0\xbd"), ReadStr("\"\\ud83d\"")));
+  ASSERT(str_equals(StrFromC("\xce\xbc"), ReadStr("\"\xce\xbc\"")));
+
+  // J8 strings
+  ASSERT(str_equals(StrFromC("\xff'"), ReadStr("b'\\yff\\''")));
+  ASSERT(str_equals(StrFromC("\xf0\x9f\x98\x80"), ReadStr("u'\\u{1f600}'")));
+  ASSERT(str_equals(StrFromC("x\"y"), ReadStr("'x\"y'")));
+  ASSERT(str_equals(StrFromC("j"), ReadStr("j\"j\"")));
+
+  ASSERT_EQ(nullptr, ReadStr("u'\\yff'"));
+  ASSERT_EQ(nullptr, ReadStr("u'\\u{d800}'"));
+  ASSERT_EQ(nullptr, ReadStr("u'\\u{110000}'"));
+  ASSERT_EQ(nullptr, ReadStr("u'\\u1234'"));
+  ASSERT_EQ(nullptr, ReadStr("\"\\'\""));
+  ASSERT_EQ(nullptr, ReadStr("\"tab\there\""));
+  ASSERT_EQ(nullptr, ReadStr("\"\xff\""));
+  ASSERT_EQ(nullptr, ReadStr("\"\xce\""));
+  ASSERT_EQ(nullptr, ReadStr("\"unclosed"));
+
+  // Only in J8
+  ASSERT_EQ(nullptr, ReadStr("'single'", false));
+  ASSERT_EQ(nullptr, ReadStr("j\"x\"", false));
+  ASSERT_EQ(nullptr, Read("# comment\n42", false));
+  ASSERT(Read("# comment\n42", true) != nullptr);
+
+  PASS();
+}
+
+TEST container_test() {
+  value_t* val = Read("{\"a\": [1, 2.5, {}], \"b\": [], \"a\": null}");
+  ASSERT_EQ(value_e::Dict, val->tag());
+  auto d = static_cast<value::Dict*>(val)->d;
+  ASSERT_EQ(2, len(d));
+  ASSERT_EQ(value::Null, d->at(StrFromC("a")));
+
+  val = Read("[[1], [[2]], 3]");
+  ASSERT_EQ(value_e::List, val->tag());
+  ASSERT_EQ(3, len(static_cast<value::List*>(val)->items));
+
+  ASSERT_EQ(nullptr, Read("[1, 2"));
+  ASSERT_EQ(nullptr, Read("[1, 2,]"));
+  ASSERT_EQ(nullptr, Read("{a: 1}"));
+  ASSERT_EQ(nullptr, Read("{\"a\" 1}"));
+
+  PASS();
+}
+
+// Decode s, and return the error
+error::Decode* ReadError(const char* s, bool is_j8 = true) {
+  int fds[2];
+  if (pipe(fds) < 0) {
+    return nullptr;
+  }
+  int n = strlen(s);
+  if (write(fds[1], s, n) != n) {
+    return nullptr;
+  }
+  close(fds[1]);
+
+  error::Decode* err = nullptr;
+  try {
+    pyj8_read::ReadValue(fds[0], kEmptyString, is_j8);
+  } catch (error::Decode* e) {
+    err = e;
+  }
+  close(fds[0]);
+  return err;
+}
+
+TEST error_test() {
+  error::Decode* err = ReadError("[1,\n 2,\n }");
+  ASSERT(err != nullptr);
+  ASSERT(str_equals(StrFromC("Invalid token while parsing J8: Id.J8_RBrace"),
+                    err->msg));
+  ASSERT_EQ(3, err->line_num);
+  ASSERT_EQ(9, err->start_pos);
+  ASSERT_EQ(10, err->end_pos);
+
+  // Like j8.py, invalid UTF-8 is reported up to the end of the Lit_Chars
+  // token
+  err = ReadError("[\"ab\xff\xfe" "cd\", 1]");
+  ASSERT(err != nullptr);
+  ASSERT(str_equals(StrFromC("Invalid UTF-8 in J8 string literal"),
+                    err->msg));
+  ASSERT_EQ(1, err->start_pos);
+  ASSERT_EQ(8, err->end_pos);
+
+  // A truncated sequence doesn't include the closing quote
+  err = ReadError("\"\xe2\x82\"", false);
+  ASSERT(err != nullptr);
+  ASSERT(str_equals(StrFromC("Invalid UTF-8 in JSON string literal"),
+                    err->msg));
+  ASSERT_EQ(0, err->start_pos);
+  ASSERT_EQ(3, err->end_pos);
+
+  err = ReadError("\"\xed\x80\"0.5", false);
+  ASSERT(err != nullptr);
+  ASSERT_EQ(0, err->start_pos);
+  ASSERT_EQ(3, err->end_pos);
+
+  // Not a pipe
+  bool caught = false;
+  try {
+    pyj8_read::ReadValue(-1, kEmptyString, true);
+  } catch (pyos::ReadError* e) {
+    caught = true;
+  }
+  ASSERT(caught);
+
+  PASS();
+}
+
+TEST streaming_test() {
+  // The prefix is part of the document
+  value_t* val = ReadFromPipe("[1, \"a", "b\", 3]", true);
+  ASSERT_EQ(3, len(static_cast<value::List*>(val)->items));
+
+  // Tokens and strings that cross chunk boundaries
+  const int n = 100 * 1000;
+  std::string doc = "[";
+  for (int i = 0; i < n; ++i) {
+    doc += "{\"key\": \"value \\u03bc \xce\xbc\", \"n\": 12345.5}, ";
+  }
+  std::string big(200 * 1000, 'x');
+  doc += "\"" + big + "\"]";
+
+  int fds[2];
+  pipe(fds);
+  if (fork() == 0) {
+    close(fds[0]);
+    write(fds[1], doc.data(), doc.size());
+    _exit(0);
+  }
+  close(fds[1]);
+  val = pyj8_read::ReadValue(fds[0], kEmptyString, false);
+  close(fds[0]);
+
+  auto items = static_cast<value::List*>(val)->items;
+  ASSERT_EQ(n + 1, len(items));
+  auto d = static_cast<value::Dict*>(items->at(n - 1))->d;
+  ASSERT(str_equals(StrFromC("value \xce\xbc \xce\xbc"),
+                    static_cast<value::Str*>(d->at(StrFromC("key")))->s));
+  ASSERT_EQ(200 * 1000, len(static_cast<value::Str*>(items->at(n))->s));
+
+  PASS();
+}
+
+GREATEST_MAIN_DEFS();
+
+int main(int argc, char** argv) {
+  gHeap.Init();
+
+  GREATEST_MAIN_BEGIN();
+
+  RUN_TEST(scalar_test);
+  RUN_TEST(string_test);
+  RUN_TEST(container_test);
+  RUN_TEST(error_test);
+  RUN_TEST(streaming_test);
+
+  gHeap.CleanProcessExit();
+
+  GREATEST_MAIN_END();
+  return 0;
+}
@@ -139,8 +139,6 @@ Dict<K, V>* NewDict() {
 }
 
 // "Inflate" the static C data into a heap-allocated ASDL data structure.
-//
-// TODO: Make a GLOBAL CACHE?  It could be shared between subinterpreters even?
 flag_spec::_FlagSpec* CreateSpec(FlagSpec_c* in) {
   auto out = Alloc<flag_spec::_FlagSpec>();
   out->arity0 = NewList<BigStr*>();
@@ -192,7 +190,22 @@ flag_spec::_FlagSpecAndMore* CreateSpec2(FlagSpecAndMore_c* in) {
 using arg_types::kFlagSpecs;
 using arg_types::kFlagSpecsAndMore;
 
+// Each spec is inflated once, the first time it's looked up.  It's then
+// shared by every invocation of the builtin, which is OK because the parser
+// doesn't mutate it: _Attributes copies the defaults before setting a flag.
+List<flag_spec::_FlagSpec*>* gSpecs = nullptr;
+List<flag_spec::_FlagSpecAndMore*>* gSpecs2 = nullptr;
+
 flag_spec::_FlagSpec* LookupFlagSpec(BigStr* spec_name) {
+  if (gSpecs == nullptr) {
+    int n = 0;
+    while (kFlagSpecs[n].name) {
+      n++;
+    }
+    gSpecs = NewList<flag_spec::_FlagSpec*>(nullptr, n);
+    gHeap.RootGlobalVar(gSpecs);
+  }
+
   int i = 0;
   while (true) {
     const char* name = kFlagSpecs[i].name;
@@ -201,7 +214,12 @@ flag_spec::_FlagSpec* LookupFlagSpec(BigStr* spec_name) {
     }
     if (str_equals0(name, spec_name)) {
       // log("%s found", spec_name->data_);
-      return CreateSpec(&kFlagSpecs[i]);
+      flag_spec::_FlagSpec* spec = gSpecs->at(i);
+      if (spec == nullptr) {
+        spec = CreateSpec(&kFlagSpecs[i]);
+        gSpecs->set(i, spec);
+      }
+      return spec;
     }
 
     i++;
@@ -211,6 +229,15 @@ flag_spec::_FlagSpec* LookupFlagSpec(BigStr* spec_name) {
 }
 
 flag_spec::_FlagSpecAndMore* LookupFlagSpec2(BigStr* spec_name) {
+  if (gSpecs2 == nullptr) {
+    int n = 0;
+    while (kFlagSpecsAndMore[n].name) {
+      n++;
+    }
+    gSpecs2 = NewList<flag_spec::_FlagSpecAndMore*>(nullptr, n);
+    gHeap.RootGlobalVar(gSpecs2);
+  }
+
   int i = 0;
   while (true) {
     const char* name = kFlagSpecsAndMore[i].name;
@@ -219,7 +246,12 @@ flag_spec::_FlagSpecAndMore* LookupFlagSpec2(BigStr* spec_name) {
     }
     if (str_equals0(name, spec_name)) {
       // log("%s found", spec_name->data_);
-      return CreateSpec2(&kFlagSpecsAndMore[i]);
+      flag_spec::_FlagSpecAndMore* spec = gSpecs2->at(i);
+      if (spec == nullptr) {
+        spec = CreateSpec2(&kFlagSpecsAndMore[i]);
+        gSpecs2->set(i, spec);
+      }
+      return spec;
     }
 
     i++;
@@ -76,6 +76,9 @@ TEST flag_spec_test() {
   spec = flag_util::LookupFlagSpec(StrFromC("readonly"));
   ASSERT(spec != nullptr);
 
+  // Specs are inflated once, and cached
+  ASSERT_EQ(spec, flag_util::LookupFlagSpec(StrFromC("readonly")));
+
   spec = flag_util::LookupFlagSpec(StrFromC("zzz"));
   ASSERT(spec == nullptr);
 
@@ -83,6 +86,7 @@ TEST flag_spec_test() {
 
   spec2 = flag_util::LookupFlagSpec2(StrFromC("main"));
   ASSERT(spec2 != nullptr);
+  ASSERT_EQ(spec2, flag_util::LookupFlagSpec2(StrFromC("main")));
 
   spec2 = flag_util::LookupFlagSpec2(StrFromC("zzz"));
   ASSERT(spec2 == nullptr);
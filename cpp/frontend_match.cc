@@ -31,9 +31,7 @@ Tuple2<Id_t, BigStr*> SimpleLexer::Next() {
               &id, &end_pos);
 
   int len = end_pos - pos_;
-  BigStr* val = NewStr(len);
-  memcpy(val->data_, s_->data_ + pos_, len);  // copy the list item
-  val->data_[len] = '\0';
+  BigStr* val = StrFromC(s_->data_ + pos_, len);  // copy the token
 
   pos_ = end_pos;
   return Tuple2<Id_t, BigStr*>(static_cast<Id_t>(id), val);
@@ -174,8 +174,11 @@ BigStr* Readline::prompt_input(BigStr* prompt) {
 
 void Readline::parse_and_bind(BigStr* s) {
 #if HAVE_READLINE
-  // Make a copy -- rl_parse_and_bind() modifies its argument
-  BigStr* copy = StrFromC(s->data(), len(s));
+  // Make a copy -- rl_parse_and_bind() modifies its argument.  Not with
+  // StrFromC(), which returns a shared global for a one-byte string.
+  int n = len(s);
+  BigStr* copy = NewStr(n);
+  memcpy(copy->data(), s->data(), n);
   rl_parse_and_bind(copy->data());
 #else
   assert(0);  // not implemented
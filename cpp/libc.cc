@@ -7,10 +7,15 @@
 #include <glob.h>
 #include <locale.h>
 #include <regex.h>
+#include <string.h>  // memcpy()
 #include <sys/ioctl.h>
 #include <unistd.h>  // gethostname()
 #include <wchar.h>
 
+#include <vector>
+
+#include "cpp/regex_cache.h"
+
 namespace libc {
 
 BigStr* gethostname() {
@@ -103,17 +108,45 @@ List<BigStr*>* glob(BigStr* pat) {
   return matches;
 }
 
+List<Tuple2<BigStr*, int>*>* listdir_kinds(BigStr* path) {
+  DIR* dirp = opendir(path->data_);
+  if (dirp == nullptr) {
+    throw Alloc<OSError>(errno);
+  }
+  int dir_fd = dirfd(dirp);
+
+  auto entries = NewList<Tuple2<BigStr*, int>*>();
+  while (true) {
+    errno = 0;
+    struct dirent* ep = readdir(dirp);
+    if (ep == nullptr) {
+      if (errno != 0) {
+        int err_num = errno;
+        closedir(dirp);
+        throw Alloc<OSError>(err_num);
+      }
+      break;  // no more entries
+    }
+    if (DirentIsDots(ep)) {
+      continue;
+    }
+    int kind = DirentKind(dir_fd, ep);
+    entries->append(
+        Alloc<Tuple2<BigStr*, int>>(StrFromC(ep->d_name), kind));
+  }
+  closedir(dirp);
+
+  return entries;
+}
+
 // Raises RuntimeError if the pattern is invalid.  TODO: Use a different
 // exception?
 List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
                         int pos) {
   cflags |= REG_EXTENDED;
-  regex_t pat;
-  int status = regcomp(&pat, pattern->data_, cflags);
-  if (status != 0) {
-    char error_desc[50];
-    regerror(status, &pat, error_desc, 50);
-
+  char error_desc[50];
+  regex_t* pat = regex_cache_get(pattern->data_, cflags, error_desc, 50);
+  if (pat == nullptr) {
     char error_message[80];
     snprintf(error_message, 80, "Invalid regex %s (%s)", pattern->data_,
              error_desc);
@@ -121,7 +154,7 @@ List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
     throw Alloc<ValueError>(StrFromC(error_message));
   }
 
-  int num_groups = pat.re_nsub + 1;  // number of captures
+  int num_groups = pat->re_nsub + 1;  // number of captures
 
   List<int>* indices = NewList<int>();
   indices->reserve(num_groups * 2);
@@ -129,7 +162,7 @@ List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
   const char* s = str->data_;
   regmatch_t* pmatch =
       static_cast<regmatch_t*>(malloc(sizeof(regmatch_t) * num_groups));
-  bool match = regexec(&pat, s + pos, num_groups, pmatch, eflags) == 0;
+  bool match = regexec(pat, s + pos, num_groups, pmatch, eflags) == 0;
   if (match) {
     int i;
     for (i = 0; i < num_groups; i++) {
@@ -148,7 +181,6 @@ List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
   }
 
   free(pmatch);
-  regfree(&pat);
 
   if (!match) {
     return nullptr;
@@ -167,20 +199,19 @@ const int NMATCH = 2;
 // Odd: This a Tuple2* not Tuple2 because it's Optional[Tuple2]!
 Tuple2<int, int>* regex_first_group_match(BigStr* pattern, BigStr* str,
                                           int pos) {
-  regex_t pat;
   regmatch_t m[NMATCH];
 
   // Could have been checked by regex_parse for [[ =~ ]], but not for glob
   // patterns like ${foo/x*/y}.
 
-  if (regcomp(&pat, pattern->data_, REG_EXTENDED) != 0) {
+  regex_t* pat = regex_cache_get(pattern->data_, REG_EXTENDED, nullptr, 0);
+  if (pat == nullptr) {
     throw Alloc<RuntimeError>(
         StrFromC("Invalid regex syntax (func_regex_first_group_match)"));
   }
 
   // Match at offset 'pos'
-  int result = regexec(&pat, str->data_ + pos, NMATCH, m, 0 /*flags*/);
-  regfree(&pat);
+  int result = regexec(pat, str->data_ + pos, NMATCH, m, 0 /*flags*/);
 
   if (result != 0) {
     return nullptr;
@@ -194,6 +225,76 @@ Tuple2<int, int>* regex_first_group_match(BigStr* pattern, BigStr* str,
   return tup;
 }
 
+BigStr* regex_replace_all(BigStr* pattern, BigStr* str, BigStr* replace_str) {
+  regex_t* pat = regex_cache_get(pattern->data_, REG_EXTENDED, nullptr, 0);
+  if (pat == nullptr) {
+    throw Alloc<RuntimeError>(
+        StrFromC("Invalid regex syntax (func_regex_replace_all)"));
+  }
+
+  // Record (start, end) pairs, so we can allocate the result once
+  std::vector<int> spans;
+
+  const char* s = str->data_;
+  int str_len = len(str);
+  regmatch_t m[1];
+  int pos = 0;
+  while (pos < str_len) {  // prevents infinite loop in the (.*) case
+    if (regexec(pat, s + pos, 1, m, 0 /*flags*/) != 0) {
+      break;
+    }
+    int start = pos + m[0].rm_so;
+    int end = pos + m[0].rm_eo;
+    spans.push_back(start);
+    spans.push_back(end);
+
+    // An empty match would loop forever, so step over one byte
+    pos = (end == pos) ? end + 1 : end;
+  }
+
+  if (spans.empty()) {
+    return str;
+  }
+
+  int replace_len = len(replace_str);
+  int num_matches = spans.size() / 2;
+  int result_len = str_len;
+  for (int i = 0; i < num_matches; ++i) {
+    result_len += replace_len - (spans[2 * i + 1] - spans[2 * i]);
+  }
+
+  BigStr* result = NewStr(result_len);
+  char* out = result->data_;
+  int prev_end = 0;
+  for (int i = 0; i < num_matches; ++i) {
+    int start = spans[2 * i];
+    memcpy(out, s + prev_end, start - prev_end);
+    out += start - prev_end;
+    memcpy(out, replace_str->data_, replace_len);
+    out += replace_len;
+    prev_end = spans[2 * i + 1];
+  }
+  memcpy(out, s + prev_end, str_len - prev_end);
+
+  return result;
+}
+
+List<int>* regex_cache_stats() {
+  RegexCacheStats stats;
+  ::regex_cache_stats(&stats);
+
+  List<int>* result = NewList<int>();
+  result->append(stats.num_hits);
+  result->append(stats.num_misses);
+  result->append(stats.num_evictions);
+  result->append(stats.num_entries);
+  return result;
+}
+
+void regex_cache_clear() {
+  ::regex_cache_clear();
+}
+
 int wcswidth(BigStr* s) {
   // Behavior of mbstowcs() depends on LC_CTYPE
 
@@ -5,6 +5,7 @@
 
 #include <stdlib.h>
 
+#include "cpp/libc_dirent.h"  // DIRENT_DIR in osh/glob_.py
 #include "mycpp/runtime.h"
 
 namespace libc {
@@ -24,12 +25,21 @@ int fnmatch(BigStr* pat, BigStr* str, int flags = 0);
 
 List<BigStr*>* glob(BigStr* pat);
 
+// (name, kind) for each entry of a directory, except . and ..
+List<Tuple2<BigStr*, int>*>* listdir_kinds(BigStr* path);
+
 Tuple2<int, int>* regex_first_group_match(BigStr* pattern, BigStr* str,
                                           int pos);
 
 List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
                         int pos = 0);
 
+BigStr* regex_replace_all(BigStr* pattern, BigStr* str, BigStr* replace_str);
+
+// [num_hits, num_misses, num_evictions, num_entries]
+List<int>* regex_cache_stats();
+void regex_cache_clear();
+
 int wcswidth(BigStr* str);
 int get_terminal_width();
 
@@ -0,0 +1,53 @@
+#ifndef LIBC_DIRENT_H
+#define LIBC_DIRENT_H
+
+// Classify directory entries for libc.listdir_kinds(), which the glob engine
+// in osh/glob_.py uses to walk directories.
+//
+// This header is shared between cpp/ and pyext/.
+//
+// d_type from readdir() usually says whether an entry is a directory, so we
+// don't need to stat() each one.  Symlinks are reported as such, and the
+// caller stat()s them only if it needs to descend into them.
+
+#include <dirent.h>
+#include <fcntl.h>  // AT_SYMLINK_NOFOLLOW
+#include <sys/stat.h>
+
+#define DIRENT_OTHER 0
+#define DIRENT_DIR 1
+#define DIRENT_SYMLINK 2
+
+static inline int DirentKind(int dir_fd, struct dirent* ep) {
+  switch (ep->d_type) {
+  case DT_DIR:
+    return DIRENT_DIR;
+  case DT_LNK:
+    return DIRENT_SYMLINK;
+  case DT_UNKNOWN: {
+    // Some file systems don't fill in d_type
+    struct stat st;
+    if (fstatat(dir_fd, ep->d_name, &st, AT_SYMLINK_NOFOLLOW) != 0) {
+      return DIRENT_OTHER;
+    }
+    if (S_ISDIR(st.st_mode)) {
+      return DIRENT_DIR;
+    }
+    if (S_ISLNK(st.st_mode)) {
+      return DIRENT_SYMLINK;
+    }
+    return DIRENT_OTHER;
+  }
+  default:
+    return DIRENT_OTHER;
+  }
+}
+
+// Is this the . or .. entry?
+static inline int DirentIsDots(struct dirent* ep) {
+  const char* name = ep->d_name;
+  return name[0] == '.' &&
+         (name[1] == '\0' || (name[1] == '.' && name[2] == '\0'));
+}
+
+#endif  // LIBC_DIRENT_H
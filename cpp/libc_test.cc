@@ -121,6 +121,72 @@ TEST regex_test() {
   PASS();
 }
 
+TEST regex_replace_all_test() {
+  BigStr* s = StrFromC("oXooXoooX");
+  BigStr* result =
+      libc::regex_replace_all(StrFromC("(X.)"), s, StrFromC("_"));
+  ASSERT(str_equals(StrFromC("o_o_ooX"), result));
+
+  result = libc::regex_replace_all(StrFromC("(X.)"), s, StrFromC("ABC"));
+  ASSERT(str_equals(StrFromC("oABCoABCooX"), result));
+
+  result = libc::regex_replace_all(StrFromC("(z)"), s, StrFromC("_"));
+  ASSERT(str_equals(s, result));
+
+  // Empty matches don't loop forever
+  result =
+      libc::regex_replace_all(StrFromC("(z*)"), StrFromC("abc"), StrFromC("-"));
+  ASSERT(str_equals(StrFromC("-a-b-c"), result));
+
+  PASS();
+}
+
+TEST regex_cache_test() {
+  libc::regex_cache_clear();
+
+  BigStr* s = StrFromC("oXooXoooXoX");
+  for (int i = 0; i < 3; ++i) {
+    Tuple2<int, int>* result =
+        libc::regex_first_group_match(StrFromC("(X.)"), s, 0);
+    ASSERT_EQ_FMT(1, result->at0(), "%d");
+    ASSERT_EQ_FMT(3, result->at1(), "%d");
+  }
+
+  List<int>* stats = libc::regex_cache_stats();
+  ASSERT_EQ_FMT(2, stats->at(0), "%d");  // hits
+  ASSERT_EQ_FMT(1, stats->at(1), "%d");  // misses
+  ASSERT_EQ_FMT(0, stats->at(2), "%d");  // evictions
+  ASSERT_EQ_FMT(1, stats->at(3), "%d");  // entries
+
+  // Different flags means a different entry
+  List<int>* indices =
+      libc::regex_search(StrFromC("x"), REG_ICASE, StrFromC("X"), 0);
+  ASSERT(indices != nullptr);
+  indices = libc::regex_search(StrFromC("x"), 0, StrFromC("X"), 0);
+  ASSERT_EQ(nullptr, indices);
+
+  stats = libc::regex_cache_stats();
+  ASSERT_EQ_FMT(3, stats->at(1), "%d");
+  ASSERT_EQ_FMT(3, stats->at(3), "%d");
+
+  // Overflow the cache
+  char buf[20];
+  for (int i = 0; i < 1000; ++i) {
+    snprintf(buf, sizeof(buf), "^%d$", i);
+    indices = libc::regex_search(StrFromC(buf), 0, str(i), 0);
+    ASSERT(indices != nullptr);
+  }
+  stats = libc::regex_cache_stats();
+  ASSERT_EQ_FMT(1003, stats->at(1), "%d");
+  ASSERT_EQ_FMT(1003 - stats->at(3), stats->at(2), "%d");
+
+  libc::regex_cache_clear();
+  stats = libc::regex_cache_stats();
+  ASSERT_EQ_FMT(0, stats->at(3), "%d");
+
+  PASS();
+}
+
 TEST libc_glob_test() {
   // This depends on the file system
   auto files = libc::glob(StrFromC("*.testdata"));
@@ -135,6 +201,31 @@ TEST libc_glob_test() {
   PASS();
 }
 
+TEST listdir_kinds_test() {
+  auto entries = libc::listdir_kinds(StrFromC("cpp"));
+  bool found = false;
+  for (int i = 0; i < len(entries); ++i) {
+    Tuple2<BigStr*, int>* entry = entries->at(i);
+    ASSERT(!str_equals0(".", entry->at0()));
+    ASSERT(!str_equals0("..", entry->at0()));
+    if (str_equals0("libc.cc", entry->at0())) {
+      ASSERT_EQ(DIRENT_OTHER, entry->at1());
+      found = true;
+    }
+  }
+  ASSERT(found);
+
+  bool caught = false;
+  try {
+    libc::listdir_kinds(StrFromC("_nonexistent_"));
+  } catch (IOError_OSError* e) {
+    caught = true;
+  }
+  ASSERT(caught);
+
+  PASS();
+}
+
 TEST for_test_coverage() {
   // Sometimes we're not connected to a terminal
   try {
@@ -259,7 +350,10 @@ int main(int argc, char** argv) {
   RUN_TEST(realpath_test);
   RUN_TEST(libc_test);
   RUN_TEST(regex_test);
+  RUN_TEST(regex_replace_all_test);
+  RUN_TEST(regex_cache_test);
   RUN_TEST(libc_glob_test);
+  RUN_TEST(listdir_kinds_test);
   RUN_TEST(for_test_coverage);
 
   RUN_TEST(regex_unanchored);
@@ -23,6 +23,7 @@
 #include "_gen/ysh/grammar_nt.h"
 #include "cpp/core.h"
 #include "cpp/data_lang.h"
+#include "cpp/data_lang_read.h"
 #include "cpp/fanos.h"
 #include "cpp/frontend_flag_spec.h"
 #include "cpp/frontend_match.h"
@@ -0,0 +1,170 @@
+#include "cpp/regex_cache.h"
+
+#include <stdlib.h>  // malloc(), free()
+#include <string.h>  // strcmp(), strlen(), memcpy()
+
+// Must be a power of 2, and larger than REGEX_CACHE_SIZE so chains are short
+#define NUM_BUCKETS 512
+
+struct Entry {
+  char* pattern;  // owned; malloc()'d
+  int cflags;
+  unsigned int hash;
+  regex_t compiled;
+
+  struct Entry* next_in_bucket;
+
+  // Doubly linked list in LRU order.  The head is the most recently used.
+  struct Entry* lru_prev;
+  struct Entry* lru_next;
+};
+
+// All entries are allocated up front; they're reused on eviction.
+static struct Entry gEntries[REGEX_CACHE_SIZE];
+static struct Entry* gBuckets[NUM_BUCKETS];
+
+static struct Entry* gLruHead = NULL;
+static struct Entry* gLruTail = NULL;
+
+static struct RegexCacheStats gStats = {0, 0, 0, 0};
+
+// FNV-1a, with the flags mixed in
+static unsigned int HashKey(const char* pattern, int cflags) {
+  unsigned int h = 2166136261u;
+  const unsigned char* p = (const unsigned char*)pattern;
+  for (; *p; ++p) {
+    h ^= *p;
+    h *= 16777619u;
+  }
+  h ^= (unsigned int)cflags;
+  h *= 16777619u;
+  return h;
+}
+
+static void LruUnlink(struct Entry* e) {
+  if (e->lru_prev) {
+    e->lru_prev->lru_next = e->lru_next;
+  } else {
+    gLruHead = e->lru_next;
+  }
+  if (e->lru_next) {
+    e->lru_next->lru_prev = e->lru_prev;
+  } else {
+    gLruTail = e->lru_prev;
+  }
+  e->lru_prev = NULL;
+  e->lru_next = NULL;
+}
+
+static void LruPushFront(struct Entry* e) {
+  e->lru_prev = NULL;
+  e->lru_next = gLruHead;
+  if (gLruHead) {
+    gLruHead->lru_prev = e;
+  } else {
+    gLruTail = e;
+  }
+  gLruHead = e;
+}
+
+static void BucketRemove(struct Entry* e) {
+  struct Entry** link = &gBuckets[e->hash & (NUM_BUCKETS - 1)];
+  while (*link != e) {
+    link = &(*link)->next_in_bucket;
+  }
+  *link = e->next_in_bucket;
+  e->next_in_bucket = NULL;
+}
+
+// Release the regex and pattern, but leave the slot in place
+static void EntryFree(struct Entry* e) {
+  regfree(&e->compiled);
+  free(e->pattern);
+  e->pattern = NULL;
+}
+
+regex_t* regex_cache_get(const char* pattern, int cflags, char* err_buf,
+                         int err_len) {
+  unsigned int h = HashKey(pattern, cflags);
+  struct Entry** bucket = &gBuckets[h & (NUM_BUCKETS - 1)];
+
+  struct Entry* e;
+  for (e = *bucket; e; e = e->next_in_bucket) {
+    if (e->hash == h && e->cflags == cflags &&
+        strcmp(e->pattern, pattern) == 0) {
+      gStats.num_hits++;
+      if (e != gLruHead) {
+        LruUnlink(e);
+        LruPushFront(e);
+      }
+      return &e->compiled;
+    }
+  }
+
+  gStats.num_misses++;
+
+  // Compile into a temporary first, so errors don't disturb the cache
+  regex_t compiled;
+  int status = regcomp(&compiled, pattern, cflags);
+  if (status != 0) {
+    if (err_buf) {
+      regerror(status, &compiled, err_buf, err_len);
+    }
+    return NULL;
+  }
+
+  size_t n = strlen(pattern);
+  char* pattern_copy = (char*)malloc(n + 1);
+  if (pattern_copy == NULL) {
+    regfree(&compiled);
+    if (err_buf) {
+      strncpy(err_buf, "out of memory", err_len);
+      err_buf[err_len - 1] = '\0';
+    }
+    return NULL;
+  }
+  memcpy(pattern_copy, pattern, n + 1);
+
+  if (gStats.num_entries < REGEX_CACHE_SIZE) {
+    e = &gEntries[gStats.num_entries];
+    gStats.num_entries++;
+  } else {
+    // Evict the least recently used entry, and reuse its slot
+    e = gLruTail;
+    LruUnlink(e);
+    BucketRemove(e);
+    EntryFree(e);
+    gStats.num_evictions++;
+  }
+
+  e->pattern = pattern_copy;
+  e->cflags = cflags;
+  e->hash = h;
+  e->compiled = compiled;
+
+  e->next_in_bucket = *bucket;
+  *bucket = e;
+  LruPushFront(e);
+
+  return &e->compiled;
+}
+
+void regex_cache_stats(struct RegexCacheStats* stats_out) {
+  *stats_out = gStats;
+}
+
+void regex_cache_clear(void) {
+  int i;
+  for (i = 0; i < gStats.num_entries; ++i) {
+    EntryFree(&gEntries[i]);
+  }
+  memset(gEntries, 0, sizeof(gEntries));
+  memset(gBuckets, 0, sizeof(gBuckets));
+  gLruHead = NULL;
+  gLruTail = NULL;
+
+  gStats.num_hits = 0;
+  gStats.num_misses = 0;
+  gStats.num_evictions = 0;
+  gStats.num_entries = 0;
+}
@@ -0,0 +1,40 @@
+#ifndef REGEX_CACHE_H
+#define REGEX_CACHE_H
+
+// A bounded LRU cache of compiled POSIX regexes, keyed by (pattern, cflags).
+//
+// This library is shared between cpp/ and pyext/.
+//
+// Shell scripts tend to match the same few patterns over and over, e.g. in
+// [[ $x =~ $re ]] within a loop, or ${x//pat/rep} which matches repeatedly at
+// increasing offsets.  regcomp() dominates those workloads, so we keep the
+// compiled regex_t around.
+
+#include <regex.h>
+
+// Maximum number of compiled regexes that are kept alive.  When it's full, the
+// least recently used entry is evicted with regfree().
+#define REGEX_CACHE_SIZE 256
+
+struct RegexCacheStats {
+  int num_hits;
+  int num_misses;
+  int num_evictions;
+  int num_entries;  // currently in the cache
+};
+
+// Return a compiled regex for the given pattern and flags.  The cache owns
+// the result: the caller must NOT call regfree() on it, and must not use it
+// after another call to regex_cache_get(), which may evict it.
+//
+// On a regcomp() error, returns NULL, and writes regerror() output to err_buf
+// if it's non-NULL.  Invalid patterns aren't cached.
+regex_t* regex_cache_get(const char* pattern, int cflags, char* err_buf,
+                         int err_len);
+
+void regex_cache_stats(struct RegexCacheStats* stats_out);
+
+// Free all entries, and reset stats.  Used by tests.
+void regex_cache_clear(void);
+
+#endif  // REGEX_CACHE_H
@@ -4,6 +4,7 @@
 #define LEAKY_STDLIB_H
 
 #include <errno.h>
+#include <stdio.h>  // rename()
 #include <sys/types.h>  // mode_t
 #include <unistd.h>
 
@@ -108,6 +109,18 @@ inline void write(int fd, BigStr* s) {
   }
 }
 
+inline void rename(BigStr* old_path, BigStr* new_path) {
+  if (::rename(old_path->data_, new_path->data_) < 0) {
+    throw Alloc<OSError>(errno);
+  }
+}
+
+inline void unlink(BigStr* path) {
+  if (::unlink(path->data_) < 0) {
+    throw Alloc<OSError>(errno);
+  }
+}
+
 inline void setpgid(pid_t pid, pid_t pgid) {
   int ret = ::setpgid(pid, pgid);
   if (ret < 0) {
@@ -1,6 +1,7 @@
 #include "cpp/stdlib.h"
 
 #include <errno.h>
+#include <fcntl.h>  // O_CREAT
 #include <sys/stat.h>
 
 #include "mycpp/gc_builtins.h"
@@ -66,6 +67,32 @@ TEST open_test() {
   PASS();
 }
 
+TEST rename_unlink_test() {
+  BigStr* path = StrFromC("_tmp/stdlib_test_rename");
+  BigStr* path2 = StrFromC("_tmp/stdlib_test_rename2");
+
+  int fd = posix::open(path, O_CREAT | O_WRONLY | O_TRUNC, 0644);
+  posix::write(fd, StrFromC("hi"));
+  posix::close(fd);
+
+  posix::rename(path, path2);
+  ASSERT_EQ(false, posix::access(path, R_OK));
+  ASSERT_EQ(true, posix::access(path2, R_OK));
+
+  posix::unlink(path2);
+  ASSERT_EQ(false, posix::access(path2, R_OK));
+
+  int ec = -1;
+  try {
+    posix::unlink(path2);
+  } catch (IOError_OSError* e) {
+    ec = e->errno_;
+  }
+  ASSERT_EQ(ENOENT, ec);
+
+  PASS();
+}
+
 TEST time_test() {
   int ts = time_::time();
   log("ts = %d", ts);
@@ -145,6 +172,7 @@ int main(int argc, char** argv) {
   RUN_TEST(posix_test);
   RUN_TEST(putenv_test);
   RUN_TEST(open_test);
+  RUN_TEST(rename_unlink_test);
   RUN_TEST(time_test);
   RUN_TEST(mtime_demo);
   RUN_TEST(listdir_test);
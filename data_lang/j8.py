@@ -38,6 +38,7 @@ from _devbuild.gen.value_asdl import (value, value_e, value_t, value_str)
 from _devbuild.gen.nil8_asdl import (nvalue, nvalue_t)
 
 from asdl import format as fmt
+from core import bash_array
 from core import error
 from data_lang import pyj8
 # dependency issue: consts.py pulls in frontend/option_def.py
@@ -427,7 +428,7 @@ class InstancePrinter(object):
 
                 self.buf.write('[')
                 self._MaybeNewline()
-                for i, s in enumerate(val.strs):
+                for i, s in enumerate(bash_array.GetDenseStrs(val)):
                     if i != 0:
                         self.buf.write(',')
                         self._MaybeNewline()
@@ -98,6 +98,7 @@ from _devbuild.gen.pretty_asdl import doc, doc_e, DocFragment, Measure, Measured
 from _devbuild.gen.value_asdl import value, value_e, value_t, value_str
 from data_lang.j8 import ValueIdString, HeapValueId
 from core import ansi
+from core import bash_array
 from frontend import match
 from mycpp import mops
 from mycpp.mylib import log, tagswitch, BufWriter, iteritems
@@ -479,14 +480,25 @@ class _DocConstructor:
     def _BashArray(self, varray):
         # type: (value.BashArray) -> MeasuredDoc
         type_name = self._Styled(self.type_style, _Text("BashArray"))
-        if len(varray.strs) == 0:
+        if bash_array.IsEmpty(varray):
             return _Concat([_Text("("), type_name, _Text(")")])
         mdocs = []  # type: List[MeasuredDoc]
-        for s in varray.strs:
-            if s is None:
-                mdocs.append(_Text("null"))
-            else:
-                mdocs.append(self._BashStringLiteral(s))
+        if bash_array.IsSparse(varray):
+            # Like BashAssoc, instead of a null for every hole
+            keys = bash_array.GetKeys(varray)
+            values = bash_array.GetValues(varray)
+            for k in xrange(len(keys)):
+                mdocs.append(
+                    _Concat([
+                        _Text("[%d]=" % keys[k]),
+                        self._BashStringLiteral(values[k])
+                    ]))
+        else:
+            for s in bash_array.GetDenseStrs(varray):
+                if s is None:
+                    mdocs.append(_Text("null"))
+                else:
+                    mdocs.append(self._BashStringLiteral(s))
         return self._SurroundedAndPrefixed("(", type_name, " ",
                                            self._Join(mdocs, "", " "), ")")
 
@@ -533,13 +545,18 @@ class _DocConstructor:
 
             elif case(value_e.Range):
                 r = cast(value.Range, val)
-                return self._Styled(
-                    self.number_style,
-                    _Concat([
-                        _Text(str(r.lower)),
-                        _Text(" .. "),
-                        _Text(str(r.upper))
-                    ]))
+                parts = [
+                    _Text(mops.ToStr(r.lower)),
+                    _Text(" .. "),
+                    _Text(mops.ToStr(r.upper))
+                ]  # type: List[MeasuredDoc]
+                if not mops.Equal(r.step, mops.ONE):
+                    # The syntax that creates it, like (0 .. 10) => step(3)
+                    parts.insert(0, _Text("("))
+                    parts.append(_Text(") => step("))
+                    parts.append(_Text(mops.ToStr(r.step)))
+                    parts.append(_Text(")"))
+                return self._Styled(self.number_style, _Concat(parts))
 
             elif case(value_e.List):
                 vlist = cast(value.List, val)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python2
+"""
+pyj8_read.py - Decode a J8 or JSON document from a file descriptor
+
+The C++ version in cpp/data_lang_read.cc reads the descriptor in chunks, and
+decodes straight into value_t, without the tokens and intermediate strings of
+j8.Parser.  This version is the reference: it reads everything, then calls
+j8.Parser.
+"""
+from __future__ import print_function
+
+from _devbuild.gen.value_asdl import value_t
+from core import pyos
+from data_lang import j8
+from mycpp.mylib import log
+
+_ = log
+
+
+def ReadValue(fd, prefix, is_j8):
+    # type: (int, str, bool) -> value_t
+    """Read fd until EOF, and decode it as a single value.
+
+    prefix: bytes that were already read from fd, e.g. by StdinBuffer
+
+    Raises error.Decode, or pyos.ReadError.
+    """
+    s, err_num = pyos.ReadAll(fd, prefix, False)
+    if err_num != 0:
+        raise pyos.ReadError(err_num)
+
+    p = j8.Parser(s, is_j8)
+    return p.ParseValue()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python2
+from __future__ import print_function
+
+import os
+import unittest
+
+from _devbuild.gen.value_asdl import value_e
+from core import error
+from core import pyos
+from data_lang import pyj8_read
+
+
+def _Read(prefix, s, is_j8=True):
+    r, w = os.pipe()
+    os.write(w, s)
+    os.close(w)
+    try:
+        return pyj8_read.ReadValue(r, prefix, is_j8)
+    finally:
+        os.close(r)
+
+
+class PyJ8ReadTest(unittest.TestCase):
+
+    def testReadValue(self):
+        val = _Read('[1, "a', 'b", 3]')
+        self.assertEqual(value_e.List, val.tag())
+        self.assertEqual(3, len(val.items))
+        self.assertEqual('ab', val.items[1].s)
+
+        val = _Read('', "# comment\n'x'")
+        self.assertEqual('x', val.s)
+
+    def testErrors(self):
+        self.assertRaises(error.Decode, _Read, '', "# comment\n42", False)
+        self.assertRaises(error.Decode, _Read, '', '[1, 2')
+        self.assertRaises(error.Decode, _Read, '', '1 2')
+
+        self.assertRaises(pyos.ReadError, pyj8_read.ReadValue, -1, '', True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -168,7 +168,8 @@ def NinjaGraph(ru):
             # Hm it did not create a problem?  I guess only cc_library() deps
             # can't be circular?
             '//core/value.asdl',
-        ])
+        ],
+        marshal_methods=True)
 
     ru.cc_binary('frontend/syntax_asdl_test.cc',
                  deps=['//frontend/syntax.asdl'],
@@ -48,6 +48,11 @@ TEST pointer_test() {
     ASSERT(str_equals(StrFromC("hi %s"), m->v));
   }
 
+  // Unset string flags are nullptr
+  attrs->set(StrFromC("v"), value::Undef);
+  auto m = Alloc<arg_types::printf>(attrs);
+  ASSERT_EQ(nullptr, m->v);
+
   PASS();
 }
 
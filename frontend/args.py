@@ -83,8 +83,10 @@ class _Attributes(object):
     def __init__(self, defaults):
         # type: (Dict[str, value_t]) -> None
 
-        # New style
-        self.attrs = {}  # type: Dict[str, value_t]
+        # New style.  This is the spec's dict of defaults until a flag is set,
+        # so that parsing argv without flags doesn't copy it.
+        self.attrs = defaults
+        self.attrs_copied = False
 
         self.opt_changes = []  # type: List[OptChange]  # -o errexit +o nounset
         self.shopt_changes = [
@@ -92,8 +94,6 @@ class _Attributes(object):
         self.show_options = False  # 'set -o' without an argument
         self.actions = []  # type: List[str]  # for compgen -A
         self.saw_double_dash = False  # for set --
-        for name, v in iteritems(defaults):
-            self.Set(name, v)
 
     def SetTrue(self, name):
         # type: (str) -> None
@@ -102,6 +102,13 @@ class _Attributes(object):
     def Set(self, name, val):
         # type: (str, value_t) -> None
 
+        if not self.attrs_copied:
+            attrs = {}  # type: Dict[str, value_t]
+            for k, v in iteritems(self.attrs):
+                attrs[k] = v
+            self.attrs = attrs
+            self.attrs_copied = True
+
         # debug-completion -> debug_completion
         name = name.replace('-', '_')
         self.attrs[name] = val
@@ -11,6 +11,7 @@ from _devbuild.gen.value_asdl import value
 from core import error
 from frontend import flag_spec
 from frontend import args  # module under test
+from mycpp import mops
 
 from typing import Tuple
 
@@ -170,6 +171,25 @@ class ArgsTest(unittest.TestCase):
         self.assertEqual('+', arg.attrs['r'].s)
         self.assertEqual('+', arg.attrs['x'].s)
 
+    def testDefaultsShared(self):
+        s = flag_spec._FlagSpec()
+        s.ShortFlag('-f')
+        s.LongFlag('--num-bytes', args.Int)
+
+        # Stored under the attribute name
+        self.assertEqual(-1, mops.BigTruncate(s.defaults['num_bytes'].i))
+
+        # Without flags, the defaults aren't copied
+        arg, i = _ParseCmdVal(s, _MakeBuiltinArgv(['foo']))
+        self.assertIs(s.defaults, arg.attrs)
+
+        # Setting a flag copies them, leaving the spec alone
+        arg, i = _ParseCmdVal(s, _MakeBuiltinArgv(['-f', '--num-bytes', '3']))
+        self.assertEqual(True, arg.attrs['f'].b)
+        self.assertEqual(3, mops.BigTruncate(arg.attrs['num_bytes'].i))
+        self.assertEqual(False, s.defaults['f'].b)
+        self.assertEqual(-1, mops.BigTruncate(s.defaults['num_bytes'].i))
+
     def testReadFlagSpec(self):
         s = flag_spec._FlagSpec()
         s.ShortFlag('-r')  # no backslash escapes
@@ -533,4 +533,13 @@ JSON_WRITE_SPEC.LongFlag('--indent',
                          default=2,
                          help='Indent JSON by this amount')
 
+JSON_WRITE_SPEC.LongFlag('--lines',
+                         args.Bool,
+                         default=False,
+                         help='Write each item of a List on its own line')
+
 JSON_READ_SPEC = FlagSpec('json_read')
+JSON_READ_SPEC.LongFlag('--lines',
+                        args.Bool,
+                        default=False,
+                        help='Read one record per line, until EOF')
@@ -2,6 +2,7 @@
 """Flag_gen.py."""
 from __future__ import print_function
 
+import cStringIO
 import itertools
 import sys
 
@@ -190,6 +191,9 @@ using value_asdl::value_e;
 
 namespace arg_types {
 """)
+    flag_names = set()  # every field name, for GLOBAL_STR() keys
+    ctor_f = cStringIO.StringIO()  # constructors of the classes
+
     for spec_name in sorted(specs):
         spec = specs[spec_name]
 
@@ -208,26 +212,21 @@ namespace arg_types {
             typ = spec.fields[field_name]
             field_name = field_name.replace('-', '_')
             field_names.append(field_name)
+            flag_names.add(field_name)
+
+            # The GLOBAL_STR() key means that no strings are allocated
+            lookup = 'attrs->at(kFlag_%s)' % field_name
 
             with switch(typ) as case:
                 if case(flag_type_e.Bool):
-                    init_vals.append(
-                        'static_cast<value::Bool*>(attrs->at(StrFromC("%s")))->b'
-                        % field_name)
+                    init_vals.append('_Bool(%s)' % lookup)
                     field_decls.append('bool %s;' % field_name)
 
                     # Bug that test should find
                     #bits.append('maskbit(offsetof(%s, %s))' % (spec_name, field_name))
 
                 elif case(flag_type_e.Str):
-                    # TODO: This code is ugly and inefficient!  Generate something
-                    # better.  At least get rid of 'new' everywhere?
-                    init_vals.append('''\
-attrs->at(StrFromC("%s"))->tag() == value_e::Undef
-          ? nullptr
-          : static_cast<value::Str*>(attrs->at(StrFromC("%s")))->s''' %
-                                     (field_name, field_name))
-
+                    init_vals.append('_Str(%s)' % lookup)
                     field_decls.append('BigStr* %s;' % field_name)
 
                     # BigStr* is a pointer type, so add a field here
@@ -235,19 +234,11 @@ attrs->at(StrFromC("%s"))->tag() == value_e::Undef
                                 (spec_name, field_name))
 
                 elif case(flag_type_e.Int):
-                    init_vals.append('''\
-attrs->at(StrFromC("%s"))->tag() == value_e::Undef
-          ? -1
-          : static_cast<value::Int*>(attrs->at(StrFromC("%s")))->i''' %
-                                     (field_name, field_name))
+                    init_vals.append('_Int(%s)' % lookup)
                     field_decls.append('int %s;' % field_name)
 
                 elif case(flag_type_e.Float):
-                    init_vals.append('''\
-attrs->at(StrFromC("%s"))->tag() == value_e::Undef
-          ? -1
-          : static_cast<value::Float*>(attrs->at(StrFromC("%s")))->f''' %
-                                     (field_name, field_name))
+                    init_vals.append('_Float(%s)' % lookup)
                     field_decls.append('float %s;' % field_name)
 
                 else:
@@ -267,17 +258,22 @@ attrs->at(StrFromC("%s"))->tag() == value_e::Undef
         header_f.write("""
 class %s {
  public:
-  %s(Dict<BigStr*, value_asdl::value_t*>* attrs)""" % (spec_name, spec_name))
-
-        if field_names:
-            header_f.write('\n      : ')
-            for i, field_name in enumerate(field_names):
-                if i != 0:
-                    header_f.write(',\n        ')
-                header_f.write('%s(%s)' % (field_name, init_vals[i]))
-        header_f.write(' {\n')
-        header_f.write('  }\n')
-        header_f.write('\n')
+  explicit %s(Dict<BigStr*, value_asdl::value_t*>* attrs);
+
+""" % (spec_name, spec_name))
+
+        # Defined in arg_types.cc, after the GLOBAL_STR() keys
+        ctor_f.write('%s::%s(Dict<BigStr*, value_asdl::value_t*>* attrs)' %
+                     (spec_name, spec_name))
+        for i, field_name in enumerate(field_names):
+            if i == 0:
+                ctor_f.write('\n    : ')
+            else:
+                ctor_f.write(',\n      ')
+            ctor_f.write('%s(%s)' % (field_name, init_vals[i]))
+        ctor_f.write(' {\n')
+        ctor_f.write('}\n')
+        ctor_f.write('\n')
 
         for decl in field_decls:
             header_f.write('  %s\n' % decl)
@@ -322,6 +318,31 @@ namespace arg_types {
 
 """)
 
+    for name in sorted(flag_names):
+        cc_f.write('GLOBAL_STR(kFlag_%s, "%s");\n' % (name, name))
+    cc_f.write("""
+static inline bool _Bool(value_asdl::value_t* val) {
+  return static_cast<value::Bool*>(val)->b;
+}
+
+static inline BigStr* _Str(value_asdl::value_t* val) {
+  return val->tag() == value_e::Undef ? nullptr
+                                      : static_cast<value::Str*>(val)->s;
+}
+
+static inline int _Int(value_asdl::value_t* val) {
+  return val->tag() == value_e::Undef ? -1
+                                      : static_cast<value::Int*>(val)->i;
+}
+
+static inline float _Float(value_asdl::value_t* val) {
+  return val->tag() == value_e::Undef ? -1
+                                      : static_cast<value::Float*>(val)->f;
+}
+
+""")
+    cc_f.write(ctor_f.getvalue())
+
     var_names = []
     for i, spec_name in enumerate(sorted(flag_spec.FLAG_SPEC)):
         spec = specs[spec_name]
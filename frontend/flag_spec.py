@@ -207,8 +207,11 @@ class _FlagSpec(object):
         else:
             self.actions_long[name] = _MakeAction(arg_type, name)
 
-        self.defaults[name] = _Default(arg_type, arg_default=default)
-        self.fields[name] = typ
+        # The same key that _Attributes.Set() uses, so that _Attributes can
+        # share this dict
+        attr_name = name.replace('-', '_')
+        self.defaults[attr_name] = _Default(arg_type, arg_default=default)
+        self.fields[attr_name] = typ
 
     def PlusFlag(self, char, help=None):
         # type: (str, Optional[str]) -> None
@@ -114,8 +114,9 @@ def LazyStr(tok):
 
     if tok.tval is None:
         if tok.id in (Id.VSub_DollarName, Id.VSub_Number):  # $x or $2
-            # Special case for SimpleVarSub - completion also relies on this
-            tok.tval = TokenSliceLeft(tok, 1)
+            # Special case for SimpleVarSub - completion also relies on this.
+            # Variable names are interned, so lookups compare pointers.
+            tok.tval = intern(TokenSliceLeft(tok, 1))
         else:
             tok.tval = TokenVal(tok)
 
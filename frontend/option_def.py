@@ -213,13 +213,11 @@ _NO_OPS = [
     # through 4.2.
     'direxpand',
     'dirspell',
-    'dotglob',
     'execfail',
     'extdebug',  # for --debugger?
     'extquote',
     'force_fignore',
     'globasciiranges',
-    'globstar',  # TODO:  implement **
     'gnu_errfmt',
     'histreedit',
     'histverify',
@@ -231,7 +229,6 @@ _NO_OPS = [
     'login_shell',
     'mailwarn',
     'no_empty_cmd_completion',
-    'nocaseglob',
     'progcomp_alias',
     'promptvars',
     'restricted_shell',
@@ -277,11 +274,17 @@ def _Init(opt_def):
     # shopt options that aren't in any groups.
     opt_def.Add('failglob')
     opt_def.Add('extglob')
+    opt_def.Add('dotglob')
+    opt_def.Add('globstar')
+    opt_def.Add('nocaseglob')
     opt_def.Add('nocasematch')
 
     # recursive parsing and evaluation - for compatibility, ble.sh, etc.
     opt_def.Add('eval_unsafe_arith')
 
+    # read and mapfile read stdin in blocks, not bytes
+    opt_def.Add('buffered_stdin')
+
     # For implementing strict_errexit
     # TODO: could be _no_command_sub / _no_process_sub, if we had to discourage
     # "default True" options
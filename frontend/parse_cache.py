@@ -0,0 +1,206 @@
+"""
+parse_cache.py - Save the syntax trees of sourced files on disk
+
+With OILS_PARSE_CACHE_DIR set, the 'source' builtin writes the logical lines
+of each file it runs to a cache file.  The next time the file is sourced, we
+decode the lines instead of lexing and parsing them again.
+
+A cache file is used only if the file's path, mtime, and size match, and it
+was written by the same version of Oils.  Each logical line also records the
+parse options it was parsed with.  If they differ when it's about to run,
+e.g. because an earlier line ran 'shopt --set ysh:all', we fall back to the
+parser at that line.
+
+The tokens in the tree point to the same SourceLine and source_t objects as
+a freshly parsed tree, so error messages and $LINENO are identical.
+"""
+from __future__ import print_function
+
+from _devbuild.gen.option_asdl import option_i
+from _devbuild.gen.syntax_asdl import command_t, source_t
+from asdl import runtime
+from core import pyos
+from frontend import consts
+from mycpp.mylib import log
+from pylib import os_path
+
+import posix_ as posix
+from posix_ import O_CREAT, O_RDONLY, O_TRUNC, O_WRONLY
+
+import time as time_  # avoid name conflict
+
+from typing import Dict, List, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from core import state
+
+_ = log
+
+
+def CacheFileName(abs_path):
+    # type: (str) -> str
+    """Flatten an absolute path into a file name, like vim's swap files.
+
+    /home/andy/x.sh -> %home%andy%x.sh
+    """
+    return abs_path.replace('%', '%25').replace('/', '%')
+
+
+class CachedLine(object):
+    """A logical line decoded from a cache file."""
+
+    def __init__(self, start_line, opts_key, node):
+        # type: (int, str, command_t) -> None
+        self.start_line = start_line  # physical line the parser started at
+        self.opts_key = opts_key
+        self.node = node
+
+
+class Recorder(object):
+    """Collects the logical lines of a file as main_loop.Batch() parses it."""
+
+    def __init__(self, cache, abs_path, mtime, size, src):
+        # type: (ParseCache, str, int, int, source_t) -> None
+        self.cache = cache
+        self.abs_path = abs_path
+
+        self.enc = runtime.Encoder()
+        self.enc.Str(cache.version_str)
+        self.enc.Str(abs_path)
+        self.enc.Int(mtime)
+        self.enc.Int(size)
+
+        # Tokens point to SourceLine objects, which point to this src
+        self.enc.External(id(src))
+        self.src = src
+
+        # Keep the nodes alive, so that id() values aren't reused
+        self.nodes = []  # type: List[command_t]
+
+        # Set when the parser reaches the end of the file without an error.
+        # If we stopped early, e.g. with 'return', we can't save the file.
+        self.eof = False
+
+    def AddLine(self, start_line, node):
+        # type: (int, command_t) -> None
+        """Called after a logical line is parsed, and before it runs.
+
+        It has to be marshaled before it runs, because evaluation may mutate
+        the tree.
+        """
+        if not self.cache.AliasesOk():
+            self.enc.ok = False
+        if not self.enc.ok:
+            return
+
+        self.enc.Int(start_line)
+        self.enc.Str(self.cache.OptsKey())
+        node.Marshal(self.enc)
+        self.nodes.append(node)
+
+
+class ParseCache(object):
+
+    def __init__(self, cache_dir, version_str, mutable_opts, aliases):
+        # type: (str, str, state.MutableOpts, Dict[str, str]) -> None
+        self.cache_dir = cache_dir
+        self.version_str = version_str
+        self.mutable_opts = mutable_opts
+        self.aliases = aliases  # shared with ParseContext
+
+    def OptsKey(self):
+        # type: () -> str
+        """The state of all parse options, e.g. '0110...'."""
+        parts = []  # type: List[str]
+        for opt_num in consts.PARSE_OPTION_NUMS:
+            parts.append('1' if self.mutable_opts.Get(opt_num) else '0')
+        return ''.join(parts)
+
+    def AliasesOk(self):
+        # type: () -> bool
+        """Aliases are expanded at parse time, so they invalidate the cache."""
+        return (len(self.aliases) == 0 or
+                not self.mutable_opts.Get(option_i.expand_aliases))
+
+    def CanReuse(self, line):
+        # type: (CachedLine) -> bool
+        """Would the parser produce the same tree for this line now?"""
+        return line.opts_key == self.OptsKey() and self.AliasesOk()
+
+    def _CachePath(self, abs_path):
+        # type: (str) -> str
+        return os_path.join(self.cache_dir, CacheFileName(abs_path))
+
+    def Load(self, abs_path, mtime, size, src):
+        # type: (str, int, int, source_t) -> Optional[List[CachedLine]]
+        """Return the logical lines of a file, or None on a cache miss."""
+        try:
+            fd = posix.open(self._CachePath(abs_path), O_RDONLY, 0)
+        except (IOError, OSError) as e:
+            return None
+
+        blob, err_num = pyos.ReadAll(fd, '', False)
+        posix.close(fd)
+        if err_num != 0:
+            return None
+
+        dec = runtime.Decoder(blob)
+        if (not dec.ok or dec.Str() != self.version_str or
+                dec.Str() != abs_path or dec.Int() != mtime or
+                dec.Int() != size):
+            return None
+        dec.External(src)
+
+        lines = []  # type: List[CachedLine]
+        while dec.ok and not dec.AtEnd():
+            start_line = dec.Int()
+            opts_key = dec.Str()
+            node = command_t.Unmarshal(dec)
+            if node is None or opts_key is None:
+                return None
+            lines.append(CachedLine(start_line, opts_key, node))
+
+        if not dec.ok:
+            return None
+        return lines
+
+    def MakeRecorder(self, abs_path, mtime, size, src):
+        # type: (str, int, int, source_t) -> Optional[Recorder]
+        """Return a Recorder for a file we just missed, or None.
+
+        A file that was modified in the last second could be modified again
+        without changing its mtime or size, so we don't save it.
+        """
+        if mtime >= int(time_.time()) - 1:
+            return None
+        return Recorder(self, abs_path, mtime, size, src)
+
+    def Store(self, recorder):
+        # type: (Recorder) -> None
+        """Write the cache file.  Errors are ignored, like a cache miss."""
+        if not recorder.eof or not recorder.enc.ok:
+            return
+
+        blob = recorder.enc.Serialize()
+
+        # Write to a temp file and rename it, so concurrent shells never read
+        # a partial file
+        path = self._CachePath(recorder.abs_path)
+        tmp_path = '%s.%d' % (path, posix.getpid())
+        try:
+            fd = posix.open(tmp_path, O_CREAT | O_WRONLY | O_TRUNC, 0o644)
+        except (IOError, OSError) as e:
+            return
+
+        err_num = pyos.WriteAll(fd, blob)
+        posix.close(fd)
+        if err_num == 0:
+            try:
+                posix.rename(tmp_path, path)
+                return
+            except (IOError, OSError) as e:
+                pass
+
+        try:
+            posix.unlink(tmp_path)
+        except (IOError, OSError) as e:
+            pass
@@ -0,0 +1,203 @@
+#!/usr/bin/env python2
+"""
+parse_cache_test.py: Tests for parse_cache.py
+"""
+from __future__ import print_function
+
+import re
+import shutil
+import tempfile
+import unittest
+
+from _devbuild.gen.syntax_asdl import command_t, source
+from asdl import format as fmt
+from asdl import runtime
+from core import alloc
+from core import test_lib
+from frontend import parse_cache  # module under test
+from mycpp import mylib
+
+
+def _TreeStr(node):
+    f = mylib.BufWriter()
+    fmt.PrintTree(node.PrettyTree(), fmt.TextOutput(f))
+    # Heap IDs of shared objects differ between the two trees
+    return re.sub('0x[0-9a-f]+', 'ID', f.getvalue())
+
+
+def _ParseLines(code_str):
+    src = source.MainFile('<parse_cache_test>')
+    arena = alloc.Arena()
+    arena.PushSource(src)
+    c_parser = test_lib.InitCommandParser(code_str, arena=arena)
+    nodes = []
+    while True:
+        node = c_parser.ParseLogicalLine()
+        if node is None:
+            break
+        nodes.append(node)
+    return src, nodes
+
+
+CODE = """\
+f() {
+  echo "hi $1" ${x:-default} $((1 + 2)) >&2
+}
+for i in a b; do
+  case $i in a) echo A ;; *) echo other ;; esac
+done
+cat <<EOF
+here $(echo doc) `echo backtick`
+EOF
+[[ $x == *.py ]] && x=(1 2 3) || echo ${#x[@]}
+"""
+
+
+class MarshalTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        src, nodes = _ParseLines(CODE)
+
+        enc = runtime.Encoder()
+        enc.External(id(src))
+        for node in nodes:
+            node.Marshal(enc)
+        self.assertEqual(True, enc.ok)
+
+        dec = runtime.Decoder(enc.Serialize())
+        dec.External(src)
+        decoded = [command_t.Unmarshal(dec) for _ in nodes]
+        self.assertEqual(True, dec.ok)
+        self.assertEqual(True, dec.AtEnd())
+
+        for node, node2 in zip(nodes, decoded):
+            self.assertEqual(_TreeStr(node), _TreeStr(node2))
+
+        # Tokens still point to the external source object
+        tok = decoded[0].name_tok
+        self.assertEqual(1, tok.line.line_num)
+        self.assertTrue(tok.line.src is src)
+
+    def testCorruptInput(self):
+        src, nodes = _ParseLines('echo hi\n')
+
+        enc = runtime.Encoder()
+        enc.External(id(src))
+        nodes[0].Marshal(enc)
+        blob = enc.Serialize()
+
+        # Truncated
+        dec = runtime.Decoder(blob[:-1])
+        self.assertEqual(False, dec.ok)
+
+        # Trailing garbage
+        dec = runtime.Decoder(blob + 'x')
+        self.assertEqual(False, dec.ok)
+
+        # Missing external object
+        dec = runtime.Decoder(blob)
+        command_t.Unmarshal(dec)
+        self.assertEqual(False, dec.ok)
+
+        # Not a command_t
+        enc = runtime.Encoder()
+        enc.Int(99999)
+        dec = runtime.Decoder(enc.Serialize())
+        self.assertEqual(None, command_t.Unmarshal(dec))
+        self.assertEqual(False, dec.ok)
+
+    def testVarints(self):
+        enc = runtime.Encoder()
+        ints = [0, -1, 1, 300, 2**31 - 1, -2**31]
+        for i in ints:
+            enc.Int(i)
+        dec = runtime.Decoder(enc.Serialize())
+        self.assertEqual(True, dec.ok)
+        self.assertEqual(ints, [dec.Int() for _ in ints])
+
+        # Doesn't fit in a 32-bit int
+        enc = runtime.Encoder()
+        enc.Int(2**33)
+        dec = runtime.Decoder(enc.Serialize())
+        self.assertEqual(False, dec.ok)
+
+        # More than 5 bytes
+        dec = runtime.Decoder('\xff\xff\xff\xff\xff\x01')
+        self.assertEqual(False, dec.ok)
+
+
+class _FakeOpts(object):
+
+    def __init__(self):
+        self.on = False
+
+    def Get(self, opt_num):
+        return self.on
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def testCacheFileName(self):
+        self.assertEqual('%home%andy%x.sh',
+                         parse_cache.CacheFileName('/home/andy/x.sh'))
+        self.assertEqual('%a%2525b', parse_cache.CacheFileName('/a%25b'))
+
+    def testStoreAndLoad(self):
+        opts = _FakeOpts()
+        aliases = {}
+        cache = parse_cache.ParseCache(self.cache_dir, '1.0', opts, aliases)
+
+        src, nodes = _ParseLines(CODE)
+
+        rec = cache.MakeRecorder('/a/b.sh', 12345, 99, src)
+        for i, node in enumerate(nodes):
+            rec.AddLine(i + 1, node)
+
+        # Not stored unless the whole file was parsed
+        cache.Store(rec)
+        self.assertEqual(None, cache.Load('/a/b.sh', 12345, 99, src))
+
+        rec.eof = True
+        cache.Store(rec)
+
+        src2 = source.MainFile('<parse_cache_test>')  # a different object
+        lines = cache.Load('/a/b.sh', 12345, 99, src2)
+        self.assertEqual(len(nodes), len(lines))
+        self.assertEqual(2, lines[1].start_line)
+        self.assertEqual(_TreeStr(nodes[1]), _TreeStr(lines[1].node))
+        self.assertTrue(lines[0].node.name_tok.line.src is src2)
+        self.assertEqual(True, cache.CanReuse(lines[0]))
+
+        # Changing options or defining aliases invalidates lines
+        opts.on = True
+        self.assertEqual(False, cache.CanReuse(lines[0]))
+        opts.on = False
+        aliases['ls'] = 'ls -l'
+        self.assertEqual(True, cache.CanReuse(lines[0]))  # expand_aliases off
+        opts.on = True
+        self.assertEqual(False, cache.AliasesOk())
+        opts.on = False
+
+        # Different mtime, size, or version
+        self.assertEqual(None, cache.Load('/a/b.sh', 12346, 99, src2))
+        self.assertEqual(None, cache.Load('/a/b.sh', 12345, 98, src2))
+        self.assertEqual(None, cache.Load('/a/c.sh', 12345, 99, src2))
+        cache2 = parse_cache.ParseCache(self.cache_dir, '1.1', opts, aliases)
+        self.assertEqual(None, cache2.Load('/a/b.sh', 12345, 99, src2))
+
+    def testRacyFile(self):
+        cache = parse_cache.ParseCache(self.cache_dir, '1.0', _FakeOpts(), {})
+        src, _ = _ParseLines('echo hi\n')
+        import time
+        self.assertEqual(
+            None, cache.MakeRecorder('/a/b.sh', int(time.time()), 8, src))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,250 @@
+// Benchmark for Dict: probe lengths and lookup speed, for the shapes of dicts
+// that Oils uses.
+//
+// For each workload, we also show the average probe length of the old scheme,
+// which hashed strings and pointers with fnv1(), ints with the identity, and
+// Tuple2<int, int> with a + b, and then probed linearly.
+
+#include <time.h>  // clock_gettime()
+
+#include <vector>
+
+#include "mycpp/runtime.h"
+#include "vendor/greatest.h"
+
+// Like syntax_asdl::Token, which is hashed by identity
+class Token {
+ public:
+  Token(int id, int col) : id_(id), col_(col) {
+  }
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassFixed(kZeroMask, sizeof(Token));
+  }
+
+  int id_;
+  int col_;
+  void* line_;
+};
+
+const int kNumLookups = 200 * 1000;  // change to 20e6 for stable timings
+
+double Seconds() {
+  struct timespec ts;
+  clock_gettime(CLOCK_MONOTONIC, &ts);
+  return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+// Mirrors Dict::hash_and_probe(): the number of index slots we look at to
+// find an existing key
+template <typename K, typename V>
+int ProbeLength(Dict<K, V>* d, K key) {
+  int mask = d->index_len_ - 1;
+  int slot = hash_key(key) & mask;
+  for (int i = 0; i < d->index_len_; slot = (slot + ++i) & mask) {
+    int kv_index = d->index_->items_[slot];
+    if (kv_index >= 0 && keys_equal(d->keys_->items_[kv_index], key)) {
+      return i + 1;
+    }
+  }
+  return -1;
+}
+
+// Insert hashes into a table of the same size with linear probing, and return
+// the average probe length
+double OldProbeLength(const std::vector<unsigned>& hashes, int index_len) {
+  std::vector<bool> used(index_len, false);
+  int mask = index_len - 1;
+  int total = 0;
+  for (unsigned h : hashes) {
+    int slot = h & mask;
+    int n = 1;
+    while (used[slot]) {
+      slot = (slot + 1) & mask;
+      n++;
+    }
+    used[slot] = true;
+    total += n;
+  }
+  return static_cast<double>(total) / hashes.size();
+}
+
+unsigned OldHash(BigStr* s) {
+  return fnv1(s->data_, len(s)) >> 2;  // BigStr::hash() keeps 30 bits
+}
+
+unsigned OldHash(void* p) {
+  return fnv1(reinterpret_cast<const char*>(&p), sizeof(void*));
+}
+
+// keys: all the keys in d
+// probes: equal keys that are separate objects, and keys that aren't in d
+template <typename K, typename V>
+void Report(const char* name, Dict<K, V>* d, List<K>* keys, List<K>* probes,
+            const std::vector<unsigned>& old_hashes) {
+  int total = 0;
+  int max_len = 0;
+  for (int i = 0; i < len(keys); ++i) {
+    int n = ProbeLength(d, keys->at(i));
+    total += n;
+    max_len = std::max(max_len, n);
+  }
+  double avg = static_cast<double>(total) / len(keys);
+  double old_avg = OldProbeLength(old_hashes, d->index_len_);
+
+  int num_found = 0;
+  int n = len(probes);
+  double start = Seconds();
+  for (int i = 0; i < kNumLookups; ++i) {
+    if (dict_contains(d, probes->at(i % n))) {
+      num_found++;
+    }
+  }
+  double elapsed = Seconds() - start;
+
+  log("%-16s len %5d  probes avg %5.2f max %3d  (old avg %6.2f)  "
+      "%6.1f M lookups/s  (%d found)",
+      name, len(d), avg, max_len, old_avg, kNumLookups / elapsed / 1e6,
+      num_found);
+}
+
+// A frame in core/state.py Mem: a few special vars, and some locals
+void MemScope(int num_locals) {
+  const char* specials[] = {"PATH", "HOME", "IFS", "PWD", "PS4", "OPTIND",
+                            "_status", "_this_dir", "SHELLOPTS", "HOSTNAME"};
+
+  auto d = Alloc<Dict<BigStr*, BigStr*>>();
+  auto keys = NewList<BigStr*>();
+  auto probes = NewList<BigStr*>();
+  std::vector<unsigned> old_hashes;
+
+  for (const char* c_str : specials) {
+    keys->append(StrFromC(c_str));
+  }
+  for (int i = 0; i < num_locals; ++i) {
+    keys->append(StrFormat("var%d", i));
+  }
+  for (int i = 0; i < len(keys); ++i) {
+    BigStr* key = keys->at(i);
+    d->set(key, key);
+    old_hashes.push_back(OldHash(key));
+
+    // Names from a different part of the program.  Lookups that miss are
+    // common, since we look at each frame in the dynamic scope.
+    probes->append(StrFromC(key->data_));
+    probes->append(str_concat(key, StrFromC("_")));
+  }
+
+  BigStr* name = StrFormat("mem scope %d", len(d));
+  Report(name->data_, d, keys, probes, old_hashes);
+}
+
+// e.g. the Dict[Token, int] used to find the location of a token
+void TokenDict(int num_tokens) {
+  auto d = Alloc<Dict<Token*, int>>();
+  auto keys = NewList<Token*>();
+  std::vector<unsigned> old_hashes;
+
+  for (int i = 0; i < num_tokens; ++i) {
+    // Tokens are allocated one after another
+    Token* tok = Alloc<Token>(i % 100, i % 80);
+    keys->append(tok);
+    d->set(tok, i);
+    old_hashes.push_back(OldHash(tok));
+  }
+
+  BigStr* name = StrFormat("Token %d", num_tokens);
+  Report(name->data_, d, keys, keys, old_hashes);
+}
+
+// YSH dicts: keys from JSON, like records with field names
+void YshDict(int num_keys) {
+  const char* fields[] = {"name", "id", "type", "value", "size", "path"};
+
+  auto d = Alloc<Dict<BigStr*, BigStr*>>();
+  auto keys = NewList<BigStr*>();
+  auto probes = NewList<BigStr*>();
+  std::vector<unsigned> old_hashes;
+
+  for (int i = 0; i < num_keys; ++i) {
+    BigStr* key = i < 6 ? StrFromC(fields[i])
+                        : StrFormat("%s_%d", StrFromC(fields[i % 6]), i);
+    keys->append(key);
+    d->set(key, key);
+    old_hashes.push_back(OldHash(key));
+    probes->append(StrFromC(key->data_));
+  }
+
+  BigStr* name = StrFormat("YSH dict %d", num_keys);
+  Report(name->data_, d, keys, probes, old_hashes);
+}
+
+// Ints with a stride, like file descriptors or IDs that are multiples of 64
+void IntDict(int num_keys, int stride) {
+  auto d = Alloc<Dict<int, int>>();
+  auto keys = NewList<int>();
+  std::vector<unsigned> old_hashes;
+
+  for (int i = 0; i < num_keys; ++i) {
+    int key = i * stride;
+    keys->append(key);
+    d->set(key, i);
+    old_hashes.push_back(key);
+  }
+
+  BigStr* name = StrFormat("int *%d", stride);
+  Report(name->data_, d, keys, keys, old_hashes);
+}
+
+// (line, col) pairs
+void TupleDict(int num_lines, int num_cols) {
+  auto d = Alloc<Dict<Tuple2<int, int>*, int>>();
+  auto keys = NewList<Tuple2<int, int>*>();
+  std::vector<unsigned> old_hashes;
+
+  for (int line = 0; line < num_lines; ++line) {
+    for (int col = 0; col < num_cols; ++col) {
+      auto key = Alloc<Tuple2<int, int>>(line, col);
+      keys->append(key);
+      d->set(key, line);
+      old_hashes.push_back(line + col);
+    }
+  }
+
+  BigStr* name = StrFormat("(line, col) %d", len(d));
+  Report(name->data_, d, keys, keys, old_hashes);
+}
+
+TEST dict_bench() {
+  MemScope(0);
+  MemScope(20);
+  MemScope(200);
+
+  TokenDict(100);
+  TokenDict(10000);
+
+  YshDict(6);
+  YshDict(1000);
+
+  IntDict(1000, 1);
+  IntDict(1000, 64);
+
+  TupleDict(100, 80);
+
+  PASS();
+}
+
+GREATEST_MAIN_DEFS();
+
+int main(int argc, char** argv) {
+  gHeap.Init();
+
+  GREATEST_MAIN_BEGIN();
+
+  RUN_TEST(dict_bench);
+
+  gHeap.CleanProcessExit();
+
+  GREATEST_MAIN_END();
+  return 0;
+}
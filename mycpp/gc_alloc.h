@@ -169,6 +169,7 @@ inline BigStr* NewStr(int len) {
   s->data_[len] = '\0';  // NUL terminate
   s->len_ = len;
   s->hash_ = 0;
+  s->is_interned_ = 0;
   s->is_hashed_ = 0;
 
 #if MARK_SWEEP
@@ -196,6 +197,7 @@ inline BigStr* OverAllocatedStr(int len) {
   ObjHeader* header = new (place) ObjHeader(BigStr::obj_header());
   auto s = new (header->ObjectAddress()) BigStr();
   s->hash_ = 0;
+  s->is_interned_ = 0;
   s->is_hashed_ = 0;
 
 #if MARK_SWEEP
@@ -213,6 +215,9 @@ inline BigStr* StrFromC(const char* data, int len) {
   if (len == 0) {
     return kEmptyString;
   }
+  if (len == 1) {
+    return SingleByteStr(data[0]);
+  }
   BigStr* s = NewStr(len);
   memcpy(s->data_, data, len);
   DCHECK(s->data_[len] == '\0');  // should be true because Heap was zeroed
@@ -58,16 +58,18 @@ BigStr* str(double d) {
   return StrFromC(buf);
 }
 
-// Do we need this API?  Or is mylib.InternedStr(BigStr* s, int start, int end)
-// better for getting values out of Token.line without allocating?
+// Returns a string equal to s, which is the same object for all equal
+// interned strings.  Used for variable names and dict keys.
 //
-// e.g. mylib.InternedStr(tok.line, tok.start, tok.start+1)
-//
-// Also for SmallStr, we don't care about interning.  Only for HeapStr.
+// TODO: mylib.InternedStr(BigStr* s, int start, int end) could get values out
+// of Token.line without allocating.
 
 BigStr* intern(BigStr* s) {
-  // TODO: put in table gHeap.interned_
+#if MARK_SWEEP
+  return gHeap.interned_.Intern(s);
+#else
   return s;
+#endif
 }
 
 // Print quoted string.  Called by StrFormat('%r').
@@ -220,11 +222,8 @@ int to_int(BigStr* s, int base) {
 }
 
 BigStr* chr(int i) {
-  // NOTE: i should be less than 256, in which we could return an object from
-  // GLOBAL_STR() pool, like StrIter
-  auto result = NewStr(1);
-  result->data_[0] = i;
-  return result;
+  // NOTE: i should be less than 256
+  return SingleByteStr(i);
 }
 
 int ord(BigStr* s) {
@@ -337,6 +336,13 @@ BigStr* str_concat3(BigStr* a, BigStr* b, BigStr* c) {
 BigStr* str_concat(BigStr* a, BigStr* b) {
   int a_len = len(a);
   int b_len = len(b);
+  // Strings are immutable, so we don't need to copy
+  if (a_len == 0) {
+    return b;
+  }
+  if (b_len == 0) {
+    return a;
+  }
   int new_len = a_len + b_len;
   BigStr* result = NewStr(new_len);
   char* buf = result->data_;
@@ -363,9 +369,17 @@ bool str_equals(BigStr* left, BigStr* right) {
     return false;
   }
 
+  // Equal interned strings are the same object
+  if (left->is_interned_ && right->is_interned_) {
+    return false;
+  }
+
   // obj_len equal implies string lengths are equal
 
   if (left->len_ == right->len_) {
+    if (left->len_ == 1) {  // e.g. comparing the result of s[i]
+      return left->data_[0] == right->data_[0];
+    }
     // assert(len(left) == len(right));
     return memcmp(left->data_, right->data_, left->len_) == 0;
   }
@@ -449,7 +463,7 @@ bool str_equals0(const char* c_string, BigStr* s) {
 }
 
 int hash(BigStr* s) {
-  return s->hash(fnv1);
+  return s->hash(hash_bytes);
 }
 
 int max(int a, int b) {
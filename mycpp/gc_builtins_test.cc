@@ -331,11 +331,43 @@ TEST hash_str_test() {
 }
 
 TEST intern_test() {
-  BigStr* s = StrFromC("foo");
-  BigStr* t = intern(s);
+  BigStr* s = nullptr;
+  BigStr* t = nullptr;
+  BigStr* u = nullptr;
+  StackRoots _roots({&s, &t, &u});
 
+  s = StrFromC("foo");
+  t = intern(s);
   ASSERT(str_equals(s, t));
 
+  u = intern(StrFromC("foo"));
+  ASSERT(str_equals(s, u));
+  ASSERT(str_equals(u, s));
+#if MARK_SWEEP
+  // The first one is returned, and it remembers its hash
+  ASSERT_EQ(s, t);
+  ASSERT_EQ(s, u);
+  ASSERT(s->is_interned_);
+  ASSERT(s->is_hashed_);
+
+  ASSERT(!str_equals(s, intern(StrFromC("bar"))));
+  ASSERT_EQ(kStrFood, intern(kStrFood));
+  ASSERT_EQ(kStrFood, intern(StrFromC("food")));
+
+  // Unreachable strings are removed from the table
+  int before = gHeap.interned_.num_interned();
+  ASSERT(before >= 3);
+  t = nullptr;
+  u = nullptr;
+  for (int i = 0; i < 1000; ++i) {
+    intern(StrFromC(str(i + 100)->data_));  // not a global one-byte str
+  }
+  ASSERT(gHeap.interned_.num_interned() >= 1000);
+  gHeap.Collect();
+  ASSERT_EQ_FMT(2, gHeap.interned_.num_interned(), "%d");  // s and kStrFood
+  ASSERT_EQ(s, intern(StrFromC("foo")));
+#endif
+
   PASS();
 }
 
@@ -296,12 +296,9 @@ void Dict<K, V>::clear() {
   len_ = 0;
 }
 
-// TODO:
-// - Special case to intern BigStr* when it's hashed?  How?
-//   - Should we have wrappers like:
-//   - V GetAndIntern<V>(D, &string_key)
-//   - SetAndIntern<V>(D, &string_key, value)
-//   This will enable duplicate copies of the string to be garbage collected
+// Note: keys passed through intern() compare by pointer in keys_equal(), and
+// their hash is computed once.  The caller decides which keys to intern, e.g.
+// variable names in core/state.py.
 template <typename K, typename V>
 int Dict<K, V>::hash_and_probe(K key) const {
   if (capacity_ == 0) {
@@ -312,17 +309,16 @@ int Dict<K, V>::hash_and_probe(K key) const {
   // probe until an empty one is found.
   unsigned h = hash_key(key);
   // faster % using & -- assuming index_len_ is power of 2
-  int init_bucket = h & (index_len_ - 1);
+  int mask = index_len_ - 1;
+  int slot = h & mask;
 
   // If we see a tombstone along the probing path, stash it.
   int open_slot = -1;
 
-  for (int i = 0; i < index_len_; ++i) {
-    // Start at init_bucket and wrap araound
-
-    // faster % using & -- assuming index_len_ is power of 2
-    int slot = (i + init_bucket) & (index_len_ - 1);
-
+  // Triangular probing: the offsets from the first slot are 0, 1, 3, 6, 10,
+  // ...  Unlike linear probing, keys that collide don't pile up into long
+  // runs.  Since index_len_ is a power of 2, we visit every slot once.
+  for (int i = 0; i < index_len_; slot = (slot + ++i) & mask) {
     int kv_index = index_->items_[slot];
     DCHECK(kv_index < len_);
     // Optimistically this is the common case once the table has been populated.
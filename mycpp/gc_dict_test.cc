@@ -557,9 +557,9 @@ TEST test_dict_erase2() {
   PASS();
 }
 
-// Ints hash to themselves, so we can control when collisions happen. This test
-// sets up a few contrived workloads and checks that Dict still operates as
-// expected.
+// This test sets up a few contrived workloads and checks that Dict still
+// operates as expected.  (Ints used to hash to themselves, which let us
+// control when collisions happen.)
 TEST test_dict_probe() {
   auto d = Alloc<Dict<int, int>>();
 
@@ -683,6 +683,25 @@ TEST test_hash() {
   ASSERT_EQ_FMT(h1, h2, "%d");
   ASSERT(h1 != h3);
 
+  // Order matters for tuples
+  auto t1 = Alloc<Tuple2<int, int>>(1, 2);
+  auto t2 = Alloc<Tuple2<int, int>>(2, 1);
+  ASSERT(hash_key(t1) != hash_key(t2));
+
+  // Strided ints don't all land in the same few slots of a small table
+  int slot_counts[16] = {0};
+  for (int n = 0; n < 160; ++n) {
+    slot_counts[hash_key(n * 64) & 15]++;
+  }
+  for (int i = 0; i < 16; ++i) {
+    ASSERT(slot_counts[i] < 30);
+  }
+
+  // Strings are hashed a word at a time, including the tail
+  ASSERT_EQ(hash_bytes("0123456789", 10), hash_bytes("0123456789", 10));
+  ASSERT(hash_bytes("0123456789", 10) != hash_bytes("0123456788", 10));
+  ASSERT(hash_bytes("01234567", 8) != hash_bytes("01234567\0", 9));
+
   PASS();
 }
 
@@ -437,6 +437,14 @@ TEST test_list_sort() {
   ASSERT(str_equals(s->at(1), s2));
   ASSERT(str_equals(s->at(2), s3));
 
+  auto ints = NewList<int>(std::initializer_list<int>{1000000, 3, -1, 42});
+  auto s4 = sorted(ints);
+  ASSERT_EQ(-1, s4->at(0));
+  ASSERT_EQ(3, s4->at(1));
+  ASSERT_EQ(42, s4->at(2));
+  ASSERT_EQ(1000000, s4->at(3));
+  ASSERT_EQ(1000000, ints->at(0));  // sorted() makes a copy
+
   PASS();
 }
 
@@ -12,6 +12,8 @@ namespace mops {
 const BigInt ZERO = BigInt{0};
 const BigInt ONE = BigInt{1};
 const BigInt MINUS_ONE = BigInt{-1};
+const BigInt MAX_INT64 = INT64_MAX;
+const BigInt MIN_INT64 = INT64_MIN;
 
 static const int kInt64BufSize = 32;  // more than twice as big as kIntBufSize
 
@@ -21,6 +21,8 @@ typedef int64_t BigInt;
 extern const BigInt ZERO;
 extern const BigInt ONE;
 extern const BigInt MINUS_ONE;
+extern const BigInt MAX_INT64;
+extern const BigInt MIN_INT64;
 
 BigStr* ToStr(BigInt b);
 BigInt FromStr(BigStr* s, int base = 10);
@@ -12,6 +12,27 @@
 
 GLOBAL_STR(kEmptyString, "");
 
+// Like GLOBAL_STR(), expanded 256 times
+#define SINGLE_BYTE(c)                                                  \
+  {                                                                     \
+    ObjHeader::Global(TypeTag::BigStr), {                               \
+      .len_ = 1, .hash_ = 0, .is_interned_ = 0, .is_hashed_ = 0,        \
+      .data_ = {static_cast<char>(c), '\0'}                             \
+    }                                                                   \
+  }
+#define SINGLE_BYTE4(c) \
+  SINGLE_BYTE(c), SINGLE_BYTE(c + 1), SINGLE_BYTE(c + 2), SINGLE_BYTE(c + 3)
+#define SINGLE_BYTE16(c)                                             \
+  SINGLE_BYTE4(c), SINGLE_BYTE4(c + 4), SINGLE_BYTE4(c + 8), \
+      SINGLE_BYTE4(c + 12)
+#define SINGLE_BYTE64(c)                                                 \
+  SINGLE_BYTE16(c), SINGLE_BYTE16(c + 16), SINGLE_BYTE16(c + 32), \
+      SINGLE_BYTE16(c + 48)
+
+GcGlobal<GlobalStr<2>> gSingleByteStrs[256] = {
+    SINGLE_BYTE64(0), SINGLE_BYTE64(64), SINGLE_BYTE64(128),
+    SINGLE_BYTE64(192)};
+
 static const std::regex gStrFmtRegex("([^%]*)(?:%(-?[0-9]*)(.))?");
 static const int kMaxFmtWidth = 256;  // arbitrary...
 
@@ -131,9 +152,7 @@ BigStr* BigStr::at(int i) {
   DCHECK(0 <= i);
   DCHECK(i < length);  // had a problem here!
 
-  BigStr* result = NewStr(1);
-  result->data_[0] = data_[i];
-  return result;
+  return SingleByteStr(data_[i]);
 }
 
 // s[begin:]
@@ -152,6 +171,14 @@ BigStr* BigStr::slice(int begin, int end) {
   int new_len = end - begin;
   DCHECK(0 <= new_len && new_len <= length);
 
+  // Strings are immutable, so we don't need to copy
+  if (new_len == length) {
+    return this;
+  }
+  if (new_len == 1) {
+    return SingleByteStr(data_[begin]);
+  }
+
   BigStr* result = NewStr(new_len);  // has kEmptyString optimization
   memcpy(result->data_, data_ + begin, new_len);
 
@@ -433,6 +460,18 @@ BigStr* BigStr::join(List<BigStr*>* items) {
   int this_len = len(this);
   length += this_len * (num_parts - 1);
 
+  // e.g. ''.join(['', 'x']) is one of the parts
+  if (length == 1) {
+    if (this_len == 1) {
+      return SingleByteStr(data_[0]);
+    }
+    for (int i = 0; i < num_parts; ++i) {
+      if (len(items->at(i)) == 1) {
+        return items->at(i);
+      }
+    }
+  }
+
   BigStr* result = NewStr(length);
   char* p_result = result->data_;  // advances through
 
@@ -510,7 +549,7 @@ List<BigStr*>* BigStr::split(BigStr* sep) {
 
 unsigned BigStr::hash(HashFunc h) {
   if (!is_hashed_) {
-    hash_ = h(data_, len(this)) >> 1;
+    hash_ = h(data_, len(this)) >> 2;
     is_hashed_ = 1;
   }
   return hash_;
@@ -622,10 +661,7 @@ static inline BigStr* _StrFormat(const char* fmt, int fmt_len, va_list args) {
 }
 
 BigStr* StrIter::Value() {  // similar to at()
-  BigStr* result = NewStr(1);
-  result->data_[0] = s_->data_[i_];
-  DCHECK(result->data_[1] == '\0');
-  return result;
+  return SingleByteStr(s_->data_[i_]);
 }
 
 BigStr* StrFormat(const char* fmt, ...) {
@@ -81,7 +81,8 @@ class BigStr {
   unsigned hash(HashFunc h);
 
   int len_;
-  unsigned hash_ : 31;
+  unsigned hash_ : 30;
+  unsigned is_interned_ : 1;  // returned by intern(), see InternTable
   unsigned is_hashed_ : 1;
   char data_[1];  // flexible array
 
@@ -146,13 +147,24 @@ class GlobalStr {
   // a buffer of size N).  For initializing global constant instances.
  public:
   int len_;
-  unsigned hash_ : 31;
+  unsigned hash_ : 30;
+  unsigned is_interned_ : 1;
   unsigned is_hashed_ : 1;
   const char data_[N];
 
   DISALLOW_COPY_AND_ASSIGN(GlobalStr)
 };
 
+// Preallocated strings of one byte, for s[i], chr(i), and short slices.  Like
+// kEmptyString, they're global objects, so they're never marked or swept, and
+// each one caches its hash.
+extern GcGlobal<GlobalStr<2>> gSingleByteStrs[256];
+
+inline BigStr* SingleByteStr(int c) {
+  unsigned char i = static_cast<unsigned char>(c);
+  return reinterpret_cast<BigStr*>(&gSingleByteStrs[i].obj);
+}
+
 union Str {
  public:
   // Instead of this at the start of every function:
@@ -195,17 +207,25 @@ inline int len(const Str s) {
 //
 // TODO: Can we hash values at compile time so they can be in the intern table?
 
-#define GLOBAL_STR(name, val)                                                \
-  GcGlobal<GlobalStr<sizeof(val)>> _##name = {                               \
-      ObjHeader::Global(TypeTag::BigStr),                                    \
-      {.len_ = sizeof(val) - 1, .hash_ = 0, .is_hashed_ = 0, .data_ = val}}; \
+#define GLOBAL_STR(name, val)                                   \
+  GcGlobal<GlobalStr<sizeof(val)>> _##name = {                  \
+      ObjHeader::Global(TypeTag::BigStr),                       \
+      {.len_ = sizeof(val) - 1,                                 \
+       .hash_ = 0,                                              \
+       .is_interned_ = 0,                                       \
+       .is_hashed_ = 0,                                         \
+       .data_ = val}};                                          \
   BigStr* name = reinterpret_cast<BigStr*>(&_##name.obj);
 
 // New style for SmallStr compatibility
-#define GLOBAL_STR2(name, val)                                               \
-  GcGlobal<GlobalStr<sizeof(val)>> _##name = {                               \
-      ObjHeader::Global(TypeTag::BigStr),                                    \
-      {.len_ = sizeof(val) - 1, .hash_ = 0, .is_hashed_ = 0, .data_ = val}}; \
+#define GLOBAL_STR2(name, val)                                  \
+  GcGlobal<GlobalStr<sizeof(val)>> _##name = {                  \
+      ObjHeader::Global(TypeTag::BigStr),                       \
+      {.len_ = sizeof(val) - 1,                                 \
+       .hash_ = 0,                                              \
+       .is_interned_ = 0,                                       \
+       .is_hashed_ = 0,                                         \
+       .data_ = val}};                                          \
   Str name(reinterpret_cast<BigStr*>(&_##name.obj));
 
 // Helper function that's consistent with JSON definition of ASCII whitespace,
@@ -1509,6 +1509,58 @@ TEST small_big_test() {
   PASS();
 }
 
+static int NumAllocated() {
+  return gHeap.num_allocated_ + gHeap.pool1_.num_allocated() +
+         gHeap.pool2_.num_allocated();
+}
+
+TEST single_byte_test() {
+  BigStr* s = StrFromC("hello\xff");
+  StackRoots _roots({&s});
+
+  int before = NumAllocated();
+
+  ASSERT_EQ(SingleByteStr('h'), s->at(0));
+  ASSERT_EQ(SingleByteStr('\xff'), s->at(-1));
+  ASSERT_EQ(SingleByteStr('e'), s->slice(1, 2));
+  ASSERT_EQ(s, s->slice(0));
+  ASSERT_EQ(SingleByteStr('o'), StrFromC("o"));
+  ASSERT_EQ(SingleByteStr(255), chr(255));
+  ASSERT_EQ(1, len(chr(255)));
+  ASSERT_EQ(255, ord(chr(255)));
+
+  int i = 0;
+  for (StrIter it(s); !it.Done(); it.Next()) {
+    ASSERT_EQ(s->at(i), it.Value());
+    i++;
+  }
+
+  // Concatenating or joining with empty strings returns one of the parts
+  ASSERT_EQ(s, str_concat(kEmptyString, s));
+  ASSERT_EQ(s, str_concat(s, kEmptyString));
+  ASSERT_EQ(SingleByteStr('l'),
+            kEmptyString->join(NewList<BigStr*>(
+                {kEmptyString, s->at(2), kEmptyString})));
+  ASSERT_EQ(SingleByteStr(','),
+            StrFromC(",")->join(NewList<BigStr*>({kEmptyString, kEmptyString})));
+
+  // Only the 2 lists and their slabs were allocated
+  ASSERT_EQ_FMT(before + 4, NumAllocated(), "%d");
+
+  // They compare and hash like other strings
+  BigStr* h = NewStr(1);
+  h->data_[0] = 'h';
+  ASSERT(str_equals(h, s->at(0)));
+  ASSERT(!str_equals(h, s->at(1)));
+  ASSERT_EQ(hash(h), hash(s->at(0)));
+
+  // Global objects survive collection
+  gHeap.Collect();
+  ASSERT(str_equals0("o", s->at(4)));
+
+  PASS();
+}
+
 GREATEST_MAIN_DEFS();
 
 int main(int argc, char** argv) {
@@ -1550,6 +1602,7 @@ int main(int argc, char** argv) {
   RUN_TEST(str_iters_test);
 
   RUN_TEST(small_big_test);
+  RUN_TEST(single_byte_test);
 
   gHeap.CleanProcessExit();
 
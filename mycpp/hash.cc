@@ -1,5 +1,8 @@
 #include "mycpp/hash.h"
 
+#include <stdint.h>  // uint64_t
+#include <string.h>  // memcpy
+
 #include "mycpp/gc_str.h"
 #include "mycpp/gc_tuple.h"
 
@@ -16,24 +19,70 @@ unsigned fnv1(const char* data, int len) {
   return h;
 }
 
+// Constants from xxHash: https://github.com/Cyan4973/xxHash
+const uint64_t kPrime1 = 0x9E3779B185EBCA87ULL;
+const uint64_t kPrime2 = 0xC2B2AE3D27D4EB4FULL;
+
+static inline uint64_t Round(uint64_t acc, uint64_t word) {
+  acc += word * kPrime2;
+  acc = (acc << 31) | (acc >> 33);
+  return acc * kPrime1;
+}
+
+// The finalizer of MurmurHash3: every input bit affects every output bit.
+// The low bits are what we use to pick a slot in a power of 2 table.
+static inline unsigned Avalanche(uint64_t h) {
+  h ^= h >> 33;
+  h *= 0xFF51AFD7ED558CCDULL;
+  h ^= h >> 33;
+  h *= 0xC4CEB9FE1A85EC53ULL;
+  h ^= h >> 33;
+  return static_cast<unsigned>(h);
+}
+
+unsigned hash_bytes(const char* data, int len) {
+  // Consume 8 bytes at a time, unlike fnv1()
+  uint64_t h = kPrime1 + static_cast<uint64_t>(len);
+  int i = 0;
+  for (; i + 8 <= len; i += 8) {
+    uint64_t word;
+    memcpy(&word, data + i, 8);  // unaligned load
+    h = Round(h, word);
+  }
+  if (i < len) {
+    uint64_t word = 0;
+    memcpy(&word, data + i, len - i);
+    h = Round(h, word);
+  }
+  return Avalanche(h);
+}
+
+// Combine two 32-bit values without losing information, so (1, 2) and (2, 1)
+// don't collide
+static inline unsigned HashPair(unsigned a, unsigned b) {
+  return Avalanche((static_cast<uint64_t>(a) << 32) | b);
+}
+
 unsigned hash_key(BigStr* s) {
-  return s->hash(fnv1);
+  return s->hash(hash_bytes);
 }
 
 unsigned hash_key(int n) {
-  return n;
+  // Identity hashing puts consecutive and strided keys in clusters
+  return Avalanche(static_cast<unsigned>(n));
 }
 
 unsigned hash_key(Tuple2<int, int>* t1) {
-  return t1->at0() + t1->at1();
+  return HashPair(t1->at0(), t1->at1());
 }
 
 unsigned hash_key(Tuple2<BigStr*, int>* t1) {
-  return t1->at0()->hash(fnv1) + t1->at1();
+  return HashPair(t1->at0()->hash(hash_bytes), t1->at1());
 }
 
 // e.g. for Dict<Token*, int>, hash the pointer itself, which means we use
 // object IDENTITY, not value.
 unsigned hash_key(void* p) {
-  return fnv1(reinterpret_cast<const char*>(&p), sizeof(void*));
+  // The low bits of a pointer are always zero, because of alignment
+  return Avalanche(reinterpret_cast<uintptr_t>(p));
 }
@@ -5,6 +5,10 @@ typedef unsigned (*HashFunc)(const char*, int);
 
 unsigned fnv1(const char* data, int len);
 
+// Hashes 8 bytes at a time.  All strings should be hashed with this function,
+// since BigStr caches the first hash it computes.
+unsigned hash_bytes(const char* data, int len);
+
 template <typename L, typename R>
 class Tuple2;
 
@@ -1,5 +1,7 @@
 #include "mycpp/mark_sweep_heap.h"
 
+#include <errno.h>
+#include <fcntl.h>     // open()
 #include <inttypes.h>  // PRId64
 #include <stdlib.h>    // getenv()
 #include <string.h>    // strlen()
@@ -14,22 +16,205 @@
 // TODO: Remove this guard when we have separate binaries
 #if MARK_SWEEP
 
+BigStr* InternTable::Intern(BigStr* s) {
+  if (s->is_interned_) {
+    return s;
+  }
+  if ((num_interned_ + 1) * 2 > static_cast<int>(slots_.size())) {
+    Rebuild(std::max(64, static_cast<int>(slots_.size()) * 2));
+  }
+
+  unsigned h = s->hash(hash_bytes);  // cached in the string
+  int n = len(s);
+  int mask = slots_.size() - 1;
+  int i = h & mask;
+  while (BigStr* t = slots_[i]) {
+    if (t->hash_ == h && len(t) == n && memcmp(t->data_, s->data_, n) == 0) {
+      return t;
+    }
+    i = (i + 1) & mask;
+  }
+
+  s->is_interned_ = 1;
+  slots_[i] = s;
+  num_interned_++;
+  return s;
+}
+
+void InternTable::Rebuild(int capacity) {
+  std::vector<BigStr*> old_slots;
+  old_slots.swap(slots_);
+  slots_.resize(capacity);  // nullptr
+
+  int mask = capacity - 1;
+  for (BigStr* s : old_slots) {
+    if (s) {
+      int i = s->hash_ & mask;
+      while (slots_[i]) {
+        i = (i + 1) & mask;
+      }
+      slots_[i] = s;
+    }
+  }
+}
+
+void InternTable::RemoveUnmarked(MarkSweepHeap* heap) {
+  int num_removed = 0;
+  for (BigStr*& s : slots_) {
+    if (s && !heap->IsMarked(reinterpret_cast<RawObject*>(s))) {
+      s = nullptr;
+      num_removed++;
+    }
+  }
+  if (num_removed) {
+    // Probing sequences may have holes now
+    num_interned_ -= num_removed;
+    Rebuild(slots_.size());
+  }
+}
+
+// Bit 55 of a /proc/self/pagemap entry.  See
+// https://www.kernel.org/doc/Documentation/admin-guide/mm/soft-dirty.rst
+const uint64_t kSoftDirtyBit = 1ULL << 55;
+
+// Policy for bytes_threshold_.  See UpdateThreshold().
+const int64_t kMinBytesThreshold = MiB(4);
+// Try not to collect more often than this, if the cap allows it
+const int kMinGcPoints = 100;
+// Garbage can take up at most this many times the live bytes
+const int64_t kMaxOverhead = 2;
+
+// Indexed by ThresholdReason
+const char* kReasonNames[] = {"survival ratio", "allocation rate", "minimum",
+                              "memory cap"};
+
+void DirtyPages::Init() {
+  page_size_ = sysconf(_SC_PAGESIZE);
+
+  // Write to a page before and after clearing the bits
+  void* page = nullptr;
+  if (posix_memalign(&page, page_size_, page_size_) != 0) {
+    return;
+  }
+  volatile char* p = static_cast<char*>(page);
+  p[0] = 1;
+
+  supported_ = true;  // so BeginCollection() opens pagemap
+  bool ok = Clear();
+  BeginCollection();
+  ok = ok && pagemap_fd_ != -1 && !IsDirty(page, 1);
+  EndCollection();
+
+  p[0] = 2;
+  BeginCollection();
+  ok = ok && IsDirty(page, 1);
+  EndCollection();
+
+  supported_ = ok;
+  free(page);
+}
+
+bool DirtyPages::Clear() {
+  if (!supported_) {
+    return true;
+  }
+  int fd = ::open("/proc/self/clear_refs", O_WRONLY | O_CLOEXEC);
+  if (fd < 0) {
+    return false;
+  }
+  bool ok = ::write(fd, "4", 1) == 1;
+  ::close(fd);
+  if (ok) {
+    cleared_pid_ = getpid();
+  }
+  return ok;
+}
+
+void DirtyPages::BeginCollection() {
+  if (supported_) {
+    pagemap_fd_ = ::open("/proc/self/pagemap", O_RDONLY | O_CLOEXEC);
+  }
+}
+
+void DirtyPages::EndCollection() {
+  if (pagemap_fd_ != -1) {
+    ::close(pagemap_fd_);
+    pagemap_fd_ = -1;
+  }
+  chunks_.clear();
+  last_chunk_ = nullptr;
+}
+
+DirtyPages::ChunkBits* DirtyPages::ReadChunk(uintptr_t chunk_index) {
+  if (last_chunk_ && chunk_index == last_chunk_index_) {
+    return last_chunk_;
+  }
+
+  auto it = chunks_.find(chunk_index);
+  if (it == chunks_.end()) {
+    uint64_t entries[kChunkPages];
+    off_t offset = chunk_index * kChunkPages * sizeof(uint64_t);
+    ssize_t n = ::pread(pagemap_fd_, entries, sizeof(entries), offset);
+
+    ChunkBits bits(kChunkPages / 64, 0);
+    for (int i = 0; i < kChunkPages; ++i) {
+      // On error, or past the end, a page is dirty
+      if (n < static_cast<ssize_t>((i + 1) * sizeof(uint64_t)) ||
+          (entries[i] & kSoftDirtyBit)) {
+        bits[i / 64] |= 1ULL << (i % 64);
+      }
+    }
+    it = chunks_.emplace(chunk_index, std::move(bits)).first;
+  }
+
+  last_chunk_index_ = chunk_index;
+  last_chunk_ = &it->second;
+  return last_chunk_;
+}
+
+bool DirtyPages::IsDirty(void* p, size_t num_bytes) {
+  if (pagemap_fd_ == -1) {
+    return true;  // not supported, or we couldn't open pagemap
+  }
+
+  uintptr_t addr = reinterpret_cast<uintptr_t>(p);
+  uintptr_t first_page = addr / page_size_;
+  uintptr_t last_page = (addr + num_bytes - 1) / page_size_;
+  for (uintptr_t page = first_page; page <= last_page; ++page) {
+    ChunkBits* bits = ReadChunk(page / kChunkPages);
+    int i = page % kChunkPages;
+    if ((*bits)[i / 64] & (1ULL << (i % 64))) {
+      return true;
+    }
+  }
+  return false;
+}
+
 void MarkSweepHeap::Init() {
   Init(1000);  // collect at 1000 objects in tests
 }
 
 void MarkSweepHeap::Init(int gc_threshold) {
   gc_threshold_ = gc_threshold;
+  bytes_threshold_ = kMinBytesThreshold;
 
   char* e;
   e = getenv("OILS_GC_THRESHOLD");
   if (e) {
     int result;
     if (StringToInt(e, strlen(e), 10, &result)) {
-      // Override collection threshold
+      // Override collection threshold, and don't count bytes
       gc_threshold_ = result;
+      bytes_threshold_ = -1;
     }
   }
+  min_gc_threshold_ = gc_threshold_;
+
+  e = getenv("OILS_GC_MODE");
+  if (e && strcmp(e, "generational") == 0) {
+    gc_mode_ = GcMode::Generational;
+    dirty_pages_.Init();
+  }
 
   // only for developers
   e = getenv("_OILS_GC_VERBOSE");
@@ -47,7 +232,15 @@ int MarkSweepHeap::MaybeCollect() {
   int result = Collect();
   #else
   int result = -1;
-  if (num_live() > gc_threshold_) {
+  // In generational mode, the threshold applies to new objects
+  int num_counted = gc_mode_ == GcMode::Generational
+                        ? num_live() - num_survived_
+                        : num_live();
+  if (num_counted > gc_threshold_) {
+    num_object_triggers_++;
+    result = Collect();
+  } else if (bytes_threshold_ != -1 && bytes_since_gc_ > bytes_threshold_) {
+    num_byte_triggers_++;
     result = Collect();
   }
   #endif
@@ -69,10 +262,12 @@ void* MarkSweepHeap::Allocate(size_t num_bytes, int* obj_id, int* pool_id) {
   #ifndef NO_POOL_ALLOC
   if (num_bytes <= pool1_.kMaxObjSize) {
     *pool_id = 1;
+    bytes_since_gc_ += pool1_.kMaxObjSize;
     return pool1_.Allocate(obj_id);
   }
   if (num_bytes <= pool2_.kMaxObjSize) {
     *pool_id = 2;
+    bytes_since_gc_ += pool2_.kMaxObjSize;
     return pool2_.Allocate(obj_id);
   }
   *pool_id = 0;  // malloc(), not a pool
@@ -107,10 +302,13 @@ void* MarkSweepHeap::Allocate(size_t num_bytes, int* obj_id, int* pool_id) {
   DCHECK(result != nullptr);
 
   live_objs_.push_back(static_cast<ObjHeader*>(result));
+  live_sizes_.push_back(num_bytes);
 
   num_live_++;
   num_allocated_++;
   bytes_allocated_ += num_bytes;
+  bytes_live_ += num_bytes;
+  bytes_since_gc_ += num_bytes;
 
   return result;
 }
@@ -171,6 +369,22 @@ void MarkSweepHeap::MaybeMarkAndPush(RawObject* obj) {
   }
 }
 
+bool MarkSweepHeap::IsMarked(RawObject* obj) {
+  ObjHeader* header = ObjHeader::FromObject(obj);
+  if (header->heap_tag == HeapTag::Global) {
+    return true;  // never swept
+  }
+  #ifndef NO_POOL_ALLOC
+  if (header->pool_id == 1) {
+    return pool1_.IsMarked(header->obj_id);
+  }
+  if (header->pool_id == 2) {
+    return pool2_.IsMarked(header->obj_id);
+  }
+  #endif
+  return mark_set_.IsMarked(header->obj_id);
+}
+
 void MarkSweepHeap::TraceChildren() {
   while (!gray_stack_.empty()) {
     ObjHeader* header = gray_stack_.back();
@@ -211,15 +425,16 @@ void MarkSweepHeap::TraceChildren() {
   }
 }
 
-void MarkSweepHeap::Sweep() {
+void MarkSweepHeap::Sweep(bool minor) {
   #ifndef NO_POOL_ALLOC
   pool1_.Sweep();
   pool2_.Sweep();
   #endif
 
-  int last_live_index = 0;
+  // A minor collection only frees young objects, so skip over the old ones
+  int last_live_index = minor ? num_old_objs_ : 0;
   int num_objs = live_objs_.size();
-  for (int i = 0; i < num_objs; ++i) {
+  for (int i = last_live_index; i < num_objs; ++i) {
     ObjHeader* obj = live_objs_[i];
     DCHECK(obj);  // malloc() shouldn't have returned nullptr
 
@@ -228,17 +443,164 @@ void MarkSweepHeap::Sweep() {
     // Compact live_objs_ and populate to_free_.  Note: doing the reverse could
     // be more efficient when many objects are dead.
     if (is_live) {
+      live_sizes_[last_live_index] = live_sizes_[i];
       live_objs_[last_live_index++] = obj;
     } else {
       to_free_.push_back(obj);
       // free(obj);
       num_live_--;
+      bytes_live_ -= live_sizes_[i];
     }
   }
   live_objs_.resize(last_live_index);  // remove dangling objects
+  live_sizes_.resize(last_live_index);
+  num_old_objs_ = last_live_index;  // everything that survived is old
 
   num_collections_++;
-  max_survived_ = std::max(max_survived_, num_live());
+  if (minor) {
+    num_minor_collections_++;
+  }
+  num_survived_ = num_live();
+  max_survived_ = std::max(max_survived_, num_survived_);
+}
+
+bool MarkSweepHeap::ShouldCollectMinor() {
+  if (gc_mode_ != GcMode::Generational) {
+    return false;
+  }
+  // The first collection has no old generation, and too many old objects
+  // means too much garbage may be kept alive
+  if (num_collections_ == 0 || num_survived_ > major_threshold_) {
+    return false;
+  }
+  // Clear() failed, or this is a forked child
+  if (dirty_pages_.supported() && dirty_pages_.cleared_pid_ != getpid()) {
+    return false;
+  }
+  return true;
+}
+
+// Old objects are already marked, so marking stops at them.  But an old object
+// that was written since the last collection may point to a young object.
+// Trace the children of such objects.
+void MarkSweepHeap::PushDirtyOldObjects() {
+  auto push = [this](ObjHeader* header) {
+    switch (header->heap_tag) {
+    case HeapTag::Scanned:
+    case HeapTag::FixedSize:
+      gray_stack_.push_back(header);
+      break;
+    }
+  };
+
+  #ifndef NO_POOL_ALLOC
+  pool1_.ForEachDirtyOldCell(&dirty_pages_, push);
+  pool2_.ForEachDirtyOldCell(&dirty_pages_, push);
+  #endif
+
+  for (int i = 0; i < num_old_objs_; ++i) {
+    ObjHeader* header = live_objs_[i];
+    // Only the pointers can refer to young objects
+    size_t num_bytes = sizeof(ObjHeader);
+    switch (header->heap_tag) {
+    case HeapTag::FixedSize: {
+      int mask = FIELD_MASK(*header);
+      int num_fields = mask ? 32 - __builtin_clz(mask) : 0;  // highest bit
+      num_bytes += num_fields * sizeof(RawObject*);
+      break;
+    }
+    case HeapTag::Scanned:
+      num_bytes += NUM_POINTERS(*header) * sizeof(RawObject*);
+      break;
+    default:
+      continue;  // no children
+    }
+    if (dirty_pages_.IsDirty(header, num_bytes)) {
+      gray_stack_.push_back(header);
+    }
+  }
+}
+
+// Set the thresholds for the next collection.  We allow (1 + survival) times
+// the live data to be allocated, where survival is the fraction of the
+// collected objects that were still live.  The more that survives, the less a
+// collection accomplishes, so we wait longer.
+void MarkSweepHeap::UpdateThreshold(bool minor, int num_before,
+                                    int64_t bytes_before) {
+  if (bytes_threshold_ != -1) {
+    int64_t bytes_after = bytes_live();
+
+    // A minor collection only collects from what was allocated since the last
+    // one
+    int64_t collected_from = minor ? bytes_since_gc_ : bytes_before;
+    int64_t survived = bytes_after - (bytes_before - collected_from);
+    double survival = collected_from > 0
+                          ? static_cast<double>(survived) / collected_from
+                          : 0.0;
+    last_survival_ = survival;
+
+    int64_t threshold = static_cast<int64_t>((1.0 + survival) * bytes_after);
+    int reason = ThresholdReason::Survival;
+
+    // If every statement allocates a lot, e.g. x=$(cat big.txt), we'd
+    // collect at every GC point.  Leave room for kMinGcPoints of them.
+    int num_points = std::max(num_gc_points_ - gc_points_at_last_gc_, 1);
+    int64_t bytes_per_point = bytes_since_gc_ / num_points;
+    if (bytes_per_point * kMinGcPoints > threshold) {
+      threshold = bytes_per_point * kMinGcPoints;
+      reason = ThresholdReason::AllocRate;
+    }
+    if (threshold < kMinBytesThreshold) {
+      threshold = kMinBytesThreshold;
+      reason = ThresholdReason::Minimum;
+    }
+    // But don't let garbage use more than kMaxOverhead times the live data
+    int64_t cap = std::max(bytes_after * kMaxOverhead, kMinBytesThreshold);
+    if (threshold > cap) {
+      threshold = cap;
+      reason = ThresholdReason::MemoryCap;
+    }
+    bytes_threshold_ = threshold;
+    num_by_reason_[reason]++;
+
+    if (gc_verbose_) {
+      log("    %.2f of %" PRId64 " bytes survived, %" PRId64
+          " bytes per GC point",
+          survival, collected_from, bytes_per_point);
+      log("    bytes threshold set to %" PRId64 " by %s", threshold,
+          kReasonNames[reason]);
+    }
+  }
+
+  if (gc_mode_ == GcMode::Generational) {
+    // gc_threshold_ is the number of new objects, so it stays the same.  Do
+    // a full collection when the old generation doubles.
+    if (!minor) {
+      major_threshold_ = std::max(num_live() * 2, gc_threshold_);
+      if (gc_verbose_) {
+        log("    full collection; next one after %d survivors",
+            major_threshold_);
+      }
+    }
+    return;
+  }
+
+  // The same policy for the number of objects.  Without it, we'd be close to
+  // the threshold after a collection that freed little, and do FUTILE mark
+  // and sweep.
+  int num_after = num_live();
+  double survival =
+      num_before > 0 ? static_cast<double>(num_after) / num_before : 0.0;
+  int threshold = num_after + static_cast<int>((1.0 + survival) * num_after);
+  threshold = std::max(threshold, min_gc_threshold_);
+  if (threshold > gc_threshold_) {
+    num_growths_++;
+  }
+  gc_threshold_ = threshold;
+  if (gc_verbose_) {
+    log("    %.2f of %d objects survived; gc_threshold set to %d", survival,
+        num_before, gc_threshold_);
+  }
 }
 
 int MarkSweepHeap::Collect() {
@@ -251,20 +613,34 @@ int MarkSweepHeap::Collect() {
 
   int num_roots = roots_.size();
   int num_globals = global_roots_.size();
+  bool minor = ShouldCollectMinor();
+  int num_before = num_live();
+  int64_t bytes_before = bytes_live();
 
   if (gc_verbose_) {
     log("");
-    log("%2d. GC with %d roots (%d global) and %d live objects",
-        num_collections_, num_roots + num_globals, num_globals, num_live());
+    log("%2d. %s GC with %d roots (%d global) and %d live objects",
+        num_collections_, minor ? "Minor" : "Full", num_roots + num_globals,
+        num_globals, num_live());
   }
 
-  // Resize it
-  mark_set_.ReInit(greatest_obj_id_);
+  // Resize it.  A minor collection keeps the marks of old objects.
+  if (minor) {
+    mark_set_.Resize(greatest_obj_id_);
+  } else {
+    mark_set_.ReInit(greatest_obj_id_);
+  }
   #ifndef NO_POOL_ALLOC
-  pool1_.PrepareForGc();
-  pool2_.PrepareForGc();
+  pool1_.PrepareForGc(minor);
+  pool2_.PrepareForGc(minor);
   #endif
 
+  if (minor) {
+    dirty_pages_.BeginCollection();
+    PushDirtyOldObjects();
+    dirty_pages_.EndCollection();
+  }
+
   // Mark roots.
   // Note: It might be nice to get rid of double pointers
   for (int i = 0; i < num_roots; ++i) {
@@ -284,25 +660,20 @@ int MarkSweepHeap::Collect() {
   // Traverse object graph.
   TraceChildren();
 
-  Sweep();
+  interned_.RemoveUnmarked(this);  // before their memory is reused
+
+  Sweep(minor);
 
   if (gc_verbose_) {
     log("    %d live after sweep", num_live());
   }
 
-  // We know how many are live.  If the number of objects is close to the
-  // threshold (above 75%), then set the threshold to 2 times the number of
-  // live objects.  This is an ad hoc policy that removes observed "thrashing"
-  // -- being at 99% of the threshold and doing FUTILE mark and sweep.
+  UpdateThreshold(minor, num_before, bytes_before);
+  bytes_since_gc_ = 0;
+  gc_points_at_last_gc_ = num_gc_points_;
 
-  int water_mark = (gc_threshold_ * 3) / 4;
-  if (num_live() > water_mark) {
-    gc_threshold_ = num_live() * 2;
-    num_growths_++;
-    if (gc_verbose_) {
-      log("    exceeded %d live objects; gc_threshold set to %d", water_mark,
-          gc_threshold_);
-    }
+  if (gc_mode_ == GcMode::Generational && !dirty_pages_.Clear()) {
+    major_threshold_ = 0;  // we can't trust the bits, so collect everything
   }
 
   #ifdef GC_TIMING
@@ -322,6 +693,19 @@ int MarkSweepHeap::Collect() {
   if (gc_millis > max_gc_millis_) {
     max_gc_millis_ = gc_millis;
   }
+
+  int bucket = 0;
+  for (double limit = 1.0; gc_millis >= limit; limit *= 2) {
+    if (bucket == kNumPauseBuckets - 1) {
+      break;
+    }
+    bucket++;
+  }
+  if (minor) {
+    minor_pauses_[bucket]++;
+  } else {
+    major_pauses_[bucket]++;
+  }
   #endif
 
   return num_live();  // for unit tests only
@@ -329,6 +713,7 @@ int MarkSweepHeap::Collect() {
 
 void MarkSweepHeap::PrintStats(int fd) {
   dprintf(fd, "  num live         = %10d\n", num_live());
+  dprintf(fd, "  num interned     = %10d\n", interned_.num_interned());
   // max survived_ can be less than num_live(), because leave off the last GC
   dprintf(fd, "  max survived     = %10d\n", max_survived_);
   dprintf(fd, "\n");
@@ -354,13 +739,56 @@ void MarkSweepHeap::PrintStats(int fd) {
   dprintf(fd, "\n");
   dprintf(fd, "  num gc points    = %10d\n", num_gc_points_);
   dprintf(fd, "  num collections  = %10d\n", num_collections_);
+  if (gc_mode_ == GcMode::Generational) {
+    dprintf(fd, "  num minor        = %10d\n", num_minor_collections_);
+    dprintf(fd, "  soft-dirty pages = %10s\n",
+            dirty_pages_.supported() ? "yes" : "no");
+  }
   dprintf(fd, "\n");
   dprintf(fd, "   gc threshold    = %10d\n", gc_threshold_);
   dprintf(fd, "  num growths      = %10d\n", num_growths_);
   dprintf(fd, "\n");
+  dprintf(fd, "bytes live         = %10" PRId64 "\n", bytes_live());
+  if (bytes_threshold_ == -1) {
+    dprintf(fd, "bytes threshold    = %10s (OILS_GC_THRESHOLD is set)\n",
+            "off");
+  } else {
+    dprintf(fd, "bytes threshold    = %10" PRId64 "\n", bytes_threshold_);
+    dprintf(fd, "  last survival    = %10.2f\n", last_survival_);
+  }
+  dprintf(fd, "\n");
+  dprintf(fd, "Collections were triggered by\n");
+  dprintf(fd, "  object count     = %10d\n", num_object_triggers_);
+  dprintf(fd, "  bytes allocated  = %10d\n", num_byte_triggers_);
+  if (bytes_threshold_ != -1) {
+    dprintf(fd, "The bytes threshold was set by\n");
+    for (int i = 0; i < ThresholdReason::Count; ++i) {
+      dprintf(fd, "  %-16s = %10d\n", kReasonNames[i], num_by_reason_[i]);
+    }
+  }
+  dprintf(fd, "\n");
   dprintf(fd, "  max gc millis    = %10.1f\n", max_gc_millis_);
   dprintf(fd, "total gc millis    = %10.1f\n", total_gc_millis_);
   dprintf(fd, "\n");
+
+  #ifdef GC_TIMING
+  dprintf(fd, "%-16s %10s %10s\n", "gc pause millis", "minor", "full");
+  int limit = 1;
+  for (int i = 0; i < kNumPauseBuckets; ++i) {
+    if (minor_pauses_[i] || major_pauses_[i]) {
+      if (i == kNumPauseBuckets - 1) {
+        dprintf(fd, "       >= %-6d %10d %10d\n", limit / 2, minor_pauses_[i],
+                major_pauses_[i]);
+      } else {
+        dprintf(fd, "        < %-6d %10d %10d\n", limit, minor_pauses_[i],
+                major_pauses_[i]);
+      }
+    }
+    limit *= 2;
+  }
+  dprintf(fd, "\n");
+  #endif
+
   dprintf(fd, "roots capacity     = %10d\n",
           static_cast<int>(roots_.capacity()));
   dprintf(fd, " objs capacity     = %10d\n",
@@ -394,6 +822,7 @@ void MarkSweepHeap::MaybePrintStats() {
 void MarkSweepHeap::FreeEverything() {
   roots_.clear();
   global_roots_.clear();
+  major_threshold_ = -1;  // a minor collection would keep old objects
 
   Collect();
 
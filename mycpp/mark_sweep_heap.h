@@ -2,7 +2,9 @@
 #define MARKSWEEP_HEAP_H
 
 #include <stdlib.h>
+#include <sys/types.h>  // pid_t
 
+#include <unordered_map>
 #include <vector>
 
 #include "mycpp/common.h"
@@ -18,6 +20,12 @@ class MarkSet {
   void ReInit(int max_obj_id) {
     // https://stackoverflow.com/questions/8848575/fastest-way-to-reset-every-value-of-stdvectorint-to-0
     std::fill(bits_.begin(), bits_.end(), 0);
+    Resize(max_obj_id);
+  }
+
+  // Like ReInit(), but keep the existing marks.  Used by minor collections,
+  // where marked objects are the old generation.
+  void Resize(int max_obj_id) {
     int max_byte_index = (max_obj_id >> 3) + 1;  // round up
     // log("ReInit max_byte_index %d", max_byte_index);
     bits_.resize(max_byte_index);
@@ -64,6 +72,59 @@ class MarkSet {
   std::vector<uint8_t> bits_;  // bit vector indexed by obj_id
 };
 
+// Which pages of memory were written since the last Clear()?  Linux sets a
+// "soft-dirty" bit in /proc/self/pagemap on the first write to a page, and
+// writing "4" to /proc/self/clear_refs resets the bits.  This is a write
+// barrier that doesn't require any changes to generated code.
+//
+// If the kernel doesn't support it, every page is dirty, which is correct but
+// slower.
+class DirtyPages {
+ public:
+  DirtyPages() = default;
+
+  // Check if soft-dirty bits work, by writing to a page
+  void Init();
+
+  // Called at the end of a collection.  Returns false on error, in which
+  // case the next collection has to be a full one.
+  bool Clear();
+
+  // Called at the start and end of a collection, to open and close
+  // /proc/self/pagemap.  The shell may use any fd between collections, and
+  // a forked child must not read its parent's pages.
+  void BeginCollection();
+  void EndCollection();
+
+  bool IsDirty(void* p, size_t num_bytes);
+
+  bool supported() {
+    return supported_;
+  }
+
+  // The process that last called Clear().  A child process doesn't inherit
+  // the bits reliably, so its first collection is a full one.
+  pid_t cleared_pid_ = -1;
+
+ private:
+  // The soft-dirty bits for a chunk of kChunkPages pages
+  static constexpr int kChunkPages = 512;
+  using ChunkBits = std::vector<uint64_t>;
+
+  ChunkBits* ReadChunk(uintptr_t chunk_index);
+
+  bool supported_ = false;
+  uintptr_t page_size_ = 4096;
+  int pagemap_fd_ = -1;
+
+  // Caches what we read from pagemap during one collection
+  std::unordered_map<uintptr_t, ChunkBits> chunks_;
+  uintptr_t last_chunk_index_ = 0;
+  ChunkBits* last_chunk_ = nullptr;
+
+  DISALLOW_COPY_AND_ASSIGN(DirtyPages);
+};
+
 // A simple Pool allocator for allocating small objects. It maintains an ever
 // growing number of Blocks each consisting of a number of fixed size Cells.
 // Memory is handed out one Cell at a time.
@@ -105,10 +166,15 @@ class Pool {
     return cell;
   }
 
-  void PrepareForGc() {
+  // A minor collection keeps the marks of old cells
+  void PrepareForGc(bool keep_marks = false) {
     DCHECK(!gc_underway_);
     gc_underway_ = true;
-    mark_set_.ReInit(blocks_.size() * CellsPerBlock);
+    if (keep_marks) {
+      mark_set_.Resize(blocks_.size() * CellsPerBlock);
+    } else {
+      mark_set_.ReInit(blocks_.size() * CellsPerBlock);
+    }
   }
 
   bool IsMarked(int cell_id) {
@@ -142,6 +208,27 @@ class Pool {
     gc_underway_ = false;
   }
 
+  // For minor collections: call f(header) on each old cell that may have been
+  // written since the last collection.
+  template <typename F>
+  void ForEachDirtyOldCell(DirtyPages* dirty_pages, F f) {
+    DCHECK(gc_underway_);
+    int cell_id = 0;
+    for (Block* block : blocks_) {
+      if (!dirty_pages->IsDirty(block, sizeof(Block))) {
+        cell_id += CellsPerBlock;
+        continue;
+      }
+      for (Cell& cell : block->cells) {
+        if (mark_set_.IsMarked(cell_id) &&
+            dirty_pages->IsDirty(cell, CellSize)) {
+          f(reinterpret_cast<ObjHeader*>(cell));
+        }
+        cell_id++;
+      }
+    }
+  }
+
   void Free() {
     for (Block* block : blocks_) {
       free(block);
@@ -161,6 +248,10 @@ class Pool {
     return blocks_.size() * CellsPerBlock - num_free_;
   }
 
+  int64_t bytes_live() {
+    return static_cast<int64_t>(num_live()) * CellSize;
+  }
+
  private:
   using Cell = uint8_t[CellSize];
 
@@ -189,6 +280,56 @@ class Pool {
   DISALLOW_COPY_AND_ASSIGN(Pool<CellsPerBlock COMMA CellSize>);
 };
 
+class BigStr;
+class MarkSweepHeap;
+
+// A weak set of strings, for intern().  Equal strings that are interned are
+// the same object, so comparing them is a pointer check.  After marking, the
+// GC removes strings that are only reachable from the table.
+class InternTable {
+ public:
+  InternTable() = default;
+
+  // Returns the string in the table that's equal to s, or adds s
+  BigStr* Intern(BigStr* s);
+
+  // Called after marking
+  void RemoveUnmarked(MarkSweepHeap* heap);
+
+  int num_interned() {
+    return num_interned_;
+  }
+
+ private:
+  void Rebuild(int capacity);
+
+  // Open addressing with linear probing.  nullptr is an empty slot.
+  std::vector<BigStr*> slots_;
+  int num_interned_ = 0;
+
+  DISALLOW_COPY_AND_ASSIGN(InternTable);
+};
+
+// Values for OILS_GC_MODE
+namespace GcMode {
+const int Full = 0;          // Mark the whole heap in every collection
+const int Generational = 1;  // Usually mark only objects allocated since
+                             // the last collection
+};  // namespace GcMode
+
+// What set bytes_threshold_, for OILS_GC_STATS
+namespace ThresholdReason {
+const int Survival = 0;   // the survival ratio
+const int AllocRate = 1;  // bytes allocated per GC point
+const int Minimum = 2;
+const int MemoryCap = 3;
+const int Count = 4;
+};  // namespace ThresholdReason
+
+// Collection pauses are counted in buckets of < 1 ms, < 2 ms, < 4 ms, ...
+// The last bucket has the rest.
+const int kNumPauseBuckets = 12;
+
 class MarkSweepHeap {
  public:
   // reserve 32 frames to start
@@ -221,7 +362,10 @@ class MarkSweepHeap {
   void MaybeMarkAndPush(RawObject* obj);
   void TraceChildren();
 
-  void Sweep();
+  // Only valid between marking and sweeping
+  bool IsMarked(RawObject* obj);
+
+  void Sweep(bool minor);
 
   void PrintStats(int fd);  // public for testing
 
@@ -236,21 +380,44 @@ class MarkSweepHeap {
         ;
   }
 
+  int64_t bytes_live() {
+    return bytes_live_
+  #ifndef NO_POOL_ALLOC
+           + pool1_.bytes_live() + pool2_.bytes_live()
+  #endif
+        ;
+  }
+
   bool is_initialized_ = true;  // mark/sweep doesn't need to be initialized
 
   // Runtime params
 
-  // Threshold is a number of live objects, since we aren't keeping track of
-  // total bytes
+  // Threshold is a number of live objects.  In generational mode, it's the
+  // number of objects allocated since the last collection.  It never goes
+  // below the initial threshold.
   int gc_threshold_;
+  int min_gc_threshold_;
+
+  // Also collect when this many bytes were allocated since the last
+  // collection, so that big strings are collected promptly.  -1 when
+  // OILS_GC_THRESHOLD is set, so the threshold is exact.
+  int64_t bytes_threshold_ = -1;
+
+  // GcMode::Full or GcMode::Generational
+  int gc_mode_ = GcMode::Full;
+
+  // In generational mode, do a full collection when more than this many
+  // objects survived the last collection
+  int major_threshold_ = 0;
 
   // Show debug logging
   bool gc_verbose_ = false;
 
   // Current stats
   int num_live_ = 0;
-  // Should we keep track of sizes?
-  // int64_t bytes_live_ = 0;
+  int64_t bytes_live_ = 0;      // not including pools
+  int64_t bytes_since_gc_ = 0;  // including pools
+  int gc_points_at_last_gc_ = 0;
 
   // Cumulative stats
   int max_survived_ = 0;  // max # live after a collection
@@ -258,10 +425,22 @@ class MarkSweepHeap {
   int64_t bytes_allocated_ = 0;  // avoid overflow
   int num_gc_points_ = 0;        // manual collection points
   int num_collections_ = 0;
-  int num_growths_;
+  int num_minor_collections_ = 0;
+  int num_growths_ = 0;
+
+  // Why we collected, and how bytes_threshold_ was chosen.  See
+  // UpdateThreshold().
+  int num_object_triggers_ = 0;
+  int num_byte_triggers_ = 0;
+  int num_by_reason_[ThresholdReason::Count] = {};
+  double last_survival_ = 0.0;
   double max_gc_millis_ = 0.0;
   double total_gc_millis_ = 0.0;
 
+  // Histograms of pause times, indexed by bucket
+  int minor_pauses_[kNumPauseBuckets] = {};
+  int major_pauses_[kNumPauseBuckets] = {};
+
 #ifndef NO_POOL_ALLOC
   // 16,384 / 24 bytes = 682 cells (rounded), 16,368 bytes
   // 16,384 / 48 bytes = 341 cells (rounded), 16,368 bytes
@@ -276,15 +455,28 @@ class MarkSweepHeap {
 
   // Allocate() appends live objects, and Sweep() compacts it
   std::vector<ObjHeader*> live_objs_;
+  // The size of each object in live_objs_, for bytes_live_
+  std::vector<size_t> live_sizes_;
+  // The old generation is live_objs_[0, num_old_objs_).  Everything that
+  // survives a collection is old, and has its mark bit set until the next full
+  // collection.
+  int num_old_objs_ = 0;
+  // num_live() after the last collection
+  int num_survived_ = 0;
   // Allocate lazily frees these, and Sweep() replenishes it
   std::vector<ObjHeader*> to_free_;
 
   std::vector<ObjHeader*> gray_stack_;
   MarkSet mark_set_;
+  DirtyPages dirty_pages_;
+  InternTable interned_;
 
   int greatest_obj_id_ = 0;
 
  private:
+  bool ShouldCollectMinor();
+  void PushDirtyOldObjects();
+  void UpdateThreshold(bool minor, int num_before, int64_t bytes_before);
   void FreeEverything();
   void MaybePrintStats();
 
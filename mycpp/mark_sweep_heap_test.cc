@@ -1,5 +1,8 @@
 #include "mycpp/mark_sweep_heap.h"
 
+#include <inttypes.h>  // PRId64
+#include <unistd.h>    // getpid()
+
 #include "mycpp/gc_alloc.h"  // gHeap
 #include "mycpp/gc_list.h"
 #include "vendor/greatest.h"
@@ -171,6 +174,120 @@ TEST cycle_collection_test() {
   PASS();
 }
 
+TEST dirty_pages_test() {
+  DirtyPages dirty_pages;
+  dirty_pages.Init();
+  log("soft-dirty pages supported = %d", dirty_pages.supported());
+
+  int* x = static_cast<int*>(malloc(sizeof(int)));
+  if (dirty_pages.supported()) {
+    ASSERT(dirty_pages.Clear());
+    ASSERT_EQ(getpid(), dirty_pages.cleared_pid_);
+
+    dirty_pages.BeginCollection();
+    ASSERT_EQ(false, dirty_pages.IsDirty(x, sizeof(int)));
+    dirty_pages.EndCollection();
+
+    *x = 42;
+    dirty_pages.BeginCollection();
+    ASSERT_EQ(true, dirty_pages.IsDirty(x, sizeof(int)));
+    dirty_pages.EndCollection();
+  } else {
+    // Every page is dirty
+    dirty_pages.BeginCollection();
+    ASSERT_EQ(true, dirty_pages.IsDirty(x, sizeof(int)));
+    dirty_pages.EndCollection();
+  }
+  free(x);
+
+  PASS();
+}
+
+TEST generational_test() {
+  gHeap.gc_mode_ = GcMode::Generational;
+  gHeap.dirty_pages_.Init();
+  gHeap.major_threshold_ = -1;  // start with a full collection
+
+  Node* old_node = nullptr;
+  List<BigStr*>* old_list = nullptr;
+  List<BigStr*>* big_list = nullptr;  // its slab isn't in a pool
+  BigStr* s = nullptr;
+  StackRoots _roots({&old_node, &old_list, &big_list, &s});
+
+  old_node = Alloc<Node>();
+  old_node->next_ = Alloc<Node>();
+  old_list = NewList<BigStr*>();
+  big_list = NewList<BigStr*>(nullptr, 100);
+  int num_live = gHeap.Collect();
+  int num_minor = gHeap.num_minor_collections_;
+
+  // A young object that's only reachable from old objects
+  old_list->append(StrFromC("young"));
+  big_list->set(99, StrFromC("young 2"));
+  old_node->next_->next_ = Alloc<Node>();
+  old_node->next_->next_->next_ = Alloc<Node>();
+
+  // Young garbage
+  for (int i = 0; i < 10; ++i) {
+    s = StrFromC("garbage");
+  }
+  s = nullptr;
+
+  // list slab + 2 strings + 2 nodes
+  ASSERT_EQ_FMT(num_live + 5, gHeap.Collect(), "%d");
+  ASSERT_EQ(num_minor + 1, gHeap.num_minor_collections_);
+  ASSERT(str_equals(StrFromC("young"), old_list->at(0)));
+  ASSERT(str_equals(StrFromC("young 2"), big_list->at(99)));
+  ASSERT(old_node->next_->next_->next_ != nullptr);
+
+  // Old garbage is kept until the next full collection
+  old_node->next_ = nullptr;
+  ASSERT_EQ_FMT(num_live + 5, gHeap.Collect(), "%d");
+  gHeap.major_threshold_ = -1;
+  ASSERT_EQ_FMT(num_live + 2, gHeap.Collect(), "%d");
+
+  // Every collection is timed
+  gHeap.PrintStats(STDERR_FILENO);
+
+  gHeap.gc_mode_ = GcMode::Full;
+  PASS();
+}
+
+TEST bytes_threshold_test() {
+  gHeap.Collect();
+  int64_t bytes_live = gHeap.bytes_live();
+  ASSERT_EQ_FMT(MiB(4), gHeap.bytes_threshold_, "%" PRId64);
+
+  // A few big strings trigger a collection before 1000 objects do
+  BigStr* s = nullptr;
+  StackRoots _roots({&s});
+  for (int i = 0; i < 3; ++i) {
+    s = OverAllocatedStr(MiB(1));
+    ASSERT_EQ(-1, gHeap.MaybeCollect());
+  }
+  s = OverAllocatedStr(MiB(1));
+  ASSERT(gHeap.bytes_live() > bytes_live + MiB(4));
+
+  int num_byte_triggers = gHeap.num_byte_triggers_;
+  ASSERT(gHeap.MaybeCollect() != -1);
+  ASSERT_EQ(num_byte_triggers + 1, gHeap.num_byte_triggers_);
+
+  // Only the last string survived
+  ASSERT(gHeap.bytes_live() > bytes_live + MiB(1));
+  ASSERT(gHeap.bytes_live() < bytes_live + MiB(2));
+  ASSERT(gHeap.last_survival_ < 0.5);
+
+  // Every GC point allocated 1 MiB, so the threshold is raised, up to the cap
+  ASSERT_EQ_FMT(MiB(4), gHeap.bytes_threshold_, "%" PRId64);
+  ASSERT_EQ(1, gHeap.num_by_reason_[ThresholdReason::MemoryCap]);
+
+  s = nullptr;
+  gHeap.Collect();
+  ASSERT_EQ_FMT(bytes_live, gHeap.bytes_live(), "%" PRId64);
+
+  PASS();
+}
+
 TEST pool_sanity_check() {
   Pool<2, 32> p;
 
@@ -357,6 +474,9 @@ int main(int argc, char **argv) {
   RUN_TEST(string_collection_test);
   RUN_TEST(list_collection_test);
   RUN_TEST(cycle_collection_test);
+  RUN_TEST(dirty_pages_test);
+  RUN_TEST(generational_test);
+  RUN_TEST(bytes_threshold_test);
 
   RUN_SUITE(pool_alloc);
 
@@ -37,6 +37,10 @@ ZERO = BigInt(0)
 ONE = BigInt(1)
 MINUS_ONE = BigInt(-1)
 
+# The range of BigInt in C++, for code that checks for overflow
+MAX_INT64 = BigInt(0x7FFFFFFFFFFFFFFF)
+MIN_INT64 = BigInt(-0x7FFFFFFFFFFFFFFF - 1)
+
 
 def ToStr(b):
     # type: (BigInt) -> str
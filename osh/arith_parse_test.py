@@ -11,6 +11,9 @@ arith_parse_test.py: Tests for arith_parse.py
 
 import unittest
 
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.option_asdl import option_i
+from _devbuild.gen.syntax_asdl import arith_expr, loc
 from _devbuild.gen.types_asdl import lex_mode_e
 from core import error
 from core import test_lib
@@ -179,5 +182,71 @@ class ArithTest(unittest.TestCase):
         #testSyntaxError('1 @ 2')
 
 
+class ArithParseCacheTest(unittest.TestCase):
+
+    def testCache(self):
+        arena = test_lib.MakeArena('<arith_parse_test.py>')
+        mem = state.Mem('', [], arena, [])
+        parse_opts, exec_opts, mutable_opts = state.MakeOpts(mem, None)
+        cache = sh_expr_eval.ArithParseCache(mutable_opts)
+
+        c_parser = test_lib.InitCommandParser('echo 1', arena=arena)
+        w1 = c_parser.ParseLogicalLine()
+        c_parser = test_lib.InitCommandParser('echo 2', arena=arena)
+        w2 = c_parser.ParseLogicalLine()
+        blame1 = loc.Word(w1.words[0])
+        blame2 = loc.Word(w2.words[0])
+
+        node = w1.words[0]  # CompoundWord is an arith_expr_t
+
+        self.assertEqual(None, cache.Get('i+1', blame1, False))
+        cache.Put('i+1', blame1, False, node)
+
+        # A different loc_t object pointing at the same token is a hit
+        self.assertEqual(node, cache.Get('i+1', loc.Word(w1.words[0]), False))
+
+        # Errors would be blamed on a different token
+        self.assertEqual(None, cache.Get('i+1', blame2, False))
+        # Different source_t for unset 'a[i]'
+        self.assertEqual(None, cache.Get('i+1', blame1, True))
+
+        # Parse options changed
+        mutable_opts.opt0_array[option_i.parse_backticks] = False
+        self.assertEqual(None, cache.Get('i+1', blame1, False))
+        mutable_opts.opt0_array[option_i.parse_backticks] = True
+        self.assertEqual(node, cache.Get('i+1', blame1, False))
+
+        self.assertEqual(2, cache.num_hits)
+        self.assertEqual(4, cache.num_misses)
+
+    def testEviction(self):
+        arena = test_lib.MakeArena('<arith_parse_test.py>')
+        mem = state.Mem('', [], arena, [])
+        parse_opts, exec_opts, mutable_opts = state.MakeOpts(mem, None)
+        cache = sh_expr_eval.ArithParseCache(mutable_opts)
+
+        node = arith_expr.Unary(Id.Arith_Minus, None)
+        n = sh_expr_eval._ARITH_CACHE_SIZE
+
+        for i in xrange(n):
+            cache.Put('x%d' % i, loc.Missing, False, node)
+        self.assertEqual(0, cache.num_evictions)
+
+        # x0 is used, so it survives the next generation
+        for i in xrange(n):
+            self.assertEqual(node, cache.Get('x0', loc.Missing, False))
+            cache.Put('y%d' % i, loc.Missing, False, node)
+
+        cache.Put('z', loc.Missing, False, node)
+        self.assertEqual(n - 1, cache.num_evictions)
+        self.assertEqual(node, cache.Get('x0', loc.Missing, False))
+        self.assertEqual(None, cache.Get('x1', loc.Missing, False))
+
+        # x0, y0 .. y(n-1), and z are left
+        self.assertEqual(
+            'hits %d  misses 1  hit_rate %d%%  evictions %d  size %d' %
+            (n + 1, (n + 1) * 100 // (n + 2), n - 1, n + 2), cache.Stats())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,7 @@ from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.syntax_asdl import (
     Token,
     CompoundWord,
+    word_shape_e,
     word,
     word_e,
     word_t,
@@ -254,7 +255,8 @@ def BraceDetect(w):
                 # ?  We're forcing braces right now but not commas.
                 if len(stack):
                     stack[-1].saw_comma = True
-                    stack[-1].alt_part.words.append(CompoundWord(cur_parts))
+                    stack[-1].alt_part.words.append(
+                        CompoundWord(cur_parts, word_shape_e.Unknown))
                     cur_parts = []  # clear
                     append = False
 
@@ -291,7 +293,8 @@ def BraceDetect(w):
                             -1].saw_comma:  # {foo} is not a real alternative
                         return None  # early return
 
-                    stack[-1].alt_part.words.append(CompoundWord(cur_parts))
+                    stack[-1].alt_part.words.append(
+                        CompoundWord(cur_parts, word_shape_e.Unknown))
 
                     frame = stack.pop()
                     cur_parts = frame.cur_parts
@@ -350,190 +353,403 @@ def _IntToString(i, width):
         return s
 
 
-def _RangeStrings(part):
-    # type: (word_part.BracedRange) -> List[str]
+class _AltIter(object):
+    """Iterates over the alternatives of a part, like {a,b} or {1..3}.
 
-    if part.kind == Id.Range_Int:
-        nums = []  # type: List[str]
+    A new iterator is on its first alternative, and there's always at least
+    one.
+    """
 
-        z1 = _LeadingZeros(part.start)
-        z2 = _LeadingZeros(part.end)
+    def __init__(self):
+        # type: () -> None
+        self.done = False
 
-        if z1 == 0 and z2 == 0:
-            width = 0
-        else:
-            if z1 < z2:
-                width = len(part.end)
+    def Reset(self):
+        # type: () -> None
+        """Go back to the first alternative."""
+        raise NotImplementedError()
+
+    def Done(self):
+        # type: () -> bool
+        return self.done
+
+    def Next(self):
+        # type: () -> None
+        raise NotImplementedError()
+
+    def AppendParts(self, out):
+        # type: (List[word_part_t]) -> None
+        """Append the parts of the current alternative."""
+        raise NotImplementedError()
+
+    def WriteStr(self, buf):
+        # type: (mylib.BufWriter) -> None
+        """Write the current alternative, which must be a literal."""
+        raise NotImplementedError()
+
+
+class _RangeIter(_AltIter):
+    """{1..10..2} or {z..a}
+
+    Values are computed as we go, not stored in a list.
+    """
+
+    def __init__(self, part):
+        # type: (word_part.BracedRange) -> None
+        _AltIter.__init__(self)
+        self.is_int = part.kind == Id.Range_Int
+
+        if self.is_int:
+            z1 = _LeadingZeros(part.start)
+            z2 = _LeadingZeros(part.end)
+
+            if z1 == 0 and z2 == 0:
+                self.width = 0
             else:
-                width = len(part.start)
-
-        n = int(part.start)
-        end = int(part.end)
-        step = part.step
-        if step > 0:
-            while True:
-                nums.append(_IntToString(n, width))
-                n += step
-                if n > end:
-                    break
+                if z1 < z2:
+                    self.width = len(part.end)
+                else:
+                    self.width = len(part.start)
+
+            self.start = int(part.start)
+            self.end = int(part.end)
+        else:  # Id.Range_Char
+            self.width = 0
+            self.start = ord(part.start)
+            self.end = ord(part.end)
+
+        self.step = part.step
+        self.n = self.start
+
+        # The token for n, which words share until n changes
+        self.tok = None  # type: Optional[Token]
+
+    def Reset(self):
+        # type: () -> None
+        self.n = self.start
+        self.tok = None
+        self.done = False
+
+    def Next(self):
+        # type: () -> None
+        self.n += self.step
+        self.tok = None
+        if self.step > 0:
+            self.done = self.n > self.end
         else:
-            while True:
-                nums.append(_IntToString(n, width))
-                n += step
-                if n < end:
-                    break
-
-        return nums
-
-    else:  # Id.Range_Char
-        chars = []  # type: List[str]
-
-        n = ord(part.start)
-        ord_end = ord(part.end)
-        step = part.step
-        if step > 0:
-            while True:
-                chars.append(chr(n))
-                n += step
-                if n > ord_end:
-                    break
+            self.done = self.n < self.end
+
+    def _Str(self):
+        # type: () -> str
+        if self.is_int:
+            return _IntToString(self.n, self.width)
         else:
-            while True:
-                chars.append(chr(n))
-                n += step
-                if n < ord_end:
-                    break
-
-        return chars
-
-
-def _ExpandPart(
-        parts,  # type: List[word_part_t]
-        first_alt_index,  # type: int
-        suffixes,  # type: List[List[word_part_t]]
-):
-    # type: (...) -> List[List[word_part_t]]
-    """Mutually recursive with _BraceExpand.
-
-    Args:
-      parts: input parts
-      first_alt_index: index of the first BracedTuple
-      suffixes: List of suffixes to append.
+            return chr(self.n)
+
+    def AppendParts(self, out):
+        # type: (List[word_part_t]) -> None
+
+        if self.tok is None:
+            # TODO: Does it help to preserve location info?
+            # t = Token(Id.Lit_Chars, expand_part.locs[0], s)
+            self.tok = lexer.DummyToken(Id.Lit_Chars, self._Str())
+        out.append(self.tok)
+
+    def WriteStr(self, buf):
+        # type: (mylib.BufWriter) -> None
+        buf.write(self._Str())
+
+
+class _TupleIter(_AltIter):
+    """{a,b,c}, where each alternative may have braces too."""
+
+    def __init__(self, part):
+        # type: (word_part.BracedTuple) -> None
+        _AltIter.__init__(self)
+        self.alts = []  # type: List[_PartsIter]
+        for w in part.words:
+            self.alts.append(_PartsIter(w.parts))
+        self.i = 0
+
+    def Reset(self):
+        # type: () -> None
+        self.i = 0
+        self.alts[0].Reset()
+        self.done = False
+
+    def Next(self):
+        # type: () -> None
+        alt = self.alts[self.i]
+        alt.Next()
+        if alt.Done():
+            self.i += 1
+            if self.i == len(self.alts):
+                self.done = True
+            else:
+                self.alts[self.i].Reset()
+
+    def AppendParts(self, out):
+        # type: (List[word_part_t]) -> None
+        self.alts[self.i].AppendParts(out)
+
+    def WriteStr(self, buf):
+        # type: (mylib.BufWriter) -> None
+        self.alts[self.i].WriteStr(buf)
+
+
+class _PartsIter(_AltIter):
+    """Iterates over the expansions of a list of parts.
+
+    Like an odometer, the last {} changes fastest, so B-{a,b}-{c,d}-E gives
+    B-a-c-E B-a-d-E B-b-c-E B-b-d-E.
     """
-    out = []  # type: List[List[word_part_t]]
-
-    prefix = parts[:first_alt_index]
-    expand_part = parts[first_alt_index]
-
-    UP_part = expand_part
-    with tagswitch(expand_part) as case:
-        if case(word_part_e.BracedTuple):
-            expand_part = cast(word_part.BracedTuple, UP_part)
-            # Call _BraceExpand on each of the inner words too!
-            expanded_alts = []  # type: List[List[word_part_t]]
-            for w in expand_part.words:
-                expanded_alts.extend(_BraceExpand(w.parts))
-
-            for alt_parts in expanded_alts:
-                for suffix in suffixes:
-                    out_parts = []  # type: List[word_part_t]
-                    out_parts.extend(prefix)
-                    out_parts.extend(alt_parts)
-                    out_parts.extend(suffix)
-                    out.append(out_parts)
-
-        elif case(word_part_e.BracedRange):
-            expand_part = cast(word_part.BracedRange, UP_part)
-            # Not mutually recursive with _BraceExpand
-            strs = _RangeStrings(expand_part)
-
-            # Often prefix and suffixes are empty, but there's not that much to
-            # optimize
-            # log('prefix %s, suffixes %s, strs %s', prefix, suffixes, strs)
-
-            for s in strs:
-                for suffix in suffixes:
-                    out_parts_ = []  # type: List[word_part_t]
-                    out_parts_.extend(prefix)
-
-                    # TODO: Does it help to preserve location info?
-                    # t = Token(Id.Lit_Chars, expand_part.locs[0], s)
-                    t = lexer.DummyToken(Id.Lit_Chars, s)
-
-                    out_parts_.append(t)
-                    out_parts_.extend(suffix)
-                    out.append(out_parts_)
 
-        else:
-            raise AssertionError()
+    def __init__(self, parts):
+        # type: (List[word_part_t]) -> None
+        _AltIter.__init__(self)
+        self.parts = parts
+
+        self.alts = []  # type: List[_AltIter]
+        for part in parts:
+            UP_part = part
+            with tagswitch(part) as case:
+                if case(word_part_e.BracedTuple):
+                    part = cast(word_part.BracedTuple, UP_part)
+                    self.alts.append(_TupleIter(part))
+
+                elif case(word_part_e.BracedRange):
+                    part = cast(word_part.BracedRange, UP_part)
+                    self.alts.append(_RangeIter(part))
+
+    def Reset(self):
+        # type: () -> None
+        for alt in self.alts:
+            alt.Reset()
+        self.done = False
 
-    return out
+    def Next(self):
+        # type: () -> None
+        i = len(self.alts) - 1
+        while i >= 0:
+            alt = self.alts[i]
+            alt.Next()
+            if not alt.Done():
+                return
+            alt.Reset()  # carry to the {} on the left
+            i -= 1
+
+        self.done = True
+
+    def AppendParts(self, out):
+        # type: (List[word_part_t]) -> None
+        i = 0
+        for part in self.parts:
+            if part.tag() in (word_part_e.BracedTuple,
+                              word_part_e.BracedRange):
+                self.alts[i].AppendParts(out)
+                i += 1
+            else:
+                out.append(part)
+
+    def WriteStr(self, buf):
+        # type: (mylib.BufWriter) -> None
+        i = 0
+        for part in self.parts:
+            if part.tag() in (word_part_e.BracedTuple,
+                              word_part_e.BracedRange):
+                self.alts[i].WriteStr(buf)
+                i += 1
+            else:
+                buf.write(lexer.LazyStr(cast(Token, part)))
 
 
-def _BraceExpand(parts):
-    # type: (List[word_part_t]) -> List[List[word_part_t]]
-    """Mutually recursive with _ExpandPart."""
+def _IsLiteral(parts):
+    # type: (List[word_part_t]) -> bool
+    for part in parts:
+        UP_part = part
+        with tagswitch(part) as case:
+            if case(word_part_e.Literal):
+                tok = cast(Token, UP_part)
+                # Not Lit_Star, Lit_Tilde, etc.
+                if tok.id not in (Id.Lit_Chars, Id.Lit_Comma, Id.Lit_Equals):
+                    return False
+
+            elif case(word_part_e.BracedTuple):
+                part = cast(word_part.BracedTuple, UP_part)
+                for w in part.words:
+                    if not _IsLiteral(w.parts):
+                        return False
+
+            elif case(word_part_e.BracedRange):
+                pass
 
-    # manual GC point, because brace expansion is a separate stage that does a
-    # bunch of computation outside the interpreter
-    mylib.MaybeCollect()
+            else:
+                return False
 
-    num_alts = 0
-    first_alt_index = -1
-    for i, part in enumerate(parts):
-        tag = part.tag()
-        if tag in (word_part_e.BracedTuple, word_part_e.BracedRange):
-            num_alts += 1
-            if num_alts == 1:
-                first_alt_index = i
-            elif num_alts == 2:
-                break  # don't need to count anymore
-
-    # NOTE: There are TWO recursive calls here, not just one -- one for
-    # nested {}, and one for adjacent {}.  This is hard to do iteratively.
-    if num_alts == 0:
-        return [parts]
-
-    elif num_alts == 1:
-        suffix = parts[first_alt_index + 1:]
-        return _ExpandPart(parts, first_alt_index, [suffix])
+    return True
 
-    else:
-        # Now call it on the tail
-        tail_parts = parts[first_alt_index + 1:]
-        suffixes = _BraceExpand(tail_parts)  # recursive call
-        return _ExpandPart(parts, first_alt_index, suffixes)
+
+def IsLiteral(words):
+    # type: (List[word_t]) -> bool
+    """Do the words expand to plain strings, with no substitutions or globs?
+
+    Then BraceIter.Str() is the same as evaluating BraceIter.Value().  For
+    example, {1..3} and x{a,b}y are literal, but {a,b}$x and {a,b}* aren't.
+    """
+    for w in words:
+        UP_w = w
+        with tagswitch(w) as case:
+            if case(word_e.BracedTree):
+                w = cast(word.BracedTree, UP_w)
+                if not _IsLiteral(w.parts):
+                    return False
+
+            elif case(word_e.Compound):
+                w = cast(CompoundWord, UP_w)
+                if not _IsLiteral(w.parts):
+                    return False
+
+            else:
+                raise AssertionError(w.tag())
+
+    return True
+
+
+def _ExpandedWord(parts):
+    # type: (List[word_part_t]) -> CompoundWord
+    expanded = CompoundWord(parts, word_shape_e.Unknown)
+
+    # Now do tilde detection on brace-expanded word
+    ti = word_.TildeDetect2(expanded)
+    if ti:
+        return ti
+    return expanded
+
+
+class BraceIter(object):
+    """Expands words one at a time.
+
+    Nothing is materialized, so for i in {1..1000000} doesn't need a list of a
+    million words.
+    """
+
+    def __init__(self, words):
+        # type: (List[word_t]) -> None
+        self.words = words
+        self.i = 0
+        self.parts_it = None  # type: Optional[_PartsIter]
+        self._Start()
+
+    def _Start(self):
+        # type: () -> None
+        self.parts_it = None
+        if self.i == len(self.words):
+            return
+
+        UP_w = self.words[self.i]
+        if UP_w.tag() == word_e.BracedTree:
+            w = cast(word.BracedTree, UP_w)
+            self.parts_it = _PartsIter(w.parts)
+
+    def Done(self):
+        # type: () -> bool
+        return self.i == len(self.words)
+
+    def Next(self):
+        # type: () -> None
+        if self.parts_it:
+            self.parts_it.Next()
+            if not self.parts_it.Done():
+                return
+
+        self.i += 1
+        self._Start()
+
+    def Value(self):
+        # type: () -> CompoundWord
+        """The current word."""
+        if self.parts_it is None:
+            UP_w = self.words[self.i]
+            if UP_w.tag() != word_e.Compound:
+                raise AssertionError(UP_w.tag())
+
+            # Already did tilde detection before expansion
+            return cast(CompoundWord, UP_w)
+
+        parts = []  # type: List[word_part_t]
+        self.parts_it.AppendParts(parts)
+        return _ExpandedWord(parts)
+
+    def Str(self):
+        # type: () -> str
+        """The current word as a string, if IsLiteral() is true."""
+        buf = mylib.BufWriter()
+        if self.parts_it is None:
+            w = cast(CompoundWord, self.words[self.i])
+            for part in w.parts:
+                buf.write(lexer.LazyStr(cast(Token, part)))
+        else:
+            self.parts_it.WriteStr(buf)
+        return buf.getvalue()
 
 
 def BraceExpandWords(words):
     # type: (List[word_t]) -> List[CompoundWord]
+    # manual GC point, because brace expansion is a separate stage that does a
+    # bunch of computation outside the interpreter.  Not in BraceIter, because
+    # a constructor's 'this' isn't a root.  A for loop over BraceIter collects
+    # before each statement of its body.
+    mylib.MaybeCollect()
+
     out = []  # type: List[CompoundWord]
     for w in words:
         UP_w = w
         with tagswitch(w) as case:
             if case(word_e.BracedTree):
                 w = cast(word.BracedTree, UP_w)
-                # Note: for the case of {1..100000}, this is a flat list of Token.
-                # Would be nice to optimize, but we don't really know the structure
-                # ahead of time
-                parts_list = _BraceExpand(w.parts)
-                for parts in parts_list:
-                    expanded = CompoundWord(parts)
-
-                    # Now do tilde detection on brace-expanded word
-                    ti = word_.TildeDetect2(expanded)
-                    if ti:
-                        out.append(ti)
-                    else:
-                        out.append(expanded)
+                _AppendExpansions(w.parts, out)
 
             elif case(word_e.Compound):
                 w = cast(CompoundWord, UP_w)
-
-                # Already did tilde detection before expansion
                 out.append(w)
 
             else:
                 raise AssertionError(w.tag())
 
     return out
+
+
+def _AppendExpansions(parts, out):
+    # type: (List[word_part_t], List[CompoundWord]) -> None
+    """Append the words that a BracedTree expands to.
+
+    Like BraceIter, but faster when all the words are needed.  The last {}
+    changes fastest, so its alternatives are expanded once, and appended to
+    each expansion of the parts before it.  That's a few list operations per
+    word, rather than a few method calls.
+    """
+    last_pos = len(parts) - 1
+    while parts[last_pos].tag() not in (word_part_e.BracedTuple,
+                                        word_part_e.BracedRange):
+        last_pos -= 1
+    suffix = parts[last_pos + 1:]
+
+    last_alts = []  # type: List[List[word_part_t]]
+    it = _PartsIter(parts[last_pos:last_pos + 1])
+    while not it.Done():
+        alt_parts = []  # type: List[word_part_t]
+        it.AppendParts(alt_parts)
+        last_alts.append(alt_parts)
+        it.Next()
+
+    prefix_it = _PartsIter(parts[:last_pos])
+    while not prefix_it.Done():
+        prefix = []  # type: List[word_part_t]
+        prefix_it.AppendParts(prefix)
+        for alt_parts in last_alts:
+            word_parts = []  # type: List[word_part_t]
+            word_parts.extend(prefix)
+            word_parts.extend(alt_parts)
+            word_parts.extend(suffix)
+            out.append(_ExpandedWord(word_parts))
+        prefix_it.Next()
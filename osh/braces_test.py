@@ -7,7 +7,7 @@ import sys
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.syntax_asdl import word_part_e, CompoundWord
+from _devbuild.gen.syntax_asdl import word_part_e, word_shape_e, CompoundWord
 from asdl import format as fmt
 from core.test_lib import FakeTok
 from mycpp.mylib import log
@@ -20,6 +20,32 @@ def _assertReadWord(*args):
     return word_parse_test._assertReadWord(*args)
 
 
+def _Expand(parts):
+    """Returns a list of expanded parts lists."""
+    results = []
+    it = braces._PartsIter(parts)
+    while not it.Done():
+        out = []
+        it.AppendParts(out)
+        results.append(out)
+        it.Next()
+    return results
+
+
+def _ExpandStrs(test, s):
+    """Expands the word s, which must be literal, to a list of strings."""
+    w = _assertReadWord(test, s)
+    tree = braces.BraceDetect(w) or w
+    test.assertTrue(braces.IsLiteral([tree]))
+
+    strs = []
+    it = braces.BraceIter([tree])
+    while not it.Done():
+        strs.append(it.Str())
+        it.Next()
+    return strs
+
+
 def _PrettyPrint(n):
     """Prints in color."""
     ast_f = fmt.DetectConsoleOutput(sys.stdout)
@@ -142,10 +168,10 @@ class BracesTest(unittest.TestCase):
 
     def testBraceExpand(self):
         w = _assertReadWord(self, 'hi')
-        results = braces._BraceExpand(w.parts)
+        results = _Expand(w.parts)
         self.assertEqual(1, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, word_shape_e.Unknown))
             print('')
 
         w = _assertReadWord(self, 'B-{a,b}-E')
@@ -153,10 +179,10 @@ class BracesTest(unittest.TestCase):
         self.assertEqual(3, len(tree.parts))
         _PrettyPrint(tree)
 
-        results = braces._BraceExpand(tree.parts)
+        results = _Expand(tree.parts)
         self.assertEqual(2, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, word_shape_e.Unknown))
             print('')
 
         w = _assertReadWord(self, 'B-{a,={b,c,d}=,e}-E')
@@ -164,10 +190,10 @@ class BracesTest(unittest.TestCase):
         self.assertEqual(3, len(tree.parts))
         _PrettyPrint(tree)
 
-        results = braces._BraceExpand(tree.parts)
+        results = _Expand(tree.parts)
         self.assertEqual(5, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, word_shape_e.Unknown))
             print('')
 
         w = _assertReadWord(self, 'B-{a,b}-{c,d}-E')
@@ -175,12 +201,52 @@ class BracesTest(unittest.TestCase):
         self.assertEqual(5, len(tree.parts))
         _PrettyPrint(tree)
 
-        results = braces._BraceExpand(tree.parts)
+        results = _Expand(tree.parts)
         self.assertEqual(4, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, word_shape_e.Unknown))
             print('')
 
+    def testBraceIter(self):
+        CASES = [
+            ('hi', ['hi']),
+            ('B-{a,b}-{c,d}-E', ['B-a-c-E', 'B-a-d-E', 'B-b-c-E', 'B-b-d-E']),
+            ('B-{a,={b,c}=,e}-E', ['B-a-E', 'B-=b=-E', 'B-=c=-E', 'B-e-E']),
+            ('{1..3}', ['1', '2', '3']),
+            ('{3..-3..-2}', ['3', '1', '-1', '-3']),
+            ('{1..6..2}', ['1', '3', '5']),
+            ('{01..3}', ['01', '02', '03']),
+            ('{1..010..4}', ['001', '005', '009']),
+            ('{z..v..-2}', ['z', 'x', 'v']),
+            ('{a..b}{1..2}', ['a1', 'a2', 'b1', 'b2']),
+            ('x{{a,b}{1..2},c}y', ['xa1y', 'xa2y', 'xb1y', 'xb2y', 'xcy']),
+        ]
+        for s, expected in CASES:
+            self.assertEqual(expected, _ExpandStrs(self, s))
+
+        # The same strings as the words
+        w = _assertReadWord(self, 'x{{a,b}{1..2},c}y')
+        tree = braces.BraceDetect(w)
+        words = braces.BraceExpandWords([tree])
+        self.assertEqual(5, len(words))
+
+    def testIsLiteral(self):
+        CASES = [
+            ('x{a,b}y', True),
+            ('{1..3}', True),
+            ('{a,b}$x', False),
+            ('{a,b}*', False),
+            ('{a,"b"}', False),
+            ('{~,b}', False),
+        ]
+        for s, expected in CASES:
+            w = _assertReadWord(self, s)
+            tree = braces.BraceDetect(w)
+            self.assertEqual(expected, braces.IsLiteral([tree]), s)
+
+        w = _assertReadWord(self, 'hi')
+        self.assertEqual(True, braces.IsLiteral([w]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -26,6 +26,7 @@ from _devbuild.gen.syntax_asdl import (
     loc_e,
     Token,
     CompoundWord,
+    word_shape_e,
     command,
     command_e,
     command_t,
@@ -66,6 +67,7 @@ from _devbuild.gen.types_asdl import redir_arg_type_e
 from _devbuild.gen.value_asdl import (value, value_e, value_t, y_lvalue,
                                       y_lvalue_e, y_lvalue_t, LeftName)
 
+from core import bash_array
 from core import dev
 from core import error
 from core import executor
@@ -199,10 +201,10 @@ def PlusEquals(old_val, val):
                 to_append = cast(value.BashArray, UP_val)
 
                 # TODO: MUTATE the existing value for efficiency?
-                strs = []  # type: List[str]
-                strs.extend(old_val.strs)
-                strs.extend(to_append.strs)
-                val = value.BashArray(strs)
+                new_val = bash_array.Copy(old_val)
+                bash_array.AppendValues(new_val,
+                                        bash_array.GetValues(to_append))
+                val = new_val
 
             else:
                 raise AssertionError()  # parsing should prevent this
@@ -251,6 +253,43 @@ class ctx_ErrTrap(object):
         self.cmd_ev.running_err_trap = False
 
 
+class _BraceWordsIter(val_ops._ContainerIter):
+    """ for x in {1..1000000}; do
+
+    Only for words where braces.IsLiteral() is true.
+    """
+
+    def __init__(self, brace_it):
+        # type: (braces.BraceIter) -> None
+        val_ops._ContainerIter.__init__(self)
+        self.brace_it = brace_it
+        self.s = None  # type: str
+        self._SkipEmpty()
+
+    def _SkipEmpty(self):
+        # type: () -> None
+        """Like EvalWordSequence(), elide empty words, e.g. from {a,}"""
+        while not self.brace_it.Done():
+            self.s = self.brace_it.Str()
+            if len(self.s):
+                return
+            self.brace_it.Next()
+
+    def Done(self):
+        # type: () -> int
+        return self.brace_it.Done()
+
+    def FirstValue(self):
+        # type: () -> value_t
+        return value.Str(self.s)
+
+    def Next(self):
+        # type: () -> None
+        val_ops._ContainerIter.Next(self)
+        self.brace_it.Next()
+        self._SkipEmpty()
+
+
 class CommandEvaluator(object):
     """Executes the program by tree-walking.
 
@@ -502,8 +541,8 @@ class CommandEvaluator(object):
 
             elif case(redir_param_e.HereDoc):
                 arg = cast(redir_param.HereDoc, UP_arg)
-                w = CompoundWord(
-                    arg.stdin_parts)  # HACK: Wrap it in a word to eval
+                # HACK: Wrap it in a word to eval
+                w = CompoundWord(arg.stdin_parts, word_shape_e.Unknown)
                 val = self.word_ev.EvalWordToString(w)
                 assert val.tag() == value_e.Str, val
                 result.arg = redirect_arg.HereDoc(val.s)
@@ -1174,6 +1213,7 @@ class CommandEvaluator(object):
 
         # for the 2 kinds of shell loop
         iter_list = None  # type: List[str]
+        brace_it = None  # type: Optional[braces.BraceIter]
 
         # for YSH loop
         iter_expr = None  # type: expr_t
@@ -1188,8 +1228,13 @@ class CommandEvaluator(object):
 
             elif case(for_iter_e.Words):
                 iterable = cast(for_iter.Words, UP_iterable)
-                words = braces.BraceExpandWords(iterable.words)
-                iter_list = self.word_ev.EvalWordSequence(words)
+                if braces.IsLiteral(iterable.words):
+                    # e.g. for i in {1..1000000}.  Evaluating the words has no
+                    # effects, so we can expand them as the loop runs.
+                    brace_it = braces.BraceIter(iterable.words)
+                else:
+                    words = braces.BraceExpandWords(iterable.words)
+                    iter_list = self.word_ev.EvalWordSequence(words)
 
             elif case(for_iter_e.YshExpr):
                 iterable = cast(for_iter.YshExpr, UP_iterable)
@@ -1205,7 +1250,7 @@ class CommandEvaluator(object):
         name2 = None  # type: Optional[LeftName]
 
         it2 = None  # type: val_ops._ContainerIter
-        if iter_list is None:  # for_expr.YshExpr
+        if iter_list is None and brace_it is None:  # for_expr.YshExpr
             val = self.expr_ev.EvalExpr(iter_expr, expr_blame)
 
             UP_val = val
@@ -1262,7 +1307,10 @@ class CommandEvaluator(object):
                                         node.keyword)
         else:
             #log('iter list %s', iter_list)
-            it2 = val_ops.ArrayIter(iter_list)
+            if brace_it:
+                it2 = _BraceWordsIter(brace_it)
+            else:
+                it2 = val_ops.ArrayIter(iter_list)
 
             if n == 1:
                 name1 = location.LName(node.iter_names[0])
@@ -2068,6 +2116,16 @@ class CommandEvaluator(object):
 
         return status
 
+    def EvalLoopBody(self, block):
+        # type: (command_t) -> int
+        """For builtins that run a block for each item, like json read --lines.
+
+        Like EvalCommand(), but break, continue, and return raise
+        vm.IntControlFlow, as they do in a for loop.  The caller should be in
+        ctx_LoopLevel, and call e.HandleLoop().
+        """
+        return self._Execute(block)
+
     def MaybeRunExitTrap(self, mut_status):
         # type: (IntParamBox) -> None
         """If an EXIT trap handler exists, run it.
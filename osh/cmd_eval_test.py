@@ -12,7 +12,8 @@ cmd_eval_test.py: Tests for cmd_eval.py
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.syntax_asdl import (BracedVarSub, suffix_op, CompoundWord)
+from _devbuild.gen.syntax_asdl import (BracedVarSub, suffix_op, CompoundWord,
+                                       word_shape_e)
 from core import test_lib
 from frontend.lexer import DummyToken as Tok
 
@@ -62,7 +63,7 @@ class VarOpTest(unittest.TestCase):
 
         # Now add some ops
         part = Tok(Id.Lit_Chars, 'default')
-        arg_word = CompoundWord([part])
+        arg_word = CompoundWord([part], word_shape_e.Unknown)
         op_tok = Tok(Id.VTest_ColonHyphen, ':-')
         test_op = suffix_op.Unary(op_tok, arg_word)
         unset_sub.suffix_op = test_op
@@ -38,6 +38,7 @@ from _devbuild.gen.syntax_asdl import (
     word_e,
     word_t,
     CompoundWord,
+    word_shape_e,
     Token,
     word_part_e,
     word_part_t,
@@ -274,7 +275,7 @@ def _MakeAssignPair(parse_ctx, preparsed, arena):
     if offset == n:
         rhs = rhs_word.Empty  # type: rhs_word_t
     else:
-        w = CompoundWord(parts[offset:])
+        w = CompoundWord(parts[offset:], word_shape_e.Unknown)
         word_.TildeDetectAssign(w)
         rhs = w
 
@@ -308,7 +309,7 @@ def _AppendMoreEnv(preparsed_list, more_env):
         if offset == n:
             rhs = rhs_word.Empty  # type: rhs_word_t
         else:
-            w = CompoundWord(parts[offset:])
+            w = CompoundWord(parts[offset:], word_shape_e.Unknown)
             word_.TildeDetectAssign(w)
             rhs = w
 
@@ -376,6 +377,7 @@ def _MakeSimpleCommand(
     # doesn't seem worth it.
     words2 = braces.BraceDetectAll(suffix_words)
     words3 = word_.TildeDetectAll(words2)
+    word_.DetectShapes(words3)
 
     more_env = []  # type: List[EnvPair]
     _AppendMoreEnv(preparsed_list, more_env)
@@ -1481,6 +1483,7 @@ class CommandParser(object):
 
                 words2 = braces.BraceDetectAll(iter_words)
                 words3 = word_.TildeDetectAll(words2)
+                word_.DetectShapes(words3)
                 node.iterable = for_iter.Words(words3)
 
                 # Now that we know there are words, do an extra check
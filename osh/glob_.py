@@ -1,6 +1,7 @@
 """Glob_.py."""
 
 import libc
+from libc import DIRENT_DIR, DIRENT_SYMLINK, FNM_CASEFOLD
 
 from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.syntax_asdl import (
@@ -14,9 +15,10 @@ from _devbuild.gen.syntax_asdl import (
 from core import pyutil
 from frontend import match
 from mycpp import mylib
-from mycpp.mylib import log, print_stderr
+from mycpp.mylib import log
+from pylib import path_stat
 
-from typing import List, Tuple, cast, TYPE_CHECKING
+from typing import List, Optional, Tuple, cast, TYPE_CHECKING
 if TYPE_CHECKING:
     from core import optview
     from frontend.match import SimpleLexer
@@ -108,6 +110,26 @@ def ExtendedRegexEscape(s):
     return pyutil.BackslashEscape(s, ERE_META_CHARS)
 
 
+def CanGlobUnescape(s):
+    # type: (str) -> bool
+    """Can GlobUnescape() be called on this string?
+
+    Escaped glob metacharacters like \\* are OK, but a pattern like \\f can
+    come from an unquoted variable.  As a glob it means 'f'.
+    """
+    i = 0
+    n = len(s)
+    while i < n:
+        if mylib.ByteEquals(mylib.ByteAt(s, i), '\\'):
+            if i == n - 1:
+                return False
+            i += 1
+            if not mylib.ByteInSet(mylib.ByteAt(s, i), GLOB_META_CHARS):
+                return False
+        i += 1
+    return True
+
+
 def GlobUnescape(s):
     # type: (str) -> str
     """Remove glob escaping from a string.
@@ -171,47 +193,67 @@ class _GlobParser(object):
           case, we also append a warning.
         """
         first_token = glob_part.Literal(self.token_type, self.token_val)
-        balance = 1  # We already saw a [
         tokens = []  # type: List[Tuple[Id_t, str]]
 
-        # NOTE: There is a special rule where []] and [[] are valid globs.  Also
-        # [^[] and sometimes [^]], although that one is ambiguous!
-        # And [[:space:]] and [[.class.]] has to be taken into account too.  I'm
-        # punting on this now because the rule isn't clear and consistent between
-        # shells.
+        # The POSIX rules, which libc glob() follows:
+        #
+        # - [! or [^ negates the class
+        # - ] right after that is a member, so []] and [!]] are valid
+        # - [ is a member, so [[] is valid, unless it starts a class name like
+        #   [:space:], [.a.], or [=a=]
+        negated = False
+        first = 0  # index of the first member
+        class_name_delim = ''  # e.g. : inside [:space:]
 
         while True:
             self._Next()
+            id_ = self.token_type
+            s = self.token_val
 
-            if self.token_type == Id.Eol_Tok:
+            malformed = id_ == Id.Eol_Tok
+            if len(class_name_delim) and id_ == Id.Glob_LBracket:
+                malformed = True  # e.g. [[:spa[ce:]]
+
+            if malformed:
                 # TODO: location info
                 self.warnings.append(
                     'Malformed character class; treating as literal')
                 parts = [first_token]  # type: List[glob_part_t]
-                for (id_, s) in tokens:
+                for (tok_id, tok_s) in tokens:
+                    parts.append(glob_part.Literal(tok_id, tok_s))
+                if id_ != Id.Eol_Tok:
+                    # Parse the rest of the pattern
                     parts.append(glob_part.Literal(id_, s))
                 return parts
 
-            if self.token_type == Id.Glob_LBracket:
-                balance += 1
-            elif self.token_type == Id.Glob_RBracket:
-                balance -= 1
-
-            if balance == 0:
-                break
-            tokens.append(
-                (self.token_type, self.token_val))  # Don't append the last ]
-
-        negated = False
-        if len(tokens):
-            id1, _ = tokens[0]
-            # NOTE: Both ! and ^ work for negation in globs
-            # https://www.gnu.org/software/bash/manual/html_node/Pattern-Matching.html#Pattern-Matching
-            # TODO: Warn about the one that's not recommended?
-            if id1 in (Id.Glob_Bang, Id.Glob_Caret):
+            n = len(tokens)
+            if n == 0 and id_ in (Id.Glob_Bang, Id.Glob_Caret):
+                # NOTE: Both ! and ^ work for negation in globs
+                # https://www.gnu.org/software/bash/manual/html_node/Pattern-Matching.html#Pattern-Matching
+                # TODO: Warn about the one that's not recommended?
                 negated = True
-                tokens = tokens[1:]
-        strs = [s for _, s in tokens]
+                first = 1
+
+            elif id_ == Id.Glob_RBracket:
+                if len(class_name_delim):
+                    # The ] in :], unless the class name is empty
+                    prev_id, prev_s = tokens[n - 1]
+                    prev2_id, prev2_s = tokens[n - 2]
+                    if (prev_s == class_name_delim and
+                            prev2_id != Id.Glob_LBracket):
+                        class_name_delim = ''
+                elif n > first:
+                    break  # Don't append the last ]
+
+            elif (id_ == Id.Glob_OtherLiteral and s in ':.=' and n > first and
+                  len(class_name_delim) == 0):
+                prev_id, prev_s = tokens[n - 1]
+                if prev_id == Id.Glob_LBracket:
+                    class_name_delim = s
+
+            tokens.append((id_, s))
+
+        strs = [tok_s for _, tok_s in tokens[first:]]
         return [glob_part.CharClass(negated, strs)]
 
     def Parse(self):
@@ -378,6 +420,190 @@ def GlobToERE(pat):
     return regex, warnings
 
 
+def _LiteralText(parts):
+    # type: (List[glob_part_t]) -> str
+    """The string that a glob without operators or char classes matches."""
+    out = []  # type: List[str]
+    for part in parts:
+        lit = cast(glob_part.Literal, part)
+        if lit.id == Id.Glob_EscapedChar:
+            out.append(lit.s[1:])
+        else:
+            out.append(lit.s)
+    return ''.join(out)
+
+
+class _Component(object):
+    """One slash-separated part of a glob pattern, like usr or *.py."""
+
+    def __init__(self, literal, pat, explicit_dot, globstar):
+        # type: (Optional[str], str, bool, bool) -> None
+
+        # If there are no glob operators, the name to look up without reading
+        # the directory
+        self.literal = literal
+
+        # Matched against names in the directory with fnmatch(), which works
+        # on bytes that aren't valid UTF-8, unlike regcomp() in a UTF-8 locale
+        self.pat = pat
+        self.explicit_dot = explicit_dot  # .* matches hidden files
+        self.globstar = globstar  # ** with shopt -s globstar
+
+        # Literal text at the start and end of the pattern, which rejects most
+        # names without fnmatch().  If there's nothing but a * in between, like
+        # *.py, fnmatch() isn't needed at all.
+        self.prefix = ''
+        self.suffix = ''
+        self.only_star = False
+
+
+def _ParseComponent(s, globstar):
+    # type: (str, bool) -> _Component
+    if globstar and s == '**':
+        return _Component(None, '', False, True)
+
+    lexer = match.GlobLexer(s)
+    parts, _ = _GlobParser(lexer).Parse()
+
+    # Indices of the first and last operator or char class
+    first = -1
+    last = -1
+    num_stars = 0
+    for i, part in enumerate(parts):
+        tag = part.tag()
+        if tag in (glob_part_e.Operator, glob_part_e.CharClass):
+            if first == -1:
+                first = i
+            last = i
+            if (tag == glob_part_e.Operator and
+                    cast(glob_part.Operator, part).op_id == Id.Glob_Star):
+                num_stars += 1
+
+    if first == -1:
+        return _Component(_LiteralText(parts), '', False, False)
+
+    prefix = _LiteralText(parts[:first])
+    comp = _Component(None, s, prefix.startswith('.'), False)
+    comp.prefix = prefix
+    comp.suffix = _LiteralText(parts[last + 1:])
+    comp.only_star = first == last and num_stars == 1
+    return comp
+
+
+class _GlobWalker(object):
+    """Matches a glob pattern by walking the file system.
+
+    Components without glob operators are looked up directly, so a pattern
+    like src/osh/*.py reads only one directory.  A directory that matches more
+    than one component, like the ** in **/*.py, is read only once.
+    """
+
+    def __init__(self, comps, dotglob, nocaseglob, out):
+        # type: (List[_Component], bool, bool, List[str]) -> None
+        self.comps = comps
+        self.dotglob = dotglob
+        self.flags = FNM_CASEFOLD if nocaseglob else 0
+        self.out = out
+
+    def _Visible(self, comp, name):
+        # type: (_Component, str) -> bool
+        """Hidden files only match patterns that start with a dot."""
+        return (self.dotglob or comp.explicit_dot or
+                not name.startswith('.'))
+
+    def _Matches(self, comp, name):
+        # type: (_Component, str) -> bool
+        if not self._Visible(comp, name):
+            return False
+
+        if self.flags == 0:  # the literal parts are case-sensitive
+            if (len(name) < len(comp.prefix) + len(comp.suffix) or
+                    not name.startswith(comp.prefix) or
+                    not name.endswith(comp.suffix)):
+                return False
+            if comp.only_star:
+                return True
+
+        return libc.fnmatch(comp.pat, name, self.flags)
+
+    def Walk(self, prefix, i):
+        # type: (str, int) -> None
+        """Match self.comps[i:] against the directory named by prefix.
+
+        prefix is empty, or it ends with /
+        """
+        comp = self.comps[i]
+        if comp.literal is not None:
+            path = prefix + comp.literal
+            if i == len(self.comps) - 1:
+                if path_stat.exists(path):
+                    self.out.append(path)
+            elif path_stat.isdir(path):
+                self.Walk(path + '/', i + 1)
+            return
+
+        try:
+            entries = libc.listdir_kinds(prefix if len(prefix) else '.')
+        except OSError:
+            return  # like other shells, skip directories we can't read
+
+        self._WalkEntries(prefix, entries, i)
+
+    def _WalkEntries(self, prefix, entries, i):
+        # type: (str, List[Tuple[str, int]], int) -> None
+        comp = self.comps[i]
+        last = i == len(self.comps) - 1
+
+        if comp.globstar:
+            if last:
+                # ** at the end matches all files and directories
+                for name, kind in entries:
+                    if self._Visible(comp, name):
+                        self.out.append(prefix + name)
+                        if kind == DIRENT_DIR:
+                            self.Walk(prefix + name + '/', i)
+                return
+
+            # Match zero directories, reusing the entries we already read
+            if self.comps[i + 1].literal is None:
+                self._WalkEntries(prefix, entries, i + 1)
+            else:
+                self.Walk(prefix, i + 1)
+
+            # Then one or more.  Like bash, don't follow symlinks, which could
+            # form a cycle.
+            for name, kind in entries:
+                if kind == DIRENT_DIR and self._Visible(comp, name):
+                    self.Walk(prefix + name + '/', i)
+            return
+
+        for name, kind in entries:
+            if not self._Matches(comp, name):
+                continue
+
+            path = prefix + name
+            if last:
+                self.out.append(path)
+            elif kind == DIRENT_DIR or (kind == DIRENT_SYMLINK and
+                                        path_stat.isdir(path)):
+                self.Walk(path + '/', i + 1)
+
+
+def _SplitPattern(pat, globstar):
+    # type: (str, bool) -> Tuple[str, List[_Component]]
+    """Split a pattern like /usr/*/bin into the root / and its components."""
+    i = 0
+    n = len(pat)
+    while i < n and mylib.ByteEquals(mylib.ByteAt(pat, i), '/'):
+        i += 1
+    root = pat[:i]
+
+    comps = []  # type: List[_Component]
+    for s in pat[i:].split('/'):
+        comps.append(_ParseComponent(s, globstar))
+    return root, comps
+
+
 # Notes for implementing extglob
 # - libc glob() doesn't have any extension!
 # - Nix stdenv uses !(foo) and @(foo|bar)
@@ -399,10 +625,7 @@ class Globber(object):
 
         # Other unimplemented bash options:
         #
-        # dotglob           dotfiles are matched
-        # globstar          ** for directories
         # globasciiranges   ascii or unicode char classes (unicode by default)
-        # nocaseglob
         # extglob          the @() !() syntax -- libc helps us with fnmatch(), but
         #                  not glob().
         #
@@ -412,17 +635,17 @@ class Globber(object):
 
     def _Glob(self, arg, out):
         # type: (str, List[str]) -> int
-        try:
-            results = libc.glob(arg)
-        except RuntimeError as e:
-            # These errors should be rare: I/O error, out of memory, or unknown
-            # There are no syntax errors.  (But see comment about globerr() in
-            # native/libc.c.)
-            # note: MyPy doesn't know RuntimeError has e.message (and e.args)
-            msg = e.message  # type: str
-            print_stderr("Error expanding glob %r: %s" % (arg, msg))
-            raise
-        #log('glob %r -> %r', arg, g)
+        """Expand a glob with our own engine, not libc glob().
+
+        It implements shopt -s globstar, dotglob, and nocaseglob.
+        """
+        root, comps = _SplitPattern(arg, self.exec_opts.globstar())
+
+        results = []  # type: List[str]
+        walker = _GlobWalker(comps, self.exec_opts.dotglob(),
+                             self.exec_opts.nocaseglob(), results)
+        walker.Walk(root, 0)
+        #log('glob %r -> %r', arg, results)
 
         n = len(results)
         if n:  # Something matched
@@ -433,6 +656,8 @@ class Globber(object):
                 results = tmp  # idiom to work around mycpp limitation
                 n = len(results)
 
+            # Like libc glob() in the C locale
+            results.sort()
             out.extend(results)
             return n
 
@@ -27,6 +27,13 @@ class GlobEscapeTest(unittest.TestCase):
             self.assertEqual(e, esc(u))
             self.assertEqual(u, unesc(e))
 
+    def testCanGlobUnescape(self):
+        self.assertEqual(True, glob_.CanGlobUnescape(r'foo'))
+        self.assertEqual(True, glob_.CanGlobUnescape(r'\*.py'))
+        self.assertEqual(True, glob_.CanGlobUnescape(r'\\n'))
+        self.assertEqual(False, glob_.CanGlobUnescape(r'\f'))
+        self.assertEqual(False, glob_.CanGlobUnescape('foo\\'))
+
     def testLooksLikeGlob(self):
         # The way to test bash behavior is:
         #   $ shopt -s nullglob; argv [    # not a glob
@@ -134,6 +141,11 @@ class GlobParserTest(unittest.TestCase):
             ('[^also_not]', '[^also_not]', False),
             ('[!*?!\\[]', '[^*?!\\[]', False),
             ('[!\]foo]', r'[^]foo]', False),
+            # ] is a member when it's first, and [ is a member
+            ('[]z]', '[]z]', False),
+            ('[!]]', '[^]]', False),
+            ('[[z]', '[[z]', False),
+            ('[^[z]', '[^[z]', False),
 
             # invalid globs
             ('not_closed[a-z', 'not_closed\\[a-z', True),
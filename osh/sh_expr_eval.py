@@ -10,7 +10,7 @@ sh_expr_eval.py -- Shell boolean and arithmetic expressions.
 """
 from __future__ import print_function
 
-from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.runtime_asdl import scope_t
 from _devbuild.gen.syntax_asdl import (
     word_t,
@@ -45,6 +45,7 @@ from _devbuild.gen.value_asdl import (
     RegexMatch,
 )
 from core import alloc
+from core import bash_array
 from core import error
 from core.error import e_die, e_die_status, e_strict, e_usage
 from core import num
@@ -66,7 +67,7 @@ import libc  # for fnmatch
 # Import these names directly because the C++ translation uses macros literally.
 from libc import FNM_CASEFOLD, REG_ICASE
 
-from typing import Tuple, Optional, cast, TYPE_CHECKING
+from typing import Dict, Tuple, Optional, cast, TYPE_CHECKING
 if TYPE_CHECKING:
     from core.ui import ErrorFormatter
     from core import optview
@@ -141,7 +142,7 @@ def OldValue(lval, mem, exec_opts):
             array_val = None  # type: value.BashArray
             with tagswitch(val) as case2:
                 if case2(value_e.Undef):
-                    array_val = value.BashArray([])
+                    array_val = value.BashArray([], None)
                 elif case2(value_e.BashArray):
                     tmp = cast(value.BashArray, UP_val)
                     # mycpp rewrite: add tmp.  cast() creates a new var in inner scope
@@ -149,7 +150,7 @@ def OldValue(lval, mem, exec_opts):
                 else:
                     e_die("Can't use [] on value of type %s" % ui.ValType(val))
 
-            s = word_eval.GetArrayItem(array_val.strs, lval.index)
+            s = bash_array.GetItem(array_val, lval.index)
 
             if s is None:
                 val = value.Str('')  # NOTE: Other logic is value.Undef?  0?
@@ -196,6 +197,100 @@ if mylib.PYTHON:
         return 'A' <= ch and ch <= 'Z'
 
 
+# Max number of strings in each generation of ArithParseCache
+_ARITH_CACHE_SIZE = 256
+
+
+class _ArithCacheEntry(object):
+
+    def __init__(self, node, blame_tok, for_lhs, opts_mask):
+        # type: (arith_expr_t, Optional[Token], bool, int) -> None
+        self.node = node
+        self.blame_tok = blame_tok
+        self.for_lhs = for_lhs
+        self.opts_mask = opts_mask
+
+
+class ArithParseCache(object):
+    """Memoizes arith_expr_t nodes parsed from strings at runtime.
+
+    x='i+1'; while (( x < n )); do ...  would otherwise parse 'i+1' on every
+    iteration.  So would 'unset' and 'printf -v' with an array index.
+
+    An entry is only used if errors would be blamed on the same token, and the
+    parse options haven't changed, so a hit behaves exactly like a re-parse.
+    Strings with parse errors aren't cached.
+
+    Eviction is by generation: when the recent dict fills up, the old one is
+    dropped and the recent one takes its place.  A hit in the old dict moves
+    the entry back to the recent one, so strings used in loops stay cached.
+    """
+
+    def __init__(self, mutable_opts):
+        # type: (state.MutableOpts) -> None
+        self.mutable_opts = mutable_opts
+
+        self.recent = {}  # type: Dict[str, _ArithCacheEntry]
+        self.old = {}  # type: Dict[str, _ArithCacheEntry]
+
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+
+    def _OptsMask(self):
+        # type: () -> int
+        mask = 0
+        bit = 1
+        for opt_num in consts.PARSE_OPTION_NUMS:
+            if self.mutable_opts.Get(opt_num):
+                mask |= bit
+            bit <<= 1
+        return mask
+
+    def Get(self, code_str, blame_loc, for_lhs):
+        # type: (str, loc_t, bool) -> Optional[arith_expr_t]
+        entry = self.recent.get(code_str)
+        if entry is None:
+            entry = self.old.get(code_str)
+            if entry is not None:
+                mylib.dict_erase(self.old, code_str)
+                self._Insert(code_str, entry)
+
+        if (entry is None or entry.for_lhs != for_lhs or
+                entry.blame_tok is not location.TokenFor(blame_loc) or
+                entry.opts_mask != self._OptsMask()):
+            self.num_misses += 1
+            return None
+
+        self.num_hits += 1
+        return entry.node
+
+    def Put(self, code_str, blame_loc, for_lhs, node):
+        # type: (str, loc_t, bool, arith_expr_t) -> None
+        entry = _ArithCacheEntry(node, location.TokenFor(blame_loc), for_lhs,
+                                 self._OptsMask())
+        self._Insert(code_str, entry)
+
+    def _Insert(self, code_str, entry):
+        # type: (str, _ArithCacheEntry) -> None
+        if (len(self.recent) >= _ARITH_CACHE_SIZE and
+                code_str not in self.recent):
+            self.num_evictions += len(self.old)
+            self.old = self.recent
+            self.recent = {}
+        self.recent[code_str] = entry
+
+    def Stats(self):
+        # type: () -> str
+        """For 'pp .arith-cache'."""
+        total = self.num_hits + self.num_misses
+        # Integer percentage, so this doesn't depend on float formatting
+        pct = self.num_hits * 100 // total if total else 0
+        return ('hits %d  misses %d  hit_rate %d%%  evictions %d  size %d' %
+                (self.num_hits, self.num_misses, pct, self.num_evictions,
+                 len(self.recent) + len(self.old)))
+
+
 class UnsafeArith(object):
     """For parsing a[i] at RUNTIME."""
 
@@ -231,16 +326,25 @@ class UnsafeArith(object):
                       location)
             return LeftName(s, location)
 
-        a_parser = self.parse_ctx.MakeArithParser(s)
-
-        with alloc.ctx_SourceCode(self.arena,
-                                  source.ArgvWord('dynamic LHS', location)):
-            try:
-                anode = a_parser.Parse()
-            except error.Parse as e:
-                self.errfmt.PrettyPrintError(e)
-                # Exception for builtins 'unset' and 'printf'
-                e_usage('got invalid LHS expression', location)
+        cache = self.arith_ev.parse_cache
+        if cache:
+            anode = cache.Get(s, location, True)
+        else:
+            anode = None
+        if anode is None:
+            a_parser = self.parse_ctx.MakeArithParser(s)
+
+            with alloc.ctx_SourceCode(
+                    self.arena, source.ArgvWord('dynamic LHS', location)):
+                try:
+                    anode = a_parser.Parse()
+                except error.Parse as e:
+                    self.errfmt.PrettyPrintError(e)
+                    # Exception for builtins 'unset' and 'printf'
+                    e_usage('got invalid LHS expression', location)
+
+            if cache:
+                cache.Put(s, location, True, anode)
 
         # Note: we parse '1+2', and then it becomes a runtime error because
         # it's not a valid LHS.  Could be a parse error.
@@ -310,6 +414,7 @@ class ArithEvaluator(object):
             mutable_opts,  # type: state.MutableOpts
             parse_ctx,  # type: Optional[parse_lib.ParseContext]
             errfmt,  # type: ErrorFormatter
+            parse_cache=None,  # type: Optional[ArithParseCache]
     ):
         # type: (...) -> None
         self.word_ev = None  # type: word_eval.StringWordEvaluator
@@ -318,6 +423,7 @@ class ArithEvaluator(object):
         self.mutable_opts = mutable_opts
         self.parse_ctx = parse_ctx
         self.errfmt = errfmt
+        self.parse_cache = parse_cache  # for strings parsed at runtime
 
     def CheckCircularDeps(self):
         # type: () -> None
@@ -400,17 +506,25 @@ class ArithEvaluator(object):
                     return mops.ZERO
 
                 # For compatibility: Try to parse it as an expression and evaluate it.
-                a_parser = self.parse_ctx.MakeArithParser(s)
-
-                # TODO: Fill in the variable name
-                with alloc.ctx_SourceCode(arena,
-                                          source.Variable(None, blame_loc)):
-                    try:
-                        node2 = a_parser.Parse()  # may raise error.Parse
-                    except error.Parse as e:
-                        self.errfmt.PrettyPrintError(e)
-                        e_die('Parse error in recursive arithmetic',
-                              e.location)
+                if self.parse_cache:
+                    node2 = self.parse_cache.Get(s, blame_loc, False)
+                else:
+                    node2 = None
+                if node2 is None:
+                    a_parser = self.parse_ctx.MakeArithParser(s)
+
+                    # TODO: Fill in the variable name
+                    with alloc.ctx_SourceCode(
+                            arena, source.Variable(None, blame_loc)):
+                        try:
+                            node2 = a_parser.Parse()  # may raise error.Parse
+                        except error.Parse as e:
+                            self.errfmt.PrettyPrintError(e)
+                            e_die('Parse error in recursive arithmetic',
+                                  e.location)
+
+                    if self.parse_cache:
+                        self.parse_cache.Put(s, blame_loc, False, node2)
 
                 # Prevent infinite recursion of $(( 1x )) -- it's a word that evaluates
                 # to itself, and you don't want to reparse it as a word.
@@ -696,7 +810,7 @@ class ArithEvaluator(object):
                             array_val = cast(value.BashArray, UP_left)
                             index = mops.BigTruncate(
                                 self.EvalToBigInt(node.right))
-                            s = word_eval.GetArrayItem(array_val.strs, index)
+                            s = bash_array.GetItem(array_val, index)
 
                         elif case(value_e.BashAssoc):
                             left = cast(value.BashAssoc, UP_left)
@@ -925,11 +1039,12 @@ class BoolEvaluator(ArithEvaluator):
             mutable_opts,  # type: Optional[state.MutableOpts]
             parse_ctx,  # type: Optional[parse_lib.ParseContext]
             errfmt,  # type: ErrorFormatter
-            always_strict=False  # type: bool
+            always_strict=False,  # type: bool
+            parse_cache=None,  # type: Optional[ArithParseCache]
     ):
         # type: (...) -> None
         ArithEvaluator.__init__(self, mem, exec_opts, mutable_opts, parse_ctx,
-                                errfmt)
+                                errfmt, parse_cache)
         self.always_strict = always_strict
 
     def _StringToBigIntOrError(self, s, blame_word=None):
@@ -954,6 +1069,128 @@ class BoolEvaluator(ArithEvaluator):
         val = self.word_ev.EvalWordToString(word, eval_flags)
         return val.s
 
+    def EvalUnary(self, op_id, s, blame_word):
+        # type: (Id_t, str, word_t) -> bool
+        """Evaluate a unary operator on an evaluated word.
+
+        Also used directly by the test builtin, which has no tree.
+        """
+        # Now dispatch on arg type
+        arg_type = consts.BoolArgType(op_id)  # could be static in the LST?
+
+        if arg_type == bool_arg_type_e.Path:
+            return bool_stat.DoUnaryOp(op_id, s)
+
+        if arg_type == bool_arg_type_e.Str:
+            if op_id == Id.BoolUnary_z:
+                return not bool(s)
+            if op_id == Id.BoolUnary_n:
+                return bool(s)
+
+            raise AssertionError(op_id)  # should never happen
+
+        if arg_type == bool_arg_type_e.Other:
+            if op_id == Id.BoolUnary_t:
+                return bool_stat.isatty(s, blame_word)
+
+            # See whether 'set -o' options have been set
+            if op_id == Id.BoolUnary_o:
+                index = consts.OptionNum(s)
+                if index == 0:
+                    return False
+                else:
+                    return self.exec_opts.opt0_array[index]
+
+            if op_id == Id.BoolUnary_v:
+                val = self.mem.GetValue(s)
+                return val.tag() != value_e.Undef
+
+            e_die("%s isn't implemented" %
+                  ui.PrettyId(op_id))  # implicit location
+
+        raise AssertionError(arg_type)
+
+    def EvalBinary(self, op_id, s1, s2, left, right):
+        # type: (Id_t, str, str, word_t, word_t) -> bool
+        """Evaluate a binary operator on two evaluated words.
+
+        The words are only used for error locations.
+        """
+        # Now dispatch on arg type
+        arg_type = consts.BoolArgType(op_id)
+
+        if arg_type == bool_arg_type_e.Path:
+            return bool_stat.DoBinaryOp(op_id, s1, s2)
+
+        if arg_type == bool_arg_type_e.Int:
+            # NOTE: We assume they are constants like [[ 3 -eq 3 ]].
+            # Bash also allows [[ 1+2 -eq 3 ]].
+            i1 = self._StringToBigIntOrError(s1, blame_word=left)
+            i2 = self._StringToBigIntOrError(s2, blame_word=right)
+
+            if op_id == Id.BoolBinary_eq:
+                return mops.Equal(i1, i2)
+            if op_id == Id.BoolBinary_ne:
+                return not mops.Equal(i1, i2)
+            if op_id == Id.BoolBinary_gt:
+                return mops.Greater(i1, i2)
+            if op_id == Id.BoolBinary_ge:
+                return mops.Greater(i1, i2) or mops.Equal(i1, i2)
+            if op_id == Id.BoolBinary_lt:
+                return mops.Greater(i2, i1)
+            if op_id == Id.BoolBinary_le:
+                return mops.Greater(i2, i1) or mops.Equal(i1, i2)
+
+            raise AssertionError(op_id)  # should never happen
+
+        if arg_type == bool_arg_type_e.Str:
+            fnmatch_flags = (FNM_CASEFOLD
+                             if self.exec_opts.nocasematch() else 0)
+
+            if op_id in (Id.BoolBinary_GlobEqual, Id.BoolBinary_GlobDEqual):
+                #log('Matching %s against pattern %s', s1, s2)
+                return libc.fnmatch(s2, s1, fnmatch_flags)
+
+            if op_id == Id.BoolBinary_GlobNEqual:
+                return not libc.fnmatch(s2, s1, fnmatch_flags)
+
+            if op_id in (Id.BoolBinary_Equal, Id.BoolBinary_DEqual):
+                return s1 == s2
+
+            if op_id == Id.BoolBinary_NEqual:
+                return s1 != s2
+
+            if op_id == Id.BoolBinary_EqualTilde:
+                # TODO: This should go to --debug-file
+                #log('Matching %r against regex %r', s1, s2)
+                regex_flags = (REG_ICASE
+                               if self.exec_opts.nocasematch() else 0)
+
+                try:
+                    indices = libc.regex_search(s2, regex_flags, s1, 0)
+                except ValueError as e:
+                    # Status 2 indicates a regex parse error.  This is fatal in OSH but
+                    # not in bash, which treats [[ like a command with an exit code.
+                    e_die_status(2, e.message, loc.Word(right))
+
+                if indices is not None:
+                    self.mem.SetRegexMatch(
+                        RegexMatch(s1, indices, eggex_ops.No))
+                    return True
+                else:
+                    self.mem.SetRegexMatch(regex_match.No)
+                    return False
+
+            if op_id == Id.Op_Less:
+                return str_cmp(s1, s2) < 0
+
+            if op_id == Id.Op_Great:
+                return str_cmp(s1, s2) > 0
+
+            raise AssertionError(op_id)  # should never happen
+
+        raise AssertionError(arg_type)
+
     def EvalB(self, node):
         # type: (bool_expr_t) -> bool
 
@@ -986,44 +1223,8 @@ class BoolEvaluator(ArithEvaluator):
 
             elif case(bool_expr_e.Unary):
                 node = cast(bool_expr.Unary, UP_node)
-                op_id = node.op_id
                 s = self._EvalCompoundWord(node.child)
-
-                # Now dispatch on arg type
-                arg_type = consts.BoolArgType(
-                    op_id)  # could be static in the LST?
-
-                if arg_type == bool_arg_type_e.Path:
-                    return bool_stat.DoUnaryOp(op_id, s)
-
-                if arg_type == bool_arg_type_e.Str:
-                    if op_id == Id.BoolUnary_z:
-                        return not bool(s)
-                    if op_id == Id.BoolUnary_n:
-                        return bool(s)
-
-                    raise AssertionError(op_id)  # should never happen
-
-                if arg_type == bool_arg_type_e.Other:
-                    if op_id == Id.BoolUnary_t:
-                        return bool_stat.isatty(s, node.child)
-
-                    # See whether 'set -o' options have been set
-                    if op_id == Id.BoolUnary_o:
-                        index = consts.OptionNum(s)
-                        if index == 0:
-                            return False
-                        else:
-                            return self.exec_opts.opt0_array[index]
-
-                    if op_id == Id.BoolUnary_v:
-                        val = self.mem.GetValue(s)
-                        return val.tag() != value_e.Undef
-
-                    e_die("%s isn't implemented" %
-                          ui.PrettyId(op_id))  # implicit location
-
-                raise AssertionError(arg_type)
+                return self.EvalUnary(node.op_id, s, node.child)
 
             elif case(bool_expr_e.Binary):
                 node = cast(bool_expr.Binary, UP_node)
@@ -1040,79 +1241,6 @@ class BoolEvaluator(ArithEvaluator):
 
                 s1 = self._EvalCompoundWord(node.left)
                 s2 = self._EvalCompoundWord(node.right, eval_flags)
-
-                # Now dispatch on arg type
-                arg_type = consts.BoolArgType(op_id)
-
-                if arg_type == bool_arg_type_e.Path:
-                    return bool_stat.DoBinaryOp(op_id, s1, s2)
-
-                if arg_type == bool_arg_type_e.Int:
-                    # NOTE: We assume they are constants like [[ 3 -eq 3 ]].
-                    # Bash also allows [[ 1+2 -eq 3 ]].
-                    i1 = self._StringToBigIntOrError(s1, blame_word=node.left)
-                    i2 = self._StringToBigIntOrError(s2, blame_word=node.right)
-
-                    if op_id == Id.BoolBinary_eq:
-                        return mops.Equal(i1, i2)
-                    if op_id == Id.BoolBinary_ne:
-                        return not mops.Equal(i1, i2)
-                    if op_id == Id.BoolBinary_gt:
-                        return mops.Greater(i1, i2)
-                    if op_id == Id.BoolBinary_ge:
-                        return mops.Greater(i1, i2) or mops.Equal(i1, i2)
-                    if op_id == Id.BoolBinary_lt:
-                        return mops.Greater(i2, i1)
-                    if op_id == Id.BoolBinary_le:
-                        return mops.Greater(i2, i1) or mops.Equal(i1, i2)
-
-                    raise AssertionError(op_id)  # should never happen
-
-                if arg_type == bool_arg_type_e.Str:
-                    fnmatch_flags = (FNM_CASEFOLD
-                                     if self.exec_opts.nocasematch() else 0)
-
-                    if op_id in (Id.BoolBinary_GlobEqual,
-                                 Id.BoolBinary_GlobDEqual):
-                        #log('Matching %s against pattern %s', s1, s2)
-                        return libc.fnmatch(s2, s1, fnmatch_flags)
-
-                    if op_id == Id.BoolBinary_GlobNEqual:
-                        return not libc.fnmatch(s2, s1, fnmatch_flags)
-
-                    if op_id in (Id.BoolBinary_Equal, Id.BoolBinary_DEqual):
-                        return s1 == s2
-
-                    if op_id == Id.BoolBinary_NEqual:
-                        return s1 != s2
-
-                    if op_id == Id.BoolBinary_EqualTilde:
-                        # TODO: This should go to --debug-file
-                        #log('Matching %r against regex %r', s1, s2)
-                        regex_flags = (REG_ICASE
-                                       if self.exec_opts.nocasematch() else 0)
-
-                        try:
-                            indices = libc.regex_search(s2, regex_flags, s1, 0)
-                        except ValueError as e:
-                            # Status 2 indicates a regex parse error.  This is fatal in OSH but
-                            # not in bash, which treats [[ like a command with an exit code.
-                            e_die_status(2, e.message, loc.Word(node.right))
-
-                        if indices is not None:
-                            self.mem.SetRegexMatch(
-                                RegexMatch(s1, indices, eggex_ops.No))
-                            return True
-                        else:
-                            self.mem.SetRegexMatch(regex_match.No)
-                            return False
-
-                    if op_id == Id.Op_Less:
-                        return str_cmp(s1, s2) < 0
-
-                    if op_id == Id.Op_Great:
-                        return str_cmp(s1, s2) > 0
-
-                    raise AssertionError(op_id)  # should never happen
+                return self.EvalBinary(op_id, s1, s2, node.left, node.right)
 
         raise AssertionError(node.tag())
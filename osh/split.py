@@ -44,43 +44,6 @@ if TYPE_CHECKING:
 DEFAULT_IFS = ' \t\n'
 
 
-def _SpansToParts(s, spans):
-    # type: (str, List[Span]) -> List[str]
-    """Helper for SplitForWordEval."""
-    parts = []  # type: List[mylib.BufWriter]
-    start_index = 0
-
-    # If the last span was black, and we get a backslash, set join_next to merge
-    # two black spans.
-    join_next = False
-    last_span_was_black = False
-
-    for span_type, end_index in spans:
-        if span_type == span_e.Black:
-            if len(parts) and join_next:
-                parts[-1].write(s[start_index:end_index])
-                join_next = False
-            else:
-                buf = mylib.BufWriter()
-                buf.write(s[start_index:end_index])
-                parts.append(buf)
-
-            last_span_was_black = True
-
-        elif span_type == span_e.Backslash:
-            if last_span_was_black:
-                join_next = True
-            last_span_was_black = False
-
-        else:
-            last_span_was_black = False
-
-        start_index = end_index
-
-    result = [buf.getvalue() for buf in parts]
-    return result
-
-
 class SplitContext(object):
     """A polymorphic interface to field splitting.
 
@@ -182,11 +145,7 @@ class SplitContext(object):
         Also used by the explicit shSplit() function.
         """
         sp = self._GetSplitter(ifs=ifs)
-        spans = sp.Split(s, True)
-        if 0:
-            for span in spans:
-                log('SPAN %s', span)
-        return _SpansToParts(s, spans)
+        return sp.SplitFields(s, True)
 
     def SplitForRead(self, line, allow_escape, do_split):
         # type: (str, bool, bool) -> List[Span]
@@ -221,6 +180,35 @@ class IfsSplitter(_BaseSplitter):
         self.ifs_whitespace = ifs_whitespace
         self.ifs_other = ifs_other
 
+        # The char_kind of each byte.  SplitContext caches a splitter per IFS
+        # value, so this is computed once per IFS value.  A backslash in IFS is
+        # a delimiter, not an escape.
+        self.byte_kinds = [char_kind_i.Black] * 256  # type: List[int]
+        self.byte_kinds[ord('\\')] = char_kind_i.Backslash
+        for c in ifs_other:
+            self.byte_kinds[ord(c)] = char_kind_i.DE_Gray
+        for c in ifs_whitespace:
+            self.byte_kinds[ord(c)] = char_kind_i.DE_White
+
+        # e.g. the default IFS, which doesn't need the state machine
+        self.whitespace_only = len(ifs_other) == 0
+
+    def _ByteKind(self, s, i, allow_escape):
+        # type: (str, int, bool) -> int
+        kind = self.byte_kinds[mylib.ByteAt(s, i)]
+        if kind == char_kind_i.Backslash and not allow_escape:
+            return char_kind_i.Black
+        return kind
+
+    def _SkipWhitespace(self, s, i):
+        # type: (str, int) -> int
+        """Return the index of the first non-whitespace byte at or after i."""
+        n = len(s)
+        while (i < n and
+               self.byte_kinds[mylib.ByteAt(s, i)] == char_kind_i.DE_White):
+            i += 1
+        return i
+
     def Split(self, s, allow_escape):
         # type: (str, bool) -> List[Span]
         """
@@ -231,12 +219,12 @@ class IfsSplitter(_BaseSplitter):
     Returns:
       List of (runtime.span, end_index) pairs
 
+    Used by the read builtin, which needs the spans to handle backslash
+    continuation and max_results.  Word evaluation uses SplitFields().
+
     TODO: This should be (frag, do_split) pairs, to avoid IFS='\'
     double-escaping issue.
     """
-        ws_chars = self.ifs_whitespace
-        other_chars = self.ifs_other
-
         n = len(s)
         # NOTE: in C, could reserve() this to len(s)
         spans = []  # type: List[Span]
@@ -247,10 +235,7 @@ class IfsSplitter(_BaseSplitter):
         # Ad hoc rule from POSIX: ignore leading whitespace.
         # "IFS white space shall be ignored at the beginning and end of the input"
         # This can't really be handled by the state machine.
-
-        i = 0
-        while i < n and mylib.ByteInSet(mylib.ByteAt(s, i), ws_chars):
-            i += 1
+        i = self._SkipWhitespace(s, 0)
 
         # Append an ignored span.
         if i != 0:
@@ -264,20 +249,9 @@ class IfsSplitter(_BaseSplitter):
         state = state_i.Start
         while state != state_i.Done:
             if i < n:
-                byte = mylib.ByteAt(s, i)
-
-                if mylib.ByteInSet(byte, ws_chars):
-                    ch = char_kind_i.DE_White
-                elif mylib.ByteInSet(byte, other_chars):
-                    ch = char_kind_i.DE_Gray
-                elif allow_escape and mylib.ByteEquals(byte, '\\'):
-                    ch = char_kind_i.Backslash
-                else:
-                    ch = char_kind_i.Black
-
+                ch = self._ByteKind(s, i, allow_escape)
             elif i == n:
                 ch = char_kind_i.Sentinel  # one more iterations for the end of string
-
             else:
                 raise AssertionError()  # shouldn't happen
 
@@ -287,8 +261,8 @@ class IfsSplitter(_BaseSplitter):
                                      (state, ch))
 
             if 0:
-                log('i %d byte %r ch %s current: %s next: %s %s', i, byte, ch,
-                    state, new_state, action)
+                log('i %d ch %s current: %s next: %s %s', i, ch, state,
+                    new_state, action)
 
             if action == emit_i.Part:
                 spans.append((span_e.Black, i))
@@ -309,3 +283,118 @@ class IfsSplitter(_BaseSplitter):
             i += 1
 
         return spans
+
+    def SplitFields(self, s, allow_escape):
+        # type: (str, bool) -> List[str]
+        """Split s into fields, removing backslashes if allow_escape.
+
+        Gives the same result as joining the spans from Split(), but without
+        creating them.
+        """
+        if self.whitespace_only:
+            return self._SplitWhitespace(s, allow_escape)
+
+        n = len(s)
+        fields = []  # type: List[str]
+
+        i = self._SkipWhitespace(s, 0)
+        if i == n:
+            return fields
+
+        # Like the spans from Split(): s[start:i] is the text since the last
+        # transition.  An escaped char continues the field before the
+        # backslash.
+        start = i
+        join_next = False
+        last_was_black = False
+
+        state = state_i.Start
+        while state != state_i.Done:
+            if i < n:
+                ch = self._ByteKind(s, i, allow_escape)
+            else:
+                ch = char_kind_i.Sentinel
+
+            new_state, action = consts.IfsEdge(state, ch)
+            if new_state == state_i.Invalid:
+                raise AssertionError('Invalid transition from %r with %r' %
+                                     (state, ch))
+
+            if action == emit_i.Empty:
+                # A delimiter, then an empty field
+                start = i
+
+            if action == emit_i.Part or action == emit_i.Empty:
+                if join_next and len(fields):
+                    fields[-1] = fields[-1] + s[start:i]
+                    join_next = False
+                else:
+                    fields.append(s[start:i])
+                last_was_black = True
+                start = i
+
+            elif action == emit_i.Delim:
+                last_was_black = False
+                start = i
+
+            elif action == emit_i.Escape:
+                # Skip the backslash
+                if last_was_black:
+                    join_next = True
+                last_was_black = False
+                start = i
+
+            state = new_state
+            i += 1
+
+        return fields
+
+    def _SplitWhitespace(self, s, allow_escape):
+        # type: (str, bool) -> List[str]
+        """SplitFields() when IFS is only whitespace, like the default.
+
+        Runs of whitespace are skipped in bulk, and each field is sliced out
+        of s, so we don't need the state machine.
+        """
+        n = len(s)
+        fields = []  # type: List[str]
+
+        i = 0
+        while True:
+            i = self._SkipWhitespace(s, i)
+            if i == n:
+                break
+
+            # Scan a field
+            field_start = i
+            start = i
+            buf = None  # type: Optional[mylib.BufWriter]
+            while i < n:
+                kind = self.byte_kinds[mylib.ByteAt(s, i)]
+                if kind == char_kind_i.DE_White:
+                    break
+
+                if kind == char_kind_i.Backslash and allow_escape:
+                    if buf is None:
+                        buf = mylib.BufWriter()
+                    buf.write(s[start:i])
+                    # The escaped byte, which may be whitespace or \, starts
+                    # the next piece
+                    i += 1
+                    start = i
+
+                i += 1
+
+            if buf is None:
+                fields.append(s[start:i])
+            elif i > n:
+                # A trailing backslash is removed.  If it's the whole field,
+                # there's no field.
+                if field_start != n - 1:
+                    fields.append(buf.getvalue())
+                break
+            else:
+                buf.write(s[start:i])
+                fields.append(buf.getvalue())
+
+        return fields
@@ -5,6 +5,7 @@ split.test.py: Tests for split.py
 
 import unittest
 
+from _devbuild.gen.runtime_asdl import char_kind_i
 from osh import split  # module under test
 
 
@@ -19,7 +20,7 @@ def _RunSplitCases(test, sp, cases):
             for span in spans:
                 print('  %s %s' % span)
 
-        parts = split._SpansToParts(s, spans)
+        parts = sp.SplitFields(s, allow_escape)
         print('PARTS %s' % parts)
 
         test.assertEqual(expected_parts, parts,
@@ -28,30 +29,48 @@ def _RunSplitCases(test, sp, cases):
 
 class SplitTest(unittest.TestCase):
 
-    def testSpansToParts(self):
+    def testSplitFields(self):
         sp = split.IfsSplitter(split.DEFAULT_IFS, '')
 
         s = 'one\\ two'
-        spans = sp.Split(s, False)
-        print(spans)
-
-        parts = split._SpansToParts(s, spans)
+        parts = sp.SplitFields(s, False)
         self.assertEqual(['one\\', 'two'], parts)
 
-        spans = sp.Split(s, True)  # allow_escape
-        parts = split._SpansToParts(s, spans)
+        parts = sp.SplitFields(s, True)  # allow_escape
         self.assertEqual(['one two'], parts)
 
-        # NOTE: Only read builtin supports max_results
-        return
+    def testByteKinds(self):
+        sp = split.IfsSplitter(' ', '_\\')
+        self.assertEqual(256, len(sp.byte_kinds))
+        self.assertEqual(char_kind_i.DE_White, sp.byte_kinds[ord(' ')])
+        self.assertEqual(char_kind_i.DE_Gray, sp.byte_kinds[ord('_')])
+        # A backslash in IFS is a delimiter
+        self.assertEqual(char_kind_i.DE_Gray, sp.byte_kinds[ord('\\')])
+        self.assertEqual(char_kind_i.Black, sp.byte_kinds[ord('a')])
+        self.assertEqual(char_kind_i.Black, sp.byte_kinds[0xff])
+
+        sp = split.IfsSplitter(split.DEFAULT_IFS, '')
+        self.assertEqual(char_kind_i.Backslash, sp.byte_kinds[ord('\\')])
 
-        parts = split._SpansToParts(s, spans, max_results=1)
-        self.assertEqual(['one\\ two'], parts)
+    def testTrailingBackslash(self):
+        CASES = [
+            (['ab'], 'ab\\', True),
+            (['a'], 'a \\', True),
+            ([], ' \\', True),
+            (['\\'], '\\\\\\', True),
+            (['ab\\'], 'ab\\', False),
+        ]
+        sp = split.IfsSplitter(split.DEFAULT_IFS, '')
+        _RunSplitCases(self, sp, CASES)
 
-        print(spans)
+        # IFS='_ '
+        sp = split.IfsSplitter(' ', '_')
+        _RunSplitCases(self, sp, CASES)
 
-        parts = split._SpansToParts(s, spans, max_results=1)
-        self.assertEqual(['one two'], parts)
+    def testLongRuns(self):
+        sp = split.IfsSplitter(split.DEFAULT_IFS, '')
+        s = ' \t' * 1000 + 'a' * 1000 + '\n' * 1000 + 'b'
+        self.assertEqual(['a' * 1000, 'b'], sp.SplitFields(s, True))
 
     def testTrailingWhitespaceBug(self):
         # Bug: these differed
@@ -441,46 +441,69 @@ def DoUnarySuffixOp(s, op_tok, arg, is_extglob):
         raise NotImplementedError(ui.PrettyId(id_))
 
 
-def _AllMatchPositions(s, regex):
-    # type: (str, str) -> List[Tuple[int, int]]
-    """Returns a list of all (start, end) match positions of the regex against
-    s.
+class _Replacer(object):
+    """Base class for ${x/pat/replace} and family."""
 
-    (If there are no matches, it returns the empty list.)
+    def __init__(self):
+        # type: () -> None
+        pass
+
+    def Replace(self, s, op):
+        # type: (str, suffix_op.PatSub) -> str
+        raise NotImplementedError()
+
+
+class LiteralReplacer(_Replacer):
+    """Fast path when the pattern has no glob metacharacters.
+
+    Uses substring search instead of translating to a regex.
     """
-    matches = []  # type: List[Tuple[int, int]]
-    pos = 0
-    n = len(s)
-    while pos < n:  # needed to prevent infinite loop in (.*) case
-        m = libc.regex_first_group_match(regex, s, pos)
-        if m is None:
-            break
-        matches.append(m)
-        start, end = m
-        pos = end  # advance position
-    return matches
 
+    def __init__(self, pat, replace_str):
+        # type: (str, str) -> None
+        _Replacer.__init__(self)
+        self.pat = pat
+        self.replace_str = replace_str
+
+    def __repr__(self):
+        # type: () -> str
+        return '<LiteralReplacer pat %r r %r>' % (self.pat, self.replace_str)
+
+    def Replace(self, s, op):
+        # type: (str, suffix_op.PatSub) -> str
+        n = len(self.pat)
+
+        if op.replace_mode == Id.Lit_Slash:
+            # Like the regex case: replacing all copies of the empty string is a
+            # no-op
+            if n == 0:
+                return s
+            return s.replace(self.pat, self.replace_str)
 
-def _PatSubAll(s, regex, replace_str):
-    # type: (str, str, str) -> str
-    parts = []  # type: List[str]
-    prev_end = 0
-    for start, end in _AllMatchPositions(s, regex):
-        parts.append(s[prev_end:start])
-        parts.append(replace_str)
-        prev_end = end
-    parts.append(s[prev_end:])
-    return ''.join(parts)
+        if op.replace_mode == Id.Lit_Pound:
+            if s.startswith(self.pat):
+                return self.replace_str + s[n:]
+            return s
+
+        if op.replace_mode == Id.Lit_Percent:
+            if s.endswith(self.pat):
+                return s[:len(s) - n] + self.replace_str
+            return s
+
+        start = s.find(self.pat)
+        if start == -1:
+            return s
+        return s[:start] + self.replace_str + s[start + n:]
 
 
-class GlobReplacer(object):
+class GlobReplacer(_Replacer):
 
     def __init__(self, regex, replace_str, slash_tok):
         # type: (str, str, Token) -> None
+        _Replacer.__init__(self)
 
-        # TODO: It would be nice to cache the compilation of the regex here,
-        # instead of just the string.  That would require more sophisticated use of
-        # the Python/C API in libc.c, which we might want to avoid.
+        # Note: libc keeps an LRU cache of compiled regexes, keyed by the regex
+        # string, so we don't call regcomp() on every match.
         self.regex = regex
         self.replace_str = replace_str
         self.slash_tok = slash_tok
@@ -500,11 +523,11 @@ class GlobReplacer(object):
                 return s
 
             try:
-                return _PatSubAll(s, regex,
-                                  self.replace_str)  # loop over matches
+                # One pass over s, with a single compiled regex
+                return libc.regex_replace_all(regex, s, self.replace_str)
             except RuntimeError as e:
                 # Not sure if this is possible since we convert from glob:
-                # libc.regex_first_group_match raises RuntimeError on regex syntax
+                # libc.regex_replace_all raises RuntimeError on regex syntax
                 # error.
                 msg = e.message  # type: str
                 e_die('Error matching regex %r: %s' % (regex, msg),
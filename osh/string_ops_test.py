@@ -6,8 +6,11 @@ from __future__ import print_function
 
 import unittest
 
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.syntax_asdl import suffix_op
 from core import error
 from osh import string_ops  # module under test
+import libc
 
 
 class LibStrTest(unittest.TestCase):
@@ -185,18 +188,37 @@ class LibStrTest(unittest.TestCase):
     def testPatSubAllMatches(self):
         s = 'oXooXoooX'
 
-        # Match positions
-        self.assertEqual([(1, 3), (4, 6)],
-                         string_ops._AllMatchPositions(s, '(X.)'))
-
-        # No match
-        self.assertEqual([], string_ops._AllMatchPositions(s, '(z)'))
-
         # Replacement
-        self.assertEqual('o_o_ooX', string_ops._PatSubAll(s, '(X.)', '_'))
+        self.assertEqual('o_o_ooX', libc.regex_replace_all('(X.)', s, '_'))
 
         # Replacement with no match
-        self.assertEqual(s, string_ops._PatSubAll(s, '(z)', '_'))
+        self.assertEqual(s, libc.regex_replace_all('(z)', s, '_'))
+
+        # Longer and shorter replacements
+        self.assertEqual('oABCoABCooX',
+                         libc.regex_replace_all('(X.)', s, 'ABC'))
+        self.assertEqual('ooooX', libc.regex_replace_all('(X.)', s, ''))
+
+        # Empty matches don't loop forever
+        self.assertEqual('-a-b-c', libc.regex_replace_all('(z*)', 'abc', '-'))
+
+    def testLiteralReplacer(self):
+        s = 'foo-bar-foo'
+        r = string_ops.LiteralReplacer('foo', 'X')
+
+        op = suffix_op.PatSub(None, None, Id.Lit_Slash, None)
+        self.assertEqual('X-bar-X', r.Replace(s, op))
+
+        op.replace_mode = Id.Undefined_Tok
+        self.assertEqual('X-bar-foo', r.Replace(s, op))
+
+        op.replace_mode = Id.Lit_Pound
+        self.assertEqual('X-bar-foo', r.Replace(s, op))
+        self.assertEqual('bar', r.Replace('bar', op))
+
+        op.replace_mode = Id.Lit_Percent
+        self.assertEqual('foo-bar-X', r.Replace(s, op))
+        self.assertEqual('bar', r.Replace('bar', op))
 
 
 if __name__ == '__main__':
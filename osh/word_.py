@@ -6,8 +6,12 @@ from _devbuild.gen.id_kind_asdl import Id, Kind, Id_t, Kind_t
 from _devbuild.gen.syntax_asdl import (
     Token,
     CompoundWord,
+    word_shape_e,
+    word_shape_t,
     DoubleQuoted,
     SingleQuoted,
+    SimpleVarSub,
+    BracedVarSub,
     word,
     word_e,
     word_t,
@@ -118,10 +122,10 @@ def FastStrEval(w):
         For echo -e, test x -lt 0, etc.
     (2) single quoted word like 'foo'
 
-    Other patterns we could detect are:
-    (1) "foo"
-    (2) "$var" and "${var}" - I think these are very common in OSH code (but not YSH)
-        - I think val_ops.Stringify() can handle all the errors
+    EvalWordSequence2() also has a fast path for "$var" and "${var}".  See
+    ShapeOf().
+
+    Another pattern we could detect is "foo".
     """
     if len(w.parts) != 1:
         return None
@@ -157,6 +161,75 @@ def FastStrEval(w):
             return None
 
 
+def QuotedVarName(w):
+    # type: (CompoundWord) -> Optional[str]
+    """For the words "$x" and "${x}", return x.  Otherwise None."""
+    if len(w.parts) != 1:
+        return None
+
+    UP_part0 = w.parts[0]
+    if UP_part0.tag() != word_part_e.DoubleQuoted:
+        return None
+    part0 = cast(DoubleQuoted, UP_part0)
+    if part0.left.id != Id.Left_DoubleQuote or len(part0.parts) != 1:
+        return None
+
+    UP_part = part0.parts[0]
+    with tagswitch(UP_part) as case:
+        if case(word_part_e.SimpleVarSub):
+            part = cast(SimpleVarSub, UP_part)
+            if part.tok.id == Id.VSub_DollarName:  # not $1 or $@
+                return lexer.LazyStr(part.tok)
+
+        elif case(word_part_e.BracedVarSub):
+            part2 = cast(BracedVarSub, UP_part)
+            # not ${#x} ${a[0]} ${x:-default}, etc.
+            if (part2.token.id == Id.VSub_Name and part2.prefix_op is None and
+                    part2.bracket_op is None and part2.suffix_op is None):
+                return part2.var_name
+
+    return None
+
+
+def ShapeOf(w):
+    # type: (CompoundWord) -> word_shape_t
+    """Classify a word for EvalWordSequence2().
+
+    The Literal and SingleQuoted shapes are the words that FastStrEval()
+    handles.
+    """
+    if len(w.parts) != 1:
+        return word_shape_e.Other
+
+    UP_part0 = w.parts[0]
+    with tagswitch(UP_part0) as case:
+        if case(word_part_e.Literal):
+            part0 = cast(Token, UP_part0)
+            if part0.id in (Id.Lit_Chars, Id.Lit_LBracket, Id.Lit_RBracket):
+                return word_shape_e.Literal
+
+        elif case(word_part_e.SingleQuoted):
+            return word_shape_e.SingleQuoted
+
+        elif case(word_part_e.DoubleQuoted):
+            if QuotedVarName(w) is not None:
+                return word_shape_e.QuotedVar
+
+    return word_shape_e.Other
+
+
+def DetectShapes(words):
+    # type: (List[word_t]) -> None
+    """Set the shape of each word in argv, after brace and tilde detection.
+
+    MUTATES its argument.
+    """
+    for w in words:
+        if w.tag() == word_e.Compound:
+            w2 = cast(CompoundWord, w)
+            w2.shape = ShapeOf(w2)
+
+
 def StaticEval(UP_w):
     # type: (word_t) -> Tuple[bool, str, bool]
     """Evaluate a Compound at PARSE TIME."""
@@ -254,13 +327,13 @@ def TildeDetect2(w):
 
     if len(w.parts) == 1:  # ~
         new_parts.append(word_part.TildeSub(tok0, None, None))
-        return CompoundWord(new_parts)
+        return CompoundWord(new_parts, word_shape_e.Unknown)
 
     id1 = LiteralId(w.parts[1])
     if id1 == Id.Lit_Slash:  # ~/
         new_parts.append(word_part.TildeSub(tok0, None, None))
         new_parts.extend(w.parts[1:])
-        return CompoundWord(new_parts)
+        return CompoundWord(new_parts, word_shape_e.Unknown)
 
     if id1 != Id.Lit_Chars:
         return None  # ~$x is not TildeSub
@@ -269,7 +342,7 @@ def TildeDetect2(w):
 
     if len(w.parts) == 2:  # ~foo
         new_parts.append(word_part.TildeSub(tok0, tok1, lexer.TokenVal(tok1)))
-        return CompoundWord(new_parts)
+        return CompoundWord(new_parts, word_shape_e.Unknown)
 
     id2 = LiteralId(w.parts[2])
     if id2 != Id.Lit_Slash:  # ~foo$x is not TildeSub
@@ -277,7 +350,7 @@ def TildeDetect2(w):
 
     new_parts.append(word_part.TildeSub(tok0, tok1, lexer.TokenVal(tok1)))
     new_parts.extend(w.parts[2:])
-    return CompoundWord(new_parts)
+    return CompoundWord(new_parts, word_shape_e.Unknown)
 
 
 def TildeDetectAssign(w):
@@ -526,8 +599,9 @@ def DetectAssocPair(w):
         id_ = LiteralId(parts[i])
         if id_ == Id.Lit_ArrayLhsClose:  # ]=
             # e.g. if we have [$x$y]=$a$b
-            key = CompoundWord(parts[1:i])  # $x$y
-            value = CompoundWord(parts[i + 1:])  # $a$b from
+            key = CompoundWord(parts[1:i], word_shape_e.Unknown)  # $x$y
+            value = CompoundWord(parts[i + 1:],
+                                 word_shape_e.Unknown)  # $a$b from
 
             # Type-annotated intermediate value for mycpp translation
             return AssocPair(key, value)
@@ -754,7 +828,7 @@ def IsVarSub(w):
 def ErrorWord(error_str):
     # type: (str) -> CompoundWord
     t = lexer.DummyToken(Id.Lit_Chars, error_str)
-    return CompoundWord([t])
+    return CompoundWord([t], word_shape_e.Unknown)
 
 
 def Pretty(w):
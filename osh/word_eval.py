@@ -20,6 +20,7 @@ from _devbuild.gen.syntax_asdl import (
     word_e,
     word_t,
     CompoundWord,
+    word_shape_e,
     rhs_word,
     rhs_word_e,
     rhs_word_t,
@@ -48,6 +49,7 @@ from _devbuild.gen.value_asdl import (
     sh_lvalue,
     sh_lvalue_t,
 )
+from core import bash_array
 from core import error
 from core import pyos
 from core import pyutil
@@ -111,7 +113,7 @@ def DecayArray(val):
     """Resolve ${array} to ${array[0]}."""
     if val.tag() == value_e.BashArray:
         array_val = cast(value.BashArray, val)
-        s = array_val.strs[0] if len(array_val.strs) else None
+        s = bash_array.GetItem(array_val, 0)
     elif val.tag() == value_e.BashAssoc:
         assoc_val = cast(value.BashAssoc, val)
         s = assoc_val.d['0'] if '0' in assoc_val.d else None
@@ -124,22 +126,6 @@ def DecayArray(val):
         return value.Str(s)
 
 
-def GetArrayItem(strs, index):
-    # type: (List[str], int) -> Optional[str]
-
-    n = len(strs)
-    if index < 0:
-        index += n
-
-    if 0 <= index and index < n:
-        # TODO: strs->index() has a redundant check for (i < 0)
-        s = strs[index]
-        # note: s could be None because representation is sparse
-    else:
-        s = None
-    return s
-
-
 # Use libc to parse NAME, NAME=value, and NAME+=value.  We want submatch
 # extraction, but I haven't used that in re2c, and we would need a new kind of
 # binding.
@@ -221,7 +207,7 @@ def _ValueToPartValue(val, quoted, part_loc):
 
         elif case(value_e.BashArray):
             val = cast(value.BashArray, UP_val)
-            return part_value.Array(val.strs)
+            return part_value.Array(bash_array.GetValues(val))
 
         elif case(value_e.BashAssoc):
             val = cast(value.BashAssoc, UP_val)
@@ -242,8 +228,8 @@ def _ValueToPartValue(val, quoted, part_loc):
     raise AssertionError('for -Wreturn-type in C++')
 
 
-def _MakeWordFrames(part_vals):
-    # type: (List[part_value_t]) -> List[List[Piece]]
+def _MakeWordFrames(part_vals, pieces, breaks):
+    # type: (List[part_value_t], List[Piece], List[int]) -> None
     """A word evaluates to a flat list of part_value (String or Array).  frame
     is a portion that results in zero or more args.  It can never be joined.
     This idea exists because of arrays like "$@" and "${a[@]}".
@@ -262,30 +248,20 @@ def _MakeWordFrames(part_vals):
       [ ('2 3', True, False) ]
       [ ('4', True, False), ('y', False, True) ]
 
-    Note: A frame is a 3-tuple that's identical to Piece()?  Maybe we
-    should make that top level type.
-
-    TODO:
-    - Instead of List[List[Piece]], where List[Piece] is a Frame
-    - Change this representation to
-      Frames = (List[Piece] pieces, List[int] break_indices) 
-      # where break_indices are the end
+    The frames are stored flat, to avoid allocating a list per frame:
 
-      Consider a common case like "$x" or "${x}" - I think this a lot more
-      efficient?
+      pieces: all the Piece instances, in order
+      breaks: the end of each frame, an index into pieces
 
-    And then change _EvalWordFrame(pieces: List[Piece], start: int, end: int)
+    So frame i is pieces[breaks[i-1] : breaks[i]], with breaks[-1] taken as 0.
     """
-    current = []  # type: List[Piece]
-    frames = [current]
-
     for p in part_vals:
         UP_p = p
 
         with tagswitch(p) as case:
             if case(part_value_e.String):
                 p = cast(Piece, UP_p)
-                current.append(p)
+                pieces.append(p)
 
             elif case(part_value_e.Array):
                 p = cast(part_value.Array, UP_p)
@@ -299,16 +275,27 @@ def _MakeWordFrames(part_vals):
                     # a string.
                     piece = Piece(s, True, False)
                     if is_first:
-                        current.append(piece)
                         is_first = False
                     else:
-                        current = [piece]
-                        frames.append(current)  # singleton frame
+                        breaks.append(len(pieces))  # singleton frame
+                    pieces.append(piece)
 
             else:
                 raise AssertionError()
 
-    return frames
+    breaks.append(len(pieces))
+
+
+def _JoinFrame(pieces, start, end):
+    # type: (List[Piece], int, int) -> str
+    """Join a frame without splitting or globbing."""
+    if end - start == 1:
+        return pieces[start].s
+
+    tmp = []  # type: List[str]
+    for i in xrange(start, end):
+        tmp.append(pieces[i].s)
+    return ''.join(tmp)
 
 
 # TODO: This could be _MakeWordFrames and then sep.join().  It's redundant.
@@ -381,30 +368,29 @@ def _PerformSlice(
                     "The length index of a array slice can't be negative: %d" %
                     length, loc.WordPart(part))
 
+            n = bash_array.Length(val)
             # Quirk: "begin" for positional arguments ($@ and $*) counts $0.
+            offset = 0
             if arg0_val is not None:
-                orig = [arg0_val.s]
-                orig.extend(val.strs)
-            else:
-                orig = val.strs
-
-            n = len(orig)
+                offset = 1
+                n += 1
             if begin < 0:
-                i = n + begin  # ${@:-3} starts counts from the end
-            else:
-                i = begin
-            strs = []  # type: List[str]
-            count = 0
-            while i < n:
-                if has_length and count == length:  # length could be 0
-                    break
-                s = orig[i]
-                if s is not None:  # Unset elements don't count towards the length
-                    strs.append(s)
-                    count += 1
-                i += 1
+                begin += n  # ${@:-3} starts counts from the end
 
-            result = value.BashArray(strs)
+            strs = []  # type: List[str]
+            if begin >= 0 and not (has_length and length == 0):
+                if arg0_val is not None and begin == 0:
+                    strs.append(arg0_val.s)
+                # Unset elements don't count towards the length
+                keys = bash_array.GetKeys(val)
+                values = bash_array.GetValues(val)
+                for k in xrange(len(keys)):
+                    if has_length and len(strs) == length:
+                        break
+                    if keys[k] + offset >= begin:
+                        strs.append(values[k])
+
+            result = value.BashArray(strs, None)
 
         elif case(value_e.BashAssoc):
             e_die("Can't slice associative arrays", loc.WordPart(part))
@@ -567,7 +553,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
 
         if op_id in (Id.VSub_At, Id.VSub_Star):
             argv = self.mem.GetArgv()
-            val = value.BashArray(argv)  # type: value_t
+            val = value.BashArray(argv, None)  # type: value_t
             if op_id == Id.VSub_At:
                 # "$@" evaluates to an array, $@ should be decayed
                 vsub_state.join_array = not quoted
@@ -635,7 +621,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
             elif case(value_e.BashArray):
                 val = cast(value.BashArray, UP_val)
                 # TODO: allow undefined
-                is_falsey = len(val.strs) == 0
+                is_falsey = bash_array.IsEmpty(val)
             elif case(value_e.BashAssoc):
                 val = cast(value.BashAssoc, UP_val)
                 is_falsey = len(val.d) == 0
@@ -751,10 +737,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
             elif case(value_e.BashArray):
                 val = cast(value.BashArray, UP_val)
                 # There can be empty placeholder values in the array.
-                length = 0
-                for s in val.strs:
-                    if s is not None:
-                        length += 1
+                length = bash_array.Count(val)
 
             elif case(value_e.BashAssoc):
                 val = cast(value.BashAssoc, UP_val)
@@ -774,20 +757,15 @@ class AbstractWordEvaluator(StringWordEvaluator):
         with tagswitch(val) as case:
             if case(value_e.BashArray):
                 val = cast(value.BashArray, UP_val)
-                # translation issue: tuple indices not supported in list comprehensions
-                #indices = [str(i) for i, s in enumerate(val.strs) if s is not None]
-                indices = []  # type: List[str]
-                for i, s in enumerate(val.strs):
-                    if s is not None:
-                        indices.append(str(i))
-                return value.BashArray(indices)
+                indices = [str(i) for i in bash_array.GetKeys(val)]
+                return value.BashArray(indices, None)
 
             elif case(value_e.BashAssoc):
                 val = cast(value.BashAssoc, UP_val)
                 assert val.d is not None  # for MyPy, so it's not Optional[]
 
                 # BUG: Keys aren't ordered according to insertion!
-                return value.BashArray(val.d.keys())
+                return value.BashArray(val.d.keys(), None)
 
             else:
                 raise error.TypeErr(val, 'Keys op expected Str', token)
@@ -845,12 +823,11 @@ class AbstractWordEvaluator(StringWordEvaluator):
                     val = cast(value.BashArray, UP_val)
                     # ${a[@]#prefix} is VECTORIZED on arrays.  YSH should have this too.
                     strs = []  # type: List[str]
-                    for s in val.strs:
-                        if s is not None:
-                            strs.append(
-                                string_ops.DoUnarySuffixOp(
-                                    s, op.op, arg_val.s, has_extglob))
-                    new_val = value.BashArray(strs)
+                    for s in bash_array.GetValues(val):
+                        strs.append(
+                            string_ops.DoUnarySuffixOp(s, op.op, arg_val.s,
+                                                       has_extglob))
+                    new_val = value.BashArray(strs, None)
 
                 elif case(value_e.BashAssoc):
                     val = cast(value.BashAssoc, UP_val)
@@ -859,7 +836,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
                         strs.append(
                             string_ops.DoUnarySuffixOp(s, op.op, arg_val.s,
                                                        has_extglob))
-                    new_val = value.BashArray(strs)
+                    new_val = value.BashArray(strs, None)
 
                 else:
                     raise error.TypeErr(
@@ -889,15 +866,23 @@ class AbstractWordEvaluator(StringWordEvaluator):
         else:
             replace_str = ''
 
-        # note: doesn't support self.exec_opts.extglob()!
-        regex, warnings = glob_.GlobToERE(pat_val.s)
-        if len(warnings):
-            # TODO:
-            # - Add 'shopt -s strict_glob' mode and expose warnings.
-            #   "Glob is not in CANONICAL FORM".
-            # - Propagate location info back to the 'op.pat' word.
-            pass
-        replacer = string_ops.GlobReplacer(regex, replace_str, op.slash_tok)
+        if (glob_.LooksLikeGlob(pat_val.s) or
+                not glob_.CanGlobUnescape(pat_val.s)):
+            # note: doesn't support self.exec_opts.extglob()!
+            regex, warnings = glob_.GlobToERE(pat_val.s)
+            if len(warnings):
+                # TODO:
+                # - Add 'shopt -s strict_glob' mode and expose warnings.
+                #   "Glob is not in CANONICAL FORM".
+                # - Propagate location info back to the 'op.pat' word.
+                pass
+            replacer = string_ops.GlobReplacer(
+                regex, replace_str, op.slash_tok)  # type: string_ops._Replacer
+        else:
+            # Fast path: substring search, no regex.  Like DoUnarySuffixOp,
+            # reverse the glob escaping (e.g. [ -> \[).
+            replacer = string_ops.LiteralReplacer(glob_.GlobUnescape(pat_val.s),
+                                                  replace_str)
 
         with tagswitch(val) as case2:
             if case2(value_e.Str):
@@ -908,17 +893,16 @@ class AbstractWordEvaluator(StringWordEvaluator):
             elif case2(value_e.BashArray):
                 array_val = cast(value.BashArray, val)
                 strs = []  # type: List[str]
-                for s in array_val.strs:
-                    if s is not None:
-                        strs.append(replacer.Replace(s, op))
-                val = value.BashArray(strs)
+                for s in bash_array.GetValues(array_val):
+                    strs.append(replacer.Replace(s, op))
+                val = value.BashArray(strs, None)
 
             elif case2(value_e.BashAssoc):
                 assoc_val = cast(value.BashAssoc, val)
                 strs = []
                 for s in assoc_val.d.values():
                     strs.append(replacer.Replace(s, op))
-                val = value.BashArray(strs)
+                val = value.BashArray(strs, None)
 
             else:
                 raise error.TypeErr(
@@ -957,7 +941,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
                     if case2(value_e.Str):
                         val = value.Str('')
                     elif case2(value_e.BashArray):
-                        val = value.BashArray([])
+                        val = value.BashArray([], None)
                     else:
                         raise NotImplementedError()
         return val
@@ -993,7 +977,10 @@ class AbstractWordEvaluator(StringWordEvaluator):
                     array_val = cast(value.BashArray, UP_val)
 
                     # TODO: should use fastfunc.ShellEncode
-                    tmp = [j8_lite.MaybeShellEncode(s) for s in array_val.strs]
+                    tmp = [
+                        j8_lite.MaybeShellEncode(s)
+                        for s in bash_array.GetValues(array_val)
+                    ]
                     result = value.Str(' '.join(tmp))
                 else:
                     e_die("Can't use @Q on %s" % ui.ValType(val), op)
@@ -1081,7 +1068,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
                 index = self.arith_ev.EvalToInt(anode)
                 vtest_place.index = a_index.Int(index)
 
-                s = GetArrayItem(array_val.strs, index)
+                s = bash_array.GetItem(array_val, index)
 
                 if s is None:
                     val = value.Undef
@@ -1152,8 +1139,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
         """Decay $* to a string."""
         assert val.tag() == value_e.BashArray, val
         sep = self.splitter.GetJoinChar()
-        tmp = [s for s in val.strs if s is not None]
-        return value.Str(sep.join(tmp))
+        return value.Str(sep.join(bash_array.GetValues(val)))
 
     def _EmptyStrOrError(self, val, token):
         # type: (value_t, Token) -> value_t
@@ -1173,7 +1159,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
         if self.exec_opts.nounset():
             e_die('Undefined array %r' % lexer.TokenVal(token), token)
         else:
-            return value.BashArray([])
+            return value.BashArray([], None)
 
     def _EvalBracketOp(self, val, part, quoted, vsub_state, vtest_place):
         # type: (value_t, BracedVarSub, bool, VarSubState, VTestPlace) -> value_t
@@ -1918,7 +1904,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
                 array_words = part0.words
                 words = braces.BraceExpandWords(array_words)
                 strs = self.EvalWordSequence(words)
-                return value.BashArray(strs)
+                return value.BashArray(strs, None)
 
             if tag == word_part_e.BashAssocLiteral:
                 part0 = cast(word_part.BashAssocLiteral, UP_part0)
@@ -1932,15 +1918,17 @@ class AbstractWordEvaluator(StringWordEvaluator):
         # If RHS doesn't look like a=( ... ), then it must be a string.
         return self.EvalWordToString(w)
 
-    def _EvalWordFrame(self, frame, argv):
-        # type: (List[Piece], List[str]) -> None
+    def _EvalWordFrame(self, pieces, start, end, argv):
+        # type: (List[Piece], int, int, List[str]) -> None
+        """Split and glob the frame pieces[start:end], appending to argv."""
         all_empty = True
         all_quoted = True
         any_quoted = False
 
-        #log('--- frame %s', frame)
+        #log('--- frame %s', pieces[start:end])
 
-        for piece in frame:
+        for i in xrange(start, end):
+            piece = pieces[i]
             if len(piece.s):
                 all_empty = False
 
@@ -1956,16 +1944,15 @@ class AbstractWordEvaluator(StringWordEvaluator):
         # If every frag is quoted, e.g. "$a$b" or any part in "${a[@]}"x, then
         # don't do word splitting or globbing.
         if all_quoted:
-            tmp = [piece.s for piece in frame]
-            a = ''.join(tmp)
-            argv.append(a)
+            argv.append(_JoinFrame(pieces, start, end))
             return
 
         will_glob = not self.exec_opts.noglob()
 
         # Array of strings, some of which are BOTH IFS-escaped and GLOB escaped!
         frags = []  # type: List[str]
-        for piece in frame:
+        for i in xrange(start, end):
+            piece = pieces[i]
             if will_glob and piece.quoted:
                 frag = glob_.GlobEscape(piece.s)
             else:
@@ -2014,12 +2001,17 @@ class AbstractWordEvaluator(StringWordEvaluator):
         """
         part_vals = []  # type: List[part_value_t]
         self._EvalWordToParts(w, part_vals, 0)  # not double quoted
-        frames = _MakeWordFrames(part_vals)
+
+        pieces = []  # type: List[Piece]
+        breaks = []  # type: List[int]
+        _MakeWordFrames(part_vals, pieces, breaks)
+
         argv = []  # type: List[str]
-        for frame in frames:
-            if len(frame):  # empty array gives empty frame!
-                tmp = [piece.s for piece in frame]
-                argv.append(''.join(tmp))  # no split or glob
+        start = 0
+        for end in breaks:
+            if end > start:  # empty array gives empty frame!
+                argv.append(_JoinFrame(pieces, start, end))  # no split or glob
+            start = end
         #log('argv: %s', argv)
         return argv
 
@@ -2070,7 +2062,8 @@ class AbstractWordEvaluator(StringWordEvaluator):
                         rhs = rhs_word.Empty  # type: rhs_word_t
                     else:
                         # tmp is for intersection of C++/MyPy type systems
-                        tmp = CompoundWord(w.parts[part_offset:])
+                        tmp = CompoundWord(w.parts[part_offset:],
+                                           word_shape_e.Unknown)
                         word_.TildeDetectAssign(tmp)
                         rhs = tmp
 
@@ -2151,21 +2144,24 @@ class AbstractWordEvaluator(StringWordEvaluator):
                     log('  %s', entry)
 
             # Still need to process
-            frames = _MakeWordFrames(part_vals)
+            pieces = []  # type: List[Piece]
+            breaks = []  # type: List[int]
+            _MakeWordFrames(part_vals, pieces, breaks)
 
             if 0:
                 log('')
                 log('Static: frames after _MakeWordFrames:')
-                for entry in frames:
-                    log('  %s', entry)
+                log('  %s %s', pieces, breaks)
 
             # We will still allow x"${a[@]"x, though it's deprecated by @a, which
             # disallows such expressions at parse time.
-            for frame in frames:
-                if len(frame):  # empty array gives empty frame!
-                    tmp = [piece.s for piece in frame]
-                    strs.append(''.join(tmp))  # no split or glob
+            start = 0
+            for end in breaks:
+                if end > start:  # empty array gives empty frame!
+                    strs.append(_JoinFrame(pieces, start,
+                                           end))  # no split or glob
                     locs.append(w)
+                start = end
 
         return cmd_value.Argv(strs, locs, None, None, None, None)
 
@@ -2202,10 +2198,32 @@ class AbstractWordEvaluator(StringWordEvaluator):
 
         n = 0
         for i, w in enumerate(words):
-            fast_str = word_.FastStrEval(w)
+            if w.shape == word_shape_e.Unknown:
+                w.shape = word_.ShapeOf(w)  # words not seen by the parser
+
+            # Fast paths for the most common words, which result in exactly
+            # one arg.  They skip _EvalWordToParts() and frames.
+            fast_str = None  # type: Optional[str]
+            if w.shape == word_shape_e.Literal:  # ls -l
+                fast_str = lexer.LazyStr(cast(Token, w.parts[0]))
+
+            elif w.shape == word_shape_e.SingleQuoted:  # 'my dir'
+                fast_str = cast(SingleQuoted, w.parts[0]).sval
+
+            elif w.shape == word_shape_e.QuotedVar:  # "$x" "${x}"
+                # Not split or globbed, and never an assignment builtin.
+                # Arrays, undefined vars, etc. use the general algorithm.
+                val = self.mem.GetValue(word_.QuotedVarName(w))
+                if val.tag() == value_e.Str:
+                    strs.append(cast(value.Str, val).s)
+                    locs.append(w)
+                    n += 1
+                    continue
+
             if fast_str is not None:
                 strs.append(fast_str)
                 locs.append(w)
+                n += 1
 
                 # e.g. the 'local' in 'local a=b c=d' will be here
                 if allow_assign and i == 0:
@@ -2244,16 +2262,19 @@ class AbstractWordEvaluator(StringWordEvaluator):
                 for entry in part_vals:
                     log('  %s', entry)
 
-            frames = _MakeWordFrames(part_vals)
+            pieces = []  # type: List[Piece]
+            breaks = []  # type: List[int]
+            _MakeWordFrames(part_vals, pieces, breaks)
             if 0:
                 log('')
                 log('frames after _MakeWordFrames:')
-                for entry in frames:
-                    log('  %s', entry)
+                log('  %s %s', pieces, breaks)
 
             # Do splitting and globbing.  Each frame will append zero or more args.
-            for frame in frames:
-                self._EvalWordFrame(frame, strs)
+            start = 0
+            for end in breaks:
+                self._EvalWordFrame(pieces, start, end, strs)
+                start = end
 
             # Fill in locations parallel to strs.
             n_next = len(strs)
@@ -73,6 +73,7 @@ from _devbuild.gen.syntax_asdl import (
     word_e,
     word_t,
     CompoundWord,
+    word_shape_e,
     word_part,
     word_part_t,
     y_lhs_e,
@@ -304,7 +305,7 @@ class WordParser(WordEmitter):
 
         self._GetToken()
         if self.token_type == Id.Right_DollarBrace:
-            pat = CompoundWord([])
+            pat = CompoundWord([], word_shape_e.Unknown)
             return suffix_op.PatSub(pat, rhs_word.Empty, replace_mode,
                                     slash_tok)
 
@@ -384,7 +385,7 @@ class WordParser(WordEmitter):
 
         part = BracedVarSub.CreateNull()
         part.token = name_token
-        part.var_name = lexer.TokenVal(name_token)
+        part.var_name = intern(lexer.TokenVal(name_token))
         part.bracket_op = bracket_op
         return part
 
@@ -804,7 +805,7 @@ class WordParser(WordEmitter):
             p_die('Unexpected token after YSH single-quoted string',
                   self.cur_token)
 
-        return CompoundWord([sq_part])
+        return CompoundWord([sq_part], word_shape_e.Unknown)
 
     def _ReadUnquotedLeftParts(self, triple_out):
         # type: (Optional[BoolParamBox]) -> word_part_t
@@ -908,13 +909,13 @@ class WordParser(WordEmitter):
 
             if self.token_type == Id.Right_ExtGlob:
                 if not read_word:
-                    arms.append(CompoundWord([]))
+                    arms.append(CompoundWord([], word_shape_e.Unknown))
                 right_token = self.cur_token
                 break
 
             elif self.token_type == Id.Op_Pipe:
                 if not read_word:
-                    arms.append(CompoundWord([]))
+                    arms.append(CompoundWord([], word_shape_e.Unknown))
                 read_word = False
                 self._SetNext(lex_mode_e.ExtGlob)
 
@@ -1652,6 +1653,7 @@ class WordParser(WordEmitter):
         # Brace detection for arrays but NOT associative arrays
         words2 = braces.BraceDetectAll(words)
         words3 = word_.TildeDetectAll(words2)
+        word_.DetectShapes(words3)
         return ShArrayLiteral(left_token, words3, right_token)
 
     def ParseProcCallArgs(self, start_symbol):
@@ -1766,7 +1768,7 @@ class WordParser(WordEmitter):
         could be an operator delimiting a compound word.  Can we change lexer modes
         and remove this special case?
         """
-        w = CompoundWord([])
+        w = CompoundWord([], word_shape_e.Unknown)
         num_parts = 0
         brace_count = 0
         done = False
@@ -2172,7 +2174,7 @@ class WordParser(WordEmitter):
         This is just like reading a here doc line.  "\n" is allowed, as
         well as the typical substitutions ${x} $(echo hi) $((1 + 2)).
         """
-        w = CompoundWord([])
+        w = CompoundWord([], word_shape_e.Unknown)
         self._ReadLikeDQ(None, False, w.parts)
         return w
 
@@ -7,7 +7,7 @@ from __future__ import print_function
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.syntax_asdl import word_part_e
+from _devbuild.gen.syntax_asdl import word_part_e, word_shape_e
 
 from core import test_lib
 from mycpp.mylib import log
@@ -171,6 +171,22 @@ class WordTest(unittest.TestCase):
         self.assertEqual('b', word_.FastStrEval(node.words[3]))
         self.assertEqual(']', word_.FastStrEval(node.words[4]))
 
+    def testShapes(self):
+        node = assertParseSimpleCommand(
+            self, '''ls 'my dir' "$x" "${y}" $x "$1" "${x:-}" "a$x" *.py''')
+
+        shapes = [w.shape for w in node.words]
+        self.assertEqual([
+            word_shape_e.Literal, word_shape_e.SingleQuoted,
+            word_shape_e.QuotedVar, word_shape_e.QuotedVar, word_shape_e.Other,
+            word_shape_e.Other, word_shape_e.Other, word_shape_e.Other,
+            word_shape_e.Other
+        ], shapes)
+
+        self.assertEqual('x', word_.QuotedVarName(node.words[2]))
+        self.assertEqual('y', word_.QuotedVarName(node.words[3]))
+        self.assertEqual(None, word_.QuotedVarName(node.words[4]))
+
 
 if __name__ == '__main__':
     unittest.main()
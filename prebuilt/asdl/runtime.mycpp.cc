@@ -10,58 +10,59 @@ GLOBAL_STR(str1, ")");
 GLOBAL_STR(str2, "_");
 GLOBAL_STR(str3, "T");
 GLOBAL_STR(str4, "F");
-GLOBAL_STR(str5, "\n<html>\n  <head>\n     <title>oil AST</title>\n     <style>\n      .n { color: brown }\n      .s { font-weight: bold }\n      .o { color: darkgreen }\n     </style>\n  </head>\n  <body>\n    <pre>\n");
-GLOBAL_STR(str6, "\n    </pre>\n  </body>\n</html>\n    ");
-GLOBAL_STR(str7, "n");
-GLOBAL_STR(str8, "s");
-GLOBAL_STR(str9, "o");
+GLOBAL_STR(str5, "");
+GLOBAL_STR(str6, "\n<html>\n  <head>\n     <title>oil AST</title>\n     <style>\n      .n { color: brown }\n      .s { font-weight: bold }\n      .o { color: darkgreen }\n     </style>\n  </head>\n  <body>\n    <pre>\n");
+GLOBAL_STR(str7, "\n    </pre>\n  </body>\n</html>\n    ");
+GLOBAL_STR(str8, "n");
+GLOBAL_STR(str9, "s");
 GLOBAL_STR(str10, "o");
 GLOBAL_STR(str11, "o");
-GLOBAL_STR(str12, "<span class=\"%s\">");
-GLOBAL_STR(str13, "</span>");
-GLOBAL_STR(str14, " ");
-GLOBAL_STR(str15, "\n");
-GLOBAL_STR(str16, " ");
-GLOBAL_STR(str17, "]");
-GLOBAL_STR(str18, " ");
+GLOBAL_STR(str12, "o");
+GLOBAL_STR(str13, "<span class=\"%s\">");
+GLOBAL_STR(str14, "</span>");
+GLOBAL_STR(str15, " ");
+GLOBAL_STR(str16, "\n");
+GLOBAL_STR(str17, " ");
+GLOBAL_STR(str18, "]");
 GLOBAL_STR(str19, " ");
-GLOBAL_STR(str20, "\n");
+GLOBAL_STR(str20, " ");
 GLOBAL_STR(str21, "\n");
-GLOBAL_STR(str22, " ");
-GLOBAL_STR(str23, "%s%s: [");
-GLOBAL_STR(str24, "\n");
+GLOBAL_STR(str22, "\n");
+GLOBAL_STR(str23, " ");
+GLOBAL_STR(str24, "%s%s: [");
 GLOBAL_STR(str25, "\n");
-GLOBAL_STR(str26, "%s]");
-GLOBAL_STR(str27, "%s%s: ");
-GLOBAL_STR(str28, "\n");
+GLOBAL_STR(str26, "\n");
+GLOBAL_STR(str27, "%s]");
+GLOBAL_STR(str28, "%s%s: ");
 GLOBAL_STR(str29, "\n");
-GLOBAL_STR(str30, " ");
-GLOBAL_STR(str31, "UNTYPED any");
-GLOBAL_STR(str32, "...0x%s");
-GLOBAL_STR(str33, " ");
+GLOBAL_STR(str30, "\n");
+GLOBAL_STR(str31, " ");
+GLOBAL_STR(str32, "UNTYPED any");
+GLOBAL_STR(str33, "...0x%s");
 GLOBAL_STR(str34, " ");
-GLOBAL_STR(str35, " %s:");
-GLOBAL_STR(str36, "UNTYPED any");
-GLOBAL_STR(str37, "[");
-GLOBAL_STR(str38, " ");
-GLOBAL_STR(str39, "]");
-GLOBAL_STR(str40, "...0x%s");
-GLOBAL_STR(str41, "\u001b[0;0m");
-GLOBAL_STR(str42, "\u001b[1m");
-GLOBAL_STR(str43, "\u001b[4m");
-GLOBAL_STR(str44, "\u001b[7m");
-GLOBAL_STR(str45, "\u001b[31m");
-GLOBAL_STR(str46, "\u001b[32m");
-GLOBAL_STR(str47, "\u001b[33m");
-GLOBAL_STR(str48, "\u001b[34m");
-GLOBAL_STR(str49, "\u001b[35m");
-GLOBAL_STR(str50, "\u001b[36m");
-GLOBAL_STR(str51, "&");
-GLOBAL_STR(str52, "&amp;");
-GLOBAL_STR(str53, "<");
-GLOBAL_STR(str54, "&lt;");
-GLOBAL_STR(str55, ">");
-GLOBAL_STR(str56, "&gt;");
+GLOBAL_STR(str35, " ");
+GLOBAL_STR(str36, " %s:");
+GLOBAL_STR(str37, "UNTYPED any");
+GLOBAL_STR(str38, "[");
+GLOBAL_STR(str39, " ");
+GLOBAL_STR(str40, "]");
+GLOBAL_STR(str41, "...0x%s");
+GLOBAL_STR(str42, "\u001b[0;0m");
+GLOBAL_STR(str43, "\u001b[1m");
+GLOBAL_STR(str44, "\u001b[4m");
+GLOBAL_STR(str45, "\u001b[7m");
+GLOBAL_STR(str46, "\u001b[31m");
+GLOBAL_STR(str47, "\u001b[32m");
+GLOBAL_STR(str48, "\u001b[33m");
+GLOBAL_STR(str49, "\u001b[34m");
+GLOBAL_STR(str50, "\u001b[35m");
+GLOBAL_STR(str51, "\u001b[36m");
+GLOBAL_STR(str52, "&");
+GLOBAL_STR(str53, "&amp;");
+GLOBAL_STR(str54, "<");
+GLOBAL_STR(str55, "&lt;");
+GLOBAL_STR(str56, ">");
+GLOBAL_STR(str57, "&gt;");
 
 namespace ansi {  // forward declare
 
@@ -91,14 +92,12 @@ extern BigStr* BLUE;
 extern BigStr* MAGENTA;
 extern BigStr* CYAN;
 
-
 }  // declare namespace ansi
 
 namespace cgi {  // declare
 
 BigStr* escape(BigStr* s);
 
-
 }  // declare namespace cgi
 
 namespace j8_lite {  // declare
@@ -108,7 +107,6 @@ BigStr* MaybeShellEncode(BigStr* s);
 BigStr* ShellEncode(BigStr* s);
 BigStr* YshEncode(BigStr* s, bool unquoted_ok = false);
 
-
 }  // declare namespace j8_lite
 
 namespace runtime {  // define
@@ -141,6 +139,274 @@ TraversalState::TraversalState() {
 }
 BigStr* TRUE_STR = str3;
 BigStr* FALSE_STR = str4;
+int MARSHAL_NULL = 0;
+int MARSHAL_REF = -1;
+
+mops::BigInt _ZigZag(int i) {
+  mops::BigInt b;
+  mops::BigInt twice;
+  b = mops::IntWiden(i);
+  twice = mops::Add(b, b);
+  if (i >= 0) {
+    return twice;
+  }
+  return mops::Sub(mops::Negate(twice), mops::ONE);
+}
+
+int _UnZigZag(mops::BigInt u) {
+  mops::BigInt half;
+  half = mops::RShift(u, mops::ONE);
+  if (mops::Equal(mops::BitAnd(u, mops::ONE), mops::ZERO)) {
+    return mops::BigTruncate(half);
+  }
+  return mops::BigTruncate(mops::Sub(mops::Negate(half), mops::ONE));
+}
+
+void _WriteVarint(List<BigStr*>* out, mops::BigInt n) {
+  int low;
+  StackRoot _root0(&out);
+
+  while (mops::Greater(n, mops::IntWiden(127))) {
+    low = mops::BigTruncate(mops::BitAnd(n, mops::IntWiden(127)));
+    out->append(chr((low | 128)));
+    n = mops::RShift(n, mops::IntWiden(7));
+  }
+  out->append(chr(mops::BigTruncate(n)));
+}
+
+Encoder::Encoder() {
+  this->ints = Alloc<List<int>>();
+  this->strs = Alloc<List<BigStr*>>();
+  this->obj_nums = Alloc<Dict<int, int>>();
+  this->ok = true;
+}
+
+void Encoder::External(int heap_id) {
+  this->obj_nums->set(heap_id, len(this->obj_nums));
+}
+
+bool Encoder::Begin(int heap_id, int tag) {
+  int num;
+  num = this->obj_nums->get(heap_id, -1);
+  if (num != -1) {
+    this->ints->append(MARSHAL_REF);
+    this->ints->append(num);
+    return false;
+  }
+  this->ints->append(tag);
+  return true;
+}
+
+void Encoder::End(int heap_id) {
+  this->obj_nums->set(heap_id, len(this->obj_nums));
+}
+
+void Encoder::Null() {
+  this->ints->append(MARSHAL_NULL);
+}
+
+void Encoder::Int(int i) {
+  this->ints->append(i);
+}
+
+void Encoder::Bool(bool b) {
+  this->ints->append(b ? 1 : 0);
+}
+
+void Encoder::Str(BigStr* s) {
+  StackRoot _root0(&s);
+
+  this->strs->append(s);
+}
+
+void Encoder::Len(int n) {
+  this->ints->append(n);
+}
+
+void Encoder::Unsupported() {
+  this->ok = false;
+  this->ints->append(MARSHAL_NULL);
+}
+
+BigStr* Encoder::Serialize() {
+  List<BigStr*>* out = nullptr;
+  BigStr* s = nullptr;
+  StackRoot _root0(&out);
+  StackRoot _root1(&s);
+
+  out = Alloc<List<BigStr*>>();
+  _WriteVarint(out, mops::IntWiden(len(this->ints)));
+  for (ListIter<int> it(this->ints); !it.Done(); it.Next()) {
+    int i = it.Value();
+    _WriteVarint(out, _ZigZag(i));
+  }
+  _WriteVarint(out, mops::IntWiden(len(this->strs)));
+  for (int j = 0; j < len(this->strs); ++j) {
+    s = this->strs->at(j);
+    if (s == nullptr) {
+      _WriteVarint(out, mops::ZERO);
+    }
+    else {
+      _WriteVarint(out, mops::IntWiden((len(s) + 1)));
+      out->append(s);
+    }
+  }
+  return str5->join(out);
+}
+
+Decoder::Decoder(BigStr* blob) {
+  this->blob = blob;
+  this->pos = 0;
+  this->ints = Alloc<List<int>>();
+  this->strs = Alloc<List<BigStr*>>();
+  this->int_pos = 0;
+  this->str_pos = 0;
+  this->objs = Alloc<List<void*>>();
+  this->ok = true;
+  this->_Parse();
+}
+
+mops::BigInt Decoder::_ReadVarint(int num_bits) {
+  mops::BigInt n;
+  int shift;
+  int b;
+  n = mops::ZERO;
+  shift = 0;
+  while (true) {
+    if ((this->pos >= len(this->blob) or shift >= 32)) {
+      this->ok = false;
+      return mops::ZERO;
+    }
+    b = mylib::ByteAt(this->blob, this->pos);
+    this->pos += 1;
+    n = mops::BitOr(n, mops::LShift(mops::IntWiden((b & 127)), mops::IntWiden(shift)));
+    if (b < 128) {
+      break;
+    }
+    shift += 7;
+  }
+  if (!mops::Equal(mops::RShift(n, mops::IntWiden(num_bits)), mops::ZERO)) {
+    this->ok = false;
+    return mops::ZERO;
+  }
+  return n;
+}
+
+int Decoder::_ReadLen() {
+  return mops::BigTruncate(this->_ReadVarint(31));
+}
+
+void Decoder::_Parse() {
+  int num_ints;
+  mops::BigInt u;
+  int num_strs;
+  int n;
+  int end;
+  num_ints = this->_ReadLen();
+  for (int _ = 0; _ < num_ints; ++_) {
+    u = this->_ReadVarint(32);
+    if (!this->ok) {
+      return ;
+    }
+    this->ints->append(_UnZigZag(u));
+  }
+  num_strs = this->_ReadLen();
+  for (int _ = 0; _ < num_strs; ++_) {
+    n = this->_ReadLen();
+    if (!this->ok) {
+      return ;
+    }
+    if (n == 0) {
+      this->strs->append(nullptr);
+      continue;
+    }
+    end = ((this->pos + n) - 1);
+    if (end > len(this->blob)) {
+      this->ok = false;
+      return ;
+    }
+    this->strs->append(this->blob->slice(this->pos, end));
+    this->pos = end;
+  }
+  if (this->pos != len(this->blob)) {
+    this->ok = false;
+  }
+}
+
+void Decoder::External(void* obj) {
+  StackRoot _root0(&obj);
+
+  this->objs->append(obj);
+}
+
+void Decoder::Register(void* obj) {
+  StackRoot _root0(&obj);
+
+  this->objs->append(obj);
+}
+
+int Decoder::Int() {
+  int i;
+  if (this->int_pos >= len(this->ints)) {
+    this->ok = false;
+    return MARSHAL_NULL;
+  }
+  i = this->ints->at(this->int_pos);
+  this->int_pos += 1;
+  return i;
+}
+
+bool Decoder::Bool() {
+  return this->Int() != 0;
+}
+
+BigStr* Decoder::Str() {
+  BigStr* s = nullptr;
+  StackRoot _root0(&s);
+
+  if (this->str_pos >= len(this->strs)) {
+    this->ok = false;
+    return nullptr;
+  }
+  s = this->strs->at(this->str_pos);
+  this->str_pos += 1;
+  return s;
+}
+
+int Decoder::Len() {
+  int n;
+  int remaining;
+  n = this->Int();
+  remaining = (((len(this->ints) - this->int_pos) + len(this->strs)) - this->str_pos);
+  if ((n < -1 or n > remaining)) {
+    this->ok = false;
+    return 0;
+  }
+  return n;
+}
+
+void* Decoder::Ref() {
+  int num;
+  num = this->Int();
+  if ((num < 0 or num >= len(this->objs))) {
+    this->ok = false;
+    return nullptr;
+  }
+  return this->objs->at(num);
+}
+
+void Decoder::BadTag(int tag) {
+  this->ok = false;
+}
+
+void Decoder::Unsupported() {
+  this->Int();
+  this->ok = false;
+}
+
+bool Decoder::AtEnd() {
+  return (this->int_pos == len(this->ints) and this->str_pos == len(this->strs));
+}
 
 }  // define namespace runtime
 
@@ -220,7 +486,7 @@ Tuple2<BigStr*, int> ColorOutput::GetRaw() {
   return Tuple2<BigStr*, int>(f->getvalue(), this->num_chars);
 }
 
-TextOutput::TextOutput(mylib::Writer* f) : ColorOutput(f) {
+TextOutput::TextOutput(mylib::Writer* f) : ::format::ColorOutput(f) {
 }
 
 format::TextOutput* TextOutput::NewTempBuffer() {
@@ -235,7 +501,7 @@ void TextOutput::PopColor() {
   ;  // pass
 }
 
-HtmlOutput::HtmlOutput(mylib::Writer* f) : ColorOutput(f) {
+HtmlOutput::HtmlOutput(mylib::Writer* f) : ::format::ColorOutput(f) {
 }
 
 format::HtmlOutput* HtmlOutput::NewTempBuffer() {
@@ -243,11 +509,11 @@ format::HtmlOutput* HtmlOutput::NewTempBuffer() {
 }
 
 void HtmlOutput::FileHeader() {
-  this->f->write(str5);
+  this->f->write(str6);
 }
 
 void HtmlOutput::FileFooter() {
-  this->f->write(str6);
+  this->f->write(str7);
 }
 
 void HtmlOutput::PushColor(hnode_asdl::color_t e_color) {
@@ -255,23 +521,23 @@ void HtmlOutput::PushColor(hnode_asdl::color_t e_color) {
   StackRoot _root0(&css_class);
 
   if (e_color == color_e::TypeName) {
-    css_class = str7;
+    css_class = str8;
   }
   else {
     if (e_color == color_e::StringConst) {
-      css_class = str8;
+      css_class = str9;
     }
     else {
       if (e_color == color_e::OtherConst) {
-        css_class = str9;
+        css_class = str10;
       }
       else {
         if (e_color == color_e::External) {
-          css_class = str10;
+          css_class = str11;
         }
         else {
           if (e_color == color_e::UserType) {
-            css_class = str11;
+            css_class = str12;
           }
           else {
             assert(0);  // AssertionError
@@ -284,7 +550,7 @@ void HtmlOutput::PushColor(hnode_asdl::color_t e_color) {
 }
 
 void HtmlOutput::PopColor() {
-  this->f->write(str13);
+  this->f->write(str14);
 }
 
 void HtmlOutput::write(BigStr* s) {
@@ -294,7 +560,7 @@ void HtmlOutput::write(BigStr* s) {
   this->num_chars += len(s);
 }
 
-AnsiOutput::AnsiOutput(mylib::Writer* f) : ColorOutput(f) {
+AnsiOutput::AnsiOutput(mylib::Writer* f) : ::format::ColorOutput(f) {
 }
 
 format::AnsiOutput* AnsiOutput::NewTempBuffer() {
@@ -358,7 +624,7 @@ bool _PrettyPrinter::_PrintWrappedArray(List<hnode_asdl::hnode_t*>* array, int p
     hnode_asdl::hnode_t* val = it.Value();
     StackRoot _for(&val  );
     if (i != 0) {
-      f->write(str14);
+      f->write(str15);
     }
     single_f = f->NewTempBuffer();
     if (_TrySingleLine(val, single_f, (this->max_col - chars_so_far))) {
@@ -369,7 +635,7 @@ bool _PrettyPrinter::_PrintWrappedArray(List<hnode_asdl::hnode_t*>* array, int p
       chars_so_far += single_f->NumChars();
     }
     else {
-      f->write(str15);
+      f->write(str16);
       this->PrintNode(val, f, (indent + INDENT));
       chars_so_far = 0;
       all_fit = false;
@@ -417,11 +683,11 @@ bool _PrettyPrinter::_PrintWholeArray(List<hnode_asdl::hnode_t*>* array, int pre
       Tuple2<BigStr*, int>* p = it.Value();
       StackRoot _for(&p    );
       if (i != 0) {
-        f->write(str16);
+        f->write(str17);
       }
       f->WriteRaw(p);
     }
-    f->write(str17);
+    f->write(str18);
   }
   return all_fit;
 }
@@ -452,7 +718,7 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
   StackRoot _root9(&single_f);
   StackRoot _root10(&s);
 
-  ind = str_repeat(str18, indent);
+  ind = str_repeat(str19, indent);
   if (node->abbrev) {
     prefix = str_concat(ind, node->left);
     f->write(prefix);
@@ -460,12 +726,12 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
       f->PushColor(color_e::TypeName);
       f->write(node->node_type);
       f->PopColor();
-      f->write(str19);
+      f->write(str20);
     }
     prefix_len = ((len(prefix) + len(node->node_type)) + 1);
     all_fit = this->_PrintWrappedArray(node->unnamed_fields, prefix_len, f, indent);
     if (!all_fit) {
-      f->write(str20);
+      f->write(str21);
       f->write(ind);
     }
     f->write(node->right);
@@ -475,13 +741,13 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
     f->PushColor(color_e::TypeName);
     f->write(node->node_type);
     f->PopColor();
-    f->write(str21);
+    f->write(str22);
     for (ListIter<hnode_asdl::Field*> it(node->fields); !it.Done(); it.Next()) {
       hnode_asdl::Field* field = it.Value();
       StackRoot _for(&field    );
       name = field->name;
       val = field->val;
-      ind1 = str_repeat(str22, (indent + INDENT));
+      ind1 = str_repeat(str23, (indent + INDENT));
       UP_val = val;
       tag = val->tag();
       if (tag == hnode_e::Array) {
@@ -490,12 +756,12 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
         f->write(name_str);
         prefix_len = len(name_str);
         if (!this->_PrintWholeArray(val->children, prefix_len, f, indent)) {
-          f->write(str24);
+          f->write(str25);
           for (ListIter<hnode_asdl::hnode_t*> it(val->children); !it.Done(); it.Next()) {
             hnode_asdl::hnode_t* child = it.Value();
             StackRoot _for(&child          );
             this->PrintNode(child, f, ((indent + INDENT) + INDENT));
-            f->write(str25);
+            f->write(str26);
           }
           f->write(StrFormat("%s]", ind1));
         }
@@ -512,11 +778,11 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
           f->WriteRaw((Alloc<Tuple2<BigStr*, int>>(s, num_chars)));
         }
         else {
-          f->write(str28);
+          f->write(str29);
           this->PrintNode(val, f, ((indent + INDENT) + INDENT));
         }
       }
-      f->write(str29);
+      f->write(str30);
     }
     f->write(str_concat(ind, node->right));
   }
@@ -536,7 +802,7 @@ void _PrettyPrinter::PrintNode(hnode_asdl::hnode_t* node, format::ColorOutput* f
   StackRoot _root4(&s);
   StackRoot _root5(&UP_node);
 
-  ind = str_repeat(str30, indent);
+  ind = str_repeat(str31, indent);
   single_f = f->NewTempBuffer();
   single_f->write(ind);
   if (_TrySingleLine(node, single_f, (this->max_col - indent))) {
@@ -560,7 +826,7 @@ void _PrettyPrinter::PrintNode(hnode_asdl::hnode_t* node, format::ColorOutput* f
       f->PushColor(color_e::External);
       // if not PYTHON
       {
-        f->write(str31);
+        f->write(str32);
       }
       // endif MYCPP
       f->PopColor();
@@ -594,14 +860,14 @@ bool _TrySingleLineObj(hnode::Record* node, format::ColorOutput* f, int max_char
       f->PushColor(color_e::TypeName);
       f->write(node->node_type);
       f->PopColor();
-      f->write(str33);
+      f->write(str34);
     }
     i = 0;
     for (ListIter<hnode_asdl::hnode_t*> it(node->unnamed_fields); !it.Done(); it.Next(), ++i) {
       hnode_asdl::hnode_t* val = it.Value();
       StackRoot _for(&val    );
       if (i != 0) {
-        f->write(str34);
+        f->write(str35);
       }
       if (!_TrySingleLine(val, f, max_chars)) {
         return false;
@@ -648,7 +914,7 @@ bool _TrySingleLine(hnode_asdl::hnode_t* node, format::ColorOutput* f, int max_c
       f->PushColor(color_e::External);
       // if not PYTHON
       {
-        f->write(str36);
+        f->write(str37);
       }
       // endif MYCPP
       f->PopColor();
@@ -656,19 +922,19 @@ bool _TrySingleLine(hnode_asdl::hnode_t* node, format::ColorOutput* f, int max_c
     else {
       if (tag == hnode_e::Array) {
         hnode::Array* node = static_cast<hnode::Array*>(UP_node);
-        f->write(str37);
+        f->write(str38);
         i = 0;
         for (ListIter<hnode_asdl::hnode_t*> it(node->children); !it.Done(); it.Next(), ++i) {
           hnode_asdl::hnode_t* item = it.Value();
           StackRoot _for(&item        );
           if (i != 0) {
-            f->write(str38);
+            f->write(str39);
           }
           if (!_TrySingleLine(item, f, max_chars)) {
             return false;
           }
         }
-        f->write(str39);
+        f->write(str40);
       }
       else {
         if (tag == hnode_e::Record) {
@@ -708,16 +974,16 @@ void PrintTree(hnode_asdl::hnode_t* node, format::ColorOutput* f) {
 
 namespace ansi {  // define
 
-BigStr* RESET = str41;
-BigStr* BOLD = str42;
-BigStr* UNDERLINE = str43;
-BigStr* REVERSE = str44;
-BigStr* RED = str45;
-BigStr* GREEN = str46;
-BigStr* YELLOW = str47;
-BigStr* BLUE = str48;
-BigStr* MAGENTA = str49;
-BigStr* CYAN = str50;
+BigStr* RESET = str42;
+BigStr* BOLD = str43;
+BigStr* UNDERLINE = str44;
+BigStr* REVERSE = str45;
+BigStr* RED = str46;
+BigStr* GREEN = str47;
+BigStr* YELLOW = str48;
+BigStr* BLUE = str49;
+BigStr* MAGENTA = str50;
+BigStr* CYAN = str51;
 
 }  // define namespace ansi
 
@@ -727,9 +993,9 @@ namespace cgi {  // define
 BigStr* escape(BigStr* s) {
   StackRoot _root0(&s);
 
-  s = s->replace(str51, str52);
-  s = s->replace(str53, str54);
-  s = s->replace(str55, str56);
+  s = s->replace(str52, str53);
+  s = s->replace(str54, str55);
+  s = s->replace(str56, str57);
   return s;
 }
 
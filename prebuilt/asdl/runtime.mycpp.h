@@ -10,6 +10,8 @@
 namespace runtime {  // forward declare
 
   class TraversalState;
+  class Encoder;
+  class Decoder;
 
 }  // forward declare namespace runtime
 
@@ -44,6 +46,67 @@ class TraversalState {
 
 extern BigStr* TRUE_STR;
 extern BigStr* FALSE_STR;
+extern int MARSHAL_NULL;
+extern int MARSHAL_REF;
+mops::BigInt _ZigZag(int i);
+int _UnZigZag(mops::BigInt u);
+void _WriteVarint(List<BigStr*>* out, mops::BigInt n);
+class Encoder {
+ public:
+  Encoder();
+  void External(int heap_id);
+  bool Begin(int heap_id, int tag);
+  void End(int heap_id);
+  void Null();
+  void Int(int i);
+  void Bool(bool b);
+  void Str(BigStr* s);
+  void Len(int n);
+  void Unsupported();
+  BigStr* Serialize();
+  List<int>* ints;
+  List<BigStr*>* strs;
+  Dict<int, int>* obj_nums;
+  bool ok;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassScanned(3, sizeof(Encoder));
+  }
+
+  DISALLOW_COPY_AND_ASSIGN(Encoder)
+};
+
+class Decoder {
+ public:
+  Decoder(BigStr* blob);
+  mops::BigInt _ReadVarint(int num_bits);
+  int _ReadLen();
+  void _Parse();
+  void External(void* obj);
+  void Register(void* obj);
+  int Int();
+  bool Bool();
+  BigStr* Str();
+  int Len();
+  void* Ref();
+  void BadTag(int tag);
+  void Unsupported();
+  bool AtEnd();
+  BigStr* blob;
+  List<int>* ints;
+  List<BigStr*>* strs;
+  List<void*>* objs;
+  int pos;
+  int int_pos;
+  int str_pos;
+  bool ok;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassScanned(4, sizeof(Decoder));
+  }
+
+  DISALLOW_COPY_AND_ASSIGN(Decoder)
+};
 
 
 }  // declare namespace runtime
@@ -78,7 +141,7 @@ class ColorOutput {
   DISALLOW_COPY_AND_ASSIGN(ColorOutput)
 };
 
-class TextOutput : public ColorOutput {
+class TextOutput : public ::format::ColorOutput {
  public:
   TextOutput(mylib::Writer* f);
   virtual format::TextOutput* NewTempBuffer();
@@ -86,7 +149,7 @@ class TextOutput : public ColorOutput {
   virtual void PopColor();
   
   static constexpr uint32_t field_mask() {
-    return ColorOutput::field_mask();
+    return ::format::ColorOutput::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -96,7 +159,7 @@ class TextOutput : public ColorOutput {
   DISALLOW_COPY_AND_ASSIGN(TextOutput)
 };
 
-class HtmlOutput : public ColorOutput {
+class HtmlOutput : public ::format::ColorOutput {
  public:
   HtmlOutput(mylib::Writer* f);
   virtual format::HtmlOutput* NewTempBuffer();
@@ -107,7 +170,7 @@ class HtmlOutput : public ColorOutput {
   virtual void write(BigStr* s);
   
   static constexpr uint32_t field_mask() {
-    return ColorOutput::field_mask();
+    return ::format::ColorOutput::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -117,7 +180,7 @@ class HtmlOutput : public ColorOutput {
   DISALLOW_COPY_AND_ASSIGN(HtmlOutput)
 };
 
-class AnsiOutput : public ColorOutput {
+class AnsiOutput : public ::format::ColorOutput {
  public:
   AnsiOutput(mylib::Writer* f);
   virtual format::AnsiOutput* NewTempBuffer();
@@ -125,7 +188,7 @@ class AnsiOutput : public ColorOutput {
   virtual void PopColor();
   
   static constexpr uint32_t field_mask() {
-    return ColorOutput::field_mask();
+    return ::format::ColorOutput::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -156,7 +219,6 @@ bool _TrySingleLineObj(hnode::Record* node, format::ColorOutput* f, int max_char
 bool _TrySingleLine(hnode_asdl::hnode_t* node, format::ColorOutput* f, int max_chars);
 void PrintTree(hnode_asdl::hnode_t* node, format::ColorOutput* f);
 
-
 }  // declare namespace format
 
 #endif  // ASDL_RUNTIME_MYCPP_H
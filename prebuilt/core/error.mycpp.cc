@@ -10,15 +10,18 @@ GLOBAL_STR(str1, ")");
 GLOBAL_STR(str2, "_");
 GLOBAL_STR(str3, "T");
 GLOBAL_STR(str4, "F");
-GLOBAL_STR(str5, "<%s %r>");
-GLOBAL_STR(str6, "status");
-GLOBAL_STR(str7, "message");
-GLOBAL_STR(str8, "%s, got %s");
-GLOBAL_STR(str9, " (line %d, offset %d-%d: %r)");
+GLOBAL_STR(str5, "");
+GLOBAL_STR(str6, "<%s %r>");
+GLOBAL_STR(str7, "status");
+GLOBAL_STR(str8, "message");
+GLOBAL_STR(str9, "%s, got %s");
+GLOBAL_STR(str10, " (line %d, offset %d-%d: %r)");
 
 namespace runtime {  // forward declare
 
   class TraversalState;
+  class Encoder;
+  class Decoder;
 
 }  // forward declare namespace runtime
 
@@ -48,6 +51,67 @@ class TraversalState {
 
 extern BigStr* TRUE_STR;
 extern BigStr* FALSE_STR;
+extern int MARSHAL_NULL;
+extern int MARSHAL_REF;
+mops::BigInt _ZigZag(int i);
+int _UnZigZag(mops::BigInt u);
+void _WriteVarint(List<BigStr*>* out, mops::BigInt n);
+class Encoder {
+ public:
+  Encoder();
+  void External(int heap_id);
+  bool Begin(int heap_id, int tag);
+  void End(int heap_id);
+  void Null();
+  void Int(int i);
+  void Bool(bool b);
+  void Str(BigStr* s);
+  void Len(int n);
+  void Unsupported();
+  BigStr* Serialize();
+  List<int>* ints;
+  List<BigStr*>* strs;
+  Dict<int, int>* obj_nums;
+  bool ok;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassScanned(3, sizeof(Encoder));
+  }
+
+  DISALLOW_COPY_AND_ASSIGN(Encoder)
+};
+
+class Decoder {
+ public:
+  Decoder(BigStr* blob);
+  mops::BigInt _ReadVarint(int num_bits);
+  int _ReadLen();
+  void _Parse();
+  void External(void* obj);
+  void Register(void* obj);
+  int Int();
+  bool Bool();
+  BigStr* Str();
+  int Len();
+  void* Ref();
+  void BadTag(int tag);
+  void Unsupported();
+  bool AtEnd();
+  BigStr* blob;
+  List<int>* ints;
+  List<BigStr*>* strs;
+  List<void*>* objs;
+  int pos;
+  int int_pos;
+  int str_pos;
+  bool ok;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassScanned(4, sizeof(Decoder));
+  }
+
+  DISALLOW_COPY_AND_ASSIGN(Decoder)
+};
 
 
 }  // declare namespace runtime
@@ -62,7 +126,6 @@ int IntDivide2(int x, int y);
 mops::BigInt IntRemainder(mops::BigInt x, mops::BigInt y);
 int IntRemainder2(int x, int y);
 
-
 }  // declare namespace num
 
 namespace runtime {  // define
@@ -95,6 +158,274 @@ TraversalState::TraversalState() {
 }
 BigStr* TRUE_STR = str3;
 BigStr* FALSE_STR = str4;
+int MARSHAL_NULL = 0;
+int MARSHAL_REF = -1;
+
+mops::BigInt _ZigZag(int i) {
+  mops::BigInt b;
+  mops::BigInt twice;
+  b = mops::IntWiden(i);
+  twice = mops::Add(b, b);
+  if (i >= 0) {
+    return twice;
+  }
+  return mops::Sub(mops::Negate(twice), mops::ONE);
+}
+
+int _UnZigZag(mops::BigInt u) {
+  mops::BigInt half;
+  half = mops::RShift(u, mops::ONE);
+  if (mops::Equal(mops::BitAnd(u, mops::ONE), mops::ZERO)) {
+    return mops::BigTruncate(half);
+  }
+  return mops::BigTruncate(mops::Sub(mops::Negate(half), mops::ONE));
+}
+
+void _WriteVarint(List<BigStr*>* out, mops::BigInt n) {
+  int low;
+  StackRoot _root0(&out);
+
+  while (mops::Greater(n, mops::IntWiden(127))) {
+    low = mops::BigTruncate(mops::BitAnd(n, mops::IntWiden(127)));
+    out->append(chr((low | 128)));
+    n = mops::RShift(n, mops::IntWiden(7));
+  }
+  out->append(chr(mops::BigTruncate(n)));
+}
+
+Encoder::Encoder() {
+  this->ints = Alloc<List<int>>();
+  this->strs = Alloc<List<BigStr*>>();
+  this->obj_nums = Alloc<Dict<int, int>>();
+  this->ok = true;
+}
+
+void Encoder::External(int heap_id) {
+  this->obj_nums->set(heap_id, len(this->obj_nums));
+}
+
+bool Encoder::Begin(int heap_id, int tag) {
+  int num;
+  num = this->obj_nums->get(heap_id, -1);
+  if (num != -1) {
+    this->ints->append(MARSHAL_REF);
+    this->ints->append(num);
+    return false;
+  }
+  this->ints->append(tag);
+  return true;
+}
+
+void Encoder::End(int heap_id) {
+  this->obj_nums->set(heap_id, len(this->obj_nums));
+}
+
+void Encoder::Null() {
+  this->ints->append(MARSHAL_NULL);
+}
+
+void Encoder::Int(int i) {
+  this->ints->append(i);
+}
+
+void Encoder::Bool(bool b) {
+  this->ints->append(b ? 1 : 0);
+}
+
+void Encoder::Str(BigStr* s) {
+  StackRoot _root0(&s);
+
+  this->strs->append(s);
+}
+
+void Encoder::Len(int n) {
+  this->ints->append(n);
+}
+
+void Encoder::Unsupported() {
+  this->ok = false;
+  this->ints->append(MARSHAL_NULL);
+}
+
+BigStr* Encoder::Serialize() {
+  List<BigStr*>* out = nullptr;
+  BigStr* s = nullptr;
+  StackRoot _root0(&out);
+  StackRoot _root1(&s);
+
+  out = Alloc<List<BigStr*>>();
+  _WriteVarint(out, mops::IntWiden(len(this->ints)));
+  for (ListIter<int> it(this->ints); !it.Done(); it.Next()) {
+    int i = it.Value();
+    _WriteVarint(out, _ZigZag(i));
+  }
+  _WriteVarint(out, mops::IntWiden(len(this->strs)));
+  for (int j = 0; j < len(this->strs); ++j) {
+    s = this->strs->at(j);
+    if (s == nullptr) {
+      _WriteVarint(out, mops::ZERO);
+    }
+    else {
+      _WriteVarint(out, mops::IntWiden((len(s) + 1)));
+      out->append(s);
+    }
+  }
+  return str5->join(out);
+}
+
+Decoder::Decoder(BigStr* blob) {
+  this->blob = blob;
+  this->pos = 0;
+  this->ints = Alloc<List<int>>();
+  this->strs = Alloc<List<BigStr*>>();
+  this->int_pos = 0;
+  this->str_pos = 0;
+  this->objs = Alloc<List<void*>>();
+  this->ok = true;
+  this->_Parse();
+}
+
+mops::BigInt Decoder::_ReadVarint(int num_bits) {
+  mops::BigInt n;
+  int shift;
+  int b;
+  n = mops::ZERO;
+  shift = 0;
+  while (true) {
+    if ((this->pos >= len(this->blob) or shift >= 32)) {
+      this->ok = false;
+      return mops::ZERO;
+    }
+    b = mylib::ByteAt(this->blob, this->pos);
+    this->pos += 1;
+    n = mops::BitOr(n, mops::LShift(mops::IntWiden((b & 127)), mops::IntWiden(shift)));
+    if (b < 128) {
+      break;
+    }
+    shift += 7;
+  }
+  if (!mops::Equal(mops::RShift(n, mops::IntWiden(num_bits)), mops::ZERO)) {
+    this->ok = false;
+    return mops::ZERO;
+  }
+  return n;
+}
+
+int Decoder::_ReadLen() {
+  return mops::BigTruncate(this->_ReadVarint(31));
+}
+
+void Decoder::_Parse() {
+  int num_ints;
+  mops::BigInt u;
+  int num_strs;
+  int n;
+  int end;
+  num_ints = this->_ReadLen();
+  for (int _ = 0; _ < num_ints; ++_) {
+    u = this->_ReadVarint(32);
+    if (!this->ok) {
+      return ;
+    }
+    this->ints->append(_UnZigZag(u));
+  }
+  num_strs = this->_ReadLen();
+  for (int _ = 0; _ < num_strs; ++_) {
+    n = this->_ReadLen();
+    if (!this->ok) {
+      return ;
+    }
+    if (n == 0) {
+      this->strs->append(nullptr);
+      continue;
+    }
+    end = ((this->pos + n) - 1);
+    if (end > len(this->blob)) {
+      this->ok = false;
+      return ;
+    }
+    this->strs->append(this->blob->slice(this->pos, end));
+    this->pos = end;
+  }
+  if (this->pos != len(this->blob)) {
+    this->ok = false;
+  }
+}
+
+void Decoder::External(void* obj) {
+  StackRoot _root0(&obj);
+
+  this->objs->append(obj);
+}
+
+void Decoder::Register(void* obj) {
+  StackRoot _root0(&obj);
+
+  this->objs->append(obj);
+}
+
+int Decoder::Int() {
+  int i;
+  if (this->int_pos >= len(this->ints)) {
+    this->ok = false;
+    return MARSHAL_NULL;
+  }
+  i = this->ints->at(this->int_pos);
+  this->int_pos += 1;
+  return i;
+}
+
+bool Decoder::Bool() {
+  return this->Int() != 0;
+}
+
+BigStr* Decoder::Str() {
+  BigStr* s = nullptr;
+  StackRoot _root0(&s);
+
+  if (this->str_pos >= len(this->strs)) {
+    this->ok = false;
+    return nullptr;
+  }
+  s = this->strs->at(this->str_pos);
+  this->str_pos += 1;
+  return s;
+}
+
+int Decoder::Len() {
+  int n;
+  int remaining;
+  n = this->Int();
+  remaining = (((len(this->ints) - this->int_pos) + len(this->strs)) - this->str_pos);
+  if ((n < -1 or n > remaining)) {
+    this->ok = false;
+    return 0;
+  }
+  return n;
+}
+
+void* Decoder::Ref() {
+  int num;
+  num = this->Int();
+  if ((num < 0 or num >= len(this->objs))) {
+    this->ok = false;
+    return nullptr;
+  }
+  return this->objs->at(num);
+}
+
+void Decoder::BadTag(int tag) {
+  this->ok = false;
+}
+
+void Decoder::Unsupported() {
+  this->Int();
+  this->ok = false;
+}
+
+bool Decoder::AtEnd() {
+  return (this->int_pos == len(this->ints) and this->str_pos == len(this->strs));
+}
 
 }  // define namespace runtime
 
@@ -131,19 +462,19 @@ BigStr* _ErrorWithLocation::UserErrorString() {
   return this->msg;
 }
 
-Usage::Usage(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+Usage::Usage(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-Parse::Parse(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+Parse::Parse(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-FailGlob::FailGlob(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+FailGlob::FailGlob(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-RedirectEval::RedirectEval(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+RedirectEval::RedirectEval(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-FatalRuntime::FatalRuntime(int exit_status, BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+FatalRuntime::FatalRuntime(int exit_status, BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
   this->exit_status = exit_status;
 }
 
@@ -151,17 +482,17 @@ int FatalRuntime::ExitStatus() {
   return this->exit_status;
 }
 
-Strict::Strict(BigStr* msg, syntax_asdl::loc_t* location) : FatalRuntime(1, msg, location) {
+Strict::Strict(BigStr* msg, syntax_asdl::loc_t* location) : ::error::FatalRuntime(1, msg, location) {
 }
 
-ErrExit::ErrExit(int exit_status, BigStr* msg, syntax_asdl::loc_t* location, bool show_code) : FatalRuntime(exit_status, msg, location) {
+ErrExit::ErrExit(int exit_status, BigStr* msg, syntax_asdl::loc_t* location, bool show_code) : ::error::FatalRuntime(exit_status, msg, location) {
   this->show_code = show_code;
 }
 
-Expr::Expr(BigStr* msg, syntax_asdl::loc_t* location) : FatalRuntime(3, msg, location) {
+Expr::Expr(BigStr* msg, syntax_asdl::loc_t* location) : ::error::FatalRuntime(3, msg, location) {
 }
 
-Structured::Structured(int status, BigStr* msg, syntax_asdl::loc_t* location, Dict<BigStr*, value_asdl::value_t*>* properties) : FatalRuntime(status, msg, location) {
+Structured::Structured(int status, BigStr* msg, syntax_asdl::loc_t* location, Dict<BigStr*, value_asdl::value_t*>* properties) : ::error::FatalRuntime(status, msg, location) {
   this->properties = properties;
 }
 
@@ -169,18 +500,18 @@ value::Dict* Structured::ToDict() {
   if (this->properties == nullptr) {
     this->properties = Alloc<Dict<BigStr*, value_asdl::value_t*>>();
   }
-  this->properties->set(str6, num::ToBig(this->ExitStatus()));
-  this->properties->set(str7, Alloc<value::Str>(this->msg));
+  this->properties->set(str7, num::ToBig(this->ExitStatus()));
+  this->properties->set(str8, Alloc<value::Str>(this->msg));
   return Alloc<value::Dict>(this->properties);
 }
 
-AssertionErr::AssertionErr(BigStr* msg, syntax_asdl::loc_t* location) : Expr(msg, location) {
+AssertionErr::AssertionErr(BigStr* msg, syntax_asdl::loc_t* location) : ::error::Expr(msg, location) {
 }
 
-TypeErrVerbose::TypeErrVerbose(BigStr* msg, syntax_asdl::loc_t* location) : Expr(msg, location) {
+TypeErrVerbose::TypeErrVerbose(BigStr* msg, syntax_asdl::loc_t* location) : ::error::Expr(msg, location) {
 }
 
-TypeErr::TypeErr(value_asdl::value_t* actual_val, BigStr* msg, syntax_asdl::loc_t* location) : TypeErrVerbose(StrFormat("%s, got %s", msg, _ValType(actual_val)), location) {
+TypeErr::TypeErr(value_asdl::value_t* actual_val, BigStr* msg, syntax_asdl::loc_t* location) : ::error::TypeErrVerbose(StrFormat("%s, got %s", msg, _ValType(actual_val)), location) {
 }
 
 Runtime::Runtime(BigStr* msg) {
@@ -58,12 +58,12 @@ class _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(_ErrorWithLocation)
 };
 
-class Usage : public _ErrorWithLocation {
+class Usage : public ::error::_ErrorWithLocation {
  public:
   Usage(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -73,12 +73,12 @@ class Usage : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(Usage)
 };
 
-class Parse : public _ErrorWithLocation {
+class Parse : public ::error::_ErrorWithLocation {
  public:
   Parse(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -88,12 +88,12 @@ class Parse : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(Parse)
 };
 
-class FailGlob : public _ErrorWithLocation {
+class FailGlob : public ::error::_ErrorWithLocation {
  public:
   FailGlob(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -103,12 +103,12 @@ class FailGlob : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(FailGlob)
 };
 
-class RedirectEval : public _ErrorWithLocation {
+class RedirectEval : public ::error::_ErrorWithLocation {
  public:
   RedirectEval(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -118,7 +118,7 @@ class RedirectEval : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(RedirectEval)
 };
 
-class FatalRuntime : public _ErrorWithLocation {
+class FatalRuntime : public ::error::_ErrorWithLocation {
  public:
   FatalRuntime(int exit_status, BigStr* msg, syntax_asdl::loc_t* location);
   int ExitStatus();
@@ -126,7 +126,7 @@ class FatalRuntime : public _ErrorWithLocation {
   int exit_status;
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -136,12 +136,12 @@ class FatalRuntime : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(FatalRuntime)
 };
 
-class Strict : public FatalRuntime {
+class Strict : public ::error::FatalRuntime {
  public:
   Strict(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask();
+    return ::error::FatalRuntime::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -151,14 +151,14 @@ class Strict : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(Strict)
 };
 
-class ErrExit : public FatalRuntime {
+class ErrExit : public ::error::FatalRuntime {
  public:
   ErrExit(int exit_status, BigStr* msg, syntax_asdl::loc_t* location, bool show_code = false);
 
   bool show_code;
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask();
+    return ::error::FatalRuntime::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -168,12 +168,12 @@ class ErrExit : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(ErrExit)
 };
 
-class Expr : public FatalRuntime {
+class Expr : public ::error::FatalRuntime {
  public:
   Expr(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask();
+    return ::error::FatalRuntime::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -183,7 +183,7 @@ class Expr : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(Expr)
 };
 
-class Structured : public FatalRuntime {
+class Structured : public ::error::FatalRuntime {
  public:
   Structured(int status, BigStr* msg, syntax_asdl::loc_t* location, Dict<BigStr*, value_asdl::value_t*>* properties = nullptr);
   value::Dict* ToDict();
@@ -191,7 +191,7 @@ class Structured : public FatalRuntime {
   Dict<BigStr*, value_asdl::value_t*>* properties;
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask()
+    return ::error::FatalRuntime::field_mask()
          | maskbit(offsetof(Structured, properties));
   }
 
@@ -202,12 +202,12 @@ class Structured : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(Structured)
 };
 
-class AssertionErr : public Expr {
+class AssertionErr : public ::error::Expr {
  public:
   AssertionErr(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return Expr::field_mask();
+    return ::error::Expr::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -217,12 +217,12 @@ class AssertionErr : public Expr {
   DISALLOW_COPY_AND_ASSIGN(AssertionErr)
 };
 
-class TypeErrVerbose : public Expr {
+class TypeErrVerbose : public ::error::Expr {
  public:
   TypeErrVerbose(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return Expr::field_mask();
+    return ::error::Expr::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -232,12 +232,12 @@ class TypeErrVerbose : public Expr {
   DISALLOW_COPY_AND_ASSIGN(TypeErrVerbose)
 };
 
-class TypeErr : public TypeErrVerbose {
+class TypeErr : public ::error::TypeErrVerbose {
  public:
   TypeErr(value_asdl::value_t* actual_val, BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return TypeErrVerbose::field_mask();
+    return ::error::TypeErrVerbose::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -297,7 +297,6 @@ class Encode {
 [[noreturn]] void e_die(BigStr* msg, syntax_asdl::loc_t* location = nullptr);
 [[noreturn]] void e_die_status(int status, BigStr* msg, syntax_asdl::loc_t* location = nullptr);
 
-
 }  // declare namespace error
 
 #endif  // CORE_ERROR_MYCPP_H
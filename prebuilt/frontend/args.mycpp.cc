@@ -10,116 +10,117 @@ GLOBAL_STR(str1, ")");
 GLOBAL_STR(str2, "_");
 GLOBAL_STR(str3, "T");
 GLOBAL_STR(str4, "F");
-GLOBAL_STR(str5, "\n<html>\n  <head>\n     <title>oil AST</title>\n     <style>\n      .n { color: brown }\n      .s { font-weight: bold }\n      .o { color: darkgreen }\n     </style>\n  </head>\n  <body>\n    <pre>\n");
-GLOBAL_STR(str6, "\n    </pre>\n  </body>\n</html>\n    ");
-GLOBAL_STR(str7, "n");
-GLOBAL_STR(str8, "s");
-GLOBAL_STR(str9, "o");
+GLOBAL_STR(str5, "");
+GLOBAL_STR(str6, "\n<html>\n  <head>\n     <title>oil AST</title>\n     <style>\n      .n { color: brown }\n      .s { font-weight: bold }\n      .o { color: darkgreen }\n     </style>\n  </head>\n  <body>\n    <pre>\n");
+GLOBAL_STR(str7, "\n    </pre>\n  </body>\n</html>\n    ");
+GLOBAL_STR(str8, "n");
+GLOBAL_STR(str9, "s");
 GLOBAL_STR(str10, "o");
 GLOBAL_STR(str11, "o");
-GLOBAL_STR(str12, "<span class=\"%s\">");
-GLOBAL_STR(str13, "</span>");
-GLOBAL_STR(str14, " ");
-GLOBAL_STR(str15, "\n");
-GLOBAL_STR(str16, " ");
-GLOBAL_STR(str17, "]");
-GLOBAL_STR(str18, " ");
+GLOBAL_STR(str12, "o");
+GLOBAL_STR(str13, "<span class=\"%s\">");
+GLOBAL_STR(str14, "</span>");
+GLOBAL_STR(str15, " ");
+GLOBAL_STR(str16, "\n");
+GLOBAL_STR(str17, " ");
+GLOBAL_STR(str18, "]");
 GLOBAL_STR(str19, " ");
-GLOBAL_STR(str20, "\n");
+GLOBAL_STR(str20, " ");
 GLOBAL_STR(str21, "\n");
-GLOBAL_STR(str22, " ");
-GLOBAL_STR(str23, "%s%s: [");
-GLOBAL_STR(str24, "\n");
+GLOBAL_STR(str22, "\n");
+GLOBAL_STR(str23, " ");
+GLOBAL_STR(str24, "%s%s: [");
 GLOBAL_STR(str25, "\n");
-GLOBAL_STR(str26, "%s]");
-GLOBAL_STR(str27, "%s%s: ");
-GLOBAL_STR(str28, "\n");
+GLOBAL_STR(str26, "\n");
+GLOBAL_STR(str27, "%s]");
+GLOBAL_STR(str28, "%s%s: ");
 GLOBAL_STR(str29, "\n");
-GLOBAL_STR(str30, " ");
-GLOBAL_STR(str31, "UNTYPED any");
-GLOBAL_STR(str32, "...0x%s");
-GLOBAL_STR(str33, " ");
+GLOBAL_STR(str30, "\n");
+GLOBAL_STR(str31, " ");
+GLOBAL_STR(str32, "UNTYPED any");
+GLOBAL_STR(str33, "...0x%s");
 GLOBAL_STR(str34, " ");
-GLOBAL_STR(str35, " %s:");
-GLOBAL_STR(str36, "UNTYPED any");
-GLOBAL_STR(str37, "[");
-GLOBAL_STR(str38, " ");
-GLOBAL_STR(str39, "]");
-GLOBAL_STR(str40, "...0x%s");
-GLOBAL_STR(str41, "\u001b[0;0m");
-GLOBAL_STR(str42, "\u001b[1m");
-GLOBAL_STR(str43, "\u001b[4m");
-GLOBAL_STR(str44, "\u001b[7m");
-GLOBAL_STR(str45, "\u001b[31m");
-GLOBAL_STR(str46, "\u001b[32m");
-GLOBAL_STR(str47, "\u001b[33m");
-GLOBAL_STR(str48, "\u001b[34m");
-GLOBAL_STR(str49, "\u001b[35m");
-GLOBAL_STR(str50, "\u001b[36m");
-GLOBAL_STR(str51, "&");
-GLOBAL_STR(str52, "&amp;");
-GLOBAL_STR(str53, "<");
-GLOBAL_STR(str54, "&lt;");
-GLOBAL_STR(str55, ">");
-GLOBAL_STR(str56, "&gt;");
-GLOBAL_STR(str57, "<%s %r>");
-GLOBAL_STR(str58, "status");
-GLOBAL_STR(str59, "message");
-GLOBAL_STR(str60, "%s, got %s");
-GLOBAL_STR(str61, " (line %d, offset %d-%d: %r)");
-GLOBAL_STR(str62, "-");
-GLOBAL_STR(str63, "_");
-GLOBAL_STR(str64, "<_Attributes %s>");
-GLOBAL_STR(str65, "<args.Reader %r %d>");
-GLOBAL_STR(str66, "expected argument to %r");
-GLOBAL_STR(str67, "-");
-GLOBAL_STR(str68, "expected integer after %s, got %r");
-GLOBAL_STR(str69, "-");
-GLOBAL_STR(str70, "got invalid integer for %s: %s");
-GLOBAL_STR(str71, "-");
-GLOBAL_STR(str72, "expected number after %r, got %r");
-GLOBAL_STR(str73, "-");
-GLOBAL_STR(str74, "got invalid float for %s: %s");
-GLOBAL_STR(str75, "-");
-GLOBAL_STR(str76, "got invalid argument %r to %r, expected one of: %s");
-GLOBAL_STR(str77, "-");
-GLOBAL_STR(str78, "|");
-GLOBAL_STR(str79, "0");
-GLOBAL_STR(str80, "F");
-GLOBAL_STR(str81, "false");
-GLOBAL_STR(str82, "False");
-GLOBAL_STR(str83, "1");
-GLOBAL_STR(str84, "T");
-GLOBAL_STR(str85, "true");
-GLOBAL_STR(str86, "Talse");
-GLOBAL_STR(str87, "got invalid argument to boolean flag: %r");
-GLOBAL_STR(str88, "-");
+GLOBAL_STR(str35, " ");
+GLOBAL_STR(str36, " %s:");
+GLOBAL_STR(str37, "UNTYPED any");
+GLOBAL_STR(str38, "[");
+GLOBAL_STR(str39, " ");
+GLOBAL_STR(str40, "]");
+GLOBAL_STR(str41, "...0x%s");
+GLOBAL_STR(str42, "\u001b[0;0m");
+GLOBAL_STR(str43, "\u001b[1m");
+GLOBAL_STR(str44, "\u001b[4m");
+GLOBAL_STR(str45, "\u001b[7m");
+GLOBAL_STR(str46, "\u001b[31m");
+GLOBAL_STR(str47, "\u001b[32m");
+GLOBAL_STR(str48, "\u001b[33m");
+GLOBAL_STR(str49, "\u001b[34m");
+GLOBAL_STR(str50, "\u001b[35m");
+GLOBAL_STR(str51, "\u001b[36m");
+GLOBAL_STR(str52, "&");
+GLOBAL_STR(str53, "&amp;");
+GLOBAL_STR(str54, "<");
+GLOBAL_STR(str55, "&lt;");
+GLOBAL_STR(str56, ">");
+GLOBAL_STR(str57, "&gt;");
+GLOBAL_STR(str58, "<%s %r>");
+GLOBAL_STR(str59, "status");
+GLOBAL_STR(str60, "message");
+GLOBAL_STR(str61, "%s, got %s");
+GLOBAL_STR(str62, " (line %d, offset %d-%d: %r)");
+GLOBAL_STR(str63, "-");
+GLOBAL_STR(str64, "_");
+GLOBAL_STR(str65, "<_Attributes %s>");
+GLOBAL_STR(str66, "<args.Reader %r %d>");
+GLOBAL_STR(str67, "expected argument to %r");
+GLOBAL_STR(str68, "-");
+GLOBAL_STR(str69, "expected integer after %s, got %r");
+GLOBAL_STR(str70, "-");
+GLOBAL_STR(str71, "got invalid integer for %s: %s");
+GLOBAL_STR(str72, "-");
+GLOBAL_STR(str73, "expected number after %r, got %r");
+GLOBAL_STR(str74, "-");
+GLOBAL_STR(str75, "got invalid float for %s: %s");
+GLOBAL_STR(str76, "-");
+GLOBAL_STR(str77, "got invalid argument %r to %r, expected one of: %s");
+GLOBAL_STR(str78, "-");
+GLOBAL_STR(str79, "|");
+GLOBAL_STR(str80, "0");
+GLOBAL_STR(str81, "F");
+GLOBAL_STR(str82, "false");
+GLOBAL_STR(str83, "False");
+GLOBAL_STR(str84, "1");
+GLOBAL_STR(str85, "T");
+GLOBAL_STR(str86, "true");
+GLOBAL_STR(str87, "Talse");
+GLOBAL_STR(str88, "got invalid argument to boolean flag: %r");
 GLOBAL_STR(str89, "-");
-GLOBAL_STR(str90, "Invalid option %r");
-GLOBAL_STR(str91, "Expected argument for action");
-GLOBAL_STR(str92, "Invalid action name %r");
-GLOBAL_STR(str93, "--");
+GLOBAL_STR(str90, "-");
+GLOBAL_STR(str91, "Invalid option %r");
+GLOBAL_STR(str92, "Expected argument for action");
+GLOBAL_STR(str93, "Invalid action name %r");
 GLOBAL_STR(str94, "--");
-GLOBAL_STR(str95, "=");
-GLOBAL_STR(str96, "got invalid flag %r");
-GLOBAL_STR(str97, "-");
-GLOBAL_STR(str98, "0");
-GLOBAL_STR(str99, "Z");
-GLOBAL_STR(str100, "-");
-GLOBAL_STR(str101, "doesn't accept flag %s");
-GLOBAL_STR(str102, "-");
-GLOBAL_STR(str103, "+");
+GLOBAL_STR(str95, "--");
+GLOBAL_STR(str96, "=");
+GLOBAL_STR(str97, "got invalid flag %r");
+GLOBAL_STR(str98, "-");
+GLOBAL_STR(str99, "0");
+GLOBAL_STR(str100, "Z");
+GLOBAL_STR(str101, "-");
+GLOBAL_STR(str102, "doesn't accept flag %s");
+GLOBAL_STR(str103, "-");
 GLOBAL_STR(str104, "+");
-GLOBAL_STR(str105, "doesn't accept option %s");
-GLOBAL_STR(str106, "+");
-GLOBAL_STR(str107, "-");
-GLOBAL_STR(str108, "--");
+GLOBAL_STR(str105, "+");
+GLOBAL_STR(str106, "doesn't accept option %s");
+GLOBAL_STR(str107, "+");
+GLOBAL_STR(str108, "-");
 GLOBAL_STR(str109, "--");
-GLOBAL_STR(str110, "got invalid flag %r");
-GLOBAL_STR(str111, "-");
-GLOBAL_STR(str112, "+");
-GLOBAL_STR(str113, "got invalid flag %r");
-GLOBAL_STR(str114, "-");
+GLOBAL_STR(str110, "--");
+GLOBAL_STR(str111, "got invalid flag %r");
+GLOBAL_STR(str112, "-");
+GLOBAL_STR(str113, "+");
+GLOBAL_STR(str114, "got invalid flag %r");
+GLOBAL_STR(str115, "-");
 
 namespace ansi {  // forward declare
 
@@ -175,14 +176,12 @@ extern BigStr* BLUE;
 extern BigStr* MAGENTA;
 extern BigStr* CYAN;
 
-
 }  // declare namespace ansi
 
 namespace cgi {  // declare
 
 BigStr* escape(BigStr* s);
 
-
 }  // declare namespace cgi
 
 namespace j8_lite {  // declare
@@ -192,7 +191,6 @@ BigStr* MaybeShellEncode(BigStr* s);
 BigStr* ShellEncode(BigStr* s);
 BigStr* YshEncode(BigStr* s, bool unquoted_ok = false);
 
-
 }  // declare namespace j8_lite
 
 namespace error {  // declare
@@ -219,12 +217,12 @@ class _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(_ErrorWithLocation)
 };
 
-class Usage : public _ErrorWithLocation {
+class Usage : public ::error::_ErrorWithLocation {
  public:
   Usage(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -234,12 +232,12 @@ class Usage : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(Usage)
 };
 
-class Parse : public _ErrorWithLocation {
+class Parse : public ::error::_ErrorWithLocation {
  public:
   Parse(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -249,12 +247,12 @@ class Parse : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(Parse)
 };
 
-class FailGlob : public _ErrorWithLocation {
+class FailGlob : public ::error::_ErrorWithLocation {
  public:
   FailGlob(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -264,12 +262,12 @@ class FailGlob : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(FailGlob)
 };
 
-class RedirectEval : public _ErrorWithLocation {
+class RedirectEval : public ::error::_ErrorWithLocation {
  public:
   RedirectEval(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -279,7 +277,7 @@ class RedirectEval : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(RedirectEval)
 };
 
-class FatalRuntime : public _ErrorWithLocation {
+class FatalRuntime : public ::error::_ErrorWithLocation {
  public:
   FatalRuntime(int exit_status, BigStr* msg, syntax_asdl::loc_t* location);
   int ExitStatus();
@@ -287,7 +285,7 @@ class FatalRuntime : public _ErrorWithLocation {
   int exit_status;
   
   static constexpr uint32_t field_mask() {
-    return _ErrorWithLocation::field_mask();
+    return ::error::_ErrorWithLocation::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -297,12 +295,12 @@ class FatalRuntime : public _ErrorWithLocation {
   DISALLOW_COPY_AND_ASSIGN(FatalRuntime)
 };
 
-class Strict : public FatalRuntime {
+class Strict : public ::error::FatalRuntime {
  public:
   Strict(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask();
+    return ::error::FatalRuntime::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -312,14 +310,14 @@ class Strict : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(Strict)
 };
 
-class ErrExit : public FatalRuntime {
+class ErrExit : public ::error::FatalRuntime {
  public:
   ErrExit(int exit_status, BigStr* msg, syntax_asdl::loc_t* location, bool show_code = false);
 
   bool show_code;
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask();
+    return ::error::FatalRuntime::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -329,12 +327,12 @@ class ErrExit : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(ErrExit)
 };
 
-class Expr : public FatalRuntime {
+class Expr : public ::error::FatalRuntime {
  public:
   Expr(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask();
+    return ::error::FatalRuntime::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -344,7 +342,7 @@ class Expr : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(Expr)
 };
 
-class Structured : public FatalRuntime {
+class Structured : public ::error::FatalRuntime {
  public:
   Structured(int status, BigStr* msg, syntax_asdl::loc_t* location, Dict<BigStr*, value_asdl::value_t*>* properties = nullptr);
   value::Dict* ToDict();
@@ -352,7 +350,7 @@ class Structured : public FatalRuntime {
   Dict<BigStr*, value_asdl::value_t*>* properties;
   
   static constexpr uint32_t field_mask() {
-    return FatalRuntime::field_mask()
+    return ::error::FatalRuntime::field_mask()
          | maskbit(offsetof(Structured, properties));
   }
 
@@ -363,12 +361,12 @@ class Structured : public FatalRuntime {
   DISALLOW_COPY_AND_ASSIGN(Structured)
 };
 
-class AssertionErr : public Expr {
+class AssertionErr : public ::error::Expr {
  public:
   AssertionErr(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return Expr::field_mask();
+    return ::error::Expr::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -378,12 +376,12 @@ class AssertionErr : public Expr {
   DISALLOW_COPY_AND_ASSIGN(AssertionErr)
 };
 
-class TypeErrVerbose : public Expr {
+class TypeErrVerbose : public ::error::Expr {
  public:
   TypeErrVerbose(BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return Expr::field_mask();
+    return ::error::Expr::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -393,12 +391,12 @@ class TypeErrVerbose : public Expr {
   DISALLOW_COPY_AND_ASSIGN(TypeErrVerbose)
 };
 
-class TypeErr : public TypeErrVerbose {
+class TypeErr : public ::error::TypeErrVerbose {
  public:
   TypeErr(value_asdl::value_t* actual_val, BigStr* msg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return TypeErrVerbose::field_mask();
+    return ::error::TypeErrVerbose::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -458,7 +456,6 @@ class Encode {
 [[noreturn]] void e_die(BigStr* msg, syntax_asdl::loc_t* location = nullptr);
 [[noreturn]] void e_die_status(int status, BigStr* msg, syntax_asdl::loc_t* location = nullptr);
 
-
 }  // declare namespace error
 
 namespace num {  // declare
@@ -471,7 +468,6 @@ int IntDivide2(int x, int y);
 mops::BigInt IntRemainder(mops::BigInt x, mops::BigInt y);
 int IntRemainder2(int x, int y);
 
-
 }  // declare namespace num
 
 namespace runtime {  // define
@@ -504,6 +500,274 @@ TraversalState::TraversalState() {
 }
 BigStr* TRUE_STR = str3;
 BigStr* FALSE_STR = str4;
+int MARSHAL_NULL = 0;
+int MARSHAL_REF = -1;
+
+mops::BigInt _ZigZag(int i) {
+  mops::BigInt b;
+  mops::BigInt twice;
+  b = mops::IntWiden(i);
+  twice = mops::Add(b, b);
+  if (i >= 0) {
+    return twice;
+  }
+  return mops::Sub(mops::Negate(twice), mops::ONE);
+}
+
+int _UnZigZag(mops::BigInt u) {
+  mops::BigInt half;
+  half = mops::RShift(u, mops::ONE);
+  if (mops::Equal(mops::BitAnd(u, mops::ONE), mops::ZERO)) {
+    return mops::BigTruncate(half);
+  }
+  return mops::BigTruncate(mops::Sub(mops::Negate(half), mops::ONE));
+}
+
+void _WriteVarint(List<BigStr*>* out, mops::BigInt n) {
+  int low;
+  StackRoot _root0(&out);
+
+  while (mops::Greater(n, mops::IntWiden(127))) {
+    low = mops::BigTruncate(mops::BitAnd(n, mops::IntWiden(127)));
+    out->append(chr((low | 128)));
+    n = mops::RShift(n, mops::IntWiden(7));
+  }
+  out->append(chr(mops::BigTruncate(n)));
+}
+
+Encoder::Encoder() {
+  this->ints = Alloc<List<int>>();
+  this->strs = Alloc<List<BigStr*>>();
+  this->obj_nums = Alloc<Dict<int, int>>();
+  this->ok = true;
+}
+
+void Encoder::External(int heap_id) {
+  this->obj_nums->set(heap_id, len(this->obj_nums));
+}
+
+bool Encoder::Begin(int heap_id, int tag) {
+  int num;
+  num = this->obj_nums->get(heap_id, -1);
+  if (num != -1) {
+    this->ints->append(MARSHAL_REF);
+    this->ints->append(num);
+    return false;
+  }
+  this->ints->append(tag);
+  return true;
+}
+
+void Encoder::End(int heap_id) {
+  this->obj_nums->set(heap_id, len(this->obj_nums));
+}
+
+void Encoder::Null() {
+  this->ints->append(MARSHAL_NULL);
+}
+
+void Encoder::Int(int i) {
+  this->ints->append(i);
+}
+
+void Encoder::Bool(bool b) {
+  this->ints->append(b ? 1 : 0);
+}
+
+void Encoder::Str(BigStr* s) {
+  StackRoot _root0(&s);
+
+  this->strs->append(s);
+}
+
+void Encoder::Len(int n) {
+  this->ints->append(n);
+}
+
+void Encoder::Unsupported() {
+  this->ok = false;
+  this->ints->append(MARSHAL_NULL);
+}
+
+BigStr* Encoder::Serialize() {
+  List<BigStr*>* out = nullptr;
+  BigStr* s = nullptr;
+  StackRoot _root0(&out);
+  StackRoot _root1(&s);
+
+  out = Alloc<List<BigStr*>>();
+  _WriteVarint(out, mops::IntWiden(len(this->ints)));
+  for (ListIter<int> it(this->ints); !it.Done(); it.Next()) {
+    int i = it.Value();
+    _WriteVarint(out, _ZigZag(i));
+  }
+  _WriteVarint(out, mops::IntWiden(len(this->strs)));
+  for (int j = 0; j < len(this->strs); ++j) {
+    s = this->strs->at(j);
+    if (s == nullptr) {
+      _WriteVarint(out, mops::ZERO);
+    }
+    else {
+      _WriteVarint(out, mops::IntWiden((len(s) + 1)));
+      out->append(s);
+    }
+  }
+  return str5->join(out);
+}
+
+Decoder::Decoder(BigStr* blob) {
+  this->blob = blob;
+  this->pos = 0;
+  this->ints = Alloc<List<int>>();
+  this->strs = Alloc<List<BigStr*>>();
+  this->int_pos = 0;
+  this->str_pos = 0;
+  this->objs = Alloc<List<void*>>();
+  this->ok = true;
+  this->_Parse();
+}
+
+mops::BigInt Decoder::_ReadVarint(int num_bits) {
+  mops::BigInt n;
+  int shift;
+  int b;
+  n = mops::ZERO;
+  shift = 0;
+  while (true) {
+    if ((this->pos >= len(this->blob) or shift >= 32)) {
+      this->ok = false;
+      return mops::ZERO;
+    }
+    b = mylib::ByteAt(this->blob, this->pos);
+    this->pos += 1;
+    n = mops::BitOr(n, mops::LShift(mops::IntWiden((b & 127)), mops::IntWiden(shift)));
+    if (b < 128) {
+      break;
+    }
+    shift += 7;
+  }
+  if (!mops::Equal(mops::RShift(n, mops::IntWiden(num_bits)), mops::ZERO)) {
+    this->ok = false;
+    return mops::ZERO;
+  }
+  return n;
+}
+
+int Decoder::_ReadLen() {
+  return mops::BigTruncate(this->_ReadVarint(31));
+}
+
+void Decoder::_Parse() {
+  int num_ints;
+  mops::BigInt u;
+  int num_strs;
+  int n;
+  int end;
+  num_ints = this->_ReadLen();
+  for (int _ = 0; _ < num_ints; ++_) {
+    u = this->_ReadVarint(32);
+    if (!this->ok) {
+      return ;
+    }
+    this->ints->append(_UnZigZag(u));
+  }
+  num_strs = this->_ReadLen();
+  for (int _ = 0; _ < num_strs; ++_) {
+    n = this->_ReadLen();
+    if (!this->ok) {
+      return ;
+    }
+    if (n == 0) {
+      this->strs->append(nullptr);
+      continue;
+    }
+    end = ((this->pos + n) - 1);
+    if (end > len(this->blob)) {
+      this->ok = false;
+      return ;
+    }
+    this->strs->append(this->blob->slice(this->pos, end));
+    this->pos = end;
+  }
+  if (this->pos != len(this->blob)) {
+    this->ok = false;
+  }
+}
+
+void Decoder::External(void* obj) {
+  StackRoot _root0(&obj);
+
+  this->objs->append(obj);
+}
+
+void Decoder::Register(void* obj) {
+  StackRoot _root0(&obj);
+
+  this->objs->append(obj);
+}
+
+int Decoder::Int() {
+  int i;
+  if (this->int_pos >= len(this->ints)) {
+    this->ok = false;
+    return MARSHAL_NULL;
+  }
+  i = this->ints->at(this->int_pos);
+  this->int_pos += 1;
+  return i;
+}
+
+bool Decoder::Bool() {
+  return this->Int() != 0;
+}
+
+BigStr* Decoder::Str() {
+  BigStr* s = nullptr;
+  StackRoot _root0(&s);
+
+  if (this->str_pos >= len(this->strs)) {
+    this->ok = false;
+    return nullptr;
+  }
+  s = this->strs->at(this->str_pos);
+  this->str_pos += 1;
+  return s;
+}
+
+int Decoder::Len() {
+  int n;
+  int remaining;
+  n = this->Int();
+  remaining = (((len(this->ints) - this->int_pos) + len(this->strs)) - this->str_pos);
+  if ((n < -1 or n > remaining)) {
+    this->ok = false;
+    return 0;
+  }
+  return n;
+}
+
+void* Decoder::Ref() {
+  int num;
+  num = this->Int();
+  if ((num < 0 or num >= len(this->objs))) {
+    this->ok = false;
+    return nullptr;
+  }
+  return this->objs->at(num);
+}
+
+void Decoder::BadTag(int tag) {
+  this->ok = false;
+}
+
+void Decoder::Unsupported() {
+  this->Int();
+  this->ok = false;
+}
+
+bool Decoder::AtEnd() {
+  return (this->int_pos == len(this->ints) and this->str_pos == len(this->strs));
+}
 
 }  // define namespace runtime
 
@@ -583,7 +847,7 @@ Tuple2<BigStr*, int> ColorOutput::GetRaw() {
   return Tuple2<BigStr*, int>(f->getvalue(), this->num_chars);
 }
 
-TextOutput::TextOutput(mylib::Writer* f) : ColorOutput(f) {
+TextOutput::TextOutput(mylib::Writer* f) : ::format::ColorOutput(f) {
 }
 
 format::TextOutput* TextOutput::NewTempBuffer() {
@@ -598,7 +862,7 @@ void TextOutput::PopColor() {
   ;  // pass
 }
 
-HtmlOutput::HtmlOutput(mylib::Writer* f) : ColorOutput(f) {
+HtmlOutput::HtmlOutput(mylib::Writer* f) : ::format::ColorOutput(f) {
 }
 
 format::HtmlOutput* HtmlOutput::NewTempBuffer() {
@@ -606,11 +870,11 @@ format::HtmlOutput* HtmlOutput::NewTempBuffer() {
 }
 
 void HtmlOutput::FileHeader() {
-  this->f->write(str5);
+  this->f->write(str6);
 }
 
 void HtmlOutput::FileFooter() {
-  this->f->write(str6);
+  this->f->write(str7);
 }
 
 void HtmlOutput::PushColor(hnode_asdl::color_t e_color) {
@@ -618,23 +882,23 @@ void HtmlOutput::PushColor(hnode_asdl::color_t e_color) {
   StackRoot _root0(&css_class);
 
   if (e_color == color_e::TypeName) {
-    css_class = str7;
+    css_class = str8;
   }
   else {
     if (e_color == color_e::StringConst) {
-      css_class = str8;
+      css_class = str9;
     }
     else {
       if (e_color == color_e::OtherConst) {
-        css_class = str9;
+        css_class = str10;
       }
       else {
         if (e_color == color_e::External) {
-          css_class = str10;
+          css_class = str11;
         }
         else {
           if (e_color == color_e::UserType) {
-            css_class = str11;
+            css_class = str12;
           }
           else {
             assert(0);  // AssertionError
@@ -647,7 +911,7 @@ void HtmlOutput::PushColor(hnode_asdl::color_t e_color) {
 }
 
 void HtmlOutput::PopColor() {
-  this->f->write(str13);
+  this->f->write(str14);
 }
 
 void HtmlOutput::write(BigStr* s) {
@@ -657,7 +921,7 @@ void HtmlOutput::write(BigStr* s) {
   this->num_chars += len(s);
 }
 
-AnsiOutput::AnsiOutput(mylib::Writer* f) : ColorOutput(f) {
+AnsiOutput::AnsiOutput(mylib::Writer* f) : ::format::ColorOutput(f) {
 }
 
 format::AnsiOutput* AnsiOutput::NewTempBuffer() {
@@ -721,7 +985,7 @@ bool _PrettyPrinter::_PrintWrappedArray(List<hnode_asdl::hnode_t*>* array, int p
     hnode_asdl::hnode_t* val = it.Value();
     StackRoot _for(&val  );
     if (i != 0) {
-      f->write(str14);
+      f->write(str15);
     }
     single_f = f->NewTempBuffer();
     if (_TrySingleLine(val, single_f, (this->max_col - chars_so_far))) {
@@ -732,7 +996,7 @@ bool _PrettyPrinter::_PrintWrappedArray(List<hnode_asdl::hnode_t*>* array, int p
       chars_so_far += single_f->NumChars();
     }
     else {
-      f->write(str15);
+      f->write(str16);
       this->PrintNode(val, f, (indent + INDENT));
       chars_so_far = 0;
       all_fit = false;
@@ -780,11 +1044,11 @@ bool _PrettyPrinter::_PrintWholeArray(List<hnode_asdl::hnode_t*>* array, int pre
       Tuple2<BigStr*, int>* p = it.Value();
       StackRoot _for(&p    );
       if (i != 0) {
-        f->write(str16);
+        f->write(str17);
       }
       f->WriteRaw(p);
     }
-    f->write(str17);
+    f->write(str18);
   }
   return all_fit;
 }
@@ -815,7 +1079,7 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
   StackRoot _root9(&single_f);
   StackRoot _root10(&s);
 
-  ind = str_repeat(str18, indent);
+  ind = str_repeat(str19, indent);
   if (node->abbrev) {
     prefix = str_concat(ind, node->left);
     f->write(prefix);
@@ -823,12 +1087,12 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
       f->PushColor(color_e::TypeName);
       f->write(node->node_type);
       f->PopColor();
-      f->write(str19);
+      f->write(str20);
     }
     prefix_len = ((len(prefix) + len(node->node_type)) + 1);
     all_fit = this->_PrintWrappedArray(node->unnamed_fields, prefix_len, f, indent);
     if (!all_fit) {
-      f->write(str20);
+      f->write(str21);
       f->write(ind);
     }
     f->write(node->right);
@@ -838,13 +1102,13 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
     f->PushColor(color_e::TypeName);
     f->write(node->node_type);
     f->PopColor();
-    f->write(str21);
+    f->write(str22);
     for (ListIter<hnode_asdl::Field*> it(node->fields); !it.Done(); it.Next()) {
       hnode_asdl::Field* field = it.Value();
       StackRoot _for(&field    );
       name = field->name;
       val = field->val;
-      ind1 = str_repeat(str22, (indent + INDENT));
+      ind1 = str_repeat(str23, (indent + INDENT));
       UP_val = val;
       tag = val->tag();
       if (tag == hnode_e::Array) {
@@ -853,12 +1117,12 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
         f->write(name_str);
         prefix_len = len(name_str);
         if (!this->_PrintWholeArray(val->children, prefix_len, f, indent)) {
-          f->write(str24);
+          f->write(str25);
           for (ListIter<hnode_asdl::hnode_t*> it(val->children); !it.Done(); it.Next()) {
             hnode_asdl::hnode_t* child = it.Value();
             StackRoot _for(&child          );
             this->PrintNode(child, f, ((indent + INDENT) + INDENT));
-            f->write(str25);
+            f->write(str26);
           }
           f->write(StrFormat("%s]", ind1));
         }
@@ -875,11 +1139,11 @@ void _PrettyPrinter::_PrintRecord(hnode::Record* node, format::ColorOutput* f, i
           f->WriteRaw((Alloc<Tuple2<BigStr*, int>>(s, num_chars)));
         }
         else {
-          f->write(str28);
+          f->write(str29);
           this->PrintNode(val, f, ((indent + INDENT) + INDENT));
         }
       }
-      f->write(str29);
+      f->write(str30);
     }
     f->write(str_concat(ind, node->right));
   }
@@ -899,7 +1163,7 @@ void _PrettyPrinter::PrintNode(hnode_asdl::hnode_t* node, format::ColorOutput* f
   StackRoot _root4(&s);
   StackRoot _root5(&UP_node);
 
-  ind = str_repeat(str30, indent);
+  ind = str_repeat(str31, indent);
   single_f = f->NewTempBuffer();
   single_f->write(ind);
   if (_TrySingleLine(node, single_f, (this->max_col - indent))) {
@@ -923,7 +1187,7 @@ void _PrettyPrinter::PrintNode(hnode_asdl::hnode_t* node, format::ColorOutput* f
       f->PushColor(color_e::External);
       // if not PYTHON
       {
-        f->write(str31);
+        f->write(str32);
       }
       // endif MYCPP
       f->PopColor();
@@ -957,14 +1221,14 @@ bool _TrySingleLineObj(hnode::Record* node, format::ColorOutput* f, int max_char
       f->PushColor(color_e::TypeName);
       f->write(node->node_type);
       f->PopColor();
-      f->write(str33);
+      f->write(str34);
     }
     i = 0;
     for (ListIter<hnode_asdl::hnode_t*> it(node->unnamed_fields); !it.Done(); it.Next(), ++i) {
       hnode_asdl::hnode_t* val = it.Value();
       StackRoot _for(&val    );
       if (i != 0) {
-        f->write(str34);
+        f->write(str35);
       }
       if (!_TrySingleLine(val, f, max_chars)) {
         return false;
@@ -1011,7 +1275,7 @@ bool _TrySingleLine(hnode_asdl::hnode_t* node, format::ColorOutput* f, int max_c
       f->PushColor(color_e::External);
       // if not PYTHON
       {
-        f->write(str36);
+        f->write(str37);
       }
       // endif MYCPP
       f->PopColor();
@@ -1019,19 +1283,19 @@ bool _TrySingleLine(hnode_asdl::hnode_t* node, format::ColorOutput* f, int max_c
     else {
       if (tag == hnode_e::Array) {
         hnode::Array* node = static_cast<hnode::Array*>(UP_node);
-        f->write(str37);
+        f->write(str38);
         i = 0;
         for (ListIter<hnode_asdl::hnode_t*> it(node->children); !it.Done(); it.Next(), ++i) {
           hnode_asdl::hnode_t* item = it.Value();
           StackRoot _for(&item        );
           if (i != 0) {
-            f->write(str38);
+            f->write(str39);
           }
           if (!_TrySingleLine(item, f, max_chars)) {
             return false;
           }
         }
-        f->write(str39);
+        f->write(str40);
       }
       else {
         if (tag == hnode_e::Record) {
@@ -1071,16 +1335,16 @@ void PrintTree(hnode_asdl::hnode_t* node, format::ColorOutput* f) {
 
 namespace ansi {  // define
 
-BigStr* RESET = str41;
-BigStr* BOLD = str42;
-BigStr* UNDERLINE = str43;
-BigStr* REVERSE = str44;
-BigStr* RED = str45;
-BigStr* GREEN = str46;
-BigStr* YELLOW = str47;
-BigStr* BLUE = str48;
-BigStr* MAGENTA = str49;
-BigStr* CYAN = str50;
+BigStr* RESET = str42;
+BigStr* BOLD = str43;
+BigStr* UNDERLINE = str44;
+BigStr* REVERSE = str45;
+BigStr* RED = str46;
+BigStr* GREEN = str47;
+BigStr* YELLOW = str48;
+BigStr* BLUE = str49;
+BigStr* MAGENTA = str50;
+BigStr* CYAN = str51;
 
 }  // define namespace ansi
 
@@ -1090,9 +1354,9 @@ namespace cgi {  // define
 BigStr* escape(BigStr* s) {
   StackRoot _root0(&s);
 
-  s = s->replace(str51, str52);
-  s = s->replace(str53, str54);
-  s = s->replace(str55, str56);
+  s = s->replace(str52, str53);
+  s = s->replace(str54, str55);
+  s = s->replace(str56, str57);
   return s;
 }
 
@@ -1169,19 +1433,19 @@ BigStr* _ErrorWithLocation::UserErrorString() {
   return this->msg;
 }
 
-Usage::Usage(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+Usage::Usage(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-Parse::Parse(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+Parse::Parse(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-FailGlob::FailGlob(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+FailGlob::FailGlob(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-RedirectEval::RedirectEval(BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+RedirectEval::RedirectEval(BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
 }
 
-FatalRuntime::FatalRuntime(int exit_status, BigStr* msg, syntax_asdl::loc_t* location) : _ErrorWithLocation(msg, location) {
+FatalRuntime::FatalRuntime(int exit_status, BigStr* msg, syntax_asdl::loc_t* location) : ::error::_ErrorWithLocation(msg, location) {
   this->exit_status = exit_status;
 }
 
@@ -1189,17 +1453,17 @@ int FatalRuntime::ExitStatus() {
   return this->exit_status;
 }
 
-Strict::Strict(BigStr* msg, syntax_asdl::loc_t* location) : FatalRuntime(1, msg, location) {
+Strict::Strict(BigStr* msg, syntax_asdl::loc_t* location) : ::error::FatalRuntime(1, msg, location) {
 }
 
-ErrExit::ErrExit(int exit_status, BigStr* msg, syntax_asdl::loc_t* location, bool show_code) : FatalRuntime(exit_status, msg, location) {
+ErrExit::ErrExit(int exit_status, BigStr* msg, syntax_asdl::loc_t* location, bool show_code) : ::error::FatalRuntime(exit_status, msg, location) {
   this->show_code = show_code;
 }
 
-Expr::Expr(BigStr* msg, syntax_asdl::loc_t* location) : FatalRuntime(3, msg, location) {
+Expr::Expr(BigStr* msg, syntax_asdl::loc_t* location) : ::error::FatalRuntime(3, msg, location) {
 }
 
-Structured::Structured(int status, BigStr* msg, syntax_asdl::loc_t* location, Dict<BigStr*, value_asdl::value_t*>* properties) : FatalRuntime(status, msg, location) {
+Structured::Structured(int status, BigStr* msg, syntax_asdl::loc_t* location, Dict<BigStr*, value_asdl::value_t*>* properties) : ::error::FatalRuntime(status, msg, location) {
   this->properties = properties;
 }
 
@@ -1207,18 +1471,18 @@ value::Dict* Structured::ToDict() {
   if (this->properties == nullptr) {
     this->properties = Alloc<Dict<BigStr*, value_asdl::value_t*>>();
   }
-  this->properties->set(str58, num::ToBig(this->ExitStatus()));
-  this->properties->set(str59, Alloc<value::Str>(this->msg));
+  this->properties->set(str59, num::ToBig(this->ExitStatus()));
+  this->properties->set(str60, Alloc<value::Str>(this->msg));
   return Alloc<value::Dict>(this->properties);
 }
 
-AssertionErr::AssertionErr(BigStr* msg, syntax_asdl::loc_t* location) : Expr(msg, location) {
+AssertionErr::AssertionErr(BigStr* msg, syntax_asdl::loc_t* location) : ::error::Expr(msg, location) {
 }
 
-TypeErrVerbose::TypeErrVerbose(BigStr* msg, syntax_asdl::loc_t* location) : Expr(msg, location) {
+TypeErrVerbose::TypeErrVerbose(BigStr* msg, syntax_asdl::loc_t* location) : ::error::Expr(msg, location) {
 }
 
-TypeErr::TypeErr(value_asdl::value_t* actual_val, BigStr* msg, syntax_asdl::loc_t* location) : TypeErrVerbose(StrFormat("%s, got %s", msg, _ValType(actual_val)), location) {
+TypeErr::TypeErr(value_asdl::value_t* actual_val, BigStr* msg, syntax_asdl::loc_t* location) : ::error::TypeErrVerbose(StrFormat("%s, got %s", msg, _ValType(actual_val)), location) {
 }
 
 Runtime::Runtime(BigStr* msg) {
@@ -1393,17 +1657,13 @@ int Float = 3;
 int Bool = 4;
 
 _Attributes::_Attributes(Dict<BigStr*, value_asdl::value_t*>* defaults) {
-  this->attrs = Alloc<Dict<BigStr*, value_asdl::value_t*>>();
+  this->attrs = defaults;
+  this->attrs_copied = false;
   this->opt_changes = Alloc<List<Tuple2<BigStr*, bool>*>>();
   this->shopt_changes = Alloc<List<Tuple2<BigStr*, bool>*>>();
   this->show_options = false;
   this->actions = Alloc<List<BigStr*>>();
   this->saw_double_dash = false;
-  for (DictIter<BigStr*, value_asdl::value_t*> it(defaults); !it.Done(); it.Next()) {
-    BigStr* name = it.Key();
-    value_asdl::value_t* v = it.Value();
-    this->Set(name, v);
-  }
 }
 
 void _Attributes::SetTrue(BigStr* name) {
@@ -1413,10 +1673,22 @@ void _Attributes::SetTrue(BigStr* name) {
 }
 
 void _Attributes::Set(BigStr* name, value_asdl::value_t* val) {
+  Dict<BigStr*, value_asdl::value_t*>* attrs = nullptr;
   StackRoot _root0(&name);
   StackRoot _root1(&val);
-
-  name = name->replace(str62, str63);
+  StackRoot _root2(&attrs);
+
+  if (!this->attrs_copied) {
+    attrs = Alloc<Dict<BigStr*, value_asdl::value_t*>>();
+    for (DictIter<BigStr*, value_asdl::value_t*> it(this->attrs); !it.Done(); it.Next()) {
+      BigStr* k = it.Key();
+      value_asdl::value_t* v = it.Value();
+      attrs->set(k, v);
+    }
+    this->attrs = attrs;
+    this->attrs_copied = true;
+  }
+  name = name->replace(str63, str64);
   this->attrs->set(name, val);
 }
 
@@ -1561,7 +1833,7 @@ bool _ArgAction::OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_Attri
     arg_r->Next();
     arg = arg_r->Peek();
     if (arg == nullptr) {
-      e_usage(StrFormat("expected argument to %r", str_concat(str67, this->name)), arg_r->Location());
+      e_usage(StrFormat("expected argument to %r", str_concat(str68, this->name)), arg_r->Location());
     }
   }
   val = this->_Value(arg, arg_r->Location());
@@ -1569,7 +1841,7 @@ bool _ArgAction::OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_Attri
   return this->quit_parsing_flags;
 }
 
-SetToInt::SetToInt(BigStr* name) : _ArgAction(name, false, nullptr) {
+SetToInt::SetToInt(BigStr* name) : ::args::_ArgAction(name, false, nullptr) {
 }
 
 value_asdl::value_t* SetToInt::_Value(BigStr* arg, syntax_asdl::loc_t* location) {
@@ -1581,15 +1853,15 @@ value_asdl::value_t* SetToInt::_Value(BigStr* arg, syntax_asdl::loc_t* location)
     i = mops::FromStr(arg);
   }
   catch (ValueError*) {
-    e_usage(StrFormat("expected integer after %s, got %r", str_concat(str69, this->name), arg), location);
+    e_usage(StrFormat("expected integer after %s, got %r", str_concat(str70, this->name), arg), location);
   }
   if (mops::Greater(mops::BigInt(0), i)) {
-    e_usage(StrFormat("got invalid integer for %s: %s", str_concat(str71, this->name), arg), location);
+    e_usage(StrFormat("got invalid integer for %s: %s", str_concat(str72, this->name), arg), location);
   }
   return Alloc<value::Int>(i);
 }
 
-SetToFloat::SetToFloat(BigStr* name) : _ArgAction(name, false, nullptr) {
+SetToFloat::SetToFloat(BigStr* name) : ::args::_ArgAction(name, false, nullptr) {
 }
 
 value_asdl::value_t* SetToFloat::_Value(BigStr* arg, syntax_asdl::loc_t* location) {
@@ -1601,15 +1873,15 @@ value_asdl::value_t* SetToFloat::_Value(BigStr* arg, syntax_asdl::loc_t* locatio
     f = to_float(arg);
   }
   catch (ValueError*) {
-    e_usage(StrFormat("expected number after %r, got %r", str_concat(str73, this->name), arg), location);
+    e_usage(StrFormat("expected number after %r, got %r", str_concat(str74, this->name), arg), location);
   }
   if (f < 0) {
-    e_usage(StrFormat("got invalid float for %s: %s", str_concat(str75, this->name), arg), location);
+    e_usage(StrFormat("got invalid float for %s: %s", str_concat(str76, this->name), arg), location);
   }
   return Alloc<value::Float>(f);
 }
 
-SetToString::SetToString(BigStr* name, bool quit_parsing_flags, List<BigStr*>* valid) : _ArgAction(name, quit_parsing_flags, valid) {
+SetToString::SetToString(BigStr* name, bool quit_parsing_flags, List<BigStr*>* valid) : ::args::_ArgAction(name, quit_parsing_flags, valid) {
 }
 
 value_asdl::value_t* SetToString::_Value(BigStr* arg, syntax_asdl::loc_t* location) {
@@ -1617,7 +1889,7 @@ value_asdl::value_t* SetToString::_Value(BigStr* arg, syntax_asdl::loc_t* locati
   StackRoot _root1(&location);
 
   if ((this->valid != nullptr and !list_contains(this->valid, arg))) {
-    e_usage(StrFormat("got invalid argument %r to %r, expected one of: %s", arg, str_concat(str77, this->name), str78->join(this->valid)), location);
+    e_usage(StrFormat("got invalid argument %r to %r, expected one of: %s", arg, str_concat(str78, this->name), str79->join(this->valid)), location);
   }
   return Alloc<value::Str>(arg);
 }
@@ -1633,11 +1905,11 @@ bool SetAttachedBool::OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_
   StackRoot _root2(&out);
 
   if (attached_arg != nullptr) {
-    if ((str_equals(attached_arg, str79) || str_equals(attached_arg, str80) || str_equals(attached_arg, str81) || str_equals(attached_arg, str82))) {
+    if ((str_equals(attached_arg, str80) || str_equals(attached_arg, str81) || str_equals(attached_arg, str82) || str_equals(attached_arg, str83))) {
       b = false;
     }
     else {
-      if ((str_equals(attached_arg, str83) || str_equals(attached_arg, str84) || str_equals(attached_arg, str85) || str_equals(attached_arg, str86))) {
+      if ((str_equals(attached_arg, str84) || str_equals(attached_arg, str85) || str_equals(attached_arg, str86) || str_equals(attached_arg, str87))) {
         b = true;
       }
       else {
@@ -1675,7 +1947,7 @@ bool SetOption::OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_Attrib
   StackRoot _root1(&arg_r);
   StackRoot _root2(&out);
 
-  b = maybe_str_equals(attached_arg, str88);
+  b = maybe_str_equals(attached_arg, str89);
   out->opt_changes->append((Alloc<Tuple2<BigStr*, bool>>(this->name, b)));
   return false;
 }
@@ -1703,7 +1975,7 @@ bool SetNamedOption::OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_A
   StackRoot _root4(&attr_name);
   StackRoot _root5(&changes);
 
-  b = maybe_str_equals(attached_arg, str89);
+  b = maybe_str_equals(attached_arg, str90);
   arg_r->Next();
   arg = arg_r->Peek();
   if (arg == nullptr) {
@@ -1754,7 +2026,7 @@ bool SetNamedAction::OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_A
   arg_r->Next();
   arg = arg_r->Peek();
   if (arg == nullptr) {
-    e_usage(str91, loc::Missing);
+    e_usage(str92, loc::Missing);
   }
   attr_name = arg;
   if ((len(this->names) and !list_contains(this->names, attr_name))) {
@@ -1787,13 +2059,13 @@ args::_Attributes* Parse(flag_spec::_FlagSpec* spec, args::Reader* arg_r) {
   out = Alloc<_Attributes>(spec->defaults);
   while (!arg_r->AtEnd()) {
     arg = arg_r->Peek();
-    if (maybe_str_equals(arg, str93)) {
+    if (maybe_str_equals(arg, str94)) {
       out->saw_double_dash = true;
       arg_r->Next();
       break;
     }
-    if ((len(spec->actions_long) and arg->startswith(str94))) {
-      pos = arg->find(str95, 2);
+    if ((len(spec->actions_long) and arg->startswith(str95))) {
+      pos = arg->find(str96, 2);
       if (pos == -1) {
         suffix = nullptr;
         flag_name = arg->slice(2);
@@ -1811,15 +2083,15 @@ args::_Attributes* Parse(flag_spec::_FlagSpec* spec, args::Reader* arg_r) {
       continue;
     }
     else {
-      if ((arg->startswith(str97) and len(arg) > 1)) {
+      if ((arg->startswith(str98) and len(arg) > 1)) {
         n = len(arg);
         for (int i = 1; i < n; ++i) {
           ch = arg->at(i);
-          if (str_equals(ch, str98)) {
-            ch = str99;
+          if (str_equals(ch, str99)) {
+            ch = str100;
           }
           if (list_contains(spec->plus_flags, ch)) {
-            out->Set(ch, Alloc<value::Str>(str100));
+            out->Set(ch, Alloc<value::Str>(str101));
             continue;
           }
           if (list_contains(spec->arity0, ch)) {
@@ -1832,20 +2104,20 @@ args::_Attributes* Parse(flag_spec::_FlagSpec* spec, args::Reader* arg_r) {
             action->OnMatch(attached_arg, arg_r, out);
             break;
           }
-          e_usage(StrFormat("doesn't accept flag %s", str_concat(str102, ch)), arg_r->Location());
+          e_usage(StrFormat("doesn't accept flag %s", str_concat(str103, ch)), arg_r->Location());
         }
         arg_r->Next();
       }
       else {
-        if ((len(spec->plus_flags) and (arg->startswith(str103) and len(arg) > 1))) {
+        if ((len(spec->plus_flags) and (arg->startswith(str104) and len(arg) > 1))) {
           n = len(arg);
           for (int i = 1; i < n; ++i) {
             ch = arg->at(i);
             if (list_contains(spec->plus_flags, ch)) {
-              out->Set(ch, Alloc<value::Str>(str104));
+              out->Set(ch, Alloc<value::Str>(str105));
               continue;
             }
-            e_usage(StrFormat("doesn't accept option %s", str_concat(str106, ch)), arg_r->Location());
+            e_usage(StrFormat("doesn't accept option %s", str_concat(str107, ch)), arg_r->Location());
           }
           arg_r->Next();
         }
@@ -1873,7 +2145,7 @@ args::_Attributes* ParseLikeEcho(flag_spec::_FlagSpec* spec, args::Reader* arg_r
   while (!arg_r->AtEnd()) {
     arg = arg_r->Peek();
     chars = arg->slice(1);
-    if ((arg->startswith(str107) and len(chars))) {
+    if ((arg->startswith(str108) and len(chars))) {
       done = false;
       for (StrIter it(chars); !it.Done(); it.Next()) {
         BigStr* c = it.Value();
@@ -1919,12 +2191,12 @@ args::_Attributes* ParseMore(flag_spec::_FlagSpecAndMore* spec, args::Reader* ar
   quit = false;
   while (!arg_r->AtEnd()) {
     arg = arg_r->Peek();
-    if (maybe_str_equals(arg, str108)) {
+    if (maybe_str_equals(arg, str109)) {
       out->saw_double_dash = true;
       arg_r->Next();
       break;
     }
-    if (arg->startswith(str109)) {
+    if (arg->startswith(str110)) {
       action = spec->actions_long->get(arg->slice(2));
       if (action == nullptr) {
         e_usage(StrFormat("got invalid flag %r", arg), arg_r->Location());
@@ -1933,14 +2205,14 @@ args::_Attributes* ParseMore(flag_spec::_FlagSpecAndMore* spec, args::Reader* ar
       arg_r->Next();
       continue;
     }
-    if (((arg->startswith(str111) or arg->startswith(str112)) and len(arg) > 1)) {
+    if (((arg->startswith(str112) or arg->startswith(str113)) and len(arg) > 1)) {
       char0 = arg->at(0);
       for (StrIter it(arg->slice(1)); !it.Done(); it.Next()) {
         BigStr* ch = it.Value();
         StackRoot _for(&ch      );
         action = spec->actions_short->get(ch);
         if (action == nullptr) {
-          e_usage(StrFormat("got invalid flag %r", str_concat(str114, ch)), arg_r->Location());
+          e_usage(StrFormat("got invalid flag %r", str_concat(str115, ch)), arg_r->Location());
         }
         attached_arg = list_contains(spec->plus_flags, ch) ? char0 : nullptr;
         quit = action->OnMatch(attached_arg, arg_r, out);
@@ -17,6 +17,8 @@ using value_asdl::value;  // This is a bit ad hoc
 namespace runtime {  // forward declare
 
   class TraversalState;
+  class Encoder;
+  class Decoder;
 
 }  // forward declare namespace runtime
 
@@ -69,6 +71,67 @@ class TraversalState {
 
 extern BigStr* TRUE_STR;
 extern BigStr* FALSE_STR;
+extern int MARSHAL_NULL;
+extern int MARSHAL_REF;
+mops::BigInt _ZigZag(int i);
+int _UnZigZag(mops::BigInt u);
+void _WriteVarint(List<BigStr*>* out, mops::BigInt n);
+class Encoder {
+ public:
+  Encoder();
+  void External(int heap_id);
+  bool Begin(int heap_id, int tag);
+  void End(int heap_id);
+  void Null();
+  void Int(int i);
+  void Bool(bool b);
+  void Str(BigStr* s);
+  void Len(int n);
+  void Unsupported();
+  BigStr* Serialize();
+  List<int>* ints;
+  List<BigStr*>* strs;
+  Dict<int, int>* obj_nums;
+  bool ok;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassScanned(3, sizeof(Encoder));
+  }
+
+  DISALLOW_COPY_AND_ASSIGN(Encoder)
+};
+
+class Decoder {
+ public:
+  Decoder(BigStr* blob);
+  mops::BigInt _ReadVarint(int num_bits);
+  int _ReadLen();
+  void _Parse();
+  void External(void* obj);
+  void Register(void* obj);
+  int Int();
+  bool Bool();
+  BigStr* Str();
+  int Len();
+  void* Ref();
+  void BadTag(int tag);
+  void Unsupported();
+  bool AtEnd();
+  BigStr* blob;
+  List<int>* ints;
+  List<BigStr*>* strs;
+  List<void*>* objs;
+  int pos;
+  int int_pos;
+  int str_pos;
+  bool ok;
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassScanned(4, sizeof(Decoder));
+  }
+
+  DISALLOW_COPY_AND_ASSIGN(Decoder)
+};
 
 
 }  // declare namespace runtime
@@ -103,7 +166,7 @@ class ColorOutput {
   DISALLOW_COPY_AND_ASSIGN(ColorOutput)
 };
 
-class TextOutput : public ColorOutput {
+class TextOutput : public ::format::ColorOutput {
  public:
   TextOutput(mylib::Writer* f);
   virtual format::TextOutput* NewTempBuffer();
@@ -111,7 +174,7 @@ class TextOutput : public ColorOutput {
   virtual void PopColor();
   
   static constexpr uint32_t field_mask() {
-    return ColorOutput::field_mask();
+    return ::format::ColorOutput::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -121,7 +184,7 @@ class TextOutput : public ColorOutput {
   DISALLOW_COPY_AND_ASSIGN(TextOutput)
 };
 
-class HtmlOutput : public ColorOutput {
+class HtmlOutput : public ::format::ColorOutput {
  public:
   HtmlOutput(mylib::Writer* f);
   virtual format::HtmlOutput* NewTempBuffer();
@@ -132,7 +195,7 @@ class HtmlOutput : public ColorOutput {
   virtual void write(BigStr* s);
   
   static constexpr uint32_t field_mask() {
-    return ColorOutput::field_mask();
+    return ::format::ColorOutput::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -142,7 +205,7 @@ class HtmlOutput : public ColorOutput {
   DISALLOW_COPY_AND_ASSIGN(HtmlOutput)
 };
 
-class AnsiOutput : public ColorOutput {
+class AnsiOutput : public ::format::ColorOutput {
  public:
   AnsiOutput(mylib::Writer* f);
   virtual format::AnsiOutput* NewTempBuffer();
@@ -150,7 +213,7 @@ class AnsiOutput : public ColorOutput {
   virtual void PopColor();
   
   static constexpr uint32_t field_mask() {
-    return ColorOutput::field_mask();
+    return ::format::ColorOutput::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -181,7 +244,6 @@ bool _TrySingleLineObj(hnode::Record* node, format::ColorOutput* f, int max_char
 bool _TrySingleLine(hnode_asdl::hnode_t* node, format::ColorOutput* f, int max_chars);
 void PrintTree(hnode_asdl::hnode_t* node, format::ColorOutput* f);
 
-
 }  // declare namespace format
 
 namespace args {  // declare
@@ -200,6 +262,7 @@ class _Attributes {
   List<Tuple2<BigStr*, bool>*>* opt_changes;
   List<Tuple2<BigStr*, bool>*>* shopt_changes;
   List<BigStr*>* actions;
+  bool attrs_copied;
   bool show_options;
   bool saw_double_dash;
 
@@ -251,7 +314,7 @@ class _Action {
   DISALLOW_COPY_AND_ASSIGN(_Action)
 };
 
-class _ArgAction : public _Action {
+class _ArgAction : public ::args::_Action {
  public:
   _ArgAction(BigStr* name, bool quit_parsing_flags, List<BigStr*>* valid = nullptr);
   virtual value_asdl::value_t* _Value(BigStr* arg, syntax_asdl::loc_t* location);
@@ -262,7 +325,7 @@ class _ArgAction : public _Action {
   List<BigStr*>* valid;
   
   static constexpr uint32_t field_mask() {
-    return _Action::field_mask()
+    return ::args::_Action::field_mask()
          | maskbit(offsetof(_ArgAction, name))
          | maskbit(offsetof(_ArgAction, valid));
   }
@@ -274,13 +337,13 @@ class _ArgAction : public _Action {
   DISALLOW_COPY_AND_ASSIGN(_ArgAction)
 };
 
-class SetToInt : public _ArgAction {
+class SetToInt : public ::args::_ArgAction {
  public:
   SetToInt(BigStr* name);
   virtual value_asdl::value_t* _Value(BigStr* arg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ArgAction::field_mask();
+    return ::args::_ArgAction::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -290,13 +353,13 @@ class SetToInt : public _ArgAction {
   DISALLOW_COPY_AND_ASSIGN(SetToInt)
 };
 
-class SetToFloat : public _ArgAction {
+class SetToFloat : public ::args::_ArgAction {
  public:
   SetToFloat(BigStr* name);
   virtual value_asdl::value_t* _Value(BigStr* arg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ArgAction::field_mask();
+    return ::args::_ArgAction::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -306,13 +369,13 @@ class SetToFloat : public _ArgAction {
   DISALLOW_COPY_AND_ASSIGN(SetToFloat)
 };
 
-class SetToString : public _ArgAction {
+class SetToString : public ::args::_ArgAction {
  public:
   SetToString(BigStr* name, bool quit_parsing_flags, List<BigStr*>* valid = nullptr);
   virtual value_asdl::value_t* _Value(BigStr* arg, syntax_asdl::loc_t* location);
   
   static constexpr uint32_t field_mask() {
-    return _ArgAction::field_mask();
+    return ::args::_ArgAction::field_mask();
   }
 
   static constexpr ObjHeader obj_header() {
@@ -322,7 +385,7 @@ class SetToString : public _ArgAction {
   DISALLOW_COPY_AND_ASSIGN(SetToString)
 };
 
-class SetAttachedBool : public _Action {
+class SetAttachedBool : public ::args::_Action {
  public:
   SetAttachedBool(BigStr* name);
   virtual bool OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_Attributes* out);
@@ -330,7 +393,7 @@ class SetAttachedBool : public _Action {
   BigStr* name;
   
   static constexpr uint32_t field_mask() {
-    return _Action::field_mask()
+    return ::args::_Action::field_mask()
          | maskbit(offsetof(SetAttachedBool, name));
   }
 
@@ -341,7 +404,7 @@ class SetAttachedBool : public _Action {
   DISALLOW_COPY_AND_ASSIGN(SetAttachedBool)
 };
 
-class SetToTrue : public _Action {
+class SetToTrue : public ::args::_Action {
  public:
   SetToTrue(BigStr* name);
   virtual bool OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_Attributes* out);
@@ -349,7 +412,7 @@ class SetToTrue : public _Action {
   BigStr* name;
   
   static constexpr uint32_t field_mask() {
-    return _Action::field_mask()
+    return ::args::_Action::field_mask()
          | maskbit(offsetof(SetToTrue, name));
   }
 
@@ -360,7 +423,7 @@ class SetToTrue : public _Action {
   DISALLOW_COPY_AND_ASSIGN(SetToTrue)
 };
 
-class SetOption : public _Action {
+class SetOption : public ::args::_Action {
  public:
   SetOption(BigStr* name);
   virtual bool OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_Attributes* out);
@@ -368,7 +431,7 @@ class SetOption : public _Action {
   BigStr* name;
   
   static constexpr uint32_t field_mask() {
-    return _Action::field_mask()
+    return ::args::_Action::field_mask()
          | maskbit(offsetof(SetOption, name));
   }
 
@@ -379,7 +442,7 @@ class SetOption : public _Action {
   DISALLOW_COPY_AND_ASSIGN(SetOption)
 };
 
-class SetNamedOption : public _Action {
+class SetNamedOption : public ::args::_Action {
  public:
   SetNamedOption(bool shopt = false);
   void ArgName(BigStr* name);
@@ -389,7 +452,7 @@ class SetNamedOption : public _Action {
   bool shopt;
   
   static constexpr uint32_t field_mask() {
-    return _Action::field_mask()
+    return ::args::_Action::field_mask()
          | maskbit(offsetof(SetNamedOption, names));
   }
 
@@ -400,7 +463,7 @@ class SetNamedOption : public _Action {
   DISALLOW_COPY_AND_ASSIGN(SetNamedOption)
 };
 
-class SetAction : public _Action {
+class SetAction : public ::args::_Action {
  public:
   SetAction(BigStr* name);
   virtual bool OnMatch(BigStr* attached_arg, args::Reader* arg_r, args::_Attributes* out);
@@ -408,7 +471,7 @@ class SetAction : public _Action {
   BigStr* name;
   
   static constexpr uint32_t field_mask() {
-    return _Action::field_mask()
+    return ::args::_Action::field_mask()
          | maskbit(offsetof(SetAction, name));
   }
 
@@ -419,7 +482,7 @@ class SetAction : public _Action {
   DISALLOW_COPY_AND_ASSIGN(SetAction)
 };
 
-class SetNamedAction : public _Action {
+class SetNamedAction : public ::args::_Action {
  public:
   SetNamedAction();
   void ArgName(BigStr* name);
@@ -428,7 +491,7 @@ class SetNamedAction : public _Action {
   List<BigStr*>* names;
   
   static constexpr uint32_t field_mask() {
-    return _Action::field_mask()
+    return ::args::_Action::field_mask()
          | maskbit(offsetof(SetNamedAction, names));
   }
 
@@ -443,7 +506,6 @@ args::_Attributes* Parse(flag_spec::_FlagSpec* spec, args::Reader* arg_r);
 args::_Attributes* ParseLikeEcho(flag_spec::_FlagSpec* spec, args::Reader* arg_r);
 args::_Attributes* ParseMore(flag_spec::_FlagSpecAndMore* spec, args::Reader* arg_r);
 
-
 }  // declare namespace args
 
 #endif  // FRONTEND_ARGS_MYCPP_H
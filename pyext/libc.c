@@ -13,6 +13,7 @@
 #include <limits.h>
 #include <wchar.h>
 #include <stdlib.h>
+#include <string.h>  // memcpy()
 #include <sys/ioctl.h>
 #include <locale.h>
 #include <fnmatch.h>
@@ -21,6 +22,9 @@
 
 #include <Python.h>
 
+#include "cpp/libc_dirent.h"
+#include "cpp/regex_cache.h"
+
 // Log messages to stderr.
 static void debug(const char* fmt, ...) {
 #ifdef LIBC_VERBOSE
@@ -160,6 +164,53 @@ func_glob(PyObject *self, PyObject *args) {
   return matches;
 }
 
+static PyObject *
+func_listdir_kinds(PyObject *self, PyObject *args) {
+  const char* path;
+  if (!PyArg_ParseTuple(args, "s", &path)) {
+    return NULL;
+  }
+
+  DIR* dirp = opendir(path);
+  if (dirp == NULL) {
+    return PyErr_SetFromErrno(PyExc_OSError);
+  }
+  int dir_fd = dirfd(dirp);
+
+  PyObject* entries = PyList_New(0);
+  if (entries == NULL) {
+    closedir(dirp);
+    return NULL;
+  }
+  while (1) {
+    errno = 0;
+    struct dirent* ep = readdir(dirp);
+    if (ep == NULL) {
+      if (errno != 0) {
+        closedir(dirp);
+        Py_DECREF(entries);
+        return PyErr_SetFromErrno(PyExc_OSError);
+      }
+      break;  // no more entries
+    }
+    if (DirentIsDots(ep)) {
+      continue;
+    }
+    PyObject* entry = Py_BuildValue("(si)", ep->d_name,
+                                    DirentKind(dir_fd, ep));
+    if (entry == NULL || PyList_Append(entries, entry) < 0) {
+      Py_XDECREF(entry);
+      closedir(dirp);
+      Py_DECREF(entries);
+      return NULL;
+    }
+    Py_DECREF(entry);
+  }
+  closedir(dirp);
+
+  return entries;
+}
+
 static PyObject *
 func_regex_search(PyObject *self, PyObject *args) {
   const char* pattern;
@@ -173,12 +224,9 @@ func_regex_search(PyObject *self, PyObject *args) {
   }
 
   cflags |= REG_EXTENDED;
-  regex_t pat;
-  int status = regcomp(&pat, pattern, cflags);
-  if (status != 0) {
-    char error_desc[50];
-    regerror(status, &pat, error_desc, 50);
-
+  char error_desc[50];
+  regex_t* pat = regex_cache_get(pattern, cflags, error_desc, 50);
+  if (pat == NULL) {
     char error_message[80];
     snprintf(error_message, 80, "Invalid regex %s (%s)", pattern, error_desc);
 
@@ -186,16 +234,15 @@ func_regex_search(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  int num_groups = pat.re_nsub + 1;
+  int num_groups = pat->re_nsub + 1;
   PyObject *ret = PyList_New(num_groups * 2);
 
   if (ret == NULL) {
-    regfree(&pat);
     return NULL;
   }
 
   regmatch_t *pmatch = (regmatch_t*) malloc(sizeof(regmatch_t) * num_groups);
-  int match = regexec(&pat, str + pos, num_groups, pmatch, eflags);
+  int match = regexec(pat, str + pos, num_groups, pmatch, eflags);
   if (match == 0) {
     int i;
     for (i = 0; i < num_groups; i++) {
@@ -214,9 +261,9 @@ func_regex_search(PyObject *self, PyObject *args) {
   }
 
   free(pmatch);
-  regfree(&pat);
 
   if (match != 0) {
+    Py_DECREF(ret);
     Py_RETURN_NONE;
   }
 
@@ -239,16 +286,14 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  regex_t pat;
   regmatch_t m[NMATCH];
 
   // Could have been checked by regex_parse for [[ =~ ]], but not for glob
   // patterns like ${foo/x*/y}.
 
-  int status = regcomp(&pat, pattern, REG_EXTENDED);
-  if (status != 0) {
-    char error_string[80];
-    regerror(status, &pat, error_string, 80);
+  char error_string[80];
+  regex_t* pat = regex_cache_get(pattern, REG_EXTENDED, error_string, 80);
+  if (pat == NULL) {
     PyErr_SetString(PyExc_RuntimeError, error_string);
     return NULL;
   }
@@ -256,8 +301,7 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   debug("first_group_match pat %s str %s pos %d", pattern, str, pos);
 
   // Match at offset 'pos'
-  int result = regexec(&pat, str + pos, NMATCH, m, 0 /*flags*/);
-  regfree(&pat);
+  int result = regexec(pat, str + pos, NMATCH, m, 0 /*flags*/);
 
   if (result != 0) {
     Py_RETURN_NONE;  // no match
@@ -269,6 +313,106 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   return Py_BuildValue("(i,i)", pos + start, pos + end);
 }
 
+// Replace every match of the regex in str with replace_str, for ${x//pat/rep}.
+//
+// The string is scanned once with a single compiled regex.  We record match
+// positions, then build the result in one allocation.
+static PyObject *
+func_regex_replace_all(PyObject *self, PyObject *args) {
+  const char* pattern;
+  const char* str;
+  int str_len;
+  const char* replace_str;
+  int replace_len;
+  if (!PyArg_ParseTuple(args, "ss#s#", &pattern, &str, &str_len, &replace_str,
+                        &replace_len)) {
+    return NULL;
+  }
+
+  char error_string[80];
+  regex_t* pat = regex_cache_get(pattern, REG_EXTENDED, error_string, 80);
+  if (pat == NULL) {
+    PyErr_SetString(PyExc_RuntimeError, error_string);
+    return NULL;
+  }
+
+  // Pairs of (start, end) offsets
+  int cap = 16;
+  int num_matches = 0;
+  int* spans = (int*) malloc(sizeof(int) * cap * 2);
+  if (spans == NULL) {
+    return PyErr_NoMemory();
+  }
+
+  regmatch_t m[1];
+  int pos = 0;
+  while (pos < str_len) {  // prevents infinite loop in the (.*) case
+    if (regexec(pat, str + pos, 1, m, 0 /*flags*/) != 0) {
+      break;
+    }
+    if (num_matches == cap) {
+      cap *= 2;
+      int* new_spans = (int*) realloc(spans, sizeof(int) * cap * 2);
+      if (new_spans == NULL) {
+        free(spans);
+        return PyErr_NoMemory();
+      }
+      spans = new_spans;
+    }
+    int start = pos + m[0].rm_so;
+    int end = pos + m[0].rm_eo;
+    spans[2 * num_matches] = start;
+    spans[2 * num_matches + 1] = end;
+    num_matches++;
+
+    // An empty match would loop forever, so step over one byte
+    pos = (end == pos) ? end + 1 : end;
+  }
+
+  int result_len = str_len;
+  int i;
+  for (i = 0; i < num_matches; ++i) {
+    result_len += replace_len - (spans[2 * i + 1] - spans[2 * i]);
+  }
+
+  PyObject* result = PyString_FromStringAndSize(NULL, result_len);
+  if (result == NULL) {
+    free(spans);
+    return NULL;
+  }
+
+  char* out = PyString_AS_STRING(result);
+  int prev_end = 0;
+  for (i = 0; i < num_matches; ++i) {
+    int start = spans[2 * i];
+    memcpy(out, str + prev_end, start - prev_end);
+    out += start - prev_end;
+    memcpy(out, replace_str, replace_len);
+    out += replace_len;
+    prev_end = spans[2 * i + 1];
+  }
+  memcpy(out, str + prev_end, str_len - prev_end);
+
+  free(spans);
+  return result;
+}
+
+// Return [num_hits, num_misses, num_evictions, num_entries] for the compiled
+// regex cache.
+static PyObject *
+func_regex_cache_stats(PyObject *self, PyObject *unused) {
+  struct RegexCacheStats stats;
+  regex_cache_stats(&stats);
+  return Py_BuildValue("[iiii]", stats.num_hits, stats.num_misses,
+                       stats.num_evictions, stats.num_entries);
+}
+
+static PyObject *
+func_regex_cache_clear(PyObject *self, PyObject *unused) {
+  regex_cache_clear();
+  Py_RETURN_NONE;
+}
+
 // We do this in C so we can remove '%f' % 0.1 from the CPython build.  That
 // involves dtoa.c and pystrod.c, which are thousands of lines of code.
 static PyObject *
@@ -373,6 +517,11 @@ static PyMethodDef methods[] = {
   // We need this since Python's glob doesn't have char classes.
   {"glob", func_glob, METH_VARARGS, ""},
 
+  // Return a list of (name, kind) for the entries of a directory, except .
+  // and ..  The kind is DIRENT_DIR, DIRENT_SYMLINK or DIRENT_OTHER, usually
+  // without stat().  Raises OSError.
+  {"listdir_kinds", func_listdir_kinds, METH_VARARGS, ""},
+
   // Search a string for regex.  Returns a list of matches, None if no
   // match.  Raises RuntimeError if the regex is invalid.
   {"regex_search", func_regex_search, METH_VARARGS, ""},
@@ -382,6 +531,14 @@ static PyMethodDef methods[] = {
   // the regex is invalid.
   {"regex_first_group_match", func_regex_first_group_match, METH_VARARGS, ""},
 
+  // Replace all matches of the regex.  Raises RuntimeError if the regex is
+  // invalid.
+  {"regex_replace_all", func_regex_replace_all, METH_VARARGS, ""},
+
+  // Counters for the LRU cache of compiled regexes, for tests and benchmarks.
+  {"regex_cache_stats", func_regex_cache_stats, METH_NOARGS, ""},
+  {"regex_cache_clear", func_regex_cache_clear, METH_NOARGS, ""},
+
   // "Print three floating point values for the 'time' builtin.
   {"print_time", func_print_time, METH_VARARGS, ""},
 
@@ -409,6 +566,9 @@ void initlibc(void) {
       PyModule_AddIntConstant(module, "REG_ICASE", REG_ICASE);
       PyModule_AddIntConstant(module, "REG_NEWLINE", REG_NEWLINE);
       PyModule_AddIntConstant(module, "REG_NOTBOL", REG_NOTBOL);
+      PyModule_AddIntConstant(module, "DIRENT_OTHER", DIRENT_OTHER);
+      PyModule_AddIntConstant(module, "DIRENT_DIR", DIRENT_DIR);
+      PyModule_AddIntConstant(module, "DIRENT_SYMLINK", DIRENT_SYMLINK);
   }
 
   errno_error = PyErr_NewException("libc.error",
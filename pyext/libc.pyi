@@ -4,12 +4,19 @@ FNM_CASEFOLD: int
 REG_ICASE: int
 REG_NEWLINE: int
 REG_NOTBOL: int
+DIRENT_OTHER: int
+DIRENT_DIR: int
+DIRENT_SYMLINK: int
 
 def gethostname() -> str: ...
 def glob(pat: str) -> List[str]: ...
+def listdir_kinds(path: str) -> List[Tuple[str, int]]: ...
 def fnmatch(pat: str, s: str, flags: int = 0) -> bool: ...
 def regex_first_group_match(regex: str, s: str, pos: int) -> Optional[Tuple[int, int]]: ...
 def regex_search(regex: str, cflags: int, s: str, eflags: int, pos: int = 0) -> Optional[List[int]]: ...
+def regex_replace_all(regex: str, s: str, replace_str: str) -> str: ...
+def regex_cache_stats() -> List[int]: ...
+def regex_cache_clear() -> None: ...
 def wcswidth(s: str) -> int: ...
 def get_terminal_width() -> int: ...
 def print_time(real: float, user: float, sys: float) -> None: ...
@@ -179,6 +179,15 @@ class LibcTest(unittest.TestCase):
     print(libc.glob('\\\\'))
     print(libc.glob('[[:punct:]]'))
 
+  def testListdirKinds(self):
+    entries = dict(libc.listdir_kinds('pyext'))
+    self.assertEqual(libc.DIRENT_OTHER, entries['libc.c'])
+    self.assertEqual(libc.DIRENT_DIR, dict(libc.listdir_kinds('.'))['pyext'])
+    self.assertNotIn('.', entries)
+    self.assertNotIn('..', entries)
+
+    self.assertRaises(OSError, libc.listdir_kinds, '_nonexistent_')
+
   def testRegexMatchError(self):
     # See core/util_test.py for more tests
     try:
@@ -208,6 +217,43 @@ class LibcTest(unittest.TestCase):
     self.assertRaises(
         RuntimeError, libc.regex_first_group_match, r'*', 'abcd', 0)
 
+  def testRegexCache(self):
+    libc.regex_cache_clear()
+    self.assertEqual([0, 0, 0, 0], libc.regex_cache_stats())
+
+    s = 'oXooXoooXoX'
+    for i in xrange(3):
+      self.assertEqual((1, 3), libc.regex_first_group_match('(X.)', s, 0))
+    # 1 miss, then 2 hits
+    self.assertEqual([2, 1, 0, 1], libc.regex_cache_stats())
+
+    # Same pattern with different flags is a different entry
+    self.assertEqual([0, 1], libc.regex_search('x', libc.REG_ICASE, 'X', 0))
+    self.assertEqual(None, libc.regex_search('x', 0, 'X', 0))
+    self.assertEqual([2, 3, 0, 3], libc.regex_cache_stats())
+
+    # Invalid patterns aren't cached
+    self.assertRaises(ValueError, libc.regex_search, r'*', 0, 'abcd', 0)
+    self.assertRaises(ValueError, libc.regex_search, r'*', 0, 'abcd', 0)
+    self.assertEqual([2, 5, 0, 3], libc.regex_cache_stats())
+
+    # Fill the cache past its capacity, which evicts the least recently used
+    for i in xrange(300):
+      self.assertEqual([0, len(str(i))],
+                       libc.regex_search('^%d$' % i, 0, str(i), 0))
+    hits, misses, evictions, num_entries = libc.regex_cache_stats()
+    self.assertEqual(2, hits)
+    self.assertEqual(305, misses)
+    self.assertEqual(303 - num_entries, evictions)
+
+    # The first pattern was evicted, but the last one is still there
+    libc.regex_search('^299$', 0, '299', 0)
+    libc.regex_first_group_match('(X.)', s, 0)
+    self.assertEqual([3, 306], libc.regex_cache_stats()[:2])
+
+    libc.regex_cache_clear()
+    self.assertEqual([0, 0, 0, 0], libc.regex_cache_stats())
+
   def testRegexFirstGroupMatchError(self):
     # Helping to debug issue #291
     s = ''
@@ -2141,6 +2141,53 @@ posix_fstat(PyObject *self, PyObject *args)
 }
 
 
+PyDoc_STRVAR_remove(posix_lseek__doc__,
+"lseek(fd, pos, how) -> newpos\n\n\
+Set the current position of a file descriptor.\n\
+Return the new cursor position in bytes, starting from the beginning.");
+
+static PyObject *
+posix_lseek(PyObject *self, PyObject *args)
+{
+    int fd, how;
+    off_t pos, res;
+    PyObject *posobj;
+    if (!PyArg_ParseTuple(args, "iOi:lseek", &fd, &posobj, &how))
+        return NULL;
+#ifdef SEEK_SET
+    /* Turn 0, 1, 2 into SEEK_{SET,CUR,END} */
+    switch (how) {
+    case 0: how = SEEK_SET; break;
+    case 1: how = SEEK_CUR; break;
+    case 2: how = SEEK_END; break;
+    }
+#endif /* SEEK_END */
+
+#if !defined(HAVE_LARGEFILE_SUPPORT)
+    pos = PyInt_AsLong(posobj);
+#else
+    pos = PyLong_Check(posobj) ?
+        PyLong_AsLongLong(posobj) : PyInt_AsLong(posobj);
+#endif
+    if (PyErr_Occurred())
+        return NULL;
+
+    if (!_PyVerify_fd(fd))
+        return posix_error();
+    Py_BEGIN_ALLOW_THREADS
+    res = lseek(fd, pos, how);
+    Py_END_ALLOW_THREADS
+    if (res < 0)
+        return posix_error();
+
+#if !defined(HAVE_LARGEFILE_SUPPORT)
+    return PyInt_FromLong(res);
+#else
+    return PyLong_FromLongLong(res);
+#endif
+}
+
+
 PyDoc_STRVAR_remove(posix_fdopen__doc__,
 "fdopen(fd [, mode='r' [, bufsize]]) -> file_object\n\n\
 Return an open file object connected to a file descriptor.");
@@ -500,3 +500,48 @@ echo {z..3}
 BUG
 ## END
 
+
+#### for loop over brace expansion, with break and changing vars
+x=1
+for i in {1..3}$x; do
+  x=2
+  echo $i
+done
+for i in {1..1000000}; do
+  if test $i -eq 3; then
+    break
+  fi
+  echo $i
+done
+for i in a{b,c{1..2}}d; do
+  echo $i
+done
+## STDOUT:
+11
+21
+31
+1
+2
+abd
+ac1d
+ac2d
+## END
+
+#### for loop over brace expansion elides empty words
+for x in {a,} b; do
+  echo "[$x]"
+done
+for x in {,}; do
+  echo "[$x]"
+done
+for x in {,a}{,} {,,}; do
+  echo "[$x]"
+done
+echo done
+## STDOUT:
+[a]
+[b]
+[a]
+[a]
+done
+## END
@@ -768,3 +768,37 @@ status=1
 status=0
 ## END
 ## N-I dash/ash/mksh/zsh stdout-json: ""
+
+#### shopt -s buffered_stdin: a child doesn't see input buffered by the parent
+printf 'l1\nl2\nl3\n' | $SH -c '
+shopt -s buffered_stdin 2>/dev/null
+read first
+echo FROMPIPE | { read y; echo "y=$y"; } | cat
+read second
+echo "$first $second"
+'
+## STDOUT:
+y=FROMPIPE
+l1 l2
+## END
+
+#### shopt -s buffered_stdin: a child gives back what it doesn't read
+shopt -s buffered_stdin 2>/dev/null
+printf 'l1\nl2\nl3\nl4\nl5\nl6\nl7\n' > buffered-stdin.txt
+
+f() { read b; echo "$b"; }
+{
+  read a
+  ( read b; echo "subshell b=$b" )
+  read c
+  ( read d; echo "pipeline d=$d" ) | cat
+  read e
+  x=$(f)
+  read g
+  echo "$a $c $e $x $g"
+} < buffered-stdin.txt
+## STDOUT:
+subshell b=l2
+pipeline d=l4
+l1 l3 l5 l6 l7
+## END
@@ -357,6 +357,25 @@ __a__
 ## END
 # note: zsh also passes this, but it doesn't run with this file.
 
+#### Glob matches names that aren't valid UTF-8
+mkdir -p $TMP/glob-u8
+cd $TMP/glob-u8
+touch $'\xff.txt' $'\xce\xbc.txt'
+
+echo *[.]txt | od -A n -t x1
+echo ?.txt | od -A n -t x1
+echo [!a].txt | od -A n -t x1
+## STDOUT:
+ ce bc 2e 74 78 74 20 ff 2e 74 78 74 0a
+ ce bc 2e 74 78 74 20 ff 2e 74 78 74 0a
+ ce bc 2e 74 78 74 20 ff 2e 74 78 74 0a
+## END
+## BUG dash/mksh/ash STDOUT:
+ ce bc 2e 74 78 74 20 ff 2e 74 78 74 0a
+ ff 2e 74 78 74 0a
+ ff 2e 74 78 74 0a
+## END
+
 #### dotglob (bash option that dashglob is roughly consistent with)
 mkdir -p $TMP/dotglob
 cd $TMP/dotglob
@@ -373,3 +392,67 @@ other
 other
 other
 ## END
+
+#### globstar matches zero or more directories
+mkdir -p $TMP/globstar/a/b
+cd $TMP/globstar
+touch top.py a/x.py a/b/y.py a/b/z.txt
+
+echo **/*.py
+shopt -s globstar
+echo **/*.py
+echo a/**/y.py
+echo **/
+## STDOUT:
+a/x.py
+a/b/y.py a/x.py top.py
+a/b/y.py
+a/ a/b/
+## END
+## N-I dash/mksh/ash STDOUT:
+a/x.py
+a/x.py
+a/**/y.py
+**/
+## END
+
+#### globstar at the end matches files and directories
+mkdir -p $TMP/globstar2/d/.hidden
+cd $TMP/globstar2
+touch f d/g d/.hidden/h
+
+shopt -s globstar
+echo **
+shopt -s dotglob
+echo **
+## STDOUT:
+d d/g f
+d d/.hidden d/.hidden/h d/g f
+## END
+## N-I dash/mksh/ash STDOUT:
+d f
+d f
+## END
+
+#### nocaseglob
+mkdir -p $TMP/nocaseglob/Dir
+cd $TMP/nocaseglob
+touch Dir/A.TXT Dir/b.txt
+
+echo dir/*
+echo Dir/*.txt
+shopt -s nocaseglob
+echo Dir/*.txt
+echo D[I]r/[a]*
+## STDOUT:
+dir/*
+Dir/b.txt
+Dir/A.TXT Dir/b.txt
+Dir/A.TXT
+## END
+## N-I dash/mksh/ash STDOUT:
+dir/*
+Dir/b.txt
+Dir/b.txt
+D[I]r/[a]*
+## END
@@ -694,3 +694,50 @@ echo result=$[evalExpr(e)]
 ## STDOUT:
 result=x is 1
 ## END
+
+#### constant expressions are evaluated like other expressions
+for i in (0 .. 2) {
+  var mask = (1 << 12) - 1
+  var s = 'a' ++ 'b' ++ "c"
+  var b = 3 if 1 < 2 < 3 else 4
+  echo $mask $s $b $[false and f()] $[true or f()] $[- 2 ** 3]
+}
+## STDOUT:
+4095 abc 3 false true -8
+4095 abc 3 false true -8
+## END
+
+#### constant List and Dict literals are still new each time
+for i in (0 .. 2) {
+  var L = [1, 2 + 3]
+  var d = {k: 'v' ++ 'w'}
+  call L->append(i)
+  setvar d.i = i
+  echo $[len(L)] $[len(d)]
+}
+## STDOUT:
+3 2
+3 2
+## END
+
+#### constant expression with an error fails each time
+for i in (0 .. 2) {
+  try {
+    echo $[1 + 2 // 0]
+  }
+  echo status=$_status
+}
+## STDOUT:
+status=3
+status=3
+## END
+
+#### constant branches that aren't taken aren't evaluated
+var a = true or (1 << -1)
+var b = false and 2 ** 99999999
+var c = 42 if true else 1 << -1
+var d = 1 << -1 if false else 'else'
+echo $a $b $c $d
+## STDOUT:
+true false 42 else
+## END
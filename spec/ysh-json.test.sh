@@ -1078,3 +1078,88 @@ status=1
 status=1
 ## END
 
+
+#### json read --lines fills a List
+
+printf '{"a": 1}\n\n[2, 3]\n  "s"  \n' | json read --lines
+json write (_reply, space=0)
+
+printf '1\n2\n' | json read --lines (&x)
+json write (x, space=0)
+
+## STDOUT:
+[{"a":1},[2,3],"s"]
+[1,2]
+## END
+
+#### json read --lines runs a block for each record
+
+var total = 0
+printf '1\n2\n3\nnull\n4\n' | json read --lines (&x) {
+  if (x === null) {
+    break
+  }
+  if (x === 2) {
+    continue
+  }
+  setvar total += x
+}
+echo total=$total
+
+printf '[1]\n{"k": "v"}\n' | json8 read --lines {
+  json8 write (_reply, space=0)
+}
+
+## STDOUT:
+total=4
+[1]
+{"k":"v"}
+## END
+
+#### return in a json read --lines block returns from the proc
+
+proc p {
+  printf '1\n2\n3\n' | json read --lines (&x) {
+    if (x === 2) {
+      return 5
+    }
+    echo $x
+  }
+  echo after-loop
+}
+try {
+  p
+}
+echo status=$_status
+
+## STDOUT:
+1
+status=5
+## END
+
+#### json read --lines stops at a bad record
+
+printf '1\n2\n[3,\n4\n' | json read --lines {
+  echo $_reply
+}
+
+## status: 1
+## STDOUT:
+1
+2
+## END
+
+#### json write --lines
+
+json write --lines ([{a: 1}, [1, 2], 'x', null])
+
+json write --lines ({a: 1})
+echo status=$?
+
+## status: 3
+## STDOUT:
+{"a":1}
+[1,2]
+"x"
+null
+## END
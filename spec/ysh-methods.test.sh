@@ -488,3 +488,35 @@ write @x
 0
 ## END
 
+
+#### One call site with different types of objects
+var objs = ['a', [1, 2], 'b', {k: 1}, ['c']]
+for obj in (objs) {
+  try {
+    call obj->append('x')
+  }
+  echo "status=$_status $[len(obj)]"
+}
+json write (objs, space=0)
+## STDOUT:
+status=3 1
+status=0 3
+status=3 1
+status=3 1
+status=0 2
+["a",[1,2,"x"],"b",{"k":1},["c","x"]]
+## END
+
+#### Fat arrow calls a method, or a func of the same name
+func upper(x) { return ('func ' ++ str(x)) }
+for obj in ('a', 42, 'b') {
+  echo $[obj => upper()]
+}
+var f = 'c' => upper
+echo $[f()]
+## STDOUT:
+A
+func 42
+B
+C
+## END
@@ -709,3 +709,24 @@ match n
 match backslash
 ## END
 
+
+#### same eggex in a loop, with and without splices
+var pats = []
+for i in (0 .. 3) {
+  var pat = / <capture d+ as num> /
+  call pats->append(pat)
+  var D = str(i)
+  var spliced = / @D /
+  if ('x12' ~ pat) { echo $[_group('num')] }
+  if ('x12' ~ spliced) { echo spliced $i } else { echo nope $i }
+}
+echo $[pats[0] is pats[1]]
+## STDOUT:
+12
+nope 0
+12
+spliced 1
+12
+spliced 2
+false
+## END
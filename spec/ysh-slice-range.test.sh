@@ -184,6 +184,95 @@ for i in (5..1) {
 ## STDOUT:
 ## END
 
+#### Range len, in, and subscripts don't make a List
+var r = 0 .. 10
+echo $[len(r)] $[len(5 .. 1)]
+echo $[3 in r] $[10 in r] $[-1 in r]
+echo $[r[0]] $[r[-1]]
+= r[2:5]
+= r[-3:]
+
+try {
+  = r[10]
+}
+echo status=$_status
+
+## STDOUT:
+10 0
+true false false
+0 9
+(Range)   2 .. 5
+(Range)   7 .. 10
+status=3
+## END
+
+#### Range with step, and reversed
+var r = (0 .. 10) => step(3)
+= r
+echo $[len(r)] $[6 in r] $[7 in r] $[r[-1]]
+for i in (r) { echo $i }
+echo ---
+var rev = r => reversed()
+= rev
+for i in (rev) { echo $i }
+echo ---
+json write (list((10 .. 0) => step(-4)), space=0)
+json write (list(rev[1:]), space=0)
+echo $[r === (0 .. 12) => step(3)]
+
+## STDOUT:
+(Range)   (0 .. 10) => step(3)
+4 true false 9
+0
+3
+6
+9
+---
+(Range)   (9 .. -3) => step(-3)
+9
+6
+3
+0
+---
+[10,6,2]
+[6,3,0]
+true
+## END
+
+#### Range step of 0 is an error
+= (0 .. 3) => step(0)
+## status: 3
+## STDOUT:
+## END
+
+#### Range with big bounds
+var r = 0 .. 9223372036854775807
+echo $[len(r)]
+echo $[r[-1]]
+echo $[9223372036854775806 in r]
+echo $[len(r => step(2))]
+## STDOUT:
+9223372036854775807
+9223372036854775806
+true
+4611686018427387904
+## END
+
+#### Range whose length overflows is an error
+var r = (9223372036854775800 .. 9223372036854775807) => step(3)
+for i in (r) { echo $i }
+json write (list(r => reversed()), space=0)
+
+var big = -9223372036854775807 .. 9223372036854775807
+echo $[len(big)]
+## status: 3
+## STDOUT:
+9223372036854775800
+9223372036854775803
+9223372036854775806
+[9223372036854775806,9223372036854775803,9223372036854775800]
+## END
+
 #### Slices with Multiple Dimensions (for TSV8?)
 
 qtt pretty :mytable <<< '''
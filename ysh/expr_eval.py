@@ -60,7 +60,9 @@ from frontend import typed_args
 from osh import braces
 from mycpp import mops
 from mycpp.mylib import log, NewDict, switch, tagswitch, print_stderr
+from ysh import expr_fold
 from ysh import func_proc
+from ysh import regex_translate
 from ysh import val_ops
 
 import libc
@@ -158,6 +160,28 @@ def _ConvertForBinaryOp(left, right):
         return coerced_e.Neither, nope, nope, -1.0, -1.0
 
 
+# Clear the method cache when it has this many call sites, so that code from
+# eval in a loop doesn't make it grow without bound
+_MAX_METHOD_SITES = 1000
+
+# Likewise for the cache of static eggexes
+_MAX_EGGEXES = 1000
+
+
+class _MethodCache(object):
+    """Inline cache for one obj->method() call site.
+
+    It remembers the type tag of the last object, and the builtin method that
+    it had.  Method tables don't change after startup, so a hit gives the same
+    answer as a lookup.
+    """
+
+    def __init__(self, tag, method):
+        # type: (int, Optional[vm._Callable]) -> None
+        self.tag = tag
+        self.method = method
+
+
 class ExprEvaluator(object):
     """Shared between arith and bool evaluators.
 
@@ -183,6 +207,11 @@ class ExprEvaluator(object):
         self.mem = mem
         self.mutable_opts = mutable_opts
         self.methods = methods
+        self.method_cache = {}  # type: Dict[Attribute, _MethodCache]
+        self.folder = expr_fold.Folder(self)
+        # Eggexes without splices or conversion funcs, so that as_ere is
+        # computed once.  Each evaluation still creates a new value.Eggex.
+        self.eggex_cache = {}  # type: Dict[Eggex, value.Eggex]
         self.splitter = splitter
         self.errfmt = errfmt
 
@@ -343,9 +372,14 @@ class ExprEvaluator(object):
         self.mem.SetLocationForExpr(blame_loc)
         # Pure C++ won't need to catch exceptions
         with state.ctx_YshExpr(self.mutable_opts):
-            val = self._EvalExpr(node)
+            val = self._EvalExpr(self.folder.Fold(node))
         return val
 
+    def EvalPure(self, node):
+        # type: (expr_t) -> value_t
+        """For expr_fold: evaluate literals and operators on them."""
+        return self._EvalExpr(node)
+
     def EvalLhsExpr(self, lhs, which_scopes):
         # type: (y_lhs_t, scope_t) -> y_lvalue_t
         """Public API for _EvalLhsExpr to ensure command_sub_errexit"""
@@ -813,7 +847,30 @@ class ExprEvaluator(object):
     def _EvalFuncCall(self, node):
         # type: (expr.FuncCall) -> value_t
 
-        func = self._EvalExpr(node.func)
+        UP_func_node = node.func
+        if node.func.tag() == expr_e.Attribute:
+            attr = cast(Attribute, UP_func_node)
+            if attr.op.id in (Id.Expr_RArrow, Id.Expr_RDArrow):
+                o = self._EvalExpr(attr.obj)
+                method = self._LookupMethod(attr, o)
+                if method:
+                    # Fast path for o->method(): like calling a BoundFunc,
+                    # without allocating it and its BuiltinFunc
+                    pos_args, named_args = func_proc._EvalArgList(self,
+                                                                  node.args,
+                                                                  me=o)
+                    rd = typed_args.Reader(pos_args,
+                                           named_args,
+                                           None,
+                                           node.args,
+                                           is_bound=True)
+                    return method.Call(rd)
+
+                func = self._BindAttribute(attr, o)
+            else:
+                func = self._EvalExpr(node.func)
+        else:
+            func = self._EvalExpr(node.func)
         UP_func = func
 
         # The () operator has a 2x2 matrix of
@@ -902,6 +959,31 @@ class ExprEvaluator(object):
                             index, 'List index expected Int or Slice',
                             loc.Missing)
 
+            elif case(value_e.Range):
+                obj = cast(value.Range, UP_obj)
+                with tagswitch(index) as case2:
+                    if case2(value_e.Slice):  # another Range
+                        index = cast(value.Slice, UP_index)
+                        return val_ops.RangeSlice(obj, index.lower,
+                                                  index.upper)
+
+                    elif case2(value_e.Int):
+                        index = cast(value.Int, UP_index)
+                        n = val_ops.RangeLen(obj)
+                        big_i = index.i
+                        if mops.Greater(mops.ZERO, big_i):
+                            big_i = mops.Add(big_i, n)
+                        if (mops.Greater(mops.ZERO, big_i) or
+                                not mops.Greater(n, big_i)):
+                            # TODO: expr.Subscript has no error location
+                            raise error.Expr('index out of range', loc.Missing)
+                        return value.Int(val_ops.RangeAt(obj, big_i))
+
+                    else:
+                        raise error.TypeErr(
+                            index, 'Range index expected Int or Slice',
+                            loc.Missing)
+
             elif case(value_e.Dict):
                 obj = cast(value.Dict, UP_obj)
                 if index.tag() != value_e.Str:
@@ -916,7 +998,8 @@ class ExprEvaluator(object):
                     raise error.Expr('Dict entry %r not found' % index.s,
                                      loc.Missing)
 
-        raise error.TypeErr(obj, 'Subscript expected Str, List, or Dict',
+        raise error.TypeErr(obj,
+                            'Subscript expected Str, List, Range, or Dict',
                             loc.Missing)
 
     def _EvalDot(self, node, obj):
@@ -942,51 +1025,75 @@ class ExprEvaluator(object):
 
         return result
 
+    def _LookupMethod(self, node, o):
+        # type: (Attribute, value_t) -> Optional[vm._Callable]
+        """Return the builtin method for o->name, or None."""
+        tag = o.tag()
+        entry = self.method_cache.get(node)
+        if entry is not None and entry.tag == tag:
+            return entry.method
+
+        type_methods = self.methods.get(tag)
+        method = (type_methods.get(node.attr_name)
+                  if type_methods is not None else None)
+
+        if entry is None:
+            if len(self.method_cache) >= _MAX_METHOD_SITES:
+                self.method_cache.clear()
+            self.method_cache[node] = _MethodCache(tag, method)
+        else:  # the site saw another type
+            entry.tag = tag
+            entry.method = method
+
+        return method
+
+    def _BindAttribute(self, node, o):
+        # type: (Attribute, value_t) -> value_t
+        """o->method or o => f, where o is already evaluated."""
+        name = node.attr_name
+        # Look up builtin methods
+        vm_callable = self._LookupMethod(node, o)
+        if vm_callable:
+            func_val = value.BuiltinFunc(vm_callable)
+            return value.BoundFunc(o, func_val)
+
+        # If the operator is ->, fail because we don't have any
+        # user-defined methods
+        if node.op.id == Id.Expr_RArrow:
+            raise error.TypeErrVerbose(
+                'Method %r does not exist on type %s' %
+                (name, ui.ValType(o)), node.attr)
+
+        # Operator is =>, so try function chaining.
+
+        # Instead of str(f()) => upper()
+        #         or str(f()).upper() as in Pythohn
+        #
+        # It's more natural to write
+        #     f() => str() => upper()
+
+        # Could improve error message: may give "Undefined variable"
+        val = self._LookupVar(name, node.attr)
+
+        with tagswitch(val) as case:
+            if case(value_e.Func, value_e.BuiltinFunc):
+                return value.BoundFunc(o, val)
+            else:
+                raise error.TypeErr(
+                    val, 'Fat arrow => expects method or function',
+                    node.attr)
+
     def _EvalAttribute(self, node):
         # type: (Attribute) -> value_t
 
         o = self._EvalExpr(node.obj)
-        UP_o = o
 
         with switch(node.op.id) as case:
             # Right now => is a synonym for ->
             # Later we may enforce that => is pure, and -> is for mutation and
             # I/O.
             if case(Id.Expr_RArrow, Id.Expr_RDArrow):
-                name = node.attr_name
-                # Look up builtin methods
-                type_methods = self.methods.get(o.tag())
-                vm_callable = (type_methods.get(name)
-                               if type_methods is not None else None)
-                if vm_callable:
-                    func_val = value.BuiltinFunc(vm_callable)
-                    return value.BoundFunc(o, func_val)
-
-                # If the operator is ->, fail because we don't have any
-                # user-defined methods
-                if node.op.id == Id.Expr_RArrow:
-                    raise error.TypeErrVerbose(
-                        'Method %r does not exist on type %s' %
-                        (name, ui.ValType(o)), node.attr)
-
-                # Operator is =>, so try function chaining.
-
-                # Instead of str(f()) => upper()
-                #         or str(f()).upper() as in Pythohn
-                #
-                # It's more natural to write
-                #     f() => str() => upper()
-
-                # Could improve error message: may give "Undefined variable"
-                val = self._LookupVar(name, node.attr)
-
-                with tagswitch(val) as case2:
-                    if case2(value_e.Func, value_e.BuiltinFunc):
-                        return value.BoundFunc(o, val)
-                    else:
-                        raise error.TypeErr(
-                            val, 'Fat arrow => expects method or function',
-                            node.attr)
+                return self._BindAttribute(node, o)
 
             elif case(Id.Expr_Dot):  # d.key is like d['key']
                 return self._EvalDot(node, o)
@@ -1115,13 +1222,19 @@ class ExprEvaluator(object):
                 assert node.lower is not None
                 assert node.upper is not None
 
-                msg = 'Range begin should be Int'
-                i = val_ops.ToInt(self._EvalExpr(node.lower), msg, loc.Missing)
+                begin = self._EvalExpr(node.lower)
+                if begin.tag() != value_e.Int:
+                    raise error.TypeErr(begin, 'Range begin should be Int',
+                                        loc.Missing)
 
-                msg = 'Range end should be Int'
-                j = val_ops.ToInt(self._EvalExpr(node.upper), msg, loc.Missing)
+                end = self._EvalExpr(node.upper)
+                if end.tag() != value_e.Int:
+                    raise error.TypeErr(end, 'Range end should be Int',
+                                        loc.Missing)
 
-                return value.Range(i, j)
+                return value.Range(
+                    cast(value.Int, begin).i,
+                    cast(value.Int, end).i, mops.ONE)
 
             elif case(expr_e.Compare):
                 node = cast(expr.Compare, UP_node)
@@ -1212,14 +1325,37 @@ class ExprEvaluator(object):
     def EvalEggex(self, node):
         # type: (Eggex) -> value.Eggex
 
+        c = self.eggex_cache.get(node)
+        if c is not None:
+            # A new value, so 'is' is still false for two evaluations.  The
+            # translated fields aren't mutated after they're filled in.
+            return value.Eggex(c.spliced, c.canonical_flags, c.convert_funcs,
+                               c.convert_toks, c.as_ere, c.capture_names)
+
         # Splice, check flags consistency, and accumulate convert_funcs indexed
         # by capture group
         ev = EggexEvaluator(self.mem, node.canonical_flags)
         spliced = ev.EvalE(node.regex)
 
         # as_ere and capture_names filled by ~ operator or Str method
-        return value.Eggex(spliced, node.canonical_flags, ev.convert_funcs,
-                           ev.convert_toks, None, [])
+        eggex = value.Eggex(spliced, node.canonical_flags, ev.convert_funcs,
+                            ev.convert_toks, None, [])
+
+        # A static eggex evaluates to the same thing every time, so translate
+        # it to ERE once.  If it can't be translated, it fails each time it's
+        # used, like an eggex with splices.
+        if expr_fold.IsStaticRegex(node.regex):
+            try:
+                regex_translate.AsPosixEre(eggex)
+            except error.FatalRuntime:
+                # capture_names may be partly filled in
+                return value.Eggex(spliced, node.canonical_flags,
+                                   ev.convert_funcs, ev.convert_toks, None, [])
+
+            if len(self.eggex_cache) >= _MAX_EGGEXES:
+                self.eggex_cache.clear()
+            self.eggex_cache[node] = eggex
+        return eggex
 
 
 class EggexEvaluator(object):
@@ -0,0 +1,299 @@
+#!/usr/bin/env python2
+"""
+expr_fold.py - Fold constant subexpressions of YSH expressions
+
+For example, in
+
+    var mask = (1 << 12) - 1
+    if (n > 2 ** 20 and verbose) { echo big }
+
+the right-hand side of 'var' becomes expr.Const(4095), and 2 ** 20 becomes
+expr.Const(1048576).  Conditions like 'false and x' and 'a if true else b'
+are resolved to one side.
+
+Folding happens the first time an expression is evaluated, not at parse time,
+so 'ysh -n' still shows the original tree.  A subtree is only replaced if it
+evaluates without error to an immutable value.  Otherwise it's left alone, and
+it will fail (or create a new List or Dict) each time it's evaluated.
+"""
+from __future__ import print_function
+
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.syntax_asdl import (
+    ArgList,
+    Attribute,
+    SingleQuoted,
+    Subscript,
+    Token,
+    class_literal_term_e,
+    expr,
+    expr_e,
+    expr_t,
+    re,
+    re_e,
+    re_t,
+)
+from _devbuild.gen.value_asdl import value, value_e, value_t
+from core import error
+from mycpp.mylib import tagswitch
+from ysh import val_ops
+
+from typing import cast, Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ysh.expr_eval import ExprEvaluator
+
+# Like _MAX_METHOD_SITES in expr_eval.py: code from eval in a loop creates new
+# expressions each time
+_MAX_ROOTS = 10000
+
+
+def IsStaticRegex(node):
+    # type: (re_t) -> bool
+    """Is the result of EggexEvaluator.EvalE() the same every time?
+
+    It isn't if the regex has splices like @D and [ @chars ], or conversion
+    funcs like <capture d+ : int>, which are looked up by name.
+    """
+    UP_node = node
+    with tagswitch(node) as case:
+        if case(re_e.Splice):
+            return False
+
+        elif case(re_e.CharClassLiteral):
+            node = cast(re.CharClassLiteral, UP_node)
+            for term in node.terms:
+                if term.tag() == class_literal_term_e.Splice:
+                    return False
+            return True
+
+        elif case(re_e.Capture):
+            node = cast(re.Capture, UP_node)
+            if node.func_name:
+                return False
+            return IsStaticRegex(node.child)
+
+        elif case(re_e.Group):
+            node = cast(re.Group, UP_node)
+            return IsStaticRegex(node.child)
+
+        elif case(re_e.Repeat):
+            node = cast(re.Repeat, UP_node)
+            return IsStaticRegex(node.child)
+
+        elif case(re_e.Backtracking):
+            node = cast(re.Backtracking, UP_node)
+            return IsStaticRegex(node.child)
+
+        elif case(re_e.Seq):
+            node = cast(re.Seq, UP_node)
+            for child in node.children:
+                if not IsStaticRegex(child):
+                    return False
+            return True
+
+        elif case(re_e.Alt):
+            node = cast(re.Alt, UP_node)
+            for child in node.children:
+                if not IsStaticRegex(child):
+                    return False
+            return True
+
+        else:
+            # Primitive, PosixClass, PerlClass, SingleQuoted, ...
+            return True
+
+
+def _IsImmutable(val):
+    # type: (value_t) -> bool
+    return val.tag() in (value_e.Null, value_e.Bool, value_e.Int,
+                         value_e.Float, value_e.Str)
+
+
+class Folder(object):
+    """Rewrites expressions in place, replacing pure subtrees with expr.Const.
+
+    Pure subtrees are made of literals, and operators that don't look at
+    variables or set state.  So regex matching with ~ isn't folded, because it
+    sets _group(), and neither is 'is', because it compares identity.
+    """
+
+    def __init__(self, expr_ev):
+        # type: (ExprEvaluator) -> None
+        self.expr_ev = expr_ev
+
+        # Expressions we've folded -> the expression to evaluate instead
+        self.folded = {}  # type: Dict[expr_t, expr_t]
+
+    def Fold(self, node):
+        # type: (expr_t) -> expr_t
+        """Returns an equivalent expression, folding node the first time."""
+        result = self.folded.get(node)
+        if result is None:
+            result = self._Fold(node)
+            if len(self.folded) >= _MAX_ROOTS:
+                self.folded.clear()
+            self.folded[node] = result
+        return result
+
+    def _ToConst(self, node, tok):
+        # type: (expr_t, Token) -> expr_t
+        """Evaluate a pure expression, and return a Const if possible."""
+        try:
+            val = self.expr_ev.EvalPure(node)
+        except error.FatalRuntime:
+            # e.g. 1 / 0 or 'a' + 1 fail every time they're evaluated, with a
+            # better location than tok
+            return node
+
+        if not _IsImmutable(val):
+            return node
+        return expr.Const(tok, val)
+
+    def _FoldList(self, nodes):
+        # type: (List[expr_t]) -> bool
+        """Fold each node in place, and return whether they're all Const."""
+        all_const = True
+        for i, node in enumerate(nodes):
+            nodes[i] = self._Fold(node)
+            if nodes[i].tag() != expr_e.Const:
+                all_const = False
+        return all_const
+
+    def _FoldArgs(self, args):
+        # type: (ArgList) -> None
+        self._FoldList(args.pos_args)
+        for named in args.named_args:
+            named.value = self._Fold(named.value)
+
+    def _Fold(self, node):
+        # type: (expr_t) -> expr_t
+        UP_node = node
+        with tagswitch(node) as case:
+            if case(expr_e.SingleQuoted):
+                node = cast(SingleQuoted, UP_node)
+                return expr.Const(node.left, value.Str(node.sval))
+
+            elif case(expr_e.Unary):
+                node = cast(expr.Unary, UP_node)
+                node.child = self._Fold(node.child)
+                if (node.child.tag() == expr_e.Const and
+                        node.op.id != Id.Arith_Amp):  # &x is a Place
+                    return self._ToConst(node, node.op)
+                return node
+
+            elif case(expr_e.Binary):
+                node = cast(expr.Binary, UP_node)
+                node.left = self._Fold(node.left)
+
+                if node.left.tag() == expr_e.Const:
+                    left = cast(expr.Const, node.left)
+                    # Like _EvalBinary(), but the right side is any expr.  It's
+                    # not folded if it's not evaluated, e.g. true or 1 << -1
+                    if node.op.id == Id.Expr_And:
+                        if val_ops.ToBool(left.val):
+                            return self._Fold(node.right)
+                        return left
+                    if node.op.id == Id.Expr_Or:
+                        if val_ops.ToBool(left.val):
+                            return left
+                        return self._Fold(node.right)
+
+                node.right = self._Fold(node.right)
+                if (node.left.tag() == expr_e.Const and
+                        node.right.tag() == expr_e.Const):
+                    return self._ToConst(node, node.op)
+                return node
+
+            elif case(expr_e.Compare):
+                node = cast(expr.Compare, UP_node)
+                node.left = self._Fold(node.left)
+                all_const = self._FoldList(node.comparators)
+
+                if node.left.tag() != expr_e.Const or not all_const:
+                    return node
+                for op in node.ops:
+                    if op.id in (Id.Expr_Is, Id.Node_IsNot, Id.Arith_Tilde,
+                                 Id.Expr_NotTilde):
+                        return node
+                return self._ToConst(node, node.ops[0])
+
+            elif case(expr_e.IfExp):
+                node = cast(expr.IfExp, UP_node)
+                node.test = self._Fold(node.test)
+
+                # Only fold the branch that's taken
+                if node.test.tag() == expr_e.Const:
+                    test = cast(expr.Const, node.test)
+                    if val_ops.ToBool(test.val):
+                        return self._Fold(node.body)
+                    return self._Fold(node.orelse)
+
+                node.body = self._Fold(node.body)
+                node.orelse = self._Fold(node.orelse)
+                return node
+
+            elif case(expr_e.List):
+                node = cast(expr.List, UP_node)
+                # Each evaluation still creates a new List
+                self._FoldList(node.elts)
+                return node
+
+            elif case(expr_e.Tuple):
+                node = cast(expr.Tuple, UP_node)
+                self._FoldList(node.elts)
+                return node
+
+            elif case(expr_e.Dict):
+                node = cast(expr.Dict, UP_node)
+                self._FoldList(node.keys)
+                for i, v in enumerate(node.values):
+                    if v.tag() != expr_e.Implicit:  # {key} looks up key
+                        node.values[i] = self._Fold(v)
+                return node
+
+            elif case(expr_e.Range):
+                node = cast(expr.Range, UP_node)
+                node.lower = self._Fold(node.lower)
+                node.upper = self._Fold(node.upper)
+                return node
+
+            elif case(expr_e.Slice):
+                node = cast(expr.Slice, UP_node)
+                if node.lower:
+                    node.lower = self._Fold(node.lower)
+                if node.upper:
+                    node.upper = self._Fold(node.upper)
+                return node
+
+            elif case(expr_e.Spread):
+                node = cast(expr.Spread, UP_node)
+                node.child = self._Fold(node.child)
+                return node
+
+            elif case(expr_e.FuncCall):
+                node = cast(expr.FuncCall, UP_node)
+                node.func = self._Fold(node.func)
+                self._FoldArgs(node.args)
+                return node
+
+            elif case(expr_e.Subscript):
+                node = cast(Subscript, UP_node)
+                node.obj = self._Fold(node.obj)
+                node.index = self._Fold(node.index)
+                return node
+
+            elif case(expr_e.Attribute):
+                node = cast(Attribute, UP_node)
+                node.obj = self._Fold(node.obj)
+                return node
+
+            else:
+                # Const, Var, Place, CommandSub, DoubleQuoted, ...
+                #
+                # Literal and Lambda are left alone, since they're quoted
+                # code.
+                return node
+
+
+# vim: sw=4
@@ -206,6 +206,7 @@ def _PushYshTokens(parse_ctx, gr, p, lex):
 
             words2 = braces.BraceDetectAll(words)
             words3 = word_.TildeDetectAll(words2)
+            word_.DetectShapes(words3)
 
             typ = Id.Expr_CastedDummy
 
@@ -222,7 +222,7 @@ class Transformer(object):
 
         if typ0 in (Id.Expr_Dot, Id.Expr_RArrow, Id.Expr_RDArrow):
             attr = p_trailer.GetChild(1).tok  # will be Id.Expr_Name
-            return Attribute(base, tok0, attr, lexer.TokenVal(attr),
+            return Attribute(base, tok0, attr, intern(lexer.TokenVal(attr)),
                              expr_context_e.Store)
 
         raise AssertionError(typ0)
@@ -248,7 +248,7 @@ class Transformer(object):
         id_ = tok0.id
 
         if id_ == Id.Expr_Name:
-            key_str = value.Str(lexer.TokenVal(tok0))
+            key_str = value.Str(intern(lexer.TokenVal(tok0)))
             key = expr.Const(tok0, key_str)
             if p_node.NumChildren() >= 3:
                 val = self.Expr(p_node.GetChild(2))
@@ -706,7 +706,7 @@ class Transformer(object):
 
         tok = pnode.tok
         if typ == Id.Expr_Name:
-            return expr.Var(tok, lexer.TokenVal(tok))
+            return expr.Var(tok, intern(lexer.TokenVal(tok)))
 
         # Everything else is an expr.Const
         tok_str = lexer.TokenVal(tok)
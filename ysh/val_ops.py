@@ -6,7 +6,9 @@ from __future__ import print_function
 
 from _devbuild.gen.syntax_asdl import loc, loc_t, command_t
 from _devbuild.gen.value_asdl import (value, value_e, value_t, eggex_ops,
-                                      eggex_ops_t, regex_match, RegexMatch)
+                                      eggex_ops_t, regex_match, RegexMatch,
+                                      IntBox)
+from core import bash_array
 from core import error
 from core import ui
 from mycpp import mops
@@ -163,7 +165,7 @@ def ToShellArray(val, blame_loc, prefix=''):
         # - ysh-options tests parse_at too
         elif case2(value_e.BashArray):
             val = cast(value.BashArray, UP_val)
-            strs = val.strs
+            strs = bash_array.GetValues(val)
 
         else:
             raise error.TypeErr(val, "%sexpected List" % prefix, blame_loc)
@@ -219,23 +221,139 @@ class ArrayIter(_ContainerIter):
         return value.Str(self.strs[self.i])
 
 
+def _RangeSub(a, b):
+    # type: (mops.BigInt, mops.BigInt) -> mops.BigInt
+    """a - b, or raise error.Expr if it overflows in C++."""
+    if mops.Greater(b, mops.ZERO):
+        overflow = mops.Greater(mops.Add(mops.MIN_INT64, b), a)
+    else:
+        overflow = mops.Greater(a, mops.Add(mops.MAX_INT64, b))
+    if overflow:
+        raise error.Expr('Range is too big: integer overflow', loc.Missing)
+    return mops.Sub(a, b)
+
+
+def RangeLen(r):
+    # type: (value.Range) -> mops.BigInt
+    """The number of integers in the range, in O(1)."""
+    if mops.Greater(r.step, mops.ZERO):
+        if not mops.Greater(r.upper, r.lower):
+            return mops.ZERO
+        span = _RangeSub(r.upper, r.lower)
+        step = r.step
+    else:
+        if not mops.Greater(r.lower, r.upper):
+            return mops.ZERO
+        span = _RangeSub(r.lower, r.upper)
+        step = _RangeSub(mops.ZERO, r.step)
+
+    # ceil(span / step), with Div() and Rem() on non-negative numbers, and
+    # without overflowing
+    n = mops.Div(span, step)
+    if not mops.Equal(mops.Rem(span, step), mops.ZERO):
+        n = mops.Add(n, mops.ONE)
+    return n
+
+
+def RangeAt(r, i):
+    # type: (value.Range, mops.BigInt) -> mops.BigInt
+    """The i-th integer in the range, where i is a valid index.
+
+    It's between r.lower and r.upper, so it doesn't overflow.
+    """
+    return mops.Add(r.lower, mops.Mul(i, r.step))
+
+
+def RangeContains(r, i):
+    # type: (value.Range, mops.BigInt) -> bool
+    """Is i one of the integers in the range?  O(1)."""
+    if mops.Greater(r.step, mops.ZERO):
+        if mops.Greater(r.lower, i) or not mops.Greater(r.upper, i):
+            return False
+        offset = _RangeSub(i, r.lower)
+        step = r.step
+    else:
+        if mops.Greater(i, r.lower) or not mops.Greater(i, r.upper):
+            return False
+        offset = _RangeSub(r.lower, i)
+        step = _RangeSub(mops.ZERO, r.step)
+
+    return mops.Equal(mops.Rem(offset, step), mops.ZERO)
+
+
+def _SliceIndex(box, default, n):
+    # type: (Optional[IntBox], mops.BigInt, mops.BigInt) -> mops.BigInt
+    """Clamp a slice index to [0, n], counting negative ones from the end."""
+    if not box:
+        return default
+
+    i = mops.IntWiden(box.i)
+    if mops.Greater(mops.ZERO, i):
+        i = mops.Add(i, n)
+        if mops.Greater(mops.ZERO, i):
+            return mops.ZERO
+    if mops.Greater(i, n):
+        return n
+    return i
+
+
+def RangeSlice(r, lower, upper):
+    # type: (value.Range, Optional[IntBox], Optional[IntBox]) -> value.Range
+    """r[lower:upper], like slicing a List, without materializing it."""
+    n = RangeLen(r)
+    begin = _SliceIndex(lower, mops.ZERO, n)
+    end = _SliceIndex(upper, n, n)
+    if mops.Greater(begin, end):
+        end = begin
+
+    # RangeAt(r, n) could be past the largest integer, so use r.upper, which
+    # ends the range in the same place
+    if mops.Equal(begin, n):
+        return value.Range(r.upper, r.upper, r.step)
+    if mops.Equal(end, n):
+        return value.Range(RangeAt(r, begin), r.upper, r.step)
+    return value.Range(RangeAt(r, begin), RangeAt(r, end), r.step)
+
+
+def RangeReversed(r):
+    # type: (value.Range) -> value.Range
+    """The same integers in the opposite order."""
+    n = RangeLen(r)
+    step = _RangeSub(mops.ZERO, r.step)
+    if mops.Equal(n, mops.ZERO):
+        return value.Range(r.lower, r.lower, step)
+
+    last = RangeAt(r, mops.Sub(n, mops.ONE))
+    return value.Range(last, _RangeSub(r.lower, r.step), step)
+
+
 class RangeIterator(_ContainerIter):
-    """ for x in (m:n) { """
+    """ for x in (m .. n) { """
 
     def __init__(self, val):
         # type: (value.Range) -> None
         _ContainerIter.__init__(self)
         self.val = val
+        self.n = RangeLen(val)
+        # Not self.i, which is an int in C++, and a range can be longer
+        self.big_i = mops.ZERO
+        self.cur = val.lower
 
     def Done(self):
         # type: () -> int
-        return self.val.lower + self.i >= self.val.upper
+        return not mops.Greater(self.n, self.big_i)
 
     def FirstValue(self):
         # type: () -> value_t
+        return value.Int(self.cur)
 
-        # TODO: range should be BigInt too
-        return value.Int(mops.IntWiden(self.val.lower + self.i))
+    def Next(self):
+        # type: () -> None
+        _ContainerIter.Next(self)
+        self.big_i = mops.Add(self.big_i, mops.ONE)
+        # Stop at the last integer, because the next one could overflow
+        if not self.Done():
+            self.cur = mops.Add(self.cur, self.val.step)
 
 
 class ListIterator(_ContainerIter):
@@ -304,7 +422,7 @@ def ToBool(val):
         # OLD TYPES
         elif case(value_e.BashArray):
             val = cast(value.BashArray, UP_val)
-            return len(val.strs) != 0
+            return not bash_array.IsEmpty(val)
 
         elif case(value_e.BashAssoc):
             val = cast(value.BashAssoc, UP_val)
@@ -372,14 +490,7 @@ def ExactlyEqual(left, right, blame_loc):
         elif case(value_e.BashArray):
             left = cast(value.BashArray, UP_left)
             right = cast(value.BashArray, UP_right)
-            if len(left.strs) != len(right.strs):
-                return False
-
-            for i in xrange(0, len(left.strs)):
-                if left.strs[i] != right.strs[i]:
-                    return False
-
-            return True
+            return bash_array.Equals(left, right)
 
         elif case(value_e.List):
             left = cast(value.List, UP_left)
@@ -393,6 +504,19 @@ def ExactlyEqual(left, right, blame_loc):
 
             return True
 
+        elif case(value_e.Range):
+            # Equal if they have the same integers, like Python's range()
+            left = cast(value.Range, UP_left)
+            right = cast(value.Range, UP_right)
+            n = RangeLen(left)
+            if not mops.Equal(n, RangeLen(right)):
+                return False
+            if mops.Equal(n, mops.ZERO):
+                return True
+            if not mops.Equal(left.lower, right.lower):
+                return False
+            return mops.Equal(n, mops.ONE) or mops.Equal(left.step, right.step)
+
         elif case(value_e.BashAssoc):
             left = cast(value.Dict, UP_left)
             right = cast(value.Dict, UP_right)
@@ -436,8 +560,15 @@ def Contains(needle, haystack):
             s = ToStr(needle, "LHS of 'in' should be Str", loc.Missing)
             return s in haystack.d
 
+        elif case(value_e.Range):  # O(1), unlike searching a List
+            haystack = cast(value.Range, UP_haystack)
+            if needle.tag() != value_e.Int:
+                raise error.TypeErr(needle, "LHS of 'in' should be Int",
+                                    loc.Missing)
+            return RangeContains(haystack, cast(value.Int, needle).i)
+
         else:
-            raise error.TypeErr(haystack, "RHS of 'in' should be Dict",
+            raise error.TypeErr(haystack, "RHS of 'in' should be Dict or Range",
                                 loc.Missing)
 
     return False
@@ -6,7 +6,9 @@ from __future__ import print_function
 
 import unittest
 
-from _devbuild.gen.value_asdl import value
+from _devbuild.gen.value_asdl import value, IntBox
+from core import error
+from mycpp import mops
 from ysh import val_ops  # module under test
 
 
@@ -40,5 +42,67 @@ class IteratorTest(unittest.TestCase):
         self.assert_(it.Done())
 
 
+
+def _Range(lower, upper, step=1):
+    return value.Range(mops.BigInt(lower), mops.BigInt(upper),
+                       mops.BigInt(step))
+
+
+def _Ints(r):
+    ints = []
+    it = val_ops.RangeIterator(r)
+    while not it.Done():
+        ints.append(it.FirstValue().i.i)
+        it.Next()
+    return ints
+
+
+class RangeTest(unittest.TestCase):
+
+    def testRangeLen(self):
+        # Compare against Python's xrange()
+        for args in [(0, 10), (0, 10, 3), (10, 0, -3), (5, 5), (5, 1),
+                     (1, 5, -1), (-5, 5, 4), (3, -3, -2)]:
+            r = _Range(*args)
+            expected = list(xrange(*args))
+            self.assertEqual(len(expected), val_ops.RangeLen(r).i, args)
+            self.assertEqual(expected, _Ints(r), args)
+
+            for i in xrange(-12, 12):
+                self.assertEqual(i in expected,
+                                 val_ops.RangeContains(r, mops.BigInt(i)),
+                                 (args, i))
+
+            self.assertEqual(expected[::-1],
+                             _Ints(val_ops.RangeReversed(r)), args)
+
+    def testRangeOverflow(self):
+        big = mops.MAX_INT64.i
+        r = _Range(big - 7, big, 3)
+        self.assertEqual([big - 7, big - 4, big - 1], _Ints(r))
+        self.assertEqual([big - 1, big - 4, big - 7],
+                         _Ints(val_ops.RangeReversed(r)))
+        self.assertEqual([big - 1], _Ints(val_ops.RangeSlice(r, IntBox(2),
+                                                              None)))
+
+        r = _Range(-big, big)
+        self.assertRaises(error.Expr, val_ops.RangeLen, r)
+        self.assertRaises(error.Expr, val_ops.RangeContains, r,
+                          mops.BigInt(big - 1))
+        self.assertRaises(error.Expr, val_ops.RangeLen,
+                          _Range(0, -3, mops.MIN_INT64.i))
+
+    def testRangeSlice(self):
+        r = _Range(0, 20, 3)
+        expected = list(xrange(0, 20, 3))
+        for lower in [None, 0, 2, -2, 100, -100]:
+            for upper in [None, 0, 3, -1, 100, -100]:
+                lo = None if lower is None else IntBox(lower)
+                up = None if upper is None else IntBox(upper)
+                self.assertEqual(expected[lower:upper],
+                                 _Ints(val_ops.RangeSlice(r, lo, up)),
+                                 (lower, upper))
+
+
 if __name__ == '__main__':
     unittest.main()